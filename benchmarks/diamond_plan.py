@@ -0,0 +1,111 @@
+"""Benchmark of breaking the cycles of a layout with many relationships.
+
+A synthetic layout is generated where every table references the
+``object_id`` of several earlier tables, so the relationships have many
+cycles. The script times ``Diamond.merge_cost``, the graph work that picks
+the edges to cut on first use and when replayed from the plan cache, and
+a whole ``resolve_diamond``. On a checkout without ``Diamond.get_plan``
+the graph is built inline as ``resolve_diamond`` used to, so the same
+script compares both versions.
+
+Usage:
+
+    python benchmarks/diamond_plan.py --tables 60 --rows 5000 --parents 4
+"""
+
+import argparse
+import copy
+import time
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from cardea.data_loader import Diamond, data_loader
+
+RELATIONSHIP_FIELDS = ['parent_entity', 'parent_variable', 'child_entity', 'child_variable']
+
+
+def build_diamond(tables, rows, parents, seed=0):
+    random = np.random.default_rng(seed)
+    fhir = {'Identifier': pd.DataFrame({'object_id': pd.Series([], dtype='int64')})}
+    relationships = []
+    for number in range(tables):
+        name = 'Table{}'.format(number)
+        columns = {'object_id': np.arange(rows)}
+        for parent in random.choice(number, size=min(parents, number), replace=False):
+            column = 'reference{}'.format(parent)
+            columns[column] = random.integers(0, rows, rows)
+            relationships.append(('Table{}'.format(parent), 'object_id', name, column))
+
+        fhir[name] = pd.DataFrame(columns)
+
+    diamond = Diamond.__new__(Diamond)
+    diamond.fhir = fhir
+    diamond.relationships = pd.DataFrame(relationships, columns=RELATIONSHIP_FIELDS)
+    return diamond
+
+
+def get_plan(diamond):
+    if hasattr(diamond, 'get_plan'):
+        return diamond.get_plan()
+
+    G = nx.from_pandas_edgelist(diamond.relationships, source='parent_entity',
+                                target='child_entity', edge_attr=['weight'])
+    X = nx.maximum_spanning_tree(G)
+    return [x for x in G.edges() if x not in X.edges()]
+
+
+def measure(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+
+    return min(times) * 1000, result
+
+
+def clear_plans():
+    getattr(data_loader, '_PLANS', getattr(Diamond, '_plans', {})).clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tables', type=int, default=60)
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--parents', type=int, default=4)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    diamond = build_diamond(args.tables, args.rows, args.parents)
+    print('{} tables of {} rows, {} relationships'.format(
+        args.tables, args.rows, len(diamond.relationships)))
+
+    elapsed, weights = measure(diamond.merge_cost, args.repeat)
+    diamond.relationships['weight'] = weights
+    print('merge_cost: {:.1f} ms'.format(elapsed))
+
+    def first_plan():
+        clear_plans()
+        return get_plan(diamond)
+
+    elapsed, plan = measure(first_plan, args.repeat)
+    print('plan on first use: {:.1f} ms ({} edges to cut)'.format(elapsed, len(plan)))
+
+    elapsed, _ = measure(lambda: get_plan(diamond), args.repeat)
+    print('plan replayed: {:.1f} ms'.format(elapsed))
+
+    def resolve():
+        clear_plans()
+        resolved = copy.copy(diamond)
+        resolved.fhir = dict(diamond.fhir)
+        resolved.relationships = diamond.relationships.drop(columns='weight')
+        resolved.resolve_diamond()
+
+    elapsed, _ = measure(resolve, 1)
+    print('resolve_diamond: {:.1f} ms'.format(elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark of reading a directory of FHIR .csv files with each engine.
+
+A directory of Observation files is generated, unless one is given, and it is
+read by ``EntitySetLoader.read_csv_files`` with the serial pandas reader and
+with the Arrow reader. Each configuration runs in a fresh process, so that
+its peak resident memory is measured on its own.
+
+Usage:
+
+    python benchmarks/read_csv_files.py --files 50 --rows 100000
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+CONFIGURATIONS = (
+    ('c', 1),
+    ('pyarrow', 1),
+    ('pyarrow', None),
+)
+
+
+def generate_files(path, files, rows, seed=0):
+    random = np.random.default_rng(seed)
+    for number in range(files):
+        identifiers = np.arange(number * rows, (number + 1) * rows)
+        pd.DataFrame({
+            'identifier': identifiers,
+            'status': random.choice(['final', 'amended', 'preliminary'], rows),
+            'subject': random.integers(0, rows // 10, rows),
+            'effectiveDateTime': pd.Timestamp('2000-01-01') + pd.to_timedelta(
+                random.integers(0, 10 ** 8, rows), unit='s'),
+            'valueBoolean': random.choice(['True', 'False', ''], rows),
+            'comment': random.choice(['', 'repeated', 'checked'], rows),
+        }).to_csv(os.path.join(path, 'Observation{}.csv'.format(number)), index=False)
+
+
+def run(path, engine, n_jobs):
+    from cardea.data_loader import EntitySetLoader
+
+    start = time.perf_counter()
+    fhir = EntitySetLoader().read_csv_files(path, n_jobs=n_jobs, engine=engine)
+    elapsed = time.perf_counter() - start
+
+    # ru_maxrss is in kilobytes on Linux
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    rows = sum(len(df) for df in fhir.values())
+    print(json.dumps({'engine': engine, 'n_jobs': n_jobs, 'rows': rows,
+                      'seconds': round(elapsed, 3), 'peak_rss_mb': round(peak, 1)}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--path', help='directory of .csv files, generated if not given')
+    parser.add_argument('--files', type=int, default=50)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--run', nargs=2, metavar=('ENGINE', 'N_JOBS'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        engine, n_jobs = args.run
+        run(args.path, engine, None if n_jobs == 'None' else int(n_jobs))
+        return
+
+    with tempfile.TemporaryDirectory() as temporary_path:
+        path = args.path
+        if path is None:
+            path = temporary_path
+            generate_files(path, args.files, args.rows)
+
+        for engine, n_jobs in CONFIGURATIONS:
+            command = [sys.executable, __file__, '--path', path, '--run', engine, str(n_jobs)]
+            subprocess.run(command, check=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -7,15 +7,14 @@ import logging
 import os
 import pickle
 from inspect import isclass
-from io import BytesIO
-from urllib.request import urlopen
-from zipfile import ZipFile
 
 import featuretools as ft
-import pandas as pd
 
 import cardea
 from cardea.data_loader import EntitySetLoader, load_mimic_data
+from cardea.data_loader.download import DownloadCache
+from cardea.data_loader.load_mimic import MANIFEST, convert_mimic_data
+from cardea.data_loader.pruning import get_problem_resources
 from cardea.featurization import Featurization
 from cardea.modeling import Modeler
 from cardea.problem_definition import (
@@ -62,49 +61,147 @@ class Cardea():
         self.target_entity = None
         self.modeler = None
 
-    def load_entityset(self, data, fhir=True):
+    def load_entityset(self, data, fhir=True, format='csv', cache_dir=None, append=False,
+                       problem=None, resources=None, columns=None, max_depth=2, sample=None,
+                       cohort=None):
         """Returns an entityset loaded with .csv files in data.
 
         Load the given dataset into an entityset. The dataset
         must be in FHIR or MIMIC structure format.
 
         Args:
-            data (str):
+            data (str or ConnectionPool):
                 A directory of all .csv files that should be loaded. To load demo dataset,
-                pass the name of the dataset "kaggle" or "mimic".
+                pass the name of the dataset "kaggle" or "mimic", which is converted
+                once by ``download_demo`` when the format is ``'parquet'``. When the
+                format is ``'sql'``, the database to query, as accepted by
+                ``ConnectionPool``.
             fhir (bool):
                 An indicator of whether to use FHIR or MIMIC schema.
+            format (str):
+                The format of the FHIR files, either ``'csv'``, ``'ndjson'`` or ``'bundle'``,
+                or ``'sql'`` to read the FHIR or MIMIC tables of a database. MIMIC data
+                can also be a folder converted to ``'parquet'`` by ``convert_mimic_data``.
+            cache_dir (str):
+                A directory where the loaded FHIR data is cached, so that loading the
+                same files again skips parsing and resolving them. FHIR only.
+            append (bool):
+                Whether to append the FHIR files in data to the loaded entityset
+                instead of replacing it. FHIR only.
+            problem (str):
+                Name of the prediction problem the data is loaded for, as given to
+                ``select_problem``. Only the FHIR resources that the problem can use
+                within ``max_depth`` relationships are loaded. FHIR only.
+            resources (list):
+                Names of FHIR resources to load, in addition to the ones of the
+                problem. If neither is given, every resource is loaded. FHIR only.
+            columns (dict):
+                The columns to load from each FHIR resource or MIMIC table, where the
+                key is its name. Resources that are not in columns are loaded entirely.
+            max_depth (int):
+                The maximum depth of the features of the problem.
+            sample (float):
+                The fraction of patients to load, chosen by the hash of their
+                identifier, along with every row that references them. The same
+                patients are chosen on every load. If None, every patient is loaded.
+            cohort (Cohort):
+                The admissions to load, selected by age, admission time, class and
+                diagnosis codes. The rows of other admissions and patients are
+                dropped while MIMIC tables are read. FHIR data is read and resolved
+                entirely before the cohort is applied, so it only makes the entityset
+                smaller and saves no memory while loading. If None, every admission
+                is loaded.
 
         Returns:
             featuretools.EntitySet:
-                An entityset with loaded data.
+                An entityset with loaded data. The time and memory spent in each stage
+                of a FHIR load, and the size of each loaded resource, are kept in
+                ``es_loader.report`` as described by ``LoadProfiler.get_report``.
+
+        Raises:
+            ValueError: An error occurs if the format is not supported, or if an
+                option that only applies to FHIR data is given with MIMIC data.
         """
-        demo = ['kaggle', 'mimic']
-        if not os.path.exists(data) and data in demo:
-            data = self.download_demo(data)
+        if not fhir:
+            options = {'cache_dir': cache_dir, 'append': append, 'problem': problem,
+                       'resources': resources}
+            unsupported = [name for name, value in options.items() if value]
+            if unsupported:
+                raise ValueError('{} can only be used with FHIR data'.format(
+                    ', '.join(unsupported)))
 
-        if fhir:
-            self.es = self.es_loader.load_data_entityset(data)
+        demo = ['kaggle', 'mimic']
+        if isinstance(data, str) and not os.path.exists(data) and data in demo:
+            data = self.download_demo(data, format='parquet' if format == 'parquet' else 'csv')
+
+        if problem is not None:
+            problem_class = getattr(cardea.problem_definition, problem, None)
+            if not isclass(problem_class) or problem == 'ProblemDefinition':
+                raise ValueError('{} is not a defined problem'.format(problem))
+
+            problem_resources = get_problem_resources(problem_class, max_depth=max_depth)
+            resources = problem_resources.union(resources or [])
+
+        if fhir and append and self.es is not None:
+            self.es = self.es_loader.append_data_entityset(self.es, data, format=format)
+        elif fhir and format == 'sql':
+            self.es = self.es_loader.load_database_entityset(data, resources=resources,
+                                                             columns=columns, sample=sample,
+                                                             cohort=cohort)
+        elif fhir:
+            self.es = self.es_loader.load_data_entityset(data, format=format,
+                                                         cache_dir=cache_dir,
+                                                         resources=resources,
+                                                         columns=columns,
+                                                         sample=sample,
+                                                         cohort=cohort)
         else:
-            self.es = load_mimic_data(data)
+            self.es = load_mimic_data(data, format=format, columns=columns, sample=sample,
+                                      cohort=cohort)
 
     @staticmethod
-    def download_demo(name, data_path=DATA_PATH):
-        data_path = os.path.join(data_path, name)
-        os.makedirs(data_path, exist_ok=True)
+    def download_demo(name, data_path=DATA_PATH, checksum=None, format='csv'):
+        """Returns the folder of a demo dataset, downloading it on first use.
 
-        url = S3_URL.format(BUCKET, '{}.zip'.format(name))
-        compressed = ZipFile(BytesIO(urlopen(url).read()))
+        The archive is streamed to disk and its .csv files are extracted as they
+        are, so later calls reuse the folder without downloading it again.
+
+        Args:
+            name (str):
+                The name of the dataset, either ``'kaggle'`` or ``'mimic'``.
+            data_path (str):
+                The directory where the datasets are kept.
+            checksum (str):
+                The expected SHA-256 digest of the archive. If given, a cached
+                archive with another digest is downloaded again.
+            format (str):
+                Either ``'csv'`` or, for ``'mimic'``, ``'parquet'`` to also convert
+                the tables once with ``convert_mimic_data``.
 
-        LOGGER.info('Downloading dataset %s from %s', name, url)
-        for file in compressed.namelist():
-            filename = os.path.join(data_path, file)
-            csv_file = compressed.open(file)
+        Returns:
+            str:
+                The folder of the dataset.
+
+        Raises:
+            ValueError:
+                If the format is not supported for the dataset, or the checksum of
+                the archive is not the expected one.
+        """
+
+        if format not in ('csv', 'parquet') or (format == 'parquet' and name != 'mimic'):
+            raise ValueError('{} is not a supported format for {}'.format(format, name))
+
+        url = S3_URL.format(BUCKET, '{}.zip'.format(name))
+        path = DownloadCache(data_path).get(name, url, checksum=checksum)
+        if format == 'csv':
+            return path
 
-            data = pd.read_csv(csv_file, dtype=str)
-            data.to_csv(filename, index=False)
+        # the converted tables are removed along with the folder when it is replaced
+        parquet_path = os.path.join(path, 'parquet')
+        if not os.path.exists(os.path.join(parquet_path, MANIFEST)):
+            convert_mimic_data(path, parquet_path)
 
-        return data_path
+        return parquet_path
 
     def list_problems(self):
         """Returns a list of the currently available problems.
@@ -1,10 +1,14 @@
 """Data loader module."""
 
+from cardea.data_loader.cohort import Cohort
 from cardea.data_loader.data_loader import DataLoader, Diamond
+from cardea.data_loader.database import ConnectionPool
 from cardea.data_loader.entityset_loader import EntitySetLoader
 from cardea.data_loader.load_mimic import load_mimic_data
 
 __all__ = (
+    "Cohort",
+    "ConnectionPool",
     "DataLoader",
     "EntitySetLoader",
     "load_mimic_data"
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+import pandas as pd
+import pyarrow as pa
+
+import cardea
+from cardea.data_loader.keys import KeyDictionary
+
+LOGGER = logging.getLogger(__name__)
+
+MANIFEST = 'manifest.json'
+
+
+class EntitySetCache():
+    """A class that caches the resolved fhir dataframes of a loaded folder on disk.
+
+    Each entry is stored in a directory named after a key computed from the files
+    of the folder, the loading options and the Cardea version. It holds the
+    resolved dataframes as Parquet files, the interned keys, if any, and a JSON
+    manifest with the relationships and identifiers of the entityset.
+
+    Args:
+        cache_dir (str):
+            The directory where the entries are stored.
+        hash_content (bool):
+            Whether the key is computed from the content of the files instead of
+            their size and modification time.
+    """
+
+    __name__ = 'EntitySetCache'
+
+    def __init__(self, cache_dir, hash_content=False):
+        self.cache_dir = cache_dir
+        self.hash_content = hash_content
+
+    def get_key(self, file_paths, **options):
+        """Returns the cache key of a set of files.
+
+        Args:
+            file_paths (list):
+                The paths of the loaded files.
+            options:
+                Loading options that change the loaded data.
+
+        Returns:
+            str:
+                The hexadecimal digest that identifies the files.
+        """
+
+        key = hashlib.sha256()
+        key.update(cardea.__version__.encode())
+        key.update(json.dumps(options, sort_keys=True, default=str).encode())
+
+        for file_path in sorted(file_paths):
+            key.update(os.path.basename(file_path).encode())
+            if self.hash_content:
+                with open(file_path, 'rb') as data_file:
+                    for block in iter(lambda: data_file.read(1 << 20), b''):
+                        key.update(block)
+            else:
+                stat = os.stat(file_path)
+                key.update('{}:{}'.format(stat.st_size, stat.st_mtime_ns).encode())
+
+        return key.hexdigest()
+
+    def load(self, key):
+        """Returns the cached entry with the given key.
+
+        Args:
+            key (str):
+                The cache key.
+
+        Returns:
+            tuple:
+                The dictionary of resolved dataframes, the dataframe of relationships,
+                the dictionary of identifiers and the ``KeyDictionary`` of the interned
+                keys, or None if the key is not cached.
+        """
+
+        path = os.path.join(self.cache_dir, key)
+        manifest_path = os.path.join(path, MANIFEST)
+        if not os.path.exists(manifest_path):
+            return None
+
+        with open(manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+
+        fhir = {}
+        for name, file_name in manifest['tables'].items():
+            file_path = os.path.join(path, file_name)
+            if file_name.endswith('.parquet'):
+                fhir[name] = pd.read_parquet(file_path, memory_map=True)
+            else:
+                fhir[name] = pd.read_pickle(file_path)
+
+        keys = None
+        if manifest.get('keys'):
+            keys_df = pd.read_parquet(os.path.join(path, manifest['keys']))
+            keys = KeyDictionary(keys_df['key'])
+
+        LOGGER.info('Loaded %s resources from cache entry %s', len(fhir), key)
+        # stored with its columns, so that an entry without relationships keeps them
+        relationships = manifest['relationships']
+        if not isinstance(relationships, dict):
+            LOGGER.info('Cache entry %s has an outdated layout', key)
+            return None
+
+        relationships = pd.DataFrame(relationships['data'], columns=relationships['columns'])
+        return fhir, relationships, manifest['identifiers'], keys
+
+    def save(self, key, fhir, relationships, identifiers, keys=None):
+        """Stores an entry in the cache.
+
+        Dataframes that cannot be stored as Parquet, such as the ones with
+        mixed-type or duplicated columns, are pickled instead.
+
+        Args:
+            key (str):
+                The cache key.
+            fhir (dict):
+                The resolved fhir dataframes.
+            relationships (pandas.DataFrame):
+                The relationships of the entityset.
+            identifiers (dict):
+                The identifier column of each fhir dataframe.
+            keys (KeyDictionary):
+                The interned keys of the fhir dataframes, if any.
+        """
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = tempfile.mkdtemp(dir=self.cache_dir)
+
+        tables = {}
+        for number, (name, df) in enumerate(fhir.items()):
+            file_name = '{}.parquet'.format(number)
+            try:
+                df.to_parquet(os.path.join(path, file_name))
+            except (pa.ArrowException, ValueError):
+                file_name = '{}.pkl'.format(number)
+                df.to_pickle(os.path.join(path, file_name))
+
+            tables[name] = file_name
+
+        keys_name = None
+        if keys is not None:
+            keys_name = 'keys.parquet'
+            pd.DataFrame({'key': keys.keys.astype('str')}).to_parquet(
+                os.path.join(path, keys_name))
+
+        manifest = {
+            'version': cardea.__version__,
+            'tables': tables,
+            'relationships': json.loads(relationships.to_json(orient='split', index=False)),
+            'identifiers': identifiers,
+            'keys': keys_name
+        }
+        with open(os.path.join(path, MANIFEST), 'w') as manifest_file:
+            json.dump(manifest, manifest_file)
+
+        try:
+            os.rename(path, os.path.join(self.cache_dir, key))
+        except OSError:
+            # another process stored the same entry first
+            shutil.rmtree(path, ignore_errors=True)
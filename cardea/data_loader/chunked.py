@@ -0,0 +1,340 @@
+import logging
+import os
+import shutil
+import tempfile
+
+import pandas as pd
+import pyarrow as pa
+from pyarrow import parquet as pq
+
+LOGGER = logging.getLogger(__name__)
+
+CHUNK_OVERHEAD = 4
+SAMPLE_ROWS = 1000
+
+
+def needs_chunking(file_path, max_memory):
+    """Returns whether a .csv file should be read in chunks to stay under a memory ceiling.
+
+    Parsing a file takes several times its size on disk, so files larger than
+    a fraction of the ceiling are read in chunks.
+
+    Args:
+        file_path (str):
+            The path of the .csv file.
+        max_memory (int):
+            The memory ceiling in bytes, or None for no ceiling.
+
+    Returns:
+        bool:
+            True if the file should be read in chunks.
+    """
+
+    return max_memory is not None and os.path.getsize(file_path) * CHUNK_OVERHEAD > max_memory
+
+
+def estimate_memory(file_path, max_memory=None):
+    """Returns an estimate of the memory needed to parse a .csv file.
+
+    Args:
+        file_path (str):
+            The path of the .csv file.
+        max_memory (int):
+            The memory ceiling under which large files are read in chunks, or None.
+
+    Returns:
+        int:
+            The estimated memory in bytes.
+    """
+
+    memory = os.path.getsize(file_path) * CHUNK_OVERHEAD
+    return memory if max_memory is None else min(memory, max_memory)
+
+
+def get_chunksize(file_path, max_memory, **kwargs):
+    """Returns the number of rows of a .csv file that can be converted under a memory ceiling.
+
+    The size of a row is estimated from the first rows of the file, read with
+    the same options as the chunks, and each chunk is allowed a fraction of the
+    ceiling to account for the parser buffers and the copies made while
+    filtering and writing it.
+
+    Args:
+        file_path (str):
+            The path of the .csv file.
+        max_memory (int):
+            The memory ceiling in bytes.
+        kwargs:
+            Options passed to ``pandas.read_csv``.
+
+    Returns:
+        int:
+            The number of rows per chunk.
+    """
+
+    return get_rows_under(pd.read_csv(file_path, nrows=SAMPLE_ROWS, **kwargs), max_memory)
+
+
+def get_rows_under(sample, max_memory):
+    """Returns how many rows like the ones of a sample fit in a chunk under a memory ceiling.
+
+    Args:
+        sample (pandas.DataFrame):
+            The first rows of the table.
+        max_memory (int):
+            The memory ceiling in bytes.
+
+    Returns:
+        int:
+            The number of rows per chunk.
+    """
+
+    row_size = sample.memory_usage(index=False, deep=True).sum() / max(len(sample), 1)
+    return max(int(max_memory / (max(row_size, 1) * CHUNK_OVERHEAD)), 1)
+
+
+def spill_csv_file(file_path, spill_dir, max_memory=None, chunksize=None, row_filter=None,
+                   **kwargs):
+    """Reads a .csv file in chunks and writes them as a partitioned Parquet dataset.
+
+    Each chunk is parsed with the given column projection and dtypes, filtered
+    and written to its own Parquet file, so only one chunk is in memory at a time.
+
+    Args:
+        file_path (str):
+            The path of the .csv file.
+        spill_dir (str):
+            The directory where the Parquet files are written.
+        max_memory (int):
+            The memory ceiling in bytes used to choose the size of the chunks.
+        chunksize (int):
+            The number of rows per chunk. If None, it is derived from ``max_memory``.
+        row_filter (callable):
+            A function that receives a chunk and returns a boolean mask of the rows
+            to keep. If None, every row is kept.
+        kwargs:
+            Options passed to ``pandas.read_csv``, such as ``usecols``, ``dtype`` or
+            ``parse_dates``.
+
+    Returns:
+        int:
+            The number of rows written.
+
+    Raises:
+        ValueError:
+            If neither ``max_memory`` nor ``chunksize`` are given.
+    """
+
+    if chunksize is None:
+        if max_memory is None:
+            raise ValueError('either max_memory or chunksize must be given')
+
+        chunksize = get_chunksize(file_path, max_memory, **kwargs)
+
+    LOGGER.debug('Spilling %s in chunks of %s rows', file_path, chunksize)
+    chunks = pd.read_csv(file_path, chunksize=chunksize, **kwargs)
+
+    return spill_chunks(chunks, spill_dir, row_filter=row_filter)
+
+
+def spill_chunks(chunks, spill_dir, row_filter=None):
+    """Filters chunks of a table and writes them as a partitioned Parquet dataset.
+
+    The Parquet files left in the directory by a previous run are removed first.
+
+    Args:
+        chunks (iterable):
+            The dataframes of the chunks, in order.
+        spill_dir (str):
+            The directory where the Parquet files are written.
+        row_filter (callable):
+            A function that receives a chunk and returns a boolean mask of the rows
+            to keep. If None, every row is kept.
+
+    Returns:
+        int:
+            The number of rows written.
+    """
+
+    os.makedirs(spill_dir, exist_ok=True)
+    for name in os.listdir(spill_dir):
+        if name.startswith('part-'):
+            os.remove(os.path.join(spill_dir, name))
+
+    rows = 0
+    for number, chunk in enumerate(chunks):
+        if row_filter is not None:
+            chunk = chunk[row_filter(chunk).values]
+
+        part_path = os.path.join(spill_dir, 'part-{:05d}.parquet'.format(number))
+        write_chunk(chunk, part_path)
+        rows += len(chunk)
+
+    return rows
+
+
+def write_chunk(chunk, part_path):
+    """Writes a chunk of a table to a Parquet file.
+
+    Object columns that mix numbers and strings, which Parquet cannot store,
+    are written as strings.
+
+    Args:
+        chunk (pandas.DataFrame):
+            The chunk to write.
+        part_path (str):
+            The path of the Parquet file.
+    """
+
+    try:
+        chunk.to_parquet(part_path, index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        chunk = chunk.copy()
+        for column in chunk.select_dtypes('object').columns:
+            values = chunk[column]
+            chunk[column] = values.where(values.isnull(), values.astype('str'))
+
+        chunk.to_parquet(part_path, index=False)
+
+
+def _unify_types(left, right):
+    if left == right or pa.types.is_null(right):
+        return left
+
+    if pa.types.is_null(left):
+        return right
+
+    if (pa.types.is_integer(left) or pa.types.is_floating(left)) and \
+            (pa.types.is_integer(right) or pa.types.is_floating(right)):
+        return pa.float64()
+
+    return pa.string()
+
+
+def _cast_column(column, kind):
+    if column.type == kind:
+        return column
+
+    if column.null_count == len(column):
+        # chunks without values are read as floats by pandas
+        return pa.nulls(len(column), kind)
+
+    if pa.types.is_dictionary(kind):
+        return column.cast(pa.string()).dictionary_encode().cast(kind)
+
+    return column.cast(kind)
+
+
+def _unify_schemas(schemas):
+    types = {}
+    for schema in schemas:
+        for field in schema:
+            types[field.name] = _unify_types(types.get(field.name, field.type), field.type)
+
+    return pa.schema([(name, pa.string() if pa.types.is_null(kind) else kind)
+                      for name, kind in types.items()])
+
+
+def read_spilled(spill_dir, columns=None, categories=None):
+    """Returns the dataframe of a partitioned Parquet dataset written by ``spill_csv_file``.
+
+    Args:
+        spill_dir (str):
+            The directory of the Parquet files.
+        columns (list):
+            The columns to read. If None, every column is read.
+        categories (list):
+            The string columns returned as categoricals.
+
+    Returns:
+        pandas.DataFrame:
+            The content of the dataset.
+    """
+
+    part_paths = sorted(os.path.join(spill_dir, name) for name in os.listdir(spill_dir)
+                        if name.endswith('.parquet'))
+
+    return read_parquet_files(part_paths, columns=columns, categories=categories)
+
+
+def read_parquet_files(part_paths, columns=None, categories=None):
+    """Returns the dataframe of Parquet files written from chunks of the same table.
+
+    The types of each file are inferred from its own chunk, so they are
+    unified before concatenating them: missing columns take the type of the
+    other files and mixed numbers become floats. String columns listed in
+    categories are dictionary encoded, which keeps each distinct value once.
+
+    Args:
+        part_paths (list):
+            The paths of the Parquet files, in order.
+        columns (list):
+            The columns to read. If None, every column is read.
+        categories (list):
+            The string columns returned as categoricals.
+
+    Returns:
+        pandas.DataFrame:
+            The content of the files.
+    """
+
+    schema = _unify_schemas(pq.read_schema(part_path) for part_path in part_paths)
+    if columns is not None:
+        schema = pa.schema([field for field in schema if field.name in set(columns)])
+
+    strings = [field.name for field in schema if pa.types.is_string(field.type)]
+    categories = [column for column in categories or [] if column in strings]
+    for column in categories:
+        index = schema.get_field_index(column)
+        schema = schema.set(index, pa.field(column, pa.dictionary(pa.int32(), pa.string())))
+
+    tables = []
+    for part_path in part_paths:
+        table = pq.read_table(part_path, columns=schema.names, read_dictionary=categories)
+        columns = [_cast_column(table.column(field.name), field.type) for field in schema]
+        tables.append(pa.Table.from_arrays(columns, schema=schema))
+
+    table = pa.concat_tables(tables) if tables else schema.empty_table()
+    return table.to_pandas(self_destruct=True)
+
+
+def read_csv_chunked(file_path, max_memory=None, chunksize=None, row_filter=None,
+                     categories=None, spill_dir=None, **kwargs):
+    """Returns the dataframe of a .csv file read in chunks under a memory ceiling.
+
+    The chunks are spilled to a partitioned Parquet dataset and read back with
+    compact dtypes, so the peak memory is bounded by the size of a chunk while
+    parsing and by the size of the converted table afterwards.
+
+    Args:
+        file_path (str):
+            The path of the .csv file.
+        max_memory (int):
+            The memory ceiling in bytes used to choose the size of the chunks.
+        chunksize (int):
+            The number of rows per chunk. If None, it is derived from ``max_memory``.
+        row_filter (callable):
+            A function that receives a chunk and returns a boolean mask of the rows
+            to keep.
+        categories (list):
+            The string columns returned as categoricals.
+        spill_dir (str):
+            The directory where the Parquet files are kept. If None, they are
+            written to a temporary directory that is removed afterwards.
+        kwargs:
+            Options passed to ``pandas.read_csv``.
+
+    Returns:
+        pandas.DataFrame:
+            The filtered content of the file.
+    """
+
+    temporary = spill_dir is None
+    spill_dir = tempfile.mkdtemp(prefix='cardea-') if temporary else spill_dir
+    try:
+        spill_csv_file(file_path, spill_dir, max_memory=max_memory, chunksize=chunksize,
+                       row_filter=row_filter, **kwargs)
+        return read_spilled(spill_dir, categories=categories)
+    finally:
+        if temporary:
+            shutil.rmtree(spill_dir, ignore_errors=True)
@@ -0,0 +1,299 @@
+from functools import partial
+
+import pandas as pd
+
+from cardea.data_loader.data_loader import as_keys
+from cardea.data_loader.sampling import filter_descendants
+
+
+def _to_datetime(values):
+    return pd.to_datetime(values, errors='coerce', utc=True).dt.tz_convert(None)
+
+
+def _filter_keys(keys, row_filter, df):
+    mask = pd.Series(True, index=df.index)
+    for column, values in keys.items():
+        if column in df.columns:
+            mask &= df[column].isnull() | df[column].isin(values)
+
+    if row_filter is not None:
+        mask &= row_filter(df).values
+
+    return mask
+
+
+def key_filter(keys, row_filter=None):
+    """Returns a row filter that keeps the rows whose keys are in the given ones.
+
+    The filter can be pickled, so it can be used by the processes of
+    ``load_mimic_data``. Rows with a missing key, and tables without any of the
+    key columns, are kept.
+
+    Args:
+        keys (dict):
+            The values to keep of each key column.
+        row_filter (callable):
+            Another row filter whose rows are also required.
+
+    Returns:
+        callable:
+            A function that receives a dataframe and returns a boolean series of the
+            rows to keep.
+    """
+
+    return partial(_filter_keys, keys, row_filter)
+
+
+def _get_parent(relationships, entity, column):
+    is_child = relationships['child_entity'] == entity
+    relation = relationships[is_child & (relationships['child_variable'] == column)]
+    if relation.empty:
+        raise LookupError('{}.{} does not reference a loaded resource'.format(entity, column))
+
+    return relation.iloc[0]['parent_entity'], relation.iloc[0]['parent_variable']
+
+
+def _get_column(fhir, entity, column):
+    if column not in fhir[entity].columns:
+        raise LookupError('{}.{} is not loaded'.format(entity, column))
+
+    return fhir[entity][column]
+
+
+def lookup(fhir, relationships, entity, path):
+    """Returns the values reached from each row of a resource by following references.
+
+    Args:
+        fhir (dict):
+            A dictionary of resolved fhir dataframes.
+        relationships (pandas.DataFrame):
+            The relationships between the dataframes.
+        entity (str):
+            The resource to start from.
+        path (list):
+            The columns to follow, each but the last one referencing the resource
+            of the next one, such as ``['period', 'start']``.
+
+    Returns:
+        pandas.Series:
+            The values of the last column, indexed like the resource, with missing
+            values where a reference is missing.
+
+    Raises:
+        LookupError:
+            If a column is not loaded or does not reference a loaded resource.
+    """
+
+    values = _get_column(fhir, entity, path[0])
+    for previous, column in zip(path, path[1:]):
+        entity, variable = _get_parent(relationships, entity, previous)
+        _get_column(fhir, entity, column)
+        parent = fhir[entity].drop_duplicates(variable)
+
+        keys, parent_keys = as_keys(values, parent[variable])
+        positions = pd.Index(parent_keys).get_indexer(keys)
+        found = parent[column].take(positions).where(positions >= 0)
+        values = pd.Series(found.values, index=values.index, name=column)
+
+    return values
+
+
+class Cohort():
+    """A class that selects the admissions of a cohort while the data is loaded.
+
+    The cohort is made of the admissions that match every given criterion,
+    and of their patients. MIMIC tables are filtered while they are read,
+    chunk by chunk, so the rows of excluded admissions are never held in
+    memory. FHIR criteria follow references between resources, so FHIR data
+    is read, converted and resolved entirely first; the rows of resources that
+    reference excluded patients or encounters are then dropped before the
+    entityset is created, which makes the entityset smaller but does not
+    lower the memory used while loading.
+
+    Args:
+        min_age (int):
+            The minimum age of the patient at admission, in years.
+        max_age (int):
+            The maximum age of the patient at admission, in years.
+        start (str or datetime):
+            The earliest admission time.
+        end (str or datetime):
+            The latest admission time.
+        encounter_classes (list):
+            The admission types (MIMIC) or encounter class codes (FHIR) to keep.
+        codes (list):
+            Diagnosis codes, or prefixes of codes, of which the admission must have
+            at least one.
+    """
+
+    __name__ = 'Cohort'
+
+    def __init__(self, min_age=None, max_age=None, start=None, end=None,
+                 encounter_classes=None, codes=None):
+        self.min_age = min_age
+        self.max_age = max_age
+        self.start = None if start is None else pd.Timestamp(start)
+        self.end = None if end is None else pd.Timestamp(end)
+        self.encounter_classes = None if encounter_classes is None else set(encounter_classes)
+        self.codes = None if codes is None else tuple(str(code) for code in codes)
+
+    @property
+    def uses_age(self):
+        return self.min_age is not None or self.max_age is not None
+
+    def get_mask(self, index, admit_times=None, birth_dates=None, classes=None, codes=None):
+        """Returns which admissions belong to the cohort.
+
+        Args:
+            index (pandas.Index):
+                The index of the admissions.
+            admit_times (pandas.Series):
+                The admission time of each admission.
+            birth_dates (pandas.Series):
+                The birth date of the patient of each admission.
+            classes (pandas.Series):
+                The class of each admission.
+            codes (pandas.Series):
+                Whether each admission has one of the cohort codes.
+
+        Returns:
+            pandas.Series:
+                A boolean mask of the admissions. Admissions with a missing value
+                for a criterion do not match it.
+        """
+
+        mask = pd.Series(True, index=index)
+        if self.start is not None or self.end is not None or self.uses_age:
+            admit_times = _to_datetime(admit_times)
+
+        if self.start is not None:
+            mask &= admit_times >= self.start
+
+        if self.end is not None:
+            mask &= admit_times <= self.end
+
+        if self.uses_age:
+            birth_dates = _to_datetime(birth_dates)
+            # ages are counted in calendar years, since the shifted birth dates of
+            # MIMIC are too far from the admissions for a nanosecond timedelta
+            admit_days = admit_times.dt.month * 100 + admit_times.dt.day
+            birth_days = birth_dates.dt.month * 100 + birth_dates.dt.day
+            ages = admit_times.dt.year - birth_dates.dt.year - (admit_days < birth_days)
+            if self.min_age is not None:
+                mask &= ages >= self.min_age
+
+            if self.max_age is not None:
+                mask &= ages <= self.max_age
+
+        if self.encounter_classes is not None:
+            mask &= classes.isin(self.encounter_classes)
+
+        if self.codes is not None:
+            mask &= codes.fillna(False).astype(bool)
+
+        return mask
+
+    def has_codes(self, values):
+        """Returns whether each diagnosis code is one of the cohort codes or starts with one.
+
+        Args:
+            values (pandas.Series):
+                The diagnosis codes.
+
+        Returns:
+            pandas.Series:
+                A boolean mask of the codes.
+        """
+
+        return values.astype('str').str.startswith(self.codes) & values.notnull()
+
+    def select_mimic(self, read_table):
+        """Returns the admissions and patients of the cohort in MIMIC.
+
+        Args:
+            read_table (callable):
+                A function that receives a table name and a list of columns and
+                returns the dataframe of the table.
+
+        Returns:
+            dict:
+                The ``hadm_id`` and ``subject_id`` values of the cohort.
+        """
+
+        admissions = read_table('admissions', ['admittime', 'admission_type'])
+        birth_dates = codes = None
+        if self.uses_age:
+            patients = read_table('patients', ['dob']).drop_duplicates('subject_id')
+            birth_dates = admissions['subject_id'].map(patients.set_index('subject_id')['dob'])
+
+        if self.codes is not None:
+            diagnoses = read_table('diagnoses_icd', ['icd9_code'])
+            coded = diagnoses.loc[self.has_codes(diagnoses['icd9_code']).values, 'hadm_id']
+            codes = admissions['hadm_id'].isin(coded)
+
+        mask = self.get_mask(admissions.index, admissions['admittime'], birth_dates,
+                             admissions['admission_type'], codes)
+        admissions = admissions[mask.values]
+
+        return {'hadm_id': set(admissions['hadm_id']), 'subject_id': set(admissions['subject_id'])}
+
+    def filter_fhir(self, fhir, relationships):
+        """Returns the fhir dataframes restricted to the encounters of the cohort.
+
+        The encounters are matched by the start of their period, the birth date
+        of their subject, the code of their class and the codes of the condition
+        of their diagnosis. The encounters that do not match and the patients
+        without a matching encounter are dropped, along with the rows that
+        reference them, as in ``filter_descendants``.
+
+        Args:
+            fhir (dict):
+                A dictionary of resolved fhir dataframes.
+            relationships (pandas.DataFrame):
+                The relationships between the dataframes.
+
+        Returns:
+            dict:
+                The filtered dataframes. The given dataframes are not modified.
+
+        Raises:
+            LookupError:
+                If a resource needed by a criterion is not loaded.
+        """
+
+        if 'Encounter' not in fhir:
+            raise LookupError('\'Encounter\' file is not loaded.')
+
+        def follow(*path):
+            return lookup(fhir, relationships, 'Encounter', list(path))
+
+        encounters = fhir['Encounter']
+        admit_times = birth_dates = classes = codes = None
+        if self.start is not None or self.end is not None or self.uses_age:
+            admit_times = follow('period', 'start')
+
+        if self.uses_age:
+            birth_dates = follow('subject', 'birthDate')
+
+        if self.encounter_classes is not None:
+            classes = follow('_class', 'code')
+
+        if self.codes is not None:
+            codes = self.has_codes(follow('diagnosis', 'condition', 'code', 'coding', 'code'))
+
+        mask = self.get_mask(encounters.index, admit_times, birth_dates, classes, codes)
+
+        original = fhir
+        fhir = dict(fhir)
+        fhir['Encounter'] = encounters[mask.values]
+        roots = ['Encounter']
+        try:
+            patient, variable = _get_parent(relationships, 'Encounter', 'subject')
+            subjects, keys = as_keys(fhir['Encounter']['subject'], fhir[patient][variable])
+            fhir[patient] = fhir[patient][keys.isin(subjects).values]
+            roots.append(patient)
+
+        except LookupError:
+            pass
+
+        return filter_descendants(fhir, relationships, roots, original)
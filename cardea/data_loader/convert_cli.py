@@ -0,0 +1,26 @@
+import cli.app
+
+from cardea.data_loader.load_mimic import convert_mimic_data
+
+
+@cli.app.CommandLineApp
+def convert_app(app):
+    subset = app.params.tables.split(',') if app.params.tables else None
+
+    # Convert the MIMIC tables once, so that later loads read Parquet partitions.
+    convert_mimic_data(app.params.path, app.params.output_path, subset=subset,
+                       n_partitions=app.params.partitions,
+                       max_memory=app.params.max_memory << 20)
+
+
+convert_app.add_param("path", help="path of the folder with the MIMIC .csv files.")
+convert_app.add_param("output_path", help="path of the folder where the tables are written.")
+convert_app.add_param("-t", "--tables", default=None,
+                      help="comma separated names of the tables to convert, all in default.")
+convert_app.add_param("-p", "--partitions", default=16, type=int,
+                      help="number of patient partitions of each table, 16 in default.")
+convert_app.add_param("-m", "--max_memory", default=512, type=int,
+                      help="memory ceiling in megabytes for reading each chunk, 512 in default.")
+
+if __name__ == '__main__':
+    convert_app.run()
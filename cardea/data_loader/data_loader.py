@@ -1,11 +1,41 @@
-import inspect
-import sys
-
 import networkx as nx
+import numpy as np
 import pandas as pd
 from numpy import nan
+from pandas.api.extensions import take
+from pandas.api.types import is_integer_dtype
+
+from cardea.fhir.registry import get_resource_type
+from cardea.fhir.relationships import FIELDS, RELATIONSHIP_INDEX
+
+RELATIONSHIP_FIELDS = FIELDS[:4]
+MAX_PLANS = 128
+
+# plans computed by ``Diamond.get_plan``, shared by every instance and keyed by the
+# layout of the data, so that loading data with the same layout replays its plan
+_PLANS = {}
+
+
+def as_keys(*columns):
+    """Returns key columns in a form where equal keys compare equal.
+
+    Integer columns, such as interned surrogate keys, are returned as they are.
+    Otherwise every column is converted to strings, so that keys read with
+    different types, such as ``10`` and ``'10'``, still match.
+
+    Args:
+        columns (pandas.Series):
+            The key columns to compare.
 
-from cardea import fhir as fh
+    Returns:
+        tuple:
+            The key columns.
+    """
+
+    if all(is_integer_dtype(column) for column in columns):
+        return columns
+
+    return tuple(column.astype('str') for column in columns)
 
 
 class DataLoader():
@@ -24,23 +54,19 @@ class DataLoader():
             An object with the corresponding fhir class.
 
         Raises:
-            LookupError: An error occurs if df doesn't have an id.
+            LookupError: An error occurs if file_name is not a fhir class or
+                if df doesn't have an id.
         """
 
-        fhir_classes = [c[0] for c in inspect.getmembers(fh)]
-        if file_name not in fhir_classes:
-            raise LookupError('{} file is not part of FHIR schema'.format(file_name))
-
-        object_values = df.to_dict('list')
-        id_enum = ['identifier', 'id', 'object_id']
+        resource_type = get_resource_type(file_name)
 
-        id_exist = any(i in df.columns for i in id_enum)
+        id_exist = any(i in df.columns for i in resource_type.id_columns)
 
         if not id_exist:
             raise LookupError('{} is missing an identifier column'.format(file_name))
 
-        object = getattr(sys.modules[fh.__name__], file_name)(object_values)
-        object.assert_type()
+        columns = {column: df[column] for column in df.columns}
+        object = resource_type.cls(columns)
         return object
 
     def get_object_ids(self, objects):
@@ -63,14 +89,18 @@ class DataLoader():
 
         Args:
             objects: A list of fhir class objects.
+            names: A list of the loaded fhir class names.
 
         Returns:
             A pandas dataframe of the corresponding relationships.
         """
 
-        relationships = [relation for o in objects for relation in o.get_eligible_relationships()
-                         if relation['parent_entity'] in names]
-        relationships = pd.DataFrame(relationships)
+        objects = {object.__name__: object for object in objects}
+        relationships = [relation for relation in RELATIONSHIP_INDEX.among(names)
+                         if relation['child_entity'] in objects and
+                         getattr(objects[relation['child_entity']],
+                                 relation['child_variable']) is not None]
+        relationships = pd.DataFrame(relationships, columns=list(FIELDS))
 
         return relationships
 
@@ -157,6 +187,9 @@ class DataLoader():
 class Diamond(DataLoader):
     """This class serves as a post processing step to reading the data.
 
+    It is built either from fhir class objects or from dataframes and
+    relationships that were already resolved by ``resolve_diamond(merge=False)``.
+
     Attributes:
         fhir: A dictionary with the correspondig fhir dataframes.
         relationships: A dataframe of present fhir Relationships.
@@ -164,10 +197,14 @@ class Diamond(DataLoader):
 
     __name__ = 'Diamond'
 
-    def __init__(self, objects):
+    def __init__(self, objects=None, fhir=None, relationships=None):
+
+        if objects is not None:
+            fhir = self.get_dataframes(objects)
+            relationships = self.get_relationships(objects, list(fhir.keys()))
 
-        self.fhir = self.get_dataframes(objects)
-        self.relationships = self.get_relationships(objects, list(self.fhir.keys()))
+        self.fhir = dict(fhir)
+        self.relationships = relationships.copy()
 
     def get_fhir_dataframes(self):
         """Returns fhir dataframes with their associated names.
@@ -187,25 +224,97 @@ class Diamond(DataLoader):
 
         return self.relationships
 
-    def resolve_diamond(self):
+    def resolve_diamond(self, merge=True):
         """Resolve relationships that have a diamond graphs.
 
         This method is a pipline to solve diamond graphs by depending on MST to
         resolve the present cycles and maintains information by copying data from
         the cut ties.
+
+        Args:
+            merge (bool):
+                Whether to merge the cut ties. If False, only the references are
+                resolved, so that rows can still be filtered along every
+                relationship before ``merge_cycles`` is called. The plan is still
+                computed here, on every row, and replayed by ``merge_cycles``.
         """
 
-        self.relationships['weight'] = self.merge_cost()
+        # relationships to Identifier point at the index of Reference, so they are
+        # resolved even when there is no cycle to break
+        identifiers = (self.relationships['parent_entity'] == 'Identifier').any()
+        if identifiers or self.has_cycles():
 
-        G = nx.from_pandas_edgelist(
-            self.relationships,
-            source='parent_entity',
-            target='child_entity',
-            edge_attr=['weight'])
+            self.resolve_reference()
+            self.get_plan()
 
-        if len(list(nx.cycle_basis(G))) > 0:
+            if merge:
+                self.merge_cycles()
+
+    def merge_cycles(self):
+        """Breaks the cycles of the relationships by merging the cut ties.
+
+        The parent of each edge of the plan is merged into its child and the
+        edge is removed from the relationships.
+        """
+
+        for edge in self.get_plan():
+            if edge[0] != edge[1]:
+                self.merge(edge, remove=True)
+
+    def has_cycles(self):
+        """Returns whether the relationships, taken as undirected edges, form a cycle.
+
+        Unlike ``get_plan``, no merge cost nor spanning tree is computed.
+
+        Returns:
+            bool:
+                True if at least one relationship has to be cut to remove the cycles.
+        """
+
+        roots = {}
+
+        def find(node):
+            while roots.setdefault(node, node) != node:
+                roots[node] = roots[roots[node]]
+                node = roots[node]
+
+            return node
+
+        edges = self.relationships[['parent_entity', 'child_entity']].itertuples(index=False)
+        for source, target in {tuple(sorted(edge)) for edge in edges}:
+            source, target = find(source), find(target)
+            if source == target:
+                return True
+
+            roots[source] = target
+
+        return False
+
+    def get_plan(self):
+        """Returns the edges that break the cycles of the relationships.
+
+        The edges are the ones left out of the maximum spanning tree of the
+        relationships weighted by their merge cost. Plans are cached by the
+        resources, their columns and their relationships, so loading data with
+        the same layout again replays the plan computed for the first load
+        instead of computing the merge costs and building the graph. The merge
+        costs are only computed, into the ``weight`` column, when the plan is not
+        cached and the relationships do not have them yet.
+
+        Returns:
+            list:
+                The ``(source, target)`` edges to merge, in order.
+        """
+
+        relationships = tuple(map(tuple, self.relationships[list(RELATIONSHIP_FIELDS)].values))
+        schema = tuple((name, tuple(map(str, df.columns))) for name, df in self.fhir.items())
+        key = (schema, relationships)
+
+        plan = _PLANS.get(key)
+        if plan is None:
+            if 'weight' not in self.relationships.columns:
+                self.relationships['weight'] = self.merge_cost()
 
-            self.resolve_reference()
             G = nx.from_pandas_edgelist(
                 self.relationships,
                 source='parent_entity',
@@ -213,11 +322,14 @@ class Diamond(DataLoader):
                 edge_attr=['weight'])
 
             X = nx.maximum_spanning_tree(G)
-            edges = [x for x in G.edges() if x not in X.edges()]
+            plan = [x for x in G.edges() if x not in X.edges()]
 
-            for edge in edges:
-                if edge[0] != edge[1]:
-                    self.merge(edge, remove=True)
+            if len(_PLANS) >= MAX_PLANS:
+                _PLANS.pop(next(iter(_PLANS)))
+
+            _PLANS[key] = plan
+
+        return list(plan)
 
     def get_relation(self, source, target):
         """Obtains the record for the edge to break from relationships.
@@ -244,6 +356,9 @@ class Diamond(DataLoader):
     def merge(self, edge, remove=False):
         """Merges dataframes that are in edge then removes it from relationships and updates the fhir.
 
+        The columns of the parent are taken by position into the child, which keeps its
+        own columns without copying them when the parent key is unique.
+
         Args:
             edge: A tuple that has the relationship to be broken.
             remove: A boolean to determine whether the edge should be removed from relationships.
@@ -256,24 +371,40 @@ class Diamond(DataLoader):
         target_entity = relation.iloc[0]['child_entity']
         target_column = relation.iloc[0]['child_variable']
 
-        source_df = self.fhir[source_entity].copy()
-        target_df = self.fhir[target_entity].copy()
-
-        source_df[source_column] = source_df[source_column].astype('str')
-        target_df[target_column] = target_df[target_column].astype('str')
-
-        source_df.columns = [source_entity + "." + str(col) for col in source_df.columns]
-        target_df.columns = [target_entity + "." + str(col) for col in target_df.columns]
-
-        source_merge_col = source_entity + "." + source_column
-        target_merge_col = target_entity + "." + target_column
-
-        target_df = pd.merge(source_df, target_df, how='right', left_on=[source_merge_col],
-                             right_on=[target_merge_col])
-
-        target_df = target_df.drop([source_entity + "." + source_column], axis=1)
+        source_df = self.fhir[source_entity]
+        target_df = self.fhir[target_entity]
+        source_keys, target_keys = as_keys(source_df[source_column], target_df[target_column])
 
-        target_df.columns = [str(col).split('.')[-1] for col in target_df.columns]
+        if source_keys.is_unique:
+            source_positions = pd.Index(source_keys).get_indexer(target_keys)
+            target_positions = None
+        else:
+            pairs = pd.merge(pd.DataFrame({'key': source_keys.values,
+                                           'source': np.arange(len(source_keys))}),
+                             pd.DataFrame({'key': target_keys.values,
+                                           'target': np.arange(len(target_keys))}),
+                             how='right', on='key')
+            source_positions = pairs['source'].fillna(-1).astype('int64').values
+            target_positions = pairs['target'].values
+
+        names = []
+        values = []
+        for position, column in enumerate(source_df.columns):
+            if column != source_column:
+                names.append(column)
+                values.append(take(source_df.iloc[:, position].values, source_positions,
+                                   allow_fill=True))
+
+        for position, column in enumerate(target_df.columns):
+            names.append(column)
+            column_values = target_df.iloc[:, position].values
+            if target_positions is not None:
+                column_values = take(column_values, target_positions)
+
+            values.append(column_values)
+
+        target_df = pd.DataFrame(dict(enumerate(values)), copy=False)
+        target_df.columns = names
         self.fhir[target_entity] = target_df
 
         if remove:
@@ -282,43 +413,98 @@ class Diamond(DataLoader):
     def merge_cost(self):
         """ Calculates the merge cost of two dataframes.
 
-        The equation is defined as the sum of the dataframe sizes.
+        The cost is the number of values written by merging the parent of a
+        relationship into its child, that is the estimated number of rows of the
+        join times the number of columns of both dataframes. Each child row is
+        estimated to match as many parent rows as there are on average per
+        distinct parent key.
 
         Returns:
             A list of the cost of merging for each relationship
         """
 
-        cost = [self.fhir[row['parent_entity']].size + self.fhir[row['child_entity']].size
-                for _, row in self.relationships.iterrows()]
+        parents = self.relationships[['parent_entity', 'parent_variable']].drop_duplicates()
+        cardinality = {
+            (entity, variable): self.fhir[entity][variable].nunique(dropna=False)
+            if variable in self.fhir[entity].columns else len(self.fhir[entity])
+            for entity, variable in parents.itertuples(index=False)
+        }
+
+        rows = {name: len(df) for name, df in self.fhir.items()}
+        columns = {name: len(df.columns) for name, df in self.fhir.items()}
+
+        parent_rows = self.relationships['parent_entity'].map(rows)
+        child_rows = self.relationships['child_entity'].map(rows)
+        keys = pd.Series([cardinality[parent] for parent in zip(
+            self.relationships['parent_entity'], self.relationships['parent_variable'])],
+            index=self.relationships.index, dtype='float64')
+
+        join_rows = child_rows * np.maximum(parent_rows / keys.clip(lower=1), 1)
+        parent_columns = self.relationships['parent_entity'].map(columns)
+        child_columns = self.relationships['child_entity'].map(columns)
+        join_columns = parent_columns + child_columns - 1
 
-        return cost
+        return list(join_rows * join_columns)
+
+    def get_identifier_index(self):
+        """Returns the resource that owns each identifier value.
+
+        Every resource with an ``identifier`` column, other than ``Reference``, is
+        indexed once. When a value appears in several resources, the first loaded
+        resource owns it.
+
+        Returns:
+            pandas.Series:
+                The name of the owning resource indexed by the identifier value, which
+                is a string unless every identifier column holds integer keys.
+        """
+
+        columns = {name: df['identifier'] for name, df in self.fhir.items()
+                   if 'identifier' in df.columns and name != 'Reference'}
+        owners = [pd.Series(name, index=values)
+                  for name, values in zip(columns, as_keys(*columns.values()))]
+
+        if not owners:
+            return pd.Series([], dtype=object)
+
+        index = pd.concat(owners)
+        return index[~index.index.duplicated(keep='first')]
 
     def resolve_reference(self):
         """ Consolidates relationships that have a connection to References.
+
+        Each relationship to ``Reference`` is retargeted to the first loaded resource
+        that owns one of the referenced identifiers, and relationships to
+        ``Identifier`` are removed. The dataframes are not modified.
         """
 
         if 'Identifier' not in list(self.fhir.keys()):
             raise LookupError('\'Identifier\' file is not loaded.')
 
-        identifier_df = self.fhir['Identifier']  # always subset from id
-        identifier_df['object_id'] = identifier_df['object_id'].astype('str')
+        references = self.relationships[self.relationships['parent_entity'] == 'Reference']
+        values = {i: self.fhir[relation['child_entity']][relation['child_variable']]
+                  for i, relation in references.iterrows()}
 
-        for i, relation in self.relationships.iterrows():
+        index = self.get_identifier_index()
+        identifiers = self.fhir['Identifier']['object_id']
+        columns = [index.index, identifiers, *values.values()]
+        native = all(is_integer_dtype(column) for column in columns)
+        if not native:
+            index.index = index.index.astype('str')
+            identifiers = identifiers.astype('str')
 
-            if relation['parent_entity'] == 'Reference':
+        index = index[index.index.isin(identifiers)]
+        order = {name: position for position, name in enumerate(self.fhir)}
 
-                df = self.fhir[relation['child_entity']]
-                subset_values = [str(x) for x in df[relation['child_variable']].values]
-                sub_df = identifier_df.loc[identifier_df['object_id'].isin(subset_values)]
+        for i, relation in self.relationships.iterrows():
 
-                for second_name, second_df in self.fhir.items():
-                    if 'identifier' not in second_df.columns or second_name == 'Reference':
-                        continue
+            if i in values:
+                keys = pd.Index(values[i].unique())
+                keys = keys if native else keys.astype('str')
+                owners = index.reindex(keys).dropna().unique()
 
-                    second_df['identifier'] = second_df['identifier'].astype('str')
-                    if len(set(second_df['identifier']).intersection(sub_df['object_id'])) > 0:
-                        self.relationships.at[i, 'parent_entity'] = second_name
-                        break
+                if len(owners) > 0:
+                    self.relationships.at[i, 'parent_entity'] = min(owners, key=order.get)
 
             if relation['parent_entity'] == 'Identifier':
                 self.relationships.drop(i, inplace=True)
@@ -0,0 +1,417 @@
+import importlib
+import itertools
+import logging
+import queue
+import shutil
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+from functools import partial
+
+import pandas as pd
+
+from cardea.data_loader.chunked import SAMPLE_ROWS, get_rows_under, read_spilled, spill_chunks
+
+LOGGER = logging.getLogger(__name__)
+
+POOL_SIZE = 4
+
+# drivers whose cursors hold the whole result of a query once it is executed, and
+# the cursor class of their module that fetches it from the server instead
+SERVER_CURSORS = {
+    'MySQLdb': 'SSCursor',
+    'pymysql': 'SSCursor',
+}
+
+# drivers whose named cursors are server-side cursors
+NAMED_CURSORS = ('psycopg2', 'psycopg')
+
+TABLE_QUERIES = (
+    "SELECT name FROM sqlite_master WHERE type IN ('table', 'view')",
+    "SELECT table_name FROM information_schema.tables"
+)
+
+
+class ConnectionPool():
+    """A class that shares a few database connections between threads.
+
+    Connections are opened when they are first needed, up to the size of the
+    pool, and a thread that asks for one while all of them are in use waits
+    until another thread returns it. The transaction of a connection is rolled
+    back whenever it is returned, so reads never keep a snapshot open, and a
+    connection whose rollback fails is closed instead of being reused.
+
+    Args:
+        connect (callable, str or sqlalchemy.engine.Engine):
+            A function that returns a new DB-API connection, a SQLAlchemy engine,
+            or the path of a SQLite database.
+        size (int):
+            The maximum number of connections open at the same time.
+    """
+
+    __name__ = 'ConnectionPool'
+
+    def __init__(self, connect, size=POOL_SIZE):
+        if isinstance(connect, str):
+            # the connections are used by the threads that read the tables
+            connect = partial(sqlite3.connect, connect, check_same_thread=False)
+        elif hasattr(connect, 'raw_connection'):
+            connect = connect.raw_connection
+
+        self.connect = connect
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self):
+        """Returns a context manager that borrows a connection from the pool.
+
+        Yields:
+            A DB-API connection.
+        """
+
+        connection = None
+        while connection is None:
+            with self._lock:
+                create = self._idle.empty() and self._opened < self.size
+                if create:
+                    self._opened += 1
+
+            if create:
+                try:
+                    connection = self.connect()
+                except Exception:
+                    with self._lock:
+                        self._opened -= 1
+
+                    raise
+
+            else:
+                # None is put back in place of a discarded connection
+                connection = self._idle.get()
+
+        try:
+            yield connection
+        finally:
+            try:
+                connection.rollback()
+                self._idle.put(connection)
+            except Exception:
+                self._discard(connection)
+                raise
+
+    def _discard(self, connection):
+        try:
+            connection.close()
+        except Exception:
+            LOGGER.debug('Discarded connection could not be closed', exc_info=True)
+
+        with self._lock:
+            self._opened -= 1
+
+        # wakes up a thread waiting for a connection, so that it opens a new one
+        self._idle.put(None)
+
+    def close(self):
+        """Closes the connections that are not in use."""
+        while not self._idle.empty():
+            connection = self._idle.get()
+            if connection is not None:
+                connection.close()
+                with self._lock:
+                    self._opened -= 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def as_pool(connection, size=POOL_SIZE):
+    """Returns a connection pool for the given connection source.
+
+    Args:
+        connection (ConnectionPool, callable, str or sqlalchemy.engine.Engine):
+            A connection pool, which is returned as is, or anything accepted by
+            ``ConnectionPool``.
+        size (int):
+            The size of the pool if a new one is created.
+
+    Returns:
+        ConnectionPool:
+            The connection pool.
+    """
+
+    if isinstance(connection, ConnectionPool):
+        return connection
+
+    return ConnectionPool(connection, size=size)
+
+
+def quote_identifier(name):
+    """Returns a table or column name quoted for a SQL query.
+
+    Args:
+        name (str):
+            The name to quote.
+
+    Returns:
+        str:
+            The name between double quotes, with its double quotes escaped.
+    """
+
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+def get_table_names(pool):
+    """Returns the names of the tables and views of a database.
+
+    The SQLite catalog is tried first and then the standard
+    ``information_schema``, which lists the tables of every schema.
+
+    Args:
+        pool (ConnectionPool):
+            The connections to the database.
+
+    Returns:
+        list:
+            The names of the tables.
+
+    Raises:
+        LookupError:
+            If the database does not have any of the catalogs.
+    """
+
+    for query in TABLE_QUERIES:
+        with pool.connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query)
+            except Exception:
+                continue
+
+            return [row[0] for row in cursor.fetchall()]
+
+    raise LookupError('The tables of the database could not be listed')
+
+
+def get_table_columns(pool, table):
+    """Returns the column names of a table.
+
+    Args:
+        pool (ConnectionPool):
+            The connections to the database.
+        table (str):
+            The name of the table.
+
+    Returns:
+        list:
+            The column names in the order of the table.
+    """
+
+    with pool.connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute('SELECT * FROM {} WHERE 1 = 0'.format(quote_identifier(table)))
+        return [description[0] for description in cursor.description]
+
+
+def build_query(table, columns=None, where=None):
+    """Returns the query that reads the given columns and rows of a table.
+
+    Args:
+        table (str):
+            The name of the table.
+        columns (list or dict):
+            The columns to read, or a dictionary of the columns to read and the
+            names to give them. If None, every column is read.
+        where (str):
+            A SQL condition on the rows to read. If None, every row is read.
+
+    Returns:
+        str:
+            The query.
+    """
+
+    if columns is None:
+        projection = '*'
+    elif isinstance(columns, dict):
+        projection = ', '.join('{} AS {}'.format(quote_identifier(column), quote_identifier(name))
+                               for column, name in columns.items())
+    else:
+        projection = ', '.join(quote_identifier(column) for column in columns)
+
+    query = 'SELECT {} FROM {}'.format(projection, quote_identifier(table))
+    return query if where is None else '{} WHERE {}'.format(query, where)
+
+
+def _convert_types(df, dtype, parse_dates):
+    for column in parse_dates:
+        if column in df.columns:
+            df[column] = pd.to_datetime(df[column], errors='coerce')
+
+    for column, kind in dtype.items():
+        if column not in df.columns:
+            continue
+
+        values = df[column]
+        try:
+            if kind is str:
+                df[column] = values.where(values.isnull(), values.astype('str'))
+            else:
+                df[column] = pd.to_numeric(values).astype(kind)
+
+        except (ValueError, TypeError) as error:
+            LOGGER.warning('Declared type of %s could not be used: %s', column, error)
+
+    return df
+
+
+_cursor_names = itertools.count()
+
+
+def open_cursor(connection, server_side=False):
+    """Returns a cursor of a DB-API connection.
+
+    Most drivers, such as ``psycopg2`` and the MySQL ones, hold the whole result
+    of a query in the client as soon as it is executed. A server-side cursor
+    fetches the rows from the database as they are asked for instead: a named
+    cursor with ``psycopg2`` and ``psycopg``, and a ``SSCursor`` with ``pymysql``
+    and ``MySQLdb``. Other drivers, such as ``sqlite3``, get a regular cursor.
+
+    Args:
+        connection:
+            A DB-API connection, or a SQLAlchemy raw connection wrapping one.
+        server_side (bool):
+            Whether to use a server-side cursor when the driver offers one.
+
+    Returns:
+        A DB-API cursor.
+    """
+
+    if not server_side:
+        return connection.cursor()
+
+    # SQLAlchemy raw connections wrap the connection of the driver
+    driver = getattr(connection, 'dbapi_connection', None) or \
+        getattr(connection, 'connection', None) or connection
+    package = type(driver).__module__.split('.')[0]
+    if package in NAMED_CURSORS:
+        return connection.cursor('cardea_{}'.format(next(_cursor_names)))
+
+    if package in SERVER_CURSORS:
+        cursors = importlib.import_module('{}.cursors'.format(package))
+        return connection.cursor(getattr(cursors, SERVER_CURSORS[package]))
+
+    return connection.cursor()
+
+
+def _get_names(cursor):
+    return [description[0] for description in cursor.description]
+
+
+def _fetch_chunks(cursor, chunksize, max_memory, convert):
+    size = chunksize or SAMPLE_ROWS
+    while True:
+        rows = cursor.fetchmany(size)
+        if not rows:
+            break
+
+        # server-side cursors only describe their columns once rows are fetched
+        chunk = convert(pd.DataFrame.from_records(rows, columns=_get_names(cursor)))
+        if chunksize is None:
+            size = get_rows_under(chunk, max_memory)
+
+        yield chunk
+
+
+def read_sql_table(pool, table, columns=None, where=None, params=None, max_memory=None,
+                   chunksize=None, row_filter=None, dtype=None, parse_dates=None,
+                   categories=None, spill_dir=None):
+    """Returns the dataframe of a database table, read in chunks under a memory ceiling.
+
+    Only the given columns and the rows that match the condition are sent by
+    the database. If a ceiling or a chunk size is given, the rows are fetched
+    from the cursor a chunk at a time, and each chunk is converted, filtered
+    and spilled to Parquet before the next one is fetched, as with
+    ``read_csv_chunked``. The size of the chunks is derived from the first
+    rows when only the ceiling is given. Chunked reads use a server-side
+    cursor when the driver offers one, see ``open_cursor``, so that the
+    database does not send the whole result at once.
+
+    Args:
+        pool (ConnectionPool):
+            The connections to the database.
+        table (str):
+            The name of the table.
+        columns (list or dict):
+            The columns to read, or a dictionary of the columns to read and the
+            names to give them. If None, every column is read.
+        where (str):
+            A SQL condition on the rows to read, which may have placeholders in
+            the style of the driver.
+        params (tuple or dict):
+            The values of the placeholders of the condition.
+        max_memory (int):
+            The memory ceiling in bytes used to choose the size of the chunks.
+        chunksize (int):
+            The number of rows per chunk.
+        row_filter (callable):
+            A function that receives a chunk and returns a boolean mask of the rows
+            to keep.
+        dtype (dict):
+            The type of the columns, either ``str`` or a numeric type.
+        parse_dates (list):
+            The columns parsed as datetimes.
+        categories (list):
+            The string columns returned as categoricals when the table is read in
+            chunks.
+        spill_dir (str):
+            The directory where the Parquet files are kept. If None, they are
+            written to a temporary directory that is removed afterwards.
+
+    Returns:
+        pandas.DataFrame:
+            The filtered content of the table, with the names given by columns.
+    """
+
+    query = build_query(table, columns, where)
+    convert = partial(_convert_types, dtype=dtype or {}, parse_dates=parse_dates or [])
+
+    temporary = spill_dir is None
+    chunked = max_memory is not None or chunksize is not None
+    with pool.connection() as connection:
+        cursor = open_cursor(connection, server_side=chunked)
+        try:
+            if params is None:
+                cursor.execute(query)
+            else:
+                cursor.execute(query, params)
+
+            if not chunked:
+                rows = cursor.fetchall()
+                df = convert(pd.DataFrame.from_records(rows, columns=_get_names(cursor)))
+                if row_filter is not None:
+                    df = df[row_filter(df).values].reset_index(drop=True)
+
+                return df
+
+            LOGGER.debug('Spilling %s in chunks', table)
+            spill_dir = tempfile.mkdtemp(prefix='cardea-') if temporary else spill_dir
+            try:
+                chunks = _fetch_chunks(cursor, chunksize, max_memory, convert)
+                if not spill_chunks(chunks, spill_dir, row_filter=row_filter):
+                    return convert(pd.DataFrame(columns=_get_names(cursor)))
+
+                return read_spilled(spill_dir, categories=categories)
+
+            finally:
+                if temporary:
+                    shutil.rmtree(spill_dir, ignore_errors=True)
+
+        finally:
+            # a server-side cursor has to be closed before the connection is reused
+            cursor.close()
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from urllib.request import urlopen
+from zipfile import ZipFile
+
+LOGGER = logging.getLogger(__name__)
+
+# hidden, so that the loaders do not take it for a data file
+MANIFEST = '.download.json'
+BLOCK_SIZE = 1 << 20
+
+
+def download_file(url, file_path, block_size=BLOCK_SIZE):
+    """Streams the content of a URL to a file and returns its checksum.
+
+    Args:
+        url (str):
+            The URL to download, which may be a ``file://`` URL.
+        file_path (str):
+            The path of the file written.
+        block_size (int):
+            The number of bytes read at a time.
+
+    Returns:
+        str:
+            The hexadecimal SHA-256 digest of the content.
+    """
+
+    digest = hashlib.sha256()
+    with urlopen(url) as response, open(file_path, 'wb') as output_file:
+        for block in iter(lambda: response.read(block_size), b''):
+            digest.update(block)
+            output_file.write(block)
+
+    return digest.hexdigest()
+
+
+def extract_archive(archive_path, output_path):
+    """Extracts the files of a zip archive into a folder.
+
+    The members are copied from the archive to their files a block at a time,
+    without parsing them. Folders inside the archive are flattened, so every
+    member is written inside the output folder.
+
+    Args:
+        archive_path (str):
+            The path of the zip archive.
+        output_path (str):
+            The folder where the files are written.
+
+    Returns:
+        list:
+            The names of the files written.
+    """
+
+    names = []
+    with ZipFile(archive_path) as archive:
+        for member in archive.infolist():
+            name = os.path.basename(member.filename)
+            if member.is_dir() or not name:
+                continue
+
+            with archive.open(member) as member_file, \
+                    open(os.path.join(output_path, name), 'wb') as output_file:
+                shutil.copyfileobj(member_file, output_file, BLOCK_SIZE)
+
+            names.append(name)
+
+    return names
+
+
+class DownloadCache():
+    """A class that keeps the extracted files of downloaded archives on disk.
+
+    Each archive is streamed to a temporary file, verified and extracted into
+    a folder named after it, next to a JSON manifest with its URL and checksum.
+    Later requests for the same URL, and checksum if given, return the folder
+    without downloading it again.
+
+    Args:
+        cache_dir (str):
+            The directory where the folders are stored.
+    """
+
+    __name__ = 'DownloadCache'
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def get_manifest(self, name):
+        """Returns the manifest of a cached archive.
+
+        Args:
+            name (str):
+                The name of the archive.
+
+        Returns:
+            dict:
+                The ``url``, ``sha256`` and ``files`` of the archive, or None if it
+                is not cached.
+        """
+
+        manifest_path = os.path.join(self.cache_dir, name, MANIFEST)
+        if not os.path.exists(manifest_path):
+            return None
+
+        with open(manifest_path) as manifest_file:
+            return json.load(manifest_file)
+
+    def get(self, name, url, checksum=None):
+        """Returns the folder with the extracted files of an archive.
+
+        Args:
+            name (str):
+                The name of the archive, used as the name of its folder.
+            url (str):
+                The URL of the zip archive.
+            checksum (str):
+                The expected hexadecimal SHA-256 digest of the archive. If None,
+                the archive is not verified.
+
+        Returns:
+            str:
+                The path of the folder.
+
+        Raises:
+            ValueError:
+                If the checksum of the downloaded archive is not the expected one.
+        """
+
+        path = os.path.join(self.cache_dir, name)
+        manifest = self.get_manifest(name)
+        if manifest is not None and manifest['url'] == url and \
+                checksum in (None, manifest['sha256']):
+            return path
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temporary_path = tempfile.mkdtemp(dir=self.cache_dir)
+        try:
+            LOGGER.info('Downloading %s from %s', name, url)
+            archive_path = os.path.join(temporary_path, 'archive.zip')
+            digest = download_file(url, archive_path)
+            if checksum is not None and digest != checksum:
+                raise ValueError('Checksum of {} is {}, expected {}'.format(
+                    url, digest, checksum))
+
+            output_path = os.path.join(temporary_path, name)
+            os.makedirs(output_path)
+            files = extract_archive(archive_path, output_path)
+
+            manifest = {'url': url, 'sha256': digest, 'files': files}
+            with open(os.path.join(output_path, MANIFEST), 'w') as manifest_file:
+                json.dump(manifest, manifest_file)
+
+            shutil.rmtree(path, ignore_errors=True)
+            try:
+                os.rename(output_path, path)
+            except OSError:
+                # another process stored the same archive first
+                pass
+
+        finally:
+            shutil.rmtree(temporary_path, ignore_errors=True)
+
+        return path
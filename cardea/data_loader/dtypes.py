@@ -0,0 +1,153 @@
+import warnings
+
+import pandas as pd
+from pandas.api.types import (
+    is_categorical_dtype, is_datetime64_any_dtype, is_float_dtype, is_integer_dtype,
+    is_numeric_dtype, is_object_dtype)
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.2
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
+BOOLEANS = {'true': True, 'false': False, '1': True, '0': False}
+
+
+def _to_numeric(values):
+    try:
+        return pd.to_numeric(values)
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_datetime(values, format=None):
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            return pd.to_datetime(values, format=format)
+    except (ValueError, TypeError, OverflowError):
+        if format is None:
+            return None
+
+        return _to_datetime(values)
+
+
+def _to_boolean(values):
+    strings = values.dropna().astype('str').str.lower()
+    if not strings.isin(BOOLEANS.keys()).all():
+        return None
+
+    return values.astype('str').str.lower().map(BOOLEANS).astype('boolean')
+
+
+def _is_integral(values):
+    if is_float_dtype(values):
+        return bool((values.dropna() % 1 == 0).all())
+
+    return is_integer_dtype(values)
+
+
+def infer_dtype(values, kind=None, key=False, sample_size=1000, category_ratio=0.5):
+    """Returns a column converted to the dtype that fits its values.
+
+    Columns that are not ``object`` are left as they are, except categoricals of
+    strings, which are converted through their categories. Otherwise the declared
+    type of the column is used if known, and a bounded sample of its values is
+    parsed to choose between a numeric, datetime or categorical dtype if not, so
+    that the whole column is only converted once.
+
+    Args:
+        values (pandas.Series):
+            The column to convert.
+        kind (str):
+            The declared type of the column, either ``'bool'``, ``'int'`` (any number)
+            or ``'str'``, or None if unknown.
+        key (bool):
+            Whether the column holds the identifiers of its resource or references
+            to other resources. Integer keys are converted to the nullable ``Int64``
+            dtype, so that keys and references with missing values share a dtype, and
+            keys are never categorical.
+        sample_size (int):
+            Number of values parsed to infer the type of an undeclared column.
+        category_ratio (float):
+            Maximum ratio of distinct values to values in the sample for a string
+            column to be converted to a categorical.
+
+    Returns:
+        pandas.Series:
+            The converted column, or the given one if no conversion applies.
+    """
+
+    if key:
+        numeric = _to_numeric(values) if is_object_dtype(values) else values
+        if numeric is not None and is_numeric_dtype(numeric) and _is_integral(numeric):
+            return numeric.astype('Int64')
+
+        return values if numeric is None else numeric
+
+    if is_categorical_dtype(values) and is_object_dtype(values.cat.categories):
+        # string categoricals, as read back from chunks, are converted by their categories
+        categories = infer_dtype(pd.Series(values.cat.categories), kind, False, sample_size,
+                                 category_ratio=0)
+        if is_object_dtype(categories):
+            return values
+
+        converted = categories.reindex(values.cat.codes.values)
+        return pd.Series(converted.values, index=values.index, name=values.name)
+
+    if not is_object_dtype(values):
+        return values
+
+    if kind == 'bool':
+        boolean = _to_boolean(values)
+        return values if boolean is None else boolean
+
+    sample = values.dropna()
+    sample = sample.sample(sample_size, random_state=0) if len(sample) > sample_size else sample
+    if len(sample) == 0:
+        return values
+
+    is_numeric = _to_numeric(sample) is not None
+    if is_numeric and kind != 'str':
+        numeric = _to_numeric(values)
+        return values if numeric is None else numeric
+
+    if not is_numeric and _to_datetime(sample) is not None:
+        # parsing with the format of the sample avoids guessing it for every value
+        datetime = _to_datetime(values, guess_datetime_format(str(sample.iloc[0])))
+        if datetime is not None and is_datetime64_any_dtype(datetime):
+            return datetime
+
+    if sample.nunique() <= category_ratio * len(sample):
+        return values.astype('category')
+
+    return values
+
+
+def infer_dtypes(df, types=None, keys=(), **kwargs):
+    """Returns a dataframe with each column converted to the dtype that fits its values.
+
+    Args:
+        df (pandas.DataFrame):
+            The dataframe to convert.
+        types (dict):
+            The declared type of the columns, as given by ``ResourceType.types``.
+        keys (list):
+            The columns that hold keys.
+        kwargs:
+            Options passed to ``infer_dtype``.
+
+    Returns:
+        pandas.DataFrame:
+            The converted dataframe. Columns that are not converted are not copied.
+    """
+
+    types = types or {}
+    keys = set(keys)
+
+    columns = [infer_dtype(df.iloc[:, position], types.get(column), column in keys, **kwargs)
+               for position, column in enumerate(df.columns)]
+
+    df = pd.DataFrame(dict(enumerate(columns)), index=df.index, copy=False)
+    df.columns = [column.name for column in columns]
+    return df
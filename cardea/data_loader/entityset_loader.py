@@ -1,17 +1,71 @@
-import sys
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from glob import glob
 
 import featuretools as ft
 import pandas as pd
+from pandas.api.types import is_bool_dtype, is_categorical_dtype, is_numeric_dtype
 
 from cardea.data_loader import DataLoader, Diamond
+from cardea.data_loader.cache import EntitySetCache
+from cardea.data_loader.chunked import needs_chunking, read_csv_chunked
+from cardea.data_loader.database import (
+    POOL_SIZE, as_pool, get_table_columns, get_table_names, read_sql_table)
+from cardea.data_loader.dtypes import infer_dtypes
+from cardea.data_loader.fhir_json import read_bundle_files, read_ndjson_files
+from cardea.data_loader.keys import get_key_columns, intern_keys
+from cardea.data_loader.profiling import LoadProfiler
+from cardea.data_loader.pruning import ALWAYS_LOADED
+from cardea.data_loader.readers import PANDAS_TYPES, read_csv_file, read_csv_header
+from cardea.data_loader.sampling import sample_dataframes
+from cardea.fhir.registry import get_resource_type
+from cardea.fhir.relationships import RELATIONSHIP_INDEX
+
+LOGGER = logging.getLogger(__name__)
+
+FILE_PATTERNS = {
+    'csv': '*.csv',
+    'ndjson': '*.ndjson',
+    'bundle': '*.json'
+}
 
 
 class EntitySetLoader(DataLoader):
-    """A class that loads fhir class objects to featuretools entityset."""
+    """A class that loads fhir class objects to featuretools entityset.
+
+    Every load records the time spent in each of its stages and the rows and
+    memory usage of each loaded resource in ``report``, which is also logged.
+
+    Args:
+        track_memory (bool):
+            Whether to trace the peak memory allocated by each stage of a load.
+        intern_keys (bool):
+            Whether to replace the identifiers and references of every resource by
+            dense integer surrogate keys before resolving the relationships.
+
+    Attributes:
+        report (dict):
+            The profiling report of the last load, as returned by
+            ``LoadProfiler.get_report``.
+        keys (KeyDictionary):
+            The mapping from the surrogate keys of the last load back to the original
+            identifiers, or None if the keys were not interned.
+        merged (dict):
+            The resources of the last load that had other resources merged into them
+            to break the cycles of the relationships, with the list of those resources.
+    """
 
     __name__ = 'EntitySetLoader'
 
+    def __init__(self, track_memory=False, intern_keys=False):
+        self.track_memory = track_memory
+        self.intern_keys = intern_keys
+        self.profiler = LoadProfiler(track_memory)
+        self.report = None
+        self.keys = None
+        self.merged = {}
+
     def create_entity(self, fhir, identifiers, entity_set):
         """Creates an entity from fhir dataframes and add it to entityset.
 
@@ -25,7 +79,8 @@ class EntitySetLoader(DataLoader):
         for object_name, df in fhir.items():
 
             id = identifiers[object_name]
-            df = df.apply(pd.to_numeric, errors='ignore')
+            df = infer_dtypes(df, get_resource_type(object_name).types,
+                              keys=get_key_columns(object_name, df))
 
             if object_name == 'Period':
                 entity_set.entity_from_dataframe(entity_id=str(object_name),
@@ -55,76 +110,672 @@ class EntitySetLoader(DataLoader):
 
             entity_set.add_relationship(new_relationship)
 
-    def load_data_entityset(self, folder_path):
-        """Returns an entityset loaded with .csv files in folder_path.
+    def load_data_entityset(self, folder_path, format='csv', n_jobs=1, cache_dir=None,
+                            resources=None, columns=None, sample=None, cohort=None):
+        """Returns an entityset loaded with the files in folder_path.
+
+        Loads .csv files, FHIR Bulk Data .ndjson files or FHIR Bundle .json files
+        into pandas dataframes then loads them into featuretools' entityset.
 
-        Loads .csv files into pandas dataframes then loads them into featuretools' entityset.
+        If a cache directory is given, the resolved dataframes are stored there and
+        reused as long as the files, the loading options and the Cardea version
+        stay the same.
 
         Args:
             folder_path (dict):
-                A directory of all .csv files that should be loaded.
+                A directory of all the files that should be loaded.
+            format (str):
+                The format of the files, either ``'csv'``, ``'ndjson'`` or ``'bundle'``.
+            n_jobs (int):
+                Number of processes used to flatten bundles.
+            cache_dir (str):
+                A directory where the loaded data is cached.
+            resources (list):
+                The resources to load, such as the ones returned by
+                ``get_problem_resources``. ``Reference`` and ``Identifier`` are always
+                loaded. If None, every resource is loaded.
+            columns (dict):
+                The columns to load from each resource, where the key is the resource
+                name. The identifier columns are always loaded. Resources that are
+                not in columns are loaded entirely.
+            sample (float):
+                The fraction of patients to load, chosen by the hash of their
+                identifier, along with the rows that reference them. The cache holds
+                every patient, so loading another fraction reuses it. If None, every
+                patient is loaded.
+            cohort (Cohort):
+                The encounters to load. The encounters that do not belong to the
+                cohort and the patients without any that does are dropped, along with
+                the rows that reference them, before the entityset is created. Like
+                the sample, it is applied after the files are read and resolved, and
+                after the cache, so it does not lower the memory used while loading.
+
+        Returns:
+            featuretools.EntitySet:
+                An entityset with loaded data.
+
+        Raises:
+            ValueError: An error occurs if the format is not supported.
+            LookupError: An error occurs if resources are given and none of them,
+                other than ``Reference`` and ``Identifier``, is in the files.
+        """
+
+        if format not in FILE_PATTERNS:
+            raise ValueError('{} is not a supported format'.format(format))
+
+        self.profiler = LoadProfiler(self.track_memory)
+
+        if cache_dir:
+            cache = EntitySetCache(cache_dir)
+            file_paths = glob(os.path.join(folder_path, FILE_PATTERNS[format]))
+            key = cache.get_key(file_paths, format=format, intern_keys=self.intern_keys,
+                                resources=resources and sorted(resources), columns=columns,
+                                merged=False)
+
+            with self.profiler.stage('load_cache'):
+                cached = cache.load(key)
+
+            if cached is not None:
+                fhir, relationships, identifiers, self.keys = cached
+                return self._create_entityset(fhir, relationships, identifiers, sample,
+                                              cohort)
+
+        with self.profiler.stage('read'):
+            fhir = self.read_files(folder_path, format=format, n_jobs=n_jobs,
+                                   resources=resources, columns=columns)
+
+        fhir, relationships, identifiers = self.resolve_dataframes(fhir)
+        if cache_dir:
+            with self.profiler.stage('save_cache'):
+                cache.save(key, fhir, relationships, identifiers, keys=self.keys)
+
+        return self._create_entityset(fhir, relationships, identifiers, sample, cohort)
+
+    def load_database_entityset(self, connection, resources=None, columns=None, n_jobs=None,
+                                max_memory=None, filters=None, sample=None, cohort=None):
+        """Returns an entityset loaded with the tables of a database.
+
+        Each table named after a fhir class is read like the .csv file of the
+        class, and the entityset is built as with ``load_data_entityset``.
+
+        Args:
+            connection (ConnectionPool, callable or str):
+                A ``ConnectionPool`` or anything it accepts, such as a SQLAlchemy
+                engine or the path of a SQLite database.
+            resources (list):
+                The resources to load. ``Reference`` and ``Identifier`` are always
+                loaded. If None, every resource is loaded.
+            columns (dict):
+                The columns to load from each resource, where the key is the resource
+                name. The identifier columns are always loaded.
+            n_jobs (int):
+                Number of threads used to read the tables, each with its own
+                connection. If None, the size of the pool.
+            max_memory (int):
+                A memory ceiling in bytes for reading each table.
+            filters (dict):
+                A function or a SQL condition for each resource name.
+            sample (float):
+                The fraction of patients to load.
+            cohort (Cohort):
+                The encounters to load.
 
         Returns:
             featuretools.EntitySet:
                 An entityset with loaded data.
         """
 
-        fhir = self.read_csv_files(folder_path=folder_path)
-        return self.load_df_entityset(fhir=fhir)
+        self.profiler = LoadProfiler(self.track_memory)
+        if resources is not None:
+            resources = set(resources).union(ALWAYS_LOADED)
+
+        with self.profiler.stage('read'):
+            fhir = self.read_sql_tables(connection, columns=columns, n_jobs=n_jobs,
+                                        resources=resources, max_memory=max_memory,
+                                        filters=filters)
+
+        _check_resources(fhir, resources, 'the database')
+        fhir, relationships, identifiers = self.resolve_dataframes(fhir)
+        return self._create_entityset(fhir, relationships, identifiers, sample, cohort)
+
+    def read_files(self, folder_path, format='csv', n_jobs=1, resources=None, columns=None):
+        """Returns a dictionary with the resources of the files in folder_path.
+
+        The .csv files of resources that are not loaded are not read, while the
+        other formats are parsed entirely and then pruned.
+
+        Args:
+            folder_path (str):
+                A directory of all the files that should be loaded.
+            format (str):
+                The format of the files, either ``'csv'``, ``'ndjson'`` or ``'bundle'``.
+            n_jobs (int):
+                Number of processes used to flatten bundles.
+            resources (list):
+                The resources to load besides ``Reference`` and ``Identifier``. If
+                None, every resource is loaded.
+            columns (dict):
+                The columns to load from each resource, where the key is the resource
+                name. The identifier columns are always loaded.
+
+        Returns:
+            A dictionary of fhir resources in pandas dataframe format.
+
+        Raises:
+            ValueError: An error occurs if the format is not supported.
+            LookupError: An error occurs if resources are given and none of them,
+                other than ``Reference`` and ``Identifier``, is in the files.
+        """
+
+        if resources is not None:
+            resources = set(resources).union(ALWAYS_LOADED)
+
+        if format == 'csv':
+            fhir = self.read_csv_files(folder_path=folder_path, columns=columns,
+                                       resources=resources)
+            return _check_resources(fhir, resources, folder_path)
+        elif format == 'ndjson':
+            fhir = read_ndjson_files(folder_path=folder_path)
+        elif format == 'bundle':
+            fhir = read_bundle_files(folder_path=folder_path, n_jobs=n_jobs)
+        else:
+            raise ValueError('{} is not a supported format'.format(format))
+
+        if resources is not None:
+            fhir = {name: df for name, df in fhir.items() if name in resources}
+
+        for name, usecols in (columns or {}).items():
+            if name in fhir:
+                keep = set(get_resource_type(name).id_columns).union(usecols)
+                fhir[name] = fhir[name][[column for column in fhir[name] if column in keep]]
 
-    def read_csv_files(self, folder_path):
+        return _check_resources(fhir, resources, folder_path)
+
+    def read_csv_files(self, folder_path, columns=None, n_jobs=None, engine='pyarrow',
+                       resources=None, max_memory=None, filters=None, spill_dir=None):
         """Returns a dictionary with loaded .csv files in folder_path.
 
-        Loads .csv files into pandas dataframes.
+        Loads .csv files into pandas dataframes. The files are read concurrently by
+        a pool of threads, and the types of the columns are taken from the
+        declared types of the fhir classes instead of being inferred.
 
         Args:
-            folder_path: A dictionary of fhir resources in pandas dataframe format.
+            folder_path (str):
+                A directory of all .csv files that should be loaded.
+            columns (dict):
+                The columns to read from each resource file, where the key is the
+                resource name. The identifier columns are always read. Resources that
+                are not in columns are read entirely.
+            n_jobs (int):
+                Number of threads used to read the files. If None, it depends on the
+                number of processors.
+            engine (str):
+                Either ``'pyarrow'`` or ``'c'``, the parser used to read the files.
+            resources (list):
+                The resources to read. If None, every file is read.
+            max_memory (int):
+                A memory ceiling in bytes for parsing each file. Files too large to be
+                parsed under it are read in chunks, which are spilled to Parquet and
+                read back with their string columns as categoricals.
+            filters (dict):
+                A function for each resource name that receives a dataframe of the
+                resource and returns a boolean mask of the rows to keep. Large files
+                are filtered chunk by chunk.
+            spill_dir (str):
+                A directory where the chunks of each large file are kept, in a
+                subdirectory named after the resource. If None, they are removed
+                once read back.
 
         Returns:
             A dictionary of fhir resources in pandas dataframe format.
         """
 
-        fhir = {}
+        csv_files = glob(os.path.join(folder_path, '*.csv'))
+        names = [os.path.splitext(os.path.basename(file_path))[0] for file_path in csv_files]
+        if resources is not None:
+            csv_files = [file_path for file_path, name in zip(csv_files, names)
+                         if name in resources]
+            names = [name for name in names if name in resources]
 
-        csv_files = glob(folder_path + "/*.csv")
-        for file_path in csv_files:
-            df = pd.read_csv(file_path)
-            if sys.platform.startswith('win32'):
-                file_name = file_path.split("\\")[-1].split(".")[0]
-            else:
-                file_name = file_path.split("/")[-1].split(".")[0]
+        options = {'columns': columns or {}, 'engine': engine, 'max_memory': max_memory,
+                   'filters': filters or {}, 'spill_dir': spill_dir}
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            dfs = executor.map(lambda file_path, name: self._read_csv_file(
+                file_path, name, **options), csv_files, names)
 
-            fhir[file_name] = df
+        return dict(zip(names, dfs))
 
-        return fhir
+    def read_sql_tables(self, connection, columns=None, n_jobs=None, resources=None,
+                        max_memory=None, filters=None, spill_dir=None):
+        """Returns a dictionary with the tables of a database named after fhir classes.
 
-    def load_df_entityset(self, fhir):
-        """Returns an entityset loaded with received dataframes in fhir.
+        Only the requested columns of each table are queried, with the types of
+        the fhir classes, and the rows are fetched in chunks under a memory
+        ceiling like the chunks of large .csv files. The tables are read
+        concurrently by a pool of threads that share a pool of connections.
 
-        Loads the received dictionary of fhir resources into featuretools' entityset, where
-        the key is the resource name and the value is a pandas dataframe.
+        Args:
+            connection (ConnectionPool, callable or str):
+                A ``ConnectionPool`` or anything it accepts, such as a SQLAlchemy
+                engine or the path of a SQLite database.
+            columns (dict):
+                The columns to read from each resource table, where the key is the
+                resource name. The identifier columns are always read.
+            n_jobs (int):
+                Number of threads used to read the tables, each with its own
+                connection. If None, the size of the pool.
+            resources (list):
+                The resources to read. If None, every table of a fhir class is read.
+            max_memory (int):
+                A memory ceiling in bytes for reading each table. Tables are
+                fetched in chunks, which are spilled to Parquet and read back with
+                their string columns as categoricals.
+            filters (dict):
+                A function for each resource name that receives a dataframe of the
+                resource and returns a boolean mask of the rows to keep, or a SQL
+                condition that is evaluated by the database.
+            spill_dir (str):
+                A directory where the chunks of each table are kept, in a
+                subdirectory named after the resource. If None, they are removed
+                once read back.
+
+        Returns:
+            A dictionary of fhir resources in pandas dataframe format.
+        """
+
+        pool = as_pool(connection, size=n_jobs or POOL_SIZE)
+        try:
+            names = []
+            for name in get_table_names(pool):
+                try:
+                    get_resource_type(name)
+                except LookupError:
+                    continue
+
+                if resources is None or name in resources:
+                    names.append(name)
+
+            options = {'columns': columns or {}, 'max_memory': max_memory,
+                       'filters': filters or {}, 'spill_dir': spill_dir}
+            with ThreadPoolExecutor(max_workers=n_jobs or pool.size) as executor:
+                dfs = list(executor.map(lambda name: self._read_sql_table(
+                    pool, name, **options), names))
+
+        finally:
+            if pool is not connection:
+                pool.close()
+
+        return dict(zip(names, dfs))
+
+    @staticmethod
+    def _read_sql_table(pool, name, columns, max_memory, filters, spill_dir):
+        resource_type = get_resource_type(name)
+        table_columns = get_table_columns(pool, name)
+        usecols = columns.get(name)
+        if usecols is not None:
+            usecols = set(resource_type.id_columns).union(usecols)
+            table_columns = [column for column in table_columns if column in usecols]
+
+        # keys are compared and merged by value, so they are never categorical
+        keys = set(get_key_columns(name, pd.DataFrame(columns=table_columns)))
+        dtype = {column: PANDAS_TYPES[kind] for column, kind in resource_type.types.items()
+                 if kind in PANDAS_TYPES}
+        categories = [column for column, kind in resource_type.types.items()
+                      if kind == 'str' and column not in keys]
+
+        row_filter = filters.get(name)
+        where = None
+        if isinstance(row_filter, str):
+            where, row_filter = row_filter, None
+
+        return read_sql_table(pool, name, columns=table_columns, where=where,
+                              max_memory=max_memory, row_filter=row_filter, dtype=dtype,
+                              categories=categories,
+                              spill_dir=spill_dir and os.path.join(spill_dir, name))
+
+    def _read_csv_file(self, file_path, name, columns, engine, max_memory, filters, spill_dir):
+        try:
+            resource_type = get_resource_type(name)
+            types = resource_type.types
+            usecols = columns.get(name)
+            if usecols is not None:
+                usecols = list(resource_type.id_columns) + list(usecols)
+
+        except LookupError:
+            types = {}
+            usecols = None
+
+        row_filter = filters.get(name)
+        if needs_chunking(file_path, max_memory):
+            return self._read_csv_chunked(file_path, name, usecols, types, max_memory,
+                                          row_filter, spill_dir)
+
+        df = read_csv_file(file_path, columns=usecols, types=types, engine=engine)
+        return df if row_filter is None else df[row_filter(df).values]
+
+    @staticmethod
+    def _read_csv_chunked(file_path, name, columns, types, max_memory, row_filter, spill_dir):
+        header = read_csv_header(file_path)
+        if columns is not None:
+            columns = [column for column in header if column in set(columns)]
+
+        # keys are compared and merged by value, so they are never categorical
+        keys = set(get_key_columns(name, pd.DataFrame(columns=header))) if types else set()
+        dtype = {column: PANDAS_TYPES[kind] for column, kind in types.items()
+                 if kind in PANDAS_TYPES}
+        categories = [column for column, kind in types.items()
+                      if kind == 'str' and column not in keys]
+        spill_dir = spill_dir and os.path.join(spill_dir, name)
+
+        try:
+            return read_csv_chunked(file_path, max_memory=max_memory, row_filter=row_filter,
+                                    categories=categories, spill_dir=spill_dir,
+                                    usecols=columns, dtype=dtype or None)
+        except (ValueError, TypeError) as error:
+            if not dtype:
+                raise
+
+            LOGGER.warning('Declared types of %s could not be used: %s', file_path, error)
+            return read_csv_chunked(file_path, max_memory=max_memory, row_filter=row_filter,
+                                    categories=categories, spill_dir=spill_dir,
+                                    usecols=columns)
+
+    def resolve_dataframes(self, fhir):
+        """Returns the fhir dataframes after resolving their relationships.
+
+        References are resolved to the resources that own them, but the ties
+        that break the cycles are not merged yet, so the cohort and the sample
+        can follow every relationship. ``_create_entityset`` merges them.
 
         Args:
             fhir: A dictionary of fhir resources in pandas dataframe format.
 
         Returns:
-            An entityset with loaded data.
+            A tuple with three components, a dictionary of the resolved fhir dataframes,
+                a dataframe of their relationships and a dictionary of the identifier
+                column of each dataframe.
         """
 
         all_objects = []
-        entity_set = ft.EntitySet(id="fhir")
 
-        for name, df in fhir.items():
-            object = self.create_object(df, name)
-            all_objects.append(object)
+        self.keys = None
+        if self.intern_keys:
+            with self.profiler.stage('intern_keys'):
+                fhir, self.keys = intern_keys(fhir)
+
+        with self.profiler.stage('create_object'):
+            for name, df in fhir.items():
+                object = self.create_object(df, name)
+                all_objects.append(object)
+
+        with self.profiler.stage('resolve_diamond'):
+            diamond = Diamond(all_objects)
+            diamond.resolve_diamond(merge=False)
 
-        diamond = Diamond(all_objects)
-        diamond.resolve_diamond()
         fhir = diamond.get_fhir_dataframes()
         relationships = diamond.get_fhir_relationships()
         identifiers = diamond.get_object_ids(all_objects)
 
-        self.create_entity(fhir, identifiers, entity_set=entity_set)
-        self.create_relationships(relationships, entity_set=entity_set)
+        return fhir, relationships, identifiers
+
+    def create_entityset(self, fhir, relationships, identifiers):
+        """Returns an entityset loaded with resolved fhir dataframes.
+
+        Args:
+            fhir: A dictionary of resolved fhir dataframes.
+            relationships: A dataframe of the relationships in fhir.
+            identifiers: A dictionary of the identifier column of each dataframe.
+
+        Returns:
+            An entityset with loaded data.
+        """
+
+        entity_set = ft.EntitySet(id="fhir")
+
+        with self.profiler.stage('create_entity'):
+            self.create_entity(fhir, identifiers, entity_set=entity_set)
+
+        with self.profiler.stage('create_relationships'):
+            self.create_relationships(relationships, entity_set=entity_set)
+
+        return entity_set
+
+    def _create_entityset(self, fhir, relationships, identifiers, sample=None, cohort=None):
+        if cohort is not None:
+            with self.profiler.stage('cohort'):
+                fhir = cohort.filter_fhir(fhir, relationships)
+
+        if sample is not None:
+            with self.profiler.stage('sample'):
+                fhir = sample_dataframes(fhir, relationships, identifiers, sample,
+                                         keys=self.keys)
+
+        with self.profiler.stage('merge_cycles'):
+            diamond = Diamond(fhir=fhir, relationships=relationships)
+            diamond.merge_cycles()
+            fhir = diamond.get_fhir_dataframes()
+
+            cut = relationships.drop(diamond.get_fhir_relationships().index)
+            relationships = diamond.get_fhir_relationships()
+            self.merged = {child: sorted(set(parents['parent_entity']))
+                           for child, parents in cut.groupby('child_entity')}
+
+        entity_set = self.create_entityset(fhir, relationships, identifiers)
+
+        self.profiler.add_resources(fhir)
+        self.report = self.profiler.get_report()
+        self.profiler.log_report()
 
         return entity_set
+
+    def load_df_entityset(self, fhir, sample=None, cohort=None):
+        """Returns an entityset loaded with received dataframes in fhir.
+
+        Loads the received dictionary of fhir resources into featuretools' entityset, where
+        the key is the resource name and the value is a pandas dataframe.
+
+        Args:
+            fhir: A dictionary of fhir resources in pandas dataframe format.
+            sample (float):
+                The fraction of patients to load, as in ``load_data_entityset``.
+            cohort (Cohort):
+                The encounters to load, as in ``load_data_entityset``.
+
+        Returns:
+            An entityset with loaded data.
+        """
+
+        self.profiler = LoadProfiler(self.track_memory)
+
+        return self._create_entityset(*self.resolve_dataframes(fhir), sample, cohort)
+
+    def append_data_entityset(self, entity_set, folder_path, format='csv', n_jobs=1):
+        """Appends the resources of the files in folder_path to an entityset.
+
+        See ``append_df_entityset``. The ``object_id`` of the elements flattened
+        from ``'ndjson'`` and ``'bundle'`` files are generated again for every
+        read, so they are shifted past the largest ``object_id`` of the entityset
+        before the rows are appended.
+
+        Args:
+            entity_set (featuretools.EntitySet):
+                An entityset loaded by ``load_data_entityset`` or ``load_df_entityset``.
+            folder_path (str):
+                A directory of the files with the new rows.
+            format (str):
+                The format of the files, either ``'csv'``, ``'ndjson'`` or ``'bundle'``.
+            n_jobs (int):
+                Number of processes used to flatten bundles.
+
+        Returns:
+            featuretools.EntitySet:
+                The updated entityset.
+        """
+
+        self.profiler = LoadProfiler(self.track_memory)
+
+        with self.profiler.stage('read'):
+            fhir = self.read_files(folder_path, format=format, n_jobs=n_jobs)
+
+        if format in ('ndjson', 'bundle'):
+            offset = self._get_max_object_id(entity_set)
+            with self.profiler.stage('offset_object_ids'):
+                fhir = _offset_object_ids(fhir, offset)
+
+        return self._append_entityset(entity_set, fhir)
+
+    def append_df_entityset(self, entity_set, fhir):
+        """Appends the rows of received dataframes in fhir to an entityset.
+
+        Only the new rows are validated against the fhir classes and converted to
+        the dtypes of the entities, then they are appended to the entities of their
+        resources, whose time and last time indexes are updated. ``Reference`` and
+        ``Identifier`` rows whose key is already in the entityset are skipped, since
+        new resources usually point at resources that were already loaded.
+
+        Resources that had other resources merged into them when the entityset was
+        loaded, as listed in ``merged``, cannot be appended to, since the columns
+        they got from those resources could not be filled for the new rows.
+
+        Args:
+            entity_set (featuretools.EntitySet):
+                An entityset loaded by ``load_data_entityset`` or ``load_df_entityset``.
+            fhir (dict):
+                A dictionary of the new fhir resources in pandas dataframe format.
+
+        Returns:
+            featuretools.EntitySet:
+                The updated entityset.
+
+        Raises:
+            LookupError: An error occurs if a resource is not an entity of the entityset.
+            ValueError: An error occurs if a resource had other resources merged into
+                it, if a new row has the identifier of an existing row, or if its
+                values do not fit the fhir class.
+        """
+
+        self.profiler = LoadProfiler(self.track_memory)
+
+        return self._append_entityset(entity_set, fhir)
+
+    def _append_entityset(self, entity_set, fhir):
+        entity_ids = {entity.id for entity in entity_set.entities}
+        for name in fhir:
+            if name not in entity_ids:
+                raise LookupError('{} is not an entity of the entityset'.format(name))
+
+            if name in self.merged:
+                raise ValueError('{} cannot be appended to, since {} were merged into it '
+                                 'when the entityset was loaded'.format(
+                                     name, ', '.join(self.merged[name])))
+
+        if self.keys is not None:
+            with self.profiler.stage('intern_keys'):
+                fhir, _ = intern_keys(fhir, self.keys)
+
+        with self.profiler.stage('create_object'):
+            fhir = {name: self.create_object(df, name).get_dataframe()
+                    for name, df in fhir.items()}
+
+        with self.profiler.stage('append_entity'):
+            for name, df in fhir.items():
+                self._append_entity(entity_set[name], name, df)
+
+        self.profiler.add_resources(fhir)
+        self.report = self.profiler.get_report()
+        self.profiler.log_report()
+
+        return entity_set
+
+    def _get_max_object_id(self, entity_set):
+        maximum = 0
+        for entity in entity_set.entities:
+            if not _has_generated_ids(entity.id):
+                continue
+
+            object_ids = entity.df[entity.index]
+            if self.keys is not None:
+                object_ids = self.keys.decode(object_ids)
+
+            object_ids = pd.to_numeric(object_ids, errors='coerce')
+            if object_ids.notnull().any():
+                maximum = max(maximum, int(object_ids.max()))
+
+        return maximum
+
+    def _append_entity(self, entity, name, df):
+        df = infer_dtypes(df, get_resource_type(name).types, keys=get_key_columns(name, df))
+        df = df[[column for column in df.columns if column in entity.df.columns]]
+
+        if name in ALWAYS_LOADED:
+            df = df[~df[entity.index].isin(entity.df.index).values]
+            if df.empty:
+                return
+
+        index = pd.Index(df[entity.index])
+        collisions = index[index.duplicated() | index.isin(entity.df.index)]
+        if len(collisions) > 0:
+            raise ValueError('{} rows of {} have existing identifiers: {}'.format(
+                len(collisions), name, list(collisions[:5])))
+
+        existing = entity.df
+        columns = {}
+        for column in df.columns:
+            dtype = existing[column].dtype
+            if is_categorical_dtype(dtype):
+                categories = dtype.categories.union(pd.Index(df[column].dropna().unique()))
+                existing = existing.assign(**{column: existing[column].cat.set_categories(
+                    categories)})
+                dtype = existing[column].dtype
+
+            values = df[column]
+            if is_bool_dtype(dtype) and values.isnull().any():
+                dtype = 'boolean'
+
+            try:
+                columns[column] = values.astype(dtype)
+            except (ValueError, TypeError) as error:
+                if not (is_numeric_dtype(dtype) and is_numeric_dtype(values)):
+                    raise ValueError('Column {} of {} does not fit the entity: {}'.format(
+                        column, name, error))
+
+                # missing values in an integer column, the column is upcast when appended
+                columns[column] = values
+
+        df = pd.DataFrame(columns, copy=False)
+        df.index = index
+
+        entity.update_data(pd.concat([existing, df]), already_sorted=False)
+
+
+def _check_resources(fhir, resources, source):
+    if resources is not None and not set(fhir).difference(ALWAYS_LOADED):
+        raise LookupError('None of the resources {} is in {}'.format(
+            sorted(set(resources).difference(ALWAYS_LOADED)), source))
+
+    return fhir
+
+
+def _has_generated_ids(name):
+    if name in ALWAYS_LOADED:
+        return False
+
+    try:
+        return get_resource_type(name).id_columns[0] == 'object_id'
+    except LookupError:
+        return False
+
+
+def _offset_object_ids(fhir, offset):
+    shifted = {}
+    for name, df in fhir.items():
+        columns = ['object_id'] if _has_generated_ids(name) else []
+        for relation in RELATIONSHIP_INDEX.by_child(name):
+            if relation['parent_variable'] == 'object_id' and \
+                    _has_generated_ids(relation['parent_entity']):
+                columns.append(relation['child_variable'])
+
+        columns = [column for column in dict.fromkeys(columns) if column in df.columns]
+        shifted[name] = df.assign(**{column: df[column] + offset for column in columns})
+
+    return shifted
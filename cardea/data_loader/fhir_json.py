@@ -0,0 +1,313 @@
+import json
+import keyword
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from glob import glob
+
+import pandas as pd
+
+from cardea.fhir.registry import get_resource_type
+from cardea.fhir.relationships import RELATIONSHIP_INDEX
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ResourceFlattener():
+    """A class that flattens FHIR JSON resources into the tables of the fhir classes.
+
+    Every resource becomes a row of its resource table keyed by ``ResourceType/id``,
+    which is also registered in the ``Identifier`` table. Nested elements that the
+    fhir classes reference by ``object_id`` (such as ``Period``, ``CodeableConcept``
+    or ``Coding``) become rows of their own table with a generated ``object_id``, and
+    references become rows of the ``Reference`` table keyed by the referenced
+    resource, so the resulting tables have the layout ``load_df_entityset`` expects.
+
+    The fhir classes hold a single value per attribute, so only the first element
+    of a repeated element is kept; the other ones are counted in ``truncated``.
+    Resources without an ``id`` nor a key, which could not be told apart, are
+    skipped. Rows are buffered per table and packed into dataframes every
+    ``chunksize`` rows, including the ``Identifier`` and ``Reference`` rows, so
+    no per-resource state is kept while flattening: the tables are deduplicated
+    once by ``get_dataframes``, which keeps the first resource with each key.
+
+    Args:
+        chunksize (int):
+            Number of rows buffered per table before they are packed into a dataframe.
+        start (int):
+            The first generated ``object_id``.
+        step (int):
+            The increment between generated ``object_id`` values. Flatteners that use
+            the same step and different starts generate disjoint ids.
+    """
+
+    __name__ = 'ResourceFlattener'
+
+    def __init__(self, chunksize=10000, start=1, step=1):
+        self.chunksize = chunksize
+        self.step = step
+        self.resources = 0
+        self.skipped = 0
+        self.truncated = 0
+
+        self._object_id = start - step
+        self._rows = {}
+        self._frames = {}
+        self._relations = {}
+
+    def _get_relations(self, name):
+        relations = self._relations.get(name)
+        if relations is None:
+            relations = {relation['child_variable']: relation
+                         for relation in RELATIONSHIP_INDEX.by_child(name)}
+            self._relations[name] = relations
+
+        return relations
+
+    def _append(self, name, row):
+        rows = self._rows.setdefault(name, [])
+        rows.append(row)
+
+        if len(rows) >= self.chunksize:
+            self._frames.setdefault(name, []).append(pd.DataFrame(rows))
+            self._rows[name] = []
+
+    def _add_reference(self, reference):
+        key = reference.get('reference')
+        if key is None:
+            return None
+
+        self._append('Reference', {'identifier': key,
+                                   'reference': key,
+                                   'display': reference.get('display')})
+        self._append('Identifier', {'object_id': key})
+        return key
+
+    def _flatten(self, name, element, row):
+        resource_type = get_resource_type(name)
+        relations = self._get_relations(name)
+
+        for key, value in element.items():
+            attr = '_' + key if keyword.iskeyword(key) else key
+            if attr not in resource_type.attributes or attr in row:
+                continue
+
+            if isinstance(value, list):
+                if len(value) == 0:
+                    continue
+
+                self.truncated += len(value) - 1
+                value = value[0]
+
+            relation = relations.get(attr)
+            if relation is None:
+                if not isinstance(value, dict):
+                    row[attr] = value
+
+            elif isinstance(value, dict):
+                if relation['parent_entity'] == 'Reference':
+                    row[attr] = self._add_reference(value)
+                else:
+                    row[attr] = self._add_element(relation['parent_entity'], value)
+
+        return row
+
+    def _add_element(self, name, element):
+        self._object_id += self.step
+        row = self._flatten(name, element, {'object_id': self._object_id})
+        self._append(name, row)
+
+        return self._object_id
+
+    def add_resource(self, resource, key=None):
+        """Flattens a resource into the tables of the fhir classes.
+
+        Args:
+            resource (dict):
+                A FHIR resource.
+            key (str):
+                The key that references use to point at the resource. Defaults to
+                ``ResourceType/id``.
+
+        Returns:
+            The key of the resource, or None if its type is unknown or it has
+            neither an id nor a key.
+        """
+
+        name = resource.get('resourceType')
+        try:
+            resource_type = get_resource_type(name)
+        except LookupError:
+            LOGGER.warning('Resource type %s could not be loaded.', name)
+            self.skipped += 1
+            return None
+
+        if key is None:
+            if resource.get('id') is None:
+                LOGGER.warning('Skipping %s resource without an id.', name)
+                self.skipped += 1
+                return None
+
+            key = '{}/{}'.format(name, resource.get('id'))
+
+        identifier = {'object_id': key, 'value': resource.get('id')}
+        business_identifiers = resource.get('identifier')
+        if business_identifiers:
+            if isinstance(business_identifiers, list):
+                business_identifiers = business_identifiers[0]
+
+            identifier['system'] = business_identifiers.get('system')
+            identifier['value'] = business_identifiers.get('value', identifier['value'])
+
+        self._append('Identifier', identifier)
+
+        id_column = resource_type.id_columns[0]
+        row = self._flatten(name, resource, {id_column: key})
+        self._append(name, row)
+        self.resources += 1
+
+        return key
+
+    def get_dataframes(self):
+        """Returns the flattened tables.
+
+        The rows of resources whose key was already added are dropped and
+        counted as skipped.
+
+        Returns:
+            A dictionary of fhir resources in pandas dataframe format.
+        """
+
+        fhir = {}
+        for name, rows in self._rows.items():
+            frames = self._frames.get(name, []) + [pd.DataFrame(rows)]
+            df = pd.concat(frames, ignore_index=True)
+            fhir[name] = _drop_duplicates(name, df)
+
+            if name not in ('Identifier', 'Reference'):
+                duplicates = len(df) - len(fhir[name])
+                self.resources -= duplicates
+                self.skipped += duplicates
+
+        self._rows = {}
+        self._frames = {}
+        return fhir
+
+
+def _drop_duplicates(name, df):
+    if name == 'Identifier' and 'value' in df.columns:
+        # prefer the rows of loaded resources over the ones added by references
+        df = df.iloc[df['value'].isnull().argsort(kind='stable')]
+
+    id_column = get_resource_type(name).id_columns[0]
+    return df.drop_duplicates(subset=id_column).reset_index(drop=True)
+
+
+def read_ndjson_files(folder_path, chunksize=10000):
+    """Returns a dictionary with the flattened resources of the .ndjson files in folder_path.
+
+    The files are read one line, that is one resource, at a time, as produced by
+    a FHIR Bulk Data export.
+
+    Args:
+        folder_path (str):
+            A directory of .ndjson files.
+        chunksize (int):
+            Number of rows buffered per table before they are packed into a dataframe.
+
+    Returns:
+        A dictionary of fhir resources in pandas dataframe format.
+    """
+
+    flattener = ResourceFlattener(chunksize=chunksize)
+    start = time.time()
+
+    for file_path in sorted(glob(os.path.join(folder_path, '*.ndjson'))):
+        with open(file_path, encoding='utf-8') as ndjson_file:
+            for line in ndjson_file:
+                if line.strip():
+                    flattener.add_resource(json.loads(line))
+
+    fhir = flattener.get_dataframes()
+    elapsed = time.time() - start
+    LOGGER.info('Loaded %s resources (%s skipped, %s repeated elements dropped) in %.2f '
+                'seconds (%.0f resources/second)', flattener.resources, flattener.skipped,
+                flattener.truncated, elapsed, flattener.resources / elapsed if elapsed else 0)
+
+    return fhir
+
+
+def _read_bundles(file_paths, start, step, chunksize):
+    flattener = ResourceFlattener(chunksize=chunksize, start=start, step=step)
+    for file_path in file_paths:
+        with open(file_path, encoding='utf-8') as bundle_file:
+            bundle = json.load(bundle_file)
+
+        for entry in bundle.get('entry', []):
+            resource = entry.get('resource')
+            if resource is None:
+                continue
+
+            full_url = entry.get('fullUrl')
+            key = full_url if full_url and full_url.startswith('urn:') else None
+            flattener.add_resource(resource, key=key)
+
+    fhir = flattener.get_dataframes()
+    return (flattener.resources, flattener.skipped, flattener.truncated), fhir
+
+
+def _merge_shards(shards):
+    tables = {}
+    for shard in shards:
+        for name, df in shard.items():
+            tables.setdefault(name, []).append(df)
+
+    return {name: _drop_duplicates(name, pd.concat(dfs, ignore_index=True))
+            for name, dfs in tables.items()}
+
+
+def read_bundle_files(folder_path, n_jobs=1, chunksize=10000):
+    """Returns a dictionary with the flattened entries of the Bundle .json files in folder_path.
+
+    The files are split in shards that are parsed and flattened by a pool of
+    processes, then the tables of the shards are merged. Entries whose
+    ``fullUrl`` is a URN (such as ``urn:uuid:...``) are keyed by it, so that
+    references within transaction bundles resolve.
+
+    Args:
+        folder_path (str):
+            A directory of FHIR Bundle .json files.
+        n_jobs (int):
+            Number of processes used to flatten the bundles. If 1, the bundles
+            are flattened in the current process.
+        chunksize (int):
+            Number of rows buffered per table before they are packed into a dataframe.
+
+    Returns:
+        A dictionary of fhir resources in pandas dataframe format.
+    """
+
+    file_paths = sorted(glob(os.path.join(folder_path, '*.json')))
+    n_shards = max(min(len(file_paths), n_jobs * 4), 1)
+    shards = [file_paths[shard::n_shards] for shard in range(n_shards)]
+    start = time.time()
+
+    if n_jobs == 1:
+        results = [_read_bundles(paths, shard + 1, n_shards, chunksize)
+                   for shard, paths in enumerate(shards)]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [executor.submit(_read_bundles, paths, shard + 1, n_shards, chunksize)
+                       for shard, paths in enumerate(shards)]
+            results = [future.result() for future in futures]
+
+    resources, skipped, truncated = map(sum, zip(*(result[0] for result in results)))
+    fhir = _merge_shards(result[1] for result in results)
+
+    elapsed = time.time() - start
+    LOGGER.info('Loaded %s resources (%s skipped, %s repeated elements dropped) from %s '
+                'bundles in %.2f seconds (%.0f resources/second)', resources, skipped,
+                truncated, len(file_paths), elapsed, resources / elapsed if elapsed else 0)
+
+    return fhir
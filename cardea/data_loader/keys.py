@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_float_dtype
+
+from cardea.fhir.registry import get_resource_type
+from cardea.fhir.relationships import RELATIONSHIP_INDEX
+
+
+class KeyDictionary():
+    """A class that maps key values to dense integer surrogate keys.
+
+    Values are compared by their string representation, the same way the
+    loader compares keys of different tables, so ``10`` and ``'10'`` share a
+    surrogate. Float columns that hold integer values, as read from columns
+    with missing values, are compared as integers. Surrogates are assigned in
+    order of appearance starting from 0, and the original values are kept to
+    map them back.
+
+    Args:
+        keys (iterable):
+            Previously interned values, in the order of their surrogates.
+    """
+
+    __name__ = 'KeyDictionary'
+
+    def __init__(self, keys=None):
+        self.keys = pd.Index([] if keys is None else list(keys), dtype=object)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def intern(self, values):
+        """Returns the surrogate keys of the given values, assigning new ones as needed.
+
+        Args:
+            values (pandas.Series):
+                The key values.
+
+        Returns:
+            pandas.Series:
+                The surrogate keys as nullable ``Int64``, so that identifiers and the
+                references to them, which may be missing, share the same dtype.
+        """
+
+        missing = values.isnull()
+        present = values[~missing]
+        if is_float_dtype(present) and (present % 1 == 0).all():
+            # integer keys read along missing values
+            present = present.astype('int64')
+
+        strings = present.astype('str')
+        uniques = pd.Index(pd.unique(strings))
+
+        codes = self.keys.get_indexer(uniques)
+        if (codes == -1).any():
+            self.keys = self.keys.append(uniques[codes == -1])
+            codes = self.keys.get_indexer(uniques)
+
+        result = pd.Series(pd.NA, index=values.index, name=values.name, dtype='Int64')
+        result[~missing] = codes[uniques.get_indexer(strings)]
+        return result
+
+    def decode(self, codes):
+        """Returns the original values of the given surrogate keys.
+
+        Args:
+            codes (pandas.Series):
+                Surrogate keys returned by ``intern``.
+
+        Returns:
+            pandas.Series:
+                The key values as strings, with missing surrogates left missing.
+        """
+
+        missing = codes.isnull()
+        result = pd.Series(None, index=codes.index, name=codes.name, dtype=object)
+        result[~missing] = self.keys.take(codes[~missing].astype('int64')).values
+        return result
+
+
+def hash_keys(values):
+    """Returns a deterministic hash of each key value.
+
+    Keys are hashed by their string representation, with float columns that
+    hold integer values hashed as integers, so the same key has the same hash
+    in every table and every session.
+
+    Args:
+        values (pandas.Series):
+            The key values.
+
+    Returns:
+        numpy.ndarray:
+            The hashes as unsigned 64 bit integers.
+    """
+
+    codes, uniques = pd.factorize(values)
+    uniques = pd.Series(uniques)
+    if is_float_dtype(uniques) and (uniques % 1 == 0).all():
+        uniques = uniques.astype('int64')
+
+    # missing values have the code -1, which takes the hash of the appended missing key
+    strings = np.append(uniques.astype('str').to_numpy(dtype=object), str(pd.NA))
+    return pd.util.hash_array(strings)[codes]
+
+
+def get_key_columns(name, df):
+    """Returns the columns of a fhir dataframe that hold keys.
+
+    These are the identifier column of the resource and the columns that
+    reference other resources.
+
+    Args:
+        name (str):
+            The name of the fhir class.
+        df (pandas.DataFrame):
+            The dataframe of the resource.
+
+    Returns:
+        list:
+            The key columns present in the dataframe.
+    """
+
+    columns = [column for column in get_resource_type(name).id_columns]
+    columns.extend(relation['child_variable'] for relation in RELATIONSHIP_INDEX.by_child(name))
+
+    return [column for column in dict.fromkeys(columns) if column in df.columns]
+
+
+def intern_keys(fhir, keys=None):
+    """Returns the fhir dataframes with their key columns replaced by surrogate keys.
+
+    Every table shares the same dictionary, so references keep matching the
+    identifiers they point at. The given dataframes are not modified.
+
+    Args:
+        fhir (dict):
+            A dictionary of fhir resources in pandas dataframe format.
+        keys (KeyDictionary):
+            The dictionary used to intern the keys. If None, a new one is created.
+
+    Returns:
+        tuple:
+            The dictionary of interned dataframes and the ``KeyDictionary``.
+    """
+
+    keys = KeyDictionary() if keys is None else keys
+
+    interned = {}
+    for name, df in fhir.items():
+        df = df.copy(deep=False)
+        for column in get_key_columns(name, df):
+            df[column] = keys.intern(df[column])
+
+        interned[name] = df
+
+    return interned, keys
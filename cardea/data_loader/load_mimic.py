@@ -1,12 +1,194 @@
+import hashlib
+import json
+import logging
 import os
+import shutil
 import xml.etree.ElementTree as ET
+from collections import OrderedDict, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import lru_cache
 from glob import glob
 
 import featuretools as ft
 import pandas as pd
 
-path = os.path.dirname(os.path.abspath(__file__))
-root = ET.parse(path + '/schema.xml').getroot()
+import cardea
+from cardea.data_loader.chunked import (
+    estimate_memory, get_chunksize, needs_chunking, read_csv_chunked, read_parquet_files,
+    write_chunk)
+from cardea.data_loader.cohort import key_filter
+from cardea.data_loader.database import (
+    POOL_SIZE, as_pool, get_table_columns, get_table_names, read_sql_table)
+from cardea.data_loader.keys import hash_keys
+from cardea.data_loader.readers import read_csv_header
+from cardea.data_loader.sampling import sample_filter
+
+LOGGER = logging.getLogger(__name__)
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schema.xml')
+# the directory of the compiled schema, or no cache at all if set but empty
+CACHE_DIR_VARIABLE = 'CARDEA_CACHE_DIR'
+
+MANIFEST = 'manifest.json'
+PARTITION_COLUMN = 'subject_id'
+DEFAULT_PARTITIONS = 16
+DEFAULT_MAX_MEMORY = 1 << 29
+
+TableSpec = namedtuple('TableSpec', ['name', 'columns', 'primary_key', 'time_columns',
+                                     'relationships'])
+TableSpec.__doc__ = """A table of the MIMIC schema.
+
+Attributes:
+    name (str):
+        The name of the table.
+    columns (dict):
+        The SQL type of each column, in order.
+    primary_key (str):
+        The column that identifies the rows of the table.
+    time_columns (list):
+        The timestamp columns of the table, in order.
+    relationships (list):
+        The relationships from this table to its children, as dictionaries of
+        parent, primary_key, child and foreign_key.
+"""
+
+
+def get_spec_cache_dir():
+    """Returns the directory where the compiled MIMIC schema is cached.
+
+    The directory is taken from the ``CARDEA_CACHE_DIR`` environment variable,
+    where an empty value disables the cache, and defaults to ``cardea`` inside
+    ``XDG_CACHE_HOME`` or ``~/.cache``.
+
+    Returns:
+        str:
+            The path of the directory, or None if the schema is not cached.
+    """
+
+    cache_dir = os.environ.get(CACHE_DIR_VARIABLE)
+    if cache_dir is not None:
+        return cache_dir or None
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'cardea')
+
+
+def compile_schema(schema_path=SCHEMA_PATH):
+    """Returns the specification of every table in a MIMIC XML schema.
+
+    Args:
+        schema_path (str):
+            The path of the XML schema.
+
+    Returns:
+        list:
+            A dictionary for each table, in schema order, with the fields of
+            ``TableSpec``.
+    """
+
+    tables = []
+    for table in ET.parse(schema_path).getroot().findall('tables/table'):
+        name = table.get('name')
+        columns = {}
+        time_columns = []
+        primary_key = 'row_id'
+        relationships = []
+
+        for column in table.findall('column'):
+            column_name = column.get('name')
+            columns[column_name.lower()] = column.get('type')
+            if 'Primary key' in column.get('remarks'):
+                primary_key = column_name
+
+            if column.get('type') == 'timestamp':
+                time_columns.append(column_name)
+
+            for child in column.findall('child'):
+                relationships.append({'parent': name, 'primary_key': column_name,
+                                      'child': child.get('table'),
+                                      'foreign_key': child.get('column')})
+
+        tables.append({'name': name, 'columns': columns, 'primary_key': primary_key,
+                       'time_columns': time_columns, 'relationships': relationships})
+
+    return tables
+
+
+@lru_cache(maxsize=None)
+def get_schema_spec(schema_path=SCHEMA_PATH, cache_dir=None):
+    """Returns the specification of the MIMIC tables.
+
+    The XML schema is compiled on first use and the result is kept in a JSON
+    file of the cache directory, named after the hash of the schema and the
+    Cardea version that compiled it, so later sessions read the compiled
+    specification instead of parsing the schema.
+
+    Args:
+        schema_path (str):
+            The path of the XML schema.
+        cache_dir (str):
+            The directory of the compiled specification. If None, the one returned
+            by ``get_spec_cache_dir`` is used. If False, it is not cached.
+
+    Returns:
+        dict:
+            The ``TableSpec`` of each table, by name, in schema order.
+    """
+
+    if cache_dir is None:
+        cache_dir = get_spec_cache_dir()
+
+    digest = hashlib.sha256(cardea.__version__.encode())
+    with open(schema_path, 'rb') as schema_file:
+        digest.update(schema_file.read())
+
+    digest = digest.hexdigest()
+    cache_path = cache_dir and os.path.join(cache_dir, 'mimic-{}.json'.format(digest[:16]))
+    tables = None
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path) as cache_file:
+                tables = json.load(cache_file)
+
+        except (OSError, ValueError):
+            LOGGER.warning('Compiled MIMIC schema %s could not be read', cache_path)
+
+    if tables is None:
+        tables = compile_schema(schema_path)
+        if cache_path:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                with open(cache_path, 'w') as cache_file:
+                    json.dump(tables, cache_file)
+
+            except OSError:
+                LOGGER.debug('Compiled MIMIC schema could not be cached in %s', cache_dir)
+
+    return OrderedDict((table['name'], TableSpec(**table)) for table in tables)
+
+
+def get_table_spec(name):
+    """Returns the specification of a MIMIC table.
+
+    Args:
+        name (str):
+            The name of the table.
+
+    Returns:
+        TableSpec:
+            The specification of the table.
+
+    Raises:
+        LookupError:
+            If the table is not part of the MIMIC schema.
+    """
+
+    spec = get_schema_spec().get(name)
+    if spec is None:
+        raise LookupError('{} is not part of MIMIC schema'.format(name))
+
+    return spec
 
 
 def get_table_properties(name):
@@ -21,24 +203,10 @@ def get_table_properties(name):
             of the table, and a list of columns that consider the time indices of the table.
     """
 
-    types = {}
-    arr_time = []
-    prim_key = 'row_id'
-
-    x = root.find('.//table[@name="' + name + '"]')
-    for t in x.findall('column'):
-
-        column = t.get('name')
-        a_type = t.get('type')
-        d_type = get_type(a_type)
-        prim_key = column if 'Primary key' in t.get('remarks') else prim_key
-
-        if a_type == 'timestamp':
-            arr_time.append(column)
-
-        types[column.lower()] = d_type
+    spec = get_table_spec(name)
+    types = {column: get_type(a_type) for column, a_type in spec.columns.items()}
 
-    return types, prim_key, arr_time
+    return types, spec.primary_key, list(spec.time_columns)
 
 
 def get_table_relationships(name):
@@ -51,19 +219,7 @@ def get_table_relationships(name):
         A list of the relationships in the table, formatted as a dictionary.
     """
 
-    relations = []
-    x = root.find('.//table[@name="' + name + '"]')
-
-    for c in x.findall('column/child'):
-        target_table = c.get('table')
-        target_handle = c.get('column')
-
-        handle = x.find('.//column/child/...').get('name')
-
-        relations.append({'parent': name, 'primary_key': handle,
-                          'child': target_table, 'foreign_key': target_handle})
-
-    return relations
+    return [dict(relation) for relation in get_table_spec(name).relationships]
 
 
 def get_type(x):
@@ -76,58 +232,371 @@ def get_type(x):
     }.get(x, str)
 
 
-def load_mimic_data(path=None, subset=None):
-    """Returns an entityset loaded with the dataframes in the received path.
+def _get_key_columns(spec):
+    columns = [spec.primary_key]
+    columns.extend(relation['primary_key'] for relation in spec.relationships)
+    columns.extend(relation['foreign_key'] for other in get_schema_spec().values()
+                   for relation in other.relationships if relation['child'] == spec.name)
+
+    return list(dict.fromkeys(columns))
+
+
+def _get_read_options(file, spec, columns=None):
+    names = [column.lower() for column in read_csv_header(file)]
+    parse_dates = [column for column in spec.time_columns if column in names]
+    dtype = {column: get_type(a_type) for column, a_type in spec.columns.items()
+             if column in names and column not in parse_dates}
+    options = {'header': 0, 'names': names, 'dtype': dtype, 'parse_dates': parse_dates}
+
+    if columns is not None:
+        columns = set(columns).union(_get_key_columns(spec))
+        options['usecols'] = [column for column in names if column in columns]
+        options['parse_dates'] = [column for column in parse_dates if column in columns]
+
+    return options
+
+
+def _get_sql_options(pool, table, spec, columns=None):
+    names = OrderedDict((column.lower(), column) for column in get_table_columns(pool, table))
+    parse_dates = [column for column in spec.time_columns if column in names]
+    dtype = {column: get_type(a_type) for column, a_type in spec.columns.items()
+             if column in names and column not in parse_dates}
+
+    if columns is not None:
+        columns = set(columns).union(_get_key_columns(spec))
+        names = OrderedDict((name, column) for name, column in names.items() if name in columns)
+        parse_dates = [column for column in parse_dates if column in columns]
+
+    # the columns are renamed in the query, so chunks have lowercase names
+    columns = OrderedDict((column, name) for name, column in names.items())
+    return {'columns': columns, 'dtype': dtype, 'parse_dates': parse_dates}
+
+
+def _get_partition_paths(table_path, partitions=None):
+    part_paths = sorted(glob(os.path.join(table_path, '*.parquet')))
+    for name in sorted(os.listdir(table_path)):
+        partition_path = os.path.join(table_path, name)
+        if os.path.isdir(partition_path) and (partitions is None or int(name) in partitions):
+            part_paths.extend(sorted(glob(os.path.join(partition_path, '*.parquet'))))
+
+    return part_paths
+
+
+def _read_table(source, spec, format, columns, partitions, row_filter, max_memory, spill_dir):
+    if format == 'parquet':
+        if columns is not None:
+            columns = set(columns).union(_get_key_columns(spec))
+
+        categories = [column for column, a_type in spec.columns.items()
+                      if get_type(a_type) is str and column not in spec.time_columns]
+        df = read_parquet_files(_get_partition_paths(source, partitions), columns=columns,
+                                categories=categories)
+
+    elif format == 'sql':
+        pool, table, where = source
+        options = _get_sql_options(pool, table, spec, columns)
+        categories = [column for column, d_type in options['dtype'].items() if d_type is str]
+        spill_dir = spill_dir and os.path.join(spill_dir, spec.name)
+        return read_sql_table(pool, table, where=where, max_memory=max_memory,
+                              row_filter=row_filter, categories=categories, spill_dir=spill_dir,
+                              **options)
+
+    else:
+        options = _get_read_options(source, spec, columns)
+        if needs_chunking(source, max_memory):
+            categories = [column for column, d_type in options['dtype'].items()
+                          if d_type is str]
+            spill_dir = spill_dir and os.path.join(spill_dir, spec.name)
+            return read_csv_chunked(source, max_memory=max_memory, row_filter=row_filter,
+                                    categories=categories, spill_dir=spill_dir, **options)
+
+        df = pd.read_csv(source, **options)
+
+    return df if row_filter is None else df[row_filter(df).values].reset_index(drop=True)
+
+
+def _estimate_table_memory(source, format, max_memory):
+    if format == 'csv':
+        return estimate_memory(source, max_memory)
+
+    if format == 'sql':
+        # the size of a table is not known before it is read
+        return max_memory or 0
+
+    # parquet files are compressed, so their size is counted as if they were text
+    return sum(estimate_memory(part_path) for part_path in _get_partition_paths(source))
+
+
+def convert_mimic_data(path, output_path, subset=None, n_partitions=DEFAULT_PARTITIONS,
+                       max_memory=DEFAULT_MAX_MEMORY, chunksize=None):
+    """Converts the MIMIC .csv tables of a folder to Parquet, partitioned by patient.
+
+    Each table is read in chunks with the types declared in the schema and its
+    timestamps parsed. The rows of tables with a ``subject_id`` column are
+    written to one of ``n_partitions`` subdirectories chosen by the hash of
+    their patient, so the tables of a patient share a partition number and a
+    subset of the patients can be loaded by reading only their partitions.
+    Tables without patients are written whole. Loading the converted folder
+    with ``load_mimic_data(..., format='parquet')`` skips parsing the .csv files.
 
     Args:
         path (str):
-            The folder path that contains the data.
+            The folder path that contains the .csv files.
+        output_path (str):
+            The folder path where the Parquet tables are written, one directory
+            per table, along a ``manifest.json`` file.
+        subset (list):
+            The tables to convert. If None, every table of the schema in path is.
+        n_partitions (int):
+            The number of partitions of each table.
+        max_memory (int):
+            The memory ceiling in bytes used to choose the size of the chunks.
+        chunksize (int):
+            The number of rows per chunk. If None, it is derived from ``max_memory``.
+
+    Returns:
+        list:
+            The names of the converted tables.
+    """
+
+    tables = []
+    for table, spec in get_schema_spec().items():
+        file = os.path.join(path, table.upper() + '.csv')
+        if (subset and table not in subset) or not os.path.exists(file):
+            continue
+
+        LOGGER.info('Converting %s to parquet', file)
+        options = _get_read_options(file, spec)
+        table_chunksize = chunksize or get_chunksize(file, max_memory, **options)
+
+        table_path = os.path.join(output_path, table)
+        shutil.rmtree(table_path, ignore_errors=True)
+        os.makedirs(table_path)
+
+        chunks = pd.read_csv(file, chunksize=table_chunksize, **options)
+        for number, chunk in enumerate(chunks):
+            part_name = 'part-{:05d}.parquet'.format(number)
+            if PARTITION_COLUMN not in chunk.columns:
+                write_chunk(chunk, os.path.join(table_path, part_name))
+                continue
+
+            partitions = hash_keys(chunk[PARTITION_COLUMN]) % n_partitions
+            for partition, part in chunk.groupby(partitions):
+                partition_path = os.path.join(table_path, '{:03d}'.format(partition))
+                os.makedirs(partition_path, exist_ok=True)
+                write_chunk(part, os.path.join(partition_path, part_name))
+
+        tables.append(table)
+
+    manifest = {'n_partitions': n_partitions, 'partition_column': PARTITION_COLUMN,
+                'tables': tables}
+    with open(os.path.join(output_path, MANIFEST), 'w') as manifest_file:
+        json.dump(manifest, manifest_file)
+
+    return tables
+
+
+def _map_within_budget(executor, function, arguments, costs, budget=None):
+    """Returns the results of calling a function in an executor, keeping a budget of cost.
+
+    The calls are submitted in order, and each one waits until the calls that
+    are running leave enough budget for its cost. A call that costs more than
+    the whole budget runs alone.
+    """
+
+    results = {}
+    running = {}
+    position = 0
+    while position < len(arguments) or running:
+        while position < len(arguments):
+            used = sum(costs[index] for index in running.values())
+            if running and budget is not None and used + costs[position] > budget:
+                break
+
+            running[executor.submit(function, *arguments[position])] = position
+            position += 1
+
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            results[running.pop(future)] = future.result()
+
+    return [results[index] for index in range(len(arguments))]
+
+
+def load_mimic_data(path=None, subset=None, max_memory=None, filters=None, spill_dir=None,
+                    n_jobs=1, memory_budget=None, format='csv', columns=None, partitions=None,
+                    sample=None, cohort=None):
+    """Returns an entityset loaded with the dataframes in the received path.
+
+    The columns of each table are read with the types declared in the MIMIC
+    schema, and its timestamp columns are parsed as datetimes while reading.
+
+    Args:
+        path (str, ConnectionPool or callable):
+            The folder path that contains the data or, when the format is ``'sql'``,
+            a ``ConnectionPool`` or anything it accepts, such as a SQLAlchemy engine
+            or the path of a SQLite database.
         subset (str):
             List of tables to include.
+        max_memory (int):
+            A memory ceiling in bytes for parsing each table. Tables too large to be
+            parsed under it, such as ``chartevents``, are read in chunks that are
+            converted, filtered and spilled to Parquet one at a time, and read back
+            with their text columns as categoricals.
+        filters (dict):
+            A function for each table name that receives a dataframe of the table,
+            with lowercase column names, and returns a boolean mask of the rows to
+            keep. Large tables are filtered chunk by chunk. When the format is
+            ``'sql'``, a filter can also be a SQL condition, which is evaluated by
+            the database.
+        spill_dir (str):
+            A directory where the chunks of each large table are kept, in a
+            subdirectory named after the table. If None, they are removed once
+            read back.
+        n_jobs (int):
+            Number of processes used to read and convert the tables concurrently.
+            If None, it depends on the number of processors. With more than one
+            process, the filters must be functions that can be pickled. Tables in
+            a database are read by threads instead, each one with a connection.
+        memory_budget (int):
+            The memory in bytes that the tables read concurrently can take, as
+            estimated from the size of their files, so that large tables are not
+            read at the same time. Tables in a database count as ``max_memory``.
+            If None, only ``n_jobs`` limits them.
+        format (str):
+            Either ``'csv'``, to read the MIMIC .csv files, ``'parquet'`` to read
+            a folder written by ``convert_mimic_data``, or ``'sql'`` to query the
+            tables of a database, whose names and column names may be in any case.
+        columns (dict):
+            The columns to read from each table, where the key is the table name.
+            The primary and foreign keys are always read. Tables that are not in
+            columns are read entirely.
+        partitions (list):
+            The partitions of the tables with patients to read, when the format is
+            ``'parquet'``. If None, every partition is read.
+        sample (float):
+            The fraction of patients to load, chosen by the hash of their
+            ``subject_id``. Every table with patients is filtered by the same hash
+            while it is read, so the tables stay consistent, and the tables
+            without patients are loaded entirely. If None, every patient is loaded.
+        cohort (Cohort):
+            The admissions to load. They are selected from the ``admissions``,
+            ``patients`` and ``diagnoses_icd`` tables first, and the other tables
+            are then filtered by their ``hadm_id`` and ``subject_id`` while they
+            are read. If None, every admission is loaded.
 
     Returns:
         featuretools.EntitySet:
             An entityset with loaded data.
     """
+    if format not in ('csv', 'parquet', 'sql'):
+        raise ValueError('{} is not a supported format'.format(format))
+
+    if format == 'sql':
+        pool = as_pool(path, size=n_jobs or POOL_SIZE)
+        try:
+            names = {name.lower(): name for name in get_table_names(pool)}
+            sources = {table: (pool, names[table], None)
+                       for table in get_schema_spec() if table in names}
+
+            return _load_mimic_data(sources, subset, max_memory, filters, spill_dir, n_jobs,
+                                    memory_budget, format, columns, partitions, sample, cohort)
+
+        finally:
+            if pool is not path:
+                pool.close()
+
+    if format == 'parquet':
+        with open(os.path.join(path, MANIFEST)) as manifest_file:
+            converted = json.load(manifest_file)['tables']
+
+        sources = {table: os.path.join(path, table) for table in converted}
+
+    else:
+        files = glob(path + '/*.csv')
+        sources = {table: os.path.join(path, table.upper() + '.csv')
+                   for table in get_schema_spec()}
+        sources = {table: file for table, file in sources.items() if file in files}
+
+    return _load_mimic_data(sources, subset, max_memory, filters, spill_dir, n_jobs,
+                            memory_budget, format, columns, partitions, sample, cohort)
+
+
+def _load_mimic_data(sources, subset, max_memory, filters, spill_dir, n_jobs, memory_budget,
+                     format, columns, partitions, sample, cohort):
+    if cohort is not None:
+        def read_cohort_table(table, table_columns):
+            if table not in sources:
+                raise LookupError('{} table is not loaded'.format(table))
+
+            return _read_table(sources[table], get_table_spec(table), format, table_columns,
+                               partitions, None, max_memory, spill_dir)
+
+        cohort_keys = cohort.select_mimic(read_cohort_table)
+
     es = ft.EntitySet(id="mimic")
 
     relationships = []
     global_tables = []
-    files = glob(path + '/*.csv')
-
-    for tag in root.findall('tables/table'):
-        table = tag.get('name')
-        file = os.path.join(path, table.upper() + '.csv')
 
+    arguments = []
+    for table, spec in get_schema_spec().items():
         if subset and table not in subset:
             continue
 
-        if file in files:
+        if table in sources:
             # table name
             global_tables.append(table)
 
             # get table relationships
             relationships = relationships + get_table_relationships(table)
 
-            # get table properties
-            prop, key, arr_time = get_table_properties(table)
+            source = sources[table]
+            row_filter = (filters or {}).get(table)
+            if isinstance(row_filter, str):
+                if format != 'sql':
+                    raise ValueError('SQL filters can only be used with the sql format')
+
+                # the condition is sent to the database with the query
+                source = source[:2] + (row_filter, )
+                row_filter = None
+
+            if cohort is not None:
+                row_filter = key_filter(cohort_keys, row_filter)
+
+            if sample is not None:
+                row_filter = sample_filter(sample, PARTITION_COLUMN, row_filter)
+
+            arguments.append((source, spec, format, (columns or {}).get(table),
+                              partitions, row_filter, max_memory, spill_dir))
+
+    # load tables into dataframes, parsing their timestamps
+    if n_jobs == 1:
+        dfs = [_read_table(*table_arguments) for table_arguments in arguments]
 
-            # load table into a dataframe
-            df = pd.read_csv(file, dtype=prop, date_parser=pd.to_datetime)
+    else:
+        costs = [_estimate_table_memory(source, format, max_memory)
+                 for source, *_ in arguments]
+        executor_class = ThreadPoolExecutor if format == 'sql' else ProcessPoolExecutor
+        with executor_class(max_workers=n_jobs) as executor:
+            dfs = _map_within_budget(executor, _read_table, arguments, costs, memory_budget)
 
-            df.columns = [column.lower() for column in df.columns]
+    for table, df in zip(global_tables, dfs):
+        spec = get_table_spec(table)
+        key = spec.primary_key
+        arr_time = spec.time_columns
 
-            # check if arr_time should be None (no time index)
-            arr_time = arr_time[0] if len(arr_time) > 0 else None
+        # check if arr_time should be None (no time index)
+        arr_time = arr_time[0] if len(arr_time) > 0 else None
 
-            if arr_time and df[arr_time].isnull().all():
-                arr_time = None
+        if arr_time and (arr_time not in df.columns or df[arr_time].isnull().all()):
+            arr_time = None
 
-            # load dataframe into the entityset
-            es.entity_from_dataframe(entity_id=table,
-                                     dataframe=df,
-                                     index=key,
-                                     time_index=arr_time)
+        # load dataframe into the entityset
+        es.entity_from_dataframe(entity_id=table,
+                                 dataframe=df,
+                                 index=key,
+                                 time_index=arr_time)
 
     for r in relationships:
         if (r['parent'] in global_tables and r['child'] in global_tables):
@@ -0,0 +1,116 @@
+import logging
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+LOGGER = logging.getLogger(__name__)
+
+
+def get_max_rss():
+    """Returns the peak resident set size of the process in bytes, or None if unknown."""
+
+    if resource is None:
+        return None
+
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class LoadProfiler():
+    """A class that records the time and memory spent in each stage of a load.
+
+    Args:
+        track_memory (bool):
+            Whether to trace the memory allocated by each stage with ``tracemalloc``.
+            Tracing slows the load down, so it is disabled by default.
+    """
+
+    __name__ = 'LoadProfiler'
+
+    def __init__(self, track_memory=False):
+        self.track_memory = track_memory
+        self.stages = []
+        self.resources = {}
+
+    @contextmanager
+    def stage(self, name):
+        """Records the time and memory spent in the enclosed block.
+
+        Args:
+            name (str):
+                The name of the stage.
+        """
+
+        tracing = self.track_memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        elif self.track_memory and hasattr(tracemalloc, 'reset_peak'):
+            # python >= 3.9, otherwise the peak of the enclosing trace is reported
+            tracemalloc.reset_peak()
+
+        max_rss = get_max_rss()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            rss_increase = None if max_rss is None else get_max_rss() - max_rss
+            record = {
+                'stage': name,
+                'seconds': time.perf_counter() - start,
+                'peak_memory': tracemalloc.get_traced_memory()[1] if self.track_memory else None,
+                'rss_increase': rss_increase
+            }
+            if tracing:
+                tracemalloc.stop()
+
+            self.stages.append(record)
+            LOGGER.debug('Stage %s took %.2f seconds', name, record['seconds'])
+
+    def add_resources(self, fhir):
+        """Records the number of rows and the memory usage of each dataframe.
+
+        Args:
+            fhir (dict):
+                A dictionary of fhir resources in pandas dataframe format.
+        """
+
+        for name, df in fhir.items():
+            self.resources[name] = {
+                'rows': len(df),
+                'bytes': int(df.memory_usage(index=True, deep=True).sum())
+            }
+
+    def get_report(self):
+        """Returns the recorded stages and resources.
+
+        Returns:
+            dict:
+                A dictionary with the list of ``stages``, each with its duration in
+                ``seconds``, its ``peak_memory`` traced in bytes and its ``rss_increase``,
+                that is how many bytes the peak resident set size of the process grew
+                during the stage, which is 0 when the stage stayed under the peak of an
+                earlier one, and the ``rows`` and ``bytes`` of each loaded resource in
+                ``resources``.
+        """
+
+        return {
+            'seconds': sum(stage['seconds'] for stage in self.stages),
+            'stages': list(self.stages),
+            'resources': dict(self.resources)
+        }
+
+    def log_report(self):
+        """Logs a summary of the recorded stages and resources."""
+
+        for stage in self.stages:
+            peak_memory = stage['peak_memory']
+            LOGGER.info('%-20s %8.2f s %s', stage['stage'], stage['seconds'],
+                        '' if peak_memory is None else '{:.1f} MB peak'.format(peak_memory / 1e6))
+
+        for name, usage in sorted(self.resources.items(), key=lambda item: -item[1]['bytes']):
+            LOGGER.info('%-20s %10d rows %10.1f MB', name, usage['rows'], usage['bytes'] / 1e6)
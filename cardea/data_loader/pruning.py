@@ -0,0 +1,159 @@
+from functools import lru_cache
+
+from cardea.fhir._index import RESOURCES
+from cardea.fhir.registry import get_resource_type
+from cardea.fhir.relationships import RELATIONSHIP_INDEX
+
+ALWAYS_LOADED = ('Reference', 'Identifier')
+
+# resources that references usually point at, for the reference attributes whose
+# name is not the name of the resource they point at
+REFERENCE_TARGETS = {
+    'subject': ('Patient', 'Group'),
+    'beneficiary': ('Patient',),
+    'context': ('Encounter', 'EpisodeOfCare'),
+    'actor': ('Patient', 'Practitioner', 'RelatedPerson', 'Device', 'Location'),
+    'individual': ('Practitioner', 'RelatedPerson'),
+    'performer': ('Practitioner', 'Organization'),
+    'asserter': ('Practitioner', 'Patient'),
+    'recorder': ('Practitioner', 'Patient'),
+    'author': ('Practitioner', 'Organization'),
+    'serviceProvider': ('Organization',),
+    'managingOrganization': ('Organization',),
+    'incomingReferral': ('ReferralRequest',),
+    'medicationReference': ('Medication',),
+    'reasonReference': ('Condition', 'Observation'),
+}
+
+
+@lru_cache(maxsize=None)
+def is_shared_element(name):
+    """Returns whether a fhir class is a data type shared by many resources.
+
+    Data types such as ``Period`` or ``CodeableConcept`` are parents of most
+    resources, but each of their rows belongs to a single resource, so the
+    other resources that use them are not related to each other.
+
+    Args:
+        name (str):
+            The name of the fhir class.
+
+    Returns:
+        bool:
+            True if the class is neither a resource nor one of its elements.
+    """
+
+    resource_type = get_resource_type(name)
+    return '_' not in name and 'resourceType' not in vars(resource_type.cls())
+
+
+def is_resource(name):
+    """Returns whether a fhir class is a resource that references can point at.
+
+    Args:
+        name (str):
+            The name of the fhir class.
+
+    Returns:
+        bool:
+            True if the class is neither a data type nor an element of a resource.
+    """
+
+    return name in RESOURCES and '_' not in name and not is_shared_element(name)
+
+
+@lru_cache(maxsize=None)
+def get_reference_targets(name):
+    """Returns the resources that the references of a fhir class point at.
+
+    FHIR lets a reference point at several resource types, which the fhir
+    classes do not record, so the targets of a reference attribute are taken
+    from ``REFERENCE_TARGETS`` or, failing that, from the resource named like
+    the attribute, such as ``Encounter_Diagnosis.condition`` for ``Condition``.
+
+    Args:
+        name (str):
+            The name of the fhir class.
+
+    Returns:
+        tuple:
+            The names of the resources.
+    """
+
+    targets = []
+    for relation in RELATIONSHIP_INDEX.by_child(name):
+        if relation['parent_entity'] != 'Reference':
+            continue
+
+        attribute = relation['child_variable']
+        default = (attribute[:1].upper() + attribute[1:],)
+        targets.extend(REFERENCE_TARGETS.get(attribute, default))
+
+    return tuple(target for target in dict.fromkeys(targets) if is_resource(target))
+
+
+def get_related_resources(resources, max_depth=2):
+    """Returns the resources within max_depth relationships of the given resources.
+
+    The relationships are followed from children to parents and, except from
+    shared data types, from parents to children. References are followed to the
+    resources returned by ``get_reference_targets``, since the resource a
+    reference points at is only known once the data is loaded, but not back from
+    the resources they point at. ``Reference`` and ``Identifier`` are always
+    included.
+
+    Args:
+        resources (list):
+            The names of the fhir classes to start from.
+        max_depth (int):
+            The maximum number of relationships between a given resource and a
+            related one.
+
+    Returns:
+        set:
+            The names of the given and related fhir classes.
+    """
+
+    related = set(resources)
+    frontier = set(resources)
+    for _ in range(max_depth):
+        neighbours = set()
+        for name in frontier:
+            if name in ALWAYS_LOADED:
+                continue
+
+            neighbours.update(relation['parent_entity']
+                              for relation in RELATIONSHIP_INDEX.by_child(name))
+            neighbours.update(get_reference_targets(name))
+            if not is_shared_element(name):
+                neighbours.update(relation['child_entity']
+                                  for relation in RELATIONSHIP_INDEX.by_parent(name))
+
+        frontier = neighbours - related
+        related.update(frontier)
+
+    return related.union(ALWAYS_LOADED)
+
+
+def get_problem_resources(problem, max_depth=2):
+    """Returns the resources a prediction problem can use.
+
+    These are the target and cutoff entities of the problem, the entities it
+    uses to generate its target label, and the resources related to them
+    within the featurization depth.
+
+    Args:
+        problem (ProblemDefinition):
+            The prediction problem, either a class or an instance.
+        max_depth (int):
+            The maximum depth of the features.
+
+    Returns:
+        set:
+            The names of the fhir classes.
+    """
+
+    resources = [problem.target_entity, problem.cutoff_entity]
+    resources.extend(problem.required_entities)
+
+    return get_related_resources(resources, max_depth=max_depth)
@@ -0,0 +1,117 @@
+import logging
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pyarrow import csv
+
+LOGGER = logging.getLogger(__name__)
+
+ARROW_TYPES = {
+    'bool': pa.bool_(),
+    'int': pa.float64(),
+    'str': pa.string()
+}
+
+PANDAS_TYPES = {
+    'int': 'float64',
+    'str': str
+}
+
+
+def read_csv_header(file_path):
+    """Returns the column names of a .csv file.
+
+    Args:
+        file_path (str):
+            The path of the .csv file.
+
+    Returns:
+        list:
+            The column names in the order they appear in the file.
+    """
+
+    return list(pd.read_csv(file_path, nrows=0).columns)
+
+
+def read_csv_file(file_path, columns=None, types=None, engine='pyarrow'):
+    """Returns a dataframe with the content of a .csv file.
+
+    Args:
+        file_path (str):
+            The path of the .csv file.
+        columns (list):
+            The columns to read. Columns that are not in the file are ignored.
+            If None, every column is read.
+        types (dict):
+            Declared type (``'bool'``, ``'int'`` or ``'str'``) of the columns, used
+            instead of inferring them. If the values of a column do not match their
+            declared type, the file is read again with inferred types.
+        engine (str):
+            Either ``'pyarrow'``, to parse the file with the multi-threaded Arrow
+            reader, or ``'c'`` to use the pandas reader.
+
+    Returns:
+        pandas.DataFrame:
+            The content of the file.
+    """
+
+    if columns is not None:
+        columns = [column for column in read_csv_header(file_path) if column in set(columns)]
+
+    types = types or {}
+    try:
+        return _read_csv_file(file_path, columns, types, engine)
+    except (pa.ArrowInvalid, ValueError, TypeError) as error:
+        if not types:
+            raise
+
+        LOGGER.warning('Declared types of %s could not be used: %s', file_path, error)
+        return _read_csv_file(file_path, columns, {}, engine)
+
+
+def _get_convert_options(columns, column_types):
+    convert_options = csv.ConvertOptions(column_types=column_types, strings_can_be_null=True)
+    if columns is not None:
+        convert_options.include_columns = columns
+
+    return convert_options
+
+
+def _read_arrow_table(file_path, columns, types):
+    column_types = {column: ARROW_TYPES[kind] for column, kind in types.items()
+                    if kind in ARROW_TYPES}
+
+    # the pandas reader does not parse dates, so temporal columns inferred from the
+    # first block are read as strings
+    convert_options = _get_convert_options(columns, column_types)
+    with csv.open_csv(file_path, convert_options=convert_options) as reader:
+        temporal = [field.name for field in reader.schema if pa.types.is_temporal(field.type)]
+
+    if temporal:
+        column_types.update((column, pa.string()) for column in temporal)
+        convert_options = _get_convert_options(columns, column_types)
+
+    return csv.read_csv(file_path, convert_options=convert_options)
+
+
+def _read_csv_file(file_path, columns, types, engine):
+    if engine == 'pyarrow':
+        table = _read_arrow_table(file_path, columns, types)
+        df = table.to_pandas()
+
+        # Arrow returns None for the missing values of bool and string columns,
+        # while pandas returns NaN
+        for field in table.schema:
+            if table.column(field.name).null_count and df[field.name].dtype == object:
+                values = df[field.name]
+                df[field.name] = values.where(values.notnull(), np.nan)
+
+        return df
+
+    if engine == 'c':
+        dtype = {column: PANDAS_TYPES[kind] for column, kind in types.items()
+                 if kind in PANDAS_TYPES}
+        return pd.read_csv(file_path, usecols=columns, dtype=dtype or None)
+
+    raise ValueError('{} is not a supported engine'.format(engine))
@@ -0,0 +1,238 @@
+from functools import partial
+
+import pandas as pd
+
+from cardea.data_loader.data_loader import as_keys
+from cardea.data_loader.keys import hash_keys
+from cardea.data_loader.pruning import ALWAYS_LOADED, is_shared_element
+from cardea.fhir.registry import get_resource_type
+
+
+def sample_keys(values, fraction):
+    """Returns whether each key belongs to a deterministic sample of the keys.
+
+    A key is sampled if its hash falls in the first ``fraction`` of the hash
+    range, so the same keys are sampled in every table and every session, and
+    the sample of a smaller fraction is contained in the sample of a larger one.
+
+    Args:
+        values (pandas.Series):
+            The key values.
+        fraction (float):
+            The fraction of the keys to sample, between 0 and 1.
+
+    Returns:
+        numpy.ndarray:
+            A boolean mask of the sampled keys. Missing keys are never sampled.
+
+    Raises:
+        ValueError:
+            If fraction is not between 0 and 1.
+    """
+
+    if not 0 < fraction <= 1:
+        raise ValueError('fraction must be between 0 and 1, got {}'.format(fraction))
+
+    return (hash_keys(values) / 2.0 ** 64 < fraction) & values.notnull().values
+
+
+def _filter_sample(fraction, column, row_filter, df):
+    mask = pd.Series(True, index=df.index)
+    if column in df.columns:
+        mask &= sample_keys(df[column], fraction)
+
+    if row_filter is not None:
+        mask &= row_filter(df).values
+
+    return mask
+
+
+def sample_filter(fraction, column, row_filter=None):
+    """Returns a row filter that keeps the rows of a sample of keys.
+
+    The filter can be pickled, so it can be used by the processes of
+    ``load_mimic_data``. Tables without the key column are not sampled.
+
+    Args:
+        fraction (float):
+            The fraction of the keys to sample.
+        column (str):
+            The column with the sampled keys, such as ``subject_id``.
+        row_filter (callable):
+            Another row filter whose rows are also required.
+
+    Returns:
+        callable:
+            A function that receives a dataframe and returns a boolean series of the
+            rows to keep.
+    """
+
+    return partial(_filter_sample, fraction, column, row_filter)
+
+
+def sample_dataframes(fhir, relationships, identifiers, fraction, root='Patient', keys=None):
+    """Returns the fhir dataframes restricted to a deterministic sample of patients.
+
+    The rows of the root resource are sampled by the hash of their identifier,
+    and the selection is propagated along the relationships by
+    ``filter_descendants``: rows that reference a dropped row are dropped as
+    well, so every reference left points at a loaded row, and so are the rows
+    of shared data types that only dropped rows used.
+
+    Args:
+        fhir (dict):
+            A dictionary of resolved fhir dataframes.
+        relationships (pandas.DataFrame):
+            The relationships between the dataframes.
+        identifiers (dict):
+            The identifier column of each dataframe.
+        fraction (float):
+            The fraction of the root rows to keep.
+        root (str):
+            The resource whose rows are sampled.
+        keys (KeyDictionary):
+            The dictionary of interned keys, if any, so that the original
+            identifiers are hashed and the sample does not depend on the order
+            of loading.
+
+    Returns:
+        dict:
+            The sampled dataframes. The given dataframes are not modified.
+
+    Raises:
+        LookupError:
+            If the root resource is not loaded.
+    """
+
+    if root not in fhir:
+        raise LookupError('\'{}\' file is not loaded.'.format(root))
+
+    original = fhir
+    fhir = dict(fhir)
+    root_keys = fhir[root][identifiers[root]]
+    root_keys = root_keys if keys is None else keys.decode(root_keys)
+    fhir[root] = fhir[root][sample_keys(root_keys, fraction)]
+
+    return filter_descendants(fhir, relationships, [root], original)
+
+
+def _get_id_column(name):
+    try:
+        return get_resource_type(name).id_columns[0]
+    except (LookupError, IndexError):
+        return None
+
+
+def _is_element(name):
+    try:
+        return name not in ALWAYS_LOADED and is_shared_element(name)
+    except LookupError:
+        return False
+
+
+def _drop_children(fhir, relationships, parents):
+    parents = list(parents)
+    while parents:
+        parent = parents.pop(0)
+        children = relationships[relationships['parent_entity'] == parent]
+        for _, relation in children.iterrows():
+            child = relation['child_entity']
+            values = fhir[child][relation['child_variable']]
+            parent_keys, child_keys = as_keys(fhir[parent][relation['parent_variable']], values)
+
+            keep = values.isnull().values | child_keys.isin(parent_keys).values
+            if not keep.all():
+                fhir[child] = fhir[child][keep]
+                parents.append(child)
+
+    return fhir
+
+
+def _drop_registered_keys(original, fhir):
+    dropped = []
+    for name, df in fhir.items():
+        id_column = _get_id_column(name)
+        if name in ALWAYS_LOADED or _is_element(name) or len(df) == len(original[name]) or \
+                id_column not in df.columns:
+            continue
+
+        kept, keys = as_keys(df[id_column], original[name][id_column])
+        dropped.append(keys[~keys.isin(kept).values])
+
+    changed = []
+    if not dropped:
+        return changed
+
+    for name in ALWAYS_LOADED:
+        id_column = _get_id_column(name)
+        if name not in fhir or id_column not in fhir[name].columns:
+            continue
+
+        for keys in dropped:
+            registered, keys = as_keys(fhir[name][id_column], keys)
+            keep = ~registered.isin(keys).values
+            if not keep.all():
+                fhir[name] = fhir[name][keep]
+                changed.append(name)
+
+    return list(dict.fromkeys(changed))
+
+
+def _drop_orphans(original, fhir, relationships):
+    elements = [name for name in relationships['parent_entity'].unique() if _is_element(name)]
+    changed = True
+    while changed:
+        changed = False
+        for name in elements:
+            relations = relationships[relationships['parent_entity'] == name]
+            used = []
+            unused = []
+            for _, relation in relations.iterrows():
+                child, column = relation['child_entity'], relation['child_variable']
+                used.append(fhir[child][column].dropna())
+                unused.append(original[child][column].dropna())
+
+            parent_keys, used, unused = as_keys(fhir[name][relations.iloc[0]['parent_variable']],
+                                                pd.concat(used), pd.concat(unused))
+            keep = ~parent_keys.isin(unused[~unused.isin(used).values]).values
+            if not keep.all():
+                fhir[name] = fhir[name][keep]
+                changed = True
+
+    return fhir
+
+
+def filter_descendants(fhir, relationships, roots, original=None):
+    """Returns the fhir dataframes without the rows that reference dropped rows.
+
+    Starting from resources whose rows were filtered, the rows of their
+    children whose reference is not among the rows left are dropped, and the
+    children that lose rows are followed in turn. Rows with a missing
+    reference are kept. The ``Reference`` and ``Identifier`` rows of the
+    dropped resources are dropped too, and so are the rows of shared data
+    types, such as ``Period`` or ``Coding``, that were only used by dropped
+    rows.
+
+    Args:
+        fhir (dict):
+            A dictionary of resolved fhir dataframes.
+        relationships (pandas.DataFrame):
+            The relationships between the dataframes.
+        roots (list):
+            The resources whose rows were filtered.
+        original (dict):
+            The dataframes before the roots were filtered, which tell the rows
+            that were dropped. If None, the given ones.
+
+    Returns:
+        dict:
+            The filtered dataframes. The given dataframes are not modified.
+    """
+
+    original = fhir if original is None else original
+    fhir = dict(fhir)
+    while roots:
+        fhir = _drop_children(fhir, relationships, roots)
+        roots = _drop_registered_keys(original, fhir)
+
+    return _drop_orphans(original, fhir, relationships)
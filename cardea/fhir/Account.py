@@ -84,64 +84,6 @@ class Account(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'active', 'inactive', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, inactive, entered-in-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Account',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Account_Coverage',
-             'parent_variable': 'object_id',
-             'child_entity': 'Account',
-             'child_variable': 'coverage'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Account',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Account',
-             'child_variable': 'owner'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Account',
-             'child_variable': 'active'},
-
-            {'parent_entity': 'Account_Guarantor',
-             'parent_variable': 'object_id',
-             'child_entity': 'Account',
-             'child_variable': 'guarantor'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Account',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'Account',
-             'child_variable': 'balance'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Account',
-             'child_variable': 'identifier'},
-        ]
-
 
 class Account_Coverage(fhirbase):
     """
@@ -173,15 +115,6 @@ class Account_Coverage(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Account_Coverage',
-             'child_variable': 'coverage'},
-        ]
-
 
 class Account_Guarantor(fhirbase):
     """
@@ -214,17 +147,3 @@ class Account_Guarantor(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Account_Guarantor',
-             'child_variable': 'party'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Account_Guarantor',
-             'child_variable': 'period'},
-        ]
@@ -259,129 +259,6 @@ class ActivityDefinition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'timingRange'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'bodySite'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'transform'},
-
-            {'parent_entity': 'Dosage',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'dosage'},
-
-            {'parent_entity': 'Contributor',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'contributor'},
-
-            {'parent_entity': 'RelatedArtifact',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'relatedArtifact'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'ActivityDefinition_Participant',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'participant'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'timingTiming'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'productCodeableConcept'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'topic'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'location'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'productReference'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'useContext'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'jurisdiction'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'ActivityDefinition_DynamicValue',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'dynamicValue'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'library'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'effectivePeriod'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition',
-             'child_variable': 'timingPeriod'},
-        ]
-
 
 class ActivityDefinition_Participant(fhirbase):
     """
@@ -410,15 +287,6 @@ class ActivityDefinition_Participant(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ActivityDefinition_Participant',
-             'child_variable': 'role'},
-        ]
-
 
 class ActivityDefinition_DynamicValue(fhirbase):
     """
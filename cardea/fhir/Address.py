@@ -72,28 +72,3 @@ class Address(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.use is not None:
-            for value in self.use:
-                if value is not None and value.lower() not in [
-                        'home', 'work', 'temp', 'old']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'home, work, temp, old'))
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'postal', 'physical', 'both']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'postal, physical, both'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Address',
-             'child_variable': 'period'},
-        ]
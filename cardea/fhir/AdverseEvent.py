@@ -109,84 +109,6 @@ class AdverseEvent(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.category is not None:
-            for value in self.category:
-                if value is not None and value.lower() not in [
-                        'ae', 'pae']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'AE, PAE'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'AdverseEvent_SuspectEntity',
-             'parent_variable': 'object_id',
-             'child_entity': 'AdverseEvent',
-             'child_variable': 'suspectEntity'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'AdverseEvent',
-             'child_variable': 'subjectMedicalHistory'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'AdverseEvent',
-             'child_variable': 'outcome'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'AdverseEvent',
-             'child_variable': 'reaction'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'AdverseEvent',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'AdverseEvent',
-             'child_variable': 'recorder'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'AdverseEvent',
-             'child_variable': 'study'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'AdverseEvent',
-             'child_variable': 'location'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'AdverseEvent',
-             'child_variable': 'referenceDocument'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'AdverseEvent',
-             'child_variable': 'eventParticipant'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'AdverseEvent',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'AdverseEvent',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'AdverseEvent',
-             'child_variable': 'seriousness'},
-        ]
-
 
 class AdverseEvent_SuspectEntity(fhirbase):
     """
@@ -239,41 +161,3 @@ class AdverseEvent_SuspectEntity(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.causality is not None:
-            for value in self.causality:
-                if value is not None and value.lower() not in [
-                        'causality1', 'causality2']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'causality1, causality2'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'AdverseEvent_SuspectEntity',
-             'child_variable': 'causalityAuthor'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'AdverseEvent_SuspectEntity',
-             'child_variable': 'causalityResult'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'AdverseEvent_SuspectEntity',
-             'child_variable': 'instance'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'AdverseEvent_SuspectEntity',
-             'child_variable': 'causalityAssessment'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'AdverseEvent_SuspectEntity',
-             'child_variable': 'causalityMethod'},
-        ]
@@ -132,97 +132,6 @@ class AllergyIntolerance(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.clinicalStatus is not None:
-            for value in self.clinicalStatus:
-                if value is not None and value.lower() not in [
-                        'active', 'inactive', 'resolved']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, inactive, resolved'))
-
-        if self.verificationStatus is not None:
-            for value in self.verificationStatus:
-                if value is not None and value.lower() not in [
-                        'unconfirmed', 'confirmed', 'refuted', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'unconfirmed, confirmed, refuted, entered-in-error'))
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'allergy', 'intolerance']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'allergy, intolerance'))
-
-        if self.category is not None:
-            for value in self.category:
-                if value is not None and value.lower() not in [
-                        'food', 'medication', 'environment', 'biologic']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'food, medication, environment, biologic'))
-
-        if self.criticality is not None:
-            for value in self.criticality:
-                if value is not None and value.lower() not in [
-                        'low', 'high', 'unable-to-assess']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'low, high, unable-to-assess'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Age',
-             'parent_variable': 'object_id',
-             'child_entity': 'AllergyIntolerance',
-             'child_variable': 'onsetAge'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'AllergyIntolerance',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'AllergyIntolerance',
-             'child_variable': 'recorder'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'AllergyIntolerance',
-             'child_variable': 'patient'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'AllergyIntolerance',
-             'child_variable': 'onsetRange'},
-
-            {'parent_entity': 'AllergyIntolerance_Reaction',
-             'parent_variable': 'object_id',
-             'child_entity': 'AllergyIntolerance',
-             'child_variable': 'reaction'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'AllergyIntolerance',
-             'child_variable': 'asserter'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'AllergyIntolerance',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'AllergyIntolerance',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'AllergyIntolerance',
-             'child_variable': 'onsetPeriod'},
-        ]
-
 
 class AllergyIntolerance_Reaction(fhirbase):
     """
@@ -284,36 +193,3 @@ class AllergyIntolerance_Reaction(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.severity is not None:
-            for value in self.severity:
-                if value is not None and value.lower() not in [
-                        'mild', 'moderate', 'severe']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'mild, moderate, severe'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'AllergyIntolerance_Reaction',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'AllergyIntolerance_Reaction',
-             'child_variable': 'substance'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'AllergyIntolerance_Reaction',
-             'child_variable': 'exposureRoute'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'AllergyIntolerance_Reaction',
-             'child_variable': 'manifestation'},
-        ]
@@ -33,12 +33,3 @@ class Annotation(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Annotation',
-             'child_variable': 'authorReference'},
-        ]
@@ -149,81 +149,6 @@ class Appointment(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'proposed', 'pending', 'booked', 'arrived', 'fulfilled', 'cancelled',
-                        'noshow', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'proposed, pending, booked, arrived, fulfilled, cancelled, noshow,'
-                        'entered-in-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Appointment',
-             'child_variable': 'appointmentType'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Appointment',
-             'child_variable': 'indication'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Appointment',
-             'child_variable': 'supportingInformation'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Appointment',
-             'child_variable': 'specialty'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Appointment',
-             'child_variable': 'reason'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Appointment',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Appointment',
-             'child_variable': 'serviceCategory'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Appointment',
-             'child_variable': 'serviceType'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Appointment',
-             'child_variable': 'slot'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Appointment',
-             'child_variable': 'incomingReferral'},
-
-            {'parent_entity': 'Appointment_Participant',
-             'parent_variable': 'object_id',
-             'child_entity': 'Appointment',
-             'child_variable': 'participant'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Appointment',
-             'child_variable': 'requestedPeriod'},
-        ]
-
 
 class Appointment_Participant(fhirbase):
     """
@@ -266,33 +191,3 @@ class Appointment_Participant(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.required is not None:
-            for value in self.required:
-                if value is not None and value.lower() not in [
-                        'required', 'optional', 'information-only']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'required, optional, information-only'))
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'accepted', 'declined', 'tentative', 'needs-action']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'accepted, declined, tentative, needs-action'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Appointment_Participant',
-             'child_variable': 'actor'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Appointment_Participant',
-             'child_variable': 'type'},
-        ]
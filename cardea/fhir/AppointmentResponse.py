@@ -66,27 +66,3 @@ class AppointmentResponse(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'AppointmentResponse',
-             'child_variable': 'actor'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'AppointmentResponse',
-             'child_variable': 'appointment'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'AppointmentResponse',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'AppointmentResponse',
-             'child_variable': 'participantType'},
-        ]
@@ -76,56 +76,6 @@ class AuditEvent(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.action is not None:
-            for value in self.action:
-                if value is not None and value.lower() not in [
-                        'c', 'r', 'u', 'd', 'e']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'C, R, U, D, E'))
-
-        if self.outcome is not None:
-            for value in self.outcome:
-                if value is not None and value.lower() not in [
-                        '0', '4', '8', '12']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, '0, 4, 8, 12'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'AuditEvent',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'AuditEvent',
-             'child_variable': 'subtype'},
-
-            {'parent_entity': 'AuditEvent_Source',
-             'parent_variable': 'identifier',
-             'child_entity': 'AuditEvent',
-             'child_variable': 'source'},
-
-            {'parent_entity': 'AuditEvent_Agent',
-             'parent_variable': 'object_id',
-             'child_entity': 'AuditEvent',
-             'child_variable': 'agent'},
-
-            {'parent_entity': 'AuditEvent_Entity',
-             'parent_variable': 'identifier',
-             'child_entity': 'AuditEvent',
-             'child_variable': 'entity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'AuditEvent',
-             'child_variable': 'purposeOfEvent'},
-        ]
-
 
 class AuditEvent_Agent(fhirbase):
     """
@@ -204,45 +154,6 @@ class AuditEvent_Agent(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'AuditEvent_Agent',
-             'child_variable': 'purposeOfUse'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'AuditEvent_Agent',
-             'child_variable': 'reference'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'AuditEvent_Agent',
-             'child_variable': 'userId'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'AuditEvent_Agent',
-             'child_variable': 'location'},
-
-            {'parent_entity': 'AuditEvent_Network',
-             'parent_variable': 'object_id',
-             'child_entity': 'AuditEvent_Agent',
-             'child_variable': 'network'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'AuditEvent_Agent',
-             'child_variable': 'media'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'AuditEvent_Agent',
-             'child_variable': 'role'},
-        ]
-
 
 class AuditEvent_Network(fhirbase):
     """
@@ -274,15 +185,6 @@ class AuditEvent_Network(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        '1', '2', '3', '4', '5']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, '1, 2, 3, 4, 5'))
-
 
 class AuditEvent_Source(fhirbase):
     """
@@ -314,20 +216,6 @@ class AuditEvent_Source(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'AuditEvent_Source',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'AuditEvent_Source',
-             'child_variable': 'type'},
-        ]
-
 
 class AuditEvent_Entity(fhirbase):
     """
@@ -390,45 +278,6 @@ class AuditEvent_Entity(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'AuditEvent_Entity',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'AuditEvent_Detail',
-             'parent_variable': 'object_id',
-             'child_entity': 'AuditEvent_Entity',
-             'child_variable': 'detail'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'AuditEvent_Entity',
-             'child_variable': 'role'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'AuditEvent_Entity',
-             'child_variable': 'securityLabel'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'AuditEvent_Entity',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'AuditEvent_Entity',
-             'child_variable': 'reference'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'AuditEvent_Entity',
-             'child_variable': 'lifecycle'},
-        ]
-
 
 class AuditEvent_Detail(fhirbase):
     """
@@ -31,12 +31,3 @@ class BackboneElement(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Extension',
-             'parent_variable': 'object_id',
-             'child_entity': 'BackboneElement',
-             'child_variable': 'modifierExtension'},
-        ]
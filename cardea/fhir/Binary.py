@@ -37,12 +37,3 @@ class Binary(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Binary',
-             'child_variable': 'securityContext'},
-        ]
@@ -53,41 +53,6 @@ class Bundle(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                    'document', 'message', 'transaction', 'transaction-response', 'batch',
-                        'batch-response', 'history', 'searchset', 'collection']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'document, message, transaction, transaction-response, batch,'
-                        'batch-response, history, searchset, collection'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Signature',
-             'parent_variable': 'object_id',
-             'child_entity': 'Bundle',
-             'child_variable': 'signature'},
-
-            {'parent_entity': 'Bundle_Entry',
-             'parent_variable': 'object_id',
-             'child_entity': 'Bundle',
-             'child_variable': 'entry'},
-
-            {'parent_entity': 'Bundle_Link',
-             'parent_variable': 'object_id',
-             'child_entity': 'Bundle',
-             'child_variable': 'link'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Bundle',
-             'child_variable': 'identifier'},
-        ]
-
 
 class Bundle_Link(fhirbase):
     """
@@ -165,35 +130,6 @@ class Bundle_Entry(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Bundle_Search',
-             'parent_variable': 'object_id',
-             'child_entity': 'Bundle_Entry',
-             'child_variable': 'search'},
-
-            {'parent_entity': 'Bundle_Response',
-             'parent_variable': 'object_id',
-             'child_entity': 'Bundle_Entry',
-             'child_variable': 'response'},
-
-            {'parent_entity': 'Bundle_Link',
-             'parent_variable': 'object_id',
-             'child_entity': 'Bundle_Entry',
-             'child_variable': 'link'},
-
-            {'parent_entity': 'ResourceList',
-             'parent_variable': 'object_id',
-             'child_entity': 'Bundle_Entry',
-             'child_variable': 'resource'},
-
-            {'parent_entity': 'Bundle_Request',
-             'parent_variable': 'object_id',
-             'child_entity': 'Bundle_Entry',
-             'child_variable': 'request'},
-        ]
-
 
 class Bundle_Search(fhirbase):
     """
@@ -223,15 +159,6 @@ class Bundle_Search(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'match', 'include', 'outcome']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'match, include, outcome'))
-
 
 class Bundle_Request(fhirbase):
     """
@@ -287,15 +214,6 @@ class Bundle_Request(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.method is not None:
-            for value in self.method:
-                if value is not None and value.lower() not in [
-                        'get', 'post', 'put', 'delete']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'GET, POST, PUT, DELETE'))
-
 
 class Bundle_Response(fhirbase):
     """
@@ -339,12 +257,3 @@ class Bundle_Response(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ResourceList',
-             'parent_variable': 'object_id',
-             'child_entity': 'Bundle_Response',
-             'child_variable': 'outcome'},
-        ]
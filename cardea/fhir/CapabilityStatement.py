@@ -205,78 +205,6 @@ class CapabilityStatement(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-        if self.kind is not None:
-            for value in self.kind:
-                if value is not None and value.lower() not in [
-                        'instance', 'capability', 'requirements']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'instance, capability, requirements'))
-
-        if self.acceptUnknown is not None:
-            for value in self.acceptUnknown:
-                if value is not None and value.lower() not in [
-                        'no', 'extensions', 'elements', 'both']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'no, extensions, elements, both'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CapabilityStatement_Rest',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement',
-             'child_variable': 'rest'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'CapabilityStatement_Software',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement',
-             'child_variable': 'software'},
-
-            {'parent_entity': 'CapabilityStatement_Implementation',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement',
-             'child_variable': 'implementation'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CapabilityStatement',
-             'child_variable': 'profile'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement',
-             'child_variable': 'jurisdiction'},
-
-            {'parent_entity': 'CapabilityStatement_Document',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement',
-             'child_variable': 'document'},
-
-            {'parent_entity': 'CapabilityStatement_Messaging',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement',
-             'child_variable': 'messaging'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement',
-             'child_variable': 'useContext'},
-        ]
-
 
 class CapabilityStatement_Software(fhirbase):
     """
@@ -409,44 +337,6 @@ class CapabilityStatement_Rest(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'client', 'server']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'client, server'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CapabilityStatement_SearchParam',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement_Rest',
-             'child_variable': 'searchParam'},
-
-            {'parent_entity': 'CapabilityStatement_Interaction1',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement_Rest',
-             'child_variable': 'interaction'},
-
-            {'parent_entity': 'CapabilityStatement_Security',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement_Rest',
-             'child_variable': 'security'},
-
-            {'parent_entity': 'CapabilityStatement_Resource',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement_Rest',
-             'child_variable': 'resource'},
-
-            {'parent_entity': 'CapabilityStatement_Operation',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement_Rest',
-             'child_variable': 'operation'},
-        ]
-
 
 class CapabilityStatement_Security(fhirbase):
     """
@@ -487,20 +377,6 @@ class CapabilityStatement_Security(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CapabilityStatement_Certificate',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement_Security',
-             'child_variable': 'certificate'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement_Security',
-             'child_variable': 'service'},
-        ]
-
 
 class CapabilityStatement_Certificate(fhirbase):
     """
@@ -640,55 +516,6 @@ class CapabilityStatement_Resource(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.versioning is not None:
-            for value in self.versioning:
-                if value is not None and value.lower() not in [
-                        'no-version', 'versioned', 'versioned-update']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'no-version, versioned, versioned-update'))
-
-        if self.conditionalRead is not None:
-            for value in self.conditionalRead:
-                if value is not None and value.lower() not in [
-                        'not-supported', 'modified-since', 'not-match', 'full-support']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'not-supported, modified-since, not-match, full-support'))
-
-        if self.conditionalDelete is not None:
-            for value in self.conditionalDelete:
-                if value is not None and value.lower() not in [
-                        'not-supported', 'single', 'multiple']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'not-supported, single, multiple'))
-
-        if self.referencePolicy is not None:
-            for value in self.referencePolicy:
-                if value is not None and value.lower() not in [
-                        'literal', 'logical', 'resolves', 'enforced', 'local']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'literal, logical, resolves, enforced, local'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CapabilityStatement_Resource',
-             'child_variable': 'profile'},
-
-            {'parent_entity': 'CapabilityStatement_SearchParam',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement_Resource',
-             'child_variable': 'searchParam'},
-
-            {'parent_entity': 'CapabilityStatement_Interaction',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement_Resource',
-             'child_variable': 'interaction'},
-        ]
-
 
 class CapabilityStatement_Interaction(fhirbase):
     """
@@ -724,17 +551,6 @@ class CapabilityStatement_Interaction(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.code is not None:
-            for value in self.code:
-                if value is not None and value.lower() not in [
-                    'read', 'vread', 'update', 'patch', 'delete', 'history-instance',
-                        'history-type', 'create', 'search-type']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'read, vread, update, patch, delete, history-instance, '
-                        'history-type, create, search-type'))
-
 
 class CapabilityStatement_SearchParam(fhirbase):
     """
@@ -780,16 +596,6 @@ class CapabilityStatement_SearchParam(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                    'number', 'date', 'string', 'token', 'reference', 'composite',
-                        'quantity', 'uri']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'number, date, string, token, reference, composite, quantity, uri'))
-
 
 class CapabilityStatement_Interaction1(fhirbase):
     """
@@ -823,15 +629,6 @@ class CapabilityStatement_Interaction1(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.code is not None:
-            for value in self.code:
-                if value is not None and value.lower() not in [
-                        'transaction', 'batch', 'search-system', 'history-system']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'transaction, batch, search-system, history-system'))
-
 
 class CapabilityStatement_Operation(fhirbase):
     """
@@ -862,15 +659,6 @@ class CapabilityStatement_Operation(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CapabilityStatement_Operation',
-             'child_variable': 'definition'},
-        ]
-
 
 class CapabilityStatement_Messaging(fhirbase):
     """
@@ -922,25 +710,6 @@ class CapabilityStatement_Messaging(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CapabilityStatement_Endpoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement_Messaging',
-             'child_variable': 'endpoint'},
-
-            {'parent_entity': 'CapabilityStatement_SupportedMessage',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement_Messaging',
-             'child_variable': 'supportedMessage'},
-
-            {'parent_entity': 'CapabilityStatement_Event',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement_Messaging',
-             'child_variable': 'event'},
-        ]
-
 
 class CapabilityStatement_Endpoint(fhirbase):
     """
@@ -971,15 +740,6 @@ class CapabilityStatement_Endpoint(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement_Endpoint',
-             'child_variable': 'protocol'},
-        ]
-
 
 class CapabilityStatement_SupportedMessage(fhirbase):
     """
@@ -1012,24 +772,6 @@ class CapabilityStatement_SupportedMessage(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'sender', 'receiver']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'sender, receiver'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CapabilityStatement_SupportedMessage',
-             'child_variable': 'definition'},
-        ]
-
 
 class CapabilityStatement_Event(fhirbase):
     """
@@ -1084,41 +826,6 @@ class CapabilityStatement_Event(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.category is not None:
-            for value in self.category:
-                if value is not None and value.lower() not in [
-                        'consequence', 'currency', 'notification']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'Consequence, Currency, Notification'))
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'sender', 'receiver']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'sender, receiver'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CapabilityStatement_Event',
-             'child_variable': 'request'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CapabilityStatement_Event',
-             'child_variable': 'response'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'CapabilityStatement_Event',
-             'child_variable': 'code'},
-        ]
-
 
 class CapabilityStatement_Document(fhirbase):
     """
@@ -1155,21 +862,3 @@ class CapabilityStatement_Document(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'producer', 'consumer']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'producer, consumer'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CapabilityStatement_Document',
-             'child_variable': 'profile'},
-        ]
@@ -144,108 +144,6 @@ class CarePlan(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'draft', 'active', 'suspended', 'completed', 'entered-in-error',
-                        'cancelled', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, suspended, completed, entered-in-error, cancelled,'
-                        'unknown'))
-
-        if self.intent is not None:
-            for value in self.intent:
-                if value is not None and value.lower() not in [
-                        'proposal', 'plan', 'order', 'option']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'proposal, plan, order, option'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan',
-             'child_variable': 'author'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan',
-             'child_variable': 'careTeam'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'CarePlan',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'CarePlan',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan',
-             'child_variable': 'supportingInfo'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan',
-             'child_variable': 'goal'},
-
-            {'parent_entity': 'CarePlan_Activity',
-             'parent_variable': 'object_id',
-             'child_entity': 'CarePlan',
-             'child_variable': 'activity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'CarePlan',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan',
-             'child_variable': 'addresses'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'CarePlan',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan',
-             'child_variable': 'replaces'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan',
-             'child_variable': 'definition'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan',
-             'child_variable': 'basedOn'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan',
-             'child_variable': 'partOf'},
-        ]
-
 
 class CarePlan_Activity(fhirbase):
     """
@@ -299,35 +197,6 @@ class CarePlan_Activity(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CarePlan_Detail',
-             'parent_variable': 'object_id',
-             'child_entity': 'CarePlan_Activity',
-             'child_variable': 'detail'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'CarePlan_Activity',
-             'child_variable': 'progress'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan_Activity',
-             'child_variable': 'outcomeReference'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan_Activity',
-             'child_variable': 'reference'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'CarePlan_Activity',
-             'child_variable': 'outcomeCodeableConcept'},
-        ]
-
 
 class CarePlan_Detail(fhirbase):
     """
@@ -455,88 +324,3 @@ class CarePlan_Detail(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'not-started', 'scheduled', 'in-progress', 'on-hold', 'completed',
-                        'cancelled', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'not-started, scheduled, in-progress, on-hold, completed, '
-                        'cancelled, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'CarePlan_Detail',
-             'child_variable': 'scheduledPeriod'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan_Detail',
-             'child_variable': 'productReference'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'CarePlan_Detail',
-             'child_variable': 'dailyAmount'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan_Detail',
-             'child_variable': 'performer'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'CarePlan_Detail',
-             'child_variable': 'reasonCode'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'CarePlan_Detail',
-             'child_variable': 'scheduledTiming'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'CarePlan_Detail',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan_Detail',
-             'child_variable': 'goal'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'CarePlan_Detail',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan_Detail',
-             'child_variable': 'location'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'CarePlan_Detail',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'CarePlan_Detail',
-             'child_variable': 'productCodeableConcept'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan_Detail',
-             'child_variable': 'reasonReference'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CarePlan_Detail',
-             'child_variable': 'definition'},
-        ]
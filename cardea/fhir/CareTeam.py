@@ -87,69 +87,6 @@ class CareTeam(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'proposed', 'active', 'suspended', 'inactive', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'proposed, active, suspended, inactive, entered-in-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'CareTeam',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CareTeam',
-             'child_variable': 'reasonReference'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'CareTeam',
-             'child_variable': 'reasonCode'},
-
-            {'parent_entity': 'CareTeam_Participant',
-             'parent_variable': 'object_id',
-             'child_entity': 'CareTeam',
-             'child_variable': 'participant'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'CareTeam',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CareTeam',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CareTeam',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CareTeam',
-             'child_variable': 'managingOrganization'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'CareTeam',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'CareTeam',
-             'child_variable': 'period'},
-        ]
-
 
 class CareTeam_Participant(fhirbase):
     """
@@ -187,27 +124,3 @@ class CareTeam_Participant(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CareTeam_Participant',
-             'child_variable': 'onBehalfOf'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'CareTeam_Participant',
-             'child_variable': 'role'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CareTeam_Participant',
-             'child_variable': 'member'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'CareTeam_Participant',
-             'child_variable': 'period'},
-        ]
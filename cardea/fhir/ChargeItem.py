@@ -150,116 +150,6 @@ class ChargeItem(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'planned', 'billable', 'not-billable', 'aborted', 'billed',
-                        'entered-in-error', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'planned, billable, not-billable, aborted, billed, '
-                        'entered-in-error, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'bodysite'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'account'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'service'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'priceOverride'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'requestingOrganization'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'supportingInformation'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'reason'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'occurrencePeriod'},
-
-            {'parent_entity': 'ChargeItem_Participant',
-             'parent_variable': 'object_id',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'participant'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'enterer'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'partOf'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'performingOrganization'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'ChargeItem',
-             'child_variable': 'occurrenceTiming'},
-        ]
-
 
 class ChargeItem_Participant(fhirbase):
     """
@@ -291,17 +181,3 @@ class ChargeItem_Participant(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ChargeItem_Participant',
-             'child_variable': 'actor'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ChargeItem_Participant',
-             'child_variable': 'role'},
-        ]
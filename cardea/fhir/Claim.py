@@ -185,154 +185,6 @@ class Claim(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.use is not None:
-            for value in self.use:
-                if value is not None and value.lower() not in [
-                        'complete', 'proposed', 'exploratory', 'other']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'complete, proposed, exploratory, other'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim',
-             'child_variable': 'billablePeriod'},
-
-            {'parent_entity': 'Claim_Accident',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim',
-             'child_variable': 'accident'},
-
-            {'parent_entity': 'Claim_CareTeam',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim',
-             'child_variable': 'careTeam'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim',
-             'child_variable': 'organization'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim',
-             'child_variable': 'subType'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim',
-             'child_variable': 'prescription'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim',
-             'child_variable': 'facility'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim',
-             'child_variable': 'originalPrescription'},
-
-            {'parent_entity': 'Claim_Related',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim',
-             'child_variable': 'related'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim',
-             'child_variable': 'fundsReserve'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim',
-             'child_variable': 'patient'},
-
-            {'parent_entity': 'Claim_Procedure',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim',
-             'child_variable': 'procedure'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim',
-             'child_variable': 'insurer'},
-
-            {'parent_entity': 'Claim_Insurance',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim',
-             'child_variable': 'insurance'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim',
-             'child_variable': 'hospitalization'},
-
-            {'parent_entity': 'Claim_Information',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim',
-             'child_variable': 'information'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim',
-             'child_variable': 'enterer'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim',
-             'child_variable': 'provider'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim',
-             'child_variable': 'priority'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim',
-             'child_variable': 'total'},
-
-            {'parent_entity': 'Claim_Item',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim',
-             'child_variable': 'item'},
-
-            {'parent_entity': 'Claim_Payee',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim',
-             'child_variable': 'payee'},
-
-            {'parent_entity': 'Claim_Diagnosis',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim',
-             'child_variable': 'diagnosis'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim',
-             'child_variable': 'employmentImpacted'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim',
-             'child_variable': 'referral'},
-        ]
-
 
 class Claim_Related(fhirbase):
     """
@@ -367,25 +219,6 @@ class Claim_Related(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Related',
-             'child_variable': 'reference'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim_Related',
-             'child_variable': 'claim'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Related',
-             'child_variable': 'relationship'},
-        ]
-
 
 class Claim_Payee(fhirbase):
     """
@@ -417,25 +250,6 @@ class Claim_Payee(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim_Payee',
-             'child_variable': 'party'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Payee',
-             'child_variable': 'resourceType'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Payee',
-             'child_variable': 'type'},
-        ]
-
 
 class Claim_CareTeam(fhirbase):
     """
@@ -478,25 +292,6 @@ class Claim_CareTeam(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_CareTeam',
-             'child_variable': 'role'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_CareTeam',
-             'child_variable': 'qualification'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim_CareTeam',
-             'child_variable': 'provider'},
-        ]
-
 
 class Claim_Information(fhirbase):
     """
@@ -571,45 +366,6 @@ class Claim_Information(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Information',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Information',
-             'child_variable': 'valueQuantity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Information',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Information',
-             'child_variable': 'valueAttachment'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Information',
-             'child_variable': 'timingPeriod'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim_Information',
-             'child_variable': 'valueReference'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Information',
-             'child_variable': 'reason'},
-        ]
-
 
 class Claim_Diagnosis(fhirbase):
     """
@@ -652,30 +408,6 @@ class Claim_Diagnosis(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Diagnosis',
-             'child_variable': 'packageCode'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim_Diagnosis',
-             'child_variable': 'diagnosisReference'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Diagnosis',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Diagnosis',
-             'child_variable': 'diagnosisCodeableConcept'},
-        ]
-
 
 class Claim_Procedure(fhirbase):
     """
@@ -712,20 +444,6 @@ class Claim_Procedure(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim_Procedure',
-             'child_variable': 'procedureReference'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Procedure',
-             'child_variable': 'procedureCodeableConcept'},
-        ]
-
 
 class Claim_Insurance(fhirbase):
     """
@@ -775,20 +493,6 @@ class Claim_Insurance(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim_Insurance',
-             'child_variable': 'claimResponse'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim_Insurance',
-             'child_variable': 'coverage'},
-        ]
-
 
 class Claim_Accident(fhirbase):
     """
@@ -824,25 +528,6 @@ class Claim_Accident(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim_Accident',
-             'child_variable': 'locationReference'},
-
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Accident',
-             'child_variable': 'locationAddress'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Accident',
-             'child_variable': 'type'},
-        ]
-
 
 class Claim_Item(fhirbase):
     """
@@ -988,95 +673,6 @@ class Claim_Item(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Item',
-             'child_variable': 'programCode'},
-
-            {'parent_entity': 'Claim_Detail',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Item',
-             'child_variable': 'detail'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Item',
-             'child_variable': 'unitPrice'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim_Item',
-             'child_variable': 'encounter'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Item',
-             'child_variable': 'net'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Item',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Item',
-             'child_variable': 'service'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim_Item',
-             'child_variable': 'udi'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Item',
-             'child_variable': 'locationCodeableConcept'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Item',
-             'child_variable': 'revenue'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Item',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Item',
-             'child_variable': 'locationAddress'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Item',
-             'child_variable': 'bodySite'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim_Item',
-             'child_variable': 'locationReference'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Item',
-             'child_variable': 'servicedPeriod'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Item',
-             'child_variable': 'modifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Item',
-             'child_variable': 'subSite'},
-        ]
-
 
 class Claim_Detail(fhirbase):
     """
@@ -1165,60 +761,6 @@ class Claim_Detail(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Detail',
-             'child_variable': 'net'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim_Detail',
-             'child_variable': 'udi'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Detail',
-             'child_variable': 'revenue'},
-
-            {'parent_entity': 'Claim_SubDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Detail',
-             'child_variable': 'subDetail'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Detail',
-             'child_variable': 'programCode'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Detail',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Detail',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Detail',
-             'child_variable': 'unitPrice'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Detail',
-             'child_variable': 'modifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_Detail',
-             'child_variable': 'service'},
-        ]
-
 
 class Claim_SubDetail(fhirbase):
     """
@@ -1296,52 +838,3 @@ class Claim_SubDetail(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_SubDetail',
-             'child_variable': 'programCode'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_SubDetail',
-             'child_variable': 'modifier'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_SubDetail',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_SubDetail',
-             'child_variable': 'revenue'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_SubDetail',
-             'child_variable': 'service'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_SubDetail',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_SubDetail',
-             'child_variable': 'net'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Claim_SubDetail',
-             'child_variable': 'udi'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'Claim_SubDetail',
-             'child_variable': 'unitPrice'},
-        ]
@@ -130,110 +130,6 @@ class ClaimResponse(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'requestOrganization'},
-
-            {'parent_entity': 'ClaimResponse_AddItem',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'addItem'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'reserved'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'outcome'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'totalCost'},
-
-            {'parent_entity': 'ClaimResponse_Item',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'item'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'unallocDeductable'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'patient'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'insurer'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'payeeType'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'form'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'requestProvider'},
-
-            {'parent_entity': 'ClaimResponse_ProcessNote',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'processNote'},
-
-            {'parent_entity': 'ClaimResponse_Payment',
-             'parent_variable': 'identifier',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'payment'},
-
-            {'parent_entity': 'ClaimResponse_Insurance',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'insurance'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'request'},
-
-            {'parent_entity': 'ClaimResponse_Error',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'error'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'totalBenefit'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ClaimResponse',
-             'child_variable': 'communicationRequest'},
-        ]
-
 
 class ClaimResponse_Item(fhirbase):
     """
@@ -270,20 +166,6 @@ class ClaimResponse_Item(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ClaimResponse_Detail',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Item',
-             'child_variable': 'detail'},
-
-            {'parent_entity': 'ClaimResponse_Adjudication',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Item',
-             'child_variable': 'adjudication'},
-        ]
-
 
 class ClaimResponse_Adjudication(fhirbase):
     """
@@ -320,25 +202,6 @@ class ClaimResponse_Adjudication(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Adjudication',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Adjudication',
-             'child_variable': 'reason'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Adjudication',
-             'child_variable': 'amount'},
-        ]
-
 
 class ClaimResponse_Detail(fhirbase):
     """
@@ -376,20 +239,6 @@ class ClaimResponse_Detail(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ClaimResponse_Adjudication',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Detail',
-             'child_variable': 'adjudication'},
-
-            {'parent_entity': 'ClaimResponse_SubDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Detail',
-             'child_variable': 'subDetail'},
-        ]
-
 
 class ClaimResponse_SubDetail(fhirbase):
     """
@@ -421,15 +270,6 @@ class ClaimResponse_SubDetail(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ClaimResponse_Adjudication',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_SubDetail',
-             'child_variable': 'adjudication'},
-        ]
-
 
 class ClaimResponse_AddItem(fhirbase):
     """
@@ -494,45 +334,6 @@ class ClaimResponse_AddItem(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ClaimResponse_Detail1',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_AddItem',
-             'child_variable': 'detail'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_AddItem',
-             'child_variable': 'modifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_AddItem',
-             'child_variable': 'service'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_AddItem',
-             'child_variable': 'fee'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_AddItem',
-             'child_variable': 'revenue'},
-
-            {'parent_entity': 'ClaimResponse_Adjudication',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_AddItem',
-             'child_variable': 'adjudication'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_AddItem',
-             'child_variable': 'category'},
-        ]
-
 
 class ClaimResponse_Detail1(fhirbase):
     """
@@ -586,40 +387,6 @@ class ClaimResponse_Detail1(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Detail1',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'ClaimResponse_Adjudication',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Detail1',
-             'child_variable': 'adjudication'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Detail1',
-             'child_variable': 'fee'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Detail1',
-             'child_variable': 'service'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Detail1',
-             'child_variable': 'revenue'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Detail1',
-             'child_variable': 'modifier'},
-        ]
-
 
 class ClaimResponse_Error(fhirbase):
     """
@@ -660,15 +427,6 @@ class ClaimResponse_Error(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Error',
-             'child_variable': 'code'},
-        ]
-
 
 class ClaimResponse_Payment(fhirbase):
     """
@@ -710,35 +468,6 @@ class ClaimResponse_Payment(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Payment',
-             'child_variable': 'amount'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Payment',
-             'child_variable': 'adjustmentReason'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Payment',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Payment',
-             'child_variable': 'adjustment'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_Payment',
-             'child_variable': 'identifier'},
-        ]
-
 
 class ClaimResponse_ProcessNote(fhirbase):
     """
@@ -777,20 +506,6 @@ class ClaimResponse_ProcessNote(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_ProcessNote',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClaimResponse_ProcessNote',
-             'child_variable': 'language'},
-        ]
-
 
 class ClaimResponse_Insurance(fhirbase):
     """
@@ -837,17 +552,3 @@ class ClaimResponse_Insurance(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ClaimResponse_Insurance',
-             'child_variable': 'coverage'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ClaimResponse_Insurance',
-             'child_variable': 'claimResponse'},
-        ]
@@ -137,89 +137,6 @@ class ClinicalImpression(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'completed', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, completed, entered-in-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClinicalImpression',
-             'child_variable': 'effectivePeriod'},
-
-            {'parent_entity': 'ClinicalImpression_Finding',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClinicalImpression',
-             'child_variable': 'finding'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ClinicalImpression',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ClinicalImpression',
-             'child_variable': 'assessor'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClinicalImpression',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClinicalImpression',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ClinicalImpression',
-             'child_variable': 'action'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ClinicalImpression',
-             'child_variable': 'prognosisReference'},
-
-            {'parent_entity': 'ClinicalImpression_Investigation',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClinicalImpression',
-             'child_variable': 'investigation'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClinicalImpression',
-             'child_variable': 'prognosisCodeableConcept'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ClinicalImpression',
-             'child_variable': 'problem'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ClinicalImpression',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClinicalImpression',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ClinicalImpression',
-             'child_variable': 'previous'},
-        ]
-
 
 class ClinicalImpression_Investigation(fhirbase):
     """
@@ -256,20 +173,6 @@ class ClinicalImpression_Investigation(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ClinicalImpression_Investigation',
-             'child_variable': 'item'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClinicalImpression_Investigation',
-             'child_variable': 'code'},
-        ]
-
 
 class ClinicalImpression_Finding(fhirbase):
     """
@@ -307,17 +210,3 @@ class ClinicalImpression_Finding(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ClinicalImpression_Finding',
-             'child_variable': 'itemCodeableConcept'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ClinicalImpression_Finding',
-             'child_variable': 'itemReference'},
-        ]
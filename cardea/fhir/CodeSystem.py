@@ -174,68 +174,6 @@ class CodeSystem(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-        if self.hierarchyMeaning is not None:
-            for value in self.hierarchyMeaning:
-                if value is not None and value.lower() not in [
-                        'grouped-by', 'is-a', 'part-of', 'classified-with']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'grouped-by, is-a, part-of, classified-with'))
-
-        if self.content is not None:
-            for value in self.content:
-                if value is not None and value.lower() not in [
-                        'not-present', 'example', 'fragment', 'complete']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'not-present, example, fragment, complete'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeSystem_Filter',
-             'parent_variable': 'object_id',
-             'child_entity': 'CodeSystem',
-             'child_variable': 'filter'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'CodeSystem',
-             'child_variable': 'jurisdiction'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'CodeSystem',
-             'child_variable': 'useContext'},
-
-            {'parent_entity': 'CodeSystem_Property',
-             'parent_variable': 'object_id',
-             'child_entity': 'CodeSystem',
-             'child_variable': 'property'},
-
-            {'parent_entity': 'CodeSystem_Concept',
-             'parent_variable': 'object_id',
-             'child_entity': 'CodeSystem',
-             'child_variable': 'concept'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'CodeSystem',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'CodeSystem',
-             'child_variable': 'contact'},
-        ]
-
 
 class CodeSystem_Filter(fhirbase):
     """
@@ -315,15 +253,6 @@ class CodeSystem_Property(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'code', 'coding', 'string', 'integer', 'boolean', 'datetime']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'code, Coding, string, integer, boolean, dateTime'))
-
 
 class CodeSystem_Concept(fhirbase):
     """
@@ -378,25 +307,6 @@ class CodeSystem_Concept(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeSystem_Concept',
-             'parent_variable': 'object_id',
-             'child_entity': 'CodeSystem_Concept',
-             'child_variable': 'concept'},
-
-            {'parent_entity': 'CodeSystem_Designation',
-             'parent_variable': 'object_id',
-             'child_entity': 'CodeSystem_Concept',
-             'child_variable': 'designation'},
-
-            {'parent_entity': 'CodeSystem_Property1',
-             'parent_variable': 'object_id',
-             'child_entity': 'CodeSystem_Concept',
-             'child_variable': 'property'},
-        ]
-
 
 class CodeSystem_Designation(fhirbase):
     """
@@ -427,15 +337,6 @@ class CodeSystem_Designation(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'CodeSystem_Designation',
-             'child_variable': 'use'},
-        ]
-
 
 class CodeSystem_Property1(fhirbase):
     """
@@ -481,12 +382,3 @@ class CodeSystem_Property1(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'CodeSystem_Property1',
-             'child_variable': 'valueCoding'},
-        ]
@@ -28,12 +28,3 @@ class CodeableConcept(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'CodeableConcept',
-             'child_variable': 'coding'},
-        ]
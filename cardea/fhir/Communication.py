@@ -135,90 +135,6 @@ class Communication(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Communication',
-             'child_variable': 'partOf'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Communication',
-             'child_variable': 'reasonReference'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Communication',
-             'child_variable': 'medium'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Communication',
-             'child_variable': 'sender'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Communication',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'Communication_Payload',
-             'parent_variable': 'object_id',
-             'child_entity': 'Communication',
-             'child_variable': 'payload'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Communication',
-             'child_variable': 'recipient'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Communication',
-             'child_variable': 'notDoneReason'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Communication',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Communication',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'Communication',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Communication',
-             'child_variable': 'topic'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Communication',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Communication',
-             'child_variable': 'reasonCode'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Communication',
-             'child_variable': 'definition'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Communication',
-             'child_variable': 'basedOn'},
-        ]
-
 
 class Communication_Payload(fhirbase):
     """
@@ -252,17 +168,3 @@ class Communication_Payload(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Communication_Payload',
-             'child_variable': 'contentAttachment'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Communication_Payload',
-             'child_variable': 'contentReference'},
-        ]
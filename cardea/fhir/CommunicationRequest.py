@@ -141,95 +141,6 @@ class CommunicationRequest(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'CommunicationRequest',
-             'child_variable': 'medium'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CommunicationRequest',
-             'child_variable': 'basedOn'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CommunicationRequest',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'CommunicationRequest_Requester',
-             'parent_variable': 'object_id',
-             'child_entity': 'CommunicationRequest',
-             'child_variable': 'requester'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'CommunicationRequest',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'CommunicationRequest',
-             'child_variable': 'occurrencePeriod'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CommunicationRequest',
-             'child_variable': 'topic'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CommunicationRequest',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'CommunicationRequest',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CommunicationRequest',
-             'child_variable': 'replaces'},
-
-            {'parent_entity': 'CommunicationRequest_Payload',
-             'parent_variable': 'object_id',
-             'child_entity': 'CommunicationRequest',
-             'child_variable': 'payload'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'CommunicationRequest',
-             'child_variable': 'groupIdentifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'CommunicationRequest',
-             'child_variable': 'reasonCode'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CommunicationRequest',
-             'child_variable': 'sender'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'CommunicationRequest',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CommunicationRequest',
-             'child_variable': 'reasonReference'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CommunicationRequest',
-             'child_variable': 'recipient'},
-        ]
-
 
 class CommunicationRequest_Payload(fhirbase):
     """
@@ -264,20 +175,6 @@ class CommunicationRequest_Payload(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CommunicationRequest_Payload',
-             'child_variable': 'contentReference'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'CommunicationRequest_Payload',
-             'child_variable': 'contentAttachment'},
-        ]
-
 
 class CommunicationRequest_Requester(fhirbase):
     """
@@ -305,17 +202,3 @@ class CommunicationRequest_Requester(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CommunicationRequest_Requester',
-             'child_variable': 'agent'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'CommunicationRequest_Requester',
-             'child_variable': 'onBehalfOf'},
-        ]
@@ -117,46 +117,6 @@ class CompartmentDefinition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-        if self.code is not None:
-            for value in self.code:
-                if value is not None and value.lower() not in [
-                        'patient', 'encounter', 'relatedperson', 'practitioner', 'device']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'Patient, Encounter, RelatedPerson, Practitioner, Device'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'CompartmentDefinition',
-             'child_variable': 'useContext'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'CompartmentDefinition',
-             'child_variable': 'jurisdiction'},
-
-            {'parent_entity': 'CompartmentDefinition_Resource',
-             'parent_variable': 'object_id',
-             'child_entity': 'CompartmentDefinition',
-             'child_variable': 'resource'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'CompartmentDefinition',
-             'child_variable': 'contact'},
-        ]
-
 
 class CompartmentDefinition_Resource(fhirbase):
     """
@@ -112,74 +112,6 @@ class Composition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'preliminary', 'final', 'amended', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'preliminary, final, amended, entered-in-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Composition',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Composition',
-             'child_variable': 'author'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Composition',
-             'child_variable': '_class'},
-
-            {'parent_entity': 'Composition_Event',
-             'parent_variable': 'object_id',
-             'child_entity': 'Composition',
-             'child_variable': 'event'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Composition',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Composition',
-             'child_variable': 'custodian'},
-
-            {'parent_entity': 'Composition_RelatesTo',
-             'parent_variable': 'object_id',
-             'child_entity': 'Composition',
-             'child_variable': 'relatesTo'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Composition',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Composition_Section',
-             'parent_variable': 'object_id',
-             'child_entity': 'Composition',
-             'child_variable': 'section'},
-
-            {'parent_entity': 'Composition_Attester',
-             'parent_variable': 'object_id',
-             'child_entity': 'Composition',
-             'child_variable': 'attester'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Composition',
-             'child_variable': 'encounter'},
-        ]
-
 
 class Composition_Attester(fhirbase):
     """
@@ -217,24 +149,6 @@ class Composition_Attester(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'personal', 'professional', 'legal', 'official']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'personal, professional, legal, official'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Composition_Attester',
-             'child_variable': 'party'},
-        ]
-
 
 class Composition_RelatesTo(fhirbase):
     """
@@ -272,20 +186,6 @@ class Composition_RelatesTo(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Composition_RelatesTo',
-             'child_variable': 'targetReference'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Composition_RelatesTo',
-             'child_variable': 'targetIdentifier'},
-        ]
-
 
 class Composition_Event(fhirbase):
     """
@@ -331,25 +231,6 @@ class Composition_Event(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Composition_Event',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Composition_Event',
-             'child_variable': 'detail'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Composition_Event',
-             'child_variable': 'period'},
-        ]
-
 
 class Composition_Section(fhirbase):
     """
@@ -420,37 +301,3 @@ class Composition_Section(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Composition_Section',
-             'child_variable': 'entry'},
-
-            {'parent_entity': 'Narrative',
-             'parent_variable': 'object_id',
-             'child_entity': 'Composition_Section',
-             'child_variable': 'text'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Composition_Section',
-             'child_variable': 'orderedBy'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Composition_Section',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Composition_Section',
-             'child_variable': 'emptyReason'},
-
-            {'parent_entity': 'Composition_Section',
-             'parent_variable': 'object_id',
-             'child_entity': 'Composition_Section',
-             'child_variable': 'section'},
-        ]
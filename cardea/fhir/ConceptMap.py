@@ -147,54 +147,6 @@ class ConceptMap(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ConceptMap',
-             'child_variable': 'sourceReference'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ConceptMap',
-             'child_variable': 'targetReference'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'ConceptMap',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'ConceptMap_Group',
-             'parent_variable': 'object_id',
-             'child_entity': 'ConceptMap',
-             'child_variable': 'group'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ConceptMap',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'ConceptMap',
-             'child_variable': 'useContext'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ConceptMap',
-             'child_variable': 'jurisdiction'},
-        ]
-
 
 class ConceptMap_Group(fhirbase):
     """
@@ -245,20 +197,6 @@ class ConceptMap_Group(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ConceptMap_Unmapped',
-             'parent_variable': 'object_id',
-             'child_entity': 'ConceptMap_Group',
-             'child_variable': 'unmapped'},
-
-            {'parent_entity': 'ConceptMap_Element',
-             'parent_variable': 'object_id',
-             'child_entity': 'ConceptMap_Group',
-             'child_variable': 'element'},
-        ]
-
 
 class ConceptMap_Element(fhirbase):
     """
@@ -292,15 +230,6 @@ class ConceptMap_Element(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ConceptMap_Target',
-             'parent_variable': 'object_id',
-             'child_entity': 'ConceptMap_Element',
-             'child_variable': 'target'},
-        ]
-
 
 class ConceptMap_Target(fhirbase):
     """
@@ -360,31 +289,6 @@ class ConceptMap_Target(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.equivalence is not None:
-            for value in self.equivalence:
-                if value is not None and value.lower() not in [
-                    'relatedto', 'equivalent', 'equal', 'wider', 'subsumes', 'narrower',
-                        'specializes', 'inexact', 'unmatched', 'disjoint']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'relatedto, equivalent, equal, wider, subsumes, narrower, '
-                        'specializes, inexact, unmatched, disjoint'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ConceptMap_DependsOn',
-             'parent_variable': 'object_id',
-             'child_entity': 'ConceptMap_Target',
-             'child_variable': 'product'},
-
-            {'parent_entity': 'ConceptMap_DependsOn',
-             'parent_variable': 'object_id',
-             'child_entity': 'ConceptMap_Target',
-             'child_variable': 'dependsOn'},
-        ]
-
 
 class ConceptMap_DependsOn(fhirbase):
     """
@@ -471,12 +375,3 @@ class ConceptMap_Unmapped(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'provided', 'fixed', 'other-map']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'provided, fixed, other-map'))
@@ -167,106 +167,6 @@ class Condition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.verificationStatus is not None:
-            for value in self.verificationStatus:
-                if value is not None and value.lower() not in [
-                    'provisional', 'differential', 'confirmed', 'refuted',
-                        'entered-in-error', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'provisional, differential, confirmed, refuted, entered-in-error,'
-                        'unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'Condition',
-             'child_variable': 'onsetRange'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Condition',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Condition',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Condition_Evidence',
-             'parent_variable': 'object_id',
-             'child_entity': 'Condition',
-             'child_variable': 'evidence'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Condition',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Condition',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Condition',
-             'child_variable': 'onsetPeriod'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Condition',
-             'child_variable': 'bodySite'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Condition',
-             'child_variable': 'asserter'},
-
-            {'parent_entity': 'Condition_Stage',
-             'parent_variable': 'object_id',
-             'child_entity': 'Condition',
-             'child_variable': 'stage'},
-
-            {'parent_entity': 'Age',
-             'parent_variable': 'object_id',
-             'child_entity': 'Condition',
-             'child_variable': 'onsetAge'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Condition',
-             'child_variable': 'abatementPeriod'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'Condition',
-             'child_variable': 'abatementRange'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'Condition',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'Age',
-             'parent_variable': 'object_id',
-             'child_entity': 'Condition',
-             'child_variable': 'abatementAge'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Condition',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Condition',
-             'child_variable': 'severity'},
-        ]
-
 
 class Condition_Stage(fhirbase):
     """
@@ -296,20 +196,6 @@ class Condition_Stage(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Condition_Stage',
-             'child_variable': 'assessment'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Condition_Stage',
-             'child_variable': 'summary'},
-        ]
-
 
 class Condition_Evidence(fhirbase):
     """
@@ -339,17 +225,3 @@ class Condition_Evidence(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Condition_Evidence',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Condition_Evidence',
-             'child_variable': 'detail'},
-        ]
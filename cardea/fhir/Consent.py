@@ -141,105 +141,6 @@ class Consent(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'draft', 'proposed', 'active', 'rejected', 'inactive',
-                        'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, proposed, active, rejected, inactive, entered-in-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent',
-             'child_variable': 'sourceAttachment'},
-
-            {'parent_entity': 'Consent_Policy',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent',
-             'child_variable': 'policy'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent',
-             'child_variable': 'securityLabel'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Consent',
-             'child_variable': 'patient'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Consent',
-             'child_variable': 'sourceReference'},
-
-            {'parent_entity': 'Consent_Data',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent',
-             'child_variable': 'data'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'Consent_Actor',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent',
-             'child_variable': 'actor'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Consent',
-             'child_variable': 'organization'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Consent',
-             'child_variable': 'consentingParty'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent',
-             'child_variable': 'dataPeriod'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent',
-             'child_variable': 'sourceIdentifier'},
-
-            {'parent_entity': 'Consent_Except',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent',
-             'child_variable': '_except'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent',
-             'child_variable': 'action'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent',
-             'child_variable': 'purpose'},
-        ]
-
 
 class Consent_Actor(fhirbase):
     """
@@ -271,20 +172,6 @@ class Consent_Actor(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent_Actor',
-             'child_variable': 'role'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Consent_Actor',
-             'child_variable': 'reference'},
-        ]
-
 
 class Consent_Policy(fhirbase):
     """
@@ -349,24 +236,6 @@ class Consent_Data(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.meaning is not None:
-            for value in self.meaning:
-                if value is not None and value.lower() not in [
-                        'instance', 'related', 'dependents', 'authoredby']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'instance, related, dependents, authoredby'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Consent_Data',
-             'child_variable': 'reference'},
-        ]
-
 
 class Consent_Except(fhirbase):
     """
@@ -448,64 +317,6 @@ class Consent_Except(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'deny', 'permit']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'deny, permit'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent_Except',
-             'child_variable': 'purpose'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent_Except',
-             'child_variable': 'securityLabel'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent_Except',
-             'child_variable': 'dataPeriod'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent_Except',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'Consent_Data1',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent_Except',
-             'child_variable': 'data'},
-
-            {'parent_entity': 'Consent_Actor1',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent_Except',
-             'child_variable': 'actor'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent_Except',
-             'child_variable': 'action'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent_Except',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent_Except',
-             'child_variable': '_class'},
-        ]
-
 
 class Consent_Actor1(fhirbase):
     """
@@ -537,20 +348,6 @@ class Consent_Actor1(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Consent_Actor1',
-             'child_variable': 'reference'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Consent_Actor1',
-             'child_variable': 'role'},
-        ]
-
 
 class Consent_Data1(fhirbase):
     """
@@ -582,21 +379,3 @@ class Consent_Data1(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.meaning is not None:
-            for value in self.meaning:
-                if value is not None and value.lower() not in [
-                        'instance', 'related', 'dependents', 'authoredby']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'instance, related, dependents, authoredby'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Consent_Data1',
-             'child_variable': 'reference'},
-        ]
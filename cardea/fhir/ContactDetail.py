@@ -26,12 +26,3 @@ class ContactDetail(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'ContactDetail',
-             'child_variable': 'telecom'},
-        ]
@@ -44,28 +44,3 @@ class ContactPoint(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.system is not None:
-            for value in self.system:
-                if value is not None and value.lower() not in [
-                        'phone', 'fax', 'email', 'pager', 'url', 'sms', 'other']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'phone, fax, email, pager, url, sms, other'))
-
-        if self.use is not None:
-            for value in self.use:
-                if value is not None and value.lower() not in [
-                        'home', 'work', 'temp', 'old', 'mobile']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'home, work, temp, old, mobile'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'ContactPoint',
-             'child_variable': 'period'},
-        ]
@@ -168,120 +168,6 @@ class Contract(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Contract_Term',
-             'parent_variable': 'identifier',
-             'child_entity': 'Contract',
-             'child_variable': 'term'},
-
-            {'parent_entity': 'Contract_Friendly',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract',
-             'child_variable': 'friendly'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract',
-             'child_variable': 'actionReason'},
-
-            {'parent_entity': 'Contract_Rule',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract',
-             'child_variable': 'rule'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract',
-             'child_variable': 'decisionType'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract',
-             'child_variable': 'action'},
-
-            {'parent_entity': 'Contract_Agent',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract',
-             'child_variable': 'agent'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Contract',
-             'child_variable': 'authority'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Contract',
-             'child_variable': 'topic'},
-
-            {'parent_entity': 'Contract_ValuedItem',
-             'parent_variable': 'identifier',
-             'child_entity': 'Contract',
-             'child_variable': 'valuedItem'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract',
-             'child_variable': 'contentDerivative'},
-
-            {'parent_entity': 'Contract_Signer',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract',
-             'child_variable': 'signer'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Contract',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Contract',
-             'child_variable': 'bindingReference'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract',
-             'child_variable': 'applies'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract',
-             'child_variable': 'subType'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract',
-             'child_variable': 'securityLabel'},
-
-            {'parent_entity': 'Contract_Legal',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract',
-             'child_variable': 'legal'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Contract',
-             'child_variable': 'domain'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract',
-             'child_variable': 'bindingAttachment'},
-        ]
-
 
 class Contract_Agent(fhirbase):
     """
@@ -309,20 +195,6 @@ class Contract_Agent(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Contract_Agent',
-             'child_variable': 'actor'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_Agent',
-             'child_variable': 'role'},
-        ]
-
 
 class Contract_Signer(fhirbase):
     """
@@ -354,25 +226,6 @@ class Contract_Signer(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_Signer',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Contract_Signer',
-             'child_variable': 'party'},
-
-            {'parent_entity': 'Signature',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_Signer',
-             'child_variable': 'signature'},
-        ]
-
 
 class Contract_ValuedItem(fhirbase):
     """
@@ -439,40 +292,6 @@ class Contract_ValuedItem(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_ValuedItem',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_ValuedItem',
-             'child_variable': 'net'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Contract_ValuedItem',
-             'child_variable': 'entityReference'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_ValuedItem',
-             'child_variable': 'unitPrice'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_ValuedItem',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_ValuedItem',
-             'child_variable': 'entityCodeableConcept'},
-        ]
-
 
 class Contract_Term(fhirbase):
     """
@@ -556,65 +375,6 @@ class Contract_Term(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Contract_Agent1',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_Term',
-             'child_variable': 'agent'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_Term',
-             'child_variable': 'actionReason'},
-
-            {'parent_entity': 'Contract_Term',
-             'parent_variable': 'identifier',
-             'child_entity': 'Contract_Term',
-             'child_variable': 'group'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_Term',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Contract_ValuedItem1',
-             'parent_variable': 'identifier',
-             'child_entity': 'Contract_Term',
-             'child_variable': 'valuedItem'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_Term',
-             'child_variable': 'applies'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_Term',
-             'child_variable': 'securityLabel'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_Term',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_Term',
-             'child_variable': 'subType'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_Term',
-             'child_variable': 'action'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Contract_Term',
-             'child_variable': 'topic'},
-        ]
-
 
 class Contract_Agent1(fhirbase):
     """
@@ -643,20 +403,6 @@ class Contract_Agent1(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Contract_Agent1',
-             'child_variable': 'actor'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_Agent1',
-             'child_variable': 'role'},
-        ]
-
 
 class Contract_ValuedItem1(fhirbase):
     """
@@ -724,40 +470,6 @@ class Contract_ValuedItem1(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_ValuedItem1',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_ValuedItem1',
-             'child_variable': 'entityCodeableConcept'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_ValuedItem1',
-             'child_variable': 'net'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_ValuedItem1',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Contract_ValuedItem1',
-             'child_variable': 'entityReference'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_ValuedItem1',
-             'child_variable': 'unitPrice'},
-        ]
-
 
 class Contract_Friendly(fhirbase):
     """
@@ -788,20 +500,6 @@ class Contract_Friendly(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_Friendly',
-             'child_variable': 'contentAttachment'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Contract_Friendly',
-             'child_variable': 'contentReference'},
-        ]
-
 
 class Contract_Legal(fhirbase):
     """
@@ -828,20 +526,6 @@ class Contract_Legal(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_Legal',
-             'child_variable': 'contentAttachment'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Contract_Legal',
-             'child_variable': 'contentReference'},
-        ]
-
 
 class Contract_Rule(fhirbase):
     """
@@ -869,17 +553,3 @@ class Contract_Rule(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contract_Rule',
-             'child_variable': 'contentAttachment'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Contract_Rule',
-             'child_variable': 'contentReference'},
-        ]
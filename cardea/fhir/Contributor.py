@@ -34,21 +34,3 @@ class Contributor(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'author', 'editor', 'reviewer', 'endorser']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'author, editor, reviewer, endorser'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'Contributor',
-             'child_variable': 'contact'},
-        ]
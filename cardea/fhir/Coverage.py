@@ -112,60 +112,6 @@ class Coverage(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Coverage',
-             'child_variable': 'beneficiary'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Coverage',
-             'child_variable': 'subscriber'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Coverage',
-             'child_variable': 'policyHolder'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Coverage',
-             'child_variable': 'relationship'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Coverage',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Coverage',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Coverage',
-             'child_variable': 'contract'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Coverage',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Coverage',
-             'child_variable': 'payor'},
-
-            {'parent_entity': 'Coverage_Grouping',
-             'parent_variable': 'object_id',
-             'child_entity': 'Coverage',
-             'child_variable': 'grouping'},
-        ]
-
 
 class Coverage_Grouping(fhirbase):
     """
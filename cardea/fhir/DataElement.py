@@ -129,58 +129,6 @@ class DataElement(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-        if self.stringency is not None:
-            for value in self.stringency:
-                if value is not None and value.lower() not in [
-                    'comparable', 'fully-specified', 'equivalent', 'convertable',
-                        'scaleable', 'flexible']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'comparable, fully-specified, equivalent, convertable, scaleable,'
-                        'flexible'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'DataElement',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'DataElement',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DataElement',
-             'child_variable': 'jurisdiction'},
-
-            {'parent_entity': 'ElementDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'DataElement',
-             'child_variable': 'element'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'DataElement',
-             'child_variable': 'useContext'},
-
-            {'parent_entity': 'DataElement_Mapping',
-             'parent_variable': 'object_id',
-             'child_entity': 'DataElement',
-             'child_variable': 'mapping'},
-        ]
-
 
 class DataElement_Mapping(fhirbase):
     """
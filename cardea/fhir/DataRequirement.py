@@ -53,20 +53,6 @@ class DataRequirement(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'DataRequirement_DateFilter',
-             'parent_variable': 'object_id',
-             'child_entity': 'DataRequirement',
-             'child_variable': 'dateFilter'},
-
-            {'parent_entity': 'DataRequirement_CodeFilter',
-             'parent_variable': 'object_id',
-             'child_entity': 'DataRequirement',
-             'child_variable': 'codeFilter'},
-        ]
-
 
 class DataRequirement_CodeFilter(fhirbase):
     """
@@ -136,25 +122,6 @@ class DataRequirement_CodeFilter(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DataRequirement_CodeFilter',
-             'child_variable': 'valueSetReference'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DataRequirement_CodeFilter',
-             'child_variable': 'valueCodeableConcept'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'DataRequirement_CodeFilter',
-             'child_variable': 'valueCoding'},
-        ]
-
 
 class DataRequirement_DateFilter(fhirbase):
     """
@@ -211,17 +178,3 @@ class DataRequirement_DateFilter(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'DataRequirement_DateFilter',
-             'child_variable': 'valuePeriod'},
-
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'DataRequirement_DateFilter',
-             'child_variable': 'valueDuration'},
-        ]
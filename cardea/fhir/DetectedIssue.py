@@ -82,49 +82,6 @@ class DetectedIssue(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.severity is not None:
-            for value in self.severity:
-                if value is not None and value.lower() not in [
-                        'high', 'moderate', 'low']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'high, moderate, low'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DetectedIssue',
-             'child_variable': 'author'},
-
-            {'parent_entity': 'DetectedIssue_Mitigation',
-             'parent_variable': 'object_id',
-             'child_entity': 'DetectedIssue',
-             'child_variable': 'mitigation'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DetectedIssue',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DetectedIssue',
-             'child_variable': 'patient'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'DetectedIssue',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DetectedIssue',
-             'child_variable': 'implicated'},
-        ]
-
 
 class DetectedIssue_Mitigation(fhirbase):
     """
@@ -159,17 +116,3 @@ class DetectedIssue_Mitigation(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DetectedIssue_Mitigation',
-             'child_variable': 'action'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DetectedIssue_Mitigation',
-             'child_variable': 'author'},
-        ]
@@ -111,64 +111,6 @@ class Device(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'active', 'inactive', 'entered-in-error', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, inactive, entered-in-error, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Device_Udi',
-             'parent_variable': 'object_id',
-             'child_entity': 'Device',
-             'child_variable': 'udi'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Device',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Device',
-             'child_variable': 'safety'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Device',
-             'child_variable': 'owner'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Device',
-             'child_variable': 'location'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Device',
-             'child_variable': 'patient'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'Device',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'Device',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Device',
-             'child_variable': 'identifier'},
-        ]
-
 
 class Device_Udi(fhirbase):
     """
@@ -242,12 +184,3 @@ class Device_Udi(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.entryType is not None:
-            for value in self.entryType:
-                if value is not None and value.lower() not in [
-                        'barcode', 'rfid', 'manual', 'card', 'self-reported', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'barcode, rfid, manual, card, self-reported, unknown'))
@@ -76,61 +76,6 @@ class DeviceComponent(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.measurementPrinciple is not None:
-            for value in self.measurementPrinciple:
-                if value is not None and value.lower() not in [
-                    'other', 'chemical', 'electrical', 'impedance', 'nuclear', 'optical',
-                        'thermal', 'biological', 'mechanical', 'acoustical', 'manual']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'other, chemical, electrical, impedance, nuclear, optical, thermal,'
-                        'biological, mechanical, acoustical, manual'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceComponent',
-             'child_variable': 'languageCode'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceComponent',
-             'child_variable': 'source'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceComponent',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceComponent',
-             'child_variable': 'operationalStatus'},
-
-            {'parent_entity': 'DeviceComponent_ProductionSpecification',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceComponent',
-             'child_variable': 'productionSpecification'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceComponent',
-             'child_variable': 'parameterGroup'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceComponent',
-             'child_variable': 'parent'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceComponent',
-             'child_variable': 'type'},
-        ]
-
 
 class DeviceComponent_ProductionSpecification(fhirbase):
     """
@@ -164,17 +109,3 @@ class DeviceComponent_ProductionSpecification(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceComponent_ProductionSpecification',
-             'child_variable': 'specType'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceComponent_ProductionSpecification',
-             'child_variable': 'componentId'},
-        ]
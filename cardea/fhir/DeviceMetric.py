@@ -98,68 +98,6 @@ class DeviceMetric(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.operationalStatus is not None:
-            for value in self.operationalStatus:
-                if value is not None and value.lower() not in [
-                        'on', 'off', 'standby', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'on, off, standby, entered-in-error'))
-
-        if self.color is not None:
-            for value in self.color:
-                if value is not None and value.lower() not in [
-                        'black', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'black, red, green, yellow, blue, magenta, cyan, white'))
-
-        if self.category is not None:
-            for value in self.category:
-                if value is not None and value.lower() not in [
-                        'measurement', 'setting', 'calculation', 'unspecified']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'measurement, setting, calculation, unspecified'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'DeviceMetric_Calibration',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceMetric',
-             'child_variable': 'calibration'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceMetric',
-             'child_variable': 'unit'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceMetric',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceMetric',
-             'child_variable': 'parent'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceMetric',
-             'child_variable': 'measurementPeriod'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceMetric',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceMetric',
-             'child_variable': 'source'},
-        ]
-
 
 class DeviceMetric_Calibration(fhirbase):
     """
@@ -193,19 +131,3 @@ class DeviceMetric_Calibration(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'unspecified', 'offset', 'gain', 'two-point']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'unspecified, offset, gain, two-point'))
-
-        if self.state is not None:
-            for value in self.state:
-                if value is not None and value.lower() not in [
-                        'not-calibrated', 'calibration-required', 'calibrated', 'unspecified']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'not-calibrated, calibration-required, calibrated, unspecified'))
@@ -154,110 +154,6 @@ class DeviceRequest(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'performerType'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'definition'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'codeCodeableConcept'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'groupIdentifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'intent'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'reasonReference'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'priorRequest'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'occurrenceTiming'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'basedOn'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'occurrencePeriod'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'relevantHistory'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'reasonCode'},
-
-            {'parent_entity': 'DeviceRequest_Requester',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'requester'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'codeReference'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'supportingInfo'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceRequest',
-             'child_variable': 'performer'},
-        ]
-
 
 class DeviceRequest_Requester(fhirbase):
     """
@@ -285,17 +181,3 @@ class DeviceRequest_Requester(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceRequest_Requester',
-             'child_variable': 'onBehalfOf'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceRequest_Requester',
-             'child_variable': 'agent'},
-        ]
@@ -83,67 +83,3 @@ class DeviceUseStatement(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'active', 'completed', 'entered-in-error', 'intended', 'stopped',
-                        'on-hold']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, completed, entered-in-error, intended, stopped, on-hold'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceUseStatement',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceUseStatement',
-             'child_variable': 'timingPeriod'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceUseStatement',
-             'child_variable': 'source'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceUseStatement',
-             'child_variable': 'indication'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceUseStatement',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceUseStatement',
-             'child_variable': 'whenUsed'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DeviceUseStatement',
-             'child_variable': 'device'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceUseStatement',
-             'child_variable': 'bodySite'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceUseStatement',
-             'child_variable': 'timingTiming'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'DeviceUseStatement',
-             'child_variable': 'identifier'},
-        ]
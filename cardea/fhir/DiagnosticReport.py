@@ -138,91 +138,6 @@ class DiagnosticReport(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'registered', 'partial', 'preliminary', 'final', 'amended',
-                        'corrected', 'appended', 'cancelled', 'entered-in-error', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'registered, partial, preliminary, final, amended, corrected, '
-                        'appended, cancelled, entered-in-error, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DiagnosticReport',
-             'child_variable': 'imagingStudy'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DiagnosticReport',
-             'child_variable': 'basedOn'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DiagnosticReport',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DiagnosticReport',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DiagnosticReport',
-             'child_variable': 'codedDiagnosis'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DiagnosticReport',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DiagnosticReport',
-             'child_variable': 'result'},
-
-            {'parent_entity': 'DiagnosticReport_Performer',
-             'parent_variable': 'object_id',
-             'child_entity': 'DiagnosticReport',
-             'child_variable': 'performer'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'DiagnosticReport',
-             'child_variable': 'presentedForm'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'DiagnosticReport',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'DiagnosticReport_Image',
-             'parent_variable': 'object_id',
-             'child_entity': 'DiagnosticReport',
-             'child_variable': 'image'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'DiagnosticReport',
-             'child_variable': 'effectivePeriod'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DiagnosticReport',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DiagnosticReport',
-             'child_variable': 'specimen'},
-        ]
-
 
 class DiagnosticReport_Performer(fhirbase):
     """
@@ -256,20 +171,6 @@ class DiagnosticReport_Performer(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DiagnosticReport_Performer',
-             'child_variable': 'actor'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DiagnosticReport_Performer',
-             'child_variable': 'role'},
-        ]
-
 
 class DiagnosticReport_Image(fhirbase):
     """
@@ -301,12 +202,3 @@ class DiagnosticReport_Image(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DiagnosticReport_Image',
-             'child_variable': 'link'},
-        ]
@@ -93,59 +93,6 @@ class DocumentManifest(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'current', 'superseded', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'current, superseded, entered-in-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentManifest',
-             'child_variable': 'masterIdentifier'},
-
-            {'parent_entity': 'DocumentManifest_Related',
-             'parent_variable': 'identifier',
-             'child_entity': 'DocumentManifest',
-             'child_variable': 'related'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentManifest',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DocumentManifest',
-             'child_variable': 'recipient'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentManifest',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DocumentManifest',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DocumentManifest',
-             'child_variable': 'author'},
-
-            {'parent_entity': 'DocumentManifest_Content',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentManifest',
-             'child_variable': 'content'},
-        ]
-
 
 class DocumentManifest_Content(fhirbase):
     """
@@ -178,20 +125,6 @@ class DocumentManifest_Content(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentManifest_Content',
-             'child_variable': 'pAttachment'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DocumentManifest_Content',
-             'child_variable': 'pReference'},
-        ]
-
 
 class DocumentManifest_Related(fhirbase):
     """
@@ -216,17 +149,3 @@ class DocumentManifest_Related(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DocumentManifest_Related',
-             'child_variable': 'ref'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentManifest_Related',
-             'child_variable': 'identifier'},
-        ]
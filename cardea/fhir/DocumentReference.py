@@ -116,79 +116,6 @@ class DocumentReference(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'current', 'superseded', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'current, superseded, entered-in-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DocumentReference',
-             'child_variable': 'custodian'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentReference',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'DocumentReference_RelatesTo',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentReference',
-             'child_variable': 'relatesTo'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DocumentReference',
-             'child_variable': 'author'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DocumentReference',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentReference',
-             'child_variable': '_class'},
-
-            {'parent_entity': 'DocumentReference_Content',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentReference',
-             'child_variable': 'content'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DocumentReference',
-             'child_variable': 'authenticator'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentReference',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentReference',
-             'child_variable': 'securityLabel'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentReference',
-             'child_variable': 'masterIdentifier'},
-
-            {'parent_entity': 'DocumentReference_Context',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentReference',
-             'child_variable': 'context'},
-        ]
-
 
 class DocumentReference_RelatesTo(fhirbase):
     """
@@ -217,24 +144,6 @@ class DocumentReference_RelatesTo(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.code is not None:
-            for value in self.code:
-                if value is not None and value.lower() not in [
-                        'replaces', 'transforms', 'signs', 'appends']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'replaces, transforms, signs, appends'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DocumentReference_RelatesTo',
-             'child_variable': 'target'},
-        ]
-
 
 class DocumentReference_Content(fhirbase):
     """
@@ -263,20 +172,6 @@ class DocumentReference_Content(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentReference_Content',
-             'child_variable': 'format'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentReference_Content',
-             'child_variable': 'attachment'},
-        ]
-
 
 class DocumentReference_Context(fhirbase):
     """
@@ -334,45 +229,6 @@ class DocumentReference_Context(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DocumentReference_Context',
-             'child_variable': 'encounter'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentReference_Context',
-             'child_variable': 'facilityType'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentReference_Context',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentReference_Context',
-             'child_variable': 'event'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DocumentReference_Context',
-             'child_variable': 'sourcePatientInfo'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentReference_Context',
-             'child_variable': 'practiceSetting'},
-
-            {'parent_entity': 'DocumentReference_Related',
-             'parent_variable': 'identifier',
-             'child_entity': 'DocumentReference_Context',
-             'child_variable': 'related'},
-        ]
-
 
 class DocumentReference_Related(fhirbase):
     """
@@ -396,17 +252,3 @@ class DocumentReference_Related(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'DocumentReference_Related',
-             'child_variable': 'ref'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'DocumentReference_Related',
-             'child_variable': 'identifier'},
-        ]
@@ -60,27 +60,3 @@ class DomainResource(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Extension',
-             'parent_variable': 'object_id',
-             'child_entity': 'DomainResource',
-             'child_variable': 'extension'},
-
-            {'parent_entity': 'ResourceList',
-             'parent_variable': 'object_id',
-             'child_entity': 'DomainResource',
-             'child_variable': 'contained'},
-
-            {'parent_entity': 'Narrative',
-             'parent_variable': 'object_id',
-             'child_entity': 'DomainResource',
-             'child_variable': 'text'},
-
-            {'parent_entity': 'Extension',
-             'parent_variable': 'object_id',
-             'child_entity': 'DomainResource',
-             'child_variable': 'modifierExtension'},
-        ]
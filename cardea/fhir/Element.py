@@ -30,12 +30,3 @@ class Element(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Extension',
-             'parent_variable': 'object_id',
-             'child_entity': 'Element',
-             'child_variable': 'extension'},
-        ]
@@ -1510,609 +1510,6 @@ class ElementDefinition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.representation is not None:
-            for value in self.representation:
-                if value is not None and value.lower() not in [
-                        'xmlattr', 'xmltext', 'typeattr', 'cdatext', 'xhtml']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'xmlAttr, xmlText, typeAttr, cdaText, xhtml'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedMoney'},
-
-            {'parent_entity': 'ElementDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueElementDefinition'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedReference'},
-
-            {'parent_entity': 'Narrative',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternNarrative'},
-
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueDuration'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueTiming'},
-
-            {'parent_entity': 'RelatedArtifact',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedRelatedArtifact'},
-
-            {'parent_entity': 'TriggerDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueTriggerDefinition'},
-
-            {'parent_entity': 'Age',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedAge'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueAttachment'},
-
-            {'parent_entity': 'Extension',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternExtension'},
-
-            {'parent_entity': 'ElementDefinition_Type',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedSimpleQuantity'},
-
-            {'parent_entity': 'Narrative',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueNarrative'},
-
-            {'parent_entity': 'Element',
-             'parent_variable': 'id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueElement'},
-
-            {'parent_entity': 'Count',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueCount'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternPeriod'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternIdentifier'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueUsageContext'},
-
-            {'parent_entity': 'Ratio',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternRatio'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternAttachment'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedAnnotation'},
-
-            {'parent_entity': 'ElementDefinition_Constraint',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'constraint'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueCodeableConcept'},
-
-            {'parent_entity': 'Count',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedCount'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternCodeableConcept'},
-
-            {'parent_entity': 'HumanName',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternHumanName'},
-
-            {'parent_entity': 'DataRequirement',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueDataRequirement'},
-
-            {'parent_entity': 'ElementDefinition_Slicing',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'slicing'},
-
-            {'parent_entity': 'Count',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternCount'},
-
-            {'parent_entity': 'HumanName',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueHumanName'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueSimpleQuantity'},
-
-            {'parent_entity': 'Age',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternAge'},
-
-            {'parent_entity': 'Dosage',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternDosage'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedUsageContext'},
-
-            {'parent_entity': 'Contributor',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternContributor'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueContactDetail'},
-
-            {'parent_entity': 'RelatedArtifact',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternRelatedArtifact'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueCoding'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueQuantity'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedIdentifier'},
-
-            {'parent_entity': 'ElementDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternElementDefinition'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedCodeableConcept'},
-
-            {'parent_entity': 'DataRequirement',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedDataRequirement'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedQuantity'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternTiming'},
-
-            {'parent_entity': 'ElementDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedElementDefinition'},
-
-            {'parent_entity': 'Dosage',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedDosage'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueRange'},
-
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternDuration'},
-
-            {'parent_entity': 'ElementDefinition_Binding',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'binding'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternContactDetail'},
-
-            {'parent_entity': 'DataRequirement',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternDataRequirement'},
-
-            {'parent_entity': 'Distance',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternDistance'},
-
-            {'parent_entity': 'Extension',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueExtension'},
-
-            {'parent_entity': 'Meta',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueMeta'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedPeriod'},
-
-            {'parent_entity': 'BackboneElement',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternBackboneElement'},
-
-            {'parent_entity': 'ElementDefinition_Base',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'base'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternRange'},
-
-            {'parent_entity': 'Element',
-             'parent_variable': 'id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternElement'},
-
-            {'parent_entity': 'Contributor',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedContributor'},
-
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternAddress'},
-
-            {'parent_entity': 'SampledData',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueSampledData'},
-
-            {'parent_entity': 'Element',
-             'parent_variable': 'id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedElement'},
-
-            {'parent_entity': 'ParameterDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternParameterDefinition'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternAnnotation'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedRange'},
-
-            {'parent_entity': 'TriggerDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternTriggerDefinition'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternMoney'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Extension',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedExtension'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternReference'},
-
-            {'parent_entity': 'BackboneElement',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedBackboneElement'},
-
-            {'parent_entity': 'Dosage',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueDosage'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueReference'},
-
-            {'parent_entity': 'RelatedArtifact',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueRelatedArtifact'},
-
-            {'parent_entity': 'Meta',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedMeta'},
-
-            {'parent_entity': 'SampledData',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedSampledData'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternContactPoint'},
-
-            {'parent_entity': 'Meta',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternMeta'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternUsageContext'},
-
-            {'parent_entity': 'Signature',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedSignature'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternCoding'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueMoney'},
-
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedDuration'},
-
-            {'parent_entity': 'Narrative',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedNarrative'},
-
-            {'parent_entity': 'Distance',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedDistance'},
-
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueAddress'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueContactPoint'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'minValueQuantity'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedContactPoint'},
-
-            {'parent_entity': 'Signature',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternSignature'},
-
-            {'parent_entity': 'Ratio',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueRatio'},
-
-            {'parent_entity': 'ParameterDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedParameterDefinition'},
-
-            {'parent_entity': 'Age',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueAge'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedTiming'},
-
-            {'parent_entity': 'Contributor',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueContributor'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedCoding'},
-
-            {'parent_entity': 'Ratio',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedRatio'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'maxValueQuantity'},
-
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedAddress'},
-
-            {'parent_entity': 'ElementDefinition_Example',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'example'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValuePeriod'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedAttachment'},
-
-            {'parent_entity': 'BackboneElement',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueBackboneElement'},
-
-            {'parent_entity': 'HumanName',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedHumanName'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueAnnotation'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueIdentifier'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternSimpleQuantity'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternQuantity'},
-
-            {'parent_entity': 'Signature',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueSignature'},
-
-            {'parent_entity': 'SampledData',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'patternSampledData'},
-
-            {'parent_entity': 'Distance',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueDistance'},
-
-            {'parent_entity': 'ParameterDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'defaultValueParameterDefinition'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedContactDetail'},
-
-            {'parent_entity': 'TriggerDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'fixedTriggerDefinition'},
-
-            {'parent_entity': 'ElementDefinition_Mapping',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition',
-             'child_variable': 'mapping'},
-        ]
-
 
 class ElementDefinition_Slicing(fhirbase):
     """
@@ -2161,24 +1558,6 @@ class ElementDefinition_Slicing(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.rules is not None:
-            for value in self.rules:
-                if value is not None and value.lower() not in [
-                        'closed', 'open', 'openatend']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'closed, open, openAtEnd'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ElementDefinition_Discriminator',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Slicing',
-             'child_variable': 'discriminator'},
-        ]
-
 
 class ElementDefinition_Discriminator(fhirbase):
     """
@@ -2209,15 +1588,6 @@ class ElementDefinition_Discriminator(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'value', 'exists', 'pattern', 'type', 'profile']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'value, exists, pattern, type, profile'))
-
 
 class ElementDefinition_Base(fhirbase):
     """
@@ -2311,22 +1681,6 @@ class ElementDefinition_Type(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.aggregation is not None:
-            for value in self.aggregation:
-                if value is not None and value.lower() not in [
-                        'contained', 'referenced', 'bundled']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'contained, referenced, bundled'))
-
-        if self.versioning is not None:
-            for value in self.versioning:
-                if value is not None and value.lower() not in [
-                        'either', 'independent', 'specific']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'either, independent, specific'))
-
 
 class ElementDefinition_Example(fhirbase):
     """
@@ -2614,185 +1968,6 @@ class ElementDefinition_Example(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueAddress'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueCodeableConcept'},
-
-            {'parent_entity': 'ParameterDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueParameterDefinition'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueIdentifier'},
-
-            {'parent_entity': 'Distance',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueDistance'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valuePeriod'},
-
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueDuration'},
-
-            {'parent_entity': 'Signature',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueSignature'},
-
-            {'parent_entity': 'BackboneElement',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueBackboneElement'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueRange'},
-
-            {'parent_entity': 'Dosage',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueDosage'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueQuantity'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueMoney'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueSimpleQuantity'},
-
-            {'parent_entity': 'DataRequirement',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueDataRequirement'},
-
-            {'parent_entity': 'HumanName',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueHumanName'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueUsageContext'},
-
-            {'parent_entity': 'Contributor',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueContributor'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueAnnotation'},
-
-            {'parent_entity': 'SampledData',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueSampledData'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueContactPoint'},
-
-            {'parent_entity': 'Narrative',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueNarrative'},
-
-            {'parent_entity': 'Meta',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueMeta'},
-
-            {'parent_entity': 'RelatedArtifact',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueRelatedArtifact'},
-
-            {'parent_entity': 'TriggerDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueTriggerDefinition'},
-
-            {'parent_entity': 'Age',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueAge'},
-
-            {'parent_entity': 'Count',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueCount'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueContactDetail'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueReference'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueTiming'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueAttachment'},
-
-            {'parent_entity': 'Ratio',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueRatio'},
-
-            {'parent_entity': 'Element',
-             'parent_variable': 'id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueElement'},
-
-            {'parent_entity': 'Extension',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueExtension'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'ElementDefinition_Example',
-             'child_variable': 'valueCoding'},
-        ]
-
 
 class ElementDefinition_Constraint(fhirbase):
     """
@@ -2849,15 +2024,6 @@ class ElementDefinition_Constraint(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.severity is not None:
-            for value in self.severity:
-                if value is not None and value.lower() not in [
-                        'error', 'warning']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'error, warning'))
-
 
 class ElementDefinition_Binding(fhirbase):
     """
@@ -2909,24 +2075,6 @@ class ElementDefinition_Binding(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.strength is not None:
-            for value in self.strength:
-                if value is not None and value.lower() not in [
-                        'required', 'extensible', 'preferred', 'example']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'required, extensible, preferred, example'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ElementDefinition_Binding',
-             'child_variable': 'valueSetReference'},
-        ]
-
 
 class ElementDefinition_Mapping(fhirbase):
     """
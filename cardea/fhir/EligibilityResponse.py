@@ -83,55 +83,6 @@ class EligibilityResponse(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'EligibilityResponse',
-             'child_variable': 'requestOrganization'},
-
-            {'parent_entity': 'EligibilityResponse_Insurance',
-             'parent_variable': 'object_id',
-             'child_entity': 'EligibilityResponse',
-             'child_variable': 'insurance'},
-
-            {'parent_entity': 'EligibilityResponse_Error',
-             'parent_variable': 'object_id',
-             'child_entity': 'EligibilityResponse',
-             'child_variable': 'error'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'EligibilityResponse',
-             'child_variable': 'insurer'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'EligibilityResponse',
-             'child_variable': 'requestProvider'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'EligibilityResponse',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'EligibilityResponse',
-             'child_variable': 'outcome'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'EligibilityResponse',
-             'child_variable': 'form'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'EligibilityResponse',
-             'child_variable': 'request'},
-        ]
-
 
 class EligibilityResponse_Insurance(fhirbase):
     """
@@ -164,25 +115,6 @@ class EligibilityResponse_Insurance(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'EligibilityResponse_Insurance',
-             'child_variable': 'coverage'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'EligibilityResponse_Insurance',
-             'child_variable': 'contract'},
-
-            {'parent_entity': 'EligibilityResponse_BenefitBalance',
-             'parent_variable': 'object_id',
-             'child_entity': 'EligibilityResponse_Insurance',
-             'child_variable': 'benefitBalance'},
-        ]
-
 
 class EligibilityResponse_BenefitBalance(fhirbase):
     """
@@ -245,40 +177,6 @@ class EligibilityResponse_BenefitBalance(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'EligibilityResponse_BenefitBalance',
-             'child_variable': 'unit'},
-
-            {'parent_entity': 'EligibilityResponse_Financial',
-             'parent_variable': 'object_id',
-             'child_entity': 'EligibilityResponse_BenefitBalance',
-             'child_variable': 'financial'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'EligibilityResponse_BenefitBalance',
-             'child_variable': 'network'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'EligibilityResponse_BenefitBalance',
-             'child_variable': 'subCategory'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'EligibilityResponse_BenefitBalance',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'EligibilityResponse_BenefitBalance',
-             'child_variable': 'term'},
-        ]
-
 
 class EligibilityResponse_Financial(fhirbase):
     """
@@ -321,25 +219,6 @@ class EligibilityResponse_Financial(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'EligibilityResponse_Financial',
-             'child_variable': 'usedMoney'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'EligibilityResponse_Financial',
-             'child_variable': 'allowedMoney'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'EligibilityResponse_Financial',
-             'child_variable': 'type'},
-        ]
-
 
 class EligibilityResponse_Error(fhirbase):
     """
@@ -362,12 +241,3 @@ class EligibilityResponse_Error(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'EligibilityResponse_Error',
-             'child_variable': 'code'},
-        ]
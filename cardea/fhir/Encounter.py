@@ -148,121 +148,6 @@ class Encounter(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'planned', 'arrived', 'triaged', 'in-progress', 'onleave', 'finished',
-                        'cancelled', 'entered-in-error', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'planned, arrived, triaged, in-progress, onleave, finished, '
-                        'cancelled, entered-in-error, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Encounter',
-             'child_variable': 'incomingReferral'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Encounter',
-             'child_variable': 'episodeOfCare'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter',
-             'child_variable': '_class'},
-
-            {'parent_entity': 'Encounter_ClassHistory',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter',
-             'child_variable': 'classHistory'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Encounter',
-             'child_variable': 'partOf'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter',
-             'child_variable': 'reason'},
-
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter',
-             'child_variable': 'length'},
-
-            {'parent_entity': 'Encounter_StatusHistory',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter',
-             'child_variable': 'statusHistory'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Encounter_Location',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter',
-             'child_variable': 'location'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Encounter',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Encounter_Hospitalization',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter',
-             'child_variable': 'hospitalization'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter',
-             'child_variable': 'priority'},
-
-            {'parent_entity': 'Encounter_Participant',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter',
-             'child_variable': 'participant'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Encounter',
-             'child_variable': 'serviceProvider'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Encounter',
-             'child_variable': 'account'},
-
-            {'parent_entity': 'Encounter_Diagnosis',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter',
-             'child_variable': 'diagnosis'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Encounter',
-             'child_variable': 'appointment'},
-        ]
-
 
 class Encounter_StatusHistory(fhirbase):
     """
@@ -294,26 +179,6 @@ class Encounter_StatusHistory(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'planned', 'arrived', 'triaged', 'in-progress', 'onleave', 'finished',
-                        'cancelled', 'entered-in-error', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'planned, arrived, triaged, in-progress, onleave, finished, '
-                        'cancelled, entered-in-error, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter_StatusHistory',
-             'child_variable': 'period'},
-        ]
-
 
 class Encounter_ClassHistory(fhirbase):
     """
@@ -341,20 +206,6 @@ class Encounter_ClassHistory(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter_ClassHistory',
-             'child_variable': '_class'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter_ClassHistory',
-             'child_variable': 'period'},
-        ]
-
 
 class Encounter_Participant(fhirbase):
     """
@@ -389,25 +240,6 @@ class Encounter_Participant(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter_Participant',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Encounter_Participant',
-             'child_variable': 'individual'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter_Participant',
-             'child_variable': 'period'},
-        ]
-
 
 class Encounter_Diagnosis(fhirbase):
     """
@@ -444,20 +276,6 @@ class Encounter_Diagnosis(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Encounter_Diagnosis',
-             'child_variable': 'condition'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter_Diagnosis',
-             'child_variable': 'role'},
-        ]
-
 
 class Encounter_Hospitalization(fhirbase):
     """
@@ -520,55 +338,6 @@ class Encounter_Hospitalization(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter_Hospitalization',
-             'child_variable': 'admitSource'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter_Hospitalization',
-             'child_variable': 'preAdmissionIdentifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter_Hospitalization',
-             'child_variable': 'specialCourtesy'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter_Hospitalization',
-             'child_variable': 'specialArrangement'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter_Hospitalization',
-             'child_variable': 'reAdmission'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Encounter_Hospitalization',
-             'child_variable': 'destination'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter_Hospitalization',
-             'child_variable': 'dietPreference'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter_Hospitalization',
-             'child_variable': 'dischargeDisposition'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Encounter_Hospitalization',
-             'child_variable': 'origin'},
-        ]
-
 
 class Encounter_Location(fhirbase):
     """
@@ -604,26 +373,3 @@ class Encounter_Location(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'planned', 'active', 'reserved', 'completed']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'planned, active, reserved, completed'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Encounter_Location',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Encounter_Location',
-             'child_variable': 'location'},
-        ]
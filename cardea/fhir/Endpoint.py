@@ -84,46 +84,3 @@ class Endpoint(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'active', 'suspended', 'error', 'off', 'entered-in-error', 'test']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, suspended, error, off, entered-in-error, test'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Endpoint',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Endpoint',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Endpoint',
-             'child_variable': 'payloadType'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Endpoint',
-             'child_variable': 'managingOrganization'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'Endpoint',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Endpoint',
-             'child_variable': 'connectionType'},
-        ]
@@ -90,76 +90,6 @@ class EpisodeOfCare(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'planned', 'waitlist', 'active', 'onhold', 'finished', 'cancelled',
-                        'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'planned, waitlist, active, onhold, finished, cancelled,'
-                        'entered-in-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'EpisodeOfCare_StatusHistory',
-             'parent_variable': 'object_id',
-             'child_entity': 'EpisodeOfCare',
-             'child_variable': 'statusHistory'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'EpisodeOfCare',
-             'child_variable': 'managingOrganization'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'EpisodeOfCare',
-             'child_variable': 'account'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'EpisodeOfCare',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'EpisodeOfCare',
-             'child_variable': 'patient'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'EpisodeOfCare',
-             'child_variable': 'team'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'EpisodeOfCare',
-             'child_variable': 'referralRequest'},
-
-            {'parent_entity': 'EpisodeOfCare_Diagnosis',
-             'parent_variable': 'object_id',
-             'child_entity': 'EpisodeOfCare',
-             'child_variable': 'diagnosis'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'EpisodeOfCare',
-             'child_variable': 'careManager'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'EpisodeOfCare',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'EpisodeOfCare',
-             'child_variable': 'type'},
-        ]
-
 
 class EpisodeOfCare_StatusHistory(fhirbase):
     """
@@ -192,26 +122,6 @@ class EpisodeOfCare_StatusHistory(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'planned', 'waitlist', 'active', 'onhold', 'finished', 'cancelled',
-                        'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'planned, waitlist, active, onhold, finished, cancelled,'
-                        'entered-in-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'EpisodeOfCare_StatusHistory',
-             'child_variable': 'period'},
-        ]
-
 
 class EpisodeOfCare_Diagnosis(fhirbase):
     """
@@ -245,17 +155,3 @@ class EpisodeOfCare_Diagnosis(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'EpisodeOfCare_Diagnosis',
-             'child_variable': 'condition'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'EpisodeOfCare_Diagnosis',
-             'child_variable': 'role'},
-        ]
@@ -162,54 +162,6 @@ class ExpansionProfile(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ExpansionProfile_FixedVersion',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExpansionProfile',
-             'child_variable': 'fixedVersion'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExpansionProfile',
-             'child_variable': 'useContext'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExpansionProfile',
-             'child_variable': 'jurisdiction'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExpansionProfile',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExpansionProfile',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'ExpansionProfile_Designation',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExpansionProfile',
-             'child_variable': 'designation'},
-
-            {'parent_entity': 'ExpansionProfile_ExcludedSystem',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExpansionProfile',
-             'child_variable': 'excludedSystem'},
-        ]
-
 
 class ExpansionProfile_FixedVersion(fhirbase):
     """
@@ -244,15 +196,6 @@ class ExpansionProfile_FixedVersion(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'default', 'check', 'override']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'default, check, override'))
-
 
 class ExpansionProfile_ExcludedSystem(fhirbase):
     """
@@ -304,20 +247,6 @@ class ExpansionProfile_Designation(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ExpansionProfile_Include',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExpansionProfile_Designation',
-             'child_variable': 'include'},
-
-            {'parent_entity': 'ExpansionProfile_Exclude',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExpansionProfile_Designation',
-             'child_variable': 'exclude'},
-        ]
-
 
 class ExpansionProfile_Include(fhirbase):
     """
@@ -340,15 +269,6 @@ class ExpansionProfile_Include(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ExpansionProfile_Designation1',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExpansionProfile_Include',
-             'child_variable': 'designation'},
-        ]
-
 
 class ExpansionProfile_Designation1(fhirbase):
     """
@@ -374,15 +294,6 @@ class ExpansionProfile_Designation1(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExpansionProfile_Designation1',
-             'child_variable': 'use'},
-        ]
-
 
 class ExpansionProfile_Exclude(fhirbase):
     """
@@ -405,15 +316,6 @@ class ExpansionProfile_Exclude(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ExpansionProfile_Designation2',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExpansionProfile_Exclude',
-             'child_variable': 'designation'},
-        ]
-
 
 class ExpansionProfile_Designation2(fhirbase):
     """
@@ -438,12 +340,3 @@ class ExpansionProfile_Designation2(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExpansionProfile_Designation2',
-             'child_variable': 'use'},
-        ]
@@ -220,194 +220,6 @@ class ExplanationOfBenefit(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'active', 'cancelled', 'draft', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, cancelled, draft, entered-in-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ExplanationOfBenefit_BenefitBalance',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'benefitBalance'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'prescription'},
-
-            {'parent_entity': 'ExplanationOfBenefit_AddItem',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'addItem'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'claimResponse'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'totalCost'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'unallocDeductable'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'provider'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'originalPrescription'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'subType'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'claim'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'totalBenefit'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'form'},
-
-            {'parent_entity': 'ExplanationOfBenefit_Procedure',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'procedure'},
-
-            {'parent_entity': 'ExplanationOfBenefit_Related',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'related'},
-
-            {'parent_entity': 'ExplanationOfBenefit_Insurance',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'insurance'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'patient'},
-
-            {'parent_entity': 'ExplanationOfBenefit_Information',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'information'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'hospitalization'},
-
-            {'parent_entity': 'ExplanationOfBenefit_Accident',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'accident'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'billablePeriod'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'referral'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'organization'},
-
-            {'parent_entity': 'ExplanationOfBenefit_ProcessNote',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'processNote'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'outcome'},
-
-            {'parent_entity': 'ExplanationOfBenefit_Item',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'item'},
-
-            {'parent_entity': 'ExplanationOfBenefit_Diagnosis',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'diagnosis'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'ExplanationOfBenefit_Payee',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'payee'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'insurer'},
-
-            {'parent_entity': 'ExplanationOfBenefit_Payment',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'payment'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'enterer'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'facility'},
-
-            {'parent_entity': 'ExplanationOfBenefit_CareTeam',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'careTeam'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit',
-             'child_variable': 'employmentImpacted'},
-        ]
-
 
 class ExplanationOfBenefit_Related(fhirbase):
     """
@@ -442,25 +254,6 @@ class ExplanationOfBenefit_Related(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Related',
-             'child_variable': 'reference'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit_Related',
-             'child_variable': 'claim'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Related',
-             'child_variable': 'relationship'},
-        ]
-
 
 class ExplanationOfBenefit_Payee(fhirbase):
     """
@@ -492,25 +285,6 @@ class ExplanationOfBenefit_Payee(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Payee',
-             'child_variable': 'resourceType'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit_Payee',
-             'child_variable': 'party'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Payee',
-             'child_variable': 'type'},
-        ]
-
 
 class ExplanationOfBenefit_Information(fhirbase):
     """
@@ -585,45 +359,6 @@ class ExplanationOfBenefit_Information(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit_Information',
-             'child_variable': 'valueReference'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Information',
-             'child_variable': 'valueAttachment'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Information',
-             'child_variable': 'valueQuantity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Information',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Information',
-             'child_variable': 'reason'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Information',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Information',
-             'child_variable': 'timingPeriod'},
-        ]
-
 
 class ExplanationOfBenefit_CareTeam(fhirbase):
     """
@@ -666,25 +401,6 @@ class ExplanationOfBenefit_CareTeam(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit_CareTeam',
-             'child_variable': 'provider'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_CareTeam',
-             'child_variable': 'role'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_CareTeam',
-             'child_variable': 'qualification'},
-        ]
-
 
 class ExplanationOfBenefit_Diagnosis(fhirbase):
     """
@@ -727,30 +443,6 @@ class ExplanationOfBenefit_Diagnosis(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Diagnosis',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit_Diagnosis',
-             'child_variable': 'diagnosisReference'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Diagnosis',
-             'child_variable': 'packageCode'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Diagnosis',
-             'child_variable': 'diagnosisCodeableConcept'},
-        ]
-
 
 class ExplanationOfBenefit_Procedure(fhirbase):
     """
@@ -787,20 +479,6 @@ class ExplanationOfBenefit_Procedure(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Procedure',
-             'child_variable': 'procedureCodeableConcept'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit_Procedure',
-             'child_variable': 'procedureReference'},
-        ]
-
 
 class ExplanationOfBenefit_Insurance(fhirbase):
     """
@@ -830,15 +508,6 @@ class ExplanationOfBenefit_Insurance(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit_Insurance',
-             'child_variable': 'coverage'},
-        ]
-
 
 class ExplanationOfBenefit_Accident(fhirbase):
     """
@@ -874,25 +543,6 @@ class ExplanationOfBenefit_Accident(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Accident',
-             'child_variable': 'locationAddress'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit_Accident',
-             'child_variable': 'locationReference'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Accident',
-             'child_variable': 'type'},
-        ]
-
 
 class ExplanationOfBenefit_Item(fhirbase):
     """
@@ -1047,100 +697,6 @@ class ExplanationOfBenefit_Item(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Item',
-             'child_variable': 'unitPrice'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Item',
-             'child_variable': 'subSite'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Item',
-             'child_variable': 'net'},
-
-            {'parent_entity': 'ExplanationOfBenefit_Detail',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Item',
-             'child_variable': 'detail'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Item',
-             'child_variable': 'programCode'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Item',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Item',
-             'child_variable': 'servicedPeriod'},
-
-            {'parent_entity': 'ExplanationOfBenefit_Adjudication',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Item',
-             'child_variable': 'adjudication'},
-
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Item',
-             'child_variable': 'locationAddress'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Item',
-             'child_variable': 'service'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Item',
-             'child_variable': 'bodySite'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Item',
-             'child_variable': 'modifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Item',
-             'child_variable': 'locationCodeableConcept'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit_Item',
-             'child_variable': 'encounter'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Item',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit_Item',
-             'child_variable': 'locationReference'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Item',
-             'child_variable': 'revenue'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit_Item',
-             'child_variable': 'udi'},
-        ]
-
 
 class ExplanationOfBenefit_Adjudication(fhirbase):
     """
@@ -1178,25 +734,6 @@ class ExplanationOfBenefit_Adjudication(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Adjudication',
-             'child_variable': 'amount'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Adjudication',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Adjudication',
-             'child_variable': 'reason'},
-        ]
-
 
 class ExplanationOfBenefit_Detail(fhirbase):
     """
@@ -1298,70 +835,6 @@ class ExplanationOfBenefit_Detail(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ExplanationOfBenefit_SubDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Detail',
-             'child_variable': 'subDetail'},
-
-            {'parent_entity': 'ExplanationOfBenefit_Adjudication',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Detail',
-             'child_variable': 'adjudication'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Detail',
-             'child_variable': 'service'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Detail',
-             'child_variable': 'unitPrice'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Detail',
-             'child_variable': 'net'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Detail',
-             'child_variable': 'programCode'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Detail',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit_Detail',
-             'child_variable': 'udi'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Detail',
-             'child_variable': 'revenue'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Detail',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Detail',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Detail',
-             'child_variable': 'modifier'},
-        ]
-
 
 class ExplanationOfBenefit_SubDetail(fhirbase):
     """
@@ -1453,65 +926,6 @@ class ExplanationOfBenefit_SubDetail(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_SubDetail',
-             'child_variable': 'net'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_SubDetail',
-             'child_variable': 'programCode'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_SubDetail',
-             'child_variable': 'unitPrice'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_SubDetail',
-             'child_variable': 'modifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ExplanationOfBenefit_SubDetail',
-             'child_variable': 'udi'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_SubDetail',
-             'child_variable': 'service'},
-
-            {'parent_entity': 'ExplanationOfBenefit_Adjudication',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_SubDetail',
-             'child_variable': 'adjudication'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_SubDetail',
-             'child_variable': 'revenue'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_SubDetail',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_SubDetail',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_SubDetail',
-             'child_variable': 'category'},
-        ]
-
 
 class ExplanationOfBenefit_AddItem(fhirbase):
     """
@@ -1580,45 +994,6 @@ class ExplanationOfBenefit_AddItem(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_AddItem',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_AddItem',
-             'child_variable': 'service'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_AddItem',
-             'child_variable': 'modifier'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_AddItem',
-             'child_variable': 'fee'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_AddItem',
-             'child_variable': 'revenue'},
-
-            {'parent_entity': 'ExplanationOfBenefit_Adjudication',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_AddItem',
-             'child_variable': 'adjudication'},
-
-            {'parent_entity': 'ExplanationOfBenefit_Detail1',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_AddItem',
-             'child_variable': 'detail'},
-        ]
-
 
 class ExplanationOfBenefit_Detail1(fhirbase):
     """
@@ -1673,40 +1048,6 @@ class ExplanationOfBenefit_Detail1(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Detail1',
-             'child_variable': 'service'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Detail1',
-             'child_variable': 'revenue'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Detail1',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'ExplanationOfBenefit_Adjudication',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Detail1',
-             'child_variable': 'adjudication'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Detail1',
-             'child_variable': 'fee'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Detail1',
-             'child_variable': 'modifier'},
-        ]
-
 
 class ExplanationOfBenefit_Payment(fhirbase):
     """
@@ -1749,35 +1090,6 @@ class ExplanationOfBenefit_Payment(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Payment',
-             'child_variable': 'adjustmentReason'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Payment',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Payment',
-             'child_variable': 'adjustment'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Payment',
-             'child_variable': 'amount'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Payment',
-             'child_variable': 'type'},
-        ]
-
 
 class ExplanationOfBenefit_ProcessNote(fhirbase):
     """
@@ -1817,20 +1129,6 @@ class ExplanationOfBenefit_ProcessNote(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_ProcessNote',
-             'child_variable': 'language'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_ProcessNote',
-             'child_variable': 'type'},
-        ]
-
 
 class ExplanationOfBenefit_BenefitBalance(fhirbase):
     """
@@ -1894,40 +1192,6 @@ class ExplanationOfBenefit_BenefitBalance(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_BenefitBalance',
-             'child_variable': 'subCategory'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_BenefitBalance',
-             'child_variable': 'term'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_BenefitBalance',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_BenefitBalance',
-             'child_variable': 'unit'},
-
-            {'parent_entity': 'ExplanationOfBenefit_Financial',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_BenefitBalance',
-             'child_variable': 'financial'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_BenefitBalance',
-             'child_variable': 'network'},
-        ]
-
 
 class ExplanationOfBenefit_Financial(fhirbase):
     """
@@ -1970,22 +1234,3 @@ class ExplanationOfBenefit_Financial(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Financial',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Financial',
-             'child_variable': 'allowedMoney'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'ExplanationOfBenefit_Financial',
-             'child_variable': 'usedMoney'},
-        ]
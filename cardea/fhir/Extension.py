@@ -336,172 +336,3 @@ class Extension(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueQuantity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueCodeableConcept'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueMoney'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueSimpleQuantity'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Extension',
-             'child_variable': 'valueReference'},
-
-            {'parent_entity': 'Age',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueAge'},
-
-            {'parent_entity': 'SampledData',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueSampledData'},
-
-            {'parent_entity': 'RelatedArtifact',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueRelatedArtifact'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valuePeriod'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueRange'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueContactDetail'},
-
-            {'parent_entity': 'Ratio',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueRatio'},
-
-            {'parent_entity': 'Meta',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueMeta'},
-
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueDuration'},
-
-            {'parent_entity': 'Contributor',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueContributor'},
-
-            {'parent_entity': 'Signature',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueSignature'},
-
-            {'parent_entity': 'DataRequirement',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueDataRequirement'},
-
-            {'parent_entity': 'ParameterDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueParameterDefinition'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueUsageContext'},
-
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueAddress'},
-
-            {'parent_entity': 'Distance',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueDistance'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueTiming'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueAnnotation'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueContactPoint'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueCoding'},
-
-            {'parent_entity': 'HumanName',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueHumanName'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueIdentifier'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueAttachment'},
-
-            {'parent_entity': 'TriggerDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueTriggerDefinition'},
-
-            {'parent_entity': 'Narrative',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueNarrative'},
-
-            {'parent_entity': 'Extension',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueExtension'},
-
-            {'parent_entity': 'Dosage',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueDosage'},
-
-            {'parent_entity': 'Count',
-             'parent_variable': 'object_id',
-             'child_entity': 'Extension',
-             'child_variable': 'valueCount'},
-        ]
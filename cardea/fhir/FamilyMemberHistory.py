@@ -164,96 +164,6 @@ class FamilyMemberHistory(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'partial', 'completed', 'entered-in-error', 'health-unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'partial, completed, entered-in-error, health-unknown'))
-
-        if self.gender is not None:
-            for value in self.gender:
-                if value is not None and value.lower() not in [
-                        'male', 'female', 'other', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'male, female, other, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'FamilyMemberHistory',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'Age',
-             'parent_variable': 'object_id',
-             'child_entity': 'FamilyMemberHistory',
-             'child_variable': 'deceasedAge'},
-
-            {'parent_entity': 'FamilyMemberHistory_Condition',
-             'parent_variable': 'object_id',
-             'child_entity': 'FamilyMemberHistory',
-             'child_variable': 'condition'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'FamilyMemberHistory',
-             'child_variable': 'deceasedRange'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'FamilyMemberHistory',
-             'child_variable': 'reasonReference'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'FamilyMemberHistory',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'FamilyMemberHistory',
-             'child_variable': 'definition'},
-
-            {'parent_entity': 'Age',
-             'parent_variable': 'object_id',
-             'child_entity': 'FamilyMemberHistory',
-             'child_variable': 'ageAge'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'FamilyMemberHistory',
-             'child_variable': 'relationship'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'FamilyMemberHistory',
-             'child_variable': 'patient'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'FamilyMemberHistory',
-             'child_variable': 'ageRange'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'FamilyMemberHistory',
-             'child_variable': 'bornPeriod'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'FamilyMemberHistory',
-             'child_variable': 'notDoneReason'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'FamilyMemberHistory',
-             'child_variable': 'reasonCode'},
-        ]
-
 
 class FamilyMemberHistory_Condition(fhirbase):
     """
@@ -314,37 +224,3 @@ class FamilyMemberHistory_Condition(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Age',
-             'parent_variable': 'object_id',
-             'child_entity': 'FamilyMemberHistory_Condition',
-             'child_variable': 'onsetAge'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'FamilyMemberHistory_Condition',
-             'child_variable': 'outcome'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'FamilyMemberHistory_Condition',
-             'child_variable': 'onsetPeriod'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'FamilyMemberHistory_Condition',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'FamilyMemberHistory_Condition',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'FamilyMemberHistory_Condition',
-             'child_variable': 'onsetRange'},
-        ]
@@ -110,83 +110,6 @@ class Goal(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'proposed', 'accepted', 'planned', 'in-progress', 'on-target',
-                    'ahead-of-target', 'behind-target', 'sustaining', 'achieved',
-                        'on-hold', 'cancelled', 'entered-in-error', 'rejected']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'proposed, accepted, planned, in-progress, on-target, '
-                        'ahead-of-target, behind-target, sustaining, achieved, on-hold, '
-                        'cancelled, entered-in-error, rejected'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'Goal',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Goal',
-             'child_variable': 'addresses'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Goal',
-             'child_variable': 'outcomeReference'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Goal',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Goal',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Goal_Target',
-             'parent_variable': 'object_id',
-             'child_entity': 'Goal',
-             'child_variable': 'target'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Goal',
-             'child_variable': 'outcomeCode'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Goal',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Goal',
-             'child_variable': 'priority'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Goal',
-             'child_variable': 'expressedBy'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Goal',
-             'child_variable': 'startCodeableConcept'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Goal',
-             'child_variable': 'description'},
-        ]
-
 
 class Goal_Target(fhirbase):
     """
@@ -251,32 +174,3 @@ class Goal_Target(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Goal_Target',
-             'child_variable': 'measure'},
-
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'Goal_Target',
-             'child_variable': 'dueDuration'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Goal_Target',
-             'child_variable': 'detailCodeableConcept'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Goal_Target',
-             'child_variable': 'detailQuantity'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'Goal_Target',
-             'child_variable': 'detailRange'},
-        ]
@@ -121,39 +121,6 @@ class GraphDefinition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'GraphDefinition',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'GraphDefinition_Link',
-             'parent_variable': 'object_id',
-             'child_entity': 'GraphDefinition',
-             'child_variable': 'link'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'GraphDefinition',
-             'child_variable': 'jurisdiction'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'GraphDefinition',
-             'child_variable': 'useContext'},
-        ]
-
 
 class GraphDefinition_Link(fhirbase):
     """
@@ -237,20 +204,6 @@ class GraphDefinition_Target(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'GraphDefinition_Compartment',
-             'parent_variable': 'object_id',
-             'child_entity': 'GraphDefinition_Target',
-             'child_variable': 'compartment'},
-
-            {'parent_entity': 'GraphDefinition_Link',
-             'parent_variable': 'object_id',
-             'child_entity': 'GraphDefinition_Target',
-             'child_variable': 'link'},
-        ]
-
 
 class GraphDefinition_Compartment(fhirbase):
     """
@@ -288,12 +241,3 @@ class GraphDefinition_Compartment(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.rule is not None:
-            for value in self.rule:
-                if value is not None and value.lower() not in [
-                        'identical', 'matching', 'different', 'custom']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'identical, matching, different, custom'))
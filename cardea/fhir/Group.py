@@ -72,40 +72,6 @@ class Group(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                    'person', 'animal', 'practitioner', 'device', 'medication',
-                        'substance']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'person, animal, practitioner, device, medication, substance'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Group',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Group_Characteristic',
-             'parent_variable': 'object_id',
-             'child_entity': 'Group',
-             'child_variable': 'characteristic'},
-
-            {'parent_entity': 'Group_Member',
-             'parent_variable': 'object_id',
-             'child_entity': 'Group',
-             'child_variable': 'member'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Group',
-             'child_variable': 'identifier'},
-        ]
-
 
 class Group_Characteristic(fhirbase):
     """
@@ -160,35 +126,6 @@ class Group_Characteristic(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Group_Characteristic',
-             'child_variable': 'valueQuantity'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Group_Characteristic',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Group_Characteristic',
-             'child_variable': 'valueCodeableConcept'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'Group_Characteristic',
-             'child_variable': 'valueRange'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Group_Characteristic',
-             'child_variable': 'code'},
-        ]
-
 
 class Group_Member(fhirbase):
     """
@@ -222,17 +159,3 @@ class Group_Member(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Group_Member',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Group_Member',
-             'child_variable': 'entity'},
-        ]
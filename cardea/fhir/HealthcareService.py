@@ -150,90 +150,6 @@ class HealthcareService(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'HealthcareService_NotAvailable',
-             'parent_variable': 'object_id',
-             'child_entity': 'HealthcareService',
-             'child_variable': 'notAvailable'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'HealthcareService',
-             'child_variable': 'photo'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'HealthcareService',
-             'child_variable': 'telecom'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'HealthcareService',
-             'child_variable': 'characteristic'},
-
-            {'parent_entity': 'HealthcareService_AvailableTime',
-             'parent_variable': 'object_id',
-             'child_entity': 'HealthcareService',
-             'child_variable': 'availableTime'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'HealthcareService',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'HealthcareService',
-             'child_variable': 'referralMethod'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'HealthcareService',
-             'child_variable': 'providedBy'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'HealthcareService',
-             'child_variable': 'specialty'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'HealthcareService',
-             'child_variable': 'eligibility'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'HealthcareService',
-             'child_variable': 'serviceProvisionCode'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'HealthcareService',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'HealthcareService',
-             'child_variable': 'coverageArea'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'HealthcareService',
-             'child_variable': 'location'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'HealthcareService',
-             'child_variable': 'endpoint'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'HealthcareService',
-             'child_variable': 'category'},
-        ]
-
 
 class HealthcareService_AvailableTime(fhirbase):
     """
@@ -273,15 +189,6 @@ class HealthcareService_AvailableTime(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.daysOfWeek is not None:
-            for value in self.daysOfWeek:
-                if value is not None and value.lower() not in [
-                        'mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'mon, tue, wed, thu, fri, sat, sun'))
-
 
 class HealthcareService_NotAvailable(fhirbase):
     """
@@ -308,12 +215,3 @@ class HealthcareService_NotAvailable(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'HealthcareService_NotAvailable',
-             'child_variable': 'during'},
-        ]
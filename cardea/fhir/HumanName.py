@@ -54,21 +54,3 @@ class HumanName(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.use is not None:
-            for value in self.use:
-                if value is not None and value.lower() not in [
-                        'usual', 'official', 'temp', 'nickname', 'anonymous', 'old', 'maiden']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'usual, official, temp, nickname, anonymous, old, maiden'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'HumanName',
-             'child_variable': 'period'},
-        ]
@@ -45,26 +45,3 @@ class Identifier(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.use is not None:
-            for value in self.use:
-                if value is not None and value.lower() not in [
-                        'usual', 'official', 'temp', 'secondary']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'usual, official, temp, secondary'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Identifier',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Identifier',
-             'child_variable': 'period'},
-        ]
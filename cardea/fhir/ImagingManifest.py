@@ -64,30 +64,6 @@ class ImagingManifest(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImagingManifest',
-             'child_variable': 'author'},
-
-            {'parent_entity': 'ImagingManifest_Study',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImagingManifest',
-             'child_variable': 'study'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImagingManifest',
-             'child_variable': 'patient'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImagingManifest',
-             'child_variable': 'identifier'},
-        ]
-
 
 class ImagingManifest_Study(fhirbase):
     """
@@ -129,25 +105,6 @@ class ImagingManifest_Study(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImagingManifest_Study',
-             'child_variable': 'endpoint'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImagingManifest_Study',
-             'child_variable': 'imagingStudy'},
-
-            {'parent_entity': 'ImagingManifest_Series',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImagingManifest_Study',
-             'child_variable': 'series'},
-        ]
-
 
 class ImagingManifest_Series(fhirbase):
     """
@@ -184,20 +141,6 @@ class ImagingManifest_Series(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ImagingManifest_Instance',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImagingManifest_Series',
-             'child_variable': 'instance'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImagingManifest_Series',
-             'child_variable': 'endpoint'},
-        ]
-
 
 class ImagingManifest_Instance(fhirbase):
     """
@@ -130,84 +130,6 @@ class ImagingStudy(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.availability is not None:
-            for value in self.availability:
-                if value is not None and value.lower() not in [
-                        'online', 'offline', 'nearline', 'unavailable']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'ONLINE, OFFLINE, NEARLINE, UNAVAILABLE'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImagingStudy',
-             'child_variable': 'basedOn'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImagingStudy',
-             'child_variable': 'accession'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImagingStudy',
-             'child_variable': 'interpreter'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImagingStudy',
-             'child_variable': 'endpoint'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImagingStudy',
-             'child_variable': 'procedureCode'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImagingStudy',
-             'child_variable': 'reason'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImagingStudy',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImagingStudy',
-             'child_variable': 'procedureReference'},
-
-            {'parent_entity': 'ImagingStudy_Series',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImagingStudy',
-             'child_variable': 'series'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImagingStudy',
-             'child_variable': 'modalityList'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImagingStudy',
-             'child_variable': 'referrer'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImagingStudy',
-             'child_variable': 'patient'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImagingStudy',
-             'child_variable': 'context'},
-        ]
-
 
 class ImagingStudy_Series(fhirbase):
     """
@@ -301,49 +223,6 @@ class ImagingStudy_Series(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.availability is not None:
-            for value in self.availability:
-                if value is not None and value.lower() not in [
-                        'online', 'offline', 'nearline', 'unavailable']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'ONLINE, OFFLINE, NEARLINE, UNAVAILABLE'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImagingStudy_Series',
-             'child_variable': 'endpoint'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImagingStudy_Series',
-             'child_variable': 'bodySite'},
-
-            {'parent_entity': 'ImagingStudy_Instance',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImagingStudy_Series',
-             'child_variable': 'instance'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImagingStudy_Series',
-             'child_variable': 'laterality'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImagingStudy_Series',
-             'child_variable': 'modality'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImagingStudy_Series',
-             'child_variable': 'performer'},
-        ]
-
 
 class ImagingStudy_Instance(fhirbase):
     """
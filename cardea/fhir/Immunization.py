@@ -122,85 +122,6 @@ class Immunization(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Immunization',
-             'child_variable': 'patient'},
-
-            {'parent_entity': 'Immunization_Explanation',
-             'parent_variable': 'object_id',
-             'child_entity': 'Immunization',
-             'child_variable': 'explanation'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Immunization',
-             'child_variable': 'encounter'},
-
-            {'parent_entity': 'Immunization_Reaction',
-             'parent_variable': 'object_id',
-             'child_entity': 'Immunization',
-             'child_variable': 'reaction'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Immunization',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Immunization',
-             'child_variable': 'doseQuantity'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Immunization',
-             'child_variable': 'location'},
-
-            {'parent_entity': 'Immunization_Practitioner',
-             'parent_variable': 'object_id',
-             'child_entity': 'Immunization',
-             'child_variable': 'practitioner'},
-
-            {'parent_entity': 'Immunization_VaccinationProtocol',
-             'parent_variable': 'object_id',
-             'child_entity': 'Immunization',
-             'child_variable': 'vaccinationProtocol'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'Immunization',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Immunization',
-             'child_variable': 'manufacturer'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Immunization',
-             'child_variable': 'vaccineCode'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Immunization',
-             'child_variable': 'reportOrigin'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Immunization',
-             'child_variable': 'route'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Immunization',
-             'child_variable': 'site'},
-        ]
-
 
 class Immunization_Practitioner(fhirbase):
     """
@@ -230,20 +151,6 @@ class Immunization_Practitioner(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Immunization_Practitioner',
-             'child_variable': 'actor'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Immunization_Practitioner',
-             'child_variable': 'role'},
-        ]
-
 
 class Immunization_Explanation(fhirbase):
     """
@@ -274,20 +181,6 @@ class Immunization_Explanation(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Immunization_Explanation',
-             'child_variable': 'reasonNotGiven'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Immunization_Explanation',
-             'child_variable': 'reason'},
-        ]
-
 
 class Immunization_Reaction(fhirbase):
     """
@@ -320,15 +213,6 @@ class Immunization_Reaction(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Immunization_Reaction',
-             'child_variable': 'detail'},
-        ]
-
 
 class Immunization_VaccinationProtocol(fhirbase):
     """
@@ -386,27 +270,3 @@ class Immunization_VaccinationProtocol(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Immunization_VaccinationProtocol',
-             'child_variable': 'doseStatusReason'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Immunization_VaccinationProtocol',
-             'child_variable': 'doseStatus'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Immunization_VaccinationProtocol',
-             'child_variable': 'targetDisease'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Immunization_VaccinationProtocol',
-             'child_variable': 'authority'},
-        ]
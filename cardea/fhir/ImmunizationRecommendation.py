@@ -37,25 +37,6 @@ class ImmunizationRecommendation(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImmunizationRecommendation',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImmunizationRecommendation',
-             'child_variable': 'patient'},
-
-            {'parent_entity': 'ImmunizationRecommendation_Recommendation',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImmunizationRecommendation',
-             'child_variable': 'recommendation'},
-        ]
-
 
 class ImmunizationRecommendation_Recommendation(fhirbase):
     """
@@ -120,45 +101,6 @@ class ImmunizationRecommendation_Recommendation(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImmunizationRecommendation_Recommendation',
-             'child_variable': 'forecastStatus'},
-
-            {'parent_entity': 'ImmunizationRecommendation_DateCriterion',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImmunizationRecommendation_Recommendation',
-             'child_variable': 'dateCriterion'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImmunizationRecommendation_Recommendation',
-             'child_variable': 'vaccineCode'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImmunizationRecommendation_Recommendation',
-             'child_variable': 'targetDisease'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImmunizationRecommendation_Recommendation',
-             'child_variable': 'supportingImmunization'},
-
-            {'parent_entity': 'ImmunizationRecommendation_Protocol',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImmunizationRecommendation_Recommendation',
-             'child_variable': 'protocol'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImmunizationRecommendation_Recommendation',
-             'child_variable': 'supportingPatientInformation'},
-        ]
-
 
 class ImmunizationRecommendation_DateCriterion(fhirbase):
     """
@@ -187,15 +129,6 @@ class ImmunizationRecommendation_DateCriterion(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImmunizationRecommendation_DateCriterion',
-             'child_variable': 'code'},
-        ]
-
 
 class ImmunizationRecommendation_Protocol(fhirbase):
     """
@@ -235,12 +168,3 @@ class ImmunizationRecommendation_Protocol(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImmunizationRecommendation_Protocol',
-             'child_variable': 'authority'},
-        ]
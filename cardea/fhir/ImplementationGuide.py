@@ -145,54 +145,6 @@ class ImplementationGuide(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ImplementationGuide_Package',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImplementationGuide',
-             'child_variable': 'package'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImplementationGuide',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'ImplementationGuide_Global',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImplementationGuide',
-             'child_variable': '_global'},
-
-            {'parent_entity': 'ImplementationGuide_Dependency',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImplementationGuide',
-             'child_variable': 'dependency'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImplementationGuide',
-             'child_variable': 'jurisdiction'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImplementationGuide',
-             'child_variable': 'useContext'},
-
-            {'parent_entity': 'ImplementationGuide_Page',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImplementationGuide',
-             'child_variable': 'page'},
-        ]
-
 
 class ImplementationGuide_Dependency(fhirbase):
     """
@@ -223,15 +175,6 @@ class ImplementationGuide_Dependency(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'reference', 'inclusion']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'reference, inclusion'))
-
 
 class ImplementationGuide_Package(fhirbase):
     """
@@ -268,15 +211,6 @@ class ImplementationGuide_Package(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ImplementationGuide_Resource',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImplementationGuide_Package',
-             'child_variable': 'resource'},
-        ]
-
 
 class ImplementationGuide_Resource(fhirbase):
     """
@@ -334,20 +268,6 @@ class ImplementationGuide_Resource(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImplementationGuide_Resource',
-             'child_variable': 'sourceReference'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImplementationGuide_Resource',
-             'child_variable': 'exampleFor'},
-        ]
-
 
 class ImplementationGuide_Global(fhirbase):
     """
@@ -377,15 +297,6 @@ class ImplementationGuide_Global(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ImplementationGuide_Global',
-             'child_variable': 'profile'},
-        ]
-
 
 class ImplementationGuide_Page(fhirbase):
     """
@@ -442,23 +353,3 @@ class ImplementationGuide_Page(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.kind is not None:
-            for value in self.kind:
-                if value is not None and value.lower() not in [
-                    'page', 'example', 'list', 'include', 'directory', 'dictionary',
-                        'toc', 'resource']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'page, example, list, include, directory, dictionary, toc, '
-                        'resource'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ImplementationGuide_Page',
-             'parent_variable': 'object_id',
-             'child_entity': 'ImplementationGuide_Page',
-             'child_variable': 'page'},
-        ]
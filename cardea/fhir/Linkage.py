@@ -42,20 +42,6 @@ class Linkage(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Linkage_Item',
-             'parent_variable': 'object_id',
-             'child_entity': 'Linkage',
-             'child_variable': 'item'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Linkage',
-             'child_variable': 'author'},
-        ]
-
 
 class Linkage_Item(fhirbase):
     """
@@ -84,21 +70,3 @@ class Linkage_Item(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'source', 'alternate', 'historical']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'source, alternate, historical'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Linkage_Item',
-             'child_variable': 'resource'},
-        ]
@@ -86,71 +86,6 @@ class List(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'current', 'retired', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'current, retired, entered-in-error'))
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'working', 'snapshot', 'changes']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'working, snapshot, changes'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'List',
-             'child_variable': 'encounter'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'List',
-             'child_variable': 'orderedBy'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'List',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'List',
-             'child_variable': 'source'},
-
-            {'parent_entity': 'List_Entry',
-             'parent_variable': 'object_id',
-             'child_entity': 'List',
-             'child_variable': 'entry'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'List',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'List',
-             'child_variable': 'emptyReason'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'List',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'List',
-             'child_variable': 'code'},
-        ]
-
 
 class List_Entry(fhirbase):
     """
@@ -184,17 +119,3 @@ class List_Entry(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'List_Entry',
-             'child_variable': 'item'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'List_Entry',
-             'child_variable': 'flag'},
-        ]
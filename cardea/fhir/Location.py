@@ -105,76 +105,6 @@ class Location(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'active', 'suspended', 'inactive']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, suspended, inactive'))
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'instance', 'kind']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'instance, kind'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Location_Position',
-             'parent_variable': 'object_id',
-             'child_entity': 'Location',
-             'child_variable': 'position'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Location',
-             'child_variable': 'endpoint'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Location',
-             'child_variable': 'partOf'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Location',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Location',
-             'child_variable': 'operationalStatus'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Location',
-             'child_variable': 'physicalType'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Location',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Location',
-             'child_variable': 'managingOrganization'},
-
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'Location',
-             'child_variable': 'address'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'Location',
-             'child_variable': 'telecom'},
-        ]
-
 
 class Location_Position(fhirbase):
     """
@@ -249,89 +249,6 @@ class Measure(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Measure_SupplementalData',
-             'parent_variable': 'identifier',
-             'child_entity': 'Measure',
-             'child_variable': 'supplementalData'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Measure',
-             'child_variable': 'scoring'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'Measure',
-             'child_variable': 'useContext'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Measure',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Measure',
-             'child_variable': 'topic'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'Measure',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Measure',
-             'child_variable': 'library'},
-
-            {'parent_entity': 'Contributor',
-             'parent_variable': 'object_id',
-             'child_entity': 'Measure',
-             'child_variable': 'contributor'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Measure',
-             'child_variable': 'effectivePeriod'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Measure',
-             'child_variable': 'compositeScoring'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Measure',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Measure',
-             'child_variable': 'jurisdiction'},
-
-            {'parent_entity': 'Measure_Group',
-             'parent_variable': 'identifier',
-             'child_entity': 'Measure',
-             'child_variable': 'group'},
-
-            {'parent_entity': 'RelatedArtifact',
-             'parent_variable': 'object_id',
-             'child_entity': 'Measure',
-             'child_variable': 'relatedArtifact'},
-        ]
-
 
 class Measure_Group(fhirbase):
     """
@@ -371,25 +288,6 @@ class Measure_Group(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Measure_Population',
-             'parent_variable': 'identifier',
-             'child_entity': 'Measure_Group',
-             'child_variable': 'population'},
-
-            {'parent_entity': 'Measure_Stratifier',
-             'parent_variable': 'identifier',
-             'child_entity': 'Measure_Group',
-             'child_variable': 'stratifier'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Measure_Group',
-             'child_variable': 'identifier'},
-        ]
-
 
 class Measure_Population(fhirbase):
     """
@@ -428,20 +326,6 @@ class Measure_Population(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Measure_Population',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Measure_Population',
-             'child_variable': 'identifier'},
-        ]
-
 
 class Measure_Stratifier(fhirbase):
     """
@@ -471,15 +355,6 @@ class Measure_Stratifier(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Measure_Stratifier',
-             'child_variable': 'identifier'},
-        ]
-
 
 class Measure_SupplementalData(fhirbase):
     """
@@ -518,17 +393,3 @@ class Measure_SupplementalData(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Measure_SupplementalData',
-             'child_variable': 'usage'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Measure_SupplementalData',
-             'child_variable': 'identifier'},
-        ]
@@ -75,61 +75,6 @@ class MeasureReport(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'complete', 'pending', 'error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'complete, pending, error'))
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'individual', 'patient-list', 'summary']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'individual, patient-list, summary'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'MeasureReport',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MeasureReport',
-             'child_variable': 'reportingOrganization'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MeasureReport',
-             'child_variable': 'measure'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'MeasureReport',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MeasureReport',
-             'child_variable': 'patient'},
-
-            {'parent_entity': 'MeasureReport_Group',
-             'parent_variable': 'identifier',
-             'child_entity': 'MeasureReport',
-             'child_variable': 'group'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MeasureReport',
-             'child_variable': 'evaluatedResources'},
-        ]
-
 
 class MeasureReport_Group(fhirbase):
     """
@@ -168,25 +113,6 @@ class MeasureReport_Group(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'MeasureReport_Stratifier',
-             'parent_variable': 'identifier',
-             'child_entity': 'MeasureReport_Group',
-             'child_variable': 'stratifier'},
-
-            {'parent_entity': 'MeasureReport_Population',
-             'parent_variable': 'identifier',
-             'child_entity': 'MeasureReport_Group',
-             'child_variable': 'population'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'MeasureReport_Group',
-             'child_variable': 'identifier'},
-        ]
-
 
 class MeasureReport_Population(fhirbase):
     """
@@ -220,25 +146,6 @@ class MeasureReport_Population(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MeasureReport_Population',
-             'child_variable': 'patients'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'MeasureReport_Population',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MeasureReport_Population',
-             'child_variable': 'code'},
-        ]
-
 
 class MeasureReport_Stratifier(fhirbase):
     """
@@ -266,20 +173,6 @@ class MeasureReport_Stratifier(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'MeasureReport_Stratifier',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'MeasureReport_Stratum',
-             'parent_variable': 'object_id',
-             'child_entity': 'MeasureReport_Stratifier',
-             'child_variable': 'stratum'},
-        ]
-
 
 class MeasureReport_Stratum(fhirbase):
     """
@@ -316,15 +209,6 @@ class MeasureReport_Stratum(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'MeasureReport_Population1',
-             'parent_variable': 'identifier',
-             'child_entity': 'MeasureReport_Stratum',
-             'child_variable': 'population'},
-        ]
-
 
 class MeasureReport_Population1(fhirbase):
     """
@@ -357,22 +241,3 @@ class MeasureReport_Population1(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MeasureReport_Population1',
-             'child_variable': 'patients'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'MeasureReport_Population1',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MeasureReport_Population1',
-             'child_variable': 'code'},
-        ]
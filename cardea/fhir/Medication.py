@@ -73,49 +73,6 @@ class Medication(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'active', 'inactive', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, inactive, entered-in-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Medication_Package',
-             'parent_variable': 'object_id',
-             'child_entity': 'Medication',
-             'child_variable': 'package'},
-
-            {'parent_entity': 'Medication_Ingredient',
-             'parent_variable': 'object_id',
-             'child_entity': 'Medication',
-             'child_variable': 'ingredient'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Medication',
-             'child_variable': 'image'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Medication',
-             'child_variable': 'form'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Medication',
-             'child_variable': 'manufacturer'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Medication',
-             'child_variable': 'code'},
-        ]
-
 
 class Medication_Ingredient(fhirbase):
     """
@@ -157,25 +114,6 @@ class Medication_Ingredient(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Medication_Ingredient',
-             'child_variable': 'itemReference'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Medication_Ingredient',
-             'child_variable': 'itemCodeableConcept'},
-
-            {'parent_entity': 'Ratio',
-             'parent_variable': 'object_id',
-             'child_entity': 'Medication_Ingredient',
-             'child_variable': 'amount'},
-        ]
-
 
 class Medication_Package(fhirbase):
     """
@@ -210,25 +148,6 @@ class Medication_Package(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Medication_Batch',
-             'parent_variable': 'object_id',
-             'child_entity': 'Medication_Package',
-             'child_variable': 'batch'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Medication_Package',
-             'child_variable': 'container'},
-
-            {'parent_entity': 'Medication_Content',
-             'parent_variable': 'object_id',
-             'child_entity': 'Medication_Package',
-             'child_variable': 'content'},
-        ]
-
 
 class Medication_Content(fhirbase):
     """
@@ -260,25 +179,6 @@ class Medication_Content(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Medication_Content',
-             'child_variable': 'itemReference'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Medication_Content',
-             'child_variable': 'amount'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Medication_Content',
-             'child_variable': 'itemCodeableConcept'},
-        ]
-
 
 class Medication_Batch(fhirbase):
     """
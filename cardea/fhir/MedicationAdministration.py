@@ -162,116 +162,6 @@ class MedicationAdministration(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'in-progress', 'on-hold', 'completed', 'entered-in-error', 'stopped',
-                        'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'in-progress, on-hold, completed, entered-in-error, stopped, '
-                        'unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'supportingInformation'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'device'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'effectivePeriod'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'partOf'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'definition'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'medicationReference'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'prescription'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'MedicationAdministration_Performer',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'performer'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'reasonReference'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'medicationCodeableConcept'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'eventHistory'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'MedicationAdministration_Dosage',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'dosage'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'reasonNotGiven'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'reasonCode'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationAdministration',
-             'child_variable': 'subject'},
-        ]
-
 
 class MedicationAdministration_Performer(fhirbase):
     """
@@ -302,20 +192,6 @@ class MedicationAdministration_Performer(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationAdministration_Performer',
-             'child_variable': 'actor'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationAdministration_Performer',
-             'child_variable': 'onBehalfOf'},
-        ]
-
 
 class MedicationAdministration_Dosage(fhirbase):
     """
@@ -384,37 +260,3 @@ class MedicationAdministration_Dosage(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationAdministration_Dosage',
-             'child_variable': 'site'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationAdministration_Dosage',
-             'child_variable': 'dose'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationAdministration_Dosage',
-             'child_variable': 'method'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationAdministration_Dosage',
-             'child_variable': 'route'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationAdministration_Dosage',
-             'child_variable': 'rateSimpleQuantity'},
-
-            {'parent_entity': 'Ratio',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationAdministration_Dosage',
-             'child_variable': 'rateRatio'},
-        ]
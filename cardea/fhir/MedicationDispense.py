@@ -172,131 +172,6 @@ class MedicationDispense(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'preparation', 'in-progress', 'on-hold', 'completed',
-                        'entered-in-error', 'stopped']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'preparation, in-progress, on-hold, completed, entered-in-error,'
-                        'stopped'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Dosage',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'dosageInstruction'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'partOf'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'receiver'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'detectedIssue'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'medicationCodeableConcept'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'supportingInformation'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'daysSupply'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'medicationReference'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'destination'},
-
-            {'parent_entity': 'MedicationDispense_Performer',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'performer'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'notDoneReasonCodeableConcept'},
-
-            {'parent_entity': 'MedicationDispense_Substitution',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'substitution'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'eventHistory'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'authorizingPrescription'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'notDoneReasonReference'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationDispense',
-             'child_variable': 'category'},
-        ]
-
 
 class MedicationDispense_Performer(fhirbase):
     """
@@ -328,20 +203,6 @@ class MedicationDispense_Performer(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationDispense_Performer',
-             'child_variable': 'actor'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationDispense_Performer',
-             'child_variable': 'onBehalfOf'},
-        ]
-
 
 class MedicationDispense_Substitution(fhirbase):
     """
@@ -384,22 +245,3 @@ class MedicationDispense_Substitution(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationDispense_Substitution',
-             'child_variable': 'reason'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationDispense_Substitution',
-             'child_variable': 'responsibleParty'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationDispense_Substitution',
-             'child_variable': 'type'},
-        ]
@@ -182,140 +182,6 @@ class MedicationRequest(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'active', 'on-hold', 'cancelled', 'completed', 'entered-in-error',
-                        'stopped', 'draft', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, on-hold, cancelled, completed, entered-in-error, stopped,'
-                        'draft, unknown'))
-
-        if self.intent is not None:
-            for value in self.intent:
-                if value is not None and value.lower() not in [
-                        'proposal', 'plan', 'order', 'instance-order']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'proposal, plan, order, instance-order'))
-
-        if self.priority is not None:
-            for value in self.priority:
-                if value is not None and value.lower() not in [
-                        'routine', 'urgent', 'stat', 'asap']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'routine, urgent, stat, asap'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'definition'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'medicationReference'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'supportingInformation'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'priorPrescription'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'groupIdentifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'basedOn'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'reasonReference'},
-
-            {'parent_entity': 'MedicationRequest_Requester',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'requester'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'recorder'},
-
-            {'parent_entity': 'Dosage',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'dosageInstruction'},
-
-            {'parent_entity': 'MedicationRequest_Substitution',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'substitution'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'reasonCode'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'medicationCodeableConcept'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'detectedIssue'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'eventHistory'},
-
-            {'parent_entity': 'MedicationRequest_DispenseRequest',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationRequest',
-             'child_variable': 'dispenseRequest'},
-        ]
-
 
 class MedicationRequest_Requester(fhirbase):
     """
@@ -348,20 +214,6 @@ class MedicationRequest_Requester(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationRequest_Requester',
-             'child_variable': 'onBehalfOf'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationRequest_Requester',
-             'child_variable': 'agent'},
-        ]
-
 
 class MedicationRequest_DispenseRequest(fhirbase):
     """
@@ -414,30 +266,6 @@ class MedicationRequest_DispenseRequest(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationRequest_DispenseRequest',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationRequest_DispenseRequest',
-             'child_variable': 'expectedSupplyDuration'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationRequest_DispenseRequest',
-             'child_variable': 'validityPeriod'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MedicationRequest_DispenseRequest',
-             'child_variable': 'performer'},
-        ]
-
 
 class MedicationRequest_Substitution(fhirbase):
     """
@@ -469,12 +297,3 @@ class MedicationRequest_Substitution(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MedicationRequest_Substitution',
-             'child_variable': 'reason'},
-        ]
@@ -162,69 +162,6 @@ class MessageDefinition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'MessageDefinition',
-             'child_variable': 'event'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MessageDefinition',
-             'child_variable': 'base'},
-
-            {'parent_entity': 'MessageDefinition_AllowedResponse',
-             'parent_variable': 'object_id',
-             'child_entity': 'MessageDefinition',
-             'child_variable': 'allowedResponse'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MessageDefinition',
-             'child_variable': 'replaces'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MessageDefinition',
-             'child_variable': 'jurisdiction'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'MessageDefinition',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'MessageDefinition',
-             'child_variable': 'useContext'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MessageDefinition',
-             'child_variable': 'parent'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'MessageDefinition',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'MessageDefinition_Focus',
-             'parent_variable': 'object_id',
-             'child_entity': 'MessageDefinition',
-             'child_variable': 'focus'},
-        ]
-
 
 class MessageDefinition_Focus(fhirbase):
     """
@@ -265,15 +202,6 @@ class MessageDefinition_Focus(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MessageDefinition_Focus',
-             'child_variable': 'profile'},
-        ]
-
 
 class MessageDefinition_AllowedResponse(fhirbase):
     """
@@ -303,12 +231,3 @@ class MessageDefinition_AllowedResponse(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MessageDefinition_AllowedResponse',
-             'child_variable': 'message'},
-        ]
@@ -96,65 +96,6 @@ class MessageHeader(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MessageHeader',
-             'child_variable': 'receiver'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'MessageHeader',
-             'child_variable': 'event'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MessageHeader',
-             'child_variable': 'enterer'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MessageHeader',
-             'child_variable': 'responsible'},
-
-            {'parent_entity': 'MessageHeader_Response',
-             'parent_variable': 'identifier',
-             'child_entity': 'MessageHeader',
-             'child_variable': 'response'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'MessageHeader',
-             'child_variable': 'reason'},
-
-            {'parent_entity': 'MessageHeader_Destination',
-             'parent_variable': 'object_id',
-             'child_entity': 'MessageHeader',
-             'child_variable': 'destination'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MessageHeader',
-             'child_variable': 'focus'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MessageHeader',
-             'child_variable': 'sender'},
-
-            {'parent_entity': 'MessageHeader_Source',
-             'parent_variable': 'object_id',
-             'child_entity': 'MessageHeader',
-             'child_variable': 'source'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MessageHeader',
-             'child_variable': 'author'},
-        ]
-
 
 class MessageHeader_Destination(fhirbase):
     """
@@ -189,15 +130,6 @@ class MessageHeader_Destination(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MessageHeader_Destination',
-             'child_variable': 'target'},
-        ]
-
 
 class MessageHeader_Source(fhirbase):
     """
@@ -242,15 +174,6 @@ class MessageHeader_Source(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'MessageHeader_Source',
-             'child_variable': 'contact'},
-        ]
-
 
 class MessageHeader_Response(fhirbase):
     """
@@ -285,21 +208,3 @@ class MessageHeader_Response(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.code is not None:
-            for value in self.code:
-                if value is not None and value.lower() not in [
-                        'ok', 'transient-error', 'fatal-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'ok, transient-error, fatal-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'MessageHeader_Response',
-             'child_variable': 'details'},
-        ]
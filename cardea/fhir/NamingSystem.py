@@ -109,56 +109,6 @@ class NamingSystem(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-        if self.kind is not None:
-            for value in self.kind:
-                if value is not None and value.lower() not in [
-                        'codesystem', 'identifier', 'root']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'codesystem, identifier, root'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'NamingSystem',
-             'child_variable': 'replacedBy'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'NamingSystem',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'NamingSystem',
-             'child_variable': 'jurisdiction'},
-
-            {'parent_entity': 'NamingSystem_UniqueId',
-             'parent_variable': 'object_id',
-             'child_entity': 'NamingSystem',
-             'child_variable': 'uniqueId'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'NamingSystem',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'NamingSystem',
-             'child_variable': 'useContext'},
-        ]
-
 
 class NamingSystem_UniqueId(fhirbase):
     """
@@ -204,21 +154,3 @@ class NamingSystem_UniqueId(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'oid', 'uuid', 'uri', 'other']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'oid, uuid, uri, other'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'NamingSystem_UniqueId',
-             'child_variable': 'period'},
-        ]
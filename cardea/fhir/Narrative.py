@@ -28,12 +28,3 @@ class Narrative(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'generated', 'extensions', 'additional', 'empty']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'generated, extensions, additional, empty'))
@@ -99,71 +99,6 @@ class NutritionOrder(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'proposed', 'draft', 'planned', 'requested', 'active', 'on-hold',
-                        'completed', 'cancelled', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'proposed, draft, planned, requested, active, on-hold, completed,'
-                        'cancelled, entered-in-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'NutritionOrder',
-             'child_variable': 'encounter'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder',
-             'child_variable': 'excludeFoodModifier'},
-
-            {'parent_entity': 'NutritionOrder_EnteralFormula',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder',
-             'child_variable': 'enteralFormula'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder',
-             'child_variable': 'foodPreferenceModifier'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'NutritionOrder',
-             'child_variable': 'patient'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'NutritionOrder',
-             'child_variable': 'orderer'},
-
-            {'parent_entity': 'NutritionOrder_OralDiet',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder',
-             'child_variable': 'oralDiet'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'NutritionOrder',
-             'child_variable': 'allergyIntolerance'},
-
-            {'parent_entity': 'NutritionOrder_Supplement',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder',
-             'child_variable': 'supplement'},
-        ]
-
 
 class NutritionOrder_OralDiet(fhirbase):
     """
@@ -220,35 +155,6 @@ class NutritionOrder_OralDiet(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_OralDiet',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'NutritionOrder_Nutrient',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_OralDiet',
-             'child_variable': 'nutrient'},
-
-            {'parent_entity': 'NutritionOrder_Texture',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_OralDiet',
-             'child_variable': 'texture'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_OralDiet',
-             'child_variable': 'fluidConsistencyType'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_OralDiet',
-             'child_variable': 'schedule'},
-        ]
-
 
 class NutritionOrder_Nutrient(fhirbase):
     """
@@ -276,20 +182,6 @@ class NutritionOrder_Nutrient(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_Nutrient',
-             'child_variable': 'amount'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_Nutrient',
-             'child_variable': 'modifier'},
-        ]
-
 
 class NutritionOrder_Texture(fhirbase):
     """
@@ -318,20 +210,6 @@ class NutritionOrder_Texture(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_Texture',
-             'child_variable': 'foodType'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_Texture',
-             'child_variable': 'modifier'},
-        ]
-
 
 class NutritionOrder_Supplement(fhirbase):
     """
@@ -376,25 +254,6 @@ class NutritionOrder_Supplement(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_Supplement',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_Supplement',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_Supplement',
-             'child_variable': 'schedule'},
-        ]
-
 
 class NutritionOrder_EnteralFormula(fhirbase):
     """
@@ -468,40 +327,6 @@ class NutritionOrder_EnteralFormula(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_EnteralFormula',
-             'child_variable': 'baseFormulaType'},
-
-            {'parent_entity': 'NutritionOrder_Administration',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_EnteralFormula',
-             'child_variable': 'administration'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_EnteralFormula',
-             'child_variable': 'additiveType'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_EnteralFormula',
-             'child_variable': 'maxVolumeToDeliver'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_EnteralFormula',
-             'child_variable': 'caloricDensity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_EnteralFormula',
-             'child_variable': 'routeofAdministration'},
-        ]
-
 
 class NutritionOrder_Administration(fhirbase):
     """
@@ -540,27 +365,3 @@ class NutritionOrder_Administration(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_Administration',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_Administration',
-             'child_variable': 'rateSimpleQuantity'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_Administration',
-             'child_variable': 'schedule'},
-
-            {'parent_entity': 'Ratio',
-             'parent_variable': 'object_id',
-             'child_entity': 'NutritionOrder_Administration',
-             'child_variable': 'rateRatio'},
-        ]
@@ -206,141 +206,6 @@ class Observation(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'registered', 'preliminary', 'final', 'amended', 'corrected',
-                        'cancelled', 'entered-in-error', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'registered, preliminary, final, amended, corrected, cancelled,'
-                        'entered-in-error, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Observation',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation',
-             'child_variable': 'valueQuantity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation',
-             'child_variable': 'valueCodeableConcept'},
-
-            {'parent_entity': 'Ratio',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation',
-             'child_variable': 'valueRatio'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Observation',
-             'child_variable': 'device'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation',
-             'child_variable': 'valuePeriod'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation',
-             'child_variable': 'effectivePeriod'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation',
-             'child_variable': 'valueRange'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Observation',
-             'child_variable': 'specimen'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Observation',
-             'child_variable': 'performer'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation',
-             'child_variable': 'method'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation',
-             'child_variable': 'interpretation'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Observation',
-             'child_variable': 'basedOn'},
-
-            {'parent_entity': 'SampledData',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation',
-             'child_variable': 'valueSampledData'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation',
-             'child_variable': 'bodySite'},
-
-            {'parent_entity': 'Observation_Related',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation',
-             'child_variable': 'related'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation',
-             'child_variable': 'dataAbsentReason'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation',
-             'child_variable': 'valueAttachment'},
-
-            {'parent_entity': 'Observation_Component',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation',
-             'child_variable': 'component'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Observation',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Observation_ReferenceRange',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation',
-             'child_variable': 'referenceRange'},
-        ]
-
 
 class Observation_ReferenceRange(fhirbase):
     """
@@ -398,35 +263,6 @@ class Observation_ReferenceRange(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation_ReferenceRange',
-             'child_variable': 'low'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation_ReferenceRange',
-             'child_variable': 'appliesTo'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation_ReferenceRange',
-             'child_variable': 'high'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation_ReferenceRange',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation_ReferenceRange',
-             'child_variable': 'age'},
-        ]
-
 
 class Observation_Related(fhirbase):
     """
@@ -458,26 +294,6 @@ class Observation_Related(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                    'has-member', 'derived-from', 'sequel-to', 'replaces', 'qualified-by',
-                        'interfered-by']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'has-member, derived-from, sequel-to, replaces, qualified-by,'
-                        'interfered-by'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Observation_Related',
-             'child_variable': 'target'},
-        ]
-
 
 class Observation_Component(fhirbase):
     """
@@ -569,62 +385,3 @@ class Observation_Component(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation_Component',
-             'child_variable': 'valuePeriod'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation_Component',
-             'child_variable': 'valueQuantity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation_Component',
-             'child_variable': 'dataAbsentReason'},
-
-            {'parent_entity': 'Ratio',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation_Component',
-             'child_variable': 'valueRatio'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation_Component',
-             'child_variable': 'valueAttachment'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation_Component',
-             'child_variable': 'interpretation'},
-
-            {'parent_entity': 'Observation_ReferenceRange',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation_Component',
-             'child_variable': 'referenceRange'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation_Component',
-             'child_variable': 'valueRange'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation_Component',
-             'child_variable': 'valueCodeableConcept'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation_Component',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'SampledData',
-             'parent_variable': 'object_id',
-             'child_entity': 'Observation_Component',
-             'child_variable': 'valueSampledData'},
-        ]
@@ -165,56 +165,6 @@ class OperationDefinition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-        if self.kind is not None:
-            for value in self.kind:
-                if value is not None and value.lower() not in [
-                        'operation', 'query']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'operation, query'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'OperationDefinition',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'OperationDefinition_Overload',
-             'parent_variable': 'object_id',
-             'child_entity': 'OperationDefinition',
-             'child_variable': 'overload'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'OperationDefinition',
-             'child_variable': 'base'},
-
-            {'parent_entity': 'OperationDefinition_Parameter',
-             'parent_variable': 'object_id',
-             'child_entity': 'OperationDefinition',
-             'child_variable': 'parameter'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'OperationDefinition',
-             'child_variable': 'jurisdiction'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'OperationDefinition',
-             'child_variable': 'useContext'},
-        ]
-
 
 class OperationDefinition_Parameter(fhirbase):
     """
@@ -283,57 +233,6 @@ class OperationDefinition_Parameter(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.use is not None:
-            for value in self.use:
-                if value is not None and value.lower() not in [
-                        'in', 'out']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'in, out'))
-
-        if self.searchType is not None:
-            for value in self.searchType:
-                if value is not None and value.lower() not in [
-                    'number', 'date', 'string', 'token', 'reference', 'composite',
-                        'quantity', 'uri']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'number, date, string, token, reference, composite, quantity, uri'))
-
-        if self.use is not None:
-            for value in self.use:
-                if value is not None and value.lower() not in [
-                        'in', 'out']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'in, out'))
-
-        if self.searchType is not None:
-            for value in self.searchType:
-                if value is not None and value.lower() not in [
-                    'number', 'date', 'string', 'token', 'reference', 'composite',
-                        'quantity', 'uri']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'number, date, string, token, reference, composite, quantity, uri'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'OperationDefinition_Parameter',
-             'parent_variable': 'object_id',
-             'child_entity': 'OperationDefinition_Parameter',
-             'child_variable': 'part'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'OperationDefinition_Parameter',
-             'child_variable': 'profile'},
-
-            {'parent_entity': 'OperationDefinition_Binding',
-             'parent_variable': 'object_id',
-             'child_entity': 'OperationDefinition_Parameter',
-             'child_variable': 'binding'},
-        ]
-
 
 class OperationDefinition_Binding(fhirbase):
     """
@@ -370,24 +269,6 @@ class OperationDefinition_Binding(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.strength is not None:
-            for value in self.strength:
-                if value is not None and value.lower() not in [
-                        'required', 'extensible', 'preferred', 'example']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'required, extensible, preferred, example'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'OperationDefinition_Binding',
-             'child_variable': 'valueSetReference'},
-        ]
-
 
 class OperationDefinition_Overload(fhirbase):
     """
@@ -30,15 +30,6 @@ class OperationOutcome(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'OperationOutcome_Issue',
-             'parent_variable': 'object_id',
-             'child_entity': 'OperationOutcome',
-             'child_variable': 'issue'},
-        ]
-
 
 class OperationOutcome_Issue(fhirbase):
     """
@@ -100,37 +91,3 @@ class OperationOutcome_Issue(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.severity is not None:
-            for value in self.severity:
-                if value is not None and value.lower() not in [
-                        'fatal', 'error', 'warning', 'information']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'fatal, error, warning, information'))
-
-        if self.code is not None:
-            for value in self.code:
-                if value is not None and value.lower() not in [
-                    'invalid', 'structure', 'required', 'value', 'invariant', 'security',
-                    'login', 'unknown', 'expired', 'forbidden', 'suppressed',
-                    'processing', 'not-supported', 'duplicate', 'not-found', 'too-long',
-                    'code-invalid', 'extension', 'too-costly', 'business-rule',
-                    'conflict', 'incomplete', 'transient', 'lock-error', 'no-store',
-                        'exception', 'timeout', 'throttled', 'informational']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'invalid, structure, required, value, invariant, security, login,'
-                        'unknown, expired, forbidden, suppressed, processing, not-supported,'
-                        'duplicate, not-found, too-long, code-invalid, extension, too-costly,'
-                        'business-rule, conflict, incomplete, transient, lock-error, no-store,'
-                        'exception, timeout, throttled, informational'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'OperationOutcome_Issue',
-             'child_variable': 'details'},
-        ]
@@ -72,45 +72,6 @@ class Organization(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Organization_Contact',
-             'parent_variable': 'object_id',
-             'child_entity': 'Organization',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'Organization',
-             'child_variable': 'telecom'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Organization',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Organization',
-             'child_variable': 'partOf'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Organization',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Organization',
-             'child_variable': 'endpoint'},
-
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'Organization',
-             'child_variable': 'address'},
-        ]
-
 
 class Organization_Contact(fhirbase):
     """
@@ -148,27 +109,3 @@ class Organization_Contact(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Organization_Contact',
-             'child_variable': 'purpose'},
-
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'Organization_Contact',
-             'child_variable': 'address'},
-
-            {'parent_entity': 'HumanName',
-             'parent_variable': 'object_id',
-             'child_entity': 'Organization_Contact',
-             'child_variable': 'name'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'Organization_Contact',
-             'child_variable': 'telecom'},
-        ]
@@ -52,12 +52,3 @@ class ParameterDefinition(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ParameterDefinition',
-             'child_variable': 'profile'},
-        ]
@@ -24,15 +24,6 @@ class Parameters(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Parameters_Parameter',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters',
-             'child_variable': 'parameter'},
-        ]
-
 
 class Parameters_Parameter(fhirbase):
     """
@@ -277,197 +268,3 @@ class Parameters_Parameter(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Extension',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueExtension'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueReference'},
-
-            {'parent_entity': 'ResourceList',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'resource'},
-
-            {'parent_entity': 'Ratio',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueRatio'},
-
-            {'parent_entity': 'BackboneElement',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueBackboneElement'},
-
-            {'parent_entity': 'Contributor',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueContributor'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueContactPoint'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueCodeableConcept'},
-
-            {'parent_entity': 'Narrative',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueNarrative'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueIdentifier'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueAttachment'},
-
-            {'parent_entity': 'Parameters_Parameter',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'part'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueAnnotation'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueTiming'},
-
-            {'parent_entity': 'TriggerDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueTriggerDefinition'},
-
-            {'parent_entity': 'Age',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueAge'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueContactDetail'},
-
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueAddress'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueRange'},
-
-            {'parent_entity': 'ParameterDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueParameterDefinition'},
-
-            {'parent_entity': 'DataRequirement',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueDataRequirement'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueSimpleQuantity'},
-
-            {'parent_entity': 'RelatedArtifact',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueRelatedArtifact'},
-
-            {'parent_entity': 'Signature',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueSignature'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueQuantity'},
-
-            {'parent_entity': 'Meta',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueMeta'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueMoney'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valuePeriod'},
-
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueDuration'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueUsageContext'},
-
-            {'parent_entity': 'ElementDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueElementDefinition'},
-
-            {'parent_entity': 'Dosage',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueDosage'},
-
-            {'parent_entity': 'Distance',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueDistance'},
-
-            {'parent_entity': 'Count',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueCount'},
-
-            {'parent_entity': 'HumanName',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueHumanName'},
-
-            {'parent_entity': 'Element',
-             'parent_variable': 'id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueElement'},
-
-            {'parent_entity': 'SampledData',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueSampledData'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Parameters_Parameter',
-             'child_variable': 'valueCoding'},
-        ]
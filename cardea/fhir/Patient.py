@@ -116,79 +116,6 @@ class Patient(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.gender is not None:
-            for value in self.gender:
-                if value is not None and value.lower() not in [
-                        'male', 'female', 'other', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'male, female, other, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient',
-             'child_variable': 'address'},
-
-            {'parent_entity': 'Patient_Animal',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient',
-             'child_variable': 'animal'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Patient',
-             'child_variable': 'generalPractitioner'},
-
-            {'parent_entity': 'Patient_Link',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient',
-             'child_variable': 'link'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Patient',
-             'child_variable': 'managingOrganization'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient',
-             'child_variable': 'maritalStatus'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient',
-             'child_variable': 'telecom'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient',
-             'child_variable': 'photo'},
-
-            {'parent_entity': 'Patient_Communication',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient',
-             'child_variable': 'communication'},
-
-            {'parent_entity': 'HumanName',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient',
-             'child_variable': 'name'},
-
-            {'parent_entity': 'Patient_Contact',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient',
-             'child_variable': 'contact'},
-        ]
-
 
 class Patient_Contact(fhirbase):
     """
@@ -244,49 +171,6 @@ class Patient_Contact(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.gender is not None:
-            for value in self.gender:
-                if value is not None and value.lower() not in [
-                        'male', 'female', 'other', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'male, female, other, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'HumanName',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient_Contact',
-             'child_variable': 'name'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient_Contact',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Patient_Contact',
-             'child_variable': 'organization'},
-
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient_Contact',
-             'child_variable': 'address'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient_Contact',
-             'child_variable': 'relationship'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient_Contact',
-             'child_variable': 'telecom'},
-        ]
-
 
 class Patient_Animal(fhirbase):
     """
@@ -319,25 +203,6 @@ class Patient_Animal(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient_Animal',
-             'child_variable': 'breed'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient_Animal',
-             'child_variable': 'species'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient_Animal',
-             'child_variable': 'genderStatus'},
-        ]
-
 
 class Patient_Communication(fhirbase):
     """
@@ -368,15 +233,6 @@ class Patient_Communication(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Patient_Communication',
-             'child_variable': 'language'},
-        ]
-
 
 class Patient_Link(fhirbase):
     """
@@ -405,21 +261,3 @@ class Patient_Link(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'replaced-by', 'replaces', 'refer', 'seealso']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'replaced-by, replaces, refer, seealso'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Patient_Link',
-             'child_variable': 'other'},
-        ]
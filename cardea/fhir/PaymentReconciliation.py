@@ -85,65 +85,6 @@ class PaymentReconciliation(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'PaymentReconciliation',
-             'child_variable': 'total'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PaymentReconciliation',
-             'child_variable': 'outcome'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'PaymentReconciliation',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'PaymentReconciliation',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'PaymentReconciliation',
-             'child_variable': 'requestOrganization'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'PaymentReconciliation',
-             'child_variable': 'request'},
-
-            {'parent_entity': 'PaymentReconciliation_Detail',
-             'parent_variable': 'object_id',
-             'child_entity': 'PaymentReconciliation',
-             'child_variable': 'detail'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PaymentReconciliation',
-             'child_variable': 'form'},
-
-            {'parent_entity': 'PaymentReconciliation_ProcessNote',
-             'parent_variable': 'object_id',
-             'child_entity': 'PaymentReconciliation',
-             'child_variable': 'processNote'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'PaymentReconciliation',
-             'child_variable': 'organization'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'PaymentReconciliation',
-             'child_variable': 'requestProvider'},
-        ]
-
 
 class PaymentReconciliation_Detail(fhirbase):
     """
@@ -192,40 +133,6 @@ class PaymentReconciliation_Detail(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'PaymentReconciliation_Detail',
-             'child_variable': 'request'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PaymentReconciliation_Detail',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'PaymentReconciliation_Detail',
-             'child_variable': 'payee'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'PaymentReconciliation_Detail',
-             'child_variable': 'amount'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'PaymentReconciliation_Detail',
-             'child_variable': 'response'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'PaymentReconciliation_Detail',
-             'child_variable': 'submitter'},
-        ]
-
 
 class PaymentReconciliation_ProcessNote(fhirbase):
     """
@@ -251,12 +158,3 @@ class PaymentReconciliation_ProcessNote(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PaymentReconciliation_ProcessNote',
-             'child_variable': 'type'},
-        ]
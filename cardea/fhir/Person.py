@@ -70,54 +70,6 @@ class Person(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.gender is not None:
-            for value in self.gender:
-                if value is not None and value.lower() not in [
-                        'male', 'female', 'other', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'male, female, other, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'HumanName',
-             'parent_variable': 'object_id',
-             'child_entity': 'Person',
-             'child_variable': 'name'},
-
-            {'parent_entity': 'Person_Link',
-             'parent_variable': 'object_id',
-             'child_entity': 'Person',
-             'child_variable': 'link'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'Person',
-             'child_variable': 'telecom'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Person',
-             'child_variable': 'managingOrganization'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Person',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'Person',
-             'child_variable': 'address'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Person',
-             'child_variable': 'photo'},
-        ]
-
 
 class Person_Link(fhirbase):
     """
@@ -146,21 +98,3 @@ class Person_Link(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.assurance is not None:
-            for value in self.assurance:
-                if value is not None and value.lower() not in [
-                        'level1', 'level2', 'level3', 'level4']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'level1, level2, level3, level4'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Person_Link',
-             'child_variable': 'target'},
-        ]
@@ -192,79 +192,6 @@ class PlanDefinition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'PlanDefinition_Action',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition',
-             'child_variable': 'action'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition',
-             'child_variable': 'jurisdiction'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition',
-             'child_variable': 'useContext'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition',
-             'child_variable': 'effectivePeriod'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition',
-             'child_variable': 'topic'},
-
-            {'parent_entity': 'RelatedArtifact',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition',
-             'child_variable': 'relatedArtifact'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'Contributor',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition',
-             'child_variable': 'contributor'},
-
-            {'parent_entity': 'PlanDefinition_Goal',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition',
-             'child_variable': 'goal'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'PlanDefinition',
-             'child_variable': 'library'},
-        ]
-
 
 class PlanDefinition_Goal(fhirbase):
     """
@@ -324,45 +251,6 @@ class PlanDefinition_Goal(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Goal',
-             'child_variable': 'priority'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Goal',
-             'child_variable': 'start'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Goal',
-             'child_variable': 'description'},
-
-            {'parent_entity': 'RelatedArtifact',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Goal',
-             'child_variable': 'documentation'},
-
-            {'parent_entity': 'PlanDefinition_Target',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Goal',
-             'child_variable': 'target'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Goal',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Goal',
-             'child_variable': 'addresses'},
-        ]
-
 
 class PlanDefinition_Target(fhirbase):
     """
@@ -424,35 +312,6 @@ class PlanDefinition_Target(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Target',
-             'child_variable': 'detailQuantity'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Target',
-             'child_variable': 'detailRange'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Target',
-             'child_variable': 'measure'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Target',
-             'child_variable': 'detailCodeableConcept'},
-
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Target',
-             'child_variable': 'due'},
-        ]
-
 
 class PlanDefinition_Action(fhirbase):
     """
@@ -643,174 +502,6 @@ class PlanDefinition_Action(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.groupingBehavior is not None:
-            for value in self.groupingBehavior:
-                if value is not None and value.lower() not in [
-                        'visual-group', 'logical-group', 'sentence-group']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'visual-group, logical-group, sentence-group'))
-
-        if self.selectionBehavior is not None:
-            for value in self.selectionBehavior:
-                if value is not None and value.lower() not in [
-                    'any', 'all', 'all-or-none', 'exactly-one', 'at-most-one',
-                        'one-or-more']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'any, all, all-or-none, exactly-one, at-most-one, one-or-more'))
-
-        if self.requiredBehavior is not None:
-            for value in self.requiredBehavior:
-                if value is not None and value.lower() not in [
-                        'must', 'could', 'must-unless-documented']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'must, could, must-unless-documented'))
-
-        if self.precheckBehavior is not None:
-            for value in self.precheckBehavior:
-                if value is not None and value.lower() not in [
-                        'yes', 'no']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'yes, no'))
-
-        if self.cardinalityBehavior is not None:
-            for value in self.cardinalityBehavior:
-                if value is not None and value.lower() not in [
-                        'single', 'multiple']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'single, multiple'))
-
-        if self.groupingBehavior is not None:
-            for value in self.groupingBehavior:
-                if value is not None and value.lower() not in [
-                        'visual-group', 'logical-group', 'sentence-group']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'visual-group, logical-group, sentence-group'))
-
-        if self.selectionBehavior is not None:
-            for value in self.selectionBehavior:
-                if value is not None and value.lower() not in [
-                    'any', 'all', 'all-or-none', 'exactly-one', 'at-most-one',
-                        'one-or-more']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'any, all, all-or-none, exactly-one, at-most-one, one-or-more'))
-
-        if self.requiredBehavior is not None:
-            for value in self.requiredBehavior:
-                if value is not None and value.lower() not in [
-                        'must', 'could', 'must-unless-documented']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'must, could, must-unless-documented'))
-
-        if self.precheckBehavior is not None:
-            for value in self.precheckBehavior:
-                if value is not None and value.lower() not in [
-                        'yes', 'no']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'yes, no'))
-
-        if self.cardinalityBehavior is not None:
-            for value in self.cardinalityBehavior:
-                if value is not None and value.lower() not in [
-                        'single', 'multiple']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'single, multiple'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'PlanDefinition_RelatedAction',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Action',
-             'child_variable': 'relatedAction'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Action',
-             'child_variable': 'timingRange'},
-
-            {'parent_entity': 'RelatedArtifact',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Action',
-             'child_variable': 'documentation'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Action',
-             'child_variable': 'timingTiming'},
-
-            {'parent_entity': 'PlanDefinition_Participant',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Action',
-             'child_variable': 'participant'},
-
-            {'parent_entity': 'PlanDefinition_Action',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Action',
-             'child_variable': 'action'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Action',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'PlanDefinition_Action',
-             'child_variable': 'definition'},
-
-            {'parent_entity': 'DataRequirement',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Action',
-             'child_variable': 'input'},
-
-            {'parent_entity': 'PlanDefinition_DynamicValue',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Action',
-             'child_variable': 'dynamicValue'},
-
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Action',
-             'child_variable': 'timingDuration'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Action',
-             'child_variable': 'timingPeriod'},
-
-            {'parent_entity': 'TriggerDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Action',
-             'child_variable': 'triggerDefinition'},
-
-            {'parent_entity': 'DataRequirement',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Action',
-             'child_variable': 'output'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'PlanDefinition_Action',
-             'child_variable': 'transform'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Action',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Action',
-             'child_variable': 'reason'},
-
-            {'parent_entity': 'PlanDefinition_Condition',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Action',
-             'child_variable': 'condition'},
-        ]
-
 
 class PlanDefinition_Condition(fhirbase):
     """
@@ -852,15 +543,6 @@ class PlanDefinition_Condition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.kind is not None:
-            for value in self.kind:
-                if value is not None and value.lower() not in [
-                        'applicability', 'start', 'stop']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'applicability, start, stop'))
-
 
 class PlanDefinition_RelatedAction(fhirbase):
     """
@@ -904,32 +586,6 @@ class PlanDefinition_RelatedAction(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.relationship is not None:
-            for value in self.relationship:
-                if value is not None and value.lower() not in [
-                    'before-start', 'before', 'before-end', 'concurrent-with-start',
-                    'concurrent', 'concurrent-with-end', 'after-start', 'after',
-                        'after-end']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'before-start, before, before-end, concurrent-with-start, '
-                        'concurrent, concurrent-with-end, after-start, after, after-end'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_RelatedAction',
-             'child_variable': 'offsetRange'},
-
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_RelatedAction',
-             'child_variable': 'offsetDuration'},
-        ]
-
 
 class PlanDefinition_Participant(fhirbase):
     """
@@ -962,24 +618,6 @@ class PlanDefinition_Participant(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'patient', 'practitioner', 'related-person']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'patient, practitioner, related-person'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PlanDefinition_Participant',
-             'child_variable': 'role'},
-        ]
-
 
 class PlanDefinition_DynamicValue(fhirbase):
     """
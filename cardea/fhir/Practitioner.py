@@ -74,54 +74,6 @@ class Practitioner(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.gender is not None:
-            for value in self.gender:
-                if value is not None and value.lower() not in [
-                        'male', 'female', 'other', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'male, female, other, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Practitioner_Qualification',
-             'parent_variable': 'identifier',
-             'child_entity': 'Practitioner',
-             'child_variable': 'qualification'},
-
-            {'parent_entity': 'HumanName',
-             'parent_variable': 'object_id',
-             'child_entity': 'Practitioner',
-             'child_variable': 'name'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Practitioner',
-             'child_variable': 'communication'},
-
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'Practitioner',
-             'child_variable': 'address'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Practitioner',
-             'child_variable': 'photo'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Practitioner',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'Practitioner',
-             'child_variable': 'telecom'},
-        ]
-
 
 class Practitioner_Qualification(fhirbase):
     """
@@ -154,27 +106,3 @@ class Practitioner_Qualification(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Practitioner_Qualification',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Practitioner_Qualification',
-             'child_variable': 'issuer'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Practitioner_Qualification',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Practitioner_Qualification',
-             'child_variable': 'period'},
-        ]
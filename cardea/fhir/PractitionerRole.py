@@ -98,70 +98,6 @@ class PractitionerRole(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'PractitionerRole',
-             'child_variable': 'healthcareService'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'PractitionerRole',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'PractitionerRole',
-             'child_variable': 'practitioner'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'PractitionerRole',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PractitionerRole',
-             'child_variable': 'specialty'},
-
-            {'parent_entity': 'PractitionerRole_NotAvailable',
-             'parent_variable': 'object_id',
-             'child_entity': 'PractitionerRole',
-             'child_variable': 'notAvailable'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'PractitionerRole',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'PractitionerRole',
-             'child_variable': 'endpoint'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'PractitionerRole',
-             'child_variable': 'telecom'},
-
-            {'parent_entity': 'PractitionerRole_AvailableTime',
-             'parent_variable': 'object_id',
-             'child_entity': 'PractitionerRole',
-             'child_variable': 'availableTime'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'PractitionerRole',
-             'child_variable': 'organization'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'PractitionerRole',
-             'child_variable': 'location'},
-        ]
-
 
 class PractitionerRole_AvailableTime(fhirbase):
     """
@@ -227,12 +163,3 @@ class PractitionerRole_NotAvailable(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'PractitionerRole_NotAvailable',
-             'child_variable': 'during'},
-        ]
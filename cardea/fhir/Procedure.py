@@ -182,130 +182,6 @@ class Procedure(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Procedure',
-             'child_variable': 'partOf'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Procedure',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Procedure',
-             'child_variable': 'performedPeriod'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Procedure',
-             'child_variable': 'usedCode'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Procedure',
-             'child_variable': 'followUp'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Procedure',
-             'child_variable': 'location'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Procedure',
-             'child_variable': 'reasonReference'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Procedure',
-             'child_variable': 'basedOn'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Procedure',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Procedure_Performer',
-             'parent_variable': 'object_id',
-             'child_entity': 'Procedure',
-             'child_variable': 'performer'},
-
-            {'parent_entity': 'Procedure_FocalDevice',
-             'parent_variable': 'object_id',
-             'child_entity': 'Procedure',
-             'child_variable': 'focalDevice'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Procedure',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Procedure',
-             'child_variable': 'complication'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Procedure',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Procedure',
-             'child_variable': 'report'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Procedure',
-             'child_variable': 'reasonCode'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Procedure',
-             'child_variable': 'notDoneReason'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Procedure',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'Procedure',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Procedure',
-             'child_variable': 'outcome'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Procedure',
-             'child_variable': 'bodySite'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Procedure',
-             'child_variable': 'definition'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Procedure',
-             'child_variable': 'usedReference'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Procedure',
-             'child_variable': 'complicationDetail'},
-        ]
-
 
 class Procedure_Performer(fhirbase):
     """
@@ -338,25 +214,6 @@ class Procedure_Performer(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Procedure_Performer',
-             'child_variable': 'role'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Procedure_Performer',
-             'child_variable': 'actor'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Procedure_Performer',
-             'child_variable': 'onBehalfOf'},
-        ]
-
 
 class Procedure_FocalDevice(fhirbase):
     """
@@ -385,17 +242,3 @@ class Procedure_FocalDevice(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Procedure_FocalDevice',
-             'child_variable': 'manipulated'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Procedure_FocalDevice',
-             'child_variable': 'action'},
-        ]
@@ -191,120 +191,6 @@ class ProcedureRequest(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'replaces'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'performer'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'asNeededCodeableConcept'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'performerType'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'occurrencePeriod'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'basedOn'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'occurrenceTiming'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'bodySite'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'specimen'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'requisition'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'definition'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'relevantHistory'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'reasonCode'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'ProcedureRequest_Requester',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'requester'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'supportingInfo'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'reasonReference'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcedureRequest',
-             'child_variable': 'note'},
-        ]
-
 
 class ProcedureRequest_Requester(fhirbase):
     """
@@ -332,17 +218,3 @@ class ProcedureRequest_Requester(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcedureRequest_Requester',
-             'child_variable': 'agent'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcedureRequest_Requester',
-             'child_variable': 'onBehalfOf'},
-        ]
@@ -92,59 +92,6 @@ class ProcessRequest(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.action is not None:
-            for value in self.action:
-                if value is not None and value.lower() not in [
-                        'cancel', 'poll', 'reprocess', 'status']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'cancel, poll, reprocess, status'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcessRequest',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcessRequest',
-             'child_variable': 'request'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcessRequest',
-             'child_variable': 'provider'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcessRequest',
-             'child_variable': 'organization'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcessRequest',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcessRequest',
-             'child_variable': 'target'},
-
-            {'parent_entity': 'ProcessRequest_Item',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcessRequest',
-             'child_variable': 'item'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcessRequest',
-             'child_variable': 'response'},
-        ]
-
 
 class ProcessRequest_Item(fhirbase):
     """
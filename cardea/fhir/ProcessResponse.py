@@ -83,60 +83,6 @@ class ProcessResponse(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcessResponse',
-             'child_variable': 'error'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcessResponse',
-             'child_variable': 'outcome'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcessResponse',
-             'child_variable': 'communicationRequest'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcessResponse',
-             'child_variable': 'requestProvider'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcessResponse',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'ProcessResponse_ProcessNote',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcessResponse',
-             'child_variable': 'processNote'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcessResponse',
-             'child_variable': 'request'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcessResponse',
-             'child_variable': 'form'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcessResponse',
-             'child_variable': 'requestOrganization'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ProcessResponse',
-             'child_variable': 'organization'},
-        ]
-
 
 class ProcessResponse_ProcessNote(fhirbase):
     """
@@ -162,12 +108,3 @@ class ProcessResponse_ProcessNote(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ProcessResponse_ProcessNote',
-             'child_variable': 'type'},
-        ]
@@ -88,50 +88,6 @@ class Provenance(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Provenance',
-             'child_variable': 'reason'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Provenance',
-             'child_variable': 'location'},
-
-            {'parent_entity': 'Provenance_Agent',
-             'parent_variable': 'object_id',
-             'child_entity': 'Provenance',
-             'child_variable': 'agent'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Provenance',
-             'child_variable': 'activity'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Provenance',
-             'child_variable': 'target'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Provenance',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'Signature',
-             'parent_variable': 'object_id',
-             'child_entity': 'Provenance',
-             'child_variable': 'signature'},
-
-            {'parent_entity': 'Provenance_Entity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Provenance',
-             'child_variable': 'entity'},
-        ]
-
 
 class Provenance_Agent(fhirbase):
     """
@@ -189,30 +145,6 @@ class Provenance_Agent(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Provenance_Agent',
-             'child_variable': 'whoReference'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Provenance_Agent',
-             'child_variable': 'role'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Provenance_Agent',
-             'child_variable': 'onBehalfOfReference'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Provenance_Agent',
-             'child_variable': 'relatedAgentType'},
-        ]
-
 
 class Provenance_Entity(fhirbase):
     """
@@ -269,31 +201,3 @@ class Provenance_Entity(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.role is not None:
-            for value in self.role:
-                if value is not None and value.lower() not in [
-                        'derivation', 'revision', 'quotation', 'source', 'removal']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'derivation, revision, quotation, source, removal'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Provenance_Agent',
-             'parent_variable': 'object_id',
-             'child_entity': 'Provenance_Entity',
-             'child_variable': 'agent'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Provenance_Entity',
-             'child_variable': 'whatIdentifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Provenance_Entity',
-             'child_variable': 'whatReference'},
-        ]
@@ -47,12 +47,3 @@ class Quantity(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.comparator is not None:
-            for value in self.comparator:
-                if value is not None and value.lower() not in [
-                        '<', '<=', '>=', '>']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, '<, <=, >=, >'))
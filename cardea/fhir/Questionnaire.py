@@ -156,54 +156,6 @@ class Questionnaire(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'Questionnaire',
-             'child_variable': 'useContext'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'Questionnaire',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Questionnaire',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Questionnaire_Item',
-             'parent_variable': 'object_id',
-             'child_entity': 'Questionnaire',
-             'child_variable': 'item'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Questionnaire',
-             'child_variable': 'effectivePeriod'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Questionnaire',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Questionnaire',
-             'child_variable': 'jurisdiction'},
-        ]
-
 
 class Questionnaire_Item(fhirbase):
     """
@@ -374,68 +326,6 @@ class Questionnaire_Item(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                    'group', 'display', 'boolean', 'decimal', 'integer', 'date',
-                    'datetime', 'time', 'string', 'text', 'url', 'choice', 'open-choice',
-                        'attachment', 'reference', 'quantity']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'group, display, boolean, decimal, integer, date, dateTime, time,'
-                        'string, text, url, choice, open-choice, attachment, reference,'
-                        'quantity'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Questionnaire_Item',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Questionnaire_Item',
-             'child_variable': 'initialReference'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Questionnaire_Item',
-             'child_variable': 'initialQuantity'},
-
-            {'parent_entity': 'Questionnaire_Item',
-             'parent_variable': 'object_id',
-             'child_entity': 'Questionnaire_Item',
-             'child_variable': 'item'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Questionnaire_Item',
-             'child_variable': 'initialAttachment'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Questionnaire_Item',
-             'child_variable': 'initialCoding'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Questionnaire_Item',
-             'child_variable': 'options'},
-
-            {'parent_entity': 'Questionnaire_Option',
-             'parent_variable': 'object_id',
-             'child_entity': 'Questionnaire_Item',
-             'child_variable': 'option'},
-
-            {'parent_entity': 'Questionnaire_EnableWhen',
-             'parent_variable': 'object_id',
-             'child_entity': 'Questionnaire_Item',
-             'child_variable': 'enableWhen'},
-        ]
-
 
 class Questionnaire_EnableWhen(fhirbase):
     """
@@ -527,30 +417,6 @@ class Questionnaire_EnableWhen(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Questionnaire_EnableWhen',
-             'child_variable': 'answerQuantity'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Questionnaire_EnableWhen',
-             'child_variable': 'answerCoding'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Questionnaire_EnableWhen',
-             'child_variable': 'answerReference'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Questionnaire_EnableWhen',
-             'child_variable': 'answerAttachment'},
-        ]
-
 
 class Questionnaire_Option(fhirbase):
     """
@@ -595,12 +461,3 @@ class Questionnaire_Option(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Questionnaire_Option',
-             'child_variable': 'valueCoding'},
-        ]
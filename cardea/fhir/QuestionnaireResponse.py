@@ -86,64 +86,6 @@ class QuestionnaireResponse(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'in-progress', 'completed', 'amended', 'entered-in-error', 'stopped']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'in-progress, completed, amended, entered-in-error, stopped'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'QuestionnaireResponse',
-             'child_variable': 'author'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'QuestionnaireResponse',
-             'child_variable': 'questionnaire'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'QuestionnaireResponse',
-             'child_variable': 'parent'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'QuestionnaireResponse',
-             'child_variable': 'basedOn'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'QuestionnaireResponse',
-             'child_variable': 'source'},
-
-            {'parent_entity': 'QuestionnaireResponse_Item',
-             'parent_variable': 'object_id',
-             'child_entity': 'QuestionnaireResponse',
-             'child_variable': 'item'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'QuestionnaireResponse',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'QuestionnaireResponse',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'QuestionnaireResponse',
-             'child_variable': 'subject'},
-        ]
-
 
 class QuestionnaireResponse_Item(fhirbase):
     """
@@ -193,25 +135,6 @@ class QuestionnaireResponse_Item(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'QuestionnaireResponse_Item',
-             'parent_variable': 'object_id',
-             'child_entity': 'QuestionnaireResponse_Item',
-             'child_variable': 'item'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'QuestionnaireResponse_Item',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'QuestionnaireResponse_Answer',
-             'parent_variable': 'object_id',
-             'child_entity': 'QuestionnaireResponse_Item',
-             'child_variable': 'answer'},
-        ]
-
 
 class QuestionnaireResponse_Answer(fhirbase):
     """
@@ -296,32 +219,3 @@ class QuestionnaireResponse_Answer(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'QuestionnaireResponse_Item',
-             'parent_variable': 'object_id',
-             'child_entity': 'QuestionnaireResponse_Answer',
-             'child_variable': 'item'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'QuestionnaireResponse_Answer',
-             'child_variable': 'valueAttachment'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'QuestionnaireResponse_Answer',
-             'child_variable': 'valueCoding'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'QuestionnaireResponse_Answer',
-             'child_variable': 'valueQuantity'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'QuestionnaireResponse_Answer',
-             'child_variable': 'valueReference'},
-        ]
@@ -25,17 +25,3 @@ class Ratio(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Ratio',
-             'child_variable': 'denominator'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Ratio',
-             'child_variable': 'numerator'},
-        ]
@@ -40,12 +40,3 @@ class Reference(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Reference',
-             'child_variable': 'identifier'},
-        ]
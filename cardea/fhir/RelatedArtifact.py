@@ -49,28 +49,3 @@ class RelatedArtifact(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                    'documentation', 'justification', 'citation', 'predecessor',
-                        'successor', 'derived-from', 'depends-on', 'composed-of']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'documentation, justification, citation, predecessor, successor,'
-                        'derived-from, depends-on, composed-of'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'RelatedArtifact',
-             'child_variable': 'document'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RelatedArtifact',
-             'child_variable': 'resource'},
-        ]
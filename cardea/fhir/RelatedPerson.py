@@ -75,56 +75,3 @@ class RelatedPerson(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.gender is not None:
-            for value in self.gender:
-                if value is not None and value.lower() not in [
-                        'male', 'female', 'other', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'male, female, other, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'RelatedPerson',
-             'child_variable': 'address'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'RelatedPerson',
-             'child_variable': 'photo'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'RelatedPerson',
-             'child_variable': 'relationship'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'RelatedPerson',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'RelatedPerson',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RelatedPerson',
-             'child_variable': 'patient'},
-
-            {'parent_entity': 'HumanName',
-             'parent_variable': 'object_id',
-             'child_entity': 'RelatedPerson',
-             'child_variable': 'name'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'RelatedPerson',
-             'child_variable': 'telecom'},
-        ]
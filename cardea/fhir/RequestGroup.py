@@ -112,70 +112,6 @@ class RequestGroup(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RequestGroup',
-             'child_variable': 'basedOn'},
-
-            {'parent_entity': 'RequestGroup_Action',
-             'parent_variable': 'object_id',
-             'child_entity': 'RequestGroup',
-             'child_variable': 'action'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'RequestGroup',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'RequestGroup',
-             'child_variable': 'reasonCodeableConcept'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RequestGroup',
-             'child_variable': 'reasonReference'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RequestGroup',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'RequestGroup',
-             'child_variable': 'groupIdentifier'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'RequestGroup',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RequestGroup',
-             'child_variable': 'author'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RequestGroup',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RequestGroup',
-             'child_variable': 'replaces'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RequestGroup',
-             'child_variable': 'definition'},
-        ]
-
 
 class RequestGroup_Action(fhirbase):
     """
@@ -311,70 +247,6 @@ class RequestGroup_Action(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'RequestGroup_Action',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'RequestGroup_Action',
-             'parent_variable': 'object_id',
-             'child_entity': 'RequestGroup_Action',
-             'child_variable': 'action'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'RequestGroup_Action',
-             'child_variable': 'timingTiming'},
-
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'RequestGroup_Action',
-             'child_variable': 'timingDuration'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'RequestGroup_Action',
-             'child_variable': 'timingRange'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RequestGroup_Action',
-             'child_variable': 'participant'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RequestGroup_Action',
-             'child_variable': 'resource'},
-
-            {'parent_entity': 'RelatedArtifact',
-             'parent_variable': 'object_id',
-             'child_entity': 'RequestGroup_Action',
-             'child_variable': 'documentation'},
-
-            {'parent_entity': 'RequestGroup_RelatedAction',
-             'parent_variable': 'object_id',
-             'child_entity': 'RequestGroup_Action',
-             'child_variable': 'relatedAction'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'RequestGroup_Action',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'RequestGroup_Action',
-             'child_variable': 'timingPeriod'},
-
-            {'parent_entity': 'RequestGroup_Condition',
-             'parent_variable': 'object_id',
-             'child_entity': 'RequestGroup_Action',
-             'child_variable': 'condition'},
-        ]
-
 
 class RequestGroup_Condition(fhirbase):
     """
@@ -448,17 +320,3 @@ class RequestGroup_RelatedAction(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'RequestGroup_RelatedAction',
-             'child_variable': 'offsetDuration'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'RequestGroup_RelatedAction',
-             'child_variable': 'offsetRange'},
-        ]
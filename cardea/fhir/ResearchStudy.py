@@ -139,106 +139,6 @@ class ResearchStudy(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'draft', 'in-progress', 'suspended', 'stopped', 'completed',
-                        'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, in-progress, suspended, stopped, completed, '
-                        'entered-in-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ResearchStudy',
-             'child_variable': 'reasonStopped'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ResearchStudy',
-             'child_variable': 'sponsor'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ResearchStudy',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ResearchStudy',
-             'child_variable': 'partOf'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'ResearchStudy',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ResearchStudy',
-             'child_variable': 'site'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ResearchStudy',
-             'child_variable': 'focus'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ResearchStudy',
-             'child_variable': 'protocol'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'ResearchStudy',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'RelatedArtifact',
-             'parent_variable': 'object_id',
-             'child_entity': 'ResearchStudy',
-             'child_variable': 'relatedArtifact'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ResearchStudy',
-             'child_variable': 'principalInvestigator'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ResearchStudy',
-             'child_variable': 'jurisdiction'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ResearchStudy',
-             'child_variable': 'keyword'},
-
-            {'parent_entity': 'ResearchStudy_Arm',
-             'parent_variable': 'object_id',
-             'child_entity': 'ResearchStudy',
-             'child_variable': 'arm'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ResearchStudy',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ResearchStudy',
-             'child_variable': 'enrollment'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'ResearchStudy',
-             'child_variable': 'note'},
-        ]
-
 
 class ResearchStudy_Arm(fhirbase):
     """
@@ -275,12 +175,3 @@ class ResearchStudy_Arm(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ResearchStudy_Arm',
-             'child_variable': 'code'},
-        ]
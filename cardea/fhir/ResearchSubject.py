@@ -65,42 +65,3 @@ class ResearchSubject(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'candidate', 'enrolled', 'active', 'suspended', 'withdrawn',
-                        'completed']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'candidate, enrolled, active, suspended, withdrawn, completed'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ResearchSubject',
-             'child_variable': 'individual'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ResearchSubject',
-             'child_variable': 'study'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'ResearchSubject',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ResearchSubject',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'ResearchSubject',
-             'child_variable': 'consent'},
-        ]
@@ -34,12 +34,3 @@ class Resource(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Meta',
-             'parent_variable': 'object_id',
-             'child_entity': 'Resource',
-             'child_variable': 'meta'},
-        ]
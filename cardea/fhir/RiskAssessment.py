@@ -104,80 +104,6 @@ class RiskAssessment(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RiskAssessment',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'RiskAssessment',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'RiskAssessment_Prediction',
-             'parent_variable': 'object_id',
-             'child_entity': 'RiskAssessment',
-             'child_variable': 'prediction'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RiskAssessment',
-             'child_variable': 'condition'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RiskAssessment',
-             'child_variable': 'parent'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RiskAssessment',
-             'child_variable': 'performer'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RiskAssessment',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'RiskAssessment',
-             'child_variable': 'occurrencePeriod'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RiskAssessment',
-             'child_variable': 'reasonReference'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RiskAssessment',
-             'child_variable': 'basedOn'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'RiskAssessment',
-             'child_variable': 'method'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'RiskAssessment',
-             'child_variable': 'basis'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'RiskAssessment',
-             'child_variable': 'reasonCodeableConcept'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'RiskAssessment',
-             'child_variable': 'identifier'},
-        ]
-
 
 class RiskAssessment_Prediction(fhirbase):
     """
@@ -237,32 +163,3 @@ class RiskAssessment_Prediction(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'RiskAssessment_Prediction',
-             'child_variable': 'whenPeriod'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'RiskAssessment_Prediction',
-             'child_variable': 'qualitativeRisk'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'RiskAssessment_Prediction',
-             'child_variable': 'whenRange'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'RiskAssessment_Prediction',
-             'child_variable': 'outcome'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'RiskAssessment_Prediction',
-             'child_variable': 'probabilityRange'},
-        ]
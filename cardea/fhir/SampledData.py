@@ -57,12 +57,3 @@ class SampledData(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'SampledData',
-             'child_variable': 'origin'},
-        ]
@@ -177,70 +177,6 @@ class SearchParameter(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                    'number', 'date', 'string', 'token', 'reference', 'composite',
-                        'quantity', 'uri']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'number, date, string, token, reference, composite, quantity, uri'))
-
-        if self.xpathUsage is not None:
-            for value in self.xpathUsage:
-                if value is not None and value.lower() not in [
-                        'normal', 'phonetic', 'nearby', 'distance', 'other']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'normal, phonetic, nearby, distance, other'))
-
-        if self.comparator is not None:
-            for value in self.comparator:
-                if value is not None and value.lower() not in [
-                        'eq', 'ne', 'gt', 'lt', 'ge', 'le', 'sa', 'eb', 'ap']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'eq, ne, gt, lt, ge, le, sa, eb, ap'))
-
-        if self.modifier is not None:
-            for value in self.modifier:
-                if value is not None and value.lower() not in [
-                    'missing', 'exact', 'contains', 'not', 'text', 'in', 'not-in',
-                        'below', 'above', 'type']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'missing, exact, contains, not, text, in, not-in, below, above, '
-                        'type'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'SearchParameter',
-             'child_variable': 'jurisdiction'},
-
-            {'parent_entity': 'SearchParameter_Component',
-             'parent_variable': 'object_id',
-             'child_entity': 'SearchParameter',
-             'child_variable': 'component'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'SearchParameter',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'SearchParameter',
-             'child_variable': 'useContext'},
-        ]
-
 
 class SearchParameter_Component(fhirbase):
     """
@@ -268,12 +204,3 @@ class SearchParameter_Component(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'SearchParameter_Component',
-             'child_variable': 'definition'},
-        ]
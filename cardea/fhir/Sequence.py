@@ -106,74 +106,6 @@ class Sequence(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'aa', 'dna', 'rna']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'aa, dna, rna'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Sequence',
-             'child_variable': 'patient'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Sequence',
-             'child_variable': 'pointer'},
-
-            {'parent_entity': 'Sequence_Quality',
-             'parent_variable': 'object_id',
-             'child_entity': 'Sequence',
-             'child_variable': 'quality'},
-
-            {'parent_entity': 'Sequence_Repository',
-             'parent_variable': 'object_id',
-             'child_entity': 'Sequence',
-             'child_variable': 'repository'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Sequence',
-             'child_variable': 'specimen'},
-
-            {'parent_entity': 'Sequence_ReferenceSeq',
-             'parent_variable': 'object_id',
-             'child_entity': 'Sequence',
-             'child_variable': 'referenceSeq'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Sequence',
-             'child_variable': 'performer'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Sequence',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Sequence_Variant',
-             'parent_variable': 'object_id',
-             'child_entity': 'Sequence',
-             'child_variable': 'variant'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Sequence',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Sequence',
-             'child_variable': 'device'},
-        ]
-
 
 class Sequence_ReferenceSeq(fhirbase):
     """
@@ -240,25 +172,6 @@ class Sequence_ReferenceSeq(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Sequence_ReferenceSeq',
-             'child_variable': 'chromosome'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Sequence_ReferenceSeq',
-             'child_variable': 'referenceSeqId'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Sequence_ReferenceSeq',
-             'child_variable': 'referenceSeqPointer'},
-        ]
-
 
 class Sequence_Variant(fhirbase):
     """
@@ -322,15 +235,6 @@ class Sequence_Variant(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Sequence_Variant',
-             'child_variable': 'variantPointer'},
-        ]
-
 
 class Sequence_Quality(fhirbase):
     """
@@ -430,34 +334,6 @@ class Sequence_Quality(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'indel', 'snp', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'indel, snp, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Sequence_Quality',
-             'child_variable': 'method'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Sequence_Quality',
-             'child_variable': 'score'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Sequence_Quality',
-             'child_variable': 'standardSequence'},
-        ]
-
 
 class Sequence_Repository(fhirbase):
     """
@@ -507,12 +383,3 @@ class Sequence_Repository(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'directlink', 'openapi', 'login', 'oauth', 'other']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'directlink, openapi, login, oauth, other'))
@@ -88,69 +88,6 @@ class Specimen(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'available', 'unavailable', 'unsatisfactory', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'available, unavailable, unsatisfactory, entered-in-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Specimen_Container',
-             'parent_variable': 'identifier',
-             'child_entity': 'Specimen',
-             'child_variable': 'container'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Specimen',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Specimen',
-             'child_variable': 'parent'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Specimen',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Specimen',
-             'child_variable': 'accessionIdentifier'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'Specimen',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'Specimen_Processing',
-             'parent_variable': 'object_id',
-             'child_entity': 'Specimen',
-             'child_variable': 'processing'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Specimen',
-             'child_variable': 'request'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Specimen',
-             'child_variable': 'subject'},
-
-            {'parent_entity': 'Specimen_Collection',
-             'parent_variable': 'object_id',
-             'child_entity': 'Specimen',
-             'child_variable': 'collection'},
-        ]
-
 
 class Specimen_Collection(fhirbase):
     """
@@ -199,35 +136,6 @@ class Specimen_Collection(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Specimen_Collection',
-             'child_variable': 'collectedPeriod'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Specimen_Collection',
-             'child_variable': 'collector'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Specimen_Collection',
-             'child_variable': 'bodySite'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Specimen_Collection',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Specimen_Collection',
-             'child_variable': 'method'},
-        ]
-
 
 class Specimen_Processing(fhirbase):
     """
@@ -271,25 +179,6 @@ class Specimen_Processing(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Specimen_Processing',
-             'child_variable': 'additive'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Specimen_Processing',
-             'child_variable': 'timePeriod'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Specimen_Processing',
-             'child_variable': 'procedure'},
-        ]
-
 
 class Specimen_Container(fhirbase):
     """
@@ -340,37 +229,3 @@ class Specimen_Container(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Specimen_Container',
-             'child_variable': 'additiveCodeableConcept'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Specimen_Container',
-             'child_variable': 'specimenQuantity'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Specimen_Container',
-             'child_variable': 'capacity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Specimen_Container',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Specimen_Container',
-             'child_variable': 'additiveReference'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Specimen_Container',
-             'child_variable': 'identifier'},
-        ]
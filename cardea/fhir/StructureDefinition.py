@@ -200,80 +200,6 @@ class StructureDefinition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-        if self.kind is not None:
-            for value in self.kind:
-                if value is not None and value.lower() not in [
-                        'primitive-type', 'complex-type', 'resource', 'logical']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'primitive-type, complex-type, resource, logical'))
-
-        if self.contextType is not None:
-            for value in self.contextType:
-                if value is not None and value.lower() not in [
-                        'resource', 'datatype', 'extension']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'resource, datatype, extension'))
-
-        if self.derivation is not None:
-            for value in self.derivation:
-                if value is not None and value.lower() not in [
-                        'specialization', 'constraint']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'specialization, constraint'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureDefinition',
-             'child_variable': 'keyword'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureDefinition',
-             'child_variable': 'jurisdiction'},
-
-            {'parent_entity': 'StructureDefinition_Differential',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureDefinition',
-             'child_variable': 'differential'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureDefinition',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureDefinition',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'StructureDefinition_Mapping',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureDefinition',
-             'child_variable': 'mapping'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureDefinition',
-             'child_variable': 'useContext'},
-
-            {'parent_entity': 'StructureDefinition_Snapshot',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureDefinition',
-             'child_variable': 'snapshot'},
-        ]
-
 
 class StructureDefinition_Mapping(fhirbase):
     """
@@ -336,15 +262,6 @@ class StructureDefinition_Snapshot(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ElementDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureDefinition_Snapshot',
-             'child_variable': 'element'},
-        ]
-
 
 class StructureDefinition_Differential(fhirbase):
     """
@@ -368,12 +285,3 @@ class StructureDefinition_Differential(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ElementDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureDefinition_Differential',
-             'child_variable': 'element'},
-        ]
@@ -137,49 +137,6 @@ class StructureMap(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap',
-             'child_variable': 'jurisdiction'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap',
-             'child_variable': 'useContext'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'StructureMap_Group',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap',
-             'child_variable': 'group'},
-
-            {'parent_entity': 'StructureMap_Structure',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap',
-             'child_variable': 'structure'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap',
-             'child_variable': 'identifier'},
-        ]
-
 
 class StructureMap_Structure(fhirbase):
     """
@@ -217,15 +174,6 @@ class StructureMap_Structure(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'source', 'queried', 'target', 'produced']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'source, queried, target, produced'))
-
 
 class StructureMap_Group(fhirbase):
     """
@@ -276,29 +224,6 @@ class StructureMap_Group(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.typeMode is not None:
-            for value in self.typeMode:
-                if value is not None and value.lower() not in [
-                        'none', 'types', 'type-and-types']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'none, types, type-and-types'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'StructureMap_Input',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Group',
-             'child_variable': 'input'},
-
-            {'parent_entity': 'StructureMap_Rule',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Group',
-             'child_variable': 'rule'},
-        ]
-
 
 class StructureMap_Input(fhirbase):
     """
@@ -335,15 +260,6 @@ class StructureMap_Input(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'source', 'target']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'source, target'))
-
 
 class StructureMap_Rule(fhirbase):
     """
@@ -390,30 +306,6 @@ class StructureMap_Rule(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'StructureMap_Source',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Rule',
-             'child_variable': 'source'},
-
-            {'parent_entity': 'StructureMap_Dependent',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Rule',
-             'child_variable': 'dependent'},
-
-            {'parent_entity': 'StructureMap_Target',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Rule',
-             'child_variable': 'target'},
-
-            {'parent_entity': 'StructureMap_Rule',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Rule',
-             'child_variable': 'rule'},
-        ]
-
 
 class StructureMap_Source(fhirbase):
     """
@@ -742,199 +634,6 @@ class StructureMap_Source(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.listMode is not None:
-            for value in self.listMode:
-                if value is not None and value.lower() not in [
-                        'first', 'not_first', 'last', 'not_last', 'only_one']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'first, not_first, last, not_last, only_one'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueMoney'},
-
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueDuration'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueContactPoint'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueIdentifier'},
-
-            {'parent_entity': 'Contributor',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueContributor'},
-
-            {'parent_entity': 'HumanName',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueHumanName'},
-
-            {'parent_entity': 'BackboneElement',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueBackboneElement'},
-
-            {'parent_entity': 'TriggerDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueTriggerDefinition'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueTiming'},
-
-            {'parent_entity': 'Dosage',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueDosage'},
-
-            {'parent_entity': 'SampledData',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueSampledData'},
-
-            {'parent_entity': 'Extension',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueExtension'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueSimpleQuantity'},
-
-            {'parent_entity': 'Age',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueAge'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueAttachment'},
-
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueAddress'},
-
-            {'parent_entity': 'Ratio',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueRatio'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValuePeriod'},
-
-            {'parent_entity': 'Meta',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueMeta'},
-
-            {'parent_entity': 'Count',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueCount'},
-
-            {'parent_entity': 'RelatedArtifact',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueRelatedArtifact'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueUsageContext'},
-
-            {'parent_entity': 'ParameterDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueParameterDefinition'},
-
-            {'parent_entity': 'ElementDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueElementDefinition'},
-
-            {'parent_entity': 'Element',
-             'parent_variable': 'id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueElement'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueCodeableConcept'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueContactDetail'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueAnnotation'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueCoding'},
-
-            {'parent_entity': 'Signature',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueSignature'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueReference'},
-
-            {'parent_entity': 'Distance',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueDistance'},
-
-            {'parent_entity': 'DataRequirement',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueDataRequirement'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueRange'},
-
-            {'parent_entity': 'Narrative',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueNarrative'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Source',
-             'child_variable': 'defaultValueQuantity'},
-        ]
-
 
 class StructureMap_Target(fhirbase):
     """
@@ -993,65 +692,6 @@ class StructureMap_Target(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.contextType is not None:
-            for value in self.contextType:
-                if value is not None and value.lower() not in [
-                        'type', 'variable']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'type, variable'))
-
-        if self.listMode is not None:
-            for value in self.listMode:
-                if value is not None and value.lower() not in [
-                        'first', 'share', 'last', 'collate']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'first, share, last, collate'))
-
-        if self.transform is not None:
-            for value in self.transform:
-                if value is not None and value.lower() not in [
-                    'create', 'copy', 'truncate', 'escape', 'cast', 'append', 'translate',
-                    'reference', 'dateop', 'uuid', 'pointer', 'evaluate', 'cc', 'c',
-                        'qty', 'id', 'cp']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'create, copy, truncate, escape, cast, append, translate, '
-                        'reference, dateOp, uuid, pointer, evaluate, cc, c, qty, id, cp'))
-
-        if self.contextType is not None:
-            for value in self.contextType:
-                if value is not None and value.lower() not in [
-                        'type', 'variable']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'type, variable'))
-
-        if self.listMode is not None:
-            for value in self.listMode:
-                if value is not None and value.lower() not in [
-                        'first', 'share', 'last', 'collate']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'first, share, last, collate'))
-
-        if self.transform is not None:
-            for value in self.transform:
-                if value is not None and value.lower() not in [
-                    'create', 'copy', 'truncate', 'escape', 'cast', 'append', 'translate',
-                    'reference', 'dateop', 'uuid', 'pointer', 'evaluate', 'cc', 'c',
-                        'qty', 'id', 'cp']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'create, copy, truncate, escape, cast, append, translate, '
-                        'reference, dateOp, uuid, pointer, evaluate, cc, c, qty, id, cp'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'StructureMap_Parameter',
-             'parent_variable': 'object_id',
-             'child_entity': 'StructureMap_Target',
-             'child_variable': 'parameter'},
-        ]
-
 
 class StructureMap_Parameter(fhirbase):
     """
@@ -70,34 +70,6 @@ class Subscription(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'requested', 'active', 'error', 'off']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'requested, active, error, off'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'Subscription',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Subscription',
-             'child_variable': 'tag'},
-
-            {'parent_entity': 'Subscription_Channel',
-             'parent_variable': 'object_id',
-             'child_entity': 'Subscription',
-             'child_variable': 'channel'},
-        ]
-
 
 class Subscription_Channel(fhirbase):
     """
@@ -142,12 +114,3 @@ class Subscription_Channel(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'rest-hook', 'websocket', 'email', 'sms', 'message']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'rest-hook, websocket, email, sms, message'))
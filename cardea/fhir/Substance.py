@@ -56,44 +56,6 @@ class Substance(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'active', 'inactive', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, inactive, entered-in-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Substance_Instance',
-             'parent_variable': 'identifier',
-             'child_entity': 'Substance',
-             'child_variable': 'instance'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Substance',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Substance',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Substance',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Substance_Ingredient',
-             'parent_variable': 'object_id',
-             'child_entity': 'Substance',
-             'child_variable': 'ingredient'},
-        ]
-
 
 class Substance_Instance(fhirbase):
     """
@@ -122,20 +84,6 @@ class Substance_Instance(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Substance_Instance',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Substance_Instance',
-             'child_variable': 'identifier'},
-        ]
-
 
 class Substance_Ingredient(fhirbase):
     """
@@ -167,22 +115,3 @@ class Substance_Ingredient(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Ratio',
-             'parent_variable': 'object_id',
-             'child_entity': 'Substance_Ingredient',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Substance_Ingredient',
-             'child_variable': 'substanceCodeableConcept'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Substance_Ingredient',
-             'child_variable': 'substanceReference'},
-        ]
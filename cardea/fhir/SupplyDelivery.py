@@ -85,74 +85,6 @@ class SupplyDelivery(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'in-progress', 'completed', 'abandoned', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'in-progress, completed, abandoned, entered-in-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'SupplyDelivery',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'SupplyDelivery',
-             'child_variable': 'patient'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'SupplyDelivery',
-             'child_variable': 'occurrenceTiming'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'SupplyDelivery',
-             'child_variable': 'destination'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'SupplyDelivery',
-             'child_variable': 'receiver'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'SupplyDelivery',
-             'child_variable': 'partOf'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'SupplyDelivery',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'SupplyDelivery',
-             'child_variable': 'occurrencePeriod'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'SupplyDelivery',
-             'child_variable': 'supplier'},
-
-            {'parent_entity': 'SupplyDelivery_SuppliedItem',
-             'parent_variable': 'object_id',
-             'child_entity': 'SupplyDelivery',
-             'child_variable': 'suppliedItem'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'SupplyDelivery',
-             'child_variable': 'basedOn'},
-        ]
-
 
 class SupplyDelivery_SuppliedItem(fhirbase):
     """
@@ -188,22 +120,3 @@ class SupplyDelivery_SuppliedItem(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'SupplyDelivery_SuppliedItem',
-             'child_variable': 'itemReference'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'SupplyDelivery_SuppliedItem',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'SupplyDelivery_SuppliedItem',
-             'child_variable': 'itemCodeableConcept'},
-        ]
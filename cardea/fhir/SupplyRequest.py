@@ -87,76 +87,6 @@ class SupplyRequest(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'draft', 'active', 'suspended', 'cancelled', 'completed',
-                        'entered-in-error', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, suspended, cancelled, completed, entered-in-error,'
-                        'unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'SupplyRequest',
-             'child_variable': 'occurrencePeriod'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'SupplyRequest',
-             'child_variable': 'occurrenceTiming'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'SupplyRequest',
-             'child_variable': 'reasonCodeableConcept'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'SupplyRequest',
-             'child_variable': 'deliverFrom'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'SupplyRequest',
-             'child_variable': 'category'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'SupplyRequest',
-             'child_variable': 'deliverTo'},
-
-            {'parent_entity': 'SupplyRequest_Requester',
-             'parent_variable': 'object_id',
-             'child_entity': 'SupplyRequest',
-             'child_variable': 'requester'},
-
-            {'parent_entity': 'SupplyRequest_OrderedItem',
-             'parent_variable': 'object_id',
-             'child_entity': 'SupplyRequest',
-             'child_variable': 'orderedItem'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'SupplyRequest',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'SupplyRequest',
-             'child_variable': 'supplier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'SupplyRequest',
-             'child_variable': 'reasonReference'},
-        ]
-
 
 class SupplyRequest_OrderedItem(fhirbase):
     """
@@ -191,25 +121,6 @@ class SupplyRequest_OrderedItem(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'SupplyRequest_OrderedItem',
-             'child_variable': 'quantity'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'SupplyRequest_OrderedItem',
-             'child_variable': 'itemCodeableConcept'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'SupplyRequest_OrderedItem',
-             'child_variable': 'itemReference'},
-        ]
-
 
 class SupplyRequest_Requester(fhirbase):
     """
@@ -236,17 +147,3 @@ class SupplyRequest_Requester(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'SupplyRequest_Requester',
-             'child_variable': 'agent'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'SupplyRequest_Requester',
-             'child_variable': 'onBehalfOf'},
-        ]
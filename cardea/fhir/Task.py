@@ -174,127 +174,6 @@ class Task(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'draft', 'requested', 'received', 'accepted', 'rejected', 'ready',
-                    'cancelled', 'in-progress', 'on-hold', 'failed', 'completed',
-                        'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, requested, received, accepted, rejected, ready, cancelled,'
-                        'in-progress, on-hold, failed, completed, entered-in-error'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Task',
-             'child_variable': 'context'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task',
-             'child_variable': 'performerType'},
-
-            {'parent_entity': 'Task_Restriction',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task',
-             'child_variable': 'restriction'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task',
-             'child_variable': 'executionPeriod'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Task',
-             'child_variable': 'basedOn'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Task',
-             'child_variable': 'focus'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task',
-             'child_variable': 'reason'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'Task_Input',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task',
-             'child_variable': 'input'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Task',
-             'child_variable': 'relevantHistory'},
-
-            {'parent_entity': 'Task_Requester',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task',
-             'child_variable': 'requester'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Task',
-             'child_variable': 'definitionReference'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Task',
-             'child_variable': 'owner'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task',
-             'child_variable': 'statusReason'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task',
-             'child_variable': 'groupIdentifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Task',
-             'child_variable': 'partOf'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Task',
-             'child_variable': '_for'},
-
-            {'parent_entity': 'Task_Output',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task',
-             'child_variable': 'output'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task',
-             'child_variable': 'businessStatus'},
-        ]
-
 
 class Task_Requester(fhirbase):
     """
@@ -321,20 +200,6 @@ class Task_Requester(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Task_Requester',
-             'child_variable': 'onBehalfOf'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Task_Requester',
-             'child_variable': 'agent'},
-        ]
-
 
 class Task_Restriction(fhirbase):
     """
@@ -367,20 +232,6 @@ class Task_Restriction(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Restriction',
-             'child_variable': 'period'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Task_Restriction',
-             'child_variable': 'recipient'},
-        ]
-
 
 class Task_Input(fhirbase):
     """
@@ -622,195 +473,6 @@ class Task_Input(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueCodeableConcept'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueContactDetail'},
-
-            {'parent_entity': 'Contributor',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueContributor'},
-
-            {'parent_entity': 'RelatedArtifact',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueRelatedArtifact'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueIdentifier'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueAttachment'},
-
-            {'parent_entity': 'Meta',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueMeta'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueSimpleQuantity'},
-
-            {'parent_entity': 'Extension',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueExtension'},
-
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueAddress'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valuePeriod'},
-
-            {'parent_entity': 'DataRequirement',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueDataRequirement'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueQuantity'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueReference'},
-
-            {'parent_entity': 'TriggerDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueTriggerDefinition'},
-
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueDuration'},
-
-            {'parent_entity': 'ElementDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueElementDefinition'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueMoney'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueRange'},
-
-            {'parent_entity': 'Signature',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueSignature'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueUsageContext'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueCoding'},
-
-            {'parent_entity': 'Dosage',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueDosage'},
-
-            {'parent_entity': 'Narrative',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueNarrative'},
-
-            {'parent_entity': 'Element',
-             'parent_variable': 'id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueElement'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueAnnotation'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Count',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueCount'},
-
-            {'parent_entity': 'Ratio',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueRatio'},
-
-            {'parent_entity': 'Distance',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueDistance'},
-
-            {'parent_entity': 'BackboneElement',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueBackboneElement'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueContactPoint'},
-
-            {'parent_entity': 'Age',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueAge'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueTiming'},
-
-            {'parent_entity': 'ParameterDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueParameterDefinition'},
-
-            {'parent_entity': 'HumanName',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueHumanName'},
-
-            {'parent_entity': 'SampledData',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Input',
-             'child_variable': 'valueSampledData'},
-        ]
-
 
 class Task_Output(fhirbase):
     """
@@ -1051,192 +713,3 @@ class Task_Output(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Signature',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueSignature'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueReference'},
-
-            {'parent_entity': 'BackboneElement',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueBackboneElement'},
-
-            {'parent_entity': 'RelatedArtifact',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueRelatedArtifact'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueSimpleQuantity'},
-
-            {'parent_entity': 'ContactPoint',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueContactPoint'},
-
-            {'parent_entity': 'Extension',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueExtension'},
-
-            {'parent_entity': 'Age',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueAge'},
-
-            {'parent_entity': 'Meta',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueMeta'},
-
-            {'parent_entity': 'Dosage',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueDosage'},
-
-            {'parent_entity': 'TriggerDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueTriggerDefinition'},
-
-            {'parent_entity': 'Distance',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueDistance'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueCoding'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueCodeableConcept'},
-
-            {'parent_entity': 'ElementDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueElementDefinition'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valuePeriod'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueIdentifier'},
-
-            {'parent_entity': 'DataRequirement',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueDataRequirement'},
-
-            {'parent_entity': 'SampledData',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueSampledData'},
-
-            {'parent_entity': 'Element',
-             'parent_variable': 'id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueElement'},
-
-            {'parent_entity': 'HumanName',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueHumanName'},
-
-            {'parent_entity': 'Money',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueMoney'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueQuantity'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueContactDetail'},
-
-            {'parent_entity': 'Attachment',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueAttachment'},
-
-            {'parent_entity': 'Count',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueCount'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueRange'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueTiming'},
-
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueDuration'},
-
-            {'parent_entity': 'Narrative',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueNarrative'},
-
-            {'parent_entity': 'ParameterDefinition',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueParameterDefinition'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueAnnotation'},
-
-            {'parent_entity': 'Ratio',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueRatio'},
-
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueUsageContext'},
-
-            {'parent_entity': 'Address',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueAddress'},
-
-            {'parent_entity': 'Contributor',
-             'parent_variable': 'object_id',
-             'child_entity': 'Task_Output',
-             'child_variable': 'valueContributor'},
-        ]
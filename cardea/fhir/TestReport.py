@@ -84,56 +84,6 @@ class TestReport(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'completed', 'in-progress', 'waiting', 'stopped', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'completed, in-progress, waiting, stopped, entered-in-error'))
-
-        if self.result is not None:
-            for value in self.result:
-                if value is not None and value.lower() not in [
-                        'pass', 'fail', 'pending']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'pass, fail, pending'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestReport_Participant',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestReport',
-             'child_variable': 'participant'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'TestReport',
-             'child_variable': 'testScript'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestReport',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'TestReport_Teardown',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestReport',
-             'child_variable': 'teardown'},
-
-            {'parent_entity': 'TestReport_Setup',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestReport',
-             'child_variable': 'setup'},
-
-            {'parent_entity': 'TestReport_Test',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestReport',
-             'child_variable': 'test'},
-        ]
-
 
 class TestReport_Participant(fhirbase):
     """
@@ -166,15 +116,6 @@ class TestReport_Participant(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'test-engine', 'client', 'server']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'test-engine, client, server'))
-
 
 class TestReport_Setup(fhirbase):
     """
@@ -198,15 +139,6 @@ class TestReport_Setup(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestReport_Action',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestReport_Setup',
-             'child_variable': 'action'},
-        ]
-
 
 class TestReport_Action(fhirbase):
     """
@@ -234,20 +166,6 @@ class TestReport_Action(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestReport_Operation',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestReport_Action',
-             'child_variable': 'operation'},
-
-            {'parent_entity': 'TestReport_Assert',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestReport_Action',
-             'child_variable': '_assert'},
-        ]
-
 
 class TestReport_Operation(fhirbase):
     """
@@ -280,15 +198,6 @@ class TestReport_Operation(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.result is not None:
-            for value in self.result:
-                if value is not None and value.lower() not in [
-                        'pass', 'skip', 'fail', 'warning', 'error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'pass, skip, fail, warning, error'))
-
 
 class TestReport_Assert(fhirbase):
     """
@@ -321,15 +230,6 @@ class TestReport_Assert(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.result is not None:
-            for value in self.result:
-                if value is not None and value.lower() not in [
-                        'pass', 'skip', 'fail', 'warning', 'error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'pass, skip, fail, warning, error'))
-
 
 class TestReport_Test(fhirbase):
     """
@@ -363,15 +263,6 @@ class TestReport_Test(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestReport_Action1',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestReport_Test',
-             'child_variable': 'action'},
-        ]
-
 
 class TestReport_Action1(fhirbase):
     """
@@ -399,20 +290,6 @@ class TestReport_Action1(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestReport_Assert',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestReport_Action1',
-             'child_variable': '_assert'},
-
-            {'parent_entity': 'TestReport_Operation',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestReport_Action1',
-             'child_variable': 'operation'},
-        ]
-
 
 class TestReport_Teardown(fhirbase):
     """
@@ -436,15 +313,6 @@ class TestReport_Teardown(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestReport_Action2',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestReport_Teardown',
-             'child_variable': 'action'},
-        ]
-
 
 class TestReport_Action2(fhirbase):
     """
@@ -466,12 +334,3 @@ class TestReport_Action2(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestReport_Operation',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestReport_Action2',
-             'child_variable': 'operation'},
-        ]
@@ -178,94 +178,6 @@ class TestScript(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript',
-             'child_variable': 'useContext'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'TestScript',
-             'child_variable': 'profile'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'TestScript_Fixture',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript',
-             'child_variable': 'fixture'},
-
-            {'parent_entity': 'TestScript_Teardown',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript',
-             'child_variable': 'teardown'},
-
-            {'parent_entity': 'TestScript_Ruleset',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript',
-             'child_variable': 'ruleset'},
-
-            {'parent_entity': 'TestScript_Rule',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript',
-             'child_variable': 'rule'},
-
-            {'parent_entity': 'TestScript_Variable',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript',
-             'child_variable': 'variable'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript',
-             'child_variable': 'jurisdiction'},
-
-            {'parent_entity': 'TestScript_Metadata',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript',
-             'child_variable': 'metadata'},
-
-            {'parent_entity': 'TestScript_Origin',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript',
-             'child_variable': 'origin'},
-
-            {'parent_entity': 'TestScript_Destination',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript',
-             'child_variable': 'destination'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'TestScript_Test',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript',
-             'child_variable': 'test'},
-
-            {'parent_entity': 'TestScript_Setup',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript',
-             'child_variable': 'setup'},
-        ]
-
 
 class TestScript_Origin(fhirbase):
     """
@@ -293,15 +205,6 @@ class TestScript_Origin(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Origin',
-             'child_variable': 'profile'},
-        ]
-
 
 class TestScript_Destination(fhirbase):
     """
@@ -329,15 +232,6 @@ class TestScript_Destination(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Destination',
-             'child_variable': 'profile'},
-        ]
-
 
 class TestScript_Metadata(fhirbase):
     """
@@ -367,20 +261,6 @@ class TestScript_Metadata(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestScript_Link',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Metadata',
-             'child_variable': 'link'},
-
-            {'parent_entity': 'TestScript_Capability',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Metadata',
-             'child_variable': 'capability'},
-        ]
-
 
 class TestScript_Link(fhirbase):
     """
@@ -461,15 +341,6 @@ class TestScript_Capability(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'TestScript_Capability',
-             'child_variable': 'capabilities'},
-        ]
-
 
 class TestScript_Fixture(fhirbase):
     """
@@ -507,15 +378,6 @@ class TestScript_Fixture(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'TestScript_Fixture',
-             'child_variable': 'resource'},
-        ]
-
 
 class TestScript_Variable(fhirbase):
     """
@@ -604,20 +466,6 @@ class TestScript_Rule(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestScript_Param',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Rule',
-             'child_variable': 'param'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'TestScript_Rule',
-             'child_variable': 'resource'},
-        ]
-
 
 class TestScript_Param(fhirbase):
     """
@@ -674,20 +522,6 @@ class TestScript_Ruleset(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'TestScript_Ruleset',
-             'child_variable': 'resource'},
-
-            {'parent_entity': 'TestScript_Rule1',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Ruleset',
-             'child_variable': 'rule'},
-        ]
-
 
 class TestScript_Rule1(fhirbase):
     """
@@ -717,15 +551,6 @@ class TestScript_Rule1(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestScript_Param1',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Rule1',
-             'child_variable': 'param'},
-        ]
-
 
 class TestScript_Param1(fhirbase):
     """
@@ -777,15 +602,6 @@ class TestScript_Setup(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestScript_Action',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Setup',
-             'child_variable': 'action'},
-        ]
-
 
 class TestScript_Action(fhirbase):
     """
@@ -813,20 +629,6 @@ class TestScript_Action(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestScript_Operation',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Action',
-             'child_variable': 'operation'},
-
-            {'parent_entity': 'TestScript_Assert',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Action',
-             'child_variable': '_assert'},
-        ]
-
 
 class TestScript_Operation(fhirbase):
     """
@@ -927,64 +729,6 @@ class TestScript_Operation(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.accept is not None:
-            for value in self.accept:
-                if value is not None and value.lower() not in [
-                        'xml', 'json', 'ttl', 'none']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'xml, json, ttl, none'))
-
-        if self.contentType is not None:
-            for value in self.contentType:
-                if value is not None and value.lower() not in [
-                        'xml', 'json', 'ttl', 'none']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'xml, json, ttl, none'))
-
-        if self.accept is not None:
-            for value in self.accept:
-                if value is not None and value.lower() not in [
-                        'xml', 'json', 'ttl', 'none']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'xml, json, ttl, none'))
-
-        if self.contentType is not None:
-            for value in self.contentType:
-                if value is not None and value.lower() not in [
-                        'xml', 'json', 'ttl', 'none']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'xml, json, ttl, none'))
-
-        if self.accept is not None:
-            for value in self.accept:
-                if value is not None and value.lower() not in [
-                        'xml', 'json', 'ttl', 'none']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'xml, json, ttl, none'))
-
-        if self.contentType is not None:
-            for value in self.contentType:
-                if value is not None and value.lower() not in [
-                        'xml', 'json', 'ttl', 'none']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'xml, json, ttl, none'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Operation',
-             'child_variable': 'type'},
-
-            {'parent_entity': 'TestScript_RequestHeader',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Operation',
-             'child_variable': 'requestHeader'},
-        ]
-
 
 class TestScript_RequestHeader(fhirbase):
     """
@@ -1157,102 +901,6 @@ class TestScript_Assert(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.direction is not None:
-            for value in self.direction:
-                if value is not None and value.lower() not in [
-                        'response', 'request']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'response, request'))
-
-        if self.contentType is not None:
-            for value in self.contentType:
-                if value is not None and value.lower() not in [
-                        'xml', 'json', 'ttl', 'none']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'xml, json, ttl, none'))
-
-        if self.operator is not None:
-            for value in self.operator:
-                if value is not None and value.lower() not in [
-                    'equals', 'notequals', 'in', 'notin', 'greaterthan', 'lessthan',
-                        'empty', 'notempty', 'contains', 'notcontains', 'eval']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'equals, notEquals, in, notIn, greaterThan, lessThan, empty,'
-                        ' notEmpty, contains, notContains, eval'))
-
-        if self.requestMethod is not None:
-            for value in self.requestMethod:
-                if value is not None and value.lower() not in [
-                        'delete', 'get', 'options', 'patch', 'post', 'put']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'delete, get, options, patch, post, put'))
-
-        if self.response is not None:
-            for value in self.response:
-                if value is not None and value.lower() not in [
-                    'okay', 'created', 'nocontent', 'notmodified', 'bad', 'forbidden',
-                    'notfound', 'methodnotallowed', 'conflict', 'gone',
-                        'preconditionfailed', 'unprocessable']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'okay, created, noContent, notModified, bad, forbidden, notFound,'
-                        'methodNotAllowed, conflict, gone, preconditionFailed, unprocessable'))
-
-        if self.direction is not None:
-            for value in self.direction:
-                if value is not None and value.lower() not in [
-                        'response', 'request']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'response, request'))
-
-        if self.contentType is not None:
-            for value in self.contentType:
-                if value is not None and value.lower() not in [
-                        'xml', 'json', 'ttl', 'none']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'xml, json, ttl, none'))
-
-        if self.operator is not None:
-            for value in self.operator:
-                if value is not None and value.lower() not in [
-                    'equals', 'notequals', 'in', 'notin', 'greaterthan', 'lessthan',
-                        'empty', 'notempty', 'contains', 'notcontains', 'eval']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'equals, notEquals, in, notIn, greaterThan, lessThan, empty,'
-                        ' notEmpty, contains, notContains, eval'))
-
-        if self.requestMethod is not None:
-            for value in self.requestMethod:
-                if value is not None and value.lower() not in [
-                        'delete', 'get', 'options', 'patch', 'post', 'put']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'delete, get, options, patch, post, put'))
-
-        if self.response is not None:
-            for value in self.response:
-                if value is not None and value.lower() not in [
-                    'okay', 'created', 'nocontent', 'notmodified', 'bad', 'forbidden',
-                    'notfound', 'methodnotallowed', 'conflict', 'gone',
-                        'preconditionfailed', 'unprocessable']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'okay, created, noContent, notModified, bad, forbidden, notFound,'
-                        'methodNotAllowed, conflict, gone, preconditionFailed, unprocessable'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestScript_Ruleset1',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Assert',
-             'child_variable': 'ruleset'},
-
-            {'parent_entity': 'TestScript_Rule2',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Assert',
-             'child_variable': 'rule'},
-        ]
-
 
 class TestScript_Rule2(fhirbase):
     """
@@ -1281,15 +929,6 @@ class TestScript_Rule2(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestScript_Param2',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Rule2',
-             'child_variable': 'param'},
-        ]
-
 
 class TestScript_Param2(fhirbase):
     """
@@ -1345,15 +984,6 @@ class TestScript_Ruleset1(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestScript_Rule3',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Ruleset1',
-             'child_variable': 'rule'},
-        ]
-
 
 class TestScript_Rule3(fhirbase):
     """
@@ -1383,15 +1013,6 @@ class TestScript_Rule3(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestScript_Param3',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Rule3',
-             'child_variable': 'param'},
-        ]
-
 
 class TestScript_Param3(fhirbase):
     """
@@ -1453,15 +1074,6 @@ class TestScript_Test(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestScript_Action1',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Test',
-             'child_variable': 'action'},
-        ]
-
 
 class TestScript_Action1(fhirbase):
     """
@@ -1489,20 +1101,6 @@ class TestScript_Action1(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestScript_Assert',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Action1',
-             'child_variable': '_assert'},
-
-            {'parent_entity': 'TestScript_Operation',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Action1',
-             'child_variable': 'operation'},
-        ]
-
 
 class TestScript_Teardown(fhirbase):
     """
@@ -1526,15 +1124,6 @@ class TestScript_Teardown(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestScript_Action2',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Teardown',
-             'child_variable': 'action'},
-        ]
-
 
 class TestScript_Action2(fhirbase):
     """
@@ -1556,12 +1145,3 @@ class TestScript_Action2(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'TestScript_Operation',
-             'parent_variable': 'object_id',
-             'child_entity': 'TestScript_Action2',
-             'child_variable': 'operation'},
-        ]
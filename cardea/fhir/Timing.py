@@ -40,20 +40,6 @@ class Timing(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'Timing',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Timing_Repeat',
-             'parent_variable': 'object_id',
-             'child_entity': 'Timing',
-             'child_variable': 'repeat'},
-        ]
-
 
 class Timing_Repeat(fhirbase):
     """
@@ -168,47 +154,3 @@ class Timing_Repeat(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.durationUnit is not None:
-            for value in self.durationUnit:
-                if value is not None and value.lower() not in [
-                        's', 'min', 'h', 'd', 'wk', 'mo', 'a']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 's, min, h, d, wk, mo, a'))
-
-        if self.periodUnit is not None:
-            for value in self.periodUnit:
-                if value is not None and value.lower() not in [
-                        's', 'min', 'h', 'd', 'wk', 'mo', 'a']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 's, min, h, d, wk, mo, a'))
-
-        if self.when is not None:
-            for value in self.when:
-                if value is not None and value.lower() not in [
-                    'morn', 'aft', 'eve', 'night', 'phs', 'hs', 'wake', 'c', 'cm', 'cd',
-                        'cv', 'ac', 'acm', 'acd', 'acv', 'pc', 'pcm', 'pcd', 'pcv']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'MORN, AFT, EVE, NIGHT, PHS, HS, WAKE, C, CM, CD, CV, AC, ACM, ACD,'
-                        'ACV, PC, PCM, PCD, PCV'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Duration',
-             'parent_variable': 'object_id',
-             'child_entity': 'Timing_Repeat',
-             'child_variable': 'boundsDuration'},
-
-            {'parent_entity': 'Period',
-             'parent_variable': 'object_id',
-             'child_entity': 'Timing_Repeat',
-             'child_variable': 'boundsPeriod'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'Timing_Repeat',
-             'child_variable': 'boundsRange'},
-        ]
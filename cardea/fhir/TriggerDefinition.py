@@ -52,33 +52,3 @@ class TriggerDefinition(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                    'named-event', 'periodic', 'data-added', 'data-modified',
-                        'data-removed', 'data-accessed', 'data-access-ended']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'named-event, periodic, data-added, data-modified, data-removed,'
-                        'data-accessed, data-access-ended'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'DataRequirement',
-             'parent_variable': 'object_id',
-             'child_entity': 'TriggerDefinition',
-             'child_variable': 'eventData'},
-
-            {'parent_entity': 'Timing',
-             'parent_variable': 'object_id',
-             'child_entity': 'TriggerDefinition',
-             'child_variable': 'eventTimingTiming'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'TriggerDefinition',
-             'child_variable': 'eventTimingReference'},
-        ]
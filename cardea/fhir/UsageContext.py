@@ -42,27 +42,3 @@ class UsageContext(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'UsageContext',
-             'child_variable': 'valueCodeableConcept'},
-
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'UsageContext',
-             'child_variable': 'code'},
-
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'UsageContext',
-             'child_variable': 'valueQuantity'},
-
-            {'parent_entity': 'Range',
-             'parent_variable': 'object_id',
-             'child_entity': 'UsageContext',
-             'child_variable': 'valueRange'},
-        ]
@@ -142,49 +142,6 @@ class ValueSet(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'UsageContext',
-             'parent_variable': 'object_id',
-             'child_entity': 'ValueSet',
-             'child_variable': 'useContext'},
-
-            {'parent_entity': 'ValueSet_Compose',
-             'parent_variable': 'object_id',
-             'child_entity': 'ValueSet',
-             'child_variable': 'compose'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'ValueSet',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'ContactDetail',
-             'parent_variable': 'object_id',
-             'child_entity': 'ValueSet',
-             'child_variable': 'contact'},
-
-            {'parent_entity': 'ValueSet_Expansion',
-             'parent_variable': 'identifier',
-             'child_entity': 'ValueSet',
-             'child_variable': 'expansion'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ValueSet',
-             'child_variable': 'jurisdiction'},
-        ]
-
 
 class ValueSet_Compose(fhirbase):
     """
@@ -232,20 +189,6 @@ class ValueSet_Compose(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ValueSet_Include',
-             'parent_variable': 'object_id',
-             'child_entity': 'ValueSet_Compose',
-             'child_variable': 'include'},
-
-            {'parent_entity': 'ValueSet_Include',
-             'parent_variable': 'object_id',
-             'child_entity': 'ValueSet_Compose',
-             'child_variable': 'exclude'},
-        ]
-
 
 class ValueSet_Include(fhirbase):
     """
@@ -291,20 +234,6 @@ class ValueSet_Include(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ValueSet_Concept',
-             'parent_variable': 'object_id',
-             'child_entity': 'ValueSet_Include',
-             'child_variable': 'concept'},
-
-            {'parent_entity': 'ValueSet_Filter',
-             'parent_variable': 'object_id',
-             'child_entity': 'ValueSet_Include',
-             'child_variable': 'filter'},
-        ]
-
 
 class ValueSet_Concept(fhirbase):
     """
@@ -341,15 +270,6 @@ class ValueSet_Concept(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ValueSet_Designation',
-             'parent_variable': 'object_id',
-             'child_entity': 'ValueSet_Concept',
-             'child_variable': 'designation'},
-        ]
-
 
 class ValueSet_Designation(fhirbase):
     """
@@ -380,15 +300,6 @@ class ValueSet_Designation(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Coding',
-             'parent_variable': 'object_id',
-             'child_entity': 'ValueSet_Designation',
-             'child_variable': 'use'},
-        ]
-
 
 class ValueSet_Filter(fhirbase):
     """
@@ -426,17 +337,6 @@ class ValueSet_Filter(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.op is not None:
-            for value in self.op:
-                if value is not None and value.lower() not in [
-                    '=', 'is-a', 'descendent-of', 'is-not-a', 'regex', 'in', 'not-in',
-                        'generalizes', 'exists']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, '=, is-a, descendent-of, is-not-a, regex, in, not-in, generalizes,'
-                        'exists'))
-
 
 class ValueSet_Expansion(fhirbase):
     """
@@ -489,20 +389,6 @@ class ValueSet_Expansion(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ValueSet_Parameter',
-             'parent_variable': 'object_id',
-             'child_entity': 'ValueSet_Expansion',
-             'child_variable': 'parameter'},
-
-            {'parent_entity': 'ValueSet_Contains',
-             'parent_variable': 'object_id',
-             'child_entity': 'ValueSet_Expansion',
-             'child_variable': 'contains'},
-        ]
-
 
 class ValueSet_Parameter(fhirbase):
     """
@@ -613,17 +499,3 @@ class ValueSet_Contains(fhirbase):
 
         if dict_values:
             self.set_attributes(dict_values)
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'ValueSet_Contains',
-             'parent_variable': 'object_id',
-             'child_entity': 'ValueSet_Contains',
-             'child_variable': 'contains'},
-
-            {'parent_entity': 'ValueSet_Designation',
-             'parent_variable': 'object_id',
-             'child_entity': 'ValueSet_Contains',
-             'child_variable': 'designation'},
-        ]
@@ -67,45 +67,6 @@ class VisionPrescription(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'VisionPrescription_Dispense',
-             'parent_variable': 'object_id',
-             'child_entity': 'VisionPrescription',
-             'child_variable': 'dispense'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'VisionPrescription',
-             'child_variable': 'prescriber'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'VisionPrescription',
-             'child_variable': 'reasonCodeableConcept'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'VisionPrescription',
-             'child_variable': 'encounter'},
-
-            {'parent_entity': 'Identifier',
-             'parent_variable': 'object_id',
-             'child_entity': 'VisionPrescription',
-             'child_variable': 'identifier'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'VisionPrescription',
-             'child_variable': 'reasonReference'},
-
-            {'parent_entity': 'Reference',
-             'parent_variable': 'identifier',
-             'child_entity': 'VisionPrescription',
-             'child_variable': 'patient'},
-        ]
-
 
 class VisionPrescription_Dispense(fhirbase):
     """
@@ -192,38 +153,3 @@ class VisionPrescription_Dispense(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.eye is not None:
-            for value in self.eye:
-                if value is not None and value.lower() not in [
-                        'right', 'left']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'right, left'))
-
-        if self.base is not None:
-            for value in self.base:
-                if value is not None and value.lower() not in [
-                        'up', 'down', 'in', 'out']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'up, down, in, out'))
-
-    def get_relationships(self):
-
-        return [
-            {'parent_entity': 'Quantity',
-             'parent_variable': 'object_id',
-             'child_entity': 'VisionPrescription_Dispense',
-             'child_variable': 'duration'},
-
-            {'parent_entity': 'Annotation',
-             'parent_variable': 'object_id',
-             'child_entity': 'VisionPrescription_Dispense',
-             'child_variable': 'note'},
-
-            {'parent_entity': 'CodeableConcept',
-             'parent_variable': 'object_id',
-             'child_entity': 'VisionPrescription_Dispense',
-             'child_variable': 'product'},
-        ]
@@ -0,0 +1,6091 @@
+"""Index of the FHIR resource classes.
+
+``RESOURCES`` maps every class to the module that defines it,
+``ENUMERATIONS`` holds the possible values of the enumerated attributes
+of each class, ``TYPES`` the declared type of its primitive attributes and
+``RELATIONSHIPS`` lists the references between classes.
+
+The entries mirror the ``# type:``, ``# possible values:`` and ``# reference to``
+comments of the class definitions in ``cardea.fhir``; update both when a resource
+module changes. ``tests/cardea/fhir/test_index.py`` rebuilds the index from those
+comments and fails when the two differ.
+"""
+
+RESOURCES = {
+    'Account': 'Account',
+    'Account_Coverage': 'Account',
+    'Account_Guarantor': 'Account',
+    'ActivityDefinition': 'ActivityDefinition',
+    'ActivityDefinition_DynamicValue': 'ActivityDefinition',
+    'ActivityDefinition_Participant': 'ActivityDefinition',
+    'Address': 'Address',
+    'AdverseEvent': 'AdverseEvent',
+    'AdverseEvent_SuspectEntity': 'AdverseEvent',
+    'Age': 'Age',
+    'AllergyIntolerance': 'AllergyIntolerance',
+    'AllergyIntolerance_Reaction': 'AllergyIntolerance',
+    'Annotation': 'Annotation',
+    'Appointment': 'Appointment',
+    'Appointment_Participant': 'Appointment',
+    'AppointmentResponse': 'AppointmentResponse',
+    'Attachment': 'Attachment',
+    'AuditEvent': 'AuditEvent',
+    'AuditEvent_Agent': 'AuditEvent',
+    'AuditEvent_Detail': 'AuditEvent',
+    'AuditEvent_Entity': 'AuditEvent',
+    'AuditEvent_Network': 'AuditEvent',
+    'AuditEvent_Source': 'AuditEvent',
+    'BackboneElement': 'BackboneElement',
+    'Basic': 'Basic',
+    'Binary': 'Binary',
+    'BodySite': 'BodySite',
+    'Bundle': 'Bundle',
+    'Bundle_Entry': 'Bundle',
+    'Bundle_Link': 'Bundle',
+    'Bundle_Request': 'Bundle',
+    'Bundle_Response': 'Bundle',
+    'Bundle_Search': 'Bundle',
+    'CapabilityStatement': 'CapabilityStatement',
+    'CapabilityStatement_Certificate': 'CapabilityStatement',
+    'CapabilityStatement_Document': 'CapabilityStatement',
+    'CapabilityStatement_Endpoint': 'CapabilityStatement',
+    'CapabilityStatement_Event': 'CapabilityStatement',
+    'CapabilityStatement_Implementation': 'CapabilityStatement',
+    'CapabilityStatement_Interaction': 'CapabilityStatement',
+    'CapabilityStatement_Interaction1': 'CapabilityStatement',
+    'CapabilityStatement_Messaging': 'CapabilityStatement',
+    'CapabilityStatement_Operation': 'CapabilityStatement',
+    'CapabilityStatement_Resource': 'CapabilityStatement',
+    'CapabilityStatement_Rest': 'CapabilityStatement',
+    'CapabilityStatement_SearchParam': 'CapabilityStatement',
+    'CapabilityStatement_Security': 'CapabilityStatement',
+    'CapabilityStatement_Software': 'CapabilityStatement',
+    'CapabilityStatement_SupportedMessage': 'CapabilityStatement',
+    'CarePlan': 'CarePlan',
+    'CarePlan_Activity': 'CarePlan',
+    'CarePlan_Detail': 'CarePlan',
+    'CareTeam': 'CareTeam',
+    'CareTeam_Participant': 'CareTeam',
+    'ChargeItem': 'ChargeItem',
+    'ChargeItem_Participant': 'ChargeItem',
+    'Claim': 'Claim',
+    'Claim_Accident': 'Claim',
+    'Claim_CareTeam': 'Claim',
+    'Claim_Detail': 'Claim',
+    'Claim_Diagnosis': 'Claim',
+    'Claim_Information': 'Claim',
+    'Claim_Insurance': 'Claim',
+    'Claim_Item': 'Claim',
+    'Claim_Payee': 'Claim',
+    'Claim_Procedure': 'Claim',
+    'Claim_Related': 'Claim',
+    'Claim_SubDetail': 'Claim',
+    'ClaimResponse': 'ClaimResponse',
+    'ClaimResponse_AddItem': 'ClaimResponse',
+    'ClaimResponse_Adjudication': 'ClaimResponse',
+    'ClaimResponse_Detail': 'ClaimResponse',
+    'ClaimResponse_Detail1': 'ClaimResponse',
+    'ClaimResponse_Error': 'ClaimResponse',
+    'ClaimResponse_Insurance': 'ClaimResponse',
+    'ClaimResponse_Item': 'ClaimResponse',
+    'ClaimResponse_Payment': 'ClaimResponse',
+    'ClaimResponse_ProcessNote': 'ClaimResponse',
+    'ClaimResponse_SubDetail': 'ClaimResponse',
+    'ClinicalImpression': 'ClinicalImpression',
+    'ClinicalImpression_Finding': 'ClinicalImpression',
+    'ClinicalImpression_Investigation': 'ClinicalImpression',
+    'CodeableConcept': 'CodeableConcept',
+    'CodeSystem': 'CodeSystem',
+    'CodeSystem_Concept': 'CodeSystem',
+    'CodeSystem_Designation': 'CodeSystem',
+    'CodeSystem_Filter': 'CodeSystem',
+    'CodeSystem_Property': 'CodeSystem',
+    'CodeSystem_Property1': 'CodeSystem',
+    'Coding': 'Coding',
+    'Communication': 'Communication',
+    'Communication_Payload': 'Communication',
+    'CommunicationRequest': 'CommunicationRequest',
+    'CommunicationRequest_Payload': 'CommunicationRequest',
+    'CommunicationRequest_Requester': 'CommunicationRequest',
+    'CompartmentDefinition': 'CompartmentDefinition',
+    'CompartmentDefinition_Resource': 'CompartmentDefinition',
+    'Composition': 'Composition',
+    'Composition_Attester': 'Composition',
+    'Composition_Event': 'Composition',
+    'Composition_RelatesTo': 'Composition',
+    'Composition_Section': 'Composition',
+    'ConceptMap': 'ConceptMap',
+    'ConceptMap_DependsOn': 'ConceptMap',
+    'ConceptMap_Element': 'ConceptMap',
+    'ConceptMap_Group': 'ConceptMap',
+    'ConceptMap_Target': 'ConceptMap',
+    'ConceptMap_Unmapped': 'ConceptMap',
+    'Condition': 'Condition',
+    'Condition_Evidence': 'Condition',
+    'Condition_Stage': 'Condition',
+    'Consent': 'Consent',
+    'Consent_Actor': 'Consent',
+    'Consent_Actor1': 'Consent',
+    'Consent_Data': 'Consent',
+    'Consent_Data1': 'Consent',
+    'Consent_Except': 'Consent',
+    'Consent_Policy': 'Consent',
+    'ContactDetail': 'ContactDetail',
+    'ContactPoint': 'ContactPoint',
+    'Contract': 'Contract',
+    'Contract_Agent': 'Contract',
+    'Contract_Agent1': 'Contract',
+    'Contract_Friendly': 'Contract',
+    'Contract_Legal': 'Contract',
+    'Contract_Rule': 'Contract',
+    'Contract_Signer': 'Contract',
+    'Contract_Term': 'Contract',
+    'Contract_ValuedItem': 'Contract',
+    'Contract_ValuedItem1': 'Contract',
+    'Contributor': 'Contributor',
+    'Count': 'Count',
+    'Coverage': 'Coverage',
+    'Coverage_Grouping': 'Coverage',
+    'DataElement': 'DataElement',
+    'DataElement_Mapping': 'DataElement',
+    'DataRequirement': 'DataRequirement',
+    'DataRequirement_CodeFilter': 'DataRequirement',
+    'DataRequirement_DateFilter': 'DataRequirement',
+    'DetectedIssue': 'DetectedIssue',
+    'DetectedIssue_Mitigation': 'DetectedIssue',
+    'Device': 'Device',
+    'Device_Udi': 'Device',
+    'DeviceComponent': 'DeviceComponent',
+    'DeviceComponent_ProductionSpecification': 'DeviceComponent',
+    'DeviceMetric': 'DeviceMetric',
+    'DeviceMetric_Calibration': 'DeviceMetric',
+    'DeviceRequest': 'DeviceRequest',
+    'DeviceRequest_Requester': 'DeviceRequest',
+    'DeviceUseStatement': 'DeviceUseStatement',
+    'DiagnosticReport': 'DiagnosticReport',
+    'DiagnosticReport_Image': 'DiagnosticReport',
+    'DiagnosticReport_Performer': 'DiagnosticReport',
+    'Distance': 'Distance',
+    'DocumentManifest': 'DocumentManifest',
+    'DocumentManifest_Content': 'DocumentManifest',
+    'DocumentManifest_Related': 'DocumentManifest',
+    'DocumentReference': 'DocumentReference',
+    'DocumentReference_Content': 'DocumentReference',
+    'DocumentReference_Context': 'DocumentReference',
+    'DocumentReference_Related': 'DocumentReference',
+    'DocumentReference_RelatesTo': 'DocumentReference',
+    'DomainResource': 'DomainResource',
+    'Dosage': 'Dosage',
+    'Duration': 'Duration',
+    'Element': 'Element',
+    'ElementDefinition': 'ElementDefinition',
+    'ElementDefinition_Base': 'ElementDefinition',
+    'ElementDefinition_Binding': 'ElementDefinition',
+    'ElementDefinition_Constraint': 'ElementDefinition',
+    'ElementDefinition_Discriminator': 'ElementDefinition',
+    'ElementDefinition_Example': 'ElementDefinition',
+    'ElementDefinition_Mapping': 'ElementDefinition',
+    'ElementDefinition_Slicing': 'ElementDefinition',
+    'ElementDefinition_Type': 'ElementDefinition',
+    'EligibilityRequest': 'EligibilityRequest',
+    'EligibilityResponse': 'EligibilityResponse',
+    'EligibilityResponse_BenefitBalance': 'EligibilityResponse',
+    'EligibilityResponse_Error': 'EligibilityResponse',
+    'EligibilityResponse_Financial': 'EligibilityResponse',
+    'EligibilityResponse_Insurance': 'EligibilityResponse',
+    'Encounter': 'Encounter',
+    'Encounter_ClassHistory': 'Encounter',
+    'Encounter_Diagnosis': 'Encounter',
+    'Encounter_Hospitalization': 'Encounter',
+    'Encounter_Location': 'Encounter',
+    'Encounter_Participant': 'Encounter',
+    'Encounter_StatusHistory': 'Encounter',
+    'Endpoint': 'Endpoint',
+    'EnrollmentRequest': 'EnrollmentRequest',
+    'EnrollmentResponse': 'EnrollmentResponse',
+    'EpisodeOfCare': 'EpisodeOfCare',
+    'EpisodeOfCare_Diagnosis': 'EpisodeOfCare',
+    'EpisodeOfCare_StatusHistory': 'EpisodeOfCare',
+    'ExpansionProfile': 'ExpansionProfile',
+    'ExpansionProfile_Designation': 'ExpansionProfile',
+    'ExpansionProfile_Designation1': 'ExpansionProfile',
+    'ExpansionProfile_Designation2': 'ExpansionProfile',
+    'ExpansionProfile_Exclude': 'ExpansionProfile',
+    'ExpansionProfile_ExcludedSystem': 'ExpansionProfile',
+    'ExpansionProfile_FixedVersion': 'ExpansionProfile',
+    'ExpansionProfile_Include': 'ExpansionProfile',
+    'ExplanationOfBenefit': 'ExplanationOfBenefit',
+    'ExplanationOfBenefit_Accident': 'ExplanationOfBenefit',
+    'ExplanationOfBenefit_AddItem': 'ExplanationOfBenefit',
+    'ExplanationOfBenefit_Adjudication': 'ExplanationOfBenefit',
+    'ExplanationOfBenefit_BenefitBalance': 'ExplanationOfBenefit',
+    'ExplanationOfBenefit_CareTeam': 'ExplanationOfBenefit',
+    'ExplanationOfBenefit_Detail': 'ExplanationOfBenefit',
+    'ExplanationOfBenefit_Detail1': 'ExplanationOfBenefit',
+    'ExplanationOfBenefit_Diagnosis': 'ExplanationOfBenefit',
+    'ExplanationOfBenefit_Financial': 'ExplanationOfBenefit',
+    'ExplanationOfBenefit_Information': 'ExplanationOfBenefit',
+    'ExplanationOfBenefit_Insurance': 'ExplanationOfBenefit',
+    'ExplanationOfBenefit_Item': 'ExplanationOfBenefit',
+    'ExplanationOfBenefit_Payee': 'ExplanationOfBenefit',
+    'ExplanationOfBenefit_Payment': 'ExplanationOfBenefit',
+    'ExplanationOfBenefit_Procedure': 'ExplanationOfBenefit',
+    'ExplanationOfBenefit_ProcessNote': 'ExplanationOfBenefit',
+    'ExplanationOfBenefit_Related': 'ExplanationOfBenefit',
+    'ExplanationOfBenefit_SubDetail': 'ExplanationOfBenefit',
+    'Extension': 'Extension',
+    'FamilyMemberHistory': 'FamilyMemberHistory',
+    'FamilyMemberHistory_Condition': 'FamilyMemberHistory',
+    'fhirbase': 'fhirbase',
+    'Flag': 'Flag',
+    'Goal': 'Goal',
+    'Goal_Target': 'Goal',
+    'GraphDefinition': 'GraphDefinition',
+    'GraphDefinition_Compartment': 'GraphDefinition',
+    'GraphDefinition_Link': 'GraphDefinition',
+    'GraphDefinition_Target': 'GraphDefinition',
+    'Group': 'Group',
+    'Group_Characteristic': 'Group',
+    'Group_Member': 'Group',
+    'GuidanceResponse': 'GuidanceResponse',
+    'HealthcareService': 'HealthcareService',
+    'HealthcareService_AvailableTime': 'HealthcareService',
+    'HealthcareService_NotAvailable': 'HealthcareService',
+    'HumanName': 'HumanName',
+    'Identifier': 'Identifier',
+    'ImagingManifest': 'ImagingManifest',
+    'ImagingManifest_Instance': 'ImagingManifest',
+    'ImagingManifest_Series': 'ImagingManifest',
+    'ImagingManifest_Study': 'ImagingManifest',
+    'ImagingStudy': 'ImagingStudy',
+    'ImagingStudy_Instance': 'ImagingStudy',
+    'ImagingStudy_Series': 'ImagingStudy',
+    'Immunization': 'Immunization',
+    'Immunization_Explanation': 'Immunization',
+    'Immunization_Practitioner': 'Immunization',
+    'Immunization_Reaction': 'Immunization',
+    'Immunization_VaccinationProtocol': 'Immunization',
+    'ImmunizationRecommendation': 'ImmunizationRecommendation',
+    'ImmunizationRecommendation_DateCriterion': 'ImmunizationRecommendation',
+    'ImmunizationRecommendation_Protocol': 'ImmunizationRecommendation',
+    'ImmunizationRecommendation_Recommendation': 'ImmunizationRecommendation',
+    'ImplementationGuide': 'ImplementationGuide',
+    'ImplementationGuide_Dependency': 'ImplementationGuide',
+    'ImplementationGuide_Global': 'ImplementationGuide',
+    'ImplementationGuide_Package': 'ImplementationGuide',
+    'ImplementationGuide_Page': 'ImplementationGuide',
+    'ImplementationGuide_Resource': 'ImplementationGuide',
+    'Library': 'Library',
+    'Linkage': 'Linkage',
+    'Linkage_Item': 'Linkage',
+    'List': 'List',
+    'List_Entry': 'List',
+    'Location': 'Location',
+    'Location_Position': 'Location',
+    'Measure': 'Measure',
+    'Measure_Group': 'Measure',
+    'Measure_Population': 'Measure',
+    'Measure_Stratifier': 'Measure',
+    'Measure_SupplementalData': 'Measure',
+    'MeasureReport': 'MeasureReport',
+    'MeasureReport_Group': 'MeasureReport',
+    'MeasureReport_Population': 'MeasureReport',
+    'MeasureReport_Population1': 'MeasureReport',
+    'MeasureReport_Stratifier': 'MeasureReport',
+    'MeasureReport_Stratum': 'MeasureReport',
+    'Media': 'Media',
+    'Medication': 'Medication',
+    'Medication_Batch': 'Medication',
+    'Medication_Content': 'Medication',
+    'Medication_Ingredient': 'Medication',
+    'Medication_Package': 'Medication',
+    'MedicationAdministration': 'MedicationAdministration',
+    'MedicationAdministration_Dosage': 'MedicationAdministration',
+    'MedicationAdministration_Performer': 'MedicationAdministration',
+    'MedicationDispense': 'MedicationDispense',
+    'MedicationDispense_Performer': 'MedicationDispense',
+    'MedicationDispense_Substitution': 'MedicationDispense',
+    'MedicationRequest': 'MedicationRequest',
+    'MedicationRequest_DispenseRequest': 'MedicationRequest',
+    'MedicationRequest_Requester': 'MedicationRequest',
+    'MedicationRequest_Substitution': 'MedicationRequest',
+    'MedicationStatement': 'MedicationStatement',
+    'MessageDefinition': 'MessageDefinition',
+    'MessageDefinition_AllowedResponse': 'MessageDefinition',
+    'MessageDefinition_Focus': 'MessageDefinition',
+    'MessageHeader': 'MessageHeader',
+    'MessageHeader_Destination': 'MessageHeader',
+    'MessageHeader_Response': 'MessageHeader',
+    'MessageHeader_Source': 'MessageHeader',
+    'Meta': 'Meta',
+    'Money': 'Money',
+    'NamingSystem': 'NamingSystem',
+    'NamingSystem_UniqueId': 'NamingSystem',
+    'Narrative': 'Narrative',
+    'NutritionOrder': 'NutritionOrder',
+    'NutritionOrder_Administration': 'NutritionOrder',
+    'NutritionOrder_EnteralFormula': 'NutritionOrder',
+    'NutritionOrder_Nutrient': 'NutritionOrder',
+    'NutritionOrder_OralDiet': 'NutritionOrder',
+    'NutritionOrder_Supplement': 'NutritionOrder',
+    'NutritionOrder_Texture': 'NutritionOrder',
+    'Observation': 'Observation',
+    'Observation_Component': 'Observation',
+    'Observation_ReferenceRange': 'Observation',
+    'Observation_Related': 'Observation',
+    'OperationDefinition': 'OperationDefinition',
+    'OperationDefinition_Binding': 'OperationDefinition',
+    'OperationDefinition_Overload': 'OperationDefinition',
+    'OperationDefinition_Parameter': 'OperationDefinition',
+    'OperationOutcome': 'OperationOutcome',
+    'OperationOutcome_Issue': 'OperationOutcome',
+    'Organization': 'Organization',
+    'Organization_Contact': 'Organization',
+    'ParameterDefinition': 'ParameterDefinition',
+    'Parameters': 'Parameters',
+    'Parameters_Parameter': 'Parameters',
+    'Patient': 'Patient',
+    'Patient_Animal': 'Patient',
+    'Patient_Communication': 'Patient',
+    'Patient_Contact': 'Patient',
+    'Patient_Link': 'Patient',
+    'PaymentNotice': 'PaymentNotice',
+    'PaymentReconciliation': 'PaymentReconciliation',
+    'PaymentReconciliation_Detail': 'PaymentReconciliation',
+    'PaymentReconciliation_ProcessNote': 'PaymentReconciliation',
+    'Period': 'Period',
+    'Person': 'Person',
+    'Person_Link': 'Person',
+    'PlanDefinition': 'PlanDefinition',
+    'PlanDefinition_Action': 'PlanDefinition',
+    'PlanDefinition_Condition': 'PlanDefinition',
+    'PlanDefinition_DynamicValue': 'PlanDefinition',
+    'PlanDefinition_Goal': 'PlanDefinition',
+    'PlanDefinition_Participant': 'PlanDefinition',
+    'PlanDefinition_RelatedAction': 'PlanDefinition',
+    'PlanDefinition_Target': 'PlanDefinition',
+    'Practitioner': 'Practitioner',
+    'Practitioner_Qualification': 'Practitioner',
+    'PractitionerRole': 'PractitionerRole',
+    'PractitionerRole_AvailableTime': 'PractitionerRole',
+    'PractitionerRole_NotAvailable': 'PractitionerRole',
+    'Procedure': 'Procedure',
+    'Procedure_FocalDevice': 'Procedure',
+    'Procedure_Performer': 'Procedure',
+    'ProcedureRequest': 'ProcedureRequest',
+    'ProcedureRequest_Requester': 'ProcedureRequest',
+    'ProcessRequest': 'ProcessRequest',
+    'ProcessRequest_Item': 'ProcessRequest',
+    'ProcessResponse': 'ProcessResponse',
+    'ProcessResponse_ProcessNote': 'ProcessResponse',
+    'Provenance': 'Provenance',
+    'Provenance_Agent': 'Provenance',
+    'Provenance_Entity': 'Provenance',
+    'Quantity': 'Quantity',
+    'Questionnaire': 'Questionnaire',
+    'Questionnaire_EnableWhen': 'Questionnaire',
+    'Questionnaire_Item': 'Questionnaire',
+    'Questionnaire_Option': 'Questionnaire',
+    'QuestionnaireResponse': 'QuestionnaireResponse',
+    'QuestionnaireResponse_Answer': 'QuestionnaireResponse',
+    'QuestionnaireResponse_Item': 'QuestionnaireResponse',
+    'Range': 'Range',
+    'Ratio': 'Ratio',
+    'Reference': 'Reference',
+    'ReferralRequest': 'ReferralRequest',
+    'ReferralRequest_Requester': 'ReferralRequest',
+    'RelatedArtifact': 'RelatedArtifact',
+    'RelatedPerson': 'RelatedPerson',
+    'RequestGroup': 'RequestGroup',
+    'RequestGroup_Action': 'RequestGroup',
+    'RequestGroup_Condition': 'RequestGroup',
+    'RequestGroup_RelatedAction': 'RequestGroup',
+    'ResearchStudy': 'ResearchStudy',
+    'ResearchStudy_Arm': 'ResearchStudy',
+    'ResearchSubject': 'ResearchSubject',
+    'Resource': 'Resource',
+    'ResourceList': 'ResourceList',
+    'RiskAssessment': 'RiskAssessment',
+    'RiskAssessment_Prediction': 'RiskAssessment',
+    'SampledData': 'SampledData',
+    'Schedule': 'Schedule',
+    'SearchParameter': 'SearchParameter',
+    'SearchParameter_Component': 'SearchParameter',
+    'Sequence': 'Sequence',
+    'Sequence_Quality': 'Sequence',
+    'Sequence_ReferenceSeq': 'Sequence',
+    'Sequence_Repository': 'Sequence',
+    'Sequence_Variant': 'Sequence',
+    'ServiceDefinition': 'ServiceDefinition',
+    'Signature': 'Signature',
+    'Slot': 'Slot',
+    'Specimen': 'Specimen',
+    'Specimen_Collection': 'Specimen',
+    'Specimen_Container': 'Specimen',
+    'Specimen_Processing': 'Specimen',
+    'StructureDefinition': 'StructureDefinition',
+    'StructureDefinition_Differential': 'StructureDefinition',
+    'StructureDefinition_Mapping': 'StructureDefinition',
+    'StructureDefinition_Snapshot': 'StructureDefinition',
+    'StructureMap': 'StructureMap',
+    'StructureMap_Dependent': 'StructureMap',
+    'StructureMap_Group': 'StructureMap',
+    'StructureMap_Input': 'StructureMap',
+    'StructureMap_Parameter': 'StructureMap',
+    'StructureMap_Rule': 'StructureMap',
+    'StructureMap_Source': 'StructureMap',
+    'StructureMap_Structure': 'StructureMap',
+    'StructureMap_Target': 'StructureMap',
+    'Subscription': 'Subscription',
+    'Subscription_Channel': 'Subscription',
+    'Substance': 'Substance',
+    'Substance_Ingredient': 'Substance',
+    'Substance_Instance': 'Substance',
+    'SupplyDelivery': 'SupplyDelivery',
+    'SupplyDelivery_SuppliedItem': 'SupplyDelivery',
+    'SupplyRequest': 'SupplyRequest',
+    'SupplyRequest_OrderedItem': 'SupplyRequest',
+    'SupplyRequest_Requester': 'SupplyRequest',
+    'Task': 'Task',
+    'Task_Input': 'Task',
+    'Task_Output': 'Task',
+    'Task_Requester': 'Task',
+    'Task_Restriction': 'Task',
+    'TestReport': 'TestReport',
+    'TestReport_Action': 'TestReport',
+    'TestReport_Action1': 'TestReport',
+    'TestReport_Action2': 'TestReport',
+    'TestReport_Assert': 'TestReport',
+    'TestReport_Operation': 'TestReport',
+    'TestReport_Participant': 'TestReport',
+    'TestReport_Setup': 'TestReport',
+    'TestReport_Teardown': 'TestReport',
+    'TestReport_Test': 'TestReport',
+    'TestScript': 'TestScript',
+    'TestScript_Action': 'TestScript',
+    'TestScript_Action1': 'TestScript',
+    'TestScript_Action2': 'TestScript',
+    'TestScript_Assert': 'TestScript',
+    'TestScript_Capability': 'TestScript',
+    'TestScript_Destination': 'TestScript',
+    'TestScript_Fixture': 'TestScript',
+    'TestScript_Link': 'TestScript',
+    'TestScript_Metadata': 'TestScript',
+    'TestScript_Operation': 'TestScript',
+    'TestScript_Origin': 'TestScript',
+    'TestScript_Param': 'TestScript',
+    'TestScript_Param1': 'TestScript',
+    'TestScript_Param2': 'TestScript',
+    'TestScript_Param3': 'TestScript',
+    'TestScript_RequestHeader': 'TestScript',
+    'TestScript_Rule': 'TestScript',
+    'TestScript_Rule1': 'TestScript',
+    'TestScript_Rule2': 'TestScript',
+    'TestScript_Rule3': 'TestScript',
+    'TestScript_Ruleset': 'TestScript',
+    'TestScript_Ruleset1': 'TestScript',
+    'TestScript_Setup': 'TestScript',
+    'TestScript_Teardown': 'TestScript',
+    'TestScript_Test': 'TestScript',
+    'TestScript_Variable': 'TestScript',
+    'Timing': 'Timing',
+    'Timing_Repeat': 'Timing',
+    'TriggerDefinition': 'TriggerDefinition',
+    'UsageContext': 'UsageContext',
+    'ValueSet': 'ValueSet',
+    'ValueSet_Compose': 'ValueSet',
+    'ValueSet_Concept': 'ValueSet',
+    'ValueSet_Contains': 'ValueSet',
+    'ValueSet_Designation': 'ValueSet',
+    'ValueSet_Expansion': 'ValueSet',
+    'ValueSet_Filter': 'ValueSet',
+    'ValueSet_Include': 'ValueSet',
+    'ValueSet_Parameter': 'ValueSet',
+    'VisionPrescription': 'VisionPrescription',
+    'VisionPrescription_Dispense': 'VisionPrescription',
+}
+
+
+ENUMERATIONS = {
+    'Account': {
+        'status': ('active', 'inactive', 'entered-in-error'),
+    },
+    'ActivityDefinition': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+    },
+    'Address': {
+        'use': ('home', 'work', 'temp', 'old'),
+        'type': ('postal', 'physical', 'both'),
+    },
+    'AdverseEvent': {
+        'category': ('ae', 'pae'),
+    },
+    'AdverseEvent_SuspectEntity': {
+        'causality': ('causality1', 'causality2'),
+    },
+    'AllergyIntolerance': {
+        'clinicalStatus': ('active', 'inactive', 'resolved'),
+        'verificationStatus': ('unconfirmed', 'confirmed', 'refuted', 'entered-in-error'),
+        'type': ('allergy', 'intolerance'),
+        'category': ('food', 'medication', 'environment', 'biologic'),
+        'criticality': ('low', 'high', 'unable-to-assess'),
+    },
+    'AllergyIntolerance_Reaction': {
+        'severity': ('mild', 'moderate', 'severe'),
+    },
+    'Appointment': {
+        'status': (
+            'proposed', 'pending', 'booked', 'arrived', 'fulfilled', 'cancelled', 'noshow',
+            'entered-in-error'),
+    },
+    'Appointment_Participant': {
+        'required': ('required', 'optional', 'information-only'),
+        'status': ('accepted', 'declined', 'tentative', 'needs-action'),
+    },
+    'AuditEvent': {
+        'action': ('c', 'r', 'u', 'd', 'e'),
+        'outcome': ('0', '4', '8', '12'),
+    },
+    'AuditEvent_Network': {
+        'type': ('1', '2', '3', '4', '5'),
+    },
+    'Bundle': {
+        'type': (
+            'document', 'message', 'transaction', 'transaction-response', 'batch',
+            'batch-response', 'history', 'searchset', 'collection'),
+    },
+    'Bundle_Search': {
+        'mode': ('match', 'include', 'outcome'),
+    },
+    'Bundle_Request': {
+        'method': ('get', 'post', 'put', 'delete'),
+    },
+    'CapabilityStatement': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+        'kind': ('instance', 'capability', 'requirements'),
+        'acceptUnknown': ('no', 'extensions', 'elements', 'both'),
+    },
+    'CapabilityStatement_Rest': {
+        'mode': ('client', 'server'),
+    },
+    'CapabilityStatement_Resource': {
+        'versioning': ('no-version', 'versioned', 'versioned-update'),
+        'conditionalRead': ('not-supported', 'modified-since', 'not-match', 'full-support'),
+        'conditionalDelete': ('not-supported', 'single', 'multiple'),
+        'referencePolicy': ('literal', 'logical', 'resolves', 'enforced', 'local'),
+    },
+    'CapabilityStatement_Interaction': {
+        'code': (
+            'read', 'vread', 'update', 'patch', 'delete', 'history-instance', 'history-type',
+            'create', 'search-type'),
+    },
+    'CapabilityStatement_SearchParam': {
+        'type': ('number', 'date', 'string', 'token', 'reference', 'composite', 'quantity', 'uri'),
+    },
+    'CapabilityStatement_Interaction1': {
+        'code': ('transaction', 'batch', 'search-system', 'history-system'),
+    },
+    'CapabilityStatement_SupportedMessage': {
+        'mode': ('sender', 'receiver'),
+    },
+    'CapabilityStatement_Event': {
+        'category': ('consequence', 'currency', 'notification'),
+        'mode': ('sender', 'receiver'),
+    },
+    'CapabilityStatement_Document': {
+        'mode': ('producer', 'consumer'),
+    },
+    'CarePlan': {
+        'status': (
+            'draft', 'active', 'suspended', 'completed', 'entered-in-error', 'cancelled',
+            'unknown'),
+        'intent': ('proposal', 'plan', 'order', 'option'),
+    },
+    'CarePlan_Detail': {
+        'status': (
+            'not-started', 'scheduled', 'in-progress', 'on-hold', 'completed', 'cancelled',
+            'unknown'),
+    },
+    'CareTeam': {
+        'status': ('proposed', 'active', 'suspended', 'inactive', 'entered-in-error'),
+    },
+    'ChargeItem': {
+        'status': (
+            'planned', 'billable', 'not-billable', 'aborted', 'billed', 'entered-in-error',
+            'unknown'),
+    },
+    'Claim': {
+        'use': ('complete', 'proposed', 'exploratory', 'other'),
+    },
+    'ClinicalImpression': {
+        'status': ('draft', 'completed', 'entered-in-error'),
+    },
+    'CodeSystem': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+        'hierarchyMeaning': ('grouped-by', 'is-a', 'part-of', 'classified-with'),
+        'content': ('not-present', 'example', 'fragment', 'complete'),
+    },
+    'CodeSystem_Property': {
+        'type': ('code', 'coding', 'string', 'integer', 'boolean', 'datetime'),
+    },
+    'CompartmentDefinition': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+        'code': ('patient', 'encounter', 'relatedperson', 'practitioner', 'device'),
+    },
+    'Composition': {
+        'status': ('preliminary', 'final', 'amended', 'entered-in-error'),
+    },
+    'Composition_Attester': {
+        'mode': ('personal', 'professional', 'legal', 'official'),
+    },
+    'ConceptMap': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+    },
+    'ConceptMap_Target': {
+        'equivalence': (
+            'relatedto', 'equivalent', 'equal', 'wider', 'subsumes', 'narrower', 'specializes',
+            'inexact', 'unmatched', 'disjoint'),
+    },
+    'ConceptMap_Unmapped': {
+        'mode': ('provided', 'fixed', 'other-map'),
+    },
+    'Condition': {
+        'verificationStatus': (
+            'provisional', 'differential', 'confirmed', 'refuted', 'entered-in-error', 'unknown'),
+    },
+    'Consent': {
+        'status': ('draft', 'proposed', 'active', 'rejected', 'inactive', 'entered-in-error'),
+    },
+    'Consent_Data': {
+        'meaning': ('instance', 'related', 'dependents', 'authoredby'),
+    },
+    'Consent_Except': {
+        'type': ('deny', 'permit'),
+    },
+    'Consent_Data1': {
+        'meaning': ('instance', 'related', 'dependents', 'authoredby'),
+    },
+    'ContactPoint': {
+        'system': ('phone', 'fax', 'email', 'pager', 'url', 'sms', 'other'),
+        'use': ('home', 'work', 'temp', 'old', 'mobile'),
+    },
+    'Contributor': {
+        'type': ('author', 'editor', 'reviewer', 'endorser'),
+    },
+    'DataElement': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+        'stringency': (
+            'comparable', 'fully-specified', 'equivalent', 'convertable', 'scaleable', 'flexible'),
+    },
+    'DetectedIssue': {
+        'severity': ('high', 'moderate', 'low'),
+    },
+    'Device': {
+        'status': ('active', 'inactive', 'entered-in-error', 'unknown'),
+    },
+    'Device_Udi': {
+        'entryType': ('barcode', 'rfid', 'manual', 'card', 'self-reported', 'unknown'),
+    },
+    'DeviceComponent': {
+        'measurementPrinciple': (
+            'other', 'chemical', 'electrical', 'impedance', 'nuclear', 'optical', 'thermal',
+            'biological', 'mechanical', 'acoustical', 'manual'),
+    },
+    'DeviceMetric': {
+        'operationalStatus': ('on', 'off', 'standby', 'entered-in-error'),
+        'color': ('black', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white'),
+        'category': ('measurement', 'setting', 'calculation', 'unspecified'),
+    },
+    'DeviceMetric_Calibration': {
+        'type': ('unspecified', 'offset', 'gain', 'two-point'),
+        'state': ('not-calibrated', 'calibration-required', 'calibrated', 'unspecified'),
+    },
+    'DeviceUseStatement': {
+        'status': ('active', 'completed', 'entered-in-error', 'intended', 'stopped', 'on-hold'),
+    },
+    'DiagnosticReport': {
+        'status': (
+            'registered', 'partial', 'preliminary', 'final', 'amended', 'corrected', 'appended',
+            'cancelled', 'entered-in-error', 'unknown'),
+    },
+    'DocumentManifest': {
+        'status': ('current', 'superseded', 'entered-in-error'),
+    },
+    'DocumentReference': {
+        'status': ('current', 'superseded', 'entered-in-error'),
+    },
+    'DocumentReference_RelatesTo': {
+        'code': ('replaces', 'transforms', 'signs', 'appends'),
+    },
+    'ElementDefinition': {
+        'representation': ('xmlattr', 'xmltext', 'typeattr', 'cdatext', 'xhtml'),
+    },
+    'ElementDefinition_Slicing': {
+        'rules': ('closed', 'open', 'openatend'),
+    },
+    'ElementDefinition_Discriminator': {
+        'type': ('value', 'exists', 'pattern', 'type', 'profile'),
+    },
+    'ElementDefinition_Type': {
+        'aggregation': ('contained', 'referenced', 'bundled'),
+        'versioning': ('either', 'independent', 'specific'),
+    },
+    'ElementDefinition_Constraint': {
+        'severity': ('error', 'warning'),
+    },
+    'ElementDefinition_Binding': {
+        'strength': ('required', 'extensible', 'preferred', 'example'),
+    },
+    'Encounter': {
+        'status': (
+            'planned', 'arrived', 'triaged', 'in-progress', 'onleave', 'finished', 'cancelled',
+            'entered-in-error', 'unknown'),
+    },
+    'Encounter_StatusHistory': {
+        'status': (
+            'planned', 'arrived', 'triaged', 'in-progress', 'onleave', 'finished', 'cancelled',
+            'entered-in-error', 'unknown'),
+    },
+    'Encounter_Location': {
+        'status': ('planned', 'active', 'reserved', 'completed'),
+    },
+    'Endpoint': {
+        'status': ('active', 'suspended', 'error', 'off', 'entered-in-error', 'test'),
+    },
+    'EpisodeOfCare': {
+        'status': (
+            'planned', 'waitlist', 'active', 'onhold', 'finished', 'cancelled',
+            'entered-in-error'),
+    },
+    'EpisodeOfCare_StatusHistory': {
+        'status': (
+            'planned', 'waitlist', 'active', 'onhold', 'finished', 'cancelled',
+            'entered-in-error'),
+    },
+    'ExpansionProfile': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+    },
+    'ExpansionProfile_FixedVersion': {
+        'mode': ('default', 'check', 'override'),
+    },
+    'ExplanationOfBenefit': {
+        'status': ('active', 'cancelled', 'draft', 'entered-in-error'),
+    },
+    'FamilyMemberHistory': {
+        'status': ('partial', 'completed', 'entered-in-error', 'health-unknown'),
+        'gender': ('male', 'female', 'other', 'unknown'),
+    },
+    'Flag': {
+        'status': ('active', 'inactive', 'entered-in-error'),
+    },
+    'Goal': {
+        'status': (
+            'proposed', 'accepted', 'planned', 'in-progress', 'on-target', 'ahead-of-target',
+            'behind-target', 'sustaining', 'achieved', 'on-hold', 'cancelled',
+            'entered-in-error', 'rejected'),
+    },
+    'GraphDefinition': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+    },
+    'GraphDefinition_Compartment': {
+        'rule': ('identical', 'matching', 'different', 'custom'),
+    },
+    'Group': {
+        'type': ('person', 'animal', 'practitioner', 'device', 'medication', 'substance'),
+    },
+    'GuidanceResponse': {
+        'status': (
+            'success', 'data-requested', 'data-required', 'in-progress', 'failure',
+            'entered-in-error'),
+    },
+    'HealthcareService_AvailableTime': {
+        'daysOfWeek': ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun'),
+    },
+    'HumanName': {
+        'use': ('usual', 'official', 'temp', 'nickname', 'anonymous', 'old', 'maiden'),
+    },
+    'Identifier': {
+        'use': ('usual', 'official', 'temp', 'secondary'),
+    },
+    'ImagingStudy': {
+        'availability': ('online', 'offline', 'nearline', 'unavailable'),
+    },
+    'ImagingStudy_Series': {
+        'availability': ('online', 'offline', 'nearline', 'unavailable'),
+    },
+    'ImplementationGuide': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+    },
+    'ImplementationGuide_Dependency': {
+        'type': ('reference', 'inclusion'),
+    },
+    'ImplementationGuide_Page': {
+        'kind': (
+            'page', 'example', 'list', 'include', 'directory', 'dictionary', 'toc', 'resource'),
+    },
+    'Library': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+    },
+    'Linkage_Item': {
+        'type': ('source', 'alternate', 'historical'),
+    },
+    'List': {
+        'status': ('current', 'retired', 'entered-in-error'),
+        'mode': ('working', 'snapshot', 'changes'),
+    },
+    'Location': {
+        'status': ('active', 'suspended', 'inactive'),
+        'mode': ('instance', 'kind'),
+    },
+    'Measure': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+    },
+    'MeasureReport': {
+        'status': ('complete', 'pending', 'error'),
+        'type': ('individual', 'patient-list', 'summary'),
+    },
+    'Media': {
+        'type': ('photo', 'video', 'audio'),
+    },
+    'Medication': {
+        'status': ('active', 'inactive', 'entered-in-error'),
+    },
+    'MedicationAdministration': {
+        'status': (
+            'in-progress', 'on-hold', 'completed', 'entered-in-error', 'stopped', 'unknown'),
+    },
+    'MedicationDispense': {
+        'status': (
+            'preparation', 'in-progress', 'on-hold', 'completed', 'entered-in-error', 'stopped'),
+    },
+    'MedicationRequest': {
+        'status': (
+            'active', 'on-hold', 'cancelled', 'completed', 'entered-in-error', 'stopped',
+            'draft', 'unknown'),
+        'intent': ('proposal', 'plan', 'order', 'instance-order'),
+        'priority': ('routine', 'urgent', 'stat', 'asap'),
+    },
+    'MedicationStatement': {
+        'status': ('active', 'completed', 'entered-in-error', 'intended', 'stopped', 'on-hold'),
+        'taken': ('y', 'n', 'unk', 'na'),
+    },
+    'MessageDefinition': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+    },
+    'MessageHeader_Response': {
+        'code': ('ok', 'transient-error', 'fatal-error'),
+    },
+    'NamingSystem': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+        'kind': ('codesystem', 'identifier', 'root'),
+    },
+    'NamingSystem_UniqueId': {
+        'type': ('oid', 'uuid', 'uri', 'other'),
+    },
+    'Narrative': {
+        'status': ('generated', 'extensions', 'additional', 'empty'),
+    },
+    'NutritionOrder': {
+        'status': (
+            'proposed', 'draft', 'planned', 'requested', 'active', 'on-hold', 'completed',
+            'cancelled', 'entered-in-error'),
+    },
+    'Observation': {
+        'status': (
+            'registered', 'preliminary', 'final', 'amended', 'corrected', 'cancelled',
+            'entered-in-error', 'unknown'),
+    },
+    'Observation_Related': {
+        'type': (
+            'has-member', 'derived-from', 'sequel-to', 'replaces', 'qualified-by',
+            'interfered-by'),
+    },
+    'OperationDefinition': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+        'kind': ('operation', 'query'),
+    },
+    'OperationDefinition_Parameter': {
+        'use': ('in', 'out'),
+        'searchType': (
+            'number', 'date', 'string', 'token', 'reference', 'composite', 'quantity', 'uri'),
+    },
+    'OperationDefinition_Binding': {
+        'strength': ('required', 'extensible', 'preferred', 'example'),
+    },
+    'OperationOutcome_Issue': {
+        'severity': ('fatal', 'error', 'warning', 'information'),
+        'code': (
+            'invalid', 'structure', 'required', 'value', 'invariant', 'security', 'login',
+            'unknown', 'expired', 'forbidden', 'suppressed', 'processing', 'not-supported',
+            'duplicate', 'not-found', 'too-long', 'code-invalid', 'extension', 'too-costly',
+            'business-rule', 'conflict', 'incomplete', 'transient', 'lock-error', 'no-store',
+            'exception', 'timeout', 'throttled', 'informational'),
+    },
+    'Patient': {
+        'gender': ('male', 'female', 'other', 'unknown'),
+    },
+    'Patient_Contact': {
+        'gender': ('male', 'female', 'other', 'unknown'),
+    },
+    'Patient_Link': {
+        'type': ('replaced-by', 'replaces', 'refer', 'seealso'),
+    },
+    'Person': {
+        'gender': ('male', 'female', 'other', 'unknown'),
+    },
+    'Person_Link': {
+        'assurance': ('level1', 'level2', 'level3', 'level4'),
+    },
+    'PlanDefinition': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+    },
+    'PlanDefinition_Action': {
+        'groupingBehavior': ('visual-group', 'logical-group', 'sentence-group'),
+        'selectionBehavior': (
+            'any', 'all', 'all-or-none', 'exactly-one', 'at-most-one', 'one-or-more'),
+        'requiredBehavior': ('must', 'could', 'must-unless-documented'),
+        'precheckBehavior': ('yes', 'no'),
+        'cardinalityBehavior': ('single', 'multiple'),
+    },
+    'PlanDefinition_Condition': {
+        'kind': ('applicability', 'start', 'stop'),
+    },
+    'PlanDefinition_RelatedAction': {
+        'relationship': (
+            'before-start', 'before', 'before-end', 'concurrent-with-start', 'concurrent',
+            'concurrent-with-end', 'after-start', 'after', 'after-end'),
+    },
+    'PlanDefinition_Participant': {
+        'type': ('patient', 'practitioner', 'related-person'),
+    },
+    'Practitioner': {
+        'gender': ('male', 'female', 'other', 'unknown'),
+    },
+    'ProcessRequest': {
+        'action': ('cancel', 'poll', 'reprocess', 'status'),
+    },
+    'Provenance_Entity': {
+        'role': ('derivation', 'revision', 'quotation', 'source', 'removal'),
+    },
+    'Quantity': {
+        'comparator': ('<', '<=', '>=', '>'),
+    },
+    'Questionnaire': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+    },
+    'Questionnaire_Item': {
+        'type': (
+            'group', 'display', 'boolean', 'decimal', 'integer', 'date', 'datetime', 'time',
+            'string', 'text', 'url', 'choice', 'open-choice', 'attachment', 'reference',
+            'quantity'),
+    },
+    'QuestionnaireResponse': {
+        'status': ('in-progress', 'completed', 'amended', 'entered-in-error', 'stopped'),
+    },
+    'RelatedArtifact': {
+        'type': (
+            'documentation', 'justification', 'citation', 'predecessor', 'successor',
+            'derived-from', 'depends-on', 'composed-of'),
+    },
+    'RelatedPerson': {
+        'gender': ('male', 'female', 'other', 'unknown'),
+    },
+    'ResearchStudy': {
+        'status': (
+            'draft', 'in-progress', 'suspended', 'stopped', 'completed', 'entered-in-error'),
+    },
+    'ResearchSubject': {
+        'status': ('candidate', 'enrolled', 'active', 'suspended', 'withdrawn', 'completed'),
+    },
+    'SearchParameter': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+        'type': ('number', 'date', 'string', 'token', 'reference', 'composite', 'quantity', 'uri'),
+        'xpathUsage': ('normal', 'phonetic', 'nearby', 'distance', 'other'),
+        'comparator': ('eq', 'ne', 'gt', 'lt', 'ge', 'le', 'sa', 'eb', 'ap'),
+        'modifier': (
+            'missing', 'exact', 'contains', 'not', 'text', 'in', 'not-in', 'below', 'above',
+            'type'),
+    },
+    'Sequence': {
+        'type': ('aa', 'dna', 'rna'),
+    },
+    'Sequence_Quality': {
+        'type': ('indel', 'snp', 'unknown'),
+    },
+    'Sequence_Repository': {
+        'type': ('directlink', 'openapi', 'login', 'oauth', 'other'),
+    },
+    'ServiceDefinition': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+    },
+    'Slot': {
+        'status': ('busy', 'free', 'busy-unavailable', 'busy-tentative', 'entered-in-error'),
+    },
+    'Specimen': {
+        'status': ('available', 'unavailable', 'unsatisfactory', 'entered-in-error'),
+    },
+    'StructureDefinition': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+        'kind': ('primitive-type', 'complex-type', 'resource', 'logical'),
+        'contextType': ('resource', 'datatype', 'extension'),
+        'derivation': ('specialization', 'constraint'),
+    },
+    'StructureMap': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+    },
+    'StructureMap_Structure': {
+        'mode': ('source', 'queried', 'target', 'produced'),
+    },
+    'StructureMap_Group': {
+        'typeMode': ('none', 'types', 'type-and-types'),
+    },
+    'StructureMap_Input': {
+        'mode': ('source', 'target'),
+    },
+    'StructureMap_Source': {
+        'listMode': ('first', 'not_first', 'last', 'not_last', 'only_one'),
+    },
+    'StructureMap_Target': {
+        'contextType': ('type', 'variable'),
+        'listMode': ('first', 'share', 'last', 'collate'),
+        'transform': (
+            'create', 'copy', 'truncate', 'escape', 'cast', 'append', 'translate', 'reference',
+            'dateop', 'uuid', 'pointer', 'evaluate', 'cc', 'c', 'qty', 'id', 'cp'),
+    },
+    'Subscription': {
+        'status': ('requested', 'active', 'error', 'off'),
+    },
+    'Subscription_Channel': {
+        'type': ('rest-hook', 'websocket', 'email', 'sms', 'message'),
+    },
+    'Substance': {
+        'status': ('active', 'inactive', 'entered-in-error'),
+    },
+    'SupplyDelivery': {
+        'status': ('in-progress', 'completed', 'abandoned', 'entered-in-error'),
+    },
+    'SupplyRequest': {
+        'status': (
+            'draft', 'active', 'suspended', 'cancelled', 'completed', 'entered-in-error',
+            'unknown'),
+    },
+    'Task': {
+        'status': (
+            'draft', 'requested', 'received', 'accepted', 'rejected', 'ready', 'cancelled',
+            'in-progress', 'on-hold', 'failed', 'completed', 'entered-in-error'),
+    },
+    'TestReport': {
+        'status': ('completed', 'in-progress', 'waiting', 'stopped', 'entered-in-error'),
+        'result': ('pass', 'fail', 'pending'),
+    },
+    'TestReport_Participant': {
+        'type': ('test-engine', 'client', 'server'),
+    },
+    'TestReport_Operation': {
+        'result': ('pass', 'skip', 'fail', 'warning', 'error'),
+    },
+    'TestReport_Assert': {
+        'result': ('pass', 'skip', 'fail', 'warning', 'error'),
+    },
+    'TestScript': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+    },
+    'TestScript_Operation': {
+        'accept': ('xml', 'json', 'ttl', 'none'),
+        'contentType': ('xml', 'json', 'ttl', 'none'),
+    },
+    'TestScript_Assert': {
+        'direction': ('response', 'request'),
+        'contentType': ('xml', 'json', 'ttl', 'none'),
+        'operator': (
+            'equals', 'notequals', 'in', 'notin', 'greaterthan', 'lessthan', 'empty', 'notempty',
+            'contains', 'notcontains', 'eval'),
+        'requestMethod': ('delete', 'get', 'options', 'patch', 'post', 'put'),
+        'response': (
+            'okay', 'created', 'nocontent', 'notmodified', 'bad', 'forbidden', 'notfound',
+            'methodnotallowed', 'conflict', 'gone', 'preconditionfailed', 'unprocessable'),
+    },
+    'Timing_Repeat': {
+        'durationUnit': ('s', 'min', 'h', 'd', 'wk', 'mo', 'a'),
+        'periodUnit': ('s', 'min', 'h', 'd', 'wk', 'mo', 'a'),
+        'when': (
+            'morn', 'aft', 'eve', 'night', 'phs', 'hs', 'wake', 'c', 'cm', 'cd', 'cv', 'ac',
+            'acm', 'acd', 'acv', 'pc', 'pcm', 'pcd', 'pcv'),
+    },
+    'TriggerDefinition': {
+        'type': (
+            'named-event', 'periodic', 'data-added', 'data-modified', 'data-removed',
+            'data-accessed', 'data-access-ended'),
+    },
+    'ValueSet': {
+        'status': ('draft', 'active', 'retired', 'unknown'),
+    },
+    'ValueSet_Filter': {
+        'op': (
+            '=', 'is-a', 'descendent-of', 'is-not-a', 'regex', 'in', 'not-in', 'generalizes',
+            'exists'),
+    },
+    'VisionPrescription_Dispense': {
+        'eye': ('right', 'left'),
+        'base': ('up', 'down', 'in', 'out'),
+    },
+}
+
+
+TYPES = {
+    'Account': {
+        'status': 'str',
+        'name': 'str',
+        'description': 'str',
+    },
+    'Account_Coverage': {
+        'priority': 'int',
+    },
+    'Account_Guarantor': {
+        'onHold': 'bool',
+    },
+    'ActivityDefinition': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'usage': 'str',
+        'approvalDate': 'str',
+        'lastReviewDate': 'str',
+        'copyright': 'str',
+        'kind': 'str',
+        'timingDateTime': 'str',
+    },
+    'ActivityDefinition_DynamicValue': {
+        'description': 'str',
+        'path': 'str',
+        'language': 'str',
+        'expression': 'str',
+    },
+    'ActivityDefinition_Participant': {
+        'type': 'str',
+    },
+    'Address': {
+        'use': 'str',
+        'type': 'str',
+        'text': 'str',
+        'city': 'str',
+        'district': 'str',
+        'state': 'str',
+        'postalCode': 'str',
+        'country': 'str',
+    },
+    'AdverseEvent': {
+        'category': 'str',
+        'date': 'str',
+        'description': 'str',
+    },
+    'AdverseEvent_SuspectEntity': {
+        'causality': 'str',
+        'causalityProductRelatedness': 'str',
+    },
+    'AllergyIntolerance': {
+        'clinicalStatus': 'str',
+        'verificationStatus': 'str',
+        'type': 'str',
+        'criticality': 'str',
+        'onsetDateTime': 'str',
+        'onsetString': 'str',
+        'assertedDate': 'str',
+        'lastOccurrence': 'str',
+    },
+    'AllergyIntolerance_Reaction': {
+        'description': 'str',
+        'onset': 'str',
+        'severity': 'str',
+    },
+    'Annotation': {
+        'authorString': 'str',
+        'time': 'str',
+        'text': 'str',
+    },
+    'Appointment': {
+        'status': 'str',
+        'priority': 'int',
+        'description': 'str',
+        'start': 'str',
+        'end': 'str',
+        'minutesDuration': 'int',
+        'created': 'str',
+        'comment': 'str',
+    },
+    'Appointment_Participant': {
+        'required': 'str',
+        'status': 'str',
+    },
+    'AppointmentResponse': {
+        'start': 'str',
+        'end': 'str',
+        'participantStatus': 'str',
+        'comment': 'str',
+    },
+    'Attachment': {
+        'contentType': 'str',
+        'language': 'str',
+        'data': 'str',
+        'url': 'str',
+        'size': 'int',
+        'hash': 'str',
+        'title': 'str',
+        'creation': 'str',
+    },
+    'AuditEvent': {
+        'action': 'str',
+        'recorded': 'str',
+        'outcome': 'str',
+        'outcomeDesc': 'str',
+    },
+    'AuditEvent_Agent': {
+        'altId': 'str',
+        'name': 'str',
+        'requestor': 'bool',
+    },
+    'AuditEvent_Detail': {
+        'type': 'str',
+        'value': 'str',
+    },
+    'AuditEvent_Entity': {
+        'name': 'str',
+        'description': 'str',
+        'query': 'str',
+    },
+    'AuditEvent_Network': {
+        'address': 'str',
+        'type': 'str',
+    },
+    'AuditEvent_Source': {
+        'site': 'str',
+    },
+    'Basic': {
+        'created': 'str',
+    },
+    'Binary': {
+        'contentType': 'str',
+        'content': 'str',
+    },
+    'BodySite': {
+        'active': 'bool',
+        'description': 'str',
+    },
+    'Bundle': {
+        'type': 'str',
+        'total': 'int',
+    },
+    'Bundle_Entry': {
+        'fullUrl': 'str',
+    },
+    'Bundle_Link': {
+        'relation': 'str',
+        'url': 'str',
+    },
+    'Bundle_Request': {
+        'method': 'str',
+        'url': 'str',
+        'ifNoneMatch': 'str',
+        'ifModifiedSince': 'str',
+        'ifMatch': 'str',
+        'ifNoneExist': 'str',
+    },
+    'Bundle_Response': {
+        'status': 'str',
+        'location': 'str',
+        'etag': 'str',
+        'lastModified': 'str',
+    },
+    'Bundle_Search': {
+        'mode': 'str',
+        'score': 'int',
+    },
+    'CapabilityStatement': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'copyright': 'str',
+        'kind': 'str',
+        'fhirVersion': 'str',
+        'acceptUnknown': 'str',
+    },
+    'CapabilityStatement_Certificate': {
+        'type': 'str',
+        'blob': 'str',
+    },
+    'CapabilityStatement_Document': {
+        'mode': 'str',
+        'documentation': 'str',
+    },
+    'CapabilityStatement_Endpoint': {
+        'address': 'str',
+    },
+    'CapabilityStatement_Event': {
+        'category': 'str',
+        'mode': 'str',
+        'focus': 'str',
+        'documentation': 'str',
+    },
+    'CapabilityStatement_Implementation': {
+        'description': 'str',
+        'url': 'str',
+    },
+    'CapabilityStatement_Interaction': {
+        'code': 'str',
+        'documentation': 'str',
+    },
+    'CapabilityStatement_Interaction1': {
+        'code': 'str',
+        'documentation': 'str',
+    },
+    'CapabilityStatement_Messaging': {
+        'reliableCache': 'int',
+        'documentation': 'str',
+    },
+    'CapabilityStatement_Operation': {
+        'name': 'str',
+    },
+    'CapabilityStatement_Resource': {
+        'type': 'str',
+        'documentation': 'str',
+        'versioning': 'str',
+        'readHistory': 'bool',
+        'updateCreate': 'bool',
+        'conditionalCreate': 'bool',
+        'conditionalRead': 'str',
+        'conditionalUpdate': 'bool',
+        'conditionalDelete': 'str',
+    },
+    'CapabilityStatement_Rest': {
+        'mode': 'str',
+        'documentation': 'str',
+    },
+    'CapabilityStatement_SearchParam': {
+        'name': 'str',
+        'definition': 'str',
+        'type': 'str',
+        'documentation': 'str',
+    },
+    'CapabilityStatement_Security': {
+        'cors': 'bool',
+        'description': 'str',
+    },
+    'CapabilityStatement_Software': {
+        'name': 'str',
+        'version': 'str',
+        'releaseDate': 'str',
+    },
+    'CapabilityStatement_SupportedMessage': {
+        'mode': 'str',
+    },
+    'CarePlan': {
+        'status': 'str',
+        'intent': 'str',
+        'title': 'str',
+        'description': 'str',
+    },
+    'CarePlan_Detail': {
+        'status': 'str',
+        'statusReason': 'str',
+        'prohibited': 'bool',
+        'scheduledString': 'str',
+        'description': 'str',
+    },
+    'CareTeam': {
+        'status': 'str',
+        'name': 'str',
+    },
+    'ChargeItem': {
+        'status': 'str',
+        'occurrenceDateTime': 'str',
+        'factorOverride': 'int',
+        'overrideReason': 'str',
+        'enteredDate': 'str',
+    },
+    'Claim': {
+        'status': 'str',
+        'use': 'str',
+        'created': 'str',
+    },
+    'Claim_Accident': {
+        'date': 'str',
+    },
+    'Claim_CareTeam': {
+        'sequence': 'int',
+        'responsible': 'bool',
+    },
+    'Claim_Detail': {
+        'sequence': 'int',
+        'factor': 'int',
+    },
+    'Claim_Diagnosis': {
+        'sequence': 'int',
+    },
+    'Claim_Information': {
+        'sequence': 'int',
+        'timingDate': 'str',
+        'valueString': 'str',
+    },
+    'Claim_Insurance': {
+        'sequence': 'int',
+        'focal': 'bool',
+        'businessArrangement': 'str',
+    },
+    'Claim_Item': {
+        'sequence': 'int',
+        'servicedDate': 'str',
+        'factor': 'int',
+    },
+    'Claim_Procedure': {
+        'sequence': 'int',
+        'date': 'str',
+    },
+    'Claim_SubDetail': {
+        'sequence': 'int',
+        'factor': 'int',
+    },
+    'ClaimResponse': {
+        'status': 'str',
+        'created': 'str',
+        'disposition': 'str',
+    },
+    'ClaimResponse_Adjudication': {
+        'value': 'int',
+    },
+    'ClaimResponse_Detail': {
+        'sequenceLinkId': 'int',
+    },
+    'ClaimResponse_Error': {
+        'sequenceLinkId': 'int',
+        'detailSequenceLinkId': 'int',
+        'subdetailSequenceLinkId': 'int',
+    },
+    'ClaimResponse_Insurance': {
+        'sequence': 'int',
+        'focal': 'bool',
+        'businessArrangement': 'str',
+    },
+    'ClaimResponse_Item': {
+        'sequenceLinkId': 'int',
+    },
+    'ClaimResponse_Payment': {
+        'date': 'str',
+    },
+    'ClaimResponse_ProcessNote': {
+        'number': 'int',
+        'text': 'str',
+    },
+    'ClaimResponse_SubDetail': {
+        'sequenceLinkId': 'int',
+    },
+    'ClinicalImpression': {
+        'status': 'str',
+        'description': 'str',
+        'effectiveDateTime': 'str',
+        'date': 'str',
+        'summary': 'str',
+    },
+    'ClinicalImpression_Finding': {
+        'basis': 'str',
+    },
+    'CodeableConcept': {
+        'text': 'str',
+    },
+    'CodeSystem': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'copyright': 'str',
+        'caseSensitive': 'bool',
+        'valueSet': 'str',
+        'hierarchyMeaning': 'str',
+        'compositional': 'bool',
+        'versionNeeded': 'bool',
+        'content': 'str',
+        'count': 'int',
+    },
+    'CodeSystem_Concept': {
+        'code': 'str',
+        'display': 'str',
+        'definition': 'str',
+    },
+    'CodeSystem_Designation': {
+        'language': 'str',
+        'value': 'str',
+    },
+    'CodeSystem_Filter': {
+        'code': 'str',
+        'description': 'str',
+        'value': 'str',
+    },
+    'CodeSystem_Property': {
+        'code': 'str',
+        'uri': 'str',
+        'description': 'str',
+        'type': 'str',
+    },
+    'CodeSystem_Property1': {
+        'code': 'str',
+        'valueCode': 'str',
+        'valueString': 'str',
+        'valueInteger': 'int',
+        'valueBoolean': 'bool',
+        'valueDateTime': 'str',
+    },
+    'Coding': {
+        'system': 'str',
+        'version': 'str',
+        'code': 'str',
+        'display': 'str',
+        'userSelected': 'bool',
+    },
+    'Communication': {
+        'status': 'str',
+        'notDone': 'bool',
+        'sent': 'str',
+        'received': 'str',
+    },
+    'Communication_Payload': {
+        'contentString': 'str',
+    },
+    'CommunicationRequest': {
+        'status': 'str',
+        'priority': 'str',
+        'occurrenceDateTime': 'str',
+        'authoredOn': 'str',
+    },
+    'CommunicationRequest_Payload': {
+        'contentString': 'str',
+    },
+    'CompartmentDefinition': {
+        'url': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'code': 'str',
+        'search': 'bool',
+    },
+    'CompartmentDefinition_Resource': {
+        'code': 'str',
+        'documentation': 'str',
+    },
+    'Composition': {
+        'status': 'str',
+        'date': 'str',
+        'title': 'str',
+        'confidentiality': 'str',
+    },
+    'Composition_Attester': {
+        'time': 'str',
+    },
+    'Composition_RelatesTo': {
+        'code': 'str',
+    },
+    'Composition_Section': {
+        'title': 'str',
+        'mode': 'str',
+    },
+    'ConceptMap': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'copyright': 'str',
+        'sourceUri': 'str',
+        'targetUri': 'str',
+    },
+    'ConceptMap_DependsOn': {
+        'property': 'str',
+        'system': 'str',
+        'code': 'str',
+        'display': 'str',
+    },
+    'ConceptMap_Element': {
+        'code': 'str',
+        'display': 'str',
+    },
+    'ConceptMap_Group': {
+        'source': 'str',
+        'sourceVersion': 'str',
+        'target': 'str',
+        'targetVersion': 'str',
+    },
+    'ConceptMap_Target': {
+        'code': 'str',
+        'display': 'str',
+        'equivalence': 'str',
+        'comment': 'str',
+    },
+    'ConceptMap_Unmapped': {
+        'mode': 'str',
+        'code': 'str',
+        'display': 'str',
+        'url': 'str',
+    },
+    'Condition': {
+        'clinicalStatus': 'str',
+        'verificationStatus': 'str',
+        'onsetDateTime': 'str',
+        'onsetString': 'str',
+        'abatementDateTime': 'str',
+        'abatementBoolean': 'bool',
+        'abatementString': 'str',
+        'assertedDate': 'str',
+    },
+    'Consent': {
+        'status': 'str',
+        'dateTime': 'str',
+        'policyRule': 'str',
+    },
+    'Consent_Data': {
+        'meaning': 'str',
+    },
+    'Consent_Data1': {
+        'meaning': 'str',
+    },
+    'Consent_Except': {
+        'type': 'str',
+    },
+    'Consent_Policy': {
+        'authority': 'str',
+        'uri': 'str',
+    },
+    'ContactDetail': {
+        'name': 'str',
+    },
+    'ContactPoint': {
+        'system': 'str',
+        'value': 'str',
+        'use': 'str',
+        'rank': 'int',
+    },
+    'Contract': {
+        'status': 'str',
+        'issued': 'str',
+    },
+    'Contract_Term': {
+        'issued': 'str',
+        'text': 'str',
+    },
+    'Contract_ValuedItem': {
+        'effectiveTime': 'str',
+        'factor': 'int',
+        'points': 'int',
+    },
+    'Contract_ValuedItem1': {
+        'effectiveTime': 'str',
+        'factor': 'int',
+        'points': 'int',
+    },
+    'Contributor': {
+        'type': 'str',
+        'name': 'str',
+    },
+    'Coverage': {
+        'status': 'str',
+        'subscriberId': 'str',
+        'dependent': 'str',
+        'sequence': 'str',
+        'order': 'int',
+        'network': 'str',
+    },
+    'Coverage_Grouping': {
+        'group': 'str',
+        'groupDisplay': 'str',
+        'subGroup': 'str',
+        'subGroupDisplay': 'str',
+        'plan': 'str',
+        'planDisplay': 'str',
+        'subPlan': 'str',
+        'subPlanDisplay': 'str',
+        '_class': 'str',
+        'classDisplay': 'str',
+        'subClass': 'str',
+        'subClassDisplay': 'str',
+    },
+    'DataElement': {
+        'url': 'str',
+        'version': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'name': 'str',
+        'title': 'str',
+        'copyright': 'str',
+        'stringency': 'str',
+    },
+    'DataElement_Mapping': {
+        'identity': 'str',
+        'uri': 'str',
+        'name': 'str',
+        'comment': 'str',
+    },
+    'DataRequirement': {
+        'type': 'str',
+    },
+    'DataRequirement_CodeFilter': {
+        'path': 'str',
+        'valueSetString': 'str',
+    },
+    'DataRequirement_DateFilter': {
+        'path': 'str',
+        'valueDateTime': 'str',
+    },
+    'DetectedIssue': {
+        'status': 'str',
+        'severity': 'str',
+        'date': 'str',
+        'detail': 'str',
+        'reference': 'str',
+    },
+    'DetectedIssue_Mitigation': {
+        'date': 'str',
+    },
+    'Device': {
+        'status': 'str',
+        'lotNumber': 'str',
+        'manufacturer': 'str',
+        'manufactureDate': 'str',
+        'expirationDate': 'str',
+        'model': 'str',
+        'version': 'str',
+        'url': 'str',
+    },
+    'Device_Udi': {
+        'deviceIdentifier': 'str',
+        'name': 'str',
+        'jurisdiction': 'str',
+        'carrierHRF': 'str',
+        'carrierAIDC': 'str',
+        'issuer': 'str',
+        'entryType': 'str',
+    },
+    'DeviceComponent': {
+        'lastSystemChange': 'str',
+        'measurementPrinciple': 'str',
+    },
+    'DeviceComponent_ProductionSpecification': {
+        'productionSpec': 'str',
+    },
+    'DeviceMetric': {
+        'operationalStatus': 'str',
+        'color': 'str',
+        'category': 'str',
+    },
+    'DeviceMetric_Calibration': {
+        'type': 'str',
+        'state': 'str',
+        'time': 'str',
+    },
+    'DeviceRequest': {
+        'status': 'str',
+        'priority': 'str',
+        'occurrenceDateTime': 'str',
+        'authoredOn': 'str',
+    },
+    'DeviceUseStatement': {
+        'status': 'str',
+        'timingDateTime': 'str',
+        'recordedOn': 'str',
+    },
+    'DiagnosticReport': {
+        'status': 'str',
+        'effectiveDateTime': 'str',
+        'issued': 'str',
+        'conclusion': 'str',
+    },
+    'DiagnosticReport_Image': {
+        'comment': 'str',
+    },
+    'DocumentManifest': {
+        'status': 'str',
+        'created': 'str',
+        'source': 'str',
+        'description': 'str',
+    },
+    'DocumentReference': {
+        'status': 'str',
+        'docStatus': 'str',
+        'created': 'str',
+        'indexed': 'str',
+        'description': 'str',
+    },
+    'DocumentReference_RelatesTo': {
+        'code': 'str',
+    },
+    'Dosage': {
+        'sequence': 'int',
+        'text': 'str',
+        'patientInstruction': 'str',
+        'asNeededBoolean': 'bool',
+    },
+    'Element': {
+        'id': 'str',
+    },
+    'ElementDefinition': {
+        'path': 'str',
+        'sliceName': 'str',
+        'label': 'str',
+        'short': 'str',
+        'definition': 'str',
+        'comment': 'str',
+        'requirements': 'str',
+        'min': 'int',
+        'max': 'str',
+        'contentReference': 'str',
+        'defaultValueBoolean': 'bool',
+        'defaultValueInteger': 'int',
+        'defaultValueDecimal': 'int',
+        'defaultValueBase64Binary': 'str',
+        'defaultValueInstant': 'str',
+        'defaultValueString': 'str',
+        'defaultValueUri': 'str',
+        'defaultValueDate': 'str',
+        'defaultValueDateTime': 'str',
+        'defaultValueTime': 'str',
+        'defaultValueCode': 'str',
+        'defaultValueOid': 'str',
+        'defaultValueUuid': 'str',
+        'defaultValueId': 'str',
+        'defaultValueUnsignedInt': 'int',
+        'defaultValuePositiveInt': 'int',
+        'defaultValueMarkdown': 'str',
+        'meaningWhenMissing': 'str',
+        'orderMeaning': 'str',
+        'fixedBoolean': 'bool',
+        'fixedInteger': 'int',
+        'fixedDecimal': 'int',
+        'fixedBase64Binary': 'str',
+        'fixedInstant': 'str',
+        'fixedString': 'str',
+        'fixedUri': 'str',
+        'fixedDate': 'str',
+        'fixedDateTime': 'str',
+        'fixedTime': 'str',
+        'fixedCode': 'str',
+        'fixedOid': 'str',
+        'fixedUuid': 'str',
+        'fixedId': 'str',
+        'fixedUnsignedInt': 'int',
+        'fixedPositiveInt': 'int',
+        'fixedMarkdown': 'str',
+        'patternBoolean': 'bool',
+        'patternInteger': 'int',
+        'patternDecimal': 'int',
+        'patternBase64Binary': 'str',
+        'patternInstant': 'str',
+        'patternString': 'str',
+        'patternUri': 'str',
+        'patternDate': 'str',
+        'patternDateTime': 'str',
+        'patternTime': 'str',
+        'patternCode': 'str',
+        'patternOid': 'str',
+        'patternUuid': 'str',
+        'patternId': 'str',
+        'patternUnsignedInt': 'int',
+        'patternPositiveInt': 'int',
+        'patternMarkdown': 'str',
+        'minValueDate': 'str',
+        'minValueDateTime': 'str',
+        'minValueInstant': 'str',
+        'minValueTime': 'str',
+        'minValueDecimal': 'int',
+        'minValueInteger': 'int',
+        'minValuePositiveInt': 'int',
+        'minValueUnsignedInt': 'int',
+        'maxValueDate': 'str',
+        'maxValueDateTime': 'str',
+        'maxValueInstant': 'str',
+        'maxValueTime': 'str',
+        'maxValueDecimal': 'int',
+        'maxValueInteger': 'int',
+        'maxValuePositiveInt': 'int',
+        'maxValueUnsignedInt': 'int',
+        'maxLength': 'int',
+        'mustSupport': 'bool',
+        'isModifier': 'bool',
+        'isSummary': 'bool',
+    },
+    'ElementDefinition_Base': {
+        'path': 'str',
+        'min': 'int',
+        'max': 'str',
+    },
+    'ElementDefinition_Binding': {
+        'strength': 'str',
+        'description': 'str',
+        'valueSetUri': 'str',
+    },
+    'ElementDefinition_Constraint': {
+        'key': 'str',
+        'requirements': 'str',
+        'severity': 'str',
+        'human': 'str',
+        'expression': 'str',
+        'xpath': 'str',
+        'source': 'str',
+    },
+    'ElementDefinition_Discriminator': {
+        'type': 'str',
+        'path': 'str',
+    },
+    'ElementDefinition_Example': {
+        'label': 'str',
+        'valueBoolean': 'bool',
+        'valueInteger': 'int',
+        'valueDecimal': 'int',
+        'valueBase64Binary': 'str',
+        'valueInstant': 'str',
+        'valueString': 'str',
+        'valueUri': 'str',
+        'valueDate': 'str',
+        'valueDateTime': 'str',
+        'valueTime': 'str',
+        'valueCode': 'str',
+        'valueOid': 'str',
+        'valueUuid': 'str',
+        'valueId': 'str',
+        'valueUnsignedInt': 'int',
+        'valuePositiveInt': 'int',
+        'valueMarkdown': 'str',
+    },
+    'ElementDefinition_Mapping': {
+        'identity': 'str',
+        'language': 'str',
+        'map': 'str',
+        'comment': 'str',
+    },
+    'ElementDefinition_Slicing': {
+        'description': 'str',
+        'ordered': 'bool',
+        'rules': 'str',
+    },
+    'ElementDefinition_Type': {
+        'code': 'str',
+        'profile': 'str',
+        'targetProfile': 'str',
+        'versioning': 'str',
+    },
+    'EligibilityRequest': {
+        'status': 'str',
+        'servicedDate': 'str',
+        'created': 'str',
+        'businessArrangement': 'str',
+    },
+    'EligibilityResponse': {
+        'status': 'str',
+        'created': 'str',
+        'disposition': 'str',
+        'inforce': 'bool',
+    },
+    'EligibilityResponse_BenefitBalance': {
+        'excluded': 'bool',
+        'name': 'str',
+        'description': 'str',
+    },
+    'EligibilityResponse_Financial': {
+        'allowedUnsignedInt': 'int',
+        'allowedString': 'str',
+        'usedUnsignedInt': 'int',
+    },
+    'Encounter': {
+        'status': 'str',
+    },
+    'Encounter_Diagnosis': {
+        'rank': 'int',
+    },
+    'Encounter_Location': {
+        'status': 'str',
+    },
+    'Encounter_StatusHistory': {
+        'status': 'str',
+    },
+    'Endpoint': {
+        'status': 'str',
+        'name': 'str',
+        'address': 'str',
+    },
+    'EnrollmentRequest': {
+        'status': 'str',
+        'created': 'str',
+    },
+    'EnrollmentResponse': {
+        'status': 'str',
+        'disposition': 'str',
+        'created': 'str',
+    },
+    'EpisodeOfCare': {
+        'status': 'str',
+    },
+    'EpisodeOfCare_Diagnosis': {
+        'rank': 'int',
+    },
+    'EpisodeOfCare_StatusHistory': {
+        'status': 'str',
+    },
+    'ExpansionProfile': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'includeDesignations': 'bool',
+        'includeDefinition': 'bool',
+        'activeOnly': 'bool',
+        'excludeNested': 'bool',
+        'excludeNotForUI': 'bool',
+        'excludePostCoordinated': 'bool',
+        'displayLanguage': 'str',
+        'limitedExpansion': 'bool',
+    },
+    'ExpansionProfile_Designation1': {
+        'language': 'str',
+    },
+    'ExpansionProfile_Designation2': {
+        'language': 'str',
+    },
+    'ExpansionProfile_ExcludedSystem': {
+        'system': 'str',
+        'version': 'str',
+    },
+    'ExpansionProfile_FixedVersion': {
+        'system': 'str',
+        'version': 'str',
+        'mode': 'str',
+    },
+    'ExplanationOfBenefit': {
+        'status': 'str',
+        'created': 'str',
+        'disposition': 'str',
+        'precedence': 'int',
+    },
+    'ExplanationOfBenefit_Accident': {
+        'date': 'str',
+    },
+    'ExplanationOfBenefit_Adjudication': {
+        'value': 'int',
+    },
+    'ExplanationOfBenefit_BenefitBalance': {
+        'excluded': 'bool',
+        'name': 'str',
+        'description': 'str',
+    },
+    'ExplanationOfBenefit_CareTeam': {
+        'sequence': 'int',
+        'responsible': 'bool',
+    },
+    'ExplanationOfBenefit_Detail': {
+        'sequence': 'int',
+        'factor': 'int',
+    },
+    'ExplanationOfBenefit_Diagnosis': {
+        'sequence': 'int',
+    },
+    'ExplanationOfBenefit_Financial': {
+        'allowedUnsignedInt': 'int',
+        'allowedString': 'str',
+        'usedUnsignedInt': 'int',
+    },
+    'ExplanationOfBenefit_Information': {
+        'sequence': 'int',
+        'timingDate': 'str',
+        'valueString': 'str',
+    },
+    'ExplanationOfBenefit_Item': {
+        'sequence': 'int',
+        'servicedDate': 'str',
+        'factor': 'int',
+    },
+    'ExplanationOfBenefit_Payment': {
+        'date': 'str',
+    },
+    'ExplanationOfBenefit_Procedure': {
+        'sequence': 'int',
+        'date': 'str',
+    },
+    'ExplanationOfBenefit_ProcessNote': {
+        'number': 'int',
+        'text': 'str',
+    },
+    'ExplanationOfBenefit_SubDetail': {
+        'sequence': 'int',
+        'factor': 'int',
+    },
+    'Extension': {
+        'url': 'str',
+        'valueBoolean': 'bool',
+        'valueInteger': 'int',
+        'valueDecimal': 'int',
+        'valueBase64Binary': 'str',
+        'valueInstant': 'str',
+        'valueString': 'str',
+        'valueUri': 'str',
+        'valueDate': 'str',
+        'valueDateTime': 'str',
+        'valueTime': 'str',
+        'valueCode': 'str',
+        'valueOid': 'str',
+        'valueUuid': 'str',
+        'valueId': 'str',
+        'valueUnsignedInt': 'int',
+        'valuePositiveInt': 'int',
+        'valueMarkdown': 'str',
+    },
+    'FamilyMemberHistory': {
+        'status': 'str',
+        'notDone': 'bool',
+        'date': 'str',
+        'name': 'str',
+        'gender': 'str',
+        'bornDate': 'str',
+        'bornString': 'str',
+        'ageString': 'str',
+        'estimatedAge': 'bool',
+        'deceasedBoolean': 'bool',
+        'deceasedDate': 'str',
+        'deceasedString': 'str',
+    },
+    'FamilyMemberHistory_Condition': {
+        'onsetString': 'str',
+    },
+    'Flag': {
+        'status': 'str',
+    },
+    'Goal': {
+        'status': 'str',
+        'startDate': 'str',
+        'statusDate': 'str',
+        'statusReason': 'str',
+    },
+    'Goal_Target': {
+        'dueDate': 'str',
+    },
+    'GraphDefinition': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'start': 'str',
+        'profile': 'str',
+    },
+    'GraphDefinition_Compartment': {
+        'code': 'str',
+        'rule': 'str',
+        'expression': 'str',
+        'description': 'str',
+    },
+    'GraphDefinition_Link': {
+        'path': 'str',
+        'sliceName': 'str',
+        'min': 'int',
+        'max': 'str',
+        'description': 'str',
+    },
+    'GraphDefinition_Target': {
+        'type': 'str',
+        'profile': 'str',
+    },
+    'Group': {
+        'active': 'bool',
+        'type': 'str',
+        'actual': 'bool',
+        'name': 'str',
+        'quantity': 'int',
+    },
+    'Group_Characteristic': {
+        'valueBoolean': 'bool',
+        'exclude': 'bool',
+    },
+    'Group_Member': {
+        'inactive': 'bool',
+    },
+    'GuidanceResponse': {
+        'requestId': 'str',
+        'status': 'str',
+        'occurrenceDateTime': 'str',
+    },
+    'HealthcareService': {
+        'active': 'bool',
+        'name': 'str',
+        'comment': 'str',
+        'extraDetails': 'str',
+        'eligibilityNote': 'str',
+        'appointmentRequired': 'bool',
+        'availabilityExceptions': 'str',
+    },
+    'HealthcareService_AvailableTime': {
+        'allDay': 'bool',
+        'availableStartTime': 'str',
+        'availableEndTime': 'str',
+    },
+    'HealthcareService_NotAvailable': {
+        'description': 'str',
+    },
+    'HumanName': {
+        'use': 'str',
+        'text': 'str',
+        'family': 'str',
+    },
+    'Identifier': {
+        'use': 'str',
+        'system': 'str',
+        'value': 'str',
+    },
+    'ImagingManifest': {
+        'authoringTime': 'str',
+        'description': 'str',
+    },
+    'ImagingManifest_Instance': {
+        'sopClass': 'str',
+        'uid': 'str',
+    },
+    'ImagingManifest_Series': {
+        'uid': 'str',
+    },
+    'ImagingManifest_Study': {
+        'uid': 'str',
+    },
+    'ImagingStudy': {
+        'uid': 'str',
+        'availability': 'str',
+        'started': 'str',
+        'numberOfSeries': 'int',
+        'numberOfInstances': 'int',
+        'description': 'str',
+    },
+    'ImagingStudy_Instance': {
+        'uid': 'str',
+        'number': 'int',
+        'sopClass': 'str',
+        'title': 'str',
+    },
+    'ImagingStudy_Series': {
+        'uid': 'str',
+        'number': 'int',
+        'description': 'str',
+        'numberOfInstances': 'int',
+        'availability': 'str',
+        'started': 'str',
+    },
+    'Immunization': {
+        'status': 'str',
+        'notGiven': 'bool',
+        'date': 'str',
+        'primarySource': 'bool',
+        'lotNumber': 'str',
+        'expirationDate': 'str',
+    },
+    'Immunization_Reaction': {
+        'date': 'str',
+        'reported': 'bool',
+    },
+    'Immunization_VaccinationProtocol': {
+        'doseSequence': 'int',
+        'description': 'str',
+        'series': 'str',
+        'seriesDoses': 'int',
+    },
+    'ImmunizationRecommendation_DateCriterion': {
+        'value': 'str',
+    },
+    'ImmunizationRecommendation_Protocol': {
+        'doseSequence': 'int',
+        'description': 'str',
+        'series': 'str',
+    },
+    'ImmunizationRecommendation_Recommendation': {
+        'date': 'str',
+        'doseNumber': 'int',
+    },
+    'ImplementationGuide': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'copyright': 'str',
+        'fhirVersion': 'str',
+    },
+    'ImplementationGuide_Dependency': {
+        'type': 'str',
+        'uri': 'str',
+    },
+    'ImplementationGuide_Global': {
+        'type': 'str',
+    },
+    'ImplementationGuide_Package': {
+        'name': 'str',
+        'description': 'str',
+    },
+    'ImplementationGuide_Page': {
+        'source': 'str',
+        'title': 'str',
+        'kind': 'str',
+        'format': 'str',
+    },
+    'ImplementationGuide_Resource': {
+        'example': 'bool',
+        'name': 'str',
+        'description': 'str',
+        'acronym': 'str',
+        'sourceUri': 'str',
+    },
+    'Library': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'usage': 'str',
+        'approvalDate': 'str',
+        'lastReviewDate': 'str',
+        'copyright': 'str',
+    },
+    'Linkage': {
+        'active': 'bool',
+    },
+    'Linkage_Item': {
+        'type': 'str',
+    },
+    'List': {
+        'status': 'str',
+        'mode': 'str',
+        'title': 'str',
+        'date': 'str',
+    },
+    'List_Entry': {
+        'deleted': 'bool',
+        'date': 'str',
+    },
+    'Location': {
+        'status': 'str',
+        'name': 'str',
+        'description': 'str',
+        'mode': 'str',
+    },
+    'Location_Position': {
+        'longitude': 'int',
+        'latitude': 'int',
+        'altitude': 'int',
+    },
+    'Measure': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'usage': 'str',
+        'approvalDate': 'str',
+        'lastReviewDate': 'str',
+        'copyright': 'str',
+        'disclaimer': 'str',
+        'riskAdjustment': 'str',
+        'rateAggregation': 'str',
+        'rationale': 'str',
+        'clinicalRecommendationStatement': 'str',
+        'improvementNotation': 'str',
+        'guidance': 'str',
+        'set': 'str',
+    },
+    'Measure_Group': {
+        'name': 'str',
+        'description': 'str',
+    },
+    'Measure_Population': {
+        'name': 'str',
+        'description': 'str',
+        'criteria': 'str',
+    },
+    'Measure_Stratifier': {
+        'criteria': 'str',
+        'path': 'str',
+    },
+    'Measure_SupplementalData': {
+        'criteria': 'str',
+        'path': 'str',
+    },
+    'MeasureReport': {
+        'status': 'str',
+        'type': 'str',
+        'date': 'str',
+    },
+    'MeasureReport_Group': {
+        'measureScore': 'int',
+    },
+    'MeasureReport_Population': {
+        'count': 'int',
+    },
+    'MeasureReport_Population1': {
+        'count': 'int',
+    },
+    'MeasureReport_Stratum': {
+        'value': 'str',
+        'measureScore': 'int',
+    },
+    'Media': {
+        'type': 'str',
+        'occurrenceDateTime': 'str',
+        'height': 'int',
+        'width': 'int',
+        'frames': 'int',
+        'duration': 'int',
+    },
+    'Medication': {
+        'status': 'str',
+        'isBrand': 'bool',
+        'isOverTheCounter': 'bool',
+    },
+    'Medication_Batch': {
+        'lotNumber': 'str',
+        'expirationDate': 'str',
+    },
+    'Medication_Ingredient': {
+        'isActive': 'bool',
+    },
+    'MedicationAdministration': {
+        'status': 'str',
+        'effectiveDateTime': 'str',
+        'notGiven': 'bool',
+    },
+    'MedicationAdministration_Dosage': {
+        'text': 'str',
+    },
+    'MedicationDispense': {
+        'status': 'str',
+        'whenPrepared': 'str',
+        'whenHandedOver': 'str',
+        'notDone': 'bool',
+    },
+    'MedicationDispense_Substitution': {
+        'wasSubstituted': 'bool',
+    },
+    'MedicationRequest': {
+        'status': 'str',
+        'intent': 'str',
+        'priority': 'str',
+        'authoredOn': 'str',
+    },
+    'MedicationRequest_DispenseRequest': {
+        'numberOfRepeatsAllowed': 'int',
+    },
+    'MedicationRequest_Substitution': {
+        'allowed': 'bool',
+    },
+    'MedicationStatement': {
+        'status': 'str',
+        'effectiveDateTime': 'str',
+        'dateAsserted': 'str',
+        'taken': 'str',
+    },
+    'MessageDefinition': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'copyright': 'str',
+        'category': 'str',
+        'responseRequired': 'bool',
+    },
+    'MessageDefinition_AllowedResponse': {
+        'situation': 'str',
+    },
+    'MessageDefinition_Focus': {
+        'code': 'str',
+        'min': 'int',
+        'max': 'str',
+    },
+    'MessageHeader': {
+        'timestamp': 'str',
+    },
+    'MessageHeader_Destination': {
+        'name': 'str',
+        'endpoint': 'str',
+    },
+    'MessageHeader_Response': {
+        'code': 'str',
+        'identifier': 'str',
+    },
+    'MessageHeader_Source': {
+        'name': 'str',
+        'software': 'str',
+        'version': 'str',
+        'endpoint': 'str',
+    },
+    'Meta': {
+        'versionId': 'str',
+        'lastUpdated': 'str',
+    },
+    'NamingSystem': {
+        'name': 'str',
+        'status': 'str',
+        'kind': 'str',
+        'date': 'str',
+        'publisher': 'str',
+        'responsible': 'str',
+        'description': 'str',
+        'usage': 'str',
+    },
+    'NamingSystem_UniqueId': {
+        'type': 'str',
+        'value': 'str',
+        'preferred': 'bool',
+        'comment': 'str',
+    },
+    'Narrative': {
+        'status': 'str',
+        'div': 'str',
+    },
+    'NutritionOrder': {
+        'status': 'str',
+        'dateTime': 'str',
+    },
+    'NutritionOrder_EnteralFormula': {
+        'baseFormulaProductName': 'str',
+        'additiveProductName': 'str',
+        'administrationInstruction': 'str',
+    },
+    'NutritionOrder_OralDiet': {
+        'instruction': 'str',
+    },
+    'NutritionOrder_Supplement': {
+        'productName': 'str',
+        'instruction': 'str',
+    },
+    'Observation': {
+        'status': 'str',
+        'effectiveDateTime': 'str',
+        'issued': 'str',
+        'valueString': 'str',
+        'valueBoolean': 'bool',
+        'valueTime': 'str',
+        'valueDateTime': 'str',
+        'comment': 'str',
+    },
+    'Observation_Component': {
+        'valueString': 'str',
+        'valueTime': 'str',
+        'valueDateTime': 'str',
+    },
+    'Observation_ReferenceRange': {
+        'text': 'str',
+    },
+    'Observation_Related': {
+        'type': 'str',
+    },
+    'OperationDefinition': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'status': 'str',
+        'kind': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'idempotent': 'bool',
+        'code': 'str',
+        'comment': 'str',
+        'system': 'bool',
+        'type': 'bool',
+        'instance': 'bool',
+    },
+    'OperationDefinition_Binding': {
+        'strength': 'str',
+        'valueSetUri': 'str',
+    },
+    'OperationDefinition_Overload': {
+        'comment': 'str',
+    },
+    'OperationDefinition_Parameter': {
+        'name': 'str',
+        'use': 'str',
+        'min': 'int',
+        'max': 'str',
+        'documentation': 'str',
+        'type': 'str',
+        'searchType': 'str',
+    },
+    'OperationOutcome_Issue': {
+        'severity': 'str',
+        'code': 'str',
+        'diagnostics': 'str',
+    },
+    'Organization': {
+        'active': 'bool',
+        'name': 'str',
+    },
+    'ParameterDefinition': {
+        'name': 'str',
+        'use': 'str',
+        'min': 'int',
+        'max': 'str',
+        'documentation': 'str',
+        'type': 'str',
+    },
+    'Parameters_Parameter': {
+        'name': 'str',
+        'valueBoolean': 'bool',
+        'valueInteger': 'int',
+        'valueDecimal': 'int',
+        'valueBase64Binary': 'str',
+        'valueInstant': 'str',
+        'valueString': 'str',
+        'valueUri': 'str',
+        'valueDate': 'str',
+        'valueDateTime': 'str',
+        'valueTime': 'str',
+        'valueCode': 'str',
+        'valueOid': 'str',
+        'valueUuid': 'str',
+        'valueId': 'str',
+        'valueUnsignedInt': 'int',
+        'valuePositiveInt': 'int',
+        'valueMarkdown': 'str',
+    },
+    'Patient': {
+        'active': 'bool',
+        'gender': 'str',
+        'birthDate': 'str',
+        'deceasedBoolean': 'bool',
+        'deceasedDateTime': 'str',
+        'multipleBirthBoolean': 'bool',
+        'multipleBirthInteger': 'int',
+    },
+    'Patient_Communication': {
+        'preferred': 'bool',
+    },
+    'Patient_Contact': {
+        'gender': 'str',
+    },
+    'Patient_Link': {
+        'type': 'str',
+    },
+    'PaymentNotice': {
+        'status': 'str',
+        'statusDate': 'str',
+        'created': 'str',
+    },
+    'PaymentReconciliation': {
+        'status': 'str',
+        'created': 'str',
+        'disposition': 'str',
+    },
+    'PaymentReconciliation_Detail': {
+        'date': 'str',
+    },
+    'PaymentReconciliation_ProcessNote': {
+        'text': 'str',
+    },
+    'Period': {
+        'start': 'str',
+        'end': 'str',
+    },
+    'Person': {
+        'gender': 'str',
+        'birthDate': 'str',
+        'active': 'bool',
+    },
+    'Person_Link': {
+        'assurance': 'str',
+    },
+    'PlanDefinition': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'usage': 'str',
+        'approvalDate': 'str',
+        'lastReviewDate': 'str',
+        'copyright': 'str',
+    },
+    'PlanDefinition_Action': {
+        'label': 'str',
+        'title': 'str',
+        'description': 'str',
+        'textEquivalent': 'str',
+        'timingDateTime': 'str',
+        'groupingBehavior': 'str',
+        'selectionBehavior': 'str',
+        'requiredBehavior': 'str',
+        'precheckBehavior': 'str',
+        'cardinalityBehavior': 'str',
+    },
+    'PlanDefinition_Condition': {
+        'kind': 'str',
+        'description': 'str',
+        'language': 'str',
+        'expression': 'str',
+    },
+    'PlanDefinition_DynamicValue': {
+        'description': 'str',
+        'path': 'str',
+        'language': 'str',
+        'expression': 'str',
+    },
+    'PlanDefinition_Participant': {
+        'type': 'str',
+    },
+    'PlanDefinition_RelatedAction': {
+        'actionId': 'str',
+        'relationship': 'str',
+    },
+    'Practitioner': {
+        'active': 'bool',
+        'gender': 'str',
+        'birthDate': 'str',
+    },
+    'PractitionerRole': {
+        'active': 'bool',
+        'availabilityExceptions': 'str',
+    },
+    'PractitionerRole_AvailableTime': {
+        'allDay': 'bool',
+        'availableStartTime': 'str',
+        'availableEndTime': 'str',
+    },
+    'PractitionerRole_NotAvailable': {
+        'description': 'str',
+    },
+    'Procedure': {
+        'status': 'str',
+        'notDone': 'bool',
+        'performedDateTime': 'str',
+    },
+    'ProcedureRequest': {
+        'status': 'str',
+        'intent': 'str',
+        'priority': 'str',
+        'doNotPerform': 'bool',
+        'occurrenceDateTime': 'str',
+        'asNeededBoolean': 'bool',
+        'authoredOn': 'str',
+    },
+    'ProcessRequest': {
+        'status': 'str',
+        'action': 'str',
+        'created': 'str',
+        'nullify': 'bool',
+        'reference': 'str',
+    },
+    'ProcessRequest_Item': {
+        'sequenceLinkId': 'int',
+    },
+    'ProcessResponse': {
+        'status': 'str',
+        'created': 'str',
+        'disposition': 'str',
+    },
+    'ProcessResponse_ProcessNote': {
+        'text': 'str',
+    },
+    'Provenance': {
+        'recorded': 'str',
+    },
+    'Provenance_Agent': {
+        'whoUri': 'str',
+        'onBehalfOfUri': 'str',
+    },
+    'Provenance_Entity': {
+        'role': 'str',
+        'whatUri': 'str',
+    },
+    'Quantity': {
+        'value': 'int',
+        'comparator': 'str',
+        'unit': 'str',
+        'system': 'str',
+        'code': 'str',
+    },
+    'Questionnaire': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'approvalDate': 'str',
+        'lastReviewDate': 'str',
+        'copyright': 'str',
+    },
+    'Questionnaire_EnableWhen': {
+        'question': 'str',
+        'hasAnswer': 'bool',
+        'answerBoolean': 'bool',
+        'answerDecimal': 'int',
+        'answerInteger': 'int',
+        'answerDate': 'str',
+        'answerDateTime': 'str',
+        'answerTime': 'str',
+        'answerString': 'str',
+        'answerUri': 'str',
+    },
+    'Questionnaire_Item': {
+        'linkId': 'str',
+        'definition': 'str',
+        'prefix': 'str',
+        'text': 'str',
+        'type': 'str',
+        'required': 'bool',
+        'repeats': 'bool',
+        'readOnly': 'bool',
+        'maxLength': 'int',
+        'initialBoolean': 'bool',
+        'initialDecimal': 'int',
+        'initialInteger': 'int',
+        'initialDate': 'str',
+        'initialDateTime': 'str',
+        'initialTime': 'str',
+        'initialString': 'str',
+        'initialUri': 'str',
+    },
+    'Questionnaire_Option': {
+        'valueInteger': 'int',
+        'valueDate': 'str',
+        'valueTime': 'str',
+        'valueString': 'str',
+    },
+    'QuestionnaireResponse': {
+        'status': 'str',
+        'authored': 'str',
+    },
+    'QuestionnaireResponse_Answer': {
+        'valueBoolean': 'bool',
+        'valueDecimal': 'int',
+        'valueInteger': 'int',
+        'valueDate': 'str',
+        'valueDateTime': 'str',
+        'valueTime': 'str',
+        'valueString': 'str',
+        'valueUri': 'str',
+    },
+    'QuestionnaireResponse_Item': {
+        'linkId': 'str',
+        'definition': 'str',
+        'text': 'str',
+    },
+    'Reference': {
+        'reference': 'str',
+        'display': 'str',
+    },
+    'ReferralRequest': {
+        'status': 'str',
+        'intent': 'str',
+        'priority': 'str',
+        'occurrenceDateTime': 'str',
+        'authoredOn': 'str',
+        'description': 'str',
+    },
+    'RelatedArtifact': {
+        'type': 'str',
+        'display': 'str',
+        'citation': 'str',
+        'url': 'str',
+    },
+    'RelatedPerson': {
+        'active': 'bool',
+        'gender': 'str',
+        'birthDate': 'str',
+    },
+    'RequestGroup': {
+        'status': 'str',
+        'intent': 'str',
+        'priority': 'str',
+        'authoredOn': 'str',
+    },
+    'RequestGroup_Action': {
+        'label': 'str',
+        'title': 'str',
+        'description': 'str',
+        'textEquivalent': 'str',
+        'timingDateTime': 'str',
+        'groupingBehavior': 'str',
+        'selectionBehavior': 'str',
+        'requiredBehavior': 'str',
+        'precheckBehavior': 'str',
+        'cardinalityBehavior': 'str',
+    },
+    'RequestGroup_Condition': {
+        'kind': 'str',
+        'description': 'str',
+        'language': 'str',
+        'expression': 'str',
+    },
+    'RequestGroup_RelatedAction': {
+        'actionId': 'str',
+        'relationship': 'str',
+    },
+    'ResearchStudy': {
+        'title': 'str',
+        'status': 'str',
+        'description': 'str',
+    },
+    'ResearchStudy_Arm': {
+        'name': 'str',
+        'description': 'str',
+    },
+    'ResearchSubject': {
+        'status': 'str',
+        'assignedArm': 'str',
+        'actualArm': 'str',
+    },
+    'Resource': {
+        'implicitRules': 'str',
+        'language': 'str',
+        'id': 'str',
+    },
+    'RiskAssessment': {
+        'status': 'str',
+        'occurrenceDateTime': 'str',
+        'mitigation': 'str',
+        'comment': 'str',
+    },
+    'RiskAssessment_Prediction': {
+        'probabilityDecimal': 'int',
+        'relativeRisk': 'int',
+        'rationale': 'str',
+    },
+    'SampledData': {
+        'period': 'int',
+        'factor': 'int',
+        'lowerLimit': 'int',
+        'upperLimit': 'int',
+        'dimensions': 'int',
+        'data': 'str',
+    },
+    'Schedule': {
+        'active': 'bool',
+        'comment': 'str',
+    },
+    'SearchParameter': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'purpose': 'str',
+        'code': 'str',
+        'type': 'str',
+        'derivedFrom': 'str',
+        'description': 'str',
+        'expression': 'str',
+        'xpath': 'str',
+        'xpathUsage': 'str',
+    },
+    'SearchParameter_Component': {
+        'expression': 'str',
+    },
+    'Sequence': {
+        'type': 'str',
+        'coordinateSystem': 'int',
+        'observedSeq': 'str',
+        'readCoverage': 'int',
+    },
+    'Sequence_Quality': {
+        'type': 'str',
+        'start': 'int',
+        'end': 'int',
+        'truthTP': 'int',
+        'queryTP': 'int',
+        'truthFN': 'int',
+        'queryFP': 'int',
+        'gtFP': 'int',
+        'precision': 'int',
+        'recall': 'int',
+        'fScore': 'int',
+    },
+    'Sequence_ReferenceSeq': {
+        'genomeBuild': 'str',
+        'referenceSeqString': 'str',
+        'strand': 'int',
+        'windowStart': 'int',
+        'windowEnd': 'int',
+    },
+    'Sequence_Repository': {
+        'type': 'str',
+        'url': 'str',
+        'name': 'str',
+        'datasetId': 'str',
+        'variantsetId': 'str',
+        'readsetId': 'str',
+    },
+    'Sequence_Variant': {
+        'start': 'int',
+        'end': 'int',
+        'observedAllele': 'str',
+        'referenceAllele': 'str',
+        'cigar': 'str',
+    },
+    'ServiceDefinition': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'usage': 'str',
+        'approvalDate': 'str',
+        'lastReviewDate': 'str',
+        'copyright': 'str',
+    },
+    'Signature': {
+        'when': 'str',
+        'whoUri': 'str',
+        'onBehalfOfUri': 'str',
+        'contentType': 'str',
+        'blob': 'str',
+    },
+    'Slot': {
+        'status': 'str',
+        'start': 'str',
+        'end': 'str',
+        'overbooked': 'bool',
+        'comment': 'str',
+    },
+    'Specimen': {
+        'status': 'str',
+        'receivedTime': 'str',
+    },
+    'Specimen_Collection': {
+        'collectedDateTime': 'str',
+    },
+    'Specimen_Container': {
+        'description': 'str',
+    },
+    'Specimen_Processing': {
+        'description': 'str',
+        'timeDateTime': 'str',
+    },
+    'StructureDefinition': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'copyright': 'str',
+        'fhirVersion': 'str',
+        'kind': 'str',
+        'abstract': 'bool',
+        'contextType': 'str',
+        'type': 'str',
+        'baseDefinition': 'str',
+        'derivation': 'str',
+    },
+    'StructureDefinition_Mapping': {
+        'identity': 'str',
+        'uri': 'str',
+        'name': 'str',
+        'comment': 'str',
+    },
+    'StructureMap': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'copyright': 'str',
+    },
+    'StructureMap_Dependent': {
+        'name': 'str',
+    },
+    'StructureMap_Group': {
+        'name': 'str',
+        'extends': 'str',
+        'typeMode': 'str',
+        'documentation': 'str',
+    },
+    'StructureMap_Input': {
+        'name': 'str',
+        'type': 'str',
+        'mode': 'str',
+        'documentation': 'str',
+    },
+    'StructureMap_Parameter': {
+        'valueId': 'str',
+        'valueString': 'str',
+        'valueBoolean': 'bool',
+        'valueInteger': 'int',
+        'valueDecimal': 'int',
+    },
+    'StructureMap_Rule': {
+        'name': 'str',
+        'documentation': 'str',
+    },
+    'StructureMap_Source': {
+        'context': 'str',
+        'min': 'int',
+        'max': 'str',
+        'type': 'str',
+        'defaultValueBoolean': 'bool',
+        'defaultValueInteger': 'int',
+        'defaultValueDecimal': 'int',
+        'defaultValueBase64Binary': 'str',
+        'defaultValueInstant': 'str',
+        'defaultValueString': 'str',
+        'defaultValueUri': 'str',
+        'defaultValueDate': 'str',
+        'defaultValueDateTime': 'str',
+        'defaultValueTime': 'str',
+        'defaultValueCode': 'str',
+        'defaultValueOid': 'str',
+        'defaultValueUuid': 'str',
+        'defaultValueId': 'str',
+        'defaultValueUnsignedInt': 'int',
+        'defaultValuePositiveInt': 'int',
+        'defaultValueMarkdown': 'str',
+        'element': 'str',
+        'listMode': 'str',
+        'variable': 'str',
+        'condition': 'str',
+        'check': 'str',
+    },
+    'StructureMap_Structure': {
+        'url': 'str',
+        'mode': 'str',
+        'alias': 'str',
+        'documentation': 'str',
+    },
+    'StructureMap_Target': {
+        'context': 'str',
+        'contextType': 'str',
+        'element': 'str',
+        'variable': 'str',
+        'listRuleId': 'str',
+        'transform': 'str',
+    },
+    'Subscription': {
+        'status': 'str',
+        'end': 'str',
+        'reason': 'str',
+        'criteria': 'str',
+        'error': 'str',
+    },
+    'Subscription_Channel': {
+        'type': 'str',
+        'endpoint': 'str',
+        'payload': 'str',
+    },
+    'Substance': {
+        'status': 'str',
+        'description': 'str',
+    },
+    'Substance_Instance': {
+        'expiry': 'str',
+    },
+    'SupplyDelivery': {
+        'status': 'str',
+        'occurrenceDateTime': 'str',
+    },
+    'SupplyRequest': {
+        'status': 'str',
+        'priority': 'str',
+        'occurrenceDateTime': 'str',
+        'authoredOn': 'str',
+    },
+    'Task': {
+        'definitionUri': 'str',
+        'status': 'str',
+        'intent': 'str',
+        'priority': 'str',
+        'description': 'str',
+        'authoredOn': 'str',
+        'lastModified': 'str',
+    },
+    'Task_Input': {
+        'valueBoolean': 'bool',
+        'valueInteger': 'int',
+        'valueDecimal': 'int',
+        'valueBase64Binary': 'str',
+        'valueInstant': 'str',
+        'valueString': 'str',
+        'valueUri': 'str',
+        'valueDate': 'str',
+        'valueDateTime': 'str',
+        'valueTime': 'str',
+        'valueCode': 'str',
+        'valueOid': 'str',
+        'valueUuid': 'str',
+        'valueId': 'str',
+        'valueUnsignedInt': 'int',
+        'valuePositiveInt': 'int',
+        'valueMarkdown': 'str',
+    },
+    'Task_Output': {
+        'valueBoolean': 'bool',
+        'valueInteger': 'int',
+        'valueDecimal': 'int',
+        'valueBase64Binary': 'str',
+        'valueInstant': 'str',
+        'valueString': 'str',
+        'valueUri': 'str',
+        'valueDate': 'str',
+        'valueDateTime': 'str',
+        'valueTime': 'str',
+        'valueCode': 'str',
+        'valueOid': 'str',
+        'valueUuid': 'str',
+        'valueId': 'str',
+        'valueUnsignedInt': 'int',
+        'valuePositiveInt': 'int',
+        'valueMarkdown': 'str',
+    },
+    'Task_Restriction': {
+        'repetitions': 'int',
+    },
+    'TestReport': {
+        'name': 'str',
+        'status': 'str',
+        'result': 'str',
+        'score': 'int',
+        'tester': 'str',
+        'issued': 'str',
+    },
+    'TestReport_Assert': {
+        'result': 'str',
+        'message': 'str',
+        'detail': 'str',
+    },
+    'TestReport_Operation': {
+        'result': 'str',
+        'message': 'str',
+        'detail': 'str',
+    },
+    'TestReport_Participant': {
+        'type': 'str',
+        'uri': 'str',
+        'display': 'str',
+    },
+    'TestReport_Test': {
+        'name': 'str',
+        'description': 'str',
+    },
+    'TestScript': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'copyright': 'str',
+    },
+    'TestScript_Assert': {
+        'label': 'str',
+        'description': 'str',
+        'direction': 'str',
+        'compareToSourceId': 'str',
+        'compareToSourceExpression': 'str',
+        'compareToSourcePath': 'str',
+        'contentType': 'str',
+        'expression': 'str',
+        'headerField': 'str',
+        'minimumId': 'str',
+        'navigationLinks': 'bool',
+        'operator': 'str',
+        'path': 'str',
+        'requestMethod': 'str',
+        'requestURL': 'str',
+        'resource': 'str',
+        'response': 'str',
+        'responseCode': 'str',
+        'sourceId': 'str',
+        'validateProfileId': 'str',
+        'value': 'str',
+        'warningOnly': 'bool',
+    },
+    'TestScript_Capability': {
+        'required': 'bool',
+        'validated': 'bool',
+        'description': 'str',
+        'destination': 'int',
+    },
+    'TestScript_Destination': {
+        'index': 'int',
+    },
+    'TestScript_Fixture': {
+        'autocreate': 'bool',
+        'autodelete': 'bool',
+    },
+    'TestScript_Link': {
+        'url': 'str',
+        'description': 'str',
+    },
+    'TestScript_Operation': {
+        'resource': 'str',
+        'label': 'str',
+        'description': 'str',
+        'accept': 'str',
+        'contentType': 'str',
+        'destination': 'int',
+        'encodeRequestUrl': 'bool',
+        'origin': 'int',
+        'params': 'str',
+        'requestId': 'str',
+        'responseId': 'str',
+        'sourceId': 'str',
+        'targetId': 'str',
+        'url': 'str',
+    },
+    'TestScript_Origin': {
+        'index': 'int',
+    },
+    'TestScript_Param': {
+        'name': 'str',
+        'value': 'str',
+    },
+    'TestScript_Param1': {
+        'name': 'str',
+        'value': 'str',
+    },
+    'TestScript_Param2': {
+        'name': 'str',
+        'value': 'str',
+    },
+    'TestScript_Param3': {
+        'name': 'str',
+        'value': 'str',
+    },
+    'TestScript_RequestHeader': {
+        'field': 'str',
+        'value': 'str',
+    },
+    'TestScript_Rule1': {
+        'ruleId': 'str',
+    },
+    'TestScript_Rule2': {
+        'ruleId': 'str',
+    },
+    'TestScript_Rule3': {
+        'ruleId': 'str',
+    },
+    'TestScript_Ruleset1': {
+        'rulesetId': 'str',
+    },
+    'TestScript_Test': {
+        'name': 'str',
+        'description': 'str',
+    },
+    'TestScript_Variable': {
+        'name': 'str',
+        'defaultValue': 'str',
+        'description': 'str',
+        'expression': 'str',
+        'headerField': 'str',
+        'hint': 'str',
+        'path': 'str',
+        'sourceId': 'str',
+    },
+    'Timing_Repeat': {
+        'count': 'int',
+        'countMax': 'int',
+        'duration': 'int',
+        'durationMax': 'int',
+        'durationUnit': 'str',
+        'frequency': 'int',
+        'frequencyMax': 'int',
+        'period': 'int',
+        'periodMax': 'int',
+        'periodUnit': 'str',
+        'offset': 'int',
+    },
+    'TriggerDefinition': {
+        'type': 'str',
+        'eventName': 'str',
+        'eventTimingDate': 'str',
+        'eventTimingDateTime': 'str',
+    },
+    'ValueSet': {
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'immutable': 'bool',
+        'purpose': 'str',
+        'copyright': 'str',
+        'extensible': 'bool',
+    },
+    'ValueSet_Compose': {
+        'lockedDate': 'str',
+        'inactive': 'bool',
+    },
+    'ValueSet_Concept': {
+        'code': 'str',
+        'display': 'str',
+    },
+    'ValueSet_Contains': {
+        'system': 'str',
+        'abstract': 'bool',
+        'inactive': 'bool',
+        'version': 'str',
+        'code': 'str',
+        'display': 'str',
+    },
+    'ValueSet_Designation': {
+        'language': 'str',
+        'value': 'str',
+    },
+    'ValueSet_Expansion': {
+        'timestamp': 'str',
+        'total': 'int',
+        'offset': 'int',
+        'identifier': 'str',
+    },
+    'ValueSet_Filter': {
+        'property': 'str',
+        'op': 'str',
+        'value': 'str',
+    },
+    'ValueSet_Include': {
+        'system': 'str',
+        'version': 'str',
+    },
+    'ValueSet_Parameter': {
+        'name': 'str',
+        'valueString': 'str',
+        'valueBoolean': 'bool',
+        'valueInteger': 'int',
+        'valueDecimal': 'int',
+        'valueUri': 'str',
+        'valueCode': 'str',
+    },
+    'VisionPrescription': {
+        'status': 'str',
+        'dateWritten': 'str',
+    },
+    'VisionPrescription_Dispense': {
+        'eye': 'str',
+        'sphere': 'int',
+        'cylinder': 'int',
+        'axis': 'int',
+        'prism': 'int',
+        'base': 'str',
+        'add': 'int',
+        'power': 'int',
+        'backCurve': 'int',
+        'diameter': 'int',
+        'color': 'str',
+        'brand': 'str',
+    },
+}
+
+# (parent_entity, parent_variable, child_entity, child_variable, cardinality)
+RELATIONSHIPS = (
+    ('Reference', 'identifier', 'Account', 'subject', 'one'),
+    ('Account_Coverage', 'object_id', 'Account', 'coverage', 'many'),
+    ('Period', 'object_id', 'Account', 'period', 'one'),
+    ('Reference', 'identifier', 'Account', 'owner', 'one'),
+    ('Period', 'object_id', 'Account', 'active', 'one'),
+    ('Account_Guarantor', 'object_id', 'Account', 'guarantor', 'many'),
+    ('CodeableConcept', 'object_id', 'Account', 'type', 'one'),
+    ('Money', 'object_id', 'Account', 'balance', 'one'),
+    ('Identifier', 'object_id', 'Account', 'identifier', 'many'),
+    ('Reference', 'identifier', 'Account_Coverage', 'coverage', 'one'),
+    ('Reference', 'identifier', 'Account_Guarantor', 'party', 'one'),
+    ('Period', 'object_id', 'Account_Guarantor', 'period', 'one'),
+    ('Quantity', 'object_id', 'ActivityDefinition', 'quantity', 'one'),
+    ('Range', 'object_id', 'ActivityDefinition', 'timingRange', 'one'),
+    ('CodeableConcept', 'object_id', 'ActivityDefinition', 'bodySite', 'many'),
+    ('Reference', 'identifier', 'ActivityDefinition', 'transform', 'one'),
+    ('Dosage', 'object_id', 'ActivityDefinition', 'dosage', 'many'),
+    ('Contributor', 'object_id', 'ActivityDefinition', 'contributor', 'many'),
+    ('RelatedArtifact', 'object_id', 'ActivityDefinition', 'relatedArtifact', 'many'),
+    ('ContactDetail', 'object_id', 'ActivityDefinition', 'contact', 'many'),
+    ('ActivityDefinition_Participant', 'object_id', 'ActivityDefinition', 'participant', 'many'),
+    ('Timing', 'object_id', 'ActivityDefinition', 'timingTiming', 'one'),
+    ('CodeableConcept', 'object_id', 'ActivityDefinition', 'productCodeableConcept', 'one'),
+    ('CodeableConcept', 'object_id', 'ActivityDefinition', 'topic', 'many'),
+    ('Reference', 'identifier', 'ActivityDefinition', 'location', 'one'),
+    ('Reference', 'identifier', 'ActivityDefinition', 'productReference', 'one'),
+    ('UsageContext', 'object_id', 'ActivityDefinition', 'useContext', 'many'),
+    ('CodeableConcept', 'object_id', 'ActivityDefinition', 'code', 'one'),
+    ('CodeableConcept', 'object_id', 'ActivityDefinition', 'jurisdiction', 'many'),
+    ('Identifier', 'object_id', 'ActivityDefinition', 'identifier', 'many'),
+    ('ActivityDefinition_DynamicValue', 'object_id', 'ActivityDefinition', 'dynamicValue', 'many'),
+    ('Reference', 'identifier', 'ActivityDefinition', 'library', 'many'),
+    ('Period', 'object_id', 'ActivityDefinition', 'effectivePeriod', 'one'),
+    ('Period', 'object_id', 'ActivityDefinition', 'timingPeriod', 'one'),
+    ('CodeableConcept', 'object_id', 'ActivityDefinition_Participant', 'role', 'one'),
+    ('Period', 'object_id', 'Address', 'period', 'one'),
+    ('AdverseEvent_SuspectEntity', 'object_id', 'AdverseEvent', 'suspectEntity', 'many'),
+    ('Reference', 'identifier', 'AdverseEvent', 'subjectMedicalHistory', 'many'),
+    ('CodeableConcept', 'object_id', 'AdverseEvent', 'outcome', 'one'),
+    ('Reference', 'identifier', 'AdverseEvent', 'reaction', 'many'),
+    ('Identifier', 'object_id', 'AdverseEvent', 'identifier', 'one'),
+    ('Reference', 'identifier', 'AdverseEvent', 'recorder', 'one'),
+    ('Reference', 'identifier', 'AdverseEvent', 'study', 'many'),
+    ('Reference', 'identifier', 'AdverseEvent', 'location', 'one'),
+    ('Reference', 'identifier', 'AdverseEvent', 'referenceDocument', 'many'),
+    ('Reference', 'identifier', 'AdverseEvent', 'eventParticipant', 'one'),
+    ('CodeableConcept', 'object_id', 'AdverseEvent', 'type', 'one'),
+    ('Reference', 'identifier', 'AdverseEvent', 'subject', 'one'),
+    ('CodeableConcept', 'object_id', 'AdverseEvent', 'seriousness', 'one'),
+    ('Reference', 'identifier', 'AdverseEvent_SuspectEntity', 'causalityAuthor', 'one'),
+    ('CodeableConcept', 'object_id', 'AdverseEvent_SuspectEntity', 'causalityResult', 'one'),
+    ('Reference', 'identifier', 'AdverseEvent_SuspectEntity', 'instance', 'one'),
+    ('CodeableConcept', 'object_id', 'AdverseEvent_SuspectEntity', 'causalityAssessment', 'one'),
+    ('CodeableConcept', 'object_id', 'AdverseEvent_SuspectEntity', 'causalityMethod', 'one'),
+    ('Age', 'object_id', 'AllergyIntolerance', 'onsetAge', 'one'),
+    ('Annotation', 'object_id', 'AllergyIntolerance', 'note', 'many'),
+    ('Reference', 'identifier', 'AllergyIntolerance', 'recorder', 'one'),
+    ('Reference', 'identifier', 'AllergyIntolerance', 'patient', 'one'),
+    ('Range', 'object_id', 'AllergyIntolerance', 'onsetRange', 'one'),
+    ('AllergyIntolerance_Reaction', 'object_id', 'AllergyIntolerance', 'reaction', 'many'),
+    ('Reference', 'identifier', 'AllergyIntolerance', 'asserter', 'one'),
+    ('CodeableConcept', 'object_id', 'AllergyIntolerance', 'code', 'one'),
+    ('Identifier', 'object_id', 'AllergyIntolerance', 'identifier', 'many'),
+    ('Period', 'object_id', 'AllergyIntolerance', 'onsetPeriod', 'one'),
+    ('Annotation', 'object_id', 'AllergyIntolerance_Reaction', 'note', 'many'),
+    ('CodeableConcept', 'object_id', 'AllergyIntolerance_Reaction', 'substance', 'one'),
+    ('CodeableConcept', 'object_id', 'AllergyIntolerance_Reaction', 'exposureRoute', 'one'),
+    ('CodeableConcept', 'object_id', 'AllergyIntolerance_Reaction', 'manifestation', 'many'),
+    ('Reference', 'identifier', 'Annotation', 'authorReference', 'one'),
+    ('CodeableConcept', 'object_id', 'Appointment', 'appointmentType', 'one'),
+    ('Reference', 'identifier', 'Appointment', 'indication', 'many'),
+    ('Reference', 'identifier', 'Appointment', 'supportingInformation', 'many'),
+    ('CodeableConcept', 'object_id', 'Appointment', 'specialty', 'many'),
+    ('CodeableConcept', 'object_id', 'Appointment', 'reason', 'many'),
+    ('Identifier', 'object_id', 'Appointment', 'identifier', 'many'),
+    ('CodeableConcept', 'object_id', 'Appointment', 'serviceCategory', 'one'),
+    ('CodeableConcept', 'object_id', 'Appointment', 'serviceType', 'many'),
+    ('Reference', 'identifier', 'Appointment', 'slot', 'many'),
+    ('Reference', 'identifier', 'Appointment', 'incomingReferral', 'many'),
+    ('Appointment_Participant', 'object_id', 'Appointment', 'participant', 'many'),
+    ('Period', 'object_id', 'Appointment', 'requestedPeriod', 'many'),
+    ('Reference', 'identifier', 'Appointment_Participant', 'actor', 'one'),
+    ('CodeableConcept', 'object_id', 'Appointment_Participant', 'type', 'many'),
+    ('Reference', 'identifier', 'AppointmentResponse', 'actor', 'one'),
+    ('Reference', 'identifier', 'AppointmentResponse', 'appointment', 'one'),
+    ('Identifier', 'object_id', 'AppointmentResponse', 'identifier', 'many'),
+    ('CodeableConcept', 'object_id', 'AppointmentResponse', 'participantType', 'many'),
+    ('Coding', 'object_id', 'AuditEvent', 'type', 'one'),
+    ('Coding', 'object_id', 'AuditEvent', 'subtype', 'many'),
+    ('AuditEvent_Source', 'identifier', 'AuditEvent', 'source', 'one'),
+    ('AuditEvent_Agent', 'object_id', 'AuditEvent', 'agent', 'many'),
+    ('AuditEvent_Entity', 'identifier', 'AuditEvent', 'entity', 'many'),
+    ('CodeableConcept', 'object_id', 'AuditEvent', 'purposeOfEvent', 'many'),
+    ('CodeableConcept', 'object_id', 'AuditEvent_Agent', 'purposeOfUse', 'many'),
+    ('Reference', 'identifier', 'AuditEvent_Agent', 'reference', 'one'),
+    ('Identifier', 'object_id', 'AuditEvent_Agent', 'userId', 'one'),
+    ('Reference', 'identifier', 'AuditEvent_Agent', 'location', 'one'),
+    ('AuditEvent_Network', 'object_id', 'AuditEvent_Agent', 'network', 'one'),
+    ('Coding', 'object_id', 'AuditEvent_Agent', 'media', 'one'),
+    ('CodeableConcept', 'object_id', 'AuditEvent_Agent', 'role', 'many'),
+    ('Coding', 'object_id', 'AuditEvent_Entity', 'type', 'one'),
+    ('AuditEvent_Detail', 'object_id', 'AuditEvent_Entity', 'detail', 'many'),
+    ('Coding', 'object_id', 'AuditEvent_Entity', 'role', 'one'),
+    ('Coding', 'object_id', 'AuditEvent_Entity', 'securityLabel', 'many'),
+    ('Identifier', 'object_id', 'AuditEvent_Entity', 'identifier', 'one'),
+    ('Reference', 'identifier', 'AuditEvent_Entity', 'reference', 'one'),
+    ('Coding', 'object_id', 'AuditEvent_Entity', 'lifecycle', 'one'),
+    ('Identifier', 'object_id', 'AuditEvent_Source', 'identifier', 'one'),
+    ('Coding', 'object_id', 'AuditEvent_Source', 'type', 'many'),
+    ('Extension', 'object_id', 'BackboneElement', 'modifierExtension', 'many'),
+    ('Reference', 'identifier', 'Basic', 'author', 'one'),
+    ('CodeableConcept', 'object_id', 'Basic', 'code', 'one'),
+    ('Reference', 'identifier', 'Basic', 'subject', 'one'),
+    ('Identifier', 'object_id', 'Basic', 'identifier', 'many'),
+    ('Reference', 'identifier', 'Binary', 'securityContext', 'one'),
+    ('Reference', 'identifier', 'BodySite', 'patient', 'one'),
+    ('CodeableConcept', 'object_id', 'BodySite', 'code', 'one'),
+    ('CodeableConcept', 'object_id', 'BodySite', 'qualifier', 'many'),
+    ('Identifier', 'object_id', 'BodySite', 'identifier', 'many'),
+    ('Attachment', 'object_id', 'BodySite', 'image', 'many'),
+    ('Signature', 'object_id', 'Bundle', 'signature', 'one'),
+    ('Bundle_Entry', 'object_id', 'Bundle', 'entry', 'many'),
+    ('Bundle_Link', 'object_id', 'Bundle', 'link', 'many'),
+    ('Identifier', 'object_id', 'Bundle', 'identifier', 'one'),
+    ('Bundle_Search', 'object_id', 'Bundle_Entry', 'search', 'one'),
+    ('Bundle_Response', 'object_id', 'Bundle_Entry', 'response', 'one'),
+    ('Bundle_Link', 'object_id', 'Bundle_Entry', 'link', 'many'),
+    ('ResourceList', 'object_id', 'Bundle_Entry', 'resource', 'one'),
+    ('Bundle_Request', 'object_id', 'Bundle_Entry', 'request', 'one'),
+    ('ResourceList', 'object_id', 'Bundle_Response', 'outcome', 'one'),
+    ('CapabilityStatement_Rest', 'object_id', 'CapabilityStatement', 'rest', 'many'),
+    ('ContactDetail', 'object_id', 'CapabilityStatement', 'contact', 'many'),
+    ('CapabilityStatement_Software', 'object_id', 'CapabilityStatement', 'software', 'one'),
+    ('CapabilityStatement_Implementation', 'object_id', 'CapabilityStatement',
+     'implementation', 'one'),
+    ('Reference', 'identifier', 'CapabilityStatement', 'profile', 'many'),
+    ('CodeableConcept', 'object_id', 'CapabilityStatement', 'jurisdiction', 'many'),
+    ('CapabilityStatement_Document', 'object_id', 'CapabilityStatement', 'document', 'many'),
+    ('CapabilityStatement_Messaging', 'object_id', 'CapabilityStatement', 'messaging', 'many'),
+    ('UsageContext', 'object_id', 'CapabilityStatement', 'useContext', 'many'),
+    ('Reference', 'identifier', 'CapabilityStatement_Document', 'profile', 'one'),
+    ('Coding', 'object_id', 'CapabilityStatement_Endpoint', 'protocol', 'one'),
+    ('Reference', 'identifier', 'CapabilityStatement_Event', 'request', 'one'),
+    ('Reference', 'identifier', 'CapabilityStatement_Event', 'response', 'one'),
+    ('Coding', 'object_id', 'CapabilityStatement_Event', 'code', 'one'),
+    ('CapabilityStatement_Endpoint', 'object_id', 'CapabilityStatement_Messaging',
+     'endpoint', 'many'),
+    ('CapabilityStatement_SupportedMessage', 'object_id', 'CapabilityStatement_Messaging',
+     'supportedMessage', 'many'),
+    ('CapabilityStatement_Event', 'object_id', 'CapabilityStatement_Messaging', 'event', 'many'),
+    ('Reference', 'identifier', 'CapabilityStatement_Operation', 'definition', 'one'),
+    ('Reference', 'identifier', 'CapabilityStatement_Resource', 'profile', 'one'),
+    ('CapabilityStatement_SearchParam', 'object_id', 'CapabilityStatement_Resource',
+     'searchParam', 'many'),
+    ('CapabilityStatement_Interaction', 'object_id', 'CapabilityStatement_Resource',
+     'interaction', 'many'),
+    ('CapabilityStatement_SearchParam', 'object_id', 'CapabilityStatement_Rest',
+     'searchParam', 'many'),
+    ('CapabilityStatement_Interaction1', 'object_id', 'CapabilityStatement_Rest',
+     'interaction', 'many'),
+    ('CapabilityStatement_Security', 'object_id', 'CapabilityStatement_Rest', 'security', 'one'),
+    ('CapabilityStatement_Resource', 'object_id', 'CapabilityStatement_Rest', 'resource', 'many'),
+    ('CapabilityStatement_Operation', 'object_id', 'CapabilityStatement_Rest',
+     'operation', 'many'),
+    ('CapabilityStatement_Certificate', 'object_id', 'CapabilityStatement_Security',
+     'certificate', 'many'),
+    ('CodeableConcept', 'object_id', 'CapabilityStatement_Security', 'service', 'many'),
+    ('Reference', 'identifier', 'CapabilityStatement_SupportedMessage', 'definition', 'one'),
+    ('Reference', 'identifier', 'CarePlan', 'author', 'many'),
+    ('Reference', 'identifier', 'CarePlan', 'subject', 'one'),
+    ('Reference', 'identifier', 'CarePlan', 'careTeam', 'many'),
+    ('Reference', 'identifier', 'CarePlan', 'context', 'one'),
+    ('Annotation', 'object_id', 'CarePlan', 'note', 'many'),
+    ('Identifier', 'object_id', 'CarePlan', 'identifier', 'many'),
+    ('Reference', 'identifier', 'CarePlan', 'supportingInfo', 'many'),
+    ('Reference', 'identifier', 'CarePlan', 'goal', 'many'),
+    ('CarePlan_Activity', 'object_id', 'CarePlan', 'activity', 'many'),
+    ('CodeableConcept', 'object_id', 'CarePlan', 'category', 'many'),
+    ('Reference', 'identifier', 'CarePlan', 'addresses', 'many'),
+    ('Period', 'object_id', 'CarePlan', 'period', 'one'),
+    ('Reference', 'identifier', 'CarePlan', 'replaces', 'many'),
+    ('Reference', 'identifier', 'CarePlan', 'definition', 'many'),
+    ('Reference', 'identifier', 'CarePlan', 'basedOn', 'many'),
+    ('Reference', 'identifier', 'CarePlan', 'partOf', 'many'),
+    ('CarePlan_Detail', 'object_id', 'CarePlan_Activity', 'detail', 'one'),
+    ('Annotation', 'object_id', 'CarePlan_Activity', 'progress', 'many'),
+    ('Reference', 'identifier', 'CarePlan_Activity', 'outcomeReference', 'many'),
+    ('Reference', 'identifier', 'CarePlan_Activity', 'reference', 'one'),
+    ('CodeableConcept', 'object_id', 'CarePlan_Activity', 'outcomeCodeableConcept', 'many'),
+    ('Period', 'object_id', 'CarePlan_Detail', 'scheduledPeriod', 'one'),
+    ('Reference', 'identifier', 'CarePlan_Detail', 'productReference', 'one'),
+    ('Quantity', 'object_id', 'CarePlan_Detail', 'dailyAmount', 'one'),
+    ('Reference', 'identifier', 'CarePlan_Detail', 'performer', 'many'),
+    ('CodeableConcept', 'object_id', 'CarePlan_Detail', 'reasonCode', 'many'),
+    ('Timing', 'object_id', 'CarePlan_Detail', 'scheduledTiming', 'one'),
+    ('CodeableConcept', 'object_id', 'CarePlan_Detail', 'category', 'one'),
+    ('Reference', 'identifier', 'CarePlan_Detail', 'goal', 'many'),
+    ('CodeableConcept', 'object_id', 'CarePlan_Detail', 'code', 'one'),
+    ('Reference', 'identifier', 'CarePlan_Detail', 'location', 'one'),
+    ('Quantity', 'object_id', 'CarePlan_Detail', 'quantity', 'one'),
+    ('CodeableConcept', 'object_id', 'CarePlan_Detail', 'productCodeableConcept', 'one'),
+    ('Reference', 'identifier', 'CarePlan_Detail', 'reasonReference', 'many'),
+    ('Reference', 'identifier', 'CarePlan_Detail', 'definition', 'one'),
+    ('Annotation', 'object_id', 'CareTeam', 'note', 'many'),
+    ('Reference', 'identifier', 'CareTeam', 'reasonReference', 'many'),
+    ('CodeableConcept', 'object_id', 'CareTeam', 'reasonCode', 'many'),
+    ('CareTeam_Participant', 'object_id', 'CareTeam', 'participant', 'many'),
+    ('Identifier', 'object_id', 'CareTeam', 'identifier', 'many'),
+    ('Reference', 'identifier', 'CareTeam', 'subject', 'one'),
+    ('Reference', 'identifier', 'CareTeam', 'context', 'one'),
+    ('Reference', 'identifier', 'CareTeam', 'managingOrganization', 'many'),
+    ('CodeableConcept', 'object_id', 'CareTeam', 'category', 'many'),
+    ('Period', 'object_id', 'CareTeam', 'period', 'one'),
+    ('Reference', 'identifier', 'CareTeam_Participant', 'onBehalfOf', 'one'),
+    ('CodeableConcept', 'object_id', 'CareTeam_Participant', 'role', 'one'),
+    ('Reference', 'identifier', 'CareTeam_Participant', 'member', 'one'),
+    ('Period', 'object_id', 'CareTeam_Participant', 'period', 'one'),
+    ('Identifier', 'object_id', 'ChargeItem', 'identifier', 'one'),
+    ('CodeableConcept', 'object_id', 'ChargeItem', 'bodysite', 'many'),
+    ('Quantity', 'object_id', 'ChargeItem', 'quantity', 'one'),
+    ('Reference', 'identifier', 'ChargeItem', 'account', 'many'),
+    ('Reference', 'identifier', 'ChargeItem', 'service', 'many'),
+    ('Annotation', 'object_id', 'ChargeItem', 'note', 'many'),
+    ('Money', 'object_id', 'ChargeItem', 'priceOverride', 'one'),
+    ('Reference', 'identifier', 'ChargeItem', 'requestingOrganization', 'one'),
+    ('CodeableConcept', 'object_id', 'ChargeItem', 'code', 'one'),
+    ('Reference', 'identifier', 'ChargeItem', 'supportingInformation', 'many'),
+    ('CodeableConcept', 'object_id', 'ChargeItem', 'reason', 'many'),
+    ('Period', 'object_id', 'ChargeItem', 'occurrencePeriod', 'one'),
+    ('ChargeItem_Participant', 'object_id', 'ChargeItem', 'participant', 'many'),
+    ('Reference', 'identifier', 'ChargeItem', 'subject', 'one'),
+    ('Reference', 'identifier', 'ChargeItem', 'enterer', 'one'),
+    ('Reference', 'identifier', 'ChargeItem', 'partOf', 'many'),
+    ('Reference', 'identifier', 'ChargeItem', 'context', 'one'),
+    ('Reference', 'identifier', 'ChargeItem', 'performingOrganization', 'one'),
+    ('Timing', 'object_id', 'ChargeItem', 'occurrenceTiming', 'one'),
+    ('Reference', 'identifier', 'ChargeItem_Participant', 'actor', 'one'),
+    ('CodeableConcept', 'object_id', 'ChargeItem_Participant', 'role', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim', 'type', 'one'),
+    ('Period', 'object_id', 'Claim', 'billablePeriod', 'one'),
+    ('Claim_Accident', 'object_id', 'Claim', 'accident', 'one'),
+    ('Claim_CareTeam', 'object_id', 'Claim', 'careTeam', 'many'),
+    ('Identifier', 'object_id', 'Claim', 'identifier', 'many'),
+    ('Reference', 'identifier', 'Claim', 'organization', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim', 'subType', 'many'),
+    ('Reference', 'identifier', 'Claim', 'prescription', 'one'),
+    ('Reference', 'identifier', 'Claim', 'facility', 'one'),
+    ('Reference', 'identifier', 'Claim', 'originalPrescription', 'one'),
+    ('Claim_Related', 'object_id', 'Claim', 'related', 'many'),
+    ('CodeableConcept', 'object_id', 'Claim', 'fundsReserve', 'one'),
+    ('Reference', 'identifier', 'Claim', 'patient', 'one'),
+    ('Claim_Procedure', 'object_id', 'Claim', 'procedure', 'many'),
+    ('Reference', 'identifier', 'Claim', 'insurer', 'one'),
+    ('Claim_Insurance', 'object_id', 'Claim', 'insurance', 'many'),
+    ('Period', 'object_id', 'Claim', 'hospitalization', 'one'),
+    ('Claim_Information', 'object_id', 'Claim', 'information', 'many'),
+    ('Reference', 'identifier', 'Claim', 'enterer', 'one'),
+    ('Reference', 'identifier', 'Claim', 'provider', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim', 'priority', 'one'),
+    ('Money', 'object_id', 'Claim', 'total', 'one'),
+    ('Claim_Item', 'object_id', 'Claim', 'item', 'many'),
+    ('Claim_Payee', 'object_id', 'Claim', 'payee', 'one'),
+    ('Claim_Diagnosis', 'object_id', 'Claim', 'diagnosis', 'many'),
+    ('Period', 'object_id', 'Claim', 'employmentImpacted', 'one'),
+    ('Reference', 'identifier', 'Claim', 'referral', 'one'),
+    ('Reference', 'identifier', 'Claim_Accident', 'locationReference', 'one'),
+    ('Address', 'object_id', 'Claim_Accident', 'locationAddress', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_Accident', 'type', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_CareTeam', 'role', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_CareTeam', 'qualification', 'one'),
+    ('Reference', 'identifier', 'Claim_CareTeam', 'provider', 'one'),
+    ('Money', 'object_id', 'Claim_Detail', 'net', 'one'),
+    ('Reference', 'identifier', 'Claim_Detail', 'udi', 'many'),
+    ('CodeableConcept', 'object_id', 'Claim_Detail', 'revenue', 'one'),
+    ('Claim_SubDetail', 'object_id', 'Claim_Detail', 'subDetail', 'many'),
+    ('CodeableConcept', 'object_id', 'Claim_Detail', 'programCode', 'many'),
+    ('CodeableConcept', 'object_id', 'Claim_Detail', 'category', 'one'),
+    ('Quantity', 'object_id', 'Claim_Detail', 'quantity', 'one'),
+    ('Money', 'object_id', 'Claim_Detail', 'unitPrice', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_Detail', 'modifier', 'many'),
+    ('CodeableConcept', 'object_id', 'Claim_Detail', 'service', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_Diagnosis', 'packageCode', 'one'),
+    ('Reference', 'identifier', 'Claim_Diagnosis', 'diagnosisReference', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_Diagnosis', 'type', 'many'),
+    ('CodeableConcept', 'object_id', 'Claim_Diagnosis', 'diagnosisCodeableConcept', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_Information', 'code', 'one'),
+    ('Quantity', 'object_id', 'Claim_Information', 'valueQuantity', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_Information', 'category', 'one'),
+    ('Attachment', 'object_id', 'Claim_Information', 'valueAttachment', 'one'),
+    ('Period', 'object_id', 'Claim_Information', 'timingPeriod', 'one'),
+    ('Reference', 'identifier', 'Claim_Information', 'valueReference', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_Information', 'reason', 'one'),
+    ('Reference', 'identifier', 'Claim_Insurance', 'claimResponse', 'one'),
+    ('Reference', 'identifier', 'Claim_Insurance', 'coverage', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_Item', 'programCode', 'many'),
+    ('Claim_Detail', 'object_id', 'Claim_Item', 'detail', 'many'),
+    ('Money', 'object_id', 'Claim_Item', 'unitPrice', 'one'),
+    ('Reference', 'identifier', 'Claim_Item', 'encounter', 'many'),
+    ('Money', 'object_id', 'Claim_Item', 'net', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_Item', 'category', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_Item', 'service', 'one'),
+    ('Reference', 'identifier', 'Claim_Item', 'udi', 'many'),
+    ('CodeableConcept', 'object_id', 'Claim_Item', 'locationCodeableConcept', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_Item', 'revenue', 'one'),
+    ('Quantity', 'object_id', 'Claim_Item', 'quantity', 'one'),
+    ('Address', 'object_id', 'Claim_Item', 'locationAddress', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_Item', 'bodySite', 'one'),
+    ('Reference', 'identifier', 'Claim_Item', 'locationReference', 'one'),
+    ('Period', 'object_id', 'Claim_Item', 'servicedPeriod', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_Item', 'modifier', 'many'),
+    ('CodeableConcept', 'object_id', 'Claim_Item', 'subSite', 'many'),
+    ('Reference', 'identifier', 'Claim_Payee', 'party', 'one'),
+    ('Coding', 'object_id', 'Claim_Payee', 'resourceType', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_Payee', 'type', 'one'),
+    ('Reference', 'identifier', 'Claim_Procedure', 'procedureReference', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_Procedure', 'procedureCodeableConcept', 'one'),
+    ('Identifier', 'object_id', 'Claim_Related', 'reference', 'one'),
+    ('Reference', 'identifier', 'Claim_Related', 'claim', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_Related', 'relationship', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_SubDetail', 'programCode', 'many'),
+    ('CodeableConcept', 'object_id', 'Claim_SubDetail', 'modifier', 'many'),
+    ('Quantity', 'object_id', 'Claim_SubDetail', 'quantity', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_SubDetail', 'revenue', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_SubDetail', 'service', 'one'),
+    ('CodeableConcept', 'object_id', 'Claim_SubDetail', 'category', 'one'),
+    ('Money', 'object_id', 'Claim_SubDetail', 'net', 'one'),
+    ('Reference', 'identifier', 'Claim_SubDetail', 'udi', 'many'),
+    ('Money', 'object_id', 'Claim_SubDetail', 'unitPrice', 'one'),
+    ('Reference', 'identifier', 'ClaimResponse', 'requestOrganization', 'one'),
+    ('ClaimResponse_AddItem', 'object_id', 'ClaimResponse', 'addItem', 'many'),
+    ('Identifier', 'object_id', 'ClaimResponse', 'identifier', 'many'),
+    ('Coding', 'object_id', 'ClaimResponse', 'reserved', 'one'),
+    ('CodeableConcept', 'object_id', 'ClaimResponse', 'outcome', 'one'),
+    ('Money', 'object_id', 'ClaimResponse', 'totalCost', 'one'),
+    ('ClaimResponse_Item', 'object_id', 'ClaimResponse', 'item', 'many'),
+    ('Money', 'object_id', 'ClaimResponse', 'unallocDeductable', 'one'),
+    ('Reference', 'identifier', 'ClaimResponse', 'patient', 'one'),
+    ('Reference', 'identifier', 'ClaimResponse', 'insurer', 'one'),
+    ('CodeableConcept', 'object_id', 'ClaimResponse', 'payeeType', 'one'),
+    ('CodeableConcept', 'object_id', 'ClaimResponse', 'form', 'one'),
+    ('Reference', 'identifier', 'ClaimResponse', 'requestProvider', 'one'),
+    ('ClaimResponse_ProcessNote', 'object_id', 'ClaimResponse', 'processNote', 'many'),
+    ('ClaimResponse_Payment', 'identifier', 'ClaimResponse', 'payment', 'one'),
+    ('ClaimResponse_Insurance', 'object_id', 'ClaimResponse', 'insurance', 'many'),
+    ('Reference', 'identifier', 'ClaimResponse', 'request', 'one'),
+    ('ClaimResponse_Error', 'object_id', 'ClaimResponse', 'error', 'many'),
+    ('Money', 'object_id', 'ClaimResponse', 'totalBenefit', 'one'),
+    ('Reference', 'identifier', 'ClaimResponse', 'communicationRequest', 'many'),
+    ('ClaimResponse_Detail1', 'object_id', 'ClaimResponse_AddItem', 'detail', 'many'),
+    ('CodeableConcept', 'object_id', 'ClaimResponse_AddItem', 'modifier', 'many'),
+    ('CodeableConcept', 'object_id', 'ClaimResponse_AddItem', 'service', 'one'),
+    ('Money', 'object_id', 'ClaimResponse_AddItem', 'fee', 'one'),
+    ('CodeableConcept', 'object_id', 'ClaimResponse_AddItem', 'revenue', 'one'),
+    ('ClaimResponse_Adjudication', 'object_id', 'ClaimResponse_AddItem', 'adjudication', 'many'),
+    ('CodeableConcept', 'object_id', 'ClaimResponse_AddItem', 'category', 'one'),
+    ('CodeableConcept', 'object_id', 'ClaimResponse_Adjudication', 'category', 'one'),
+    ('CodeableConcept', 'object_id', 'ClaimResponse_Adjudication', 'reason', 'one'),
+    ('Money', 'object_id', 'ClaimResponse_Adjudication', 'amount', 'one'),
+    ('ClaimResponse_Adjudication', 'object_id', 'ClaimResponse_Detail', 'adjudication', 'many'),
+    ('ClaimResponse_SubDetail', 'object_id', 'ClaimResponse_Detail', 'subDetail', 'many'),
+    ('CodeableConcept', 'object_id', 'ClaimResponse_Detail1', 'category', 'one'),
+    ('ClaimResponse_Adjudication', 'object_id', 'ClaimResponse_Detail1', 'adjudication', 'many'),
+    ('Money', 'object_id', 'ClaimResponse_Detail1', 'fee', 'one'),
+    ('CodeableConcept', 'object_id', 'ClaimResponse_Detail1', 'service', 'one'),
+    ('CodeableConcept', 'object_id', 'ClaimResponse_Detail1', 'revenue', 'one'),
+    ('CodeableConcept', 'object_id', 'ClaimResponse_Detail1', 'modifier', 'many'),
+    ('CodeableConcept', 'object_id', 'ClaimResponse_Error', 'code', 'one'),
+    ('Reference', 'identifier', 'ClaimResponse_Insurance', 'coverage', 'one'),
+    ('Reference', 'identifier', 'ClaimResponse_Insurance', 'claimResponse', 'one'),
+    ('ClaimResponse_Detail', 'object_id', 'ClaimResponse_Item', 'detail', 'many'),
+    ('ClaimResponse_Adjudication', 'object_id', 'ClaimResponse_Item', 'adjudication', 'many'),
+    ('Money', 'object_id', 'ClaimResponse_Payment', 'amount', 'one'),
+    ('CodeableConcept', 'object_id', 'ClaimResponse_Payment', 'adjustmentReason', 'one'),
+    ('CodeableConcept', 'object_id', 'ClaimResponse_Payment', 'type', 'one'),
+    ('Money', 'object_id', 'ClaimResponse_Payment', 'adjustment', 'one'),
+    ('Identifier', 'object_id', 'ClaimResponse_Payment', 'identifier', 'one'),
+    ('CodeableConcept', 'object_id', 'ClaimResponse_ProcessNote', 'type', 'one'),
+    ('CodeableConcept', 'object_id', 'ClaimResponse_ProcessNote', 'language', 'one'),
+    ('ClaimResponse_Adjudication', 'object_id', 'ClaimResponse_SubDetail', 'adjudication', 'many'),
+    ('Period', 'object_id', 'ClinicalImpression', 'effectivePeriod', 'one'),
+    ('ClinicalImpression_Finding', 'object_id', 'ClinicalImpression', 'finding', 'many'),
+    ('Reference', 'identifier', 'ClinicalImpression', 'subject', 'one'),
+    ('Reference', 'identifier', 'ClinicalImpression', 'assessor', 'one'),
+    ('Identifier', 'object_id', 'ClinicalImpression', 'identifier', 'many'),
+    ('Annotation', 'object_id', 'ClinicalImpression', 'note', 'many'),
+    ('Reference', 'identifier', 'ClinicalImpression', 'action', 'many'),
+    ('Reference', 'identifier', 'ClinicalImpression', 'prognosisReference', 'many'),
+    ('ClinicalImpression_Investigation', 'object_id', 'ClinicalImpression',
+     'investigation', 'many'),
+    ('CodeableConcept', 'object_id', 'ClinicalImpression', 'prognosisCodeableConcept', 'many'),
+    ('Reference', 'identifier', 'ClinicalImpression', 'problem', 'many'),
+    ('Reference', 'identifier', 'ClinicalImpression', 'context', 'one'),
+    ('CodeableConcept', 'object_id', 'ClinicalImpression', 'code', 'one'),
+    ('Reference', 'identifier', 'ClinicalImpression', 'previous', 'one'),
+    ('CodeableConcept', 'object_id', 'ClinicalImpression_Finding', 'itemCodeableConcept', 'one'),
+    ('Reference', 'identifier', 'ClinicalImpression_Finding', 'itemReference', 'one'),
+    ('Reference', 'identifier', 'ClinicalImpression_Investigation', 'item', 'many'),
+    ('CodeableConcept', 'object_id', 'ClinicalImpression_Investigation', 'code', 'one'),
+    ('Coding', 'object_id', 'CodeableConcept', 'coding', 'many'),
+    ('CodeSystem_Filter', 'object_id', 'CodeSystem', 'filter', 'many'),
+    ('CodeableConcept', 'object_id', 'CodeSystem', 'jurisdiction', 'many'),
+    ('UsageContext', 'object_id', 'CodeSystem', 'useContext', 'many'),
+    ('CodeSystem_Property', 'object_id', 'CodeSystem', 'property', 'many'),
+    ('CodeSystem_Concept', 'object_id', 'CodeSystem', 'concept', 'many'),
+    ('Identifier', 'object_id', 'CodeSystem', 'identifier', 'one'),
+    ('ContactDetail', 'object_id', 'CodeSystem', 'contact', 'many'),
+    ('CodeSystem_Concept', 'object_id', 'CodeSystem_Concept', 'concept', 'many'),
+    ('CodeSystem_Designation', 'object_id', 'CodeSystem_Concept', 'designation', 'many'),
+    ('CodeSystem_Property1', 'object_id', 'CodeSystem_Concept', 'property', 'many'),
+    ('Coding', 'object_id', 'CodeSystem_Designation', 'use', 'one'),
+    ('Coding', 'object_id', 'CodeSystem_Property1', 'valueCoding', 'one'),
+    ('Reference', 'identifier', 'Communication', 'partOf', 'many'),
+    ('Reference', 'identifier', 'Communication', 'reasonReference', 'many'),
+    ('CodeableConcept', 'object_id', 'Communication', 'medium', 'many'),
+    ('Reference', 'identifier', 'Communication', 'sender', 'one'),
+    ('Reference', 'identifier', 'Communication', 'context', 'one'),
+    ('Communication_Payload', 'object_id', 'Communication', 'payload', 'many'),
+    ('Reference', 'identifier', 'Communication', 'recipient', 'many'),
+    ('CodeableConcept', 'object_id', 'Communication', 'notDoneReason', 'one'),
+    ('Identifier', 'object_id', 'Communication', 'identifier', 'many'),
+    ('Reference', 'identifier', 'Communication', 'subject', 'one'),
+    ('Annotation', 'object_id', 'Communication', 'note', 'many'),
+    ('Reference', 'identifier', 'Communication', 'topic', 'many'),
+    ('CodeableConcept', 'object_id', 'Communication', 'category', 'many'),
+    ('CodeableConcept', 'object_id', 'Communication', 'reasonCode', 'many'),
+    ('Reference', 'identifier', 'Communication', 'definition', 'many'),
+    ('Reference', 'identifier', 'Communication', 'basedOn', 'many'),
+    ('Attachment', 'object_id', 'Communication_Payload', 'contentAttachment', 'one'),
+    ('Reference', 'identifier', 'Communication_Payload', 'contentReference', 'one'),
+    ('CodeableConcept', 'object_id', 'CommunicationRequest', 'medium', 'many'),
+    ('Reference', 'identifier', 'CommunicationRequest', 'basedOn', 'many'),
+    ('Reference', 'identifier', 'CommunicationRequest', 'subject', 'one'),
+    ('CommunicationRequest_Requester', 'object_id', 'CommunicationRequest', 'requester', 'one'),
+    ('Identifier', 'object_id', 'CommunicationRequest', 'identifier', 'many'),
+    ('Period', 'object_id', 'CommunicationRequest', 'occurrencePeriod', 'one'),
+    ('Reference', 'identifier', 'CommunicationRequest', 'topic', 'many'),
+    ('Reference', 'identifier', 'CommunicationRequest', 'context', 'one'),
+    ('CodeableConcept', 'object_id', 'CommunicationRequest', 'category', 'many'),
+    ('Reference', 'identifier', 'CommunicationRequest', 'replaces', 'many'),
+    ('CommunicationRequest_Payload', 'object_id', 'CommunicationRequest', 'payload', 'many'),
+    ('Identifier', 'object_id', 'CommunicationRequest', 'groupIdentifier', 'one'),
+    ('CodeableConcept', 'object_id', 'CommunicationRequest', 'reasonCode', 'many'),
+    ('Reference', 'identifier', 'CommunicationRequest', 'sender', 'one'),
+    ('Annotation', 'object_id', 'CommunicationRequest', 'note', 'many'),
+    ('Reference', 'identifier', 'CommunicationRequest', 'reasonReference', 'many'),
+    ('Reference', 'identifier', 'CommunicationRequest', 'recipient', 'many'),
+    ('Reference', 'identifier', 'CommunicationRequest_Payload', 'contentReference', 'one'),
+    ('Attachment', 'object_id', 'CommunicationRequest_Payload', 'contentAttachment', 'one'),
+    ('Reference', 'identifier', 'CommunicationRequest_Requester', 'agent', 'one'),
+    ('Reference', 'identifier', 'CommunicationRequest_Requester', 'onBehalfOf', 'one'),
+    ('UsageContext', 'object_id', 'CompartmentDefinition', 'useContext', 'many'),
+    ('CodeableConcept', 'object_id', 'CompartmentDefinition', 'jurisdiction', 'many'),
+    ('CompartmentDefinition_Resource', 'object_id', 'CompartmentDefinition', 'resource', 'many'),
+    ('ContactDetail', 'object_id', 'CompartmentDefinition', 'contact', 'many'),
+    ('CodeableConcept', 'object_id', 'Composition', 'type', 'one'),
+    ('Reference', 'identifier', 'Composition', 'author', 'many'),
+    ('CodeableConcept', 'object_id', 'Composition', '_class', 'one'),
+    ('Composition_Event', 'object_id', 'Composition', 'event', 'many'),
+    ('Reference', 'identifier', 'Composition', 'subject', 'one'),
+    ('Reference', 'identifier', 'Composition', 'custodian', 'one'),
+    ('Composition_RelatesTo', 'object_id', 'Composition', 'relatesTo', 'many'),
+    ('Identifier', 'object_id', 'Composition', 'identifier', 'one'),
+    ('Composition_Section', 'object_id', 'Composition', 'section', 'many'),
+    ('Composition_Attester', 'object_id', 'Composition', 'attester', 'many'),
+    ('Reference', 'identifier', 'Composition', 'encounter', 'one'),
+    ('Reference', 'identifier', 'Composition_Attester', 'party', 'one'),
+    ('CodeableConcept', 'object_id', 'Composition_Event', 'code', 'many'),
+    ('Reference', 'identifier', 'Composition_Event', 'detail', 'many'),
+    ('Period', 'object_id', 'Composition_Event', 'period', 'one'),
+    ('Reference', 'identifier', 'Composition_RelatesTo', 'targetReference', 'one'),
+    ('Identifier', 'object_id', 'Composition_RelatesTo', 'targetIdentifier', 'one'),
+    ('Reference', 'identifier', 'Composition_Section', 'entry', 'many'),
+    ('Narrative', 'object_id', 'Composition_Section', 'text', 'one'),
+    ('CodeableConcept', 'object_id', 'Composition_Section', 'orderedBy', 'one'),
+    ('CodeableConcept', 'object_id', 'Composition_Section', 'code', 'one'),
+    ('CodeableConcept', 'object_id', 'Composition_Section', 'emptyReason', 'one'),
+    ('Composition_Section', 'object_id', 'Composition_Section', 'section', 'many'),
+    ('Reference', 'identifier', 'ConceptMap', 'sourceReference', 'one'),
+    ('Reference', 'identifier', 'ConceptMap', 'targetReference', 'one'),
+    ('ContactDetail', 'object_id', 'ConceptMap', 'contact', 'many'),
+    ('ConceptMap_Group', 'object_id', 'ConceptMap', 'group', 'many'),
+    ('Identifier', 'object_id', 'ConceptMap', 'identifier', 'one'),
+    ('UsageContext', 'object_id', 'ConceptMap', 'useContext', 'many'),
+    ('CodeableConcept', 'object_id', 'ConceptMap', 'jurisdiction', 'many'),
+    ('ConceptMap_Target', 'object_id', 'ConceptMap_Element', 'target', 'many'),
+    ('ConceptMap_Unmapped', 'object_id', 'ConceptMap_Group', 'unmapped', 'one'),
+    ('ConceptMap_Element', 'object_id', 'ConceptMap_Group', 'element', 'many'),
+    ('ConceptMap_DependsOn', 'object_id', 'ConceptMap_Target', 'product', 'many'),
+    ('ConceptMap_DependsOn', 'object_id', 'ConceptMap_Target', 'dependsOn', 'many'),
+    ('Range', 'object_id', 'Condition', 'onsetRange', 'one'),
+    ('CodeableConcept', 'object_id', 'Condition', 'category', 'many'),
+    ('Reference', 'identifier', 'Condition', 'subject', 'one'),
+    ('Condition_Evidence', 'object_id', 'Condition', 'evidence', 'many'),
+    ('CodeableConcept', 'object_id', 'Condition', 'code', 'one'),
+    ('Identifier', 'object_id', 'Condition', 'identifier', 'many'),
+    ('Period', 'object_id', 'Condition', 'onsetPeriod', 'one'),
+    ('CodeableConcept', 'object_id', 'Condition', 'bodySite', 'many'),
+    ('Reference', 'identifier', 'Condition', 'asserter', 'one'),
+    ('Condition_Stage', 'object_id', 'Condition', 'stage', 'one'),
+    ('Age', 'object_id', 'Condition', 'onsetAge', 'one'),
+    ('Period', 'object_id', 'Condition', 'abatementPeriod', 'one'),
+    ('Range', 'object_id', 'Condition', 'abatementRange', 'one'),
+    ('Annotation', 'object_id', 'Condition', 'note', 'many'),
+    ('Age', 'object_id', 'Condition', 'abatementAge', 'one'),
+    ('Reference', 'identifier', 'Condition', 'context', 'one'),
+    ('CodeableConcept', 'object_id', 'Condition', 'severity', 'one'),
+    ('CodeableConcept', 'object_id', 'Condition_Evidence', 'code', 'many'),
+    ('Reference', 'identifier', 'Condition_Evidence', 'detail', 'many'),
+    ('Reference', 'identifier', 'Condition_Stage', 'assessment', 'many'),
+    ('CodeableConcept', 'object_id', 'Condition_Stage', 'summary', 'one'),
+    ('CodeableConcept', 'object_id', 'Consent', 'category', 'many'),
+    ('Attachment', 'object_id', 'Consent', 'sourceAttachment', 'one'),
+    ('Consent_Policy', 'object_id', 'Consent', 'policy', 'many'),
+    ('Coding', 'object_id', 'Consent', 'securityLabel', 'many'),
+    ('Reference', 'identifier', 'Consent', 'patient', 'one'),
+    ('Reference', 'identifier', 'Consent', 'sourceReference', 'one'),
+    ('Consent_Data', 'object_id', 'Consent', 'data', 'many'),
+    ('Identifier', 'object_id', 'Consent', 'identifier', 'one'),
+    ('Period', 'object_id', 'Consent', 'period', 'one'),
+    ('Consent_Actor', 'object_id', 'Consent', 'actor', 'many'),
+    ('Reference', 'identifier', 'Consent', 'organization', 'many'),
+    ('Reference', 'identifier', 'Consent', 'consentingParty', 'many'),
+    ('Period', 'object_id', 'Consent', 'dataPeriod', 'one'),
+    ('Identifier', 'object_id', 'Consent', 'sourceIdentifier', 'one'),
+    ('Consent_Except', 'object_id', 'Consent', '_except', 'many'),
+    ('CodeableConcept', 'object_id', 'Consent', 'action', 'many'),
+    ('Coding', 'object_id', 'Consent', 'purpose', 'many'),
+    ('CodeableConcept', 'object_id', 'Consent_Actor', 'role', 'one'),
+    ('Reference', 'identifier', 'Consent_Actor', 'reference', 'one'),
+    ('Reference', 'identifier', 'Consent_Actor1', 'reference', 'one'),
+    ('CodeableConcept', 'object_id', 'Consent_Actor1', 'role', 'one'),
+    ('Reference', 'identifier', 'Consent_Data', 'reference', 'one'),
+    ('Reference', 'identifier', 'Consent_Data1', 'reference', 'one'),
+    ('Coding', 'object_id', 'Consent_Except', 'purpose', 'many'),
+    ('Coding', 'object_id', 'Consent_Except', 'securityLabel', 'many'),
+    ('Period', 'object_id', 'Consent_Except', 'dataPeriod', 'one'),
+    ('Period', 'object_id', 'Consent_Except', 'period', 'one'),
+    ('Consent_Data1', 'object_id', 'Consent_Except', 'data', 'many'),
+    ('Consent_Actor1', 'object_id', 'Consent_Except', 'actor', 'many'),
+    ('CodeableConcept', 'object_id', 'Consent_Except', 'action', 'many'),
+    ('Coding', 'object_id', 'Consent_Except', 'code', 'many'),
+    ('Coding', 'object_id', 'Consent_Except', '_class', 'many'),
+    ('ContactPoint', 'object_id', 'ContactDetail', 'telecom', 'many'),
+    ('Period', 'object_id', 'ContactPoint', 'period', 'one'),
+    ('Contract_Term', 'identifier', 'Contract', 'term', 'many'),
+    ('Contract_Friendly', 'object_id', 'Contract', 'friendly', 'many'),
+    ('CodeableConcept', 'object_id', 'Contract', 'actionReason', 'many'),
+    ('Contract_Rule', 'object_id', 'Contract', 'rule', 'many'),
+    ('CodeableConcept', 'object_id', 'Contract', 'decisionType', 'one'),
+    ('CodeableConcept', 'object_id', 'Contract', 'type', 'one'),
+    ('CodeableConcept', 'object_id', 'Contract', 'action', 'many'),
+    ('Contract_Agent', 'object_id', 'Contract', 'agent', 'many'),
+    ('Reference', 'identifier', 'Contract', 'authority', 'many'),
+    ('Reference', 'identifier', 'Contract', 'topic', 'many'),
+    ('Contract_ValuedItem', 'identifier', 'Contract', 'valuedItem', 'many'),
+    ('Identifier', 'object_id', 'Contract', 'identifier', 'one'),
+    ('CodeableConcept', 'object_id', 'Contract', 'contentDerivative', 'one'),
+    ('Contract_Signer', 'object_id', 'Contract', 'signer', 'many'),
+    ('Reference', 'identifier', 'Contract', 'subject', 'many'),
+    ('Reference', 'identifier', 'Contract', 'bindingReference', 'one'),
+    ('Period', 'object_id', 'Contract', 'applies', 'one'),
+    ('CodeableConcept', 'object_id', 'Contract', 'subType', 'many'),
+    ('Coding', 'object_id', 'Contract', 'securityLabel', 'many'),
+    ('Contract_Legal', 'object_id', 'Contract', 'legal', 'many'),
+    ('Reference', 'identifier', 'Contract', 'domain', 'many'),
+    ('Attachment', 'object_id', 'Contract', 'bindingAttachment', 'one'),
+    ('Reference', 'identifier', 'Contract_Agent', 'actor', 'one'),
+    ('CodeableConcept', 'object_id', 'Contract_Agent', 'role', 'many'),
+    ('Reference', 'identifier', 'Contract_Agent1', 'actor', 'one'),
+    ('CodeableConcept', 'object_id', 'Contract_Agent1', 'role', 'many'),
+    ('Attachment', 'object_id', 'Contract_Friendly', 'contentAttachment', 'one'),
+    ('Reference', 'identifier', 'Contract_Friendly', 'contentReference', 'one'),
+    ('Attachment', 'object_id', 'Contract_Legal', 'contentAttachment', 'one'),
+    ('Reference', 'identifier', 'Contract_Legal', 'contentReference', 'one'),
+    ('Attachment', 'object_id', 'Contract_Rule', 'contentAttachment', 'one'),
+    ('Reference', 'identifier', 'Contract_Rule', 'contentReference', 'one'),
+    ('Coding', 'object_id', 'Contract_Signer', 'type', 'one'),
+    ('Reference', 'identifier', 'Contract_Signer', 'party', 'one'),
+    ('Signature', 'object_id', 'Contract_Signer', 'signature', 'many'),
+    ('Contract_Agent1', 'object_id', 'Contract_Term', 'agent', 'many'),
+    ('CodeableConcept', 'object_id', 'Contract_Term', 'actionReason', 'many'),
+    ('Contract_Term', 'identifier', 'Contract_Term', 'group', 'many'),
+    ('CodeableConcept', 'object_id', 'Contract_Term', 'type', 'one'),
+    ('Contract_ValuedItem1', 'identifier', 'Contract_Term', 'valuedItem', 'many'),
+    ('Period', 'object_id', 'Contract_Term', 'applies', 'one'),
+    ('Coding', 'object_id', 'Contract_Term', 'securityLabel', 'many'),
+    ('Identifier', 'object_id', 'Contract_Term', 'identifier', 'one'),
+    ('CodeableConcept', 'object_id', 'Contract_Term', 'subType', 'one'),
+    ('CodeableConcept', 'object_id', 'Contract_Term', 'action', 'many'),
+    ('Reference', 'identifier', 'Contract_Term', 'topic', 'many'),
+    ('Identifier', 'object_id', 'Contract_ValuedItem', 'identifier', 'one'),
+    ('Money', 'object_id', 'Contract_ValuedItem', 'net', 'one'),
+    ('Reference', 'identifier', 'Contract_ValuedItem', 'entityReference', 'one'),
+    ('Money', 'object_id', 'Contract_ValuedItem', 'unitPrice', 'one'),
+    ('Quantity', 'object_id', 'Contract_ValuedItem', 'quantity', 'one'),
+    ('CodeableConcept', 'object_id', 'Contract_ValuedItem', 'entityCodeableConcept', 'one'),
+    ('Quantity', 'object_id', 'Contract_ValuedItem1', 'quantity', 'one'),
+    ('CodeableConcept', 'object_id', 'Contract_ValuedItem1', 'entityCodeableConcept', 'one'),
+    ('Money', 'object_id', 'Contract_ValuedItem1', 'net', 'one'),
+    ('Identifier', 'object_id', 'Contract_ValuedItem1', 'identifier', 'one'),
+    ('Reference', 'identifier', 'Contract_ValuedItem1', 'entityReference', 'one'),
+    ('Money', 'object_id', 'Contract_ValuedItem1', 'unitPrice', 'one'),
+    ('ContactDetail', 'object_id', 'Contributor', 'contact', 'many'),
+    ('Reference', 'identifier', 'Coverage', 'beneficiary', 'one'),
+    ('Reference', 'identifier', 'Coverage', 'subscriber', 'one'),
+    ('Reference', 'identifier', 'Coverage', 'policyHolder', 'one'),
+    ('CodeableConcept', 'object_id', 'Coverage', 'relationship', 'one'),
+    ('Identifier', 'object_id', 'Coverage', 'identifier', 'many'),
+    ('Period', 'object_id', 'Coverage', 'period', 'one'),
+    ('Reference', 'identifier', 'Coverage', 'contract', 'many'),
+    ('CodeableConcept', 'object_id', 'Coverage', 'type', 'one'),
+    ('Reference', 'identifier', 'Coverage', 'payor', 'many'),
+    ('Coverage_Grouping', 'object_id', 'Coverage', 'grouping', 'one'),
+    ('Identifier', 'object_id', 'DataElement', 'identifier', 'many'),
+    ('ContactDetail', 'object_id', 'DataElement', 'contact', 'many'),
+    ('CodeableConcept', 'object_id', 'DataElement', 'jurisdiction', 'many'),
+    ('ElementDefinition', 'object_id', 'DataElement', 'element', 'many'),
+    ('UsageContext', 'object_id', 'DataElement', 'useContext', 'many'),
+    ('DataElement_Mapping', 'object_id', 'DataElement', 'mapping', 'many'),
+    ('DataRequirement_DateFilter', 'object_id', 'DataRequirement', 'dateFilter', 'many'),
+    ('DataRequirement_CodeFilter', 'object_id', 'DataRequirement', 'codeFilter', 'many'),
+    ('Reference', 'identifier', 'DataRequirement_CodeFilter', 'valueSetReference', 'one'),
+    ('CodeableConcept', 'object_id', 'DataRequirement_CodeFilter', 'valueCodeableConcept', 'many'),
+    ('Coding', 'object_id', 'DataRequirement_CodeFilter', 'valueCoding', 'many'),
+    ('Period', 'object_id', 'DataRequirement_DateFilter', 'valuePeriod', 'one'),
+    ('Duration', 'object_id', 'DataRequirement_DateFilter', 'valueDuration', 'one'),
+    ('Reference', 'identifier', 'DetectedIssue', 'author', 'one'),
+    ('DetectedIssue_Mitigation', 'object_id', 'DetectedIssue', 'mitigation', 'many'),
+    ('CodeableConcept', 'object_id', 'DetectedIssue', 'category', 'one'),
+    ('Reference', 'identifier', 'DetectedIssue', 'patient', 'one'),
+    ('Identifier', 'object_id', 'DetectedIssue', 'identifier', 'one'),
+    ('Reference', 'identifier', 'DetectedIssue', 'implicated', 'many'),
+    ('CodeableConcept', 'object_id', 'DetectedIssue_Mitigation', 'action', 'one'),
+    ('Reference', 'identifier', 'DetectedIssue_Mitigation', 'author', 'one'),
+    ('Device_Udi', 'object_id', 'Device', 'udi', 'one'),
+    ('CodeableConcept', 'object_id', 'Device', 'type', 'one'),
+    ('CodeableConcept', 'object_id', 'Device', 'safety', 'many'),
+    ('Reference', 'identifier', 'Device', 'owner', 'one'),
+    ('Reference', 'identifier', 'Device', 'location', 'one'),
+    ('Reference', 'identifier', 'Device', 'patient', 'one'),
+    ('Annotation', 'object_id', 'Device', 'note', 'many'),
+    ('ContactPoint', 'object_id', 'Device', 'contact', 'many'),
+    ('Identifier', 'object_id', 'Device', 'identifier', 'many'),
+    ('CodeableConcept', 'object_id', 'DeviceComponent', 'languageCode', 'one'),
+    ('Reference', 'identifier', 'DeviceComponent', 'source', 'one'),
+    ('Identifier', 'object_id', 'DeviceComponent', 'identifier', 'one'),
+    ('CodeableConcept', 'object_id', 'DeviceComponent', 'operationalStatus', 'many'),
+    ('DeviceComponent_ProductionSpecification', 'object_id', 'DeviceComponent',
+     'productionSpecification', 'many'),
+    ('CodeableConcept', 'object_id', 'DeviceComponent', 'parameterGroup', 'one'),
+    ('Reference', 'identifier', 'DeviceComponent', 'parent', 'one'),
+    ('CodeableConcept', 'object_id', 'DeviceComponent', 'type', 'one'),
+    ('CodeableConcept', 'object_id', 'DeviceComponent_ProductionSpecification', 'specType', 'one'),
+    ('Identifier', 'object_id', 'DeviceComponent_ProductionSpecification', 'componentId', 'one'),
+    ('DeviceMetric_Calibration', 'object_id', 'DeviceMetric', 'calibration', 'many'),
+    ('CodeableConcept', 'object_id', 'DeviceMetric', 'unit', 'one'),
+    ('Identifier', 'object_id', 'DeviceMetric', 'identifier', 'one'),
+    ('Reference', 'identifier', 'DeviceMetric', 'parent', 'one'),
+    ('Timing', 'object_id', 'DeviceMetric', 'measurementPeriod', 'one'),
+    ('CodeableConcept', 'object_id', 'DeviceMetric', 'type', 'one'),
+    ('Reference', 'identifier', 'DeviceMetric', 'source', 'one'),
+    ('Reference', 'identifier', 'DeviceRequest', 'subject', 'one'),
+    ('CodeableConcept', 'object_id', 'DeviceRequest', 'performerType', 'one'),
+    ('Annotation', 'object_id', 'DeviceRequest', 'note', 'many'),
+    ('Reference', 'identifier', 'DeviceRequest', 'definition', 'many'),
+    ('CodeableConcept', 'object_id', 'DeviceRequest', 'codeCodeableConcept', 'one'),
+    ('Identifier', 'object_id', 'DeviceRequest', 'groupIdentifier', 'one'),
+    ('CodeableConcept', 'object_id', 'DeviceRequest', 'intent', 'one'),
+    ('Reference', 'identifier', 'DeviceRequest', 'reasonReference', 'many'),
+    ('Reference', 'identifier', 'DeviceRequest', 'priorRequest', 'many'),
+    ('Timing', 'object_id', 'DeviceRequest', 'occurrenceTiming', 'one'),
+    ('Reference', 'identifier', 'DeviceRequest', 'context', 'one'),
+    ('Identifier', 'object_id', 'DeviceRequest', 'identifier', 'many'),
+    ('Reference', 'identifier', 'DeviceRequest', 'basedOn', 'many'),
+    ('Period', 'object_id', 'DeviceRequest', 'occurrencePeriod', 'one'),
+    ('Reference', 'identifier', 'DeviceRequest', 'relevantHistory', 'many'),
+    ('CodeableConcept', 'object_id', 'DeviceRequest', 'reasonCode', 'many'),
+    ('DeviceRequest_Requester', 'object_id', 'DeviceRequest', 'requester', 'one'),
+    ('Reference', 'identifier', 'DeviceRequest', 'codeReference', 'one'),
+    ('Reference', 'identifier', 'DeviceRequest', 'supportingInfo', 'many'),
+    ('Reference', 'identifier', 'DeviceRequest', 'performer', 'one'),
+    ('Reference', 'identifier', 'DeviceRequest_Requester', 'onBehalfOf', 'one'),
+    ('Reference', 'identifier', 'DeviceRequest_Requester', 'agent', 'one'),
+    ('Reference', 'identifier', 'DeviceUseStatement', 'subject', 'one'),
+    ('Period', 'object_id', 'DeviceUseStatement', 'timingPeriod', 'one'),
+    ('Reference', 'identifier', 'DeviceUseStatement', 'source', 'one'),
+    ('CodeableConcept', 'object_id', 'DeviceUseStatement', 'indication', 'many'),
+    ('Annotation', 'object_id', 'DeviceUseStatement', 'note', 'many'),
+    ('Period', 'object_id', 'DeviceUseStatement', 'whenUsed', 'one'),
+    ('Reference', 'identifier', 'DeviceUseStatement', 'device', 'one'),
+    ('CodeableConcept', 'object_id', 'DeviceUseStatement', 'bodySite', 'one'),
+    ('Timing', 'object_id', 'DeviceUseStatement', 'timingTiming', 'one'),
+    ('Identifier', 'object_id', 'DeviceUseStatement', 'identifier', 'many'),
+    ('Reference', 'identifier', 'DiagnosticReport', 'imagingStudy', 'many'),
+    ('Reference', 'identifier', 'DiagnosticReport', 'basedOn', 'many'),
+    ('CodeableConcept', 'object_id', 'DiagnosticReport', 'code', 'one'),
+    ('Reference', 'identifier', 'DiagnosticReport', 'subject', 'one'),
+    ('CodeableConcept', 'object_id', 'DiagnosticReport', 'codedDiagnosis', 'many'),
+    ('Reference', 'identifier', 'DiagnosticReport', 'context', 'one'),
+    ('Reference', 'identifier', 'DiagnosticReport', 'result', 'many'),
+    ('DiagnosticReport_Performer', 'object_id', 'DiagnosticReport', 'performer', 'many'),
+    ('Attachment', 'object_id', 'DiagnosticReport', 'presentedForm', 'many'),
+    ('Identifier', 'object_id', 'DiagnosticReport', 'identifier', 'many'),
+    ('DiagnosticReport_Image', 'object_id', 'DiagnosticReport', 'image', 'many'),
+    ('Period', 'object_id', 'DiagnosticReport', 'effectivePeriod', 'one'),
+    ('CodeableConcept', 'object_id', 'DiagnosticReport', 'category', 'one'),
+    ('Reference', 'identifier', 'DiagnosticReport', 'specimen', 'many'),
+    ('Reference', 'identifier', 'DiagnosticReport_Image', 'link', 'one'),
+    ('Reference', 'identifier', 'DiagnosticReport_Performer', 'actor', 'one'),
+    ('CodeableConcept', 'object_id', 'DiagnosticReport_Performer', 'role', 'one'),
+    ('Identifier', 'object_id', 'DocumentManifest', 'masterIdentifier', 'one'),
+    ('DocumentManifest_Related', 'identifier', 'DocumentManifest', 'related', 'many'),
+    ('Identifier', 'object_id', 'DocumentManifest', 'identifier', 'many'),
+    ('Reference', 'identifier', 'DocumentManifest', 'recipient', 'many'),
+    ('CodeableConcept', 'object_id', 'DocumentManifest', 'type', 'one'),
+    ('Reference', 'identifier', 'DocumentManifest', 'subject', 'one'),
+    ('Reference', 'identifier', 'DocumentManifest', 'author', 'many'),
+    ('DocumentManifest_Content', 'object_id', 'DocumentManifest', 'content', 'many'),
+    ('Attachment', 'object_id', 'DocumentManifest_Content', 'pAttachment', 'one'),
+    ('Reference', 'identifier', 'DocumentManifest_Content', 'pReference', 'one'),
+    ('Reference', 'identifier', 'DocumentManifest_Related', 'ref', 'one'),
+    ('Identifier', 'object_id', 'DocumentManifest_Related', 'identifier', 'one'),
+    ('Reference', 'identifier', 'DocumentReference', 'custodian', 'one'),
+    ('Identifier', 'object_id', 'DocumentReference', 'identifier', 'many'),
+    ('DocumentReference_RelatesTo', 'object_id', 'DocumentReference', 'relatesTo', 'many'),
+    ('Reference', 'identifier', 'DocumentReference', 'author', 'many'),
+    ('Reference', 'identifier', 'DocumentReference', 'subject', 'one'),
+    ('CodeableConcept', 'object_id', 'DocumentReference', '_class', 'one'),
+    ('DocumentReference_Content', 'object_id', 'DocumentReference', 'content', 'many'),
+    ('Reference', 'identifier', 'DocumentReference', 'authenticator', 'one'),
+    ('CodeableConcept', 'object_id', 'DocumentReference', 'type', 'one'),
+    ('CodeableConcept', 'object_id', 'DocumentReference', 'securityLabel', 'many'),
+    ('Identifier', 'object_id', 'DocumentReference', 'masterIdentifier', 'one'),
+    ('DocumentReference_Context', 'object_id', 'DocumentReference', 'context', 'one'),
+    ('Coding', 'object_id', 'DocumentReference_Content', 'format', 'one'),
+    ('Attachment', 'object_id', 'DocumentReference_Content', 'attachment', 'one'),
+    ('Reference', 'identifier', 'DocumentReference_Context', 'encounter', 'one'),
+    ('CodeableConcept', 'object_id', 'DocumentReference_Context', 'facilityType', 'one'),
+    ('Period', 'object_id', 'DocumentReference_Context', 'period', 'one'),
+    ('CodeableConcept', 'object_id', 'DocumentReference_Context', 'event', 'many'),
+    ('Reference', 'identifier', 'DocumentReference_Context', 'sourcePatientInfo', 'one'),
+    ('CodeableConcept', 'object_id', 'DocumentReference_Context', 'practiceSetting', 'one'),
+    ('DocumentReference_Related', 'identifier', 'DocumentReference_Context', 'related', 'many'),
+    ('Reference', 'identifier', 'DocumentReference_Related', 'ref', 'one'),
+    ('Identifier', 'object_id', 'DocumentReference_Related', 'identifier', 'one'),
+    ('Reference', 'identifier', 'DocumentReference_RelatesTo', 'target', 'one'),
+    ('Extension', 'object_id', 'DomainResource', 'extension', 'many'),
+    ('ResourceList', 'object_id', 'DomainResource', 'contained', 'many'),
+    ('Narrative', 'object_id', 'DomainResource', 'text', 'one'),
+    ('Extension', 'object_id', 'DomainResource', 'modifierExtension', 'many'),
+    ('Range', 'object_id', 'Dosage', 'doseRange', 'one'),
+    ('CodeableConcept', 'object_id', 'Dosage', 'asNeededCodeableConcept', 'one'),
+    ('Ratio', 'object_id', 'Dosage', 'maxDosePerPeriod', 'one'),
+    ('CodeableConcept', 'object_id', 'Dosage', 'site', 'one'),
+    ('Quantity', 'object_id', 'Dosage', 'rateSimpleQuantity', 'one'),
+    ('Ratio', 'object_id', 'Dosage', 'rateRatio', 'one'),
+    ('Timing', 'object_id', 'Dosage', 'timing', 'one'),
+    ('Range', 'object_id', 'Dosage', 'rateRange', 'one'),
+    ('Quantity', 'object_id', 'Dosage', 'doseSimpleQuantity', 'one'),
+    ('Quantity', 'object_id', 'Dosage', 'maxDosePerLifetime', 'one'),
+    ('CodeableConcept', 'object_id', 'Dosage', 'method', 'one'),
+    ('Quantity', 'object_id', 'Dosage', 'maxDosePerAdministration', 'one'),
+    ('CodeableConcept', 'object_id', 'Dosage', 'route', 'one'),
+    ('CodeableConcept', 'object_id', 'Dosage', 'additionalInstruction', 'many'),
+    ('Extension', 'object_id', 'Element', 'extension', 'many'),
+    ('Money', 'object_id', 'ElementDefinition', 'fixedMoney', 'one'),
+    ('ElementDefinition', 'object_id', 'ElementDefinition',
+     'defaultValueElementDefinition', 'one'),
+    ('Reference', 'identifier', 'ElementDefinition', 'fixedReference', 'one'),
+    ('Narrative', 'object_id', 'ElementDefinition', 'patternNarrative', 'one'),
+    ('Duration', 'object_id', 'ElementDefinition', 'defaultValueDuration', 'one'),
+    ('Timing', 'object_id', 'ElementDefinition', 'defaultValueTiming', 'one'),
+    ('RelatedArtifact', 'object_id', 'ElementDefinition', 'fixedRelatedArtifact', 'one'),
+    ('TriggerDefinition', 'object_id', 'ElementDefinition',
+     'defaultValueTriggerDefinition', 'one'),
+    ('Age', 'object_id', 'ElementDefinition', 'fixedAge', 'one'),
+    ('Attachment', 'object_id', 'ElementDefinition', 'defaultValueAttachment', 'one'),
+    ('Extension', 'object_id', 'ElementDefinition', 'patternExtension', 'one'),
+    ('ElementDefinition_Type', 'object_id', 'ElementDefinition', 'type', 'many'),
+    ('Quantity', 'object_id', 'ElementDefinition', 'fixedSimpleQuantity', 'one'),
+    ('Narrative', 'object_id', 'ElementDefinition', 'defaultValueNarrative', 'one'),
+    ('Element', 'id', 'ElementDefinition', 'defaultValueElement', 'one'),
+    ('Count', 'object_id', 'ElementDefinition', 'defaultValueCount', 'one'),
+    ('Period', 'object_id', 'ElementDefinition', 'patternPeriod', 'one'),
+    ('Identifier', 'object_id', 'ElementDefinition', 'patternIdentifier', 'one'),
+    ('UsageContext', 'object_id', 'ElementDefinition', 'defaultValueUsageContext', 'one'),
+    ('Ratio', 'object_id', 'ElementDefinition', 'patternRatio', 'one'),
+    ('Attachment', 'object_id', 'ElementDefinition', 'patternAttachment', 'one'),
+    ('Annotation', 'object_id', 'ElementDefinition', 'fixedAnnotation', 'one'),
+    ('ElementDefinition_Constraint', 'object_id', 'ElementDefinition', 'constraint', 'many'),
+    ('CodeableConcept', 'object_id', 'ElementDefinition', 'defaultValueCodeableConcept', 'one'),
+    ('Count', 'object_id', 'ElementDefinition', 'fixedCount', 'one'),
+    ('CodeableConcept', 'object_id', 'ElementDefinition', 'patternCodeableConcept', 'one'),
+    ('HumanName', 'object_id', 'ElementDefinition', 'patternHumanName', 'one'),
+    ('DataRequirement', 'object_id', 'ElementDefinition', 'defaultValueDataRequirement', 'one'),
+    ('ElementDefinition_Slicing', 'object_id', 'ElementDefinition', 'slicing', 'one'),
+    ('Count', 'object_id', 'ElementDefinition', 'patternCount', 'one'),
+    ('HumanName', 'object_id', 'ElementDefinition', 'defaultValueHumanName', 'one'),
+    ('Quantity', 'object_id', 'ElementDefinition', 'defaultValueSimpleQuantity', 'one'),
+    ('Age', 'object_id', 'ElementDefinition', 'patternAge', 'one'),
+    ('Dosage', 'object_id', 'ElementDefinition', 'patternDosage', 'one'),
+    ('UsageContext', 'object_id', 'ElementDefinition', 'fixedUsageContext', 'one'),
+    ('Contributor', 'object_id', 'ElementDefinition', 'patternContributor', 'one'),
+    ('ContactDetail', 'object_id', 'ElementDefinition', 'defaultValueContactDetail', 'one'),
+    ('RelatedArtifact', 'object_id', 'ElementDefinition', 'patternRelatedArtifact', 'one'),
+    ('Coding', 'object_id', 'ElementDefinition', 'defaultValueCoding', 'one'),
+    ('Quantity', 'object_id', 'ElementDefinition', 'defaultValueQuantity', 'one'),
+    ('Identifier', 'object_id', 'ElementDefinition', 'fixedIdentifier', 'one'),
+    ('ElementDefinition', 'object_id', 'ElementDefinition', 'patternElementDefinition', 'one'),
+    ('CodeableConcept', 'object_id', 'ElementDefinition', 'fixedCodeableConcept', 'one'),
+    ('DataRequirement', 'object_id', 'ElementDefinition', 'fixedDataRequirement', 'one'),
+    ('Quantity', 'object_id', 'ElementDefinition', 'fixedQuantity', 'one'),
+    ('Timing', 'object_id', 'ElementDefinition', 'patternTiming', 'one'),
+    ('ElementDefinition', 'object_id', 'ElementDefinition', 'fixedElementDefinition', 'one'),
+    ('Dosage', 'object_id', 'ElementDefinition', 'fixedDosage', 'one'),
+    ('Range', 'object_id', 'ElementDefinition', 'defaultValueRange', 'one'),
+    ('Duration', 'object_id', 'ElementDefinition', 'patternDuration', 'one'),
+    ('ElementDefinition_Binding', 'object_id', 'ElementDefinition', 'binding', 'one'),
+    ('ContactDetail', 'object_id', 'ElementDefinition', 'patternContactDetail', 'one'),
+    ('DataRequirement', 'object_id', 'ElementDefinition', 'patternDataRequirement', 'one'),
+    ('Distance', 'object_id', 'ElementDefinition', 'patternDistance', 'one'),
+    ('Extension', 'object_id', 'ElementDefinition', 'defaultValueExtension', 'one'),
+    ('Meta', 'object_id', 'ElementDefinition', 'defaultValueMeta', 'one'),
+    ('Period', 'object_id', 'ElementDefinition', 'fixedPeriod', 'one'),
+    ('BackboneElement', 'object_id', 'ElementDefinition', 'patternBackboneElement', 'one'),
+    ('ElementDefinition_Base', 'object_id', 'ElementDefinition', 'base', 'one'),
+    ('Range', 'object_id', 'ElementDefinition', 'patternRange', 'one'),
+    ('Element', 'id', 'ElementDefinition', 'patternElement', 'one'),
+    ('Contributor', 'object_id', 'ElementDefinition', 'fixedContributor', 'one'),
+    ('Address', 'object_id', 'ElementDefinition', 'patternAddress', 'one'),
+    ('SampledData', 'object_id', 'ElementDefinition', 'defaultValueSampledData', 'one'),
+    ('Element', 'id', 'ElementDefinition', 'fixedElement', 'one'),
+    ('ParameterDefinition', 'object_id', 'ElementDefinition', 'patternParameterDefinition', 'one'),
+    ('Annotation', 'object_id', 'ElementDefinition', 'patternAnnotation', 'one'),
+    ('Range', 'object_id', 'ElementDefinition', 'fixedRange', 'one'),
+    ('TriggerDefinition', 'object_id', 'ElementDefinition', 'patternTriggerDefinition', 'one'),
+    ('Money', 'object_id', 'ElementDefinition', 'patternMoney', 'one'),
+    ('Coding', 'object_id', 'ElementDefinition', 'code', 'many'),
+    ('Extension', 'object_id', 'ElementDefinition', 'fixedExtension', 'one'),
+    ('Reference', 'identifier', 'ElementDefinition', 'patternReference', 'one'),
+    ('BackboneElement', 'object_id', 'ElementDefinition', 'fixedBackboneElement', 'one'),
+    ('Dosage', 'object_id', 'ElementDefinition', 'defaultValueDosage', 'one'),
+    ('Reference', 'identifier', 'ElementDefinition', 'defaultValueReference', 'one'),
+    ('RelatedArtifact', 'object_id', 'ElementDefinition', 'defaultValueRelatedArtifact', 'one'),
+    ('Meta', 'object_id', 'ElementDefinition', 'fixedMeta', 'one'),
+    ('SampledData', 'object_id', 'ElementDefinition', 'fixedSampledData', 'one'),
+    ('ContactPoint', 'object_id', 'ElementDefinition', 'patternContactPoint', 'one'),
+    ('Meta', 'object_id', 'ElementDefinition', 'patternMeta', 'one'),
+    ('UsageContext', 'object_id', 'ElementDefinition', 'patternUsageContext', 'one'),
+    ('Signature', 'object_id', 'ElementDefinition', 'fixedSignature', 'one'),
+    ('Coding', 'object_id', 'ElementDefinition', 'patternCoding', 'one'),
+    ('Money', 'object_id', 'ElementDefinition', 'defaultValueMoney', 'one'),
+    ('Duration', 'object_id', 'ElementDefinition', 'fixedDuration', 'one'),
+    ('Narrative', 'object_id', 'ElementDefinition', 'fixedNarrative', 'one'),
+    ('Distance', 'object_id', 'ElementDefinition', 'fixedDistance', 'one'),
+    ('Address', 'object_id', 'ElementDefinition', 'defaultValueAddress', 'one'),
+    ('ContactPoint', 'object_id', 'ElementDefinition', 'defaultValueContactPoint', 'one'),
+    ('Quantity', 'object_id', 'ElementDefinition', 'minValueQuantity', 'one'),
+    ('ContactPoint', 'object_id', 'ElementDefinition', 'fixedContactPoint', 'one'),
+    ('Signature', 'object_id', 'ElementDefinition', 'patternSignature', 'one'),
+    ('Ratio', 'object_id', 'ElementDefinition', 'defaultValueRatio', 'one'),
+    ('ParameterDefinition', 'object_id', 'ElementDefinition', 'fixedParameterDefinition', 'one'),
+    ('Age', 'object_id', 'ElementDefinition', 'defaultValueAge', 'one'),
+    ('Timing', 'object_id', 'ElementDefinition', 'fixedTiming', 'one'),
+    ('Contributor', 'object_id', 'ElementDefinition', 'defaultValueContributor', 'one'),
+    ('Coding', 'object_id', 'ElementDefinition', 'fixedCoding', 'one'),
+    ('Ratio', 'object_id', 'ElementDefinition', 'fixedRatio', 'one'),
+    ('Quantity', 'object_id', 'ElementDefinition', 'maxValueQuantity', 'one'),
+    ('Address', 'object_id', 'ElementDefinition', 'fixedAddress', 'one'),
+    ('ElementDefinition_Example', 'object_id', 'ElementDefinition', 'example', 'many'),
+    ('Period', 'object_id', 'ElementDefinition', 'defaultValuePeriod', 'one'),
+    ('Attachment', 'object_id', 'ElementDefinition', 'fixedAttachment', 'one'),
+    ('BackboneElement', 'object_id', 'ElementDefinition', 'defaultValueBackboneElement', 'one'),
+    ('HumanName', 'object_id', 'ElementDefinition', 'fixedHumanName', 'one'),
+    ('Annotation', 'object_id', 'ElementDefinition', 'defaultValueAnnotation', 'one'),
+    ('Identifier', 'object_id', 'ElementDefinition', 'defaultValueIdentifier', 'one'),
+    ('Quantity', 'object_id', 'ElementDefinition', 'patternSimpleQuantity', 'one'),
+    ('Quantity', 'object_id', 'ElementDefinition', 'patternQuantity', 'one'),
+    ('Signature', 'object_id', 'ElementDefinition', 'defaultValueSignature', 'one'),
+    ('SampledData', 'object_id', 'ElementDefinition', 'patternSampledData', 'one'),
+    ('Distance', 'object_id', 'ElementDefinition', 'defaultValueDistance', 'one'),
+    ('ParameterDefinition', 'object_id', 'ElementDefinition',
+     'defaultValueParameterDefinition', 'one'),
+    ('ContactDetail', 'object_id', 'ElementDefinition', 'fixedContactDetail', 'one'),
+    ('TriggerDefinition', 'object_id', 'ElementDefinition', 'fixedTriggerDefinition', 'one'),
+    ('ElementDefinition_Mapping', 'object_id', 'ElementDefinition', 'mapping', 'many'),
+    ('Reference', 'identifier', 'ElementDefinition_Binding', 'valueSetReference', 'one'),
+    ('Address', 'object_id', 'ElementDefinition_Example', 'valueAddress', 'one'),
+    ('CodeableConcept', 'object_id', 'ElementDefinition_Example', 'valueCodeableConcept', 'one'),
+    ('ParameterDefinition', 'object_id', 'ElementDefinition_Example',
+     'valueParameterDefinition', 'one'),
+    ('Identifier', 'object_id', 'ElementDefinition_Example', 'valueIdentifier', 'one'),
+    ('Distance', 'object_id', 'ElementDefinition_Example', 'valueDistance', 'one'),
+    ('Period', 'object_id', 'ElementDefinition_Example', 'valuePeriod', 'one'),
+    ('Duration', 'object_id', 'ElementDefinition_Example', 'valueDuration', 'one'),
+    ('Signature', 'object_id', 'ElementDefinition_Example', 'valueSignature', 'one'),
+    ('BackboneElement', 'object_id', 'ElementDefinition_Example', 'valueBackboneElement', 'one'),
+    ('Range', 'object_id', 'ElementDefinition_Example', 'valueRange', 'one'),
+    ('Dosage', 'object_id', 'ElementDefinition_Example', 'valueDosage', 'one'),
+    ('Quantity', 'object_id', 'ElementDefinition_Example', 'valueQuantity', 'one'),
+    ('Money', 'object_id', 'ElementDefinition_Example', 'valueMoney', 'one'),
+    ('Quantity', 'object_id', 'ElementDefinition_Example', 'valueSimpleQuantity', 'one'),
+    ('DataRequirement', 'object_id', 'ElementDefinition_Example', 'valueDataRequirement', 'one'),
+    ('HumanName', 'object_id', 'ElementDefinition_Example', 'valueHumanName', 'one'),
+    ('UsageContext', 'object_id', 'ElementDefinition_Example', 'valueUsageContext', 'one'),
+    ('Contributor', 'object_id', 'ElementDefinition_Example', 'valueContributor', 'one'),
+    ('Annotation', 'object_id', 'ElementDefinition_Example', 'valueAnnotation', 'one'),
+    ('SampledData', 'object_id', 'ElementDefinition_Example', 'valueSampledData', 'one'),
+    ('ContactPoint', 'object_id', 'ElementDefinition_Example', 'valueContactPoint', 'one'),
+    ('Narrative', 'object_id', 'ElementDefinition_Example', 'valueNarrative', 'one'),
+    ('Meta', 'object_id', 'ElementDefinition_Example', 'valueMeta', 'one'),
+    ('RelatedArtifact', 'object_id', 'ElementDefinition_Example', 'valueRelatedArtifact', 'one'),
+    ('TriggerDefinition', 'object_id', 'ElementDefinition_Example',
+     'valueTriggerDefinition', 'one'),
+    ('Age', 'object_id', 'ElementDefinition_Example', 'valueAge', 'one'),
+    ('Count', 'object_id', 'ElementDefinition_Example', 'valueCount', 'one'),
+    ('ContactDetail', 'object_id', 'ElementDefinition_Example', 'valueContactDetail', 'one'),
+    ('Reference', 'identifier', 'ElementDefinition_Example', 'valueReference', 'one'),
+    ('Timing', 'object_id', 'ElementDefinition_Example', 'valueTiming', 'one'),
+    ('Attachment', 'object_id', 'ElementDefinition_Example', 'valueAttachment', 'one'),
+    ('Ratio', 'object_id', 'ElementDefinition_Example', 'valueRatio', 'one'),
+    ('Element', 'id', 'ElementDefinition_Example', 'valueElement', 'one'),
+    ('Extension', 'object_id', 'ElementDefinition_Example', 'valueExtension', 'one'),
+    ('Coding', 'object_id', 'ElementDefinition_Example', 'valueCoding', 'one'),
+    ('ElementDefinition_Discriminator', 'object_id', 'ElementDefinition_Slicing',
+     'discriminator', 'many'),
+    ('Reference', 'identifier', 'EligibilityRequest', 'provider', 'one'),
+    ('Identifier', 'object_id', 'EligibilityRequest', 'identifier', 'many'),
+    ('Reference', 'identifier', 'EligibilityRequest', 'enterer', 'one'),
+    ('Reference', 'identifier', 'EligibilityRequest', 'patient', 'one'),
+    ('Reference', 'identifier', 'EligibilityRequest', 'coverage', 'one'),
+    ('CodeableConcept', 'object_id', 'EligibilityRequest', 'benefitCategory', 'one'),
+    ('Period', 'object_id', 'EligibilityRequest', 'servicedPeriod', 'one'),
+    ('Reference', 'identifier', 'EligibilityRequest', 'insurer', 'one'),
+    ('CodeableConcept', 'object_id', 'EligibilityRequest', 'benefitSubCategory', 'one'),
+    ('Reference', 'identifier', 'EligibilityRequest', 'facility', 'one'),
+    ('CodeableConcept', 'object_id', 'EligibilityRequest', 'priority', 'one'),
+    ('Reference', 'identifier', 'EligibilityRequest', 'organization', 'one'),
+    ('Reference', 'identifier', 'EligibilityResponse', 'requestOrganization', 'one'),
+    ('EligibilityResponse_Insurance', 'object_id', 'EligibilityResponse', 'insurance', 'many'),
+    ('EligibilityResponse_Error', 'object_id', 'EligibilityResponse', 'error', 'many'),
+    ('Reference', 'identifier', 'EligibilityResponse', 'insurer', 'one'),
+    ('Reference', 'identifier', 'EligibilityResponse', 'requestProvider', 'one'),
+    ('Identifier', 'object_id', 'EligibilityResponse', 'identifier', 'many'),
+    ('CodeableConcept', 'object_id', 'EligibilityResponse', 'outcome', 'one'),
+    ('CodeableConcept', 'object_id', 'EligibilityResponse', 'form', 'one'),
+    ('Reference', 'identifier', 'EligibilityResponse', 'request', 'one'),
+    ('CodeableConcept', 'object_id', 'EligibilityResponse_BenefitBalance', 'unit', 'one'),
+    ('EligibilityResponse_Financial', 'object_id', 'EligibilityResponse_BenefitBalance',
+     'financial', 'many'),
+    ('CodeableConcept', 'object_id', 'EligibilityResponse_BenefitBalance', 'network', 'one'),
+    ('CodeableConcept', 'object_id', 'EligibilityResponse_BenefitBalance', 'subCategory', 'one'),
+    ('CodeableConcept', 'object_id', 'EligibilityResponse_BenefitBalance', 'category', 'one'),
+    ('CodeableConcept', 'object_id', 'EligibilityResponse_BenefitBalance', 'term', 'one'),
+    ('CodeableConcept', 'object_id', 'EligibilityResponse_Error', 'code', 'one'),
+    ('Money', 'object_id', 'EligibilityResponse_Financial', 'usedMoney', 'one'),
+    ('Money', 'object_id', 'EligibilityResponse_Financial', 'allowedMoney', 'one'),
+    ('CodeableConcept', 'object_id', 'EligibilityResponse_Financial', 'type', 'one'),
+    ('Reference', 'identifier', 'EligibilityResponse_Insurance', 'coverage', 'one'),
+    ('Reference', 'identifier', 'EligibilityResponse_Insurance', 'contract', 'one'),
+    ('EligibilityResponse_BenefitBalance', 'object_id', 'EligibilityResponse_Insurance',
+     'benefitBalance', 'many'),
+    ('Reference', 'identifier', 'Encounter', 'incomingReferral', 'many'),
+    ('Identifier', 'object_id', 'Encounter', 'identifier', 'many'),
+    ('Reference', 'identifier', 'Encounter', 'episodeOfCare', 'many'),
+    ('Coding', 'object_id', 'Encounter', '_class', 'one'),
+    ('Encounter_ClassHistory', 'object_id', 'Encounter', 'classHistory', 'many'),
+    ('Reference', 'identifier', 'Encounter', 'partOf', 'one'),
+    ('CodeableConcept', 'object_id', 'Encounter', 'reason', 'many'),
+    ('Duration', 'object_id', 'Encounter', 'length', 'one'),
+    ('Encounter_StatusHistory', 'object_id', 'Encounter', 'statusHistory', 'many'),
+    ('CodeableConcept', 'object_id', 'Encounter', 'type', 'many'),
+    ('Encounter_Location', 'object_id', 'Encounter', 'location', 'many'),
+    ('Reference', 'identifier', 'Encounter', 'subject', 'one'),
+    ('Encounter_Hospitalization', 'object_id', 'Encounter', 'hospitalization', 'one'),
+    ('CodeableConcept', 'object_id', 'Encounter', 'priority', 'one'),
+    ('Encounter_Participant', 'object_id', 'Encounter', 'participant', 'many'),
+    ('Reference', 'identifier', 'Encounter', 'serviceProvider', 'one'),
+    ('Reference', 'identifier', 'Encounter', 'account', 'many'),
+    ('Encounter_Diagnosis', 'object_id', 'Encounter', 'diagnosis', 'many'),
+    ('Period', 'object_id', 'Encounter', 'period', 'one'),
+    ('Reference', 'identifier', 'Encounter', 'appointment', 'one'),
+    ('Coding', 'object_id', 'Encounter_ClassHistory', '_class', 'one'),
+    ('Period', 'object_id', 'Encounter_ClassHistory', 'period', 'one'),
+    ('Reference', 'identifier', 'Encounter_Diagnosis', 'condition', 'one'),
+    ('CodeableConcept', 'object_id', 'Encounter_Diagnosis', 'role', 'one'),
+    ('CodeableConcept', 'object_id', 'Encounter_Hospitalization', 'admitSource', 'one'),
+    ('Identifier', 'object_id', 'Encounter_Hospitalization', 'preAdmissionIdentifier', 'one'),
+    ('CodeableConcept', 'object_id', 'Encounter_Hospitalization', 'specialCourtesy', 'many'),
+    ('CodeableConcept', 'object_id', 'Encounter_Hospitalization', 'specialArrangement', 'many'),
+    ('CodeableConcept', 'object_id', 'Encounter_Hospitalization', 'reAdmission', 'one'),
+    ('Reference', 'identifier', 'Encounter_Hospitalization', 'destination', 'one'),
+    ('CodeableConcept', 'object_id', 'Encounter_Hospitalization', 'dietPreference', 'many'),
+    ('CodeableConcept', 'object_id', 'Encounter_Hospitalization', 'dischargeDisposition', 'one'),
+    ('Reference', 'identifier', 'Encounter_Hospitalization', 'origin', 'one'),
+    ('Period', 'object_id', 'Encounter_Location', 'period', 'one'),
+    ('Reference', 'identifier', 'Encounter_Location', 'location', 'one'),
+    ('CodeableConcept', 'object_id', 'Encounter_Participant', 'type', 'many'),
+    ('Reference', 'identifier', 'Encounter_Participant', 'individual', 'one'),
+    ('Period', 'object_id', 'Encounter_Participant', 'period', 'one'),
+    ('Period', 'object_id', 'Encounter_StatusHistory', 'period', 'one'),
+    ('Period', 'object_id', 'Endpoint', 'period', 'one'),
+    ('Identifier', 'object_id', 'Endpoint', 'identifier', 'many'),
+    ('CodeableConcept', 'object_id', 'Endpoint', 'payloadType', 'many'),
+    ('Reference', 'identifier', 'Endpoint', 'managingOrganization', 'one'),
+    ('ContactPoint', 'object_id', 'Endpoint', 'contact', 'many'),
+    ('Coding', 'object_id', 'Endpoint', 'connectionType', 'one'),
+    ('Reference', 'identifier', 'EnrollmentRequest', 'subject', 'one'),
+    ('Reference', 'identifier', 'EnrollmentRequest', 'coverage', 'one'),
+    ('Reference', 'identifier', 'EnrollmentRequest', 'insurer', 'one'),
+    ('Identifier', 'object_id', 'EnrollmentRequest', 'identifier', 'many'),
+    ('Reference', 'identifier', 'EnrollmentRequest', 'organization', 'one'),
+    ('Reference', 'identifier', 'EnrollmentRequest', 'provider', 'one'),
+    ('Reference', 'identifier', 'EnrollmentResponse', 'requestOrganization', 'one'),
+    ('Reference', 'identifier', 'EnrollmentResponse', 'request', 'one'),
+    ('Identifier', 'object_id', 'EnrollmentResponse', 'identifier', 'many'),
+    ('Reference', 'identifier', 'EnrollmentResponse', 'requestProvider', 'one'),
+    ('Reference', 'identifier', 'EnrollmentResponse', 'organization', 'one'),
+    ('CodeableConcept', 'object_id', 'EnrollmentResponse', 'outcome', 'one'),
+    ('EpisodeOfCare_StatusHistory', 'object_id', 'EpisodeOfCare', 'statusHistory', 'many'),
+    ('Reference', 'identifier', 'EpisodeOfCare', 'managingOrganization', 'one'),
+    ('Reference', 'identifier', 'EpisodeOfCare', 'account', 'many'),
+    ('Identifier', 'object_id', 'EpisodeOfCare', 'identifier', 'many'),
+    ('Reference', 'identifier', 'EpisodeOfCare', 'patient', 'one'),
+    ('Reference', 'identifier', 'EpisodeOfCare', 'team', 'many'),
+    ('Reference', 'identifier', 'EpisodeOfCare', 'referralRequest', 'many'),
+    ('EpisodeOfCare_Diagnosis', 'object_id', 'EpisodeOfCare', 'diagnosis', 'many'),
+    ('Reference', 'identifier', 'EpisodeOfCare', 'careManager', 'one'),
+    ('Period', 'object_id', 'EpisodeOfCare', 'period', 'one'),
+    ('CodeableConcept', 'object_id', 'EpisodeOfCare', 'type', 'many'),
+    ('Reference', 'identifier', 'EpisodeOfCare_Diagnosis', 'condition', 'one'),
+    ('CodeableConcept', 'object_id', 'EpisodeOfCare_Diagnosis', 'role', 'one'),
+    ('Period', 'object_id', 'EpisodeOfCare_StatusHistory', 'period', 'one'),
+    ('ExpansionProfile_FixedVersion', 'object_id', 'ExpansionProfile', 'fixedVersion', 'many'),
+    ('UsageContext', 'object_id', 'ExpansionProfile', 'useContext', 'many'),
+    ('CodeableConcept', 'object_id', 'ExpansionProfile', 'jurisdiction', 'many'),
+    ('ContactDetail', 'object_id', 'ExpansionProfile', 'contact', 'many'),
+    ('Identifier', 'object_id', 'ExpansionProfile', 'identifier', 'one'),
+    ('ExpansionProfile_Designation', 'object_id', 'ExpansionProfile', 'designation', 'one'),
+    ('ExpansionProfile_ExcludedSystem', 'object_id', 'ExpansionProfile', 'excludedSystem', 'one'),
+    ('ExpansionProfile_Include', 'object_id', 'ExpansionProfile_Designation', 'include', 'one'),
+    ('ExpansionProfile_Exclude', 'object_id', 'ExpansionProfile_Designation', 'exclude', 'one'),
+    ('Coding', 'object_id', 'ExpansionProfile_Designation1', 'use', 'one'),
+    ('Coding', 'object_id', 'ExpansionProfile_Designation2', 'use', 'one'),
+    ('ExpansionProfile_Designation2', 'object_id', 'ExpansionProfile_Exclude',
+     'designation', 'many'),
+    ('ExpansionProfile_Designation1', 'object_id', 'ExpansionProfile_Include',
+     'designation', 'many'),
+    ('ExplanationOfBenefit_BenefitBalance', 'object_id', 'ExplanationOfBenefit',
+     'benefitBalance', 'many'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit', 'prescription', 'one'),
+    ('ExplanationOfBenefit_AddItem', 'object_id', 'ExplanationOfBenefit', 'addItem', 'many'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit', 'claimResponse', 'one'),
+    ('Money', 'object_id', 'ExplanationOfBenefit', 'totalCost', 'one'),
+    ('Money', 'object_id', 'ExplanationOfBenefit', 'unallocDeductable', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit', 'provider', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit', 'originalPrescription', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit', 'subType', 'many'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit', 'claim', 'one'),
+    ('Money', 'object_id', 'ExplanationOfBenefit', 'totalBenefit', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit', 'form', 'one'),
+    ('ExplanationOfBenefit_Procedure', 'object_id', 'ExplanationOfBenefit', 'procedure', 'many'),
+    ('ExplanationOfBenefit_Related', 'object_id', 'ExplanationOfBenefit', 'related', 'many'),
+    ('ExplanationOfBenefit_Insurance', 'object_id', 'ExplanationOfBenefit', 'insurance', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit', 'type', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit', 'patient', 'one'),
+    ('ExplanationOfBenefit_Information', 'object_id', 'ExplanationOfBenefit',
+     'information', 'many'),
+    ('Period', 'object_id', 'ExplanationOfBenefit', 'hospitalization', 'one'),
+    ('ExplanationOfBenefit_Accident', 'object_id', 'ExplanationOfBenefit', 'accident', 'one'),
+    ('Period', 'object_id', 'ExplanationOfBenefit', 'billablePeriod', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit', 'referral', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit', 'organization', 'one'),
+    ('ExplanationOfBenefit_ProcessNote', 'object_id', 'ExplanationOfBenefit',
+     'processNote', 'many'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit', 'outcome', 'one'),
+    ('ExplanationOfBenefit_Item', 'object_id', 'ExplanationOfBenefit', 'item', 'many'),
+    ('ExplanationOfBenefit_Diagnosis', 'object_id', 'ExplanationOfBenefit', 'diagnosis', 'many'),
+    ('Identifier', 'object_id', 'ExplanationOfBenefit', 'identifier', 'many'),
+    ('ExplanationOfBenefit_Payee', 'object_id', 'ExplanationOfBenefit', 'payee', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit', 'insurer', 'one'),
+    ('ExplanationOfBenefit_Payment', 'identifier', 'ExplanationOfBenefit', 'payment', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit', 'enterer', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit', 'facility', 'one'),
+    ('ExplanationOfBenefit_CareTeam', 'object_id', 'ExplanationOfBenefit', 'careTeam', 'many'),
+    ('Period', 'object_id', 'ExplanationOfBenefit', 'employmentImpacted', 'one'),
+    ('Address', 'object_id', 'ExplanationOfBenefit_Accident', 'locationAddress', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit_Accident', 'locationReference', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Accident', 'type', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_AddItem', 'category', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_AddItem', 'service', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_AddItem', 'modifier', 'many'),
+    ('Money', 'object_id', 'ExplanationOfBenefit_AddItem', 'fee', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_AddItem', 'revenue', 'one'),
+    ('ExplanationOfBenefit_Adjudication', 'object_id', 'ExplanationOfBenefit_AddItem',
+     'adjudication', 'many'),
+    ('ExplanationOfBenefit_Detail1', 'object_id', 'ExplanationOfBenefit_AddItem',
+     'detail', 'many'),
+    ('Money', 'object_id', 'ExplanationOfBenefit_Adjudication', 'amount', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Adjudication', 'category', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Adjudication', 'reason', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_BenefitBalance', 'subCategory', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_BenefitBalance', 'term', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_BenefitBalance', 'category', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_BenefitBalance', 'unit', 'one'),
+    ('ExplanationOfBenefit_Financial', 'object_id', 'ExplanationOfBenefit_BenefitBalance',
+     'financial', 'many'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_BenefitBalance', 'network', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit_CareTeam', 'provider', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_CareTeam', 'role', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_CareTeam', 'qualification', 'one'),
+    ('ExplanationOfBenefit_SubDetail', 'object_id', 'ExplanationOfBenefit_Detail',
+     'subDetail', 'many'),
+    ('ExplanationOfBenefit_Adjudication', 'object_id', 'ExplanationOfBenefit_Detail',
+     'adjudication', 'many'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Detail', 'service', 'one'),
+    ('Money', 'object_id', 'ExplanationOfBenefit_Detail', 'unitPrice', 'one'),
+    ('Money', 'object_id', 'ExplanationOfBenefit_Detail', 'net', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Detail', 'programCode', 'many'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Detail', 'type', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit_Detail', 'udi', 'many'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Detail', 'revenue', 'one'),
+    ('Quantity', 'object_id', 'ExplanationOfBenefit_Detail', 'quantity', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Detail', 'category', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Detail', 'modifier', 'many'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Detail1', 'service', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Detail1', 'revenue', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Detail1', 'category', 'one'),
+    ('ExplanationOfBenefit_Adjudication', 'object_id', 'ExplanationOfBenefit_Detail1',
+     'adjudication', 'many'),
+    ('Money', 'object_id', 'ExplanationOfBenefit_Detail1', 'fee', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Detail1', 'modifier', 'many'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Diagnosis', 'type', 'many'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit_Diagnosis', 'diagnosisReference', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Diagnosis', 'packageCode', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Diagnosis',
+     'diagnosisCodeableConcept', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Financial', 'type', 'one'),
+    ('Money', 'object_id', 'ExplanationOfBenefit_Financial', 'allowedMoney', 'one'),
+    ('Money', 'object_id', 'ExplanationOfBenefit_Financial', 'usedMoney', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit_Information', 'valueReference', 'one'),
+    ('Attachment', 'object_id', 'ExplanationOfBenefit_Information', 'valueAttachment', 'one'),
+    ('Quantity', 'object_id', 'ExplanationOfBenefit_Information', 'valueQuantity', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Information', 'code', 'one'),
+    ('Coding', 'object_id', 'ExplanationOfBenefit_Information', 'reason', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Information', 'category', 'one'),
+    ('Period', 'object_id', 'ExplanationOfBenefit_Information', 'timingPeriod', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit_Insurance', 'coverage', 'one'),
+    ('Money', 'object_id', 'ExplanationOfBenefit_Item', 'unitPrice', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Item', 'subSite', 'many'),
+    ('Money', 'object_id', 'ExplanationOfBenefit_Item', 'net', 'one'),
+    ('ExplanationOfBenefit_Detail', 'object_id', 'ExplanationOfBenefit_Item', 'detail', 'many'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Item', 'programCode', 'many'),
+    ('Quantity', 'object_id', 'ExplanationOfBenefit_Item', 'quantity', 'one'),
+    ('Period', 'object_id', 'ExplanationOfBenefit_Item', 'servicedPeriod', 'one'),
+    ('ExplanationOfBenefit_Adjudication', 'object_id', 'ExplanationOfBenefit_Item',
+     'adjudication', 'many'),
+    ('Address', 'object_id', 'ExplanationOfBenefit_Item', 'locationAddress', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Item', 'service', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Item', 'bodySite', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Item', 'modifier', 'many'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Item',
+     'locationCodeableConcept', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit_Item', 'encounter', 'many'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Item', 'category', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit_Item', 'locationReference', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Item', 'revenue', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit_Item', 'udi', 'many'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Payee', 'resourceType', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit_Payee', 'party', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Payee', 'type', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Payment', 'adjustmentReason', 'one'),
+    ('Identifier', 'object_id', 'ExplanationOfBenefit_Payment', 'identifier', 'one'),
+    ('Money', 'object_id', 'ExplanationOfBenefit_Payment', 'adjustment', 'one'),
+    ('Money', 'object_id', 'ExplanationOfBenefit_Payment', 'amount', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Payment', 'type', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Procedure',
+     'procedureCodeableConcept', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit_Procedure', 'procedureReference', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_ProcessNote', 'language', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_ProcessNote', 'type', 'one'),
+    ('Identifier', 'object_id', 'ExplanationOfBenefit_Related', 'reference', 'one'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit_Related', 'claim', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_Related', 'relationship', 'one'),
+    ('Money', 'object_id', 'ExplanationOfBenefit_SubDetail', 'net', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_SubDetail', 'programCode', 'many'),
+    ('Money', 'object_id', 'ExplanationOfBenefit_SubDetail', 'unitPrice', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_SubDetail', 'modifier', 'many'),
+    ('Reference', 'identifier', 'ExplanationOfBenefit_SubDetail', 'udi', 'many'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_SubDetail', 'service', 'one'),
+    ('ExplanationOfBenefit_Adjudication', 'object_id', 'ExplanationOfBenefit_SubDetail',
+     'adjudication', 'many'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_SubDetail', 'revenue', 'one'),
+    ('Quantity', 'object_id', 'ExplanationOfBenefit_SubDetail', 'quantity', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_SubDetail', 'type', 'one'),
+    ('CodeableConcept', 'object_id', 'ExplanationOfBenefit_SubDetail', 'category', 'one'),
+    ('Quantity', 'object_id', 'Extension', 'valueQuantity', 'one'),
+    ('CodeableConcept', 'object_id', 'Extension', 'valueCodeableConcept', 'one'),
+    ('Money', 'object_id', 'Extension', 'valueMoney', 'one'),
+    ('Quantity', 'object_id', 'Extension', 'valueSimpleQuantity', 'one'),
+    ('Reference', 'identifier', 'Extension', 'valueReference', 'one'),
+    ('Age', 'object_id', 'Extension', 'valueAge', 'one'),
+    ('SampledData', 'object_id', 'Extension', 'valueSampledData', 'one'),
+    ('RelatedArtifact', 'object_id', 'Extension', 'valueRelatedArtifact', 'one'),
+    ('Period', 'object_id', 'Extension', 'valuePeriod', 'one'),
+    ('Range', 'object_id', 'Extension', 'valueRange', 'one'),
+    ('ContactDetail', 'object_id', 'Extension', 'valueContactDetail', 'one'),
+    ('Ratio', 'object_id', 'Extension', 'valueRatio', 'one'),
+    ('Meta', 'object_id', 'Extension', 'valueMeta', 'one'),
+    ('Duration', 'object_id', 'Extension', 'valueDuration', 'one'),
+    ('Contributor', 'object_id', 'Extension', 'valueContributor', 'one'),
+    ('Signature', 'object_id', 'Extension', 'valueSignature', 'one'),
+    ('DataRequirement', 'object_id', 'Extension', 'valueDataRequirement', 'one'),
+    ('ParameterDefinition', 'object_id', 'Extension', 'valueParameterDefinition', 'one'),
+    ('UsageContext', 'object_id', 'Extension', 'valueUsageContext', 'one'),
+    ('Address', 'object_id', 'Extension', 'valueAddress', 'one'),
+    ('Distance', 'object_id', 'Extension', 'valueDistance', 'one'),
+    ('Timing', 'object_id', 'Extension', 'valueTiming', 'one'),
+    ('Annotation', 'object_id', 'Extension', 'valueAnnotation', 'one'),
+    ('ContactPoint', 'object_id', 'Extension', 'valueContactPoint', 'one'),
+    ('Coding', 'object_id', 'Extension', 'valueCoding', 'one'),
+    ('HumanName', 'object_id', 'Extension', 'valueHumanName', 'one'),
+    ('Identifier', 'object_id', 'Extension', 'valueIdentifier', 'one'),
+    ('Attachment', 'object_id', 'Extension', 'valueAttachment', 'one'),
+    ('TriggerDefinition', 'object_id', 'Extension', 'valueTriggerDefinition', 'one'),
+    ('Narrative', 'object_id', 'Extension', 'valueNarrative', 'one'),
+    ('Extension', 'object_id', 'Extension', 'valueExtension', 'one'),
+    ('Dosage', 'object_id', 'Extension', 'valueDosage', 'one'),
+    ('Count', 'object_id', 'Extension', 'valueCount', 'one'),
+    ('Annotation', 'object_id', 'FamilyMemberHistory', 'note', 'many'),
+    ('Age', 'object_id', 'FamilyMemberHistory', 'deceasedAge', 'one'),
+    ('FamilyMemberHistory_Condition', 'object_id', 'FamilyMemberHistory', 'condition', 'many'),
+    ('Range', 'object_id', 'FamilyMemberHistory', 'deceasedRange', 'one'),
+    ('Reference', 'identifier', 'FamilyMemberHistory', 'reasonReference', 'many'),
+    ('Identifier', 'object_id', 'FamilyMemberHistory', 'identifier', 'many'),
+    ('Reference', 'identifier', 'FamilyMemberHistory', 'definition', 'many'),
+    ('Age', 'object_id', 'FamilyMemberHistory', 'ageAge', 'one'),
+    ('CodeableConcept', 'object_id', 'FamilyMemberHistory', 'relationship', 'one'),
+    ('Reference', 'identifier', 'FamilyMemberHistory', 'patient', 'one'),
+    ('Range', 'object_id', 'FamilyMemberHistory', 'ageRange', 'one'),
+    ('Period', 'object_id', 'FamilyMemberHistory', 'bornPeriod', 'one'),
+    ('CodeableConcept', 'object_id', 'FamilyMemberHistory', 'notDoneReason', 'one'),
+    ('CodeableConcept', 'object_id', 'FamilyMemberHistory', 'reasonCode', 'many'),
+    ('Age', 'object_id', 'FamilyMemberHistory_Condition', 'onsetAge', 'one'),
+    ('CodeableConcept', 'object_id', 'FamilyMemberHistory_Condition', 'outcome', 'one'),
+    ('Period', 'object_id', 'FamilyMemberHistory_Condition', 'onsetPeriod', 'one'),
+    ('Annotation', 'object_id', 'FamilyMemberHistory_Condition', 'note', 'many'),
+    ('CodeableConcept', 'object_id', 'FamilyMemberHistory_Condition', 'code', 'one'),
+    ('Range', 'object_id', 'FamilyMemberHistory_Condition', 'onsetRange', 'one'),
+    ('CodeableConcept', 'object_id', 'Flag', 'code', 'one'),
+    ('Reference', 'identifier', 'Flag', 'author', 'one'),
+    ('Reference', 'identifier', 'Flag', 'encounter', 'one'),
+    ('Period', 'object_id', 'Flag', 'period', 'one'),
+    ('CodeableConcept', 'object_id', 'Flag', 'category', 'one'),
+    ('Identifier', 'object_id', 'Flag', 'identifier', 'many'),
+    ('Reference', 'identifier', 'Flag', 'subject', 'one'),
+    ('Annotation', 'object_id', 'Goal', 'note', 'many'),
+    ('Reference', 'identifier', 'Goal', 'addresses', 'many'),
+    ('Reference', 'identifier', 'Goal', 'outcomeReference', 'many'),
+    ('Reference', 'identifier', 'Goal', 'subject', 'one'),
+    ('Identifier', 'object_id', 'Goal', 'identifier', 'many'),
+    ('Goal_Target', 'object_id', 'Goal', 'target', 'one'),
+    ('CodeableConcept', 'object_id', 'Goal', 'outcomeCode', 'many'),
+    ('CodeableConcept', 'object_id', 'Goal', 'category', 'many'),
+    ('CodeableConcept', 'object_id', 'Goal', 'priority', 'one'),
+    ('Reference', 'identifier', 'Goal', 'expressedBy', 'one'),
+    ('CodeableConcept', 'object_id', 'Goal', 'startCodeableConcept', 'one'),
+    ('CodeableConcept', 'object_id', 'Goal', 'description', 'one'),
+    ('CodeableConcept', 'object_id', 'Goal_Target', 'measure', 'one'),
+    ('Duration', 'object_id', 'Goal_Target', 'dueDuration', 'one'),
+    ('CodeableConcept', 'object_id', 'Goal_Target', 'detailCodeableConcept', 'one'),
+    ('Quantity', 'object_id', 'Goal_Target', 'detailQuantity', 'one'),
+    ('Range', 'object_id', 'Goal_Target', 'detailRange', 'one'),
+    ('ContactDetail', 'object_id', 'GraphDefinition', 'contact', 'many'),
+    ('GraphDefinition_Link', 'object_id', 'GraphDefinition', 'link', 'many'),
+    ('CodeableConcept', 'object_id', 'GraphDefinition', 'jurisdiction', 'many'),
+    ('UsageContext', 'object_id', 'GraphDefinition', 'useContext', 'many'),
+    ('GraphDefinition_Compartment', 'object_id', 'GraphDefinition_Target', 'compartment', 'many'),
+    ('GraphDefinition_Link', 'object_id', 'GraphDefinition_Target', 'link', 'many'),
+    ('CodeableConcept', 'object_id', 'Group', 'code', 'one'),
+    ('Group_Characteristic', 'object_id', 'Group', 'characteristic', 'many'),
+    ('Group_Member', 'object_id', 'Group', 'member', 'many'),
+    ('Identifier', 'object_id', 'Group', 'identifier', 'many'),
+    ('Quantity', 'object_id', 'Group_Characteristic', 'valueQuantity', 'one'),
+    ('Period', 'object_id', 'Group_Characteristic', 'period', 'one'),
+    ('CodeableConcept', 'object_id', 'Group_Characteristic', 'valueCodeableConcept', 'one'),
+    ('Range', 'object_id', 'Group_Characteristic', 'valueRange', 'one'),
+    ('CodeableConcept', 'object_id', 'Group_Characteristic', 'code', 'one'),
+    ('Period', 'object_id', 'Group_Member', 'period', 'one'),
+    ('Reference', 'identifier', 'Group_Member', 'entity', 'one'),
+    ('Reference', 'identifier', 'GuidanceResponse', 'performer', 'one'),
+    ('Reference', 'identifier', 'GuidanceResponse', 'subject', 'one'),
+    ('Reference', 'identifier', 'GuidanceResponse', 'result', 'one'),
+    ('CodeableConcept', 'object_id', 'GuidanceResponse', 'reasonCodeableConcept', 'one'),
+    ('Reference', 'identifier', 'GuidanceResponse', 'reasonReference', 'one'),
+    ('Reference', 'identifier', 'GuidanceResponse', 'outputParameters', 'one'),
+    ('DataRequirement', 'object_id', 'GuidanceResponse', 'dataRequirement', 'many'),
+    ('Identifier', 'object_id', 'GuidanceResponse', 'identifier', 'one'),
+    ('Reference', 'identifier', 'GuidanceResponse', 'evaluationMessage', 'many'),
+    ('Reference', 'identifier', 'GuidanceResponse', 'context', 'one'),
+    ('Annotation', 'object_id', 'GuidanceResponse', 'note', 'many'),
+    ('Reference', 'identifier', 'GuidanceResponse', 'module', 'one'),
+    ('HealthcareService_NotAvailable', 'object_id', 'HealthcareService', 'notAvailable', 'many'),
+    ('Attachment', 'object_id', 'HealthcareService', 'photo', 'one'),
+    ('ContactPoint', 'object_id', 'HealthcareService', 'telecom', 'many'),
+    ('CodeableConcept', 'object_id', 'HealthcareService', 'characteristic', 'many'),
+    ('HealthcareService_AvailableTime', 'object_id', 'HealthcareService', 'availableTime', 'many'),
+    ('CodeableConcept', 'object_id', 'HealthcareService', 'type', 'many'),
+    ('CodeableConcept', 'object_id', 'HealthcareService', 'referralMethod', 'many'),
+    ('Reference', 'identifier', 'HealthcareService', 'providedBy', 'one'),
+    ('CodeableConcept', 'object_id', 'HealthcareService', 'specialty', 'many'),
+    ('CodeableConcept', 'object_id', 'HealthcareService', 'eligibility', 'one'),
+    ('CodeableConcept', 'object_id', 'HealthcareService', 'serviceProvisionCode', 'many'),
+    ('Identifier', 'object_id', 'HealthcareService', 'identifier', 'many'),
+    ('Reference', 'identifier', 'HealthcareService', 'coverageArea', 'many'),
+    ('Reference', 'identifier', 'HealthcareService', 'location', 'many'),
+    ('Reference', 'identifier', 'HealthcareService', 'endpoint', 'many'),
+    ('CodeableConcept', 'object_id', 'HealthcareService', 'category', 'one'),
+    ('Period', 'object_id', 'HealthcareService_NotAvailable', 'during', 'one'),
+    ('Period', 'object_id', 'HumanName', 'period', 'one'),
+    ('CodeableConcept', 'object_id', 'Identifier', 'type', 'one'),
+    ('Period', 'object_id', 'Identifier', 'period', 'one'),
+    ('Reference', 'identifier', 'ImagingManifest', 'author', 'one'),
+    ('ImagingManifest_Study', 'object_id', 'ImagingManifest', 'study', 'many'),
+    ('Reference', 'identifier', 'ImagingManifest', 'patient', 'one'),
+    ('Identifier', 'object_id', 'ImagingManifest', 'identifier', 'one'),
+    ('ImagingManifest_Instance', 'object_id', 'ImagingManifest_Series', 'instance', 'many'),
+    ('Reference', 'identifier', 'ImagingManifest_Series', 'endpoint', 'many'),
+    ('Reference', 'identifier', 'ImagingManifest_Study', 'endpoint', 'many'),
+    ('Reference', 'identifier', 'ImagingManifest_Study', 'imagingStudy', 'one'),
+    ('ImagingManifest_Series', 'object_id', 'ImagingManifest_Study', 'series', 'many'),
+    ('Reference', 'identifier', 'ImagingStudy', 'basedOn', 'many'),
+    ('Identifier', 'object_id', 'ImagingStudy', 'accession', 'one'),
+    ('Reference', 'identifier', 'ImagingStudy', 'interpreter', 'many'),
+    ('Reference', 'identifier', 'ImagingStudy', 'endpoint', 'many'),
+    ('CodeableConcept', 'object_id', 'ImagingStudy', 'procedureCode', 'many'),
+    ('CodeableConcept', 'object_id', 'ImagingStudy', 'reason', 'one'),
+    ('Identifier', 'object_id', 'ImagingStudy', 'identifier', 'many'),
+    ('Reference', 'identifier', 'ImagingStudy', 'procedureReference', 'many'),
+    ('ImagingStudy_Series', 'object_id', 'ImagingStudy', 'series', 'many'),
+    ('Coding', 'object_id', 'ImagingStudy', 'modalityList', 'many'),
+    ('Reference', 'identifier', 'ImagingStudy', 'referrer', 'one'),
+    ('Reference', 'identifier', 'ImagingStudy', 'patient', 'one'),
+    ('Reference', 'identifier', 'ImagingStudy', 'context', 'one'),
+    ('Reference', 'identifier', 'ImagingStudy_Series', 'endpoint', 'many'),
+    ('Coding', 'object_id', 'ImagingStudy_Series', 'bodySite', 'one'),
+    ('ImagingStudy_Instance', 'object_id', 'ImagingStudy_Series', 'instance', 'many'),
+    ('Coding', 'object_id', 'ImagingStudy_Series', 'laterality', 'one'),
+    ('Coding', 'object_id', 'ImagingStudy_Series', 'modality', 'one'),
+    ('Reference', 'identifier', 'ImagingStudy_Series', 'performer', 'many'),
+    ('Reference', 'identifier', 'Immunization', 'patient', 'one'),
+    ('Immunization_Explanation', 'object_id', 'Immunization', 'explanation', 'one'),
+    ('Reference', 'identifier', 'Immunization', 'encounter', 'one'),
+    ('Immunization_Reaction', 'object_id', 'Immunization', 'reaction', 'many'),
+    ('Identifier', 'object_id', 'Immunization', 'identifier', 'many'),
+    ('Quantity', 'object_id', 'Immunization', 'doseQuantity', 'one'),
+    ('Reference', 'identifier', 'Immunization', 'location', 'one'),
+    ('Immunization_Practitioner', 'object_id', 'Immunization', 'practitioner', 'many'),
+    ('Immunization_VaccinationProtocol', 'object_id', 'Immunization',
+     'vaccinationProtocol', 'many'),
+    ('Annotation', 'object_id', 'Immunization', 'note', 'many'),
+    ('Reference', 'identifier', 'Immunization', 'manufacturer', 'one'),
+    ('CodeableConcept', 'object_id', 'Immunization', 'vaccineCode', 'one'),
+    ('CodeableConcept', 'object_id', 'Immunization', 'reportOrigin', 'one'),
+    ('CodeableConcept', 'object_id', 'Immunization', 'route', 'one'),
+    ('CodeableConcept', 'object_id', 'Immunization', 'site', 'one'),
+    ('CodeableConcept', 'object_id', 'Immunization_Explanation', 'reasonNotGiven', 'many'),
+    ('CodeableConcept', 'object_id', 'Immunization_Explanation', 'reason', 'many'),
+    ('Reference', 'identifier', 'Immunization_Practitioner', 'actor', 'one'),
+    ('CodeableConcept', 'object_id', 'Immunization_Practitioner', 'role', 'one'),
+    ('Reference', 'identifier', 'Immunization_Reaction', 'detail', 'one'),
+    ('CodeableConcept', 'object_id', 'Immunization_VaccinationProtocol',
+     'doseStatusReason', 'one'),
+    ('CodeableConcept', 'object_id', 'Immunization_VaccinationProtocol', 'doseStatus', 'one'),
+    ('CodeableConcept', 'object_id', 'Immunization_VaccinationProtocol', 'targetDisease', 'many'),
+    ('Reference', 'identifier', 'Immunization_VaccinationProtocol', 'authority', 'one'),
+    ('Identifier', 'object_id', 'ImmunizationRecommendation', 'identifier', 'many'),
+    ('Reference', 'identifier', 'ImmunizationRecommendation', 'patient', 'one'),
+    ('ImmunizationRecommendation_Recommendation', 'object_id', 'ImmunizationRecommendation',
+     'recommendation', 'many'),
+    ('CodeableConcept', 'object_id', 'ImmunizationRecommendation_DateCriterion', 'code', 'one'),
+    ('Reference', 'identifier', 'ImmunizationRecommendation_Protocol', 'authority', 'one'),
+    ('CodeableConcept', 'object_id', 'ImmunizationRecommendation_Recommendation',
+     'forecastStatus', 'one'),
+    ('ImmunizationRecommendation_DateCriterion', 'object_id',
+     'ImmunizationRecommendation_Recommendation',
+     'dateCriterion', 'many'),
+    ('CodeableConcept', 'object_id', 'ImmunizationRecommendation_Recommendation',
+     'vaccineCode', 'one'),
+    ('CodeableConcept', 'object_id', 'ImmunizationRecommendation_Recommendation',
+     'targetDisease', 'one'),
+    ('Reference', 'identifier', 'ImmunizationRecommendation_Recommendation',
+     'supportingImmunization', 'many'),
+    ('ImmunizationRecommendation_Protocol', 'object_id',
+     'ImmunizationRecommendation_Recommendation',
+     'protocol', 'one'),
+    ('Reference', 'identifier', 'ImmunizationRecommendation_Recommendation',
+     'supportingPatientInformation', 'many'),
+    ('ImplementationGuide_Package', 'object_id', 'ImplementationGuide', 'package', 'many'),
+    ('ContactDetail', 'object_id', 'ImplementationGuide', 'contact', 'many'),
+    ('ImplementationGuide_Global', 'object_id', 'ImplementationGuide', '_global', 'many'),
+    ('ImplementationGuide_Dependency', 'object_id', 'ImplementationGuide', 'dependency', 'many'),
+    ('CodeableConcept', 'object_id', 'ImplementationGuide', 'jurisdiction', 'many'),
+    ('UsageContext', 'object_id', 'ImplementationGuide', 'useContext', 'many'),
+    ('ImplementationGuide_Page', 'object_id', 'ImplementationGuide', 'page', 'one'),
+    ('Reference', 'identifier', 'ImplementationGuide_Global', 'profile', 'one'),
+    ('ImplementationGuide_Resource', 'object_id', 'ImplementationGuide_Package',
+     'resource', 'many'),
+    ('ImplementationGuide_Page', 'object_id', 'ImplementationGuide_Page', 'page', 'many'),
+    ('Reference', 'identifier', 'ImplementationGuide_Resource', 'sourceReference', 'one'),
+    ('Reference', 'identifier', 'ImplementationGuide_Resource', 'exampleFor', 'one'),
+    ('Contributor', 'object_id', 'Library', 'contributor', 'many'),
+    ('CodeableConcept', 'object_id', 'Library', 'jurisdiction', 'many'),
+    ('CodeableConcept', 'object_id', 'Library', 'type', 'one'),
+    ('Period', 'object_id', 'Library', 'effectivePeriod', 'one'),
+    ('Identifier', 'object_id', 'Library', 'identifier', 'many'),
+    ('ParameterDefinition', 'object_id', 'Library', 'parameter', 'many'),
+    ('RelatedArtifact', 'object_id', 'Library', 'relatedArtifact', 'many'),
+    ('ContactDetail', 'object_id', 'Library', 'contact', 'many'),
+    ('UsageContext', 'object_id', 'Library', 'useContext', 'many'),
+    ('CodeableConcept', 'object_id', 'Library', 'topic', 'many'),
+    ('DataRequirement', 'object_id', 'Library', 'dataRequirement', 'many'),
+    ('Attachment', 'object_id', 'Library', 'content', 'many'),
+    ('Linkage_Item', 'object_id', 'Linkage', 'item', 'many'),
+    ('Reference', 'identifier', 'Linkage', 'author', 'one'),
+    ('Reference', 'identifier', 'Linkage_Item', 'resource', 'one'),
+    ('Reference', 'identifier', 'List', 'encounter', 'one'),
+    ('CodeableConcept', 'object_id', 'List', 'orderedBy', 'one'),
+    ('Reference', 'identifier', 'List', 'subject', 'one'),
+    ('Reference', 'identifier', 'List', 'source', 'one'),
+    ('List_Entry', 'object_id', 'List', 'entry', 'many'),
+    ('Annotation', 'object_id', 'List', 'note', 'many'),
+    ('CodeableConcept', 'object_id', 'List', 'emptyReason', 'one'),
+    ('Identifier', 'object_id', 'List', 'identifier', 'many'),
+    ('CodeableConcept', 'object_id', 'List', 'code', 'one'),
+    ('Reference', 'identifier', 'List_Entry', 'item', 'one'),
+    ('CodeableConcept', 'object_id', 'List_Entry', 'flag', 'one'),
+    ('Location_Position', 'object_id', 'Location', 'position', 'one'),
+    ('Reference', 'identifier', 'Location', 'endpoint', 'many'),
+    ('Reference', 'identifier', 'Location', 'partOf', 'one'),
+    ('Identifier', 'object_id', 'Location', 'identifier', 'many'),
+    ('Coding', 'object_id', 'Location', 'operationalStatus', 'one'),
+    ('CodeableConcept', 'object_id', 'Location', 'physicalType', 'one'),
+    ('CodeableConcept', 'object_id', 'Location', 'type', 'one'),
+    ('Reference', 'identifier', 'Location', 'managingOrganization', 'one'),
+    ('Address', 'object_id', 'Location', 'address', 'one'),
+    ('ContactPoint', 'object_id', 'Location', 'telecom', 'many'),
+    ('Measure_SupplementalData', 'identifier', 'Measure', 'supplementalData', 'many'),
+    ('CodeableConcept', 'object_id', 'Measure', 'scoring', 'one'),
+    ('UsageContext', 'object_id', 'Measure', 'useContext', 'many'),
+    ('Identifier', 'object_id', 'Measure', 'identifier', 'many'),
+    ('CodeableConcept', 'object_id', 'Measure', 'topic', 'many'),
+    ('ContactDetail', 'object_id', 'Measure', 'contact', 'many'),
+    ('Reference', 'identifier', 'Measure', 'library', 'many'),
+    ('Contributor', 'object_id', 'Measure', 'contributor', 'many'),
+    ('Period', 'object_id', 'Measure', 'effectivePeriod', 'one'),
+    ('CodeableConcept', 'object_id', 'Measure', 'compositeScoring', 'one'),
+    ('CodeableConcept', 'object_id', 'Measure', 'type', 'many'),
+    ('CodeableConcept', 'object_id', 'Measure', 'jurisdiction', 'many'),
+    ('Measure_Group', 'identifier', 'Measure', 'group', 'many'),
+    ('RelatedArtifact', 'object_id', 'Measure', 'relatedArtifact', 'many'),
+    ('Measure_Population', 'identifier', 'Measure_Group', 'population', 'many'),
+    ('Measure_Stratifier', 'identifier', 'Measure_Group', 'stratifier', 'many'),
+    ('Identifier', 'object_id', 'Measure_Group', 'identifier', 'one'),
+    ('CodeableConcept', 'object_id', 'Measure_Population', 'code', 'one'),
+    ('Identifier', 'object_id', 'Measure_Population', 'identifier', 'one'),
+    ('Identifier', 'object_id', 'Measure_Stratifier', 'identifier', 'one'),
+    ('CodeableConcept', 'object_id', 'Measure_SupplementalData', 'usage', 'many'),
+    ('Identifier', 'object_id', 'Measure_SupplementalData', 'identifier', 'one'),
+    ('Identifier', 'object_id', 'MeasureReport', 'identifier', 'one'),
+    ('Reference', 'identifier', 'MeasureReport', 'reportingOrganization', 'one'),
+    ('Reference', 'identifier', 'MeasureReport', 'measure', 'one'),
+    ('Period', 'object_id', 'MeasureReport', 'period', 'one'),
+    ('Reference', 'identifier', 'MeasureReport', 'patient', 'one'),
+    ('MeasureReport_Group', 'identifier', 'MeasureReport', 'group', 'many'),
+    ('Reference', 'identifier', 'MeasureReport', 'evaluatedResources', 'one'),
+    ('MeasureReport_Stratifier', 'identifier', 'MeasureReport_Group', 'stratifier', 'many'),
+    ('MeasureReport_Population', 'identifier', 'MeasureReport_Group', 'population', 'many'),
+    ('Identifier', 'object_id', 'MeasureReport_Group', 'identifier', 'one'),
+    ('Reference', 'identifier', 'MeasureReport_Population', 'patients', 'one'),
+    ('Identifier', 'object_id', 'MeasureReport_Population', 'identifier', 'one'),
+    ('CodeableConcept', 'object_id', 'MeasureReport_Population', 'code', 'one'),
+    ('Reference', 'identifier', 'MeasureReport_Population1', 'patients', 'one'),
+    ('Identifier', 'object_id', 'MeasureReport_Population1', 'identifier', 'one'),
+    ('CodeableConcept', 'object_id', 'MeasureReport_Population1', 'code', 'one'),
+    ('Identifier', 'object_id', 'MeasureReport_Stratifier', 'identifier', 'one'),
+    ('MeasureReport_Stratum', 'object_id', 'MeasureReport_Stratifier', 'stratum', 'many'),
+    ('MeasureReport_Population1', 'identifier', 'MeasureReport_Stratum', 'population', 'many'),
+    ('Period', 'object_id', 'Media', 'occurrencePeriod', 'one'),
+    ('Annotation', 'object_id', 'Media', 'note', 'many'),
+    ('CodeableConcept', 'object_id', 'Media', 'subtype', 'one'),
+    ('Reference', 'identifier', 'Media', 'subject', 'one'),
+    ('Attachment', 'object_id', 'Media', 'content', 'one'),
+    ('CodeableConcept', 'object_id', 'Media', 'bodySite', 'one'),
+    ('Identifier', 'object_id', 'Media', 'identifier', 'many'),
+    ('CodeableConcept', 'object_id', 'Media', 'reasonCode', 'many'),
+    ('Reference', 'identifier', 'Media', 'operator', 'one'),
+    ('Reference', 'identifier', 'Media', 'basedOn', 'many'),
+    ('Reference', 'identifier', 'Media', 'context', 'one'),
+    ('Reference', 'identifier', 'Media', 'device', 'one'),
+    ('CodeableConcept', 'object_id', 'Media', 'view', 'one'),
+    ('Medication_Package', 'object_id', 'Medication', 'package', 'one'),
+    ('Medication_Ingredient', 'object_id', 'Medication', 'ingredient', 'many'),
+    ('Attachment', 'object_id', 'Medication', 'image', 'many'),
+    ('CodeableConcept', 'object_id', 'Medication', 'form', 'one'),
+    ('Reference', 'identifier', 'Medication', 'manufacturer', 'one'),
+    ('CodeableConcept', 'object_id', 'Medication', 'code', 'one'),
+    ('Reference', 'identifier', 'Medication_Content', 'itemReference', 'one'),
+    ('Quantity', 'object_id', 'Medication_Content', 'amount', 'one'),
+    ('CodeableConcept', 'object_id', 'Medication_Content', 'itemCodeableConcept', 'one'),
+    ('Reference', 'identifier', 'Medication_Ingredient', 'itemReference', 'one'),
+    ('CodeableConcept', 'object_id', 'Medication_Ingredient', 'itemCodeableConcept', 'one'),
+    ('Ratio', 'object_id', 'Medication_Ingredient', 'amount', 'one'),
+    ('Medication_Batch', 'object_id', 'Medication_Package', 'batch', 'many'),
+    ('CodeableConcept', 'object_id', 'Medication_Package', 'container', 'one'),
+    ('Medication_Content', 'object_id', 'Medication_Package', 'content', 'many'),
+    ('Reference', 'identifier', 'MedicationAdministration', 'supportingInformation', 'many'),
+    ('CodeableConcept', 'object_id', 'MedicationAdministration', 'category', 'one'),
+    ('Reference', 'identifier', 'MedicationAdministration', 'device', 'many'),
+    ('Period', 'object_id', 'MedicationAdministration', 'effectivePeriod', 'one'),
+    ('Reference', 'identifier', 'MedicationAdministration', 'partOf', 'many'),
+    ('Reference', 'identifier', 'MedicationAdministration', 'definition', 'many'),
+    ('Reference', 'identifier', 'MedicationAdministration', 'medicationReference', 'one'),
+    ('Reference', 'identifier', 'MedicationAdministration', 'prescription', 'one'),
+    ('Annotation', 'object_id', 'MedicationAdministration', 'note', 'many'),
+    ('MedicationAdministration_Performer', 'object_id', 'MedicationAdministration',
+     'performer', 'many'),
+    ('Reference', 'identifier', 'MedicationAdministration', 'reasonReference', 'many'),
+    ('CodeableConcept', 'object_id', 'MedicationAdministration',
+     'medicationCodeableConcept', 'one'),
+    ('Reference', 'identifier', 'MedicationAdministration', 'eventHistory', 'many'),
+    ('Identifier', 'object_id', 'MedicationAdministration', 'identifier', 'many'),
+    ('MedicationAdministration_Dosage', 'object_id', 'MedicationAdministration', 'dosage', 'one'),
+    ('CodeableConcept', 'object_id', 'MedicationAdministration', 'reasonNotGiven', 'many'),
+    ('CodeableConcept', 'object_id', 'MedicationAdministration', 'reasonCode', 'many'),
+    ('Reference', 'identifier', 'MedicationAdministration', 'context', 'one'),
+    ('Reference', 'identifier', 'MedicationAdministration', 'subject', 'one'),
+    ('CodeableConcept', 'object_id', 'MedicationAdministration_Dosage', 'site', 'one'),
+    ('Quantity', 'object_id', 'MedicationAdministration_Dosage', 'dose', 'one'),
+    ('CodeableConcept', 'object_id', 'MedicationAdministration_Dosage', 'method', 'one'),
+    ('CodeableConcept', 'object_id', 'MedicationAdministration_Dosage', 'route', 'one'),
+    ('Quantity', 'object_id', 'MedicationAdministration_Dosage', 'rateSimpleQuantity', 'one'),
+    ('Ratio', 'object_id', 'MedicationAdministration_Dosage', 'rateRatio', 'one'),
+    ('Reference', 'identifier', 'MedicationAdministration_Performer', 'actor', 'one'),
+    ('Reference', 'identifier', 'MedicationAdministration_Performer', 'onBehalfOf', 'one'),
+    ('Dosage', 'object_id', 'MedicationDispense', 'dosageInstruction', 'many'),
+    ('Reference', 'identifier', 'MedicationDispense', 'partOf', 'many'),
+    ('Reference', 'identifier', 'MedicationDispense', 'receiver', 'many'),
+    ('Reference', 'identifier', 'MedicationDispense', 'detectedIssue', 'many'),
+    ('CodeableConcept', 'object_id', 'MedicationDispense', 'medicationCodeableConcept', 'one'),
+    ('Reference', 'identifier', 'MedicationDispense', 'supportingInformation', 'many'),
+    ('Quantity', 'object_id', 'MedicationDispense', 'quantity', 'one'),
+    ('Reference', 'identifier', 'MedicationDispense', 'subject', 'one'),
+    ('Identifier', 'object_id', 'MedicationDispense', 'identifier', 'many'),
+    ('Quantity', 'object_id', 'MedicationDispense', 'daysSupply', 'one'),
+    ('Reference', 'identifier', 'MedicationDispense', 'medicationReference', 'one'),
+    ('Reference', 'identifier', 'MedicationDispense', 'destination', 'one'),
+    ('MedicationDispense_Performer', 'object_id', 'MedicationDispense', 'performer', 'many'),
+    ('CodeableConcept', 'object_id', 'MedicationDispense', 'notDoneReasonCodeableConcept', 'one'),
+    ('MedicationDispense_Substitution', 'object_id', 'MedicationDispense', 'substitution', 'one'),
+    ('Reference', 'identifier', 'MedicationDispense', 'eventHistory', 'many'),
+    ('CodeableConcept', 'object_id', 'MedicationDispense', 'type', 'one'),
+    ('Reference', 'identifier', 'MedicationDispense', 'context', 'one'),
+    ('Reference', 'identifier', 'MedicationDispense', 'authorizingPrescription', 'many'),
+    ('Reference', 'identifier', 'MedicationDispense', 'notDoneReasonReference', 'one'),
+    ('Annotation', 'object_id', 'MedicationDispense', 'note', 'many'),
+    ('CodeableConcept', 'object_id', 'MedicationDispense', 'category', 'one'),
+    ('Reference', 'identifier', 'MedicationDispense_Performer', 'actor', 'one'),
+    ('Reference', 'identifier', 'MedicationDispense_Performer', 'onBehalfOf', 'one'),
+    ('CodeableConcept', 'object_id', 'MedicationDispense_Substitution', 'reason', 'many'),
+    ('Reference', 'identifier', 'MedicationDispense_Substitution', 'responsibleParty', 'many'),
+    ('CodeableConcept', 'object_id', 'MedicationDispense_Substitution', 'type', 'one'),
+    ('Annotation', 'object_id', 'MedicationRequest', 'note', 'many'),
+    ('Reference', 'identifier', 'MedicationRequest', 'subject', 'one'),
+    ('Reference', 'identifier', 'MedicationRequest', 'definition', 'many'),
+    ('Reference', 'identifier', 'MedicationRequest', 'medicationReference', 'one'),
+    ('CodeableConcept', 'object_id', 'MedicationRequest', 'category', 'one'),
+    ('Reference', 'identifier', 'MedicationRequest', 'supportingInformation', 'many'),
+    ('Reference', 'identifier', 'MedicationRequest', 'priorPrescription', 'one'),
+    ('Identifier', 'object_id', 'MedicationRequest', 'groupIdentifier', 'one'),
+    ('Reference', 'identifier', 'MedicationRequest', 'basedOn', 'many'),
+    ('Reference', 'identifier', 'MedicationRequest', 'reasonReference', 'many'),
+    ('MedicationRequest_Requester', 'object_id', 'MedicationRequest', 'requester', 'one'),
+    ('Reference', 'identifier', 'MedicationRequest', 'recorder', 'one'),
+    ('Dosage', 'object_id', 'MedicationRequest', 'dosageInstruction', 'many'),
+    ('MedicationRequest_Substitution', 'object_id', 'MedicationRequest', 'substitution', 'one'),
+    ('CodeableConcept', 'object_id', 'MedicationRequest', 'reasonCode', 'many'),
+    ('CodeableConcept', 'object_id', 'MedicationRequest', 'medicationCodeableConcept', 'one'),
+    ('Reference', 'identifier', 'MedicationRequest', 'detectedIssue', 'many'),
+    ('Identifier', 'object_id', 'MedicationRequest', 'identifier', 'many'),
+    ('Reference', 'identifier', 'MedicationRequest', 'context', 'one'),
+    ('Reference', 'identifier', 'MedicationRequest', 'eventHistory', 'many'),
+    ('MedicationRequest_DispenseRequest', 'object_id', 'MedicationRequest',
+     'dispenseRequest', 'one'),
+    ('Quantity', 'object_id', 'MedicationRequest_DispenseRequest', 'quantity', 'one'),
+    ('Duration', 'object_id', 'MedicationRequest_DispenseRequest',
+     'expectedSupplyDuration', 'one'),
+    ('Period', 'object_id', 'MedicationRequest_DispenseRequest', 'validityPeriod', 'one'),
+    ('Reference', 'identifier', 'MedicationRequest_DispenseRequest', 'performer', 'one'),
+    ('Reference', 'identifier', 'MedicationRequest_Requester', 'onBehalfOf', 'one'),
+    ('Reference', 'identifier', 'MedicationRequest_Requester', 'agent', 'one'),
+    ('CodeableConcept', 'object_id', 'MedicationRequest_Substitution', 'reason', 'one'),
+    ('Reference', 'identifier', 'MedicationStatement', 'basedOn', 'many'),
+    ('Reference', 'identifier', 'MedicationStatement', 'derivedFrom', 'many'),
+    ('Identifier', 'object_id', 'MedicationStatement', 'identifier', 'many'),
+    ('CodeableConcept', 'object_id', 'MedicationStatement', 'reasonCode', 'many'),
+    ('Reference', 'identifier', 'MedicationStatement', 'medicationReference', 'one'),
+    ('CodeableConcept', 'object_id', 'MedicationStatement', 'category', 'one'),
+    ('Reference', 'identifier', 'MedicationStatement', 'reasonReference', 'many'),
+    ('Reference', 'identifier', 'MedicationStatement', 'context', 'one'),
+    ('Period', 'object_id', 'MedicationStatement', 'effectivePeriod', 'one'),
+    ('Dosage', 'object_id', 'MedicationStatement', 'dosage', 'many'),
+    ('CodeableConcept', 'object_id', 'MedicationStatement', 'reasonNotTaken', 'many'),
+    ('CodeableConcept', 'object_id', 'MedicationStatement', 'medicationCodeableConcept', 'one'),
+    ('Reference', 'identifier', 'MedicationStatement', 'informationSource', 'one'),
+    ('Reference', 'identifier', 'MedicationStatement', 'subject', 'one'),
+    ('Annotation', 'object_id', 'MedicationStatement', 'note', 'many'),
+    ('Reference', 'identifier', 'MedicationStatement', 'partOf', 'many'),
+    ('Coding', 'object_id', 'MessageDefinition', 'event', 'one'),
+    ('Reference', 'identifier', 'MessageDefinition', 'base', 'one'),
+    ('MessageDefinition_AllowedResponse', 'object_id', 'MessageDefinition',
+     'allowedResponse', 'many'),
+    ('Reference', 'identifier', 'MessageDefinition', 'replaces', 'many'),
+    ('CodeableConcept', 'object_id', 'MessageDefinition', 'jurisdiction', 'many'),
+    ('ContactDetail', 'object_id', 'MessageDefinition', 'contact', 'many'),
+    ('UsageContext', 'object_id', 'MessageDefinition', 'useContext', 'many'),
+    ('Reference', 'identifier', 'MessageDefinition', 'parent', 'many'),
+    ('Identifier', 'object_id', 'MessageDefinition', 'identifier', 'one'),
+    ('MessageDefinition_Focus', 'object_id', 'MessageDefinition', 'focus', 'many'),
+    ('Reference', 'identifier', 'MessageDefinition_AllowedResponse', 'message', 'one'),
+    ('Reference', 'identifier', 'MessageDefinition_Focus', 'profile', 'one'),
+    ('Reference', 'identifier', 'MessageHeader', 'receiver', 'one'),
+    ('Coding', 'object_id', 'MessageHeader', 'event', 'one'),
+    ('Reference', 'identifier', 'MessageHeader', 'enterer', 'one'),
+    ('Reference', 'identifier', 'MessageHeader', 'responsible', 'one'),
+    ('MessageHeader_Response', 'identifier', 'MessageHeader', 'response', 'one'),
+    ('CodeableConcept', 'object_id', 'MessageHeader', 'reason', 'one'),
+    ('MessageHeader_Destination', 'object_id', 'MessageHeader', 'destination', 'many'),
+    ('Reference', 'identifier', 'MessageHeader', 'focus', 'many'),
+    ('Reference', 'identifier', 'MessageHeader', 'sender', 'one'),
+    ('MessageHeader_Source', 'object_id', 'MessageHeader', 'source', 'one'),
+    ('Reference', 'identifier', 'MessageHeader', 'author', 'one'),
+    ('Reference', 'identifier', 'MessageHeader_Destination', 'target', 'one'),
+    ('Reference', 'identifier', 'MessageHeader_Response', 'details', 'one'),
+    ('ContactPoint', 'object_id', 'MessageHeader_Source', 'contact', 'one'),
+    ('Coding', 'object_id', 'Meta', 'tag', 'many'),
+    ('Coding', 'object_id', 'Meta', 'security', 'many'),
+    ('Reference', 'identifier', 'NamingSystem', 'replacedBy', 'one'),
+    ('ContactDetail', 'object_id', 'NamingSystem', 'contact', 'many'),
+    ('CodeableConcept', 'object_id', 'NamingSystem', 'jurisdiction', 'many'),
+    ('NamingSystem_UniqueId', 'object_id', 'NamingSystem', 'uniqueId', 'many'),
+    ('CodeableConcept', 'object_id', 'NamingSystem', 'type', 'one'),
+    ('UsageContext', 'object_id', 'NamingSystem', 'useContext', 'many'),
+    ('Period', 'object_id', 'NamingSystem_UniqueId', 'period', 'one'),
+    ('Reference', 'identifier', 'NutritionOrder', 'encounter', 'one'),
+    ('CodeableConcept', 'object_id', 'NutritionOrder', 'excludeFoodModifier', 'many'),
+    ('NutritionOrder_EnteralFormula', 'object_id', 'NutritionOrder', 'enteralFormula', 'one'),
+    ('CodeableConcept', 'object_id', 'NutritionOrder', 'foodPreferenceModifier', 'many'),
+    ('Identifier', 'object_id', 'NutritionOrder', 'identifier', 'many'),
+    ('Reference', 'identifier', 'NutritionOrder', 'patient', 'one'),
+    ('Reference', 'identifier', 'NutritionOrder', 'orderer', 'one'),
+    ('NutritionOrder_OralDiet', 'object_id', 'NutritionOrder', 'oralDiet', 'one'),
+    ('Reference', 'identifier', 'NutritionOrder', 'allergyIntolerance', 'many'),
+    ('NutritionOrder_Supplement', 'object_id', 'NutritionOrder', 'supplement', 'many'),
+    ('Quantity', 'object_id', 'NutritionOrder_Administration', 'quantity', 'one'),
+    ('Quantity', 'object_id', 'NutritionOrder_Administration', 'rateSimpleQuantity', 'one'),
+    ('Timing', 'object_id', 'NutritionOrder_Administration', 'schedule', 'one'),
+    ('Ratio', 'object_id', 'NutritionOrder_Administration', 'rateRatio', 'one'),
+    ('CodeableConcept', 'object_id', 'NutritionOrder_EnteralFormula', 'baseFormulaType', 'one'),
+    ('NutritionOrder_Administration', 'object_id', 'NutritionOrder_EnteralFormula',
+     'administration', 'many'),
+    ('CodeableConcept', 'object_id', 'NutritionOrder_EnteralFormula', 'additiveType', 'one'),
+    ('Quantity', 'object_id', 'NutritionOrder_EnteralFormula', 'maxVolumeToDeliver', 'one'),
+    ('Quantity', 'object_id', 'NutritionOrder_EnteralFormula', 'caloricDensity', 'one'),
+    ('CodeableConcept', 'object_id', 'NutritionOrder_EnteralFormula',
+     'routeofAdministration', 'one'),
+    ('Quantity', 'object_id', 'NutritionOrder_Nutrient', 'amount', 'one'),
+    ('CodeableConcept', 'object_id', 'NutritionOrder_Nutrient', 'modifier', 'one'),
+    ('CodeableConcept', 'object_id', 'NutritionOrder_OralDiet', 'type', 'many'),
+    ('NutritionOrder_Nutrient', 'object_id', 'NutritionOrder_OralDiet', 'nutrient', 'many'),
+    ('NutritionOrder_Texture', 'object_id', 'NutritionOrder_OralDiet', 'texture', 'many'),
+    ('CodeableConcept', 'object_id', 'NutritionOrder_OralDiet', 'fluidConsistencyType', 'many'),
+    ('Timing', 'object_id', 'NutritionOrder_OralDiet', 'schedule', 'many'),
+    ('Quantity', 'object_id', 'NutritionOrder_Supplement', 'quantity', 'one'),
+    ('CodeableConcept', 'object_id', 'NutritionOrder_Supplement', 'type', 'one'),
+    ('Timing', 'object_id', 'NutritionOrder_Supplement', 'schedule', 'many'),
+    ('CodeableConcept', 'object_id', 'NutritionOrder_Texture', 'foodType', 'one'),
+    ('CodeableConcept', 'object_id', 'NutritionOrder_Texture', 'modifier', 'one'),
+    ('Reference', 'identifier', 'Observation', 'context', 'one'),
+    ('Quantity', 'object_id', 'Observation', 'valueQuantity', 'one'),
+    ('CodeableConcept', 'object_id', 'Observation', 'category', 'many'),
+    ('CodeableConcept', 'object_id', 'Observation', 'valueCodeableConcept', 'one'),
+    ('Ratio', 'object_id', 'Observation', 'valueRatio', 'one'),
+    ('Reference', 'identifier', 'Observation', 'device', 'one'),
+    ('Period', 'object_id', 'Observation', 'valuePeriod', 'one'),
+    ('Period', 'object_id', 'Observation', 'effectivePeriod', 'one'),
+    ('Range', 'object_id', 'Observation', 'valueRange', 'one'),
+    ('Identifier', 'object_id', 'Observation', 'identifier', 'many'),
+    ('Reference', 'identifier', 'Observation', 'specimen', 'one'),
+    ('Reference', 'identifier', 'Observation', 'performer', 'many'),
+    ('CodeableConcept', 'object_id', 'Observation', 'method', 'one'),
+    ('CodeableConcept', 'object_id', 'Observation', 'interpretation', 'one'),
+    ('CodeableConcept', 'object_id', 'Observation', 'code', 'one'),
+    ('Reference', 'identifier', 'Observation', 'basedOn', 'many'),
+    ('SampledData', 'object_id', 'Observation', 'valueSampledData', 'one'),
+    ('CodeableConcept', 'object_id', 'Observation', 'bodySite', 'one'),
+    ('Observation_Related', 'object_id', 'Observation', 'related', 'many'),
+    ('CodeableConcept', 'object_id', 'Observation', 'dataAbsentReason', 'one'),
+    ('Attachment', 'object_id', 'Observation', 'valueAttachment', 'one'),
+    ('Observation_Component', 'object_id', 'Observation', 'component', 'many'),
+    ('Reference', 'identifier', 'Observation', 'subject', 'one'),
+    ('Observation_ReferenceRange', 'object_id', 'Observation', 'referenceRange', 'many'),
+    ('Period', 'object_id', 'Observation_Component', 'valuePeriod', 'one'),
+    ('Quantity', 'object_id', 'Observation_Component', 'valueQuantity', 'one'),
+    ('CodeableConcept', 'object_id', 'Observation_Component', 'dataAbsentReason', 'one'),
+    ('Ratio', 'object_id', 'Observation_Component', 'valueRatio', 'one'),
+    ('Attachment', 'object_id', 'Observation_Component', 'valueAttachment', 'one'),
+    ('CodeableConcept', 'object_id', 'Observation_Component', 'interpretation', 'one'),
+    ('Observation_ReferenceRange', 'object_id', 'Observation_Component', 'referenceRange', 'many'),
+    ('Range', 'object_id', 'Observation_Component', 'valueRange', 'one'),
+    ('CodeableConcept', 'object_id', 'Observation_Component', 'valueCodeableConcept', 'one'),
+    ('CodeableConcept', 'object_id', 'Observation_Component', 'code', 'one'),
+    ('SampledData', 'object_id', 'Observation_Component', 'valueSampledData', 'one'),
+    ('Quantity', 'object_id', 'Observation_ReferenceRange', 'low', 'one'),
+    ('CodeableConcept', 'object_id', 'Observation_ReferenceRange', 'appliesTo', 'many'),
+    ('Quantity', 'object_id', 'Observation_ReferenceRange', 'high', 'one'),
+    ('CodeableConcept', 'object_id', 'Observation_ReferenceRange', 'type', 'one'),
+    ('Range', 'object_id', 'Observation_ReferenceRange', 'age', 'one'),
+    ('Reference', 'identifier', 'Observation_Related', 'target', 'one'),
+    ('ContactDetail', 'object_id', 'OperationDefinition', 'contact', 'many'),
+    ('OperationDefinition_Overload', 'object_id', 'OperationDefinition', 'overload', 'many'),
+    ('Reference', 'identifier', 'OperationDefinition', 'base', 'one'),
+    ('OperationDefinition_Parameter', 'object_id', 'OperationDefinition', 'parameter', 'many'),
+    ('CodeableConcept', 'object_id', 'OperationDefinition', 'jurisdiction', 'many'),
+    ('UsageContext', 'object_id', 'OperationDefinition', 'useContext', 'many'),
+    ('Reference', 'identifier', 'OperationDefinition_Binding', 'valueSetReference', 'one'),
+    ('OperationDefinition_Parameter', 'object_id', 'OperationDefinition_Parameter',
+     'part', 'many'),
+    ('Reference', 'identifier', 'OperationDefinition_Parameter', 'profile', 'one'),
+    ('OperationDefinition_Binding', 'object_id', 'OperationDefinition_Parameter',
+     'binding', 'one'),
+    ('OperationOutcome_Issue', 'object_id', 'OperationOutcome', 'issue', 'many'),
+    ('CodeableConcept', 'object_id', 'OperationOutcome_Issue', 'details', 'one'),
+    ('Organization_Contact', 'object_id', 'Organization', 'contact', 'many'),
+    ('ContactPoint', 'object_id', 'Organization', 'telecom', 'many'),
+    ('Identifier', 'object_id', 'Organization', 'identifier', 'many'),
+    ('Reference', 'identifier', 'Organization', 'partOf', 'one'),
+    ('CodeableConcept', 'object_id', 'Organization', 'type', 'many'),
+    ('Reference', 'identifier', 'Organization', 'endpoint', 'many'),
+    ('Address', 'object_id', 'Organization', 'address', 'many'),
+    ('CodeableConcept', 'object_id', 'Organization_Contact', 'purpose', 'one'),
+    ('Address', 'object_id', 'Organization_Contact', 'address', 'one'),
+    ('HumanName', 'object_id', 'Organization_Contact', 'name', 'one'),
+    ('ContactPoint', 'object_id', 'Organization_Contact', 'telecom', 'many'),
+    ('Reference', 'identifier', 'ParameterDefinition', 'profile', 'one'),
+    ('Parameters_Parameter', 'object_id', 'Parameters', 'parameter', 'many'),
+    ('Extension', 'object_id', 'Parameters_Parameter', 'valueExtension', 'one'),
+    ('Reference', 'identifier', 'Parameters_Parameter', 'valueReference', 'one'),
+    ('ResourceList', 'object_id', 'Parameters_Parameter', 'resource', 'one'),
+    ('Ratio', 'object_id', 'Parameters_Parameter', 'valueRatio', 'one'),
+    ('BackboneElement', 'object_id', 'Parameters_Parameter', 'valueBackboneElement', 'one'),
+    ('Contributor', 'object_id', 'Parameters_Parameter', 'valueContributor', 'one'),
+    ('ContactPoint', 'object_id', 'Parameters_Parameter', 'valueContactPoint', 'one'),
+    ('CodeableConcept', 'object_id', 'Parameters_Parameter', 'valueCodeableConcept', 'one'),
+    ('Narrative', 'object_id', 'Parameters_Parameter', 'valueNarrative', 'one'),
+    ('Identifier', 'object_id', 'Parameters_Parameter', 'valueIdentifier', 'one'),
+    ('Attachment', 'object_id', 'Parameters_Parameter', 'valueAttachment', 'one'),
+    ('Parameters_Parameter', 'object_id', 'Parameters_Parameter', 'part', 'many'),
+    ('Annotation', 'object_id', 'Parameters_Parameter', 'valueAnnotation', 'one'),
+    ('Timing', 'object_id', 'Parameters_Parameter', 'valueTiming', 'one'),
+    ('TriggerDefinition', 'object_id', 'Parameters_Parameter', 'valueTriggerDefinition', 'one'),
+    ('Age', 'object_id', 'Parameters_Parameter', 'valueAge', 'one'),
+    ('ContactDetail', 'object_id', 'Parameters_Parameter', 'valueContactDetail', 'one'),
+    ('Address', 'object_id', 'Parameters_Parameter', 'valueAddress', 'one'),
+    ('Range', 'object_id', 'Parameters_Parameter', 'valueRange', 'one'),
+    ('ParameterDefinition', 'object_id', 'Parameters_Parameter',
+     'valueParameterDefinition', 'one'),
+    ('DataRequirement', 'object_id', 'Parameters_Parameter', 'valueDataRequirement', 'one'),
+    ('Quantity', 'object_id', 'Parameters_Parameter', 'valueSimpleQuantity', 'one'),
+    ('RelatedArtifact', 'object_id', 'Parameters_Parameter', 'valueRelatedArtifact', 'one'),
+    ('Signature', 'object_id', 'Parameters_Parameter', 'valueSignature', 'one'),
+    ('Quantity', 'object_id', 'Parameters_Parameter', 'valueQuantity', 'one'),
+    ('Meta', 'object_id', 'Parameters_Parameter', 'valueMeta', 'one'),
+    ('Money', 'object_id', 'Parameters_Parameter', 'valueMoney', 'one'),
+    ('Period', 'object_id', 'Parameters_Parameter', 'valuePeriod', 'one'),
+    ('Duration', 'object_id', 'Parameters_Parameter', 'valueDuration', 'one'),
+    ('UsageContext', 'object_id', 'Parameters_Parameter', 'valueUsageContext', 'one'),
+    ('ElementDefinition', 'object_id', 'Parameters_Parameter', 'valueElementDefinition', 'one'),
+    ('Dosage', 'object_id', 'Parameters_Parameter', 'valueDosage', 'one'),
+    ('Distance', 'object_id', 'Parameters_Parameter', 'valueDistance', 'one'),
+    ('Count', 'object_id', 'Parameters_Parameter', 'valueCount', 'one'),
+    ('HumanName', 'object_id', 'Parameters_Parameter', 'valueHumanName', 'one'),
+    ('Element', 'id', 'Parameters_Parameter', 'valueElement', 'one'),
+    ('SampledData', 'object_id', 'Parameters_Parameter', 'valueSampledData', 'one'),
+    ('Coding', 'object_id', 'Parameters_Parameter', 'valueCoding', 'one'),
+    ('Address', 'object_id', 'Patient', 'address', 'many'),
+    ('Patient_Animal', 'object_id', 'Patient', 'animal', 'one'),
+    ('Reference', 'identifier', 'Patient', 'generalPractitioner', 'many'),
+    ('Patient_Link', 'object_id', 'Patient', 'link', 'many'),
+    ('Reference', 'identifier', 'Patient', 'managingOrganization', 'one'),
+    ('CodeableConcept', 'object_id', 'Patient', 'maritalStatus', 'one'),
+    ('ContactPoint', 'object_id', 'Patient', 'telecom', 'many'),
+    ('Identifier', 'object_id', 'Patient', 'identifier', 'many'),
+    ('Attachment', 'object_id', 'Patient', 'photo', 'many'),
+    ('Patient_Communication', 'object_id', 'Patient', 'communication', 'many'),
+    ('HumanName', 'object_id', 'Patient', 'name', 'many'),
+    ('Patient_Contact', 'object_id', 'Patient', 'contact', 'many'),
+    ('CodeableConcept', 'object_id', 'Patient_Animal', 'breed', 'one'),
+    ('CodeableConcept', 'object_id', 'Patient_Animal', 'species', 'one'),
+    ('CodeableConcept', 'object_id', 'Patient_Animal', 'genderStatus', 'one'),
+    ('CodeableConcept', 'object_id', 'Patient_Communication', 'language', 'one'),
+    ('HumanName', 'object_id', 'Patient_Contact', 'name', 'one'),
+    ('Period', 'object_id', 'Patient_Contact', 'period', 'one'),
+    ('Reference', 'identifier', 'Patient_Contact', 'organization', 'one'),
+    ('Address', 'object_id', 'Patient_Contact', 'address', 'one'),
+    ('CodeableConcept', 'object_id', 'Patient_Contact', 'relationship', 'many'),
+    ('ContactPoint', 'object_id', 'Patient_Contact', 'telecom', 'many'),
+    ('Reference', 'identifier', 'Patient_Link', 'other', 'one'),
+    ('CodeableConcept', 'object_id', 'PaymentNotice', 'paymentStatus', 'one'),
+    ('Reference', 'identifier', 'PaymentNotice', 'request', 'one'),
+    ('Reference', 'identifier', 'PaymentNotice', 'target', 'one'),
+    ('Reference', 'identifier', 'PaymentNotice', 'provider', 'one'),
+    ('Identifier', 'object_id', 'PaymentNotice', 'identifier', 'many'),
+    ('Reference', 'identifier', 'PaymentNotice', 'response', 'one'),
+    ('Reference', 'identifier', 'PaymentNotice', 'organization', 'one'),
+    ('Money', 'object_id', 'PaymentReconciliation', 'total', 'one'),
+    ('CodeableConcept', 'object_id', 'PaymentReconciliation', 'outcome', 'one'),
+    ('Identifier', 'object_id', 'PaymentReconciliation', 'identifier', 'many'),
+    ('Period', 'object_id', 'PaymentReconciliation', 'period', 'one'),
+    ('Reference', 'identifier', 'PaymentReconciliation', 'requestOrganization', 'one'),
+    ('Reference', 'identifier', 'PaymentReconciliation', 'request', 'one'),
+    ('PaymentReconciliation_Detail', 'object_id', 'PaymentReconciliation', 'detail', 'many'),
+    ('CodeableConcept', 'object_id', 'PaymentReconciliation', 'form', 'one'),
+    ('PaymentReconciliation_ProcessNote', 'object_id', 'PaymentReconciliation',
+     'processNote', 'many'),
+    ('Reference', 'identifier', 'PaymentReconciliation', 'organization', 'one'),
+    ('Reference', 'identifier', 'PaymentReconciliation', 'requestProvider', 'one'),
+    ('Reference', 'identifier', 'PaymentReconciliation_Detail', 'request', 'one'),
+    ('CodeableConcept', 'object_id', 'PaymentReconciliation_Detail', 'type', 'one'),
+    ('Reference', 'identifier', 'PaymentReconciliation_Detail', 'payee', 'one'),
+    ('Money', 'object_id', 'PaymentReconciliation_Detail', 'amount', 'one'),
+    ('Reference', 'identifier', 'PaymentReconciliation_Detail', 'response', 'one'),
+    ('Reference', 'identifier', 'PaymentReconciliation_Detail', 'submitter', 'one'),
+    ('CodeableConcept', 'object_id', 'PaymentReconciliation_ProcessNote', 'type', 'one'),
+    ('HumanName', 'object_id', 'Person', 'name', 'many'),
+    ('Person_Link', 'object_id', 'Person', 'link', 'many'),
+    ('ContactPoint', 'object_id', 'Person', 'telecom', 'many'),
+    ('Reference', 'identifier', 'Person', 'managingOrganization', 'one'),
+    ('Identifier', 'object_id', 'Person', 'identifier', 'many'),
+    ('Address', 'object_id', 'Person', 'address', 'many'),
+    ('Attachment', 'object_id', 'Person', 'photo', 'one'),
+    ('Reference', 'identifier', 'Person_Link', 'target', 'one'),
+    ('Identifier', 'object_id', 'PlanDefinition', 'identifier', 'many'),
+    ('PlanDefinition_Action', 'object_id', 'PlanDefinition', 'action', 'many'),
+    ('CodeableConcept', 'object_id', 'PlanDefinition', 'jurisdiction', 'many'),
+    ('CodeableConcept', 'object_id', 'PlanDefinition', 'type', 'one'),
+    ('UsageContext', 'object_id', 'PlanDefinition', 'useContext', 'many'),
+    ('Period', 'object_id', 'PlanDefinition', 'effectivePeriod', 'one'),
+    ('CodeableConcept', 'object_id', 'PlanDefinition', 'topic', 'many'),
+    ('RelatedArtifact', 'object_id', 'PlanDefinition', 'relatedArtifact', 'many'),
+    ('ContactDetail', 'object_id', 'PlanDefinition', 'contact', 'many'),
+    ('Contributor', 'object_id', 'PlanDefinition', 'contributor', 'many'),
+    ('PlanDefinition_Goal', 'object_id', 'PlanDefinition', 'goal', 'many'),
+    ('Reference', 'identifier', 'PlanDefinition', 'library', 'many'),
+    ('PlanDefinition_RelatedAction', 'object_id', 'PlanDefinition_Action',
+     'relatedAction', 'many'),
+    ('Range', 'object_id', 'PlanDefinition_Action', 'timingRange', 'one'),
+    ('RelatedArtifact', 'object_id', 'PlanDefinition_Action', 'documentation', 'many'),
+    ('Timing', 'object_id', 'PlanDefinition_Action', 'timingTiming', 'one'),
+    ('PlanDefinition_Participant', 'object_id', 'PlanDefinition_Action', 'participant', 'many'),
+    ('PlanDefinition_Action', 'object_id', 'PlanDefinition_Action', 'action', 'many'),
+    ('CodeableConcept', 'object_id', 'PlanDefinition_Action', 'code', 'many'),
+    ('Reference', 'identifier', 'PlanDefinition_Action', 'definition', 'one'),
+    ('DataRequirement', 'object_id', 'PlanDefinition_Action', 'input', 'many'),
+    ('PlanDefinition_DynamicValue', 'object_id', 'PlanDefinition_Action', 'dynamicValue', 'many'),
+    ('Duration', 'object_id', 'PlanDefinition_Action', 'timingDuration', 'one'),
+    ('Period', 'object_id', 'PlanDefinition_Action', 'timingPeriod', 'one'),
+    ('TriggerDefinition', 'object_id', 'PlanDefinition_Action', 'triggerDefinition', 'many'),
+    ('DataRequirement', 'object_id', 'PlanDefinition_Action', 'output', 'many'),
+    ('Reference', 'identifier', 'PlanDefinition_Action', 'transform', 'one'),
+    ('Coding', 'object_id', 'PlanDefinition_Action', 'type', 'one'),
+    ('CodeableConcept', 'object_id', 'PlanDefinition_Action', 'reason', 'many'),
+    ('PlanDefinition_Condition', 'object_id', 'PlanDefinition_Action', 'condition', 'many'),
+    ('CodeableConcept', 'object_id', 'PlanDefinition_Goal', 'priority', 'one'),
+    ('CodeableConcept', 'object_id', 'PlanDefinition_Goal', 'start', 'one'),
+    ('CodeableConcept', 'object_id', 'PlanDefinition_Goal', 'description', 'one'),
+    ('RelatedArtifact', 'object_id', 'PlanDefinition_Goal', 'documentation', 'many'),
+    ('PlanDefinition_Target', 'object_id', 'PlanDefinition_Goal', 'target', 'many'),
+    ('CodeableConcept', 'object_id', 'PlanDefinition_Goal', 'category', 'one'),
+    ('CodeableConcept', 'object_id', 'PlanDefinition_Goal', 'addresses', 'many'),
+    ('CodeableConcept', 'object_id', 'PlanDefinition_Participant', 'role', 'one'),
+    ('Range', 'object_id', 'PlanDefinition_RelatedAction', 'offsetRange', 'one'),
+    ('Duration', 'object_id', 'PlanDefinition_RelatedAction', 'offsetDuration', 'one'),
+    ('Quantity', 'object_id', 'PlanDefinition_Target', 'detailQuantity', 'one'),
+    ('Range', 'object_id', 'PlanDefinition_Target', 'detailRange', 'one'),
+    ('CodeableConcept', 'object_id', 'PlanDefinition_Target', 'measure', 'one'),
+    ('CodeableConcept', 'object_id', 'PlanDefinition_Target', 'detailCodeableConcept', 'one'),
+    ('Duration', 'object_id', 'PlanDefinition_Target', 'due', 'one'),
+    ('Practitioner_Qualification', 'identifier', 'Practitioner', 'qualification', 'many'),
+    ('HumanName', 'object_id', 'Practitioner', 'name', 'many'),
+    ('CodeableConcept', 'object_id', 'Practitioner', 'communication', 'many'),
+    ('Address', 'object_id', 'Practitioner', 'address', 'many'),
+    ('Attachment', 'object_id', 'Practitioner', 'photo', 'many'),
+    ('Identifier', 'object_id', 'Practitioner', 'identifier', 'many'),
+    ('ContactPoint', 'object_id', 'Practitioner', 'telecom', 'many'),
+    ('Identifier', 'object_id', 'Practitioner_Qualification', 'identifier', 'many'),
+    ('Reference', 'identifier', 'Practitioner_Qualification', 'issuer', 'one'),
+    ('CodeableConcept', 'object_id', 'Practitioner_Qualification', 'code', 'one'),
+    ('Period', 'object_id', 'Practitioner_Qualification', 'period', 'one'),
+    ('Reference', 'identifier', 'PractitionerRole', 'healthcareService', 'many'),
+    ('Period', 'object_id', 'PractitionerRole', 'period', 'one'),
+    ('Reference', 'identifier', 'PractitionerRole', 'practitioner', 'one'),
+    ('Identifier', 'object_id', 'PractitionerRole', 'identifier', 'many'),
+    ('CodeableConcept', 'object_id', 'PractitionerRole', 'specialty', 'many'),
+    ('PractitionerRole_NotAvailable', 'object_id', 'PractitionerRole', 'notAvailable', 'many'),
+    ('CodeableConcept', 'object_id', 'PractitionerRole', 'code', 'many'),
+    ('Reference', 'identifier', 'PractitionerRole', 'endpoint', 'many'),
+    ('ContactPoint', 'object_id', 'PractitionerRole', 'telecom', 'many'),
+    ('PractitionerRole_AvailableTime', 'object_id', 'PractitionerRole', 'availableTime', 'many'),
+    ('Reference', 'identifier', 'PractitionerRole', 'organization', 'one'),
+    ('Reference', 'identifier', 'PractitionerRole', 'location', 'many'),
+    ('Period', 'object_id', 'PractitionerRole_NotAvailable', 'during', 'one'),
+    ('Reference', 'identifier', 'Procedure', 'partOf', 'many'),
+    ('Reference', 'identifier', 'Procedure', 'subject', 'one'),
+    ('Period', 'object_id', 'Procedure', 'performedPeriod', 'one'),
+    ('CodeableConcept', 'object_id', 'Procedure', 'usedCode', 'many'),
+    ('CodeableConcept', 'object_id', 'Procedure', 'followUp', 'many'),
+    ('Reference', 'identifier', 'Procedure', 'location', 'one'),
+    ('Reference', 'identifier', 'Procedure', 'reasonReference', 'many'),
+    ('Reference', 'identifier', 'Procedure', 'basedOn', 'many'),
+    ('Identifier', 'object_id', 'Procedure', 'identifier', 'many'),
+    ('Procedure_Performer', 'object_id', 'Procedure', 'performer', 'many'),
+    ('Procedure_FocalDevice', 'object_id', 'Procedure', 'focalDevice', 'many'),
+    ('CodeableConcept', 'object_id', 'Procedure', 'code', 'one'),
+    ('CodeableConcept', 'object_id', 'Procedure', 'complication', 'many'),
+    ('CodeableConcept', 'object_id', 'Procedure', 'category', 'one'),
+    ('Reference', 'identifier', 'Procedure', 'report', 'many'),
+    ('CodeableConcept', 'object_id', 'Procedure', 'reasonCode', 'many'),
+    ('CodeableConcept', 'object_id', 'Procedure', 'notDoneReason', 'one'),
+    ('Reference', 'identifier', 'Procedure', 'context', 'one'),
+    ('Annotation', 'object_id', 'Procedure', 'note', 'many'),
+    ('CodeableConcept', 'object_id', 'Procedure', 'outcome', 'one'),
+    ('CodeableConcept', 'object_id', 'Procedure', 'bodySite', 'many'),
+    ('Reference', 'identifier', 'Procedure', 'definition', 'many'),
+    ('Reference', 'identifier', 'Procedure', 'usedReference', 'many'),
+    ('Reference', 'identifier', 'Procedure', 'complicationDetail', 'many'),
+    ('Reference', 'identifier', 'Procedure_FocalDevice', 'manipulated', 'one'),
+    ('CodeableConcept', 'object_id', 'Procedure_FocalDevice', 'action', 'one'),
+    ('CodeableConcept', 'object_id', 'Procedure_Performer', 'role', 'one'),
+    ('Reference', 'identifier', 'Procedure_Performer', 'actor', 'one'),
+    ('Reference', 'identifier', 'Procedure_Performer', 'onBehalfOf', 'one'),
+    ('Reference', 'identifier', 'ProcedureRequest', 'replaces', 'many'),
+    ('Reference', 'identifier', 'ProcedureRequest', 'performer', 'one'),
+    ('CodeableConcept', 'object_id', 'ProcedureRequest', 'asNeededCodeableConcept', 'one'),
+    ('CodeableConcept', 'object_id', 'ProcedureRequest', 'performerType', 'one'),
+    ('Period', 'object_id', 'ProcedureRequest', 'occurrencePeriod', 'one'),
+    ('Reference', 'identifier', 'ProcedureRequest', 'basedOn', 'many'),
+    ('Timing', 'object_id', 'ProcedureRequest', 'occurrenceTiming', 'one'),
+    ('CodeableConcept', 'object_id', 'ProcedureRequest', 'bodySite', 'many'),
+    ('Reference', 'identifier', 'ProcedureRequest', 'specimen', 'many'),
+    ('Identifier', 'object_id', 'ProcedureRequest', 'identifier', 'many'),
+    ('Identifier', 'object_id', 'ProcedureRequest', 'requisition', 'one'),
+    ('Reference', 'identifier', 'ProcedureRequest', 'subject', 'one'),
+    ('Reference', 'identifier', 'ProcedureRequest', 'definition', 'many'),
+    ('Reference', 'identifier', 'ProcedureRequest', 'relevantHistory', 'many'),
+    ('CodeableConcept', 'object_id', 'ProcedureRequest', 'code', 'one'),
+    ('CodeableConcept', 'object_id', 'ProcedureRequest', 'reasonCode', 'many'),
+    ('Reference', 'identifier', 'ProcedureRequest', 'context', 'one'),
+    ('ProcedureRequest_Requester', 'object_id', 'ProcedureRequest', 'requester', 'one'),
+    ('CodeableConcept', 'object_id', 'ProcedureRequest', 'category', 'many'),
+    ('Reference', 'identifier', 'ProcedureRequest', 'supportingInfo', 'many'),
+    ('Reference', 'identifier', 'ProcedureRequest', 'reasonReference', 'many'),
+    ('Annotation', 'object_id', 'ProcedureRequest', 'note', 'many'),
+    ('Reference', 'identifier', 'ProcedureRequest_Requester', 'agent', 'one'),
+    ('Reference', 'identifier', 'ProcedureRequest_Requester', 'onBehalfOf', 'one'),
+    ('Identifier', 'object_id', 'ProcessRequest', 'identifier', 'many'),
+    ('Reference', 'identifier', 'ProcessRequest', 'request', 'one'),
+    ('Reference', 'identifier', 'ProcessRequest', 'provider', 'one'),
+    ('Reference', 'identifier', 'ProcessRequest', 'organization', 'one'),
+    ('Period', 'object_id', 'ProcessRequest', 'period', 'one'),
+    ('Reference', 'identifier', 'ProcessRequest', 'target', 'one'),
+    ('ProcessRequest_Item', 'object_id', 'ProcessRequest', 'item', 'many'),
+    ('Reference', 'identifier', 'ProcessRequest', 'response', 'one'),
+    ('CodeableConcept', 'object_id', 'ProcessResponse', 'error', 'many'),
+    ('CodeableConcept', 'object_id', 'ProcessResponse', 'outcome', 'one'),
+    ('Reference', 'identifier', 'ProcessResponse', 'communicationRequest', 'many'),
+    ('Reference', 'identifier', 'ProcessResponse', 'requestProvider', 'one'),
+    ('Identifier', 'object_id', 'ProcessResponse', 'identifier', 'many'),
+    ('ProcessResponse_ProcessNote', 'object_id', 'ProcessResponse', 'processNote', 'many'),
+    ('Reference', 'identifier', 'ProcessResponse', 'request', 'one'),
+    ('CodeableConcept', 'object_id', 'ProcessResponse', 'form', 'one'),
+    ('Reference', 'identifier', 'ProcessResponse', 'requestOrganization', 'one'),
+    ('Reference', 'identifier', 'ProcessResponse', 'organization', 'one'),
+    ('CodeableConcept', 'object_id', 'ProcessResponse_ProcessNote', 'type', 'one'),
+    ('Coding', 'object_id', 'Provenance', 'reason', 'many'),
+    ('Reference', 'identifier', 'Provenance', 'location', 'one'),
+    ('Provenance_Agent', 'object_id', 'Provenance', 'agent', 'many'),
+    ('Coding', 'object_id', 'Provenance', 'activity', 'one'),
+    ('Reference', 'identifier', 'Provenance', 'target', 'many'),
+    ('Period', 'object_id', 'Provenance', 'period', 'one'),
+    ('Signature', 'object_id', 'Provenance', 'signature', 'many'),
+    ('Provenance_Entity', 'object_id', 'Provenance', 'entity', 'many'),
+    ('Reference', 'identifier', 'Provenance_Agent', 'whoReference', 'one'),
+    ('CodeableConcept', 'object_id', 'Provenance_Agent', 'role', 'many'),
+    ('Reference', 'identifier', 'Provenance_Agent', 'onBehalfOfReference', 'one'),
+    ('CodeableConcept', 'object_id', 'Provenance_Agent', 'relatedAgentType', 'one'),
+    ('Provenance_Agent', 'object_id', 'Provenance_Entity', 'agent', 'many'),
+    ('Identifier', 'object_id', 'Provenance_Entity', 'whatIdentifier', 'one'),
+    ('Reference', 'identifier', 'Provenance_Entity', 'whatReference', 'one'),
+    ('UsageContext', 'object_id', 'Questionnaire', 'useContext', 'many'),
+    ('ContactDetail', 'object_id', 'Questionnaire', 'contact', 'many'),
+    ('Identifier', 'object_id', 'Questionnaire', 'identifier', 'many'),
+    ('Questionnaire_Item', 'object_id', 'Questionnaire', 'item', 'many'),
+    ('Period', 'object_id', 'Questionnaire', 'effectivePeriod', 'one'),
+    ('Coding', 'object_id', 'Questionnaire', 'code', 'many'),
+    ('CodeableConcept', 'object_id', 'Questionnaire', 'jurisdiction', 'many'),
+    ('Quantity', 'object_id', 'Questionnaire_EnableWhen', 'answerQuantity', 'one'),
+    ('Coding', 'object_id', 'Questionnaire_EnableWhen', 'answerCoding', 'one'),
+    ('Reference', 'identifier', 'Questionnaire_EnableWhen', 'answerReference', 'one'),
+    ('Attachment', 'object_id', 'Questionnaire_EnableWhen', 'answerAttachment', 'one'),
+    ('Coding', 'object_id', 'Questionnaire_Item', 'code', 'many'),
+    ('Reference', 'identifier', 'Questionnaire_Item', 'initialReference', 'one'),
+    ('Quantity', 'object_id', 'Questionnaire_Item', 'initialQuantity', 'one'),
+    ('Questionnaire_Item', 'object_id', 'Questionnaire_Item', 'item', 'many'),
+    ('Attachment', 'object_id', 'Questionnaire_Item', 'initialAttachment', 'one'),
+    ('Coding', 'object_id', 'Questionnaire_Item', 'initialCoding', 'one'),
+    ('Reference', 'identifier', 'Questionnaire_Item', 'options', 'one'),
+    ('Questionnaire_Option', 'object_id', 'Questionnaire_Item', 'option', 'many'),
+    ('Questionnaire_EnableWhen', 'object_id', 'Questionnaire_Item', 'enableWhen', 'many'),
+    ('Coding', 'object_id', 'Questionnaire_Option', 'valueCoding', 'one'),
+    ('Reference', 'identifier', 'QuestionnaireResponse', 'author', 'one'),
+    ('Reference', 'identifier', 'QuestionnaireResponse', 'questionnaire', 'one'),
+    ('Reference', 'identifier', 'QuestionnaireResponse', 'parent', 'many'),
+    ('Reference', 'identifier', 'QuestionnaireResponse', 'basedOn', 'many'),
+    ('Reference', 'identifier', 'QuestionnaireResponse', 'source', 'one'),
+    ('QuestionnaireResponse_Item', 'object_id', 'QuestionnaireResponse', 'item', 'many'),
+    ('Identifier', 'object_id', 'QuestionnaireResponse', 'identifier', 'one'),
+    ('Reference', 'identifier', 'QuestionnaireResponse', 'context', 'one'),
+    ('Reference', 'identifier', 'QuestionnaireResponse', 'subject', 'one'),
+    ('QuestionnaireResponse_Item', 'object_id', 'QuestionnaireResponse_Answer', 'item', 'many'),
+    ('Attachment', 'object_id', 'QuestionnaireResponse_Answer', 'valueAttachment', 'one'),
+    ('Coding', 'object_id', 'QuestionnaireResponse_Answer', 'valueCoding', 'one'),
+    ('Quantity', 'object_id', 'QuestionnaireResponse_Answer', 'valueQuantity', 'one'),
+    ('Reference', 'identifier', 'QuestionnaireResponse_Answer', 'valueReference', 'one'),
+    ('QuestionnaireResponse_Item', 'object_id', 'QuestionnaireResponse_Item', 'item', 'many'),
+    ('Reference', 'identifier', 'QuestionnaireResponse_Item', 'subject', 'one'),
+    ('QuestionnaireResponse_Answer', 'object_id', 'QuestionnaireResponse_Item', 'answer', 'many'),
+    ('Quantity', 'object_id', 'Range', 'low', 'one'),
+    ('Quantity', 'object_id', 'Range', 'high', 'one'),
+    ('Quantity', 'object_id', 'Ratio', 'denominator', 'one'),
+    ('Quantity', 'object_id', 'Ratio', 'numerator', 'one'),
+    ('Identifier', 'object_id', 'Reference', 'identifier', 'one'),
+    ('ReferralRequest_Requester', 'object_id', 'ReferralRequest', 'requester', 'one'),
+    ('Period', 'object_id', 'ReferralRequest', 'occurrencePeriod', 'one'),
+    ('Reference', 'identifier', 'ReferralRequest', 'recipient', 'many'),
+    ('CodeableConcept', 'object_id', 'ReferralRequest', 'type', 'one'),
+    ('CodeableConcept', 'object_id', 'ReferralRequest', 'serviceRequested', 'many'),
+    ('Reference', 'identifier', 'ReferralRequest', 'relevantHistory', 'many'),
+    ('Reference', 'identifier', 'ReferralRequest', 'reasonReference', 'many'),
+    ('Reference', 'identifier', 'ReferralRequest', 'subject', 'one'),
+    ('CodeableConcept', 'object_id', 'ReferralRequest', 'specialty', 'one'),
+    ('Identifier', 'object_id', 'ReferralRequest', 'groupIdentifier', 'one'),
+    ('Reference', 'identifier', 'ReferralRequest', 'basedOn', 'many'),
+    ('Identifier', 'object_id', 'ReferralRequest', 'identifier', 'many'),
+    ('Reference', 'identifier', 'ReferralRequest', 'supportingInfo', 'many'),
+    ('CodeableConcept', 'object_id', 'ReferralRequest', 'reasonCode', 'many'),
+    ('Reference', 'identifier', 'ReferralRequest', 'replaces', 'many'),
+    ('Annotation', 'object_id', 'ReferralRequest', 'note', 'many'),
+    ('Reference', 'identifier', 'ReferralRequest', 'context', 'one'),
+    ('Reference', 'identifier', 'ReferralRequest', 'definition', 'many'),
+    ('Reference', 'identifier', 'ReferralRequest_Requester', 'onBehalfOf', 'one'),
+    ('Reference', 'identifier', 'ReferralRequest_Requester', 'agent', 'one'),
+    ('Attachment', 'object_id', 'RelatedArtifact', 'document', 'one'),
+    ('Reference', 'identifier', 'RelatedArtifact', 'resource', 'one'),
+    ('Address', 'object_id', 'RelatedPerson', 'address', 'many'),
+    ('Attachment', 'object_id', 'RelatedPerson', 'photo', 'many'),
+    ('CodeableConcept', 'object_id', 'RelatedPerson', 'relationship', 'one'),
+    ('Identifier', 'object_id', 'RelatedPerson', 'identifier', 'many'),
+    ('Period', 'object_id', 'RelatedPerson', 'period', 'one'),
+    ('Reference', 'identifier', 'RelatedPerson', 'patient', 'one'),
+    ('HumanName', 'object_id', 'RelatedPerson', 'name', 'many'),
+    ('ContactPoint', 'object_id', 'RelatedPerson', 'telecom', 'many'),
+    ('Reference', 'identifier', 'RequestGroup', 'basedOn', 'many'),
+    ('RequestGroup_Action', 'object_id', 'RequestGroup', 'action', 'many'),
+    ('Annotation', 'object_id', 'RequestGroup', 'note', 'many'),
+    ('CodeableConcept', 'object_id', 'RequestGroup', 'reasonCodeableConcept', 'one'),
+    ('Reference', 'identifier', 'RequestGroup', 'reasonReference', 'one'),
+    ('Reference', 'identifier', 'RequestGroup', 'subject', 'one'),
+    ('Identifier', 'object_id', 'RequestGroup', 'groupIdentifier', 'one'),
+    ('Identifier', 'object_id', 'RequestGroup', 'identifier', 'many'),
+    ('Reference', 'identifier', 'RequestGroup', 'author', 'one'),
+    ('Reference', 'identifier', 'RequestGroup', 'context', 'one'),
+    ('Reference', 'identifier', 'RequestGroup', 'replaces', 'many'),
+    ('Reference', 'identifier', 'RequestGroup', 'definition', 'many'),
+    ('CodeableConcept', 'object_id', 'RequestGroup_Action', 'code', 'many'),
+    ('RequestGroup_Action', 'object_id', 'RequestGroup_Action', 'action', 'many'),
+    ('Timing', 'object_id', 'RequestGroup_Action', 'timingTiming', 'one'),
+    ('Duration', 'object_id', 'RequestGroup_Action', 'timingDuration', 'one'),
+    ('Range', 'object_id', 'RequestGroup_Action', 'timingRange', 'one'),
+    ('Reference', 'identifier', 'RequestGroup_Action', 'participant', 'many'),
+    ('Reference', 'identifier', 'RequestGroup_Action', 'resource', 'one'),
+    ('RelatedArtifact', 'object_id', 'RequestGroup_Action', 'documentation', 'many'),
+    ('RequestGroup_RelatedAction', 'object_id', 'RequestGroup_Action', 'relatedAction', 'many'),
+    ('Coding', 'object_id', 'RequestGroup_Action', 'type', 'one'),
+    ('Period', 'object_id', 'RequestGroup_Action', 'timingPeriod', 'one'),
+    ('RequestGroup_Condition', 'object_id', 'RequestGroup_Action', 'condition', 'many'),
+    ('Duration', 'object_id', 'RequestGroup_RelatedAction', 'offsetDuration', 'one'),
+    ('Range', 'object_id', 'RequestGroup_RelatedAction', 'offsetRange', 'one'),
+    ('CodeableConcept', 'object_id', 'ResearchStudy', 'reasonStopped', 'one'),
+    ('Reference', 'identifier', 'ResearchStudy', 'sponsor', 'one'),
+    ('Identifier', 'object_id', 'ResearchStudy', 'identifier', 'many'),
+    ('Reference', 'identifier', 'ResearchStudy', 'partOf', 'many'),
+    ('ContactDetail', 'object_id', 'ResearchStudy', 'contact', 'many'),
+    ('Reference', 'identifier', 'ResearchStudy', 'site', 'many'),
+    ('CodeableConcept', 'object_id', 'ResearchStudy', 'focus', 'many'),
+    ('Reference', 'identifier', 'ResearchStudy', 'protocol', 'many'),
+    ('Period', 'object_id', 'ResearchStudy', 'period', 'one'),
+    ('RelatedArtifact', 'object_id', 'ResearchStudy', 'relatedArtifact', 'many'),
+    ('Reference', 'identifier', 'ResearchStudy', 'principalInvestigator', 'one'),
+    ('CodeableConcept', 'object_id', 'ResearchStudy', 'jurisdiction', 'many'),
+    ('CodeableConcept', 'object_id', 'ResearchStudy', 'keyword', 'many'),
+    ('ResearchStudy_Arm', 'object_id', 'ResearchStudy', 'arm', 'many'),
+    ('CodeableConcept', 'object_id', 'ResearchStudy', 'category', 'many'),
+    ('Reference', 'identifier', 'ResearchStudy', 'enrollment', 'many'),
+    ('Annotation', 'object_id', 'ResearchStudy', 'note', 'many'),
+    ('CodeableConcept', 'object_id', 'ResearchStudy_Arm', 'code', 'one'),
+    ('Reference', 'identifier', 'ResearchSubject', 'individual', 'one'),
+    ('Reference', 'identifier', 'ResearchSubject', 'study', 'one'),
+    ('Period', 'object_id', 'ResearchSubject', 'period', 'one'),
+    ('Identifier', 'object_id', 'ResearchSubject', 'identifier', 'one'),
+    ('Reference', 'identifier', 'ResearchSubject', 'consent', 'one'),
+    ('Meta', 'object_id', 'Resource', 'meta', 'one'),
+    ('Reference', 'identifier', 'RiskAssessment', 'context', 'one'),
+    ('CodeableConcept', 'object_id', 'RiskAssessment', 'code', 'one'),
+    ('RiskAssessment_Prediction', 'object_id', 'RiskAssessment', 'prediction', 'many'),
+    ('Reference', 'identifier', 'RiskAssessment', 'condition', 'one'),
+    ('Reference', 'identifier', 'RiskAssessment', 'parent', 'one'),
+    ('Reference', 'identifier', 'RiskAssessment', 'performer', 'one'),
+    ('Reference', 'identifier', 'RiskAssessment', 'subject', 'one'),
+    ('Period', 'object_id', 'RiskAssessment', 'occurrencePeriod', 'one'),
+    ('Reference', 'identifier', 'RiskAssessment', 'reasonReference', 'one'),
+    ('Reference', 'identifier', 'RiskAssessment', 'basedOn', 'one'),
+    ('CodeableConcept', 'object_id', 'RiskAssessment', 'method', 'one'),
+    ('Reference', 'identifier', 'RiskAssessment', 'basis', 'many'),
+    ('CodeableConcept', 'object_id', 'RiskAssessment', 'reasonCodeableConcept', 'one'),
+    ('Identifier', 'object_id', 'RiskAssessment', 'identifier', 'one'),
+    ('Period', 'object_id', 'RiskAssessment_Prediction', 'whenPeriod', 'one'),
+    ('CodeableConcept', 'object_id', 'RiskAssessment_Prediction', 'qualitativeRisk', 'one'),
+    ('Range', 'object_id', 'RiskAssessment_Prediction', 'whenRange', 'one'),
+    ('CodeableConcept', 'object_id', 'RiskAssessment_Prediction', 'outcome', 'one'),
+    ('Range', 'object_id', 'RiskAssessment_Prediction', 'probabilityRange', 'one'),
+    ('Quantity', 'object_id', 'SampledData', 'origin', 'one'),
+    ('Identifier', 'object_id', 'Schedule', 'identifier', 'many'),
+    ('CodeableConcept', 'object_id', 'Schedule', 'serviceType', 'many'),
+    ('CodeableConcept', 'object_id', 'Schedule', 'specialty', 'many'),
+    ('CodeableConcept', 'object_id', 'Schedule', 'serviceCategory', 'one'),
+    ('Period', 'object_id', 'Schedule', 'planningHorizon', 'one'),
+    ('Reference', 'identifier', 'Schedule', 'actor', 'many'),
+    ('CodeableConcept', 'object_id', 'SearchParameter', 'jurisdiction', 'many'),
+    ('SearchParameter_Component', 'object_id', 'SearchParameter', 'component', 'many'),
+    ('ContactDetail', 'object_id', 'SearchParameter', 'contact', 'many'),
+    ('UsageContext', 'object_id', 'SearchParameter', 'useContext', 'many'),
+    ('Reference', 'identifier', 'SearchParameter_Component', 'definition', 'one'),
+    ('Reference', 'identifier', 'Sequence', 'patient', 'one'),
+    ('Reference', 'identifier', 'Sequence', 'pointer', 'many'),
+    ('Sequence_Quality', 'object_id', 'Sequence', 'quality', 'many'),
+    ('Sequence_Repository', 'object_id', 'Sequence', 'repository', 'many'),
+    ('Reference', 'identifier', 'Sequence', 'specimen', 'one'),
+    ('Sequence_ReferenceSeq', 'object_id', 'Sequence', 'referenceSeq', 'one'),
+    ('Reference', 'identifier', 'Sequence', 'performer', 'one'),
+    ('Identifier', 'object_id', 'Sequence', 'identifier', 'many'),
+    ('Sequence_Variant', 'object_id', 'Sequence', 'variant', 'many'),
+    ('Quantity', 'object_id', 'Sequence', 'quantity', 'one'),
+    ('Reference', 'identifier', 'Sequence', 'device', 'one'),
+    ('CodeableConcept', 'object_id', 'Sequence_Quality', 'method', 'one'),
+    ('Quantity', 'object_id', 'Sequence_Quality', 'score', 'one'),
+    ('CodeableConcept', 'object_id', 'Sequence_Quality', 'standardSequence', 'one'),
+    ('CodeableConcept', 'object_id', 'Sequence_ReferenceSeq', 'chromosome', 'one'),
+    ('CodeableConcept', 'object_id', 'Sequence_ReferenceSeq', 'referenceSeqId', 'one'),
+    ('Reference', 'identifier', 'Sequence_ReferenceSeq', 'referenceSeqPointer', 'one'),
+    ('Reference', 'identifier', 'Sequence_Variant', 'variantPointer', 'one'),
+    ('Period', 'object_id', 'ServiceDefinition', 'effectivePeriod', 'one'),
+    ('TriggerDefinition', 'object_id', 'ServiceDefinition', 'trigger', 'many'),
+    ('ContactDetail', 'object_id', 'ServiceDefinition', 'contact', 'many'),
+    ('Identifier', 'object_id', 'ServiceDefinition', 'identifier', 'many'),
+    ('RelatedArtifact', 'object_id', 'ServiceDefinition', 'relatedArtifact', 'many'),
+    ('CodeableConcept', 'object_id', 'ServiceDefinition', 'jurisdiction', 'many'),
+    ('CodeableConcept', 'object_id', 'ServiceDefinition', 'topic', 'many'),
+    ('UsageContext', 'object_id', 'ServiceDefinition', 'useContext', 'many'),
+    ('DataRequirement', 'object_id', 'ServiceDefinition', 'dataRequirement', 'many'),
+    ('Contributor', 'object_id', 'ServiceDefinition', 'contributor', 'many'),
+    ('Reference', 'identifier', 'ServiceDefinition', 'operationDefinition', 'one'),
+    ('Reference', 'identifier', 'Signature', 'whoReference', 'one'),
+    ('Coding', 'object_id', 'Signature', 'type', 'many'),
+    ('Reference', 'identifier', 'Signature', 'onBehalfOfReference', 'one'),
+    ('CodeableConcept', 'object_id', 'Slot', 'serviceCategory', 'one'),
+    ('Identifier', 'object_id', 'Slot', 'identifier', 'many'),
+    ('CodeableConcept', 'object_id', 'Slot', 'appointmentType', 'one'),
+    ('CodeableConcept', 'object_id', 'Slot', 'specialty', 'many'),
+    ('Reference', 'identifier', 'Slot', 'schedule', 'one'),
+    ('CodeableConcept', 'object_id', 'Slot', 'serviceType', 'many'),
+    ('Specimen_Container', 'identifier', 'Specimen', 'container', 'many'),
+    ('Identifier', 'object_id', 'Specimen', 'identifier', 'many'),
+    ('Reference', 'identifier', 'Specimen', 'parent', 'many'),
+    ('CodeableConcept', 'object_id', 'Specimen', 'type', 'one'),
+    ('Identifier', 'object_id', 'Specimen', 'accessionIdentifier', 'one'),
+    ('Annotation', 'object_id', 'Specimen', 'note', 'many'),
+    ('Specimen_Processing', 'object_id', 'Specimen', 'processing', 'many'),
+    ('Reference', 'identifier', 'Specimen', 'request', 'many'),
+    ('Reference', 'identifier', 'Specimen', 'subject', 'one'),
+    ('Specimen_Collection', 'object_id', 'Specimen', 'collection', 'one'),
+    ('Period', 'object_id', 'Specimen_Collection', 'collectedPeriod', 'one'),
+    ('Reference', 'identifier', 'Specimen_Collection', 'collector', 'one'),
+    ('CodeableConcept', 'object_id', 'Specimen_Collection', 'bodySite', 'one'),
+    ('Quantity', 'object_id', 'Specimen_Collection', 'quantity', 'one'),
+    ('CodeableConcept', 'object_id', 'Specimen_Collection', 'method', 'one'),
+    ('CodeableConcept', 'object_id', 'Specimen_Container', 'additiveCodeableConcept', 'one'),
+    ('Quantity', 'object_id', 'Specimen_Container', 'specimenQuantity', 'one'),
+    ('Quantity', 'object_id', 'Specimen_Container', 'capacity', 'one'),
+    ('CodeableConcept', 'object_id', 'Specimen_Container', 'type', 'one'),
+    ('Reference', 'identifier', 'Specimen_Container', 'additiveReference', 'one'),
+    ('Identifier', 'object_id', 'Specimen_Container', 'identifier', 'many'),
+    ('Reference', 'identifier', 'Specimen_Processing', 'additive', 'many'),
+    ('Period', 'object_id', 'Specimen_Processing', 'timePeriod', 'one'),
+    ('CodeableConcept', 'object_id', 'Specimen_Processing', 'procedure', 'one'),
+    ('Coding', 'object_id', 'StructureDefinition', 'keyword', 'many'),
+    ('CodeableConcept', 'object_id', 'StructureDefinition', 'jurisdiction', 'many'),
+    ('StructureDefinition_Differential', 'object_id', 'StructureDefinition',
+     'differential', 'one'),
+    ('ContactDetail', 'object_id', 'StructureDefinition', 'contact', 'many'),
+    ('Identifier', 'object_id', 'StructureDefinition', 'identifier', 'many'),
+    ('StructureDefinition_Mapping', 'object_id', 'StructureDefinition', 'mapping', 'many'),
+    ('UsageContext', 'object_id', 'StructureDefinition', 'useContext', 'many'),
+    ('StructureDefinition_Snapshot', 'object_id', 'StructureDefinition', 'snapshot', 'one'),
+    ('ElementDefinition', 'object_id', 'StructureDefinition_Differential', 'element', 'many'),
+    ('ElementDefinition', 'object_id', 'StructureDefinition_Snapshot', 'element', 'many'),
+    ('CodeableConcept', 'object_id', 'StructureMap', 'jurisdiction', 'many'),
+    ('UsageContext', 'object_id', 'StructureMap', 'useContext', 'many'),
+    ('ContactDetail', 'object_id', 'StructureMap', 'contact', 'many'),
+    ('StructureMap_Group', 'object_id', 'StructureMap', 'group', 'many'),
+    ('StructureMap_Structure', 'object_id', 'StructureMap', 'structure', 'many'),
+    ('Identifier', 'object_id', 'StructureMap', 'identifier', 'many'),
+    ('StructureMap_Input', 'object_id', 'StructureMap_Group', 'input', 'many'),
+    ('StructureMap_Rule', 'object_id', 'StructureMap_Group', 'rule', 'many'),
+    ('StructureMap_Source', 'object_id', 'StructureMap_Rule', 'source', 'many'),
+    ('StructureMap_Dependent', 'object_id', 'StructureMap_Rule', 'dependent', 'many'),
+    ('StructureMap_Target', 'object_id', 'StructureMap_Rule', 'target', 'many'),
+    ('StructureMap_Rule', 'object_id', 'StructureMap_Rule', 'rule', 'many'),
+    ('Money', 'object_id', 'StructureMap_Source', 'defaultValueMoney', 'one'),
+    ('Duration', 'object_id', 'StructureMap_Source', 'defaultValueDuration', 'one'),
+    ('ContactPoint', 'object_id', 'StructureMap_Source', 'defaultValueContactPoint', 'one'),
+    ('Identifier', 'object_id', 'StructureMap_Source', 'defaultValueIdentifier', 'one'),
+    ('Contributor', 'object_id', 'StructureMap_Source', 'defaultValueContributor', 'one'),
+    ('HumanName', 'object_id', 'StructureMap_Source', 'defaultValueHumanName', 'one'),
+    ('BackboneElement', 'object_id', 'StructureMap_Source', 'defaultValueBackboneElement', 'one'),
+    ('TriggerDefinition', 'object_id', 'StructureMap_Source',
+     'defaultValueTriggerDefinition', 'one'),
+    ('Timing', 'object_id', 'StructureMap_Source', 'defaultValueTiming', 'one'),
+    ('Dosage', 'object_id', 'StructureMap_Source', 'defaultValueDosage', 'one'),
+    ('SampledData', 'object_id', 'StructureMap_Source', 'defaultValueSampledData', 'one'),
+    ('Extension', 'object_id', 'StructureMap_Source', 'defaultValueExtension', 'one'),
+    ('Quantity', 'object_id', 'StructureMap_Source', 'defaultValueSimpleQuantity', 'one'),
+    ('Age', 'object_id', 'StructureMap_Source', 'defaultValueAge', 'one'),
+    ('Attachment', 'object_id', 'StructureMap_Source', 'defaultValueAttachment', 'one'),
+    ('Address', 'object_id', 'StructureMap_Source', 'defaultValueAddress', 'one'),
+    ('Ratio', 'object_id', 'StructureMap_Source', 'defaultValueRatio', 'one'),
+    ('Period', 'object_id', 'StructureMap_Source', 'defaultValuePeriod', 'one'),
+    ('Meta', 'object_id', 'StructureMap_Source', 'defaultValueMeta', 'one'),
+    ('Count', 'object_id', 'StructureMap_Source', 'defaultValueCount', 'one'),
+    ('RelatedArtifact', 'object_id', 'StructureMap_Source', 'defaultValueRelatedArtifact', 'one'),
+    ('UsageContext', 'object_id', 'StructureMap_Source', 'defaultValueUsageContext', 'one'),
+    ('ParameterDefinition', 'object_id', 'StructureMap_Source',
+     'defaultValueParameterDefinition', 'one'),
+    ('ElementDefinition', 'object_id', 'StructureMap_Source',
+     'defaultValueElementDefinition', 'one'),
+    ('Element', 'id', 'StructureMap_Source', 'defaultValueElement', 'one'),
+    ('CodeableConcept', 'object_id', 'StructureMap_Source', 'defaultValueCodeableConcept', 'one'),
+    ('ContactDetail', 'object_id', 'StructureMap_Source', 'defaultValueContactDetail', 'one'),
+    ('Annotation', 'object_id', 'StructureMap_Source', 'defaultValueAnnotation', 'one'),
+    ('Coding', 'object_id', 'StructureMap_Source', 'defaultValueCoding', 'one'),
+    ('Signature', 'object_id', 'StructureMap_Source', 'defaultValueSignature', 'one'),
+    ('Reference', 'identifier', 'StructureMap_Source', 'defaultValueReference', 'one'),
+    ('Distance', 'object_id', 'StructureMap_Source', 'defaultValueDistance', 'one'),
+    ('DataRequirement', 'object_id', 'StructureMap_Source', 'defaultValueDataRequirement', 'one'),
+    ('Range', 'object_id', 'StructureMap_Source', 'defaultValueRange', 'one'),
+    ('Narrative', 'object_id', 'StructureMap_Source', 'defaultValueNarrative', 'one'),
+    ('Quantity', 'object_id', 'StructureMap_Source', 'defaultValueQuantity', 'one'),
+    ('StructureMap_Parameter', 'object_id', 'StructureMap_Target', 'parameter', 'many'),
+    ('ContactPoint', 'object_id', 'Subscription', 'contact', 'many'),
+    ('Coding', 'object_id', 'Subscription', 'tag', 'many'),
+    ('Subscription_Channel', 'object_id', 'Subscription', 'channel', 'one'),
+    ('Substance_Instance', 'identifier', 'Substance', 'instance', 'many'),
+    ('CodeableConcept', 'object_id', 'Substance', 'code', 'one'),
+    ('CodeableConcept', 'object_id', 'Substance', 'category', 'many'),
+    ('Identifier', 'object_id', 'Substance', 'identifier', 'many'),
+    ('Substance_Ingredient', 'object_id', 'Substance', 'ingredient', 'many'),
+    ('Ratio', 'object_id', 'Substance_Ingredient', 'quantity', 'one'),
+    ('CodeableConcept', 'object_id', 'Substance_Ingredient', 'substanceCodeableConcept', 'one'),
+    ('Reference', 'identifier', 'Substance_Ingredient', 'substanceReference', 'one'),
+    ('Quantity', 'object_id', 'Substance_Instance', 'quantity', 'one'),
+    ('Identifier', 'object_id', 'Substance_Instance', 'identifier', 'one'),
+    ('Identifier', 'object_id', 'SupplyDelivery', 'identifier', 'one'),
+    ('Reference', 'identifier', 'SupplyDelivery', 'patient', 'one'),
+    ('Timing', 'object_id', 'SupplyDelivery', 'occurrenceTiming', 'one'),
+    ('Reference', 'identifier', 'SupplyDelivery', 'destination', 'one'),
+    ('Reference', 'identifier', 'SupplyDelivery', 'receiver', 'many'),
+    ('Reference', 'identifier', 'SupplyDelivery', 'partOf', 'many'),
+    ('CodeableConcept', 'object_id', 'SupplyDelivery', 'type', 'one'),
+    ('Period', 'object_id', 'SupplyDelivery', 'occurrencePeriod', 'one'),
+    ('Reference', 'identifier', 'SupplyDelivery', 'supplier', 'one'),
+    ('SupplyDelivery_SuppliedItem', 'object_id', 'SupplyDelivery', 'suppliedItem', 'one'),
+    ('Reference', 'identifier', 'SupplyDelivery', 'basedOn', 'many'),
+    ('Reference', 'identifier', 'SupplyDelivery_SuppliedItem', 'itemReference', 'one'),
+    ('Quantity', 'object_id', 'SupplyDelivery_SuppliedItem', 'quantity', 'one'),
+    ('CodeableConcept', 'object_id', 'SupplyDelivery_SuppliedItem', 'itemCodeableConcept', 'one'),
+    ('Period', 'object_id', 'SupplyRequest', 'occurrencePeriod', 'one'),
+    ('Timing', 'object_id', 'SupplyRequest', 'occurrenceTiming', 'one'),
+    ('CodeableConcept', 'object_id', 'SupplyRequest', 'reasonCodeableConcept', 'one'),
+    ('Reference', 'identifier', 'SupplyRequest', 'deliverFrom', 'one'),
+    ('CodeableConcept', 'object_id', 'SupplyRequest', 'category', 'one'),
+    ('Reference', 'identifier', 'SupplyRequest', 'deliverTo', 'one'),
+    ('SupplyRequest_Requester', 'object_id', 'SupplyRequest', 'requester', 'one'),
+    ('SupplyRequest_OrderedItem', 'object_id', 'SupplyRequest', 'orderedItem', 'one'),
+    ('Identifier', 'object_id', 'SupplyRequest', 'identifier', 'one'),
+    ('Reference', 'identifier', 'SupplyRequest', 'supplier', 'many'),
+    ('Reference', 'identifier', 'SupplyRequest', 'reasonReference', 'one'),
+    ('Quantity', 'object_id', 'SupplyRequest_OrderedItem', 'quantity', 'one'),
+    ('CodeableConcept', 'object_id', 'SupplyRequest_OrderedItem', 'itemCodeableConcept', 'one'),
+    ('Reference', 'identifier', 'SupplyRequest_OrderedItem', 'itemReference', 'one'),
+    ('Reference', 'identifier', 'SupplyRequest_Requester', 'agent', 'one'),
+    ('Reference', 'identifier', 'SupplyRequest_Requester', 'onBehalfOf', 'one'),
+    ('Reference', 'identifier', 'Task', 'context', 'one'),
+    ('Identifier', 'object_id', 'Task', 'identifier', 'many'),
+    ('CodeableConcept', 'object_id', 'Task', 'performerType', 'many'),
+    ('Task_Restriction', 'object_id', 'Task', 'restriction', 'one'),
+    ('Period', 'object_id', 'Task', 'executionPeriod', 'one'),
+    ('Reference', 'identifier', 'Task', 'basedOn', 'many'),
+    ('Reference', 'identifier', 'Task', 'focus', 'one'),
+    ('CodeableConcept', 'object_id', 'Task', 'reason', 'one'),
+    ('Annotation', 'object_id', 'Task', 'note', 'many'),
+    ('Task_Input', 'object_id', 'Task', 'input', 'many'),
+    ('Reference', 'identifier', 'Task', 'relevantHistory', 'many'),
+    ('Task_Requester', 'object_id', 'Task', 'requester', 'one'),
+    ('Reference', 'identifier', 'Task', 'definitionReference', 'one'),
+    ('CodeableConcept', 'object_id', 'Task', 'code', 'one'),
+    ('Reference', 'identifier', 'Task', 'owner', 'one'),
+    ('CodeableConcept', 'object_id', 'Task', 'statusReason', 'one'),
+    ('Identifier', 'object_id', 'Task', 'groupIdentifier', 'one'),
+    ('Reference', 'identifier', 'Task', 'partOf', 'many'),
+    ('Reference', 'identifier', 'Task', '_for', 'one'),
+    ('Task_Output', 'object_id', 'Task', 'output', 'many'),
+    ('CodeableConcept', 'object_id', 'Task', 'businessStatus', 'one'),
+    ('CodeableConcept', 'object_id', 'Task_Input', 'valueCodeableConcept', 'one'),
+    ('ContactDetail', 'object_id', 'Task_Input', 'valueContactDetail', 'one'),
+    ('Contributor', 'object_id', 'Task_Input', 'valueContributor', 'one'),
+    ('RelatedArtifact', 'object_id', 'Task_Input', 'valueRelatedArtifact', 'one'),
+    ('Identifier', 'object_id', 'Task_Input', 'valueIdentifier', 'one'),
+    ('Attachment', 'object_id', 'Task_Input', 'valueAttachment', 'one'),
+    ('Meta', 'object_id', 'Task_Input', 'valueMeta', 'one'),
+    ('Quantity', 'object_id', 'Task_Input', 'valueSimpleQuantity', 'one'),
+    ('Extension', 'object_id', 'Task_Input', 'valueExtension', 'one'),
+    ('Address', 'object_id', 'Task_Input', 'valueAddress', 'one'),
+    ('Period', 'object_id', 'Task_Input', 'valuePeriod', 'one'),
+    ('DataRequirement', 'object_id', 'Task_Input', 'valueDataRequirement', 'one'),
+    ('Quantity', 'object_id', 'Task_Input', 'valueQuantity', 'one'),
+    ('Reference', 'identifier', 'Task_Input', 'valueReference', 'one'),
+    ('TriggerDefinition', 'object_id', 'Task_Input', 'valueTriggerDefinition', 'one'),
+    ('Duration', 'object_id', 'Task_Input', 'valueDuration', 'one'),
+    ('ElementDefinition', 'object_id', 'Task_Input', 'valueElementDefinition', 'one'),
+    ('Money', 'object_id', 'Task_Input', 'valueMoney', 'one'),
+    ('Range', 'object_id', 'Task_Input', 'valueRange', 'one'),
+    ('Signature', 'object_id', 'Task_Input', 'valueSignature', 'one'),
+    ('UsageContext', 'object_id', 'Task_Input', 'valueUsageContext', 'one'),
+    ('Coding', 'object_id', 'Task_Input', 'valueCoding', 'one'),
+    ('Dosage', 'object_id', 'Task_Input', 'valueDosage', 'one'),
+    ('Narrative', 'object_id', 'Task_Input', 'valueNarrative', 'one'),
+    ('Element', 'id', 'Task_Input', 'valueElement', 'one'),
+    ('Annotation', 'object_id', 'Task_Input', 'valueAnnotation', 'one'),
+    ('CodeableConcept', 'object_id', 'Task_Input', 'type', 'one'),
+    ('Count', 'object_id', 'Task_Input', 'valueCount', 'one'),
+    ('Ratio', 'object_id', 'Task_Input', 'valueRatio', 'one'),
+    ('Distance', 'object_id', 'Task_Input', 'valueDistance', 'one'),
+    ('BackboneElement', 'object_id', 'Task_Input', 'valueBackboneElement', 'one'),
+    ('ContactPoint', 'object_id', 'Task_Input', 'valueContactPoint', 'one'),
+    ('Age', 'object_id', 'Task_Input', 'valueAge', 'one'),
+    ('Timing', 'object_id', 'Task_Input', 'valueTiming', 'one'),
+    ('ParameterDefinition', 'object_id', 'Task_Input', 'valueParameterDefinition', 'one'),
+    ('HumanName', 'object_id', 'Task_Input', 'valueHumanName', 'one'),
+    ('SampledData', 'object_id', 'Task_Input', 'valueSampledData', 'one'),
+    ('Signature', 'object_id', 'Task_Output', 'valueSignature', 'one'),
+    ('Reference', 'identifier', 'Task_Output', 'valueReference', 'one'),
+    ('BackboneElement', 'object_id', 'Task_Output', 'valueBackboneElement', 'one'),
+    ('RelatedArtifact', 'object_id', 'Task_Output', 'valueRelatedArtifact', 'one'),
+    ('Quantity', 'object_id', 'Task_Output', 'valueSimpleQuantity', 'one'),
+    ('ContactPoint', 'object_id', 'Task_Output', 'valueContactPoint', 'one'),
+    ('Extension', 'object_id', 'Task_Output', 'valueExtension', 'one'),
+    ('Age', 'object_id', 'Task_Output', 'valueAge', 'one'),
+    ('Meta', 'object_id', 'Task_Output', 'valueMeta', 'one'),
+    ('Dosage', 'object_id', 'Task_Output', 'valueDosage', 'one'),
+    ('TriggerDefinition', 'object_id', 'Task_Output', 'valueTriggerDefinition', 'one'),
+    ('Distance', 'object_id', 'Task_Output', 'valueDistance', 'one'),
+    ('Coding', 'object_id', 'Task_Output', 'valueCoding', 'one'),
+    ('CodeableConcept', 'object_id', 'Task_Output', 'valueCodeableConcept', 'one'),
+    ('ElementDefinition', 'object_id', 'Task_Output', 'valueElementDefinition', 'one'),
+    ('Period', 'object_id', 'Task_Output', 'valuePeriod', 'one'),
+    ('Identifier', 'object_id', 'Task_Output', 'valueIdentifier', 'one'),
+    ('DataRequirement', 'object_id', 'Task_Output', 'valueDataRequirement', 'one'),
+    ('SampledData', 'object_id', 'Task_Output', 'valueSampledData', 'one'),
+    ('Element', 'id', 'Task_Output', 'valueElement', 'one'),
+    ('HumanName', 'object_id', 'Task_Output', 'valueHumanName', 'one'),
+    ('Money', 'object_id', 'Task_Output', 'valueMoney', 'one'),
+    ('Quantity', 'object_id', 'Task_Output', 'valueQuantity', 'one'),
+    ('ContactDetail', 'object_id', 'Task_Output', 'valueContactDetail', 'one'),
+    ('Attachment', 'object_id', 'Task_Output', 'valueAttachment', 'one'),
+    ('Count', 'object_id', 'Task_Output', 'valueCount', 'one'),
+    ('CodeableConcept', 'object_id', 'Task_Output', 'type', 'one'),
+    ('Range', 'object_id', 'Task_Output', 'valueRange', 'one'),
+    ('Timing', 'object_id', 'Task_Output', 'valueTiming', 'one'),
+    ('Duration', 'object_id', 'Task_Output', 'valueDuration', 'one'),
+    ('Narrative', 'object_id', 'Task_Output', 'valueNarrative', 'one'),
+    ('ParameterDefinition', 'object_id', 'Task_Output', 'valueParameterDefinition', 'one'),
+    ('Annotation', 'object_id', 'Task_Output', 'valueAnnotation', 'one'),
+    ('Ratio', 'object_id', 'Task_Output', 'valueRatio', 'one'),
+    ('UsageContext', 'object_id', 'Task_Output', 'valueUsageContext', 'one'),
+    ('Address', 'object_id', 'Task_Output', 'valueAddress', 'one'),
+    ('Contributor', 'object_id', 'Task_Output', 'valueContributor', 'one'),
+    ('Reference', 'identifier', 'Task_Requester', 'onBehalfOf', 'one'),
+    ('Reference', 'identifier', 'Task_Requester', 'agent', 'one'),
+    ('Period', 'object_id', 'Task_Restriction', 'period', 'one'),
+    ('Reference', 'identifier', 'Task_Restriction', 'recipient', 'many'),
+    ('TestReport_Participant', 'object_id', 'TestReport', 'participant', 'many'),
+    ('Reference', 'identifier', 'TestReport', 'testScript', 'one'),
+    ('Identifier', 'object_id', 'TestReport', 'identifier', 'one'),
+    ('TestReport_Teardown', 'object_id', 'TestReport', 'teardown', 'one'),
+    ('TestReport_Setup', 'object_id', 'TestReport', 'setup', 'one'),
+    ('TestReport_Test', 'object_id', 'TestReport', 'test', 'many'),
+    ('TestReport_Operation', 'object_id', 'TestReport_Action', 'operation', 'one'),
+    ('TestReport_Assert', 'object_id', 'TestReport_Action', '_assert', 'one'),
+    ('TestReport_Assert', 'object_id', 'TestReport_Action1', '_assert', 'one'),
+    ('TestReport_Operation', 'object_id', 'TestReport_Action1', 'operation', 'one'),
+    ('TestReport_Operation', 'object_id', 'TestReport_Action2', 'operation', 'one'),
+    ('TestReport_Action', 'object_id', 'TestReport_Setup', 'action', 'many'),
+    ('TestReport_Action2', 'object_id', 'TestReport_Teardown', 'action', 'many'),
+    ('TestReport_Action1', 'object_id', 'TestReport_Test', 'action', 'many'),
+    ('UsageContext', 'object_id', 'TestScript', 'useContext', 'many'),
+    ('Reference', 'identifier', 'TestScript', 'profile', 'many'),
+    ('Identifier', 'object_id', 'TestScript', 'identifier', 'one'),
+    ('TestScript_Fixture', 'object_id', 'TestScript', 'fixture', 'many'),
+    ('TestScript_Teardown', 'object_id', 'TestScript', 'teardown', 'one'),
+    ('TestScript_Ruleset', 'object_id', 'TestScript', 'ruleset', 'many'),
+    ('TestScript_Rule', 'object_id', 'TestScript', 'rule', 'many'),
+    ('TestScript_Variable', 'object_id', 'TestScript', 'variable', 'many'),
+    ('CodeableConcept', 'object_id', 'TestScript', 'jurisdiction', 'many'),
+    ('TestScript_Metadata', 'object_id', 'TestScript', 'metadata', 'one'),
+    ('TestScript_Origin', 'object_id', 'TestScript', 'origin', 'many'),
+    ('TestScript_Destination', 'object_id', 'TestScript', 'destination', 'many'),
+    ('ContactDetail', 'object_id', 'TestScript', 'contact', 'many'),
+    ('TestScript_Test', 'object_id', 'TestScript', 'test', 'many'),
+    ('TestScript_Setup', 'object_id', 'TestScript', 'setup', 'one'),
+    ('TestScript_Operation', 'object_id', 'TestScript_Action', 'operation', 'one'),
+    ('TestScript_Assert', 'object_id', 'TestScript_Action', '_assert', 'one'),
+    ('TestScript_Assert', 'object_id', 'TestScript_Action1', '_assert', 'one'),
+    ('TestScript_Operation', 'object_id', 'TestScript_Action1', 'operation', 'one'),
+    ('TestScript_Operation', 'object_id', 'TestScript_Action2', 'operation', 'one'),
+    ('TestScript_Ruleset1', 'object_id', 'TestScript_Assert', 'ruleset', 'one'),
+    ('TestScript_Rule2', 'object_id', 'TestScript_Assert', 'rule', 'one'),
+    ('Reference', 'identifier', 'TestScript_Capability', 'capabilities', 'one'),
+    ('Coding', 'object_id', 'TestScript_Destination', 'profile', 'one'),
+    ('Reference', 'identifier', 'TestScript_Fixture', 'resource', 'one'),
+    ('TestScript_Link', 'object_id', 'TestScript_Metadata', 'link', 'many'),
+    ('TestScript_Capability', 'object_id', 'TestScript_Metadata', 'capability', 'many'),
+    ('Coding', 'object_id', 'TestScript_Operation', 'type', 'one'),
+    ('TestScript_RequestHeader', 'object_id', 'TestScript_Operation', 'requestHeader', 'many'),
+    ('Coding', 'object_id', 'TestScript_Origin', 'profile', 'one'),
+    ('TestScript_Param', 'object_id', 'TestScript_Rule', 'param', 'many'),
+    ('Reference', 'identifier', 'TestScript_Rule', 'resource', 'one'),
+    ('TestScript_Param1', 'object_id', 'TestScript_Rule1', 'param', 'many'),
+    ('TestScript_Param2', 'object_id', 'TestScript_Rule2', 'param', 'many'),
+    ('TestScript_Param3', 'object_id', 'TestScript_Rule3', 'param', 'many'),
+    ('Reference', 'identifier', 'TestScript_Ruleset', 'resource', 'one'),
+    ('TestScript_Rule1', 'object_id', 'TestScript_Ruleset', 'rule', 'many'),
+    ('TestScript_Rule3', 'object_id', 'TestScript_Ruleset1', 'rule', 'many'),
+    ('TestScript_Action', 'object_id', 'TestScript_Setup', 'action', 'many'),
+    ('TestScript_Action2', 'object_id', 'TestScript_Teardown', 'action', 'many'),
+    ('TestScript_Action1', 'object_id', 'TestScript_Test', 'action', 'many'),
+    ('CodeableConcept', 'object_id', 'Timing', 'code', 'one'),
+    ('Timing_Repeat', 'object_id', 'Timing', 'repeat', 'one'),
+    ('Duration', 'object_id', 'Timing_Repeat', 'boundsDuration', 'one'),
+    ('Period', 'object_id', 'Timing_Repeat', 'boundsPeriod', 'one'),
+    ('Range', 'object_id', 'Timing_Repeat', 'boundsRange', 'one'),
+    ('DataRequirement', 'object_id', 'TriggerDefinition', 'eventData', 'one'),
+    ('Timing', 'object_id', 'TriggerDefinition', 'eventTimingTiming', 'one'),
+    ('Reference', 'identifier', 'TriggerDefinition', 'eventTimingReference', 'one'),
+    ('CodeableConcept', 'object_id', 'UsageContext', 'valueCodeableConcept', 'one'),
+    ('Coding', 'object_id', 'UsageContext', 'code', 'one'),
+    ('Quantity', 'object_id', 'UsageContext', 'valueQuantity', 'one'),
+    ('Range', 'object_id', 'UsageContext', 'valueRange', 'one'),
+    ('UsageContext', 'object_id', 'ValueSet', 'useContext', 'many'),
+    ('ValueSet_Compose', 'object_id', 'ValueSet', 'compose', 'one'),
+    ('Identifier', 'object_id', 'ValueSet', 'identifier', 'many'),
+    ('ContactDetail', 'object_id', 'ValueSet', 'contact', 'many'),
+    ('ValueSet_Expansion', 'identifier', 'ValueSet', 'expansion', 'one'),
+    ('CodeableConcept', 'object_id', 'ValueSet', 'jurisdiction', 'many'),
+    ('ValueSet_Include', 'object_id', 'ValueSet_Compose', 'include', 'many'),
+    ('ValueSet_Include', 'object_id', 'ValueSet_Compose', 'exclude', 'many'),
+    ('ValueSet_Designation', 'object_id', 'ValueSet_Concept', 'designation', 'many'),
+    ('ValueSet_Contains', 'object_id', 'ValueSet_Contains', 'contains', 'many'),
+    ('ValueSet_Designation', 'object_id', 'ValueSet_Contains', 'designation', 'many'),
+    ('Coding', 'object_id', 'ValueSet_Designation', 'use', 'one'),
+    ('ValueSet_Parameter', 'object_id', 'ValueSet_Expansion', 'parameter', 'many'),
+    ('ValueSet_Contains', 'object_id', 'ValueSet_Expansion', 'contains', 'many'),
+    ('ValueSet_Concept', 'object_id', 'ValueSet_Include', 'concept', 'many'),
+    ('ValueSet_Filter', 'object_id', 'ValueSet_Include', 'filter', 'many'),
+    ('VisionPrescription_Dispense', 'object_id', 'VisionPrescription', 'dispense', 'many'),
+    ('Reference', 'identifier', 'VisionPrescription', 'prescriber', 'one'),
+    ('CodeableConcept', 'object_id', 'VisionPrescription', 'reasonCodeableConcept', 'one'),
+    ('Reference', 'identifier', 'VisionPrescription', 'encounter', 'one'),
+    ('Identifier', 'object_id', 'VisionPrescription', 'identifier', 'many'),
+    ('Reference', 'identifier', 'VisionPrescription', 'reasonReference', 'one'),
+    ('Reference', 'identifier', 'VisionPrescription', 'patient', 'one'),
+    ('Quantity', 'object_id', 'VisionPrescription_Dispense', 'duration', 'one'),
+    ('Annotation', 'object_id', 'VisionPrescription_Dispense', 'note', 'many'),
+    ('CodeableConcept', 'object_id', 'VisionPrescription_Dispense', 'product', 'one'),
+)
@@ -2,6 +2,10 @@ import logging
 
 import pandas as pd
 
+from cardea.fhir._index import ENUMERATIONS
+from cardea.fhir.registry import get_resource_type
+from cardea.fhir.relationships import RELATIONSHIP_INDEX
+
 logger = logging.getLogger('cardea.fhir')
 
 
@@ -10,6 +14,9 @@ class fhirbase(object):
     def set_attributes(self, dict_values):
         """Sets values to class attributes.
 
+        Values are stored as given, so attributes set from dataframe columns keep
+        a reference to the column instead of a copy of its values.
+
         Args:
             dict_values: A dictionary representation of inserted data.
 
@@ -27,6 +34,9 @@ class fhirbase(object):
     def get_dataframe(self):
         """Returns dataframe from class attribute values.
 
+        Attributes that hold dataframe columns are not copied, so the returned
+        dataframe shares memory with the data the object was created from.
+
         Returns:
             A dataframe representation of the class.
         """
@@ -36,7 +46,7 @@ class fhirbase(object):
             if value is not None and attr != 'resourceType':
                 dataframe[attr] = value
 
-        return pd.DataFrame(dataframe)
+        return pd.DataFrame(dataframe, copy=False)
 
     def get_id(self):
         """Returns fhir class identifier.
@@ -48,14 +58,58 @@ class fhirbase(object):
             LookupError: An error occurs if fhir class doesn't have an id.
         """
 
-        if hasattr(self, 'identifier') and getattr(self, 'identifier') is not None:
-            return 'identifier'
-        elif hasattr(self, 'id') and getattr(self, 'id') is not None:
-            return 'id'
-        elif hasattr(self, 'object_id') and getattr(self, 'object_id') is not None:
-            return 'object_id'
-        else:
-            raise LookupError('{} is missing an identifier'.format(self.__name__))
+        for column in get_resource_type(self.__name__).id_columns:
+            if getattr(self, column) is not None:
+                return column
+
+        raise LookupError('{} is missing an identifier'.format(self.__name__))
+
+    @staticmethod
+    def _count_values(values, chunk_size=65536):
+        """Counts the distinct non-missing values of a series, in order of appearance."""
+        counts = [
+            values.iloc[start:start + chunk_size].value_counts(sort=False)
+            for start in range(0, len(values), chunk_size)
+        ]
+        if not counts:
+            return pd.Series(dtype='int64')
+
+        return pd.concat(counts).groupby(level=0, sort=False).sum()
+
+    def validate(self, samples=5):
+        """Returns the attribute values that do not follow their possible enumerations.
+
+        Each enumerated attribute is checked column-wise: its distinct values are
+        counted chunk by chunk, lowercased once and matched against the possible
+        values of the class, so no temporary as long as the column is allocated.
+
+        Args:
+            samples: The maximum number of distinct invalid values reported per attribute.
+
+        Returns:
+            A list with one dictionary per invalid attribute, holding the ``attribute``
+            name, the ``count`` of invalid values, a list of ``samples`` of them and
+            the ``possible_values`` of the attribute.
+        """
+
+        violations = []
+        for attr, possible_values in ENUMERATIONS.get(self.__name__, {}).items():
+            values = getattr(self, attr)
+            if values is None:
+                continue
+
+            counts = self._count_values(pd.Series(values, copy=False))
+            uniques = pd.Series(counts.index, dtype=object)
+            valid = uniques.str.lower().isin(possible_values).values
+            if not valid.all():
+                violations.append({
+                    'attribute': attr,
+                    'count': int(counts.values[~valid].sum()),
+                    'samples': list(uniques[~valid][:samples]),
+                    'possible_values': possible_values
+                })
+
+        return violations
 
     def assert_type(self):
         """Checks class values follow set possible enumerations.
@@ -65,13 +119,22 @@ class fhirbase(object):
                 does not match its possible enumerations.
         """
 
+        violations = self.validate()
+        if violations:
+            raise ValueError('; '.join(
+                '{} values in {}.{} such as "{}" do not match possible values: {}'.format(
+                    violation['count'], self.__name__, violation['attribute'],
+                    '", "'.join(str(sample) for sample in violation['samples']),
+                    ', '.join(violation['possible_values']))
+                for violation in violations))
+
     def get_relationships(self):
         """Returns class relationships.
 
         Returns:
             A list of the class's associated relationships.
         """
-        return []
+        return RELATIONSHIP_INDEX.by_child(self.__name__)
 
     def get_eligible_relationships(self):
         """Returns class relationships for attributes that are used.
@@ -0,0 +1,58 @@
+"""Registry of the FHIR resource types."""
+
+import importlib
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+
+from cardea.fhir._index import RESOURCES, TYPES
+
+ID_COLUMNS = ('identifier', 'id', 'object_id')
+
+ResourceType = namedtuple('ResourceType', ['name', 'cls', 'attributes', 'id_columns', 'types'])
+ResourceType.__doc__ = """A fhir resource type.
+
+Attributes:
+    name (str):
+        The name of the fhir class.
+    cls (type):
+        The fhir class.
+    attributes (tuple):
+        The names of the class attributes.
+    id_columns (tuple):
+        The identifier attributes of the class, in order of precedence.
+    types (mappingproxy):
+        The declared type (``'bool'``, ``'int'`` or ``'str'``) of the attributes
+        that hold primitive values.
+"""
+
+
+@lru_cache(maxsize=None)
+def get_resource_type(name):
+    """Returns the resource type with the given name.
+
+    The fhir class module is imported on first use and the result is cached,
+    so resolving a resource type again is a dictionary lookup.
+
+    Args:
+        name (str):
+            The name of the fhir class.
+
+    Returns:
+        ResourceType:
+            The registered resource type.
+
+    Raises:
+        LookupError: An error occurs if name is not part of the FHIR schema.
+    """
+
+    module = RESOURCES.get(name)
+    if module is None:
+        raise LookupError('{} is not part of FHIR schema'.format(name))
+
+    cls = getattr(importlib.import_module('cardea.fhir.' + module), name)
+    attributes = tuple(attr for attr in vars(cls()) if attr != 'resourceType')
+    id_columns = tuple(column for column in ID_COLUMNS if column in attributes)
+    types = MappingProxyType(dict(TYPES.get(name, {})))
+
+    return ResourceType(name, cls, attributes, id_columns, types)
@@ -0,0 +1,75 @@
+"""Index of the relationships between FHIR resource classes."""
+
+from collections import defaultdict
+
+from cardea.fhir._index import RELATIONSHIPS
+
+FIELDS = ('parent_entity', 'parent_variable', 'child_entity', 'child_variable', 'cardinality')
+
+
+class RelationshipIndex():
+    """A class that indexes the relationships between fhir classes.
+
+    Every relationship is a dictionary with the ``parent_entity``, ``parent_variable``,
+    ``child_entity``, ``child_variable`` and ``cardinality`` keys, where the cardinality
+    is ``'many'`` if the child variable holds a list and ``'one'`` otherwise. The
+    dictionaries are shared between lookups and must not be modified.
+
+    Args:
+        relationships (iterable):
+            Tuples with the values of the relationship fields.
+    """
+
+    __name__ = 'RelationshipIndex'
+
+    def __init__(self, relationships=RELATIONSHIPS):
+        self.relationships = tuple(dict(zip(FIELDS, relation)) for relation in relationships)
+
+        self._by_child = defaultdict(list)
+        self._by_parent = defaultdict(list)
+        for relation in self.relationships:
+            self._by_child[relation['child_entity']].append(relation)
+            self._by_parent[relation['parent_entity']].append(relation)
+
+    def by_child(self, entity):
+        """Returns the relationships in which entity is the child.
+
+        Args:
+            entity: The name of the fhir class.
+
+        Returns:
+            A list of relationships.
+        """
+
+        return list(self._by_child.get(entity, []))
+
+    def by_parent(self, entity):
+        """Returns the relationships in which entity is the parent.
+
+        Args:
+            entity: The name of the fhir class.
+
+        Returns:
+            A list of relationships.
+        """
+
+        return list(self._by_parent.get(entity, []))
+
+    def among(self, entities):
+        """Returns the relationships between the given entities.
+
+        Args:
+            entities: A list of fhir class names.
+
+        Returns:
+            A list of the relationships whose parent and child are both in entities,
+            ordered by child as given in entities.
+        """
+
+        names = set(entities)
+        return [relation for entity in dict.fromkeys(entities)
+                for relation in self._by_child.get(entity, [])
+                if relation['parent_entity'] in names]
+
+
+RELATIONSHIP_INDEX = RelationshipIndex()
@@ -6,8 +6,15 @@ from cardea.data_loader import DataLoader
 class ProblemDefinition:
     """A class that defines the prediction problem
     by specifying cutoff times and generating the target label if it does not exist.
+
+    Attributes:
+        required_entities (tuple):
+            Entities, besides the target and cutoff entities, that are used to
+            generate the target label.
     """
 
+    required_entities = ()
+
     def check_target_label(self, entity_set, target_entity, target_label):
         """Checks if target label exists in the entity set.
 
@@ -30,6 +30,7 @@ class MortalityPrediction (ProblemDefinition):
     cutoff_entity = 'Period'
     prediction_type = 'classification'
     conn = 'period'
+    required_entities = ('Encounter_Diagnosis', 'Condition', 'CodeableConcept', 'Coding')
     causes_of_death = ['X60', 'X84', 'Y87.0', 'X85', 'Y09',
                        'Y87.1', 'V02', 'V04', 'V09.0', 'V09.2', 'V12', 'V14']
 
@@ -30,6 +30,7 @@ class DiagnosisPrediction (ProblemDefinition):
     cutoff_entity = 'Period'
     prediction_type = 'classification'
     conn = 'period'
+    required_entities = ('Encounter_Diagnosis', 'Condition', 'CodeableConcept', 'Coding')
 
     def __init__(self, d):
         self.diagnosis = d
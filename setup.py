@@ -15,6 +15,7 @@ install_requires = [
     'baytune>=0.5,<0.6',
     'pyCLI==2.0.3',
     'scikit-learn>=1.2,<2',
+    'pyarrow>=5,<15',
     # 'featuretools>=0.20.0,<0.25',
 ]
 
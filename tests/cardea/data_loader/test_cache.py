@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from cardea.data_loader import EntitySetLoader
+from cardea.data_loader.cache import EntitySetCache
+
+
+@pytest.fixture()
+def es_loader():
+    return EntitySetLoader()
+
+
+@pytest.fixture()
+def folder_path(tmp_path):
+    folder = tmp_path / 'fhir'
+    folder.mkdir()
+    pd.DataFrame({"identifier": [10, 11, 12],
+                  "period": [120, 121, 122]}).to_csv(folder / 'Encounter.csv', index=False)
+    pd.DataFrame({"object_id": [120, 121, 122],
+                  "start": ['1/1/2000 20:00', '2/1/2000 5:00', '3/1/2000 22:00'],
+                  "end": ['1/2/2000 21:10', '2/2/2000 18:00', '3/3/2000 20:00']}
+                 ).to_csv(folder / 'Period.csv', index=False)
+    return str(folder)
+
+
+@pytest.fixture()
+def cache_dir(tmp_path):
+    return str(tmp_path / 'cache')
+
+
+def test_get_key_changes_with_options(folder_path, cache_dir):
+    cache = EntitySetCache(cache_dir)
+    file_paths = [os.path.join(folder_path, 'Encounter.csv')]
+
+    assert cache.get_key(file_paths, format='csv') == cache.get_key(file_paths, format='csv')
+    assert cache.get_key(file_paths, format='csv') != cache.get_key(file_paths, format='ndjson')
+
+
+def test_get_key_changes_with_content(folder_path, cache_dir):
+    cache = EntitySetCache(cache_dir, hash_content=True)
+    file_path = os.path.join(folder_path, 'Encounter.csv')
+    key = cache.get_key([file_path])
+
+    with open(file_path, 'a') as csv_file:
+        csv_file.write('13,123\n')
+
+    assert cache.get_key([file_path]) != key
+
+
+def test_load_missing_key(cache_dir):
+    assert EntitySetCache(cache_dir).load('missing') is None
+
+
+def test_save_and_load(cache_dir):
+    cache = EntitySetCache(cache_dir)
+    fhir = {'Encounter': pd.DataFrame({'identifier': [10, 11], 'period': [120, 121]}),
+            'Mixed': pd.DataFrame({'object_id': [1, 2], 'value': [1, 'a']})}
+    relationships = pd.DataFrame([{'parent_entity': 'Period', 'parent_variable': 'object_id',
+                                   'child_entity': 'Encounter', 'child_variable': 'period'}])
+    identifiers = {'Encounter': 'identifier', 'Mixed': 'object_id'}
+
+    cache.save('key', fhir, relationships, identifiers)
+    loaded_fhir, loaded_relationships, loaded_identifiers, keys = cache.load('key')
+
+    assert sorted(os.listdir(os.path.join(cache_dir, 'key'))) == [
+        '0.parquet', '1.pkl', 'manifest.json']
+    pd.testing.assert_frame_equal(loaded_fhir['Encounter'], fhir['Encounter'])
+    pd.testing.assert_frame_equal(loaded_fhir['Mixed'], fhir['Mixed'])
+    pd.testing.assert_frame_equal(loaded_relationships, relationships)
+    assert loaded_identifiers == identifiers
+    assert keys is None
+
+
+def test_load_data_entityset_cache_hit(es_loader, folder_path, cache_dir):
+    es = es_loader.load_data_entityset(folder_path, cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 1
+
+    with patch.object(EntitySetLoader, 'resolve_dataframes') as resolve_dataframes:
+        cached = es_loader.load_data_entityset(folder_path, cache_dir=cache_dir)
+
+    resolve_dataframes.assert_not_called()
+    assert {entity.id for entity in cached.entities} == {entity.id for entity in es.entities}
+    assert len(cached.relationships) == len(es.relationships)
+    pd.testing.assert_frame_equal(cached['Encounter'].df, es['Encounter'].df)
+
+
+def test_load_data_entityset_cache_without_relationships(es_loader, tmp_path, cache_dir):
+    folder = tmp_path / 'patients'
+    folder.mkdir()
+    keys = ['Patient/1', 'Patient/2']
+    pd.DataFrame({"identifier": keys, "gender": ['female', 'male']}).to_csv(
+        folder / 'Patient.csv', index=False)
+    pd.DataFrame({"identifier": keys, "reference": keys}).to_csv(
+        folder / 'Reference.csv', index=False)
+    pd.DataFrame({"object_id": keys}).to_csv(folder / 'Identifier.csv', index=False)
+
+    es = es_loader.load_data_entityset(str(folder), cache_dir=cache_dir)
+    cached = es_loader.load_data_entityset(str(folder), cache_dir=cache_dir)
+
+    assert len(es.relationships) == len(cached.relationships) == 0
+    pd.testing.assert_frame_equal(cached['Patient'].df, es['Patient'].df)
+
+
+def test_load_data_entityset_cache_miss(es_loader, folder_path, cache_dir):
+    es_loader.load_data_entityset(folder_path, cache_dir=cache_dir)
+
+    file_path = os.path.join(folder_path, 'Encounter.csv')
+    with open(file_path, 'a') as csv_file:
+        csv_file.write('13,122\n')
+
+    es = es_loader.load_data_entityset(folder_path, cache_dir=cache_dir)
+
+    assert len(os.listdir(cache_dir)) == 2
+    assert len(es['Encounter'].df) == 4
+
+
+def test_load_data_entityset_cache_keys(folder_path, cache_dir):
+    es_loader = EntitySetLoader(intern_keys=True)
+    es_loader.load_data_entityset(folder_path, cache_dir=cache_dir)
+    keys = list(es_loader.keys.keys)
+
+    es_loader.keys = None
+    es = es_loader.load_data_entityset(folder_path, cache_dir=cache_dir)
+
+    assert es_loader.report['stages'][0]['stage'] == 'load_cache'
+    assert list(es_loader.keys.keys) == keys
+    assert sorted(es_loader.keys.decode(es['Encounter'].df['identifier'])) == ['10', '11', '12']
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cardea.data_loader.chunked import (
+    get_chunksize, needs_chunking, read_csv_chunked, read_spilled, spill_csv_file)
+
+
+@pytest.fixture()
+def csv_path(tmp_path):
+    path = str(tmp_path / 'CHARTEVENTS.csv')
+    pd.DataFrame({'subject_id': [1, 2, 3, 4, 5],
+                  'value': [1, 2, 3.5, None, 5],
+                  'label': ['a', 'b', 'a', 'b', 'a'],
+                  'note': [None, None, 'x', None, 'y'],
+                  'charttime': ['2100-01-01 10:00'] * 5}).to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture()
+def oversized_path(tmp_path):
+    path = str(tmp_path / 'LARGE.csv')
+    rows = 100000
+    random = np.random.default_rng(0)
+    pd.DataFrame({'subject_id': random.integers(0, 1000, rows),
+                  'value': random.random(rows),
+                  'label': random.choice(['heart rate', 'blood pressure'], rows)}
+                 ).to_csv(path, index=False)
+    return path
+
+
+def test_needs_chunking(csv_path):
+    assert not needs_chunking(csv_path, None)
+    assert not needs_chunking(csv_path, 1 << 20)
+    assert needs_chunking(csv_path, 100)
+
+
+def test_get_chunksize(oversized_path):
+    assert get_chunksize(oversized_path, 1 << 20) < get_chunksize(oversized_path, 2 << 20)
+    assert get_chunksize(oversized_path, 1) == 1
+
+
+def test_spill_csv_file(csv_path, tmp_path):
+    spill_dir = str(tmp_path / 'spill')
+    rows = spill_csv_file(csv_path, spill_dir, chunksize=2, usecols=['subject_id', 'value'],
+                          row_filter=lambda chunk: chunk['subject_id'] != 2)
+
+    assert rows == 4
+    assert sorted(os.listdir(spill_dir)) == [
+        'part-00000.parquet', 'part-00001.parquet', 'part-00002.parquet']
+    assert list(read_spilled(spill_dir).columns) == ['subject_id', 'value']
+
+
+def test_spill_csv_file_without_size(csv_path, tmp_path):
+    with pytest.raises(ValueError):
+        spill_csv_file(csv_path, str(tmp_path / 'spill'))
+
+
+def test_read_spilled_unifies_partitions(csv_path, tmp_path):
+    spill_dir = str(tmp_path / 'spill')
+    spill_csv_file(csv_path, spill_dir, chunksize=2, parse_dates=['charttime'])
+
+    df = read_spilled(spill_dir, categories=['label', 'note'])
+
+    assert df['subject_id'].tolist() == [1, 2, 3, 4, 5]
+    assert df['value'].dtype == 'float64'
+    assert df['label'].dtype == 'category' and df['label'].tolist() == ['a', 'b', 'a', 'b', 'a']
+    assert df['note'].dtype == 'category' and df['note'].isnull().sum() == 3
+    assert df['charttime'].dtype == 'datetime64[ns]'
+
+
+def test_read_csv_chunked_memory_ceiling(oversized_path):
+    max_memory = 2 << 20
+    full = pd.read_csv(oversized_path)
+    assert full.memory_usage(deep=True).sum() > 2 * max_memory
+
+    tracemalloc.start()
+    try:
+        df = read_csv_chunked(oversized_path, max_memory=max_memory, categories=['label'],
+                              row_filter=lambda chunk: chunk['subject_id'] < 500)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < max_memory
+    expected = full[full['subject_id'] < 500].reset_index(drop=True)
+    pd.testing.assert_frame_equal(df.astype({'label': 'object'}), expected)
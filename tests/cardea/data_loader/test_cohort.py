@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cardea.data_loader import Cohort, EntitySetLoader
+from cardea.data_loader.cohort import key_filter, lookup
+from cardea.data_loader.load_mimic import load_mimic_data
+
+
+@pytest.fixture()
+def admissions():
+    return pd.DataFrame({
+        'admittime': pd.to_datetime(['2150-01-01', '2150-06-01', '2151-01-01', None]),
+        'dob': pd.to_datetime(['2100-06-01', '2140-01-01', '1850-01-01', '2100-01-01']),
+        'admission_type': ['EMERGENCY', 'ELECTIVE', 'EMERGENCY', 'EMERGENCY'],
+        'codes': [True, False, True, True]
+    })
+
+
+def get_mask(cohort, admissions):
+    return cohort.get_mask(admissions.index, admissions['admittime'], admissions['dob'],
+                           admissions['admission_type'], admissions['codes']).tolist()
+
+
+def test_get_mask_age(admissions):
+    assert get_mask(Cohort(min_age=18), admissions) == [True, False, True, False]
+    assert get_mask(Cohort(min_age=18, max_age=89), admissions) == [True, False, False, False]
+    assert get_mask(Cohort(max_age=49), admissions) == [True, True, False, False]
+
+
+def test_get_mask_dates(admissions):
+    cohort = Cohort(start='2150-01-01', end='2150-12-31')
+    assert get_mask(cohort, admissions) == [True, True, False, False]
+
+
+def test_get_mask_classes_and_codes(admissions):
+    cohort = Cohort(encounter_classes=['EMERGENCY'], codes=['995'])
+    assert get_mask(cohort, admissions) == [True, False, True, True]
+
+
+def test_has_codes():
+    cohort = Cohort(codes=['99591', '038'])
+    codes = pd.Series(['99591', '0389', '4019', None])
+    assert cohort.has_codes(codes).tolist() == [True, True, False, False]
+
+
+def test_key_filter():
+    df = pd.DataFrame({'subject_id': [1, 2, 3, 1], 'hadm_id': [10, 20, 30, np.nan]})
+    row_filter = pickle.loads(pickle.dumps(key_filter({'subject_id': {1, 3},
+                                                       'hadm_id': {10}})))
+
+    assert row_filter(df).tolist() == [True, False, False, True]
+    assert row_filter(df[['hadm_id']]).tolist() == [True, False, False, True]
+
+
+@pytest.fixture()
+def fhir():
+    return {
+        'Patient': pd.DataFrame({'identifier': [1, 2, 3],
+                                 'birthDate': ['1950-01-01', '2010-01-01', '1960-05-05']}),
+        'Encounter': pd.DataFrame({'identifier': [10, 11, 12, 13],
+                                   'subject': [1, 2, 3, 1],
+                                   'period': [100, 101, 102, 103],
+                                   '_class': [200, 200, 201, 200]}),
+        'Observation': pd.DataFrame({'identifier': [20, 21, 22],
+                                     'encounter': [10, 11, 13]}),
+        'Period': pd.DataFrame({'object_id': [100, 101, 102, 103],
+                                'start': ['2020-01-01T10:00:00+01:00', '2020-02-01',
+                                          '2020-03-01', '2018-01-01']}),
+        'Coding': pd.DataFrame({'object_id': [200, 201], 'code': ['EMER', 'AMB']})
+    }
+
+
+@pytest.fixture()
+def relationships():
+    return pd.DataFrame([
+        ('Patient', 'identifier', 'Encounter', 'subject'),
+        ('Encounter', 'identifier', 'Observation', 'encounter'),
+        ('Period', 'object_id', 'Encounter', 'period'),
+        ('Coding', 'object_id', 'Encounter', '_class')
+    ], columns=['parent_entity', 'parent_variable', 'child_entity', 'child_variable'])
+
+
+def test_lookup(fhir, relationships):
+    births = lookup(fhir, relationships, 'Encounter', ['subject', 'birthDate'])
+    assert births.tolist() == ['1950-01-01', '2010-01-01', '1960-05-05', '1950-01-01']
+
+
+def test_lookup_missing_reference(fhir, relationships):
+    with pytest.raises(LookupError):
+        lookup(fhir, relationships, 'Encounter', ['location', 'name'])
+
+
+def test_filter_fhir(fhir, relationships):
+    cohort = Cohort(min_age=18, start='2019-01-01', encounter_classes=['EMER'])
+    filtered = cohort.filter_fhir(fhir, relationships)
+
+    assert filtered['Encounter']['identifier'].tolist() == [10]
+    assert filtered['Patient']['identifier'].tolist() == [1]
+    assert filtered['Observation']['identifier'].tolist() == [20]
+    assert filtered['Period']['object_id'].tolist() == [100]
+    assert filtered['Coding']['object_id'].tolist() == [200]
+    assert len(fhir['Period']) == 4 and len(fhir['Encounter']) == 4
+
+
+def test_load_df_entityset_cohort():
+    fhir = {'Encounter': pd.DataFrame({'identifier': [10, 11, 12], 'period': [120, 121, 122]}),
+            'Period': pd.DataFrame({'object_id': [120, 121, 122],
+                                    'start': ['1/1/2000', '2/1/2000', '3/1/2000'],
+                                    'end': ['1/2/2000', '2/2/2000', '3/3/2000']})}
+
+    es_loader = EntitySetLoader()
+    es = es_loader.load_df_entityset(fhir, cohort=Cohort(start='2000-01-15'))
+
+    assert sorted(es['Encounter'].df['identifier']) == [11, 12]
+    assert 'cohort' in [stage['stage'] for stage in es_loader.report['stages']]
+
+
+@pytest.fixture()
+def mimic_path(tmp_path):
+    pd.DataFrame({'ROW_ID': [1, 2, 3],
+                  'SUBJECT_ID': [10, 11, 12],
+                  'GENDER': ['F', 'M', 'F'],
+                  'DOB': ['2100-01-01 00:00:00', '2140-05-01 00:00:00', '2080-03-01 00:00:00'],
+                  'EXPIRE_FLAG': [0, 0, 0]}).to_csv(tmp_path / 'PATIENTS.csv', index=False)
+    pd.DataFrame({'ROW_ID': [1, 2, 3, 4],
+                  'SUBJECT_ID': [10, 11, 12, 10],
+                  'HADM_ID': [100, 101, 102, 103],
+                  'ADMITTIME': ['2150-01-01 10:00:00', '2150-02-01 10:00:00',
+                                '2150-03-01 10:00:00', '2152-01-01 10:00:00'],
+                  'ADMISSION_TYPE': ['EMERGENCY', 'EMERGENCY', 'ELECTIVE', 'EMERGENCY']}
+                 ).to_csv(tmp_path / 'ADMISSIONS.csv', index=False)
+    pd.DataFrame({'ROW_ID': [1, 2, 3, 4],
+                  'SUBJECT_ID': [10, 11, 12, 10],
+                  'HADM_ID': [100, 101, 102, 103],
+                  'SEQ_NUM': [1, 1, 1, 1],
+                  'ICD9_CODE': ['99591', '4019', '99592', '99591']}
+                 ).to_csv(tmp_path / 'DIAGNOSES_ICD.csv', index=False)
+    return str(tmp_path)
+
+
+@pytest.mark.parametrize('max_memory', [None, 100])
+def test_load_mimic_data_cohort(mimic_path, max_memory):
+    cohort = Cohort(min_age=18, end='2151-01-01', codes=['995'])
+    es = load_mimic_data(mimic_path, cohort=cohort, max_memory=max_memory)
+
+    assert sorted(es['admissions'].df['hadm_id']) == [100, 102]
+    assert sorted(es['patients'].df['subject_id']) == [10, 12]
+    assert sorted(es['diagnoses_icd'].df['hadm_id']) == [100, 102]
+
+
+def test_load_mimic_data_cohort_missing_table(mimic_path, tmp_path):
+    with pytest.raises(LookupError):
+        load_mimic_data(str(tmp_path / 'missing'), cohort=Cohort(codes=['995']))
+
+
+def test_lookup_missing_column(fhir, relationships):
+    with pytest.raises(LookupError):
+        lookup(fhir, relationships, 'Encounter', ['subject', 'deceasedBoolean'])
+
+
+@pytest.fixture()
+def cyclic_fhir():
+    keys = ['Patient/1', 'Patient/2', 'Encounter/1', 'Encounter/2', 'Encounter/3',
+            'Condition/1', 'Condition/2', 'Condition/3']
+    return {
+        'Patient': pd.DataFrame({'identifier': ['Patient/1', 'Patient/2'],
+                                 'birthDate': ['1950-01-01', '2010-01-01']}),
+        'Encounter': pd.DataFrame({'identifier': ['Encounter/1', 'Encounter/2', 'Encounter/3'],
+                                   'subject': ['Patient/1', 'Patient/2', 'Patient/1'],
+                                   '_class': [1, 2, 1],
+                                   'period': [3, 4, 5],
+                                   'diagnosis': [6, 7, 8]}),
+        'Coding': pd.DataFrame({'object_id': [1, 2, 11, 12],
+                                'code': ['IMP', 'AMB', 'I10', 'E11']}),
+        'Period': pd.DataFrame({'object_id': [3, 4, 5],
+                                'start': ['2020-01-01', '2020-02-01', '2020-03-01']}),
+        'Encounter_Diagnosis': pd.DataFrame({'object_id': [6, 7, 8],
+                                             'condition': ['Condition/1', 'Condition/2',
+                                                           'Condition/3']}),
+        'Condition': pd.DataFrame({'identifier': ['Condition/1', 'Condition/2', 'Condition/3'],
+                                   'subject': ['Patient/1', 'Patient/2', 'Patient/1'],
+                                   'code': [9, 10, 10]}),
+        'CodeableConcept': pd.DataFrame({'object_id': [9, 10], 'coding': [11, 12]}),
+        'Reference': pd.DataFrame({'identifier': keys, 'reference': keys}),
+        'Identifier': pd.DataFrame({'object_id': keys})
+    }
+
+
+@pytest.mark.parametrize('cohort, encounters', [
+    (Cohort(codes=['I10']), ['Encounter/1']),
+    (Cohort(encounter_classes=['IMP']), ['Encounter/1', 'Encounter/3']),
+    (Cohort(min_age=18), ['Encounter/1', 'Encounter/3'])
+])
+def test_load_df_entityset_cohort_cut_edges(cyclic_fhir, cohort, encounters):
+    es = EntitySetLoader().load_df_entityset(cyclic_fhir, cohort=cohort)
+
+    relationships = {(r.child_entity.id, r.parent_entity.id) for r in es.relationships}
+    assert ('Encounter_Diagnosis', 'Condition') not in relationships
+    assert sorted(es['Encounter'].df['identifier']) == encounters
+    assert sorted(es['Patient'].df['identifier']) == ['Patient/1']
@@ -1,10 +1,15 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import tracemalloc
+from unittest.mock import patch
+
+import networkx as nx
+import numpy as np
 import pandas as pd
 import pytest
 
-from cardea.data_loader import DataLoader, Diamond
+from cardea.data_loader import DataLoader, Diamond, data_loader
 
 
 @pytest.fixture()
@@ -108,6 +113,29 @@ def test_data_loader_create_object(loader, patient_df):
     assert len(object_df) == len(patient_df)
 
 
+def test_data_loader_create_object_shares_memory(loader, encounter_df):
+    object = loader.create_object(encounter_df, 'Encounter')
+    object_df = object.get_dataframe()
+    assert all(np.shares_memory(encounter_df[column].values, object_df[column].values)
+               for column in encounter_df.columns)
+
+
+def test_data_loader_create_object_memory():
+    size = 500000
+    observation_df = pd.DataFrame({"identifier": np.arange(size),
+                                   "status": np.random.choice(['final', 'amended'], size),
+                                   "subject": np.random.randint(0, 1000, size),
+                                   "valueString": np.random.random(size)})
+
+    tracemalloc.start()
+    object = DataLoader().create_object(observation_df, 'Observation')
+    object.get_dataframe()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert peak < observation_df.memory_usage(deep=False).sum() / 10
+
+
 def test_fhir_class_exist(loader, patient_df):
     with pytest.raises(LookupError):
         loader.create_object(patient_df, 'Inpatient')
@@ -149,7 +177,7 @@ def test_get_dataframes_names(loader, patient, encounter):
 
 def test_merge_cost(diamond):
     cost = diamond.merge_cost()
-    assert sum(cost) == sum([26, 22, 22, 16, 21, 14, 16, 16, 20])
+    assert cost == [16, 12, 12, 15, 18, 4, 6, 6, 10]
 
 
 def test_resolve_reference(diamond):
@@ -193,3 +221,140 @@ def test_resolve_diamond(diamond):
     relationships = diamond.get_fhir_relationships()
     fhir = diamond.get_fhir_dataframes()
     assert len(relationships) == 4 and len(fhir) == 7
+
+
+def test_resolve_reference_parents(diamond):
+    diamond.resolve_reference()
+    relationships = diamond.get_fhir_relationships()
+    parents = relationships.set_index(['child_entity', 'child_variable'])['parent_entity']
+
+    assert parents[('Encounter', 'subject')] == 'Patient'
+    assert parents[('Condition', 'subject')] == 'Patient'
+    assert parents[('Encounter_Diagnosis', 'condition')] == 'Condition'
+
+
+def test_resolve_reference_does_not_modify_dataframes(diamond):
+    dtypes = {name: df.dtypes.copy() for name, df in diamond.get_fhir_dataframes().items()}
+    diamond.resolve_reference()
+
+    for name, df in diamond.get_fhir_dataframes().items():
+        pd.testing.assert_series_equal(df.dtypes, dtypes[name])
+
+
+def test_get_identifier_index(diamond):
+    index = diamond.get_identifier_index()
+
+    assert index[0] == 'Patient'
+    assert index[10] == 'Encounter'
+    assert index[1000] == 'Condition'
+    assert index.index.is_unique
+
+
+def test_merge_entities_values(diamond_witout_ref, edge):
+    fhir = diamond_witout_ref.get_fhir_dataframes()
+    columns = [column for column in fhir['Patient'].columns if column != 'identifier']
+    columns += list(fhir['Condition'].columns)
+
+    diamond_witout_ref.merge(edge)
+    condition = diamond_witout_ref.get_fhir_dataframes()['Condition']
+
+    assert list(condition.columns) == columns
+    assert condition['gender'].tolist() == ['male', 'male', 'female']
+    assert condition['identifier'].tolist() == [1000, 2000, 3000]
+
+
+def test_merge_entities_missing_parent(diamond_witout_ref, edge):
+    fhir = diamond_witout_ref.get_fhir_dataframes()
+    fhir['Condition'] = pd.DataFrame({"identifier": [1000, 2000], "subject": [2, 7]},
+                                     index=[5, 6])
+    diamond_witout_ref.merge(edge)
+    condition = diamond_witout_ref.get_fhir_dataframes()['Condition']
+
+    assert condition.index.tolist() == [0, 1]
+    assert condition['gender'][0] == 'male' and pd.isnull(condition['gender'][1])
+
+
+def test_merge_entities_duplicated_parent(diamond_witout_ref, edge):
+    fhir = diamond_witout_ref.get_fhir_dataframes()
+    fhir['Patient'] = pd.DataFrame({"identifier": [2, 2, 1],
+                                    "gender": ['male', 'other', 'female']})
+    diamond_witout_ref.merge(edge)
+    condition = diamond_witout_ref.get_fhir_dataframes()['Condition']
+
+    assert condition['identifier'].tolist() == [1000, 1000, 2000, 2000, 3000]
+    assert condition['gender'].tolist() == ['male', 'other', 'male', 'other', 'female']
+
+
+def test_merge_entities_does_not_copy_target(diamond_witout_ref, edge):
+    subject = diamond_witout_ref.get_fhir_dataframes()['Condition']['subject'].values
+    diamond_witout_ref.merge(edge)
+    condition = diamond_witout_ref.get_fhir_dataframes()['Condition']
+
+    assert np.shares_memory(condition['subject'].values, subject)
+
+
+def test_merge_cost_duplicated_parent_key(objects):
+    diamond = Diamond(objects)
+    diamond.fhir['Period'] = pd.DataFrame({"object_id": [120, 120, 121, 121, 122, 122],
+                                           "start": ['1/1/2000'] * 6})
+    cost = diamond.merge_cost()
+    period = diamond.relationships['parent_entity'].tolist().index('Period')
+
+    assert cost[period] == 3 * 2 * (2 + 4 - 1)
+
+
+def test_get_plan(diamond):
+    diamond.relationships['weight'] = diamond.merge_cost()
+    diamond.resolve_reference()
+    plan = diamond.get_plan()
+
+    assert plan == [('Encounter_Diagnosis', 'Condition')]
+
+
+def test_get_plan_cached(objects):
+    data_loader._PLANS.clear()
+    Diamond(objects).resolve_diamond()
+
+    with patch('networkx.maximum_spanning_tree') as maximum_spanning_tree:
+        diamond = Diamond(objects)
+        diamond.resolve_diamond()
+
+    maximum_spanning_tree.assert_not_called()
+    assert 'subject' in diamond.get_fhir_dataframes()['Encounter_Diagnosis'].columns
+
+
+def test_get_plan_cached_skips_merge_cost(objects):
+    data_loader._PLANS.clear()
+    Diamond(objects).resolve_diamond()
+
+    with patch.object(Diamond, 'merge_cost') as merge_cost:
+        Diamond(objects).resolve_diamond()
+
+    merge_cost.assert_not_called()
+
+
+def test_resolve_diamond_builds_one_spanning_tree(objects):
+    data_loader._PLANS.clear()
+    with patch('networkx.maximum_spanning_tree', wraps=nx.maximum_spanning_tree) as tree:
+        Diamond(objects).resolve_diamond()
+
+    assert tree.call_count == 1
+
+
+def test_has_cycles():
+    diamond = Diamond(fhir={}, relationships=pd.DataFrame({
+        'parent_entity': ['Patient', 'Patient', 'Encounter'],
+        'child_entity': ['Encounter', 'Condition', 'Condition']}))
+
+    assert diamond.has_cycles()
+
+    diamond.relationships = diamond.relationships.iloc[:2]
+    assert not diamond.has_cycles()
+
+
+def test_has_cycles_parallel_edges():
+    diamond = Diamond(fhir={}, relationships=pd.DataFrame({
+        'parent_entity': ['Patient', 'Patient', 'Encounter'],
+        'child_entity': ['Encounter', 'Encounter', 'Patient']}))
+
+    assert not diamond.has_cycles()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from cardea.data_loader.database import (
+    ConnectionPool, as_pool, build_query, get_table_columns, get_table_names, open_cursor,
+    quote_identifier, read_sql_table)
+
+
+@pytest.fixture()
+def database_path(tmp_path):
+    path = str(tmp_path / 'cardea.db')
+    with sqlite3.connect(path) as connection:
+        pd.DataFrame({'subject_id': [1, 2, 3, 4, 5],
+                      'value': [1, 2, 3.5, None, 5],
+                      'label': ['a', 'b', 'a', 'b', 'a'],
+                      'charttime': ['2100-01-01 10:00'] * 5}).to_sql('CHARTEVENTS', connection,
+                                                                     index=False)
+
+    return path
+
+
+@pytest.fixture()
+def pool(database_path):
+    with ConnectionPool(database_path, size=2) as pool:
+        yield pool
+
+
+def test_connection_pool_reuses_connections(pool):
+    with pool.connection() as connection:
+        pass
+
+    with pool.connection() as other:
+        assert other is connection
+
+
+def test_connection_pool_size():
+    opened = []
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def connect():
+        opened.append(sqlite3.connect(':memory:', check_same_thread=False))
+        return opened[-1]
+
+    def use(_):
+        with pool.connection():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+
+            time.sleep(0.01)
+            with lock:
+                running.pop()
+
+    pool = ConnectionPool(connect, size=2)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(use, range(8)))
+
+    assert len(opened) == 2 and max(peak) == 2
+
+    pool.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        opened[0].execute('SELECT 1')
+
+
+def test_connection_pool_failed_rollback():
+    broken = MagicMock()
+    broken.rollback.side_effect = sqlite3.OperationalError('connection lost')
+    connections = [broken, sqlite3.connect(':memory:', check_same_thread=False)]
+    pool = ConnectionPool(lambda: connections.pop(0), size=1)
+
+    with pytest.raises(sqlite3.OperationalError):
+        with pool.connection():
+            pass
+
+    broken.close.assert_called_once()
+    assert pool._opened == 0
+
+    with pool.connection() as connection:
+        assert isinstance(connection, sqlite3.Connection)
+
+    pool.close()
+    assert pool._opened == 0
+
+
+def test_connection_pool_failed_rollback_waiting():
+    broken = MagicMock()
+    broken.rollback.side_effect = sqlite3.OperationalError('connection lost')
+    connections = [broken, sqlite3.connect(':memory:', check_same_thread=False)]
+    pool = ConnectionPool(lambda: connections.pop(0), size=1)
+    borrowed = threading.Event()
+
+    def use():
+        with pytest.raises(sqlite3.OperationalError):
+            with pool.connection():
+                borrowed.set()
+                time.sleep(0.05)
+
+    thread = threading.Thread(target=use)
+    thread.start()
+    borrowed.wait()
+    with pool.connection() as connection:
+        assert isinstance(connection, sqlite3.Connection)
+
+    thread.join()
+
+
+def driver_connection(module):
+    connection = MagicMock()
+    connection.dbapi_connection = type('Connection', (), {'__module__': module})()
+    return connection
+
+
+def test_open_cursor_regular(pool):
+    with pool.connection() as connection:
+        assert isinstance(open_cursor(connection, server_side=True), sqlite3.Cursor)
+
+
+def test_open_cursor_named():
+    connection = driver_connection('psycopg2.extensions')
+    open_cursor(connection, server_side=True)
+
+    name = connection.cursor.call_args[0][0]
+    assert name.startswith('cardea_')
+
+
+def test_open_cursor_client_side():
+    connection = driver_connection('psycopg2.extensions')
+    open_cursor(connection)
+
+    connection.cursor.assert_called_once_with()
+
+
+def test_open_cursor_server_side_class(monkeypatch):
+    cursors = types.ModuleType('pymysql.cursors')
+    cursors.SSCursor = object()
+    monkeypatch.setitem(sys.modules, 'pymysql.cursors', cursors)
+
+    connection = driver_connection('pymysql.connections')
+    open_cursor(connection, server_side=True)
+
+    connection.cursor.assert_called_once_with(cursors.SSCursor)
+
+
+def test_as_pool(pool, database_path):
+    assert as_pool(pool) is pool
+    assert isinstance(as_pool(database_path), ConnectionPool)
+
+
+def test_quote_identifier():
+    assert quote_identifier('row_id') == '"row_id"'
+    assert quote_identifier('a"b') == '"a""b"'
+
+
+def test_build_query():
+    assert build_query('patients') == 'SELECT * FROM "patients"'
+    assert build_query('patients', ['row_id'], 'dob IS NULL') == \
+        'SELECT "row_id" FROM "patients" WHERE dob IS NULL'
+    assert build_query('PATIENTS', {'ROW_ID': 'row_id'}) == \
+        'SELECT "ROW_ID" AS "row_id" FROM "PATIENTS"'
+
+
+def test_get_table_names(pool):
+    assert get_table_names(pool) == ['CHARTEVENTS']
+
+
+def test_get_table_columns(pool):
+    assert get_table_columns(pool, 'CHARTEVENTS') == ['subject_id', 'value', 'label',
+                                                      'charttime']
+
+
+def test_read_sql_table(pool):
+    df = read_sql_table(pool, 'CHARTEVENTS', columns=['subject_id', 'label'],
+                        dtype={'subject_id': float, 'label': str})
+
+    assert list(df.columns) == ['subject_id', 'label']
+    assert df['subject_id'].tolist() == [1, 2, 3, 4, 5]
+    assert df['subject_id'].dtype == float
+
+
+def test_read_sql_table_where(pool):
+    df = read_sql_table(pool, 'CHARTEVENTS', where='label = ?', params=('b', ))
+    assert df['subject_id'].tolist() == [2, 4]
+
+
+@pytest.mark.parametrize('options', [{'chunksize': 2}, {'max_memory': 100}])
+def test_read_sql_table_chunked(pool, tmp_path, options):
+    spill_dir = str(tmp_path / 'spill')
+    df = read_sql_table(pool, 'CHARTEVENTS', row_filter=lambda df: df['label'] == 'a',
+                        parse_dates=['charttime'], categories=['label'], spill_dir=spill_dir,
+                        **options)
+
+    assert os.listdir(spill_dir)
+    assert df['subject_id'].tolist() == [1, 3, 5]
+    assert df['label'].dtype == 'category'
+    assert df['charttime'].dtype == 'datetime64[ns]'
+
+
+def test_read_sql_table_chunked_empty(pool):
+    df = read_sql_table(pool, 'CHARTEVENTS', where='1 = 0', chunksize=2,
+                        columns={'subject_id': 'id'})
+
+    assert list(df.columns) == ['id'] and df.empty
+
+
+def test_read_sql_table_chunked_server_side(pool, monkeypatch):
+    opened = []
+
+    def open_cursor(connection, server_side=False):
+        opened.append(server_side)
+        return connection.cursor()
+
+    monkeypatch.setattr('cardea.data_loader.database.open_cursor', open_cursor)
+    read_sql_table(pool, 'CHARTEVENTS', chunksize=2)
+    read_sql_table(pool, 'CHARTEVENTS')
+
+    assert opened == [True, False]
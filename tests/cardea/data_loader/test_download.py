@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import hashlib
+import os
+from pathlib import Path
+from unittest.mock import patch
+from zipfile import ZipFile
+
+import pytest
+
+from cardea.data_loader.download import MANIFEST, DownloadCache, download_file, extract_archive
+
+CONTENT = b'identifier,period\n10,120\n11,121\n'
+
+
+@pytest.fixture()
+def archive_path(tmp_path):
+    path = tmp_path / 'kaggle.zip'
+    with ZipFile(path, 'w') as archive:
+        archive.writestr('Encounter.csv', CONTENT)
+        archive.writestr('nested/Period.csv', b'object_id\n120\n')
+        archive.writestr('nested/', b'')
+
+    return path
+
+
+@pytest.fixture()
+def url(archive_path):
+    return Path(archive_path).as_uri()
+
+
+@pytest.fixture()
+def checksum(archive_path):
+    return hashlib.sha256(Path(archive_path).read_bytes()).hexdigest()
+
+
+def test_download_file(url, checksum, tmp_path):
+    file_path = str(tmp_path / 'download.zip')
+    assert download_file(url, file_path, block_size=16) == checksum
+    assert Path(file_path).read_bytes() == Path(url[len('file://'):]).read_bytes()
+
+
+def test_extract_archive(archive_path, tmp_path):
+    output_path = tmp_path / 'output'
+    output_path.mkdir()
+
+    assert extract_archive(str(archive_path), str(output_path)) == ['Encounter.csv', 'Period.csv']
+    assert (output_path / 'Encounter.csv').read_bytes() == CONTENT
+
+
+def test_download_cache_get(url, checksum, tmp_path):
+    cache = DownloadCache(str(tmp_path / 'cache'))
+    path = cache.get('kaggle', url, checksum=checksum)
+
+    assert sorted(os.listdir(path)) == [MANIFEST, 'Encounter.csv', 'Period.csv']
+    assert cache.get_manifest('kaggle')['sha256'] == checksum
+    assert sorted(os.listdir(str(tmp_path / 'cache'))) == ['kaggle']
+
+
+def test_download_cache_reused(url, tmp_path):
+    cache = DownloadCache(str(tmp_path / 'cache'))
+    path = cache.get('kaggle', url)
+
+    with patch('cardea.data_loader.download.download_file') as download:
+        assert cache.get('kaggle', url) == path
+        assert not download.called
+
+
+def test_download_cache_checksum_mismatch(url, tmp_path):
+    cache = DownloadCache(str(tmp_path / 'cache'))
+    path = cache.get('kaggle', url)
+
+    with pytest.raises(ValueError):
+        cache.get('kaggle', url, checksum='0' * 64)
+
+    assert os.path.exists(os.path.join(path, 'Encounter.csv'))
+    assert sorted(os.listdir(str(tmp_path / 'cache'))) == ['kaggle']
+
+
+def test_download_cache_url_changed(archive_path, url, tmp_path):
+    cache = DownloadCache(str(tmp_path / 'cache'))
+    path = cache.get('kaggle', url)
+    os.remove(os.path.join(path, 'Encounter.csv'))
+
+    moved_path = tmp_path / 'moved.zip'
+    os.rename(archive_path, moved_path)
+    cache.get('kaggle', moved_path.as_uri())
+
+    assert os.path.exists(os.path.join(path, 'Encounter.csv'))
+    assert cache.get_manifest('kaggle')['url'] == moved_path.as_uri()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+from cardea.data_loader.dtypes import infer_dtype, infer_dtypes
+
+
+def test_infer_dtype_numeric():
+    assert infer_dtype(pd.Series(['1', '2.5', None])).dtype == 'float64'
+
+
+def test_infer_dtype_declared_str():
+    values = pd.Series(['1', '2', '3'], dtype=object)
+    assert infer_dtype(values, 'str').dtype == object
+
+
+def test_infer_dtype_bool():
+    values = infer_dtype(pd.Series(['True', 'false', None]), 'bool')
+
+    assert values.dtype == 'boolean'
+    assert values[0] and not values[1] and pd.isnull(values[2])
+
+
+def test_infer_dtype_datetime():
+    values = infer_dtype(pd.Series(['1/1/2000 20:00', '2/1/2000 5:00', None]))
+
+    assert values.dtype == 'datetime64[ns]'
+    assert values[1] == pd.Timestamp('2000-02-01 05:00')
+
+
+def test_infer_dtype_categorical_datetime():
+    values = pd.Series(['1/1/2000 20:00', None, '1/1/2000 20:00'], dtype='category')
+    converted = infer_dtype(values, kind='str')
+
+    assert converted.dtype == 'datetime64[ns]'
+    assert converted.isnull().tolist() == [False, True, False]
+
+
+def test_infer_dtype_categorical_string():
+    values = pd.Series(['male', 'female', None], dtype='category')
+    assert infer_dtype(values) is values
+
+
+def test_infer_dtype_category():
+    values = pd.Series(np.random.choice(['male', 'female'], 100), dtype=object)
+    assert infer_dtype(values).dtype == 'category'
+
+
+def test_infer_dtype_string():
+    values = pd.Series(['note {}'.format(i) for i in range(100)])
+    assert infer_dtype(values).dtype == object
+
+
+def test_infer_dtype_mixed_beyond_sample():
+    values = pd.Series([str(i) for i in range(1000)] + ['a'], dtype=object)
+    assert infer_dtype(values, sample_size=10).equals(values)
+
+
+def test_infer_dtype_key():
+    assert infer_dtype(pd.Series(['10', '11']), key=True).dtype == 'Int64'
+    assert infer_dtype(pd.Series([1.0, np.nan]), key=True).dtype == 'Int64'
+    assert infer_dtype(pd.Series(['p0', 'p0']), key=True).dtype == object
+
+
+def test_infer_dtypes_does_not_copy():
+    df = pd.DataFrame({"value": [1.5, 2.5], "status": ['final', 'final']})
+    inferred = infer_dtypes(df, {'status': 'str'})
+
+    assert np.shares_memory(inferred['value'].values, df['value'].values)
+    assert inferred['status'].dtype == 'category'
+
+
+def test_infer_dtypes_duplicated_columns():
+    df = pd.DataFrame([['1', '2']], columns=['value', 'value'])
+    assert list(infer_dtypes(df).columns) == ['value', 'value']
@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
+import sqlite3
+
 import featuretools as ft
 import pandas as pd
 import pytest
@@ -67,7 +70,235 @@ def test_number_relations_in_create_relationships(entityset):
     assert len(entityset.relationships) == 1
 
 
+@pytest.fixture()
+def folder_path(tmp_path, encounter_df, period_df):
+    for number in range(25):
+        encounter = encounter_df.assign(identifier=encounter_df['identifier'] + number * 10)
+        encounter.to_csv(tmp_path / 'Encounter{}.csv'.format(number), index=False)
+        period_df.to_csv(tmp_path / 'Period{}.csv'.format(number), index=False)
+
+    encounter_df.to_csv(tmp_path / 'Encounter.csv', index=False)
+    period_df.to_csv(tmp_path / 'Period.csv', index=False)
+    return str(tmp_path)
+
+
+def test_read_csv_files(es_loader, folder_path):
+    serial = es_loader.read_csv_files(folder_path, n_jobs=1, engine='c')
+    parallel = es_loader.read_csv_files(folder_path, n_jobs=4, engine='pyarrow')
+
+    assert len(parallel) == 52 and sorted(serial) == sorted(parallel)
+    for name, df in serial.items():
+        pd.testing.assert_frame_equal(df, parallel[name])
+
+
+def test_read_csv_files_columns(es_loader, folder_path):
+    fhir = es_loader.read_csv_files(folder_path, columns={'Period': ['end']})
+    assert list(fhir['Period'].columns) == ['object_id', 'end']
+    assert list(fhir['Encounter'].columns) == ['identifier', 'period']
+
+
 def test_load_df_entityset(es_loader, encounter_df, period_df):
     fhir = {"Encounter": encounter_df, "Period": period_df}
     es = es_loader.load_df_entityset(fhir)
     assert len(es.relationships) == 1 and len(es.entities) == 2
+
+
+def test_load_df_entityset_report(encounter_df, period_df):
+    es_loader = EntitySetLoader(track_memory=True)
+    es_loader.load_df_entityset({'Encounter': encounter_df, 'Period': period_df})
+
+    report = es_loader.report
+    stages = [stage['stage'] for stage in report['stages']]
+
+    assert stages == ['create_object', 'resolve_diamond', 'merge_cycles', 'create_entity',
+                      'create_relationships']
+    assert all(stage['peak_memory'] > 0 for stage in report['stages'])
+    assert report['resources']['Encounter']['rows'] == 3
+
+
+def test_load_data_entityset_report(es_loader, tmp_path, encounter_df, period_df):
+    encounter_df.to_csv(tmp_path / 'Encounter.csv', index=False)
+    period_df.to_csv(tmp_path / 'Period.csv', index=False)
+
+    es_loader.load_data_entityset(str(tmp_path))
+
+    stages = [stage['stage'] for stage in es_loader.report['stages']]
+
+    assert stages[0] == 'read'
+    assert es_loader.report['resources']['Period']['rows'] == 3
+
+
+@pytest.fixture()
+def loaded_entityset(es_loader, encounter_df, period_df):
+    return es_loader.load_df_entityset({'Encounter': encounter_df, 'Period': period_df})
+
+
+def test_append_df_entityset(es_loader, loaded_entityset):
+    delta = {'Encounter': pd.DataFrame({"identifier": ['13'], "period": ['123']}),
+             'Period': pd.DataFrame({"object_id": [123],
+                                     "start": ['1/1/1999 10:00'],
+                                     "end": ['1/1/1999 12:00']})}
+
+    dtypes = loaded_entityset['Period'].df.dtypes
+    es = es_loader.append_df_entityset(loaded_entityset, delta)
+
+    period = es['Period'].df
+    assert len(es['Encounter'].df) == 4 and len(period) == 4
+    assert period.index[0] == 123
+    pd.testing.assert_series_equal(period.dtypes, dtypes)
+    assert es_loader.report['resources']['Period']['rows'] == 1
+
+    features, _ = ft.dfs(entityset=es, target_entity='Period', agg_primitives=['count'],
+                         trans_primitives=[], max_depth=1)
+    assert features.loc[123, 'COUNT(Encounter)'] == 1
+
+
+def test_append_df_entityset_key_collision(es_loader, loaded_entityset):
+    delta = {'Encounter': pd.DataFrame({"identifier": [12], "period": [120]})}
+
+    with pytest.raises(ValueError):
+        es_loader.append_df_entityset(loaded_entityset, delta)
+
+    assert len(loaded_entityset['Encounter'].df) == 3
+
+
+def test_append_df_entityset_unknown_entity(es_loader, loaded_entityset):
+    delta = {'Patient': pd.DataFrame({"identifier": [1]})}
+
+    with pytest.raises(LookupError):
+        es_loader.append_df_entityset(loaded_entityset, delta)
+
+
+@pytest.fixture()
+def cyclic_fhir():
+    keys = ['Patient/1', 'Encounter/1', 'Condition/1']
+    return {
+        'Patient': pd.DataFrame({'identifier': ['Patient/1']}),
+        'Encounter': pd.DataFrame({'identifier': ['Encounter/1'], 'subject': ['Patient/1'],
+                                   'diagnosis': [1]}),
+        'Encounter_Diagnosis': pd.DataFrame({'object_id': [1], 'condition': ['Condition/1']}),
+        'Condition': pd.DataFrame({'identifier': ['Condition/1'], 'subject': ['Patient/1']}),
+        'Reference': pd.DataFrame({'identifier': keys, 'reference': keys}),
+        'Identifier': pd.DataFrame({'object_id': keys})
+    }
+
+
+def test_append_df_entityset_merged_entity(es_loader, cyclic_fhir):
+    es = es_loader.load_df_entityset(cyclic_fhir)
+    assert es_loader.merged == {'Condition': ['Patient']}
+
+    delta = {'Condition': pd.DataFrame({'identifier': ['Condition/2'], 'subject': ['Patient/1']})}
+    with pytest.raises(ValueError, match='Patient were merged into it'):
+        es_loader.append_df_entityset(es, delta)
+
+    assert len(es['Condition'].df) == 1
+
+    es = es_loader.append_df_entityset(es, {'Patient': pd.DataFrame({'identifier': ['2']})})
+    assert len(es['Patient'].df) == 2
+
+
+def test_append_data_entityset(es_loader, loaded_entityset, tmp_path):
+    pd.DataFrame({"identifier": [13, 14], "period": [120, None]}).to_csv(
+        tmp_path / 'Encounter.csv', index=False)
+
+    es = es_loader.append_data_entityset(loaded_entityset, str(tmp_path))
+
+    encounter = es['Encounter'].df
+    assert encounter['identifier'].tolist() == [10, 11, 12, 13, 14]
+    assert pd.isnull(encounter['period'][14])
+
+
+def test_load_data_entityset_resources(es_loader, tmp_path, encounter_df, period_df):
+    encounter_df.to_csv(tmp_path / 'Encounter.csv', index=False)
+    period_df.to_csv(tmp_path / 'Period.csv', index=False)
+    pd.DataFrame({"identifier": [1]}).to_csv(tmp_path / 'Unknown.csv', index=False)
+
+    es = es_loader.load_data_entityset(str(tmp_path), resources=['Encounter'],
+                                       columns={'Encounter': []})
+
+    assert [entity.id for entity in es.entities] == ['Encounter']
+    assert list(es['Encounter'].df.columns) == ['identifier']
+
+
+def test_load_data_entityset_missing_resources(es_loader, tmp_path, encounter_df, period_df):
+    encounter_df.to_csv(tmp_path / 'Encounter.csv', index=False)
+    period_df.to_csv(tmp_path / 'Period.csv', index=False)
+    pd.DataFrame({"object_id": ['Patient/1']}).to_csv(tmp_path / 'Identifier.csv', index=False)
+
+    with pytest.raises(LookupError):
+        es_loader.load_data_entityset(str(tmp_path), resources=['Appointment'])
+
+
+def test_load_df_entityset_references_without_cycles(es_loader):
+    fhir = {'Reference': pd.DataFrame({"identifier": ['Patient/1'],
+                                       "reference": ['Patient/1']}),
+            'Identifier': pd.DataFrame({"object_id": ['Patient/1', 'Encounter/1']}),
+            'Patient': pd.DataFrame({"identifier": ['Patient/1']}),
+            'Encounter': pd.DataFrame({"identifier": ['Encounter/1'],
+                                       "subject": ['Patient/1']})}
+
+    es = es_loader.load_df_entityset(fhir)
+
+    relationships = {(r.child_entity.id, r.parent_entity.id) for r in es.relationships}
+    assert relationships == {('Encounter', 'Patient')}
+
+
+def test_read_csv_files_chunked(es_loader, tmp_path, encounter_df, period_df):
+    encounter_df.to_csv(tmp_path / 'Encounter.csv', index=False)
+    period_df.to_csv(tmp_path / 'Period.csv', index=False)
+    spill_dir = tmp_path / 'spill'
+
+    filters = {'Period': lambda df: df['object_id'] != 121}
+    fhir = es_loader.read_csv_files(str(tmp_path), filters=filters)
+    chunked = es_loader.read_csv_files(str(tmp_path), filters=filters, max_memory=100,
+                                       spill_dir=str(spill_dir))
+
+    assert sorted(os.listdir(spill_dir)) == ['Encounter', 'Period']
+    assert chunked['Period']['object_id'].tolist() == [120, 122]
+    assert chunked['Period']['start'].dtype == 'category'
+    pd.testing.assert_frame_equal(chunked['Encounter'], fhir['Encounter'])
+    pd.testing.assert_frame_equal(chunked['Period'].astype(object),
+                                  fhir['Period'].reset_index(drop=True).astype(object))
+
+
+@pytest.fixture()
+def database_path(tmp_path, encounter_df, period_df):
+    database_path = str(tmp_path / 'fhir.db')
+    with sqlite3.connect(database_path) as connection:
+        encounter_df.to_sql('Encounter', connection, index=False)
+        period_df.to_sql('Period', connection, index=False)
+        pd.DataFrame({"identifier": [1]}).to_sql('Unknown', connection, index=False)
+
+    return database_path
+
+
+def test_read_sql_tables(es_loader, tmp_path, database_path, encounter_df, period_df):
+    encounter_df.to_csv(tmp_path / 'Encounter.csv', index=False)
+    period_df.to_csv(tmp_path / 'Period.csv', index=False)
+
+    fhir = es_loader.read_csv_files(str(tmp_path))
+    database = es_loader.read_sql_tables(database_path, n_jobs=2)
+
+    assert sorted(database) == ['Encounter', 'Period']
+    for name, df in fhir.items():
+        pd.testing.assert_frame_equal(database[name], df)
+
+
+def test_read_sql_tables_chunked(es_loader, database_path):
+    filters = {'Period': 'object_id <> 121', 'Encounter': lambda df: df['identifier'] != 12}
+    fhir = es_loader.read_sql_tables(database_path, columns={'Period': ['end']},
+                                     max_memory=100, filters=filters)
+
+    assert list(fhir['Period'].columns) == ['object_id', 'end']
+    assert fhir['Period']['object_id'].tolist() == [120, 122]
+    assert fhir['Period']['end'].dtype == 'category'
+    assert fhir['Encounter']['identifier'].tolist() == [10, 11]
+
+
+def test_load_database_entityset(es_loader, database_path, encounter_df, period_df):
+    expected = es_loader.load_df_entityset({"Encounter": encounter_df, "Period": period_df})
+    es = es_loader.load_database_entityset(database_path, resources=['Encounter', 'Period'])
+
+    assert len(es.relationships) == len(expected.relationships)
+    for entity in expected.entities:
+        pd.testing.assert_frame_equal(es[entity.id].df, entity.df)
@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from cardea.data_loader import EntitySetLoader
+from cardea.data_loader.fhir_json import ResourceFlattener, read_bundle_files, read_ndjson_files
+
+
+@pytest.fixture()
+def resources():
+    return [
+        {"resourceType": "Patient", "id": "p1", "gender": "female",
+         "identifier": [{"system": "mrn", "value": "A1"}]},
+        {"resourceType": "Patient", "id": "p2", "gender": "male"},
+        {"resourceType": "Encounter", "id": "e1", "status": "finished",
+         "class": {"code": "IMP"}, "subject": {"reference": "Patient/p1"},
+         "period": {"start": "2000-01-01T00:00:00", "end": "2000-01-03T00:00:00"}},
+        {"resourceType": "Encounter", "id": "e2", "status": "finished",
+         "class": {"code": "AMB"}, "subject": {"reference": "Patient/p2"},
+         "period": {"start": "2000-02-01T00:00:00", "end": "2000-02-03T00:00:00"}},
+        {"resourceType": "Encounter", "id": "e3", "status": "finished",
+         "class": {"code": "IMP"}, "subject": {"reference": "Patient/p1"},
+         "period": {"start": "2000-03-01T00:00:00", "end": "2000-03-02T00:00:00"}},
+    ]
+
+
+@pytest.fixture()
+def ndjson_path(tmp_path, resources):
+    with open(tmp_path / 'Patient.ndjson', 'w') as ndjson_file:
+        for resource in resources[:2]:
+            ndjson_file.write(json.dumps(resource) + '\n')
+
+    with open(tmp_path / 'Encounter.ndjson', 'w') as ndjson_file:
+        for resource in resources[2:]:
+            ndjson_file.write(json.dumps(resource) + '\n\n')
+
+    return str(tmp_path)
+
+
+@pytest.fixture()
+def bundle_path(tmp_path, resources):
+    patient = {"fullUrl": "urn:uuid:1", "resource": resources[0]}
+    for number, resource in enumerate(resources[2:]):
+        encounter = dict(resource, subject={"reference": "urn:uuid:1"})
+        bundle = {"resourceType": "Bundle", "type": "transaction",
+                  "entry": [patient, {"fullUrl": "urn:uuid:e{}".format(number),
+                                      "resource": encounter}]}
+        with open(tmp_path / 'bundle_{}.json'.format(number), 'w') as bundle_file:
+            json.dump(bundle, bundle_file)
+
+    return str(tmp_path)
+
+
+@pytest.fixture()
+def fhir(resources):
+    flattener = ResourceFlattener(chunksize=2)
+    for resource in resources:
+        flattener.add_resource(resource)
+
+    return flattener.get_dataframes()
+
+
+def test_flatten_resource_tables(fhir):
+    assert set(fhir) == {'Patient', 'Encounter', 'Period', 'Coding', 'Reference', 'Identifier'}
+    assert len(fhir['Encounter']) == 3 and len(fhir['Patient']) == 2
+
+
+def test_flatten_nested_elements(fhir):
+    encounter = fhir['Encounter'].set_index('identifier')
+    period = fhir['Period'].set_index('object_id')
+    coding = fhir['Coding'].set_index('object_id')
+
+    assert period.loc[encounter.loc['Encounter/e2', 'period'], 'start'] == '2000-02-01T00:00:00'
+    assert coding.loc[encounter.loc['Encounter/e2', '_class'], 'code'] == 'AMB'
+
+
+def test_flatten_references(fhir):
+    assert list(fhir['Encounter']['subject']) == ['Patient/p1', 'Patient/p2', 'Patient/p1']
+    assert sorted(fhir['Reference']['identifier']) == ['Patient/p1', 'Patient/p2']
+
+
+def test_flatten_identifiers(fhir):
+    identifier = fhir['Identifier'].set_index('object_id')
+    assert len(identifier) == 5
+    assert identifier.loc['Patient/p1', 'value'] == 'A1'
+
+
+def test_flatten_duplicated_resource(resources):
+    flattener = ResourceFlattener()
+    flattener.add_resource(resources[0])
+    flattener.add_resource(dict(resources[0], gender='male'))
+    fhir = flattener.get_dataframes()
+
+    assert fhir['Patient']['gender'].tolist() == ['female']
+    assert flattener.skipped == 1 and flattener.resources == 1
+
+
+def test_flatten_buffers_identifiers_and_references(resources):
+    flattener = ResourceFlattener(chunksize=2)
+    for resource in resources:
+        flattener.add_resource(resource)
+
+    # the rows are packed every two rows instead of being kept per key
+    assert len(flattener._frames['Identifier']) == 4
+    assert len(flattener._frames['Reference']) == 1
+
+    fhir = flattener.get_dataframes()
+    assert fhir['Identifier']['object_id'].is_unique
+    assert sorted(fhir['Reference']['identifier']) == ['Patient/p1', 'Patient/p2']
+
+
+def test_flatten_disjoint_object_ids(resources):
+    first = ResourceFlattener(start=1, step=2)
+    second = ResourceFlattener(start=2, step=2)
+    first.add_resource(resources[2])
+    second.add_resource(resources[3])
+
+    first_ids = set(first.get_dataframes()['Period']['object_id'])
+    second_ids = set(second.get_dataframes()['Period']['object_id'])
+    assert first_ids.isdisjoint(second_ids)
+
+
+def test_flatten_unknown_resource_type():
+    flattener = ResourceFlattener()
+    assert flattener.add_resource({"resourceType": "Inpatient", "id": "1"}) is None
+    assert flattener.skipped == 1 and flattener.resources == 0
+
+
+def test_flatten_resource_without_id(resources):
+    flattener = ResourceFlattener()
+    assert flattener.add_resource({"resourceType": "Patient", "gender": "male"}) is None
+    assert flattener.add_resource({"resourceType": "Patient", "gender": "female"}) is None
+    flattener.add_resource(resources[0])
+
+    assert flattener.skipped == 2 and flattener.resources == 1
+    assert flattener.get_dataframes()['Patient']['identifier'].tolist() == ['Patient/p1']
+
+
+def test_flatten_resource_without_id_keyed():
+    flattener = ResourceFlattener()
+    key = flattener.add_resource({"resourceType": "Patient"}, key='urn:uuid:1')
+
+    assert key == 'urn:uuid:1' and flattener.skipped == 0
+
+
+def test_flatten_truncated_elements():
+    flattener = ResourceFlattener()
+    flattener.add_resource({"resourceType": "Patient", "id": "p1",
+                            "name": [{"family": "Doe"}, {"family": "Roe"}, {"family": "Poe"}]})
+
+    assert flattener.truncated == 2
+
+
+def test_read_ndjson_files_logs_counts(ndjson_path, caplog):
+    with caplog.at_level('INFO', logger='cardea.data_loader.fhir_json'):
+        read_ndjson_files(ndjson_path)
+
+    assert '(0 skipped, 0 repeated elements dropped)' in caplog.text
+
+
+def test_read_ndjson_files(ndjson_path):
+    fhir = read_ndjson_files(ndjson_path)
+    assert len(fhir['Encounter']) == 3 and len(fhir['Patient']) == 2
+
+
+def test_load_data_entityset_ndjson(ndjson_path):
+    es = EntitySetLoader().load_data_entityset(ndjson_path, format='ndjson')
+    relationships = {(r.child_entity.id, r.parent_entity.id) for r in es.relationships}
+    assert ('Encounter', 'Patient') in relationships and ('Encounter', 'Period') in relationships
+
+
+@pytest.mark.parametrize('intern_keys', [False, True])
+def test_append_data_entityset_ndjson(tmp_path, resources, intern_keys):
+    for folder, rows in (('loaded', resources[:3]), ('delta', resources[4:])):
+        (tmp_path / folder).mkdir()
+        with open(tmp_path / folder / 'resources.ndjson', 'w') as ndjson_file:
+            ndjson_file.write('\n'.join(json.dumps(resource) for resource in rows))
+
+    es_loader = EntitySetLoader(intern_keys=intern_keys)
+    es = es_loader.load_data_entityset(str(tmp_path / 'loaded'), format='ndjson')
+    es = es_loader.append_data_entityset(es, str(tmp_path / 'delta'), format='ndjson')
+
+    encounter = es['Encounter'].df
+    assert len(encounter) == 2 and encounter['subject'].nunique() == 1
+    assert len(es['Reference'].df) == 1 and len(es['Identifier'].df) == 4
+    assert len(es['Period'].df) == 2 and es['Period'].df.index.is_unique
+    assert set(encounter['period']) == set(es['Period'].df.index)
+
+
+@pytest.mark.parametrize('intern_keys', [False, True])
+def test_load_data_entityset_ndjson_sample(tmp_path, intern_keys):
+    resources = [{"resourceType": "Patient", "id": "p{}".format(number)} for number in range(6)]
+    resources.extend({"resourceType": "Encounter", "id": "e{}".format(number),
+                      "class": {"code": "IMP"},
+                      "subject": {"reference": "Patient/p{}".format(number % 6)},
+                      "period": {"start": "2000-01-01T00:00:00"}} for number in range(10))
+    with open(tmp_path / 'resources.ndjson', 'w') as ndjson_file:
+        ndjson_file.write('\n'.join(json.dumps(resource) for resource in resources))
+
+    es_loader = EntitySetLoader(intern_keys=intern_keys)
+    es = es_loader.load_data_entityset(str(tmp_path), format='ndjson', sample=0.5)
+
+    patients = set(es['Patient'].df.index)
+    encounter = es['Encounter'].df
+    assert 0 < len(patients) < 6 and set(encounter['subject']) <= patients
+    assert set(es['Period'].df.index) == set(encounter['period'])
+    assert set(es['Coding'].df.index) == set(encounter['_class'])
+    assert set(es['Reference'].df.index) == patients
+    assert set(es['Identifier'].df.index) == patients.union(encounter.index)
+
+
+def test_load_data_entityset_unknown_format(ndjson_path):
+    with pytest.raises(ValueError):
+        EntitySetLoader().load_data_entityset(ndjson_path, format='xml')
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_read_bundle_files(bundle_path, n_jobs):
+    fhir = read_bundle_files(bundle_path, n_jobs=n_jobs)
+    assert len(fhir['Patient']) == 1 and len(fhir['Encounter']) == 3
+    assert fhir['Period']['object_id'].is_unique
+    assert fhir['Identifier']['object_id'].is_unique
+    assert set(fhir['Encounter']['subject']) == {'urn:uuid:1'}
+
+
+def test_load_data_entityset_bundle(bundle_path):
+    es = EntitySetLoader().load_data_entityset(bundle_path, format='bundle', n_jobs=2)
+    relationships = {(r.child_entity.id, r.parent_entity.id) for r in es.relationships}
+    assert ('Encounter', 'Patient') in relationships
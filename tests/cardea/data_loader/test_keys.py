@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pandas as pd
+import pytest
+
+from cardea.data_loader import EntitySetLoader
+from cardea.data_loader.keys import KeyDictionary, get_key_columns, intern_keys
+
+
+@pytest.fixture()
+def fhir():
+    return {
+        'Patient': pd.DataFrame({"identifier": ['p0', 'p1', 'p2'],
+                                 "gender": ['female', 'male', 'female']}),
+        'Encounter': pd.DataFrame({"identifier": ['e0', 'e1', 'e2', 'e3'],
+                                   "period": [120, 121, 122, 122],
+                                   "subject": ['p0', 'p1', 'p1', 'p2']}),
+        'Period': pd.DataFrame({"object_id": ['120', '121', '122'],
+                                "start": ['1/1/2000 20:00', '2/1/2000 5:00', '3/1/2000 22:00']}),
+        'Reference': pd.DataFrame({"identifier": ['p0', 'p1', 'p2']}),
+        'Identifier': pd.DataFrame({"object_id": ['p0', 'p1', 'p2', 'e0', 'e1', 'e2', 'e3']})
+    }
+
+
+def test_intern():
+    keys = KeyDictionary()
+    codes = keys.intern(pd.Series(['a', 'b', 'a']))
+
+    assert codes.dtype == 'Int64'
+    assert list(codes) == [0, 1, 0]
+    assert list(keys.intern(pd.Series(['c', 'b']))) == [2, 1]
+    assert len(keys) == 3
+
+
+def test_intern_compares_strings():
+    keys = KeyDictionary()
+    assert list(keys.intern(pd.Series([10, 11]))) == list(keys.intern(pd.Series(['10', '11'])))
+
+
+def test_intern_missing_values():
+    keys = KeyDictionary()
+    codes = keys.intern(pd.Series([1, None, 1]))
+
+    assert codes.isnull().tolist() == [False, True, False]
+    assert keys.decode(codes)[[0, 2]].tolist() == ['1', '1']
+
+
+def test_decode():
+    keys = KeyDictionary()
+    values = pd.Series(['a', None, 'b'], name='subject')
+
+    decoded = keys.decode(keys.intern(values))
+
+    pd.testing.assert_series_equal(decoded, values)
+
+
+def test_get_key_columns(fhir):
+    columns = get_key_columns('Encounter', fhir['Encounter'])
+    assert sorted(columns) == ['identifier', 'period', 'subject']
+    assert get_key_columns('Patient', fhir['Patient']) == ['identifier']
+
+
+def test_intern_keys(fhir):
+    interned, keys = intern_keys(fhir)
+
+    assert interned['Encounter']['subject'].tolist() == interned['Patient']['identifier'][
+        [0, 1, 1, 2]].tolist()
+    assert interned['Encounter']['period'][:3].tolist() == interned['Period']['object_id'].tolist()
+    assert interned['Encounter']['period'].dtype == interned['Period']['object_id'].dtype
+    assert fhir['Patient']['identifier'].tolist() == ['p0', 'p1', 'p2']
+    assert keys.decode(interned['Encounter']['subject']).tolist() == ['p0', 'p1', 'p1', 'p2']
+
+
+def test_load_df_entityset_intern_keys(fhir):
+    es = EntitySetLoader().load_df_entityset(fhir)
+    fhir['Encounter'].loc[3, 'period'] = None
+
+    es_loader = EntitySetLoader(intern_keys=True)
+    interned = es_loader.load_df_entityset(fhir)
+
+    relationships = {str(relationship) for relationship in es.relationships}
+    assert {str(relationship) for relationship in interned.relationships} == relationships
+    assert interned['Patient'].df['identifier'].dtype == 'Int64'
+    assert sorted(es_loader.keys.decode(interned['Patient'].df['identifier'])) == [
+        'p0', 'p1', 'p2']
@@ -1,9 +1,23 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pandas as pd
 import pytest
 
-from cardea.data_loader.load_mimic import get_table_properties, get_table_relationships
+import cardea
+from cardea.data_loader.load_mimic import (
+    PARTITION_COLUMN, SCHEMA_PATH, _map_within_budget, convert_mimic_data, get_schema_spec,
+    get_spec_cache_dir, get_table_properties, get_table_relationships, get_table_spec,
+    load_mimic_data)
+from cardea.data_loader.sampling import sample_keys
 
 
 @pytest.fixture()
@@ -40,3 +54,223 @@ def test_get_table_properties_arrtime(properties):
 
 def test_get_table_relatopnships(relationships):
     assert len(relationships) == 18
+
+
+@pytest.fixture()
+def mimic_path(tmp_path):
+    pd.DataFrame({'ROW_ID': [1, 2],
+                  'SUBJECT_ID': [10, 12],
+                  'HADM_ID': [100, 101],
+                  'ADMITTIME': ['2150-01-01 10:00:00', '2150-02-01 10:00:00'],
+                  'LANGUAGE': ['ENGL', None]}).to_csv(tmp_path / 'ADMISSIONS.csv', index=False)
+    pd.DataFrame({'ROW_ID': [1, 2, 3],
+                  'SUBJECT_ID': [10, 11, 12],
+                  'GENDER': ['F', 'M', 'F'],
+                  'DOB': ['2100-01-01 00:00:00', '2090-05-01 00:00:00', '2080-03-01 00:00:00'],
+                  'DOD': [None, None, None],
+                  'EXPIRE_FLAG': [0, 0, 0]}).to_csv(tmp_path / 'PATIENTS.csv', index=False)
+    return str(tmp_path)
+
+
+def test_load_mimic_data_chunked(mimic_path, tmp_path):
+    spill_dir = str(tmp_path / 'spill')
+    es = load_mimic_data(mimic_path, max_memory=100, spill_dir=spill_dir,
+                         filters={'patients': lambda df: df['gender'] == 'F'})
+
+    df = es['patients'].df
+    assert sorted(os.listdir(spill_dir)) == ['admissions', 'patients']
+    assert sorted(df['subject_id']) == [10, 12]
+    assert df['gender'].dtype == 'category'
+    assert df['dob'].dtype == 'datetime64[ns]'
+
+
+def test_get_schema_spec_cached(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    spec = get_schema_spec.__wrapped__(cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 1
+
+    with patch('cardea.data_loader.load_mimic.compile_schema') as compile_schema:
+        cached = get_schema_spec.__wrapped__(cache_dir=cache_dir)
+
+    compile_schema.assert_not_called()
+    assert cached == spec
+    assert cached['admissions'].primary_key == 'hadm_id'
+
+
+def test_get_schema_spec_changed_schema(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    schema_path = str(tmp_path / 'schema.xml')
+    shutil.copy(SCHEMA_PATH, schema_path)
+    get_schema_spec.__wrapped__(schema_path, cache_dir)
+
+    with open(schema_path, 'a') as schema_file:
+        schema_file.write('\n')
+
+    get_schema_spec.__wrapped__(schema_path, cache_dir)
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_get_schema_spec_changed_version(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    get_schema_spec.__wrapped__(cache_dir=cache_dir)
+
+    with patch.object(cardea, '__version__', '0.0.0'):
+        get_schema_spec.__wrapped__(cache_dir=cache_dir)
+
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_get_schema_spec_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv('CARDEA_CACHE_DIR', '')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+
+    spec = get_schema_spec.__wrapped__()
+
+    assert spec['admissions'].primary_key == 'hadm_id'
+    assert os.listdir(tmp_path) == []
+
+
+def test_get_spec_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv('CARDEA_CACHE_DIR')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    assert get_spec_cache_dir() == str(tmp_path / 'cardea')
+
+    monkeypatch.setenv('CARDEA_CACHE_DIR', str(tmp_path / 'specs'))
+    assert get_spec_cache_dir() == str(tmp_path / 'specs')
+
+
+def test_get_table_spec_unknown():
+    with pytest.raises(LookupError):
+        get_table_spec('unknown')
+
+
+def test_load_mimic_data_parse_dates(mimic_path):
+    df = load_mimic_data(mimic_path)['patients'].df
+
+    assert df['dob'].dtype == 'datetime64[ns]'
+    assert df['gender'].dtype == object
+
+
+def test_map_within_budget():
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def function(cost):
+        with lock:
+            running.append(cost)
+            peak.append(sum(running))
+
+        time.sleep(0.01)
+        with lock:
+            running.remove(cost)
+
+        return cost * 2
+
+    costs = [3, 1, 2, 5, 1, 1]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = _map_within_budget(executor, function, [(cost, ) for cost in costs], costs, 4)
+
+    assert results == [6, 2, 4, 10, 2, 2]
+    assert max(peak) == 5
+
+
+def test_load_mimic_data_parallel(mimic_path):
+    es = load_mimic_data(mimic_path)
+    parallel = load_mimic_data(mimic_path, n_jobs=2, memory_budget=1)
+
+    assert [entity.id for entity in parallel.entities] == [entity.id for entity in es.entities]
+    assert len(parallel.relationships) == len(es.relationships) == 1
+    for entity in es.entities:
+        pd.testing.assert_frame_equal(parallel[entity.id].df, entity.df)
+
+
+@pytest.fixture()
+def parquet_path(mimic_path, tmp_path):
+    output_path = str(tmp_path / 'parquet')
+    convert_mimic_data(mimic_path, output_path, n_partitions=4, chunksize=1)
+    return output_path
+
+
+def test_convert_mimic_data(parquet_path):
+    assert sorted(os.listdir(parquet_path)) == ['admissions', 'manifest.json', 'patients']
+    assert all(len(name) == 3 for name in os.listdir(os.path.join(parquet_path, 'patients')))
+
+
+def test_load_mimic_data_parquet(mimic_path, parquet_path):
+    es = load_mimic_data(mimic_path)
+    parquet = load_mimic_data(parquet_path, format='parquet')
+
+    assert len(parquet.relationships) == len(es.relationships)
+    for entity in es.entities:
+        df = parquet[entity.id].df.sort_values('row_id')
+        expected = entity.df.sort_values('row_id')
+        pd.testing.assert_frame_equal(df.astype(object), expected.astype(object),
+                                      check_index_type=False)
+
+
+def test_load_mimic_data_parquet_partitions(parquet_path):
+    partitions = os.listdir(os.path.join(parquet_path, 'patients'))
+    es = load_mimic_data(parquet_path, format='parquet', partitions=[int(partitions[0])])
+
+    subjects = set(es['patients'].df['subject_id'])
+    assert 0 < len(subjects) < 3
+    assert set(es['admissions'].df['subject_id']) <= subjects
+
+
+def test_load_mimic_data_parquet_columns(parquet_path):
+    es = load_mimic_data(parquet_path, format='parquet', columns={'patients': ['gender']})
+    assert sorted(es['patients'].df.columns) == ['gender', 'subject_id']
+
+
+def test_load_mimic_data_unknown_format(mimic_path):
+    with pytest.raises(ValueError):
+        load_mimic_data(mimic_path, format='xlsx')
+
+
+def test_load_mimic_data_sample(mimic_path):
+    es = load_mimic_data(mimic_path, sample=0.5, n_jobs=2)
+
+    patients = es['patients'].df['subject_id']
+    expected = sample_keys(pd.Series([10, 11, 12]), 0.5)
+    assert sorted(patients) == [subject for subject, sampled in zip([10, 11, 12], expected)
+                                if sampled]
+    assert set(es['admissions'].df[PARTITION_COLUMN]) <= set(patients)
+
+
+@pytest.fixture()
+def database_path(mimic_path, tmp_path):
+    database_path = str(tmp_path / 'mimic.db')
+    with sqlite3.connect(database_path) as connection:
+        for name in ['ADMISSIONS', 'PATIENTS']:
+            df = pd.read_csv(os.path.join(mimic_path, name + '.csv'))
+            df.to_sql(name, connection, index=False)
+
+    return database_path
+
+
+@pytest.mark.parametrize('max_memory', [None, 100])
+def test_load_mimic_data_sql(mimic_path, database_path, max_memory):
+    es = load_mimic_data(mimic_path)
+    database = load_mimic_data(database_path, format='sql', max_memory=max_memory, n_jobs=2)
+
+    assert len(database.relationships) == len(es.relationships)
+    for entity in es.entities:
+        df = database[entity.id].df.sort_values('row_id')
+        expected = entity.df.sort_values('row_id')
+        pd.testing.assert_frame_equal(df.astype(object), expected.astype(object),
+                                      check_index_type=False)
+
+
+def test_load_mimic_data_sql_filters(database_path):
+    es = load_mimic_data(database_path, format='sql', columns={'patients': ['gender']},
+                         filters={'patients': "GENDER = 'F'"})
+
+    df = es['patients'].df
+    assert sorted(df.columns) == ['gender', 'subject_id']
+    assert sorted(df['subject_id']) == [10, 12]
+
+
+def test_load_mimic_data_sql_filters_csv(mimic_path):
+    with pytest.raises(ValueError):
+        load_mimic_data(mimic_path, filters={'patients': "GENDER = 'F'"})
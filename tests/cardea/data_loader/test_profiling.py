@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from cardea.data_loader.profiling import LoadProfiler
+
+
+@pytest.fixture()
+def profiler():
+    return LoadProfiler(track_memory=True)
+
+
+def test_stage(profiler):
+    with profiler.stage('allocate'):
+        values = list(range(100000))
+
+    stage = profiler.get_report()['stages'][0]
+
+    assert stage['stage'] == 'allocate'
+    assert stage['seconds'] > 0
+    assert stage['peak_memory'] > len(values) * 8
+
+
+def test_stage_rss_increase(profiler):
+    with patch('cardea.data_loader.profiling.get_max_rss', side_effect=[100, 150, 150, 150]):
+        with profiler.stage('allocate'):
+            pass
+
+        with profiler.stage('read'):
+            pass
+
+    allocate, read = profiler.get_report()['stages']
+    assert allocate['rss_increase'] == 50 and read['rss_increase'] == 0
+
+
+def test_stage_without_memory_tracking():
+    profiler = LoadProfiler()
+    with profiler.stage('read'):
+        pass
+
+    assert profiler.get_report()['stages'][0]['peak_memory'] is None
+
+
+def test_stage_records_failure(profiler):
+    with pytest.raises(ValueError):
+        with profiler.stage('fail'):
+            raise ValueError()
+
+    assert [stage['stage'] for stage in profiler.stages] == ['fail']
+
+
+def test_add_resources(profiler):
+    profiler.add_resources({'Encounter': pd.DataFrame({'identifier': ['10', '11', '12']})})
+
+    resources = profiler.get_report()['resources']
+
+    assert resources['Encounter']['rows'] == 3
+    assert resources['Encounter']['bytes'] > 0
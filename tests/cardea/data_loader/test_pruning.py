@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from cardea.data_loader.pruning import (
+    get_problem_resources, get_reference_targets, get_related_resources, is_shared_element)
+from cardea.problem_definition import MissedAppointment, MortalityPrediction, Readmission
+
+
+def test_is_shared_element():
+    assert is_shared_element('Period')
+    assert not is_shared_element('Encounter')
+    assert not is_shared_element('Encounter_Diagnosis')
+
+
+def test_get_related_resources_depth():
+    assert get_related_resources(['Encounter'], max_depth=0) == {
+        'Encounter', 'Reference', 'Identifier'}
+    assert 'Encounter' in get_related_resources(['Encounter_Diagnosis'], max_depth=1)
+    assert 'Period' not in get_related_resources(['Encounter_Diagnosis'], max_depth=1)
+    assert 'Period' in get_related_resources(['Encounter_Diagnosis'], max_depth=2)
+
+
+def test_get_related_resources_shared_elements():
+    related = get_related_resources(['Encounter'], max_depth=3)
+
+    assert 'Encounter_Diagnosis' in related
+    assert 'MedicationRequest' not in related and 'Procedure' not in related
+
+
+def test_get_reference_targets():
+    assert {'Patient', 'Appointment'} <= set(get_reference_targets('Encounter'))
+    assert get_reference_targets('Encounter_Diagnosis') == ('Condition',)
+    assert get_reference_targets('Period') == ()
+
+
+def test_get_related_resources_references():
+    assert 'Patient' in get_related_resources(['Encounter'], max_depth=1)
+    assert 'Encounter' not in get_related_resources(['Patient'], max_depth=1)
+
+
+def test_get_problem_resources():
+    readmission = get_problem_resources(Readmission)
+    appointment = get_problem_resources(MissedAppointment)
+
+    assert {'Encounter', 'Period', 'Patient'} <= readmission
+    assert 'MedicationRequest' not in readmission
+    assert {'Appointment_Participant', 'Patient'} <= appointment
+    assert 'Encounter_Diagnosis' not in appointment
+
+
+def test_get_problem_resources_required_entities():
+    resources = get_problem_resources(MortalityPrediction, max_depth=1)
+    assert {'Condition', 'Coding', 'Patient'} <= resources
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pandas as pd
+import pytest
+
+from cardea.data_loader.readers import read_csv_file, read_csv_header
+
+
+@pytest.fixture()
+def csv_path(tmp_path):
+    path = str(tmp_path / 'Patient.csv')
+    with open(path, 'w') as csv_file:
+        csv_file.write('identifier,active,gender,multipleBirthInteger,lastUpdated\n'
+                       '1,True,male,2,2020-01-01T10:00:00Z\n'
+                       '2,,female,,\n'
+                       '3,False,,1,2020-01-02\n')
+
+    return path
+
+
+@pytest.fixture()
+def types():
+    return {'active': 'bool', 'gender': 'str', 'multipleBirthInteger': 'int'}
+
+
+def test_read_csv_header(csv_path):
+    assert read_csv_header(csv_path) == ['identifier', 'active', 'gender', 'multipleBirthInteger',
+                                         'lastUpdated']
+
+
+@pytest.mark.parametrize('engine', ['pyarrow', 'c'])
+def test_read_csv_file_columns(csv_path, engine):
+    df = read_csv_file(csv_path, columns=['gender', 'identifier', 'unknown'], engine=engine)
+    assert list(df.columns) == ['identifier', 'gender']
+
+
+@pytest.mark.parametrize('engine', ['pyarrow', 'c'])
+def test_read_csv_file_types(csv_path, types, engine):
+    df = read_csv_file(csv_path, types=types, engine=engine)
+    assert df['multipleBirthInteger'].dtype == 'float64'
+    assert df['gender'].isnull().sum() == 1
+
+
+@pytest.mark.parametrize('declared', [True, False])
+def test_read_csv_file_engines_match(csv_path, types, declared):
+    types = types if declared else None
+    arrow_df = read_csv_file(csv_path, types=types, engine='pyarrow')
+    pandas_df = read_csv_file(csv_path, types=types, engine='c')
+
+    pd.testing.assert_frame_equal(arrow_df, pandas_df)
+    # missing values are NaN in both, not None in one of them
+    assert arrow_df.applymap(repr).equals(pandas_df.applymap(repr))
+    assert arrow_df['lastUpdated'].tolist()[0] == '2020-01-01T10:00:00Z'
+
+
+def test_read_csv_file_invalid_types(csv_path):
+    df = read_csv_file(csv_path, types={'gender': 'bool'})
+    assert list(df['gender'].dropna()) == ['male', 'female']
+
+
+def test_read_csv_file_unknown_engine(csv_path):
+    with pytest.raises(ValueError):
+        read_csv_file(csv_path, engine='python')
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cardea.data_loader.keys import intern_keys
+from cardea.data_loader.sampling import sample_dataframes, sample_filter, sample_keys
+
+
+def test_sample_keys_fraction():
+    keys = pd.Series(np.arange(10000))
+    sampled = sample_keys(keys, 0.1)
+
+    assert 900 < sampled.sum() < 1100
+    assert (sampled <= sample_keys(keys, 0.2)).all()
+    assert sample_keys(keys, 1).all()
+
+
+def test_sample_keys_deterministic():
+    ints = sample_keys(pd.Series([1, 2, 3, 4, 5, 6]), 0.5)
+    strings = sample_keys(pd.Series(['1', '2', '3', '4', '5', '6']), 0.5)
+    floats = sample_keys(pd.Series([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, None]), 0.5)
+
+    assert ints.tolist() == strings.tolist() == floats.tolist()[:-1]
+    assert not floats[-1]
+
+
+@pytest.mark.parametrize('fraction', [0, 1.5])
+def test_sample_keys_invalid_fraction(fraction):
+    with pytest.raises(ValueError):
+        sample_keys(pd.Series([1, 2]), fraction)
+
+
+def test_sample_filter():
+    df = pd.DataFrame({'subject_id': np.arange(100), 'value': np.arange(100) % 2})
+    row_filter = pickle.loads(pickle.dumps(sample_filter(0.5, 'subject_id')))
+
+    assert row_filter(df).tolist() == sample_keys(df['subject_id'], 0.5).tolist()
+
+
+def test_sample_filter_combined():
+    df = pd.DataFrame({'subject_id': np.arange(100), 'value': np.arange(100) % 2})
+    row_filter = sample_filter(0.5, 'subject_id', lambda df: df['value'] == 0)
+
+    expected = sample_keys(df['subject_id'], 0.5) & (df['value'] == 0)
+    assert row_filter(df).tolist() == expected.tolist()
+    assert row_filter(df[['value']]).tolist() == (df['value'] == 0).tolist()
+
+
+@pytest.fixture()
+def fhir():
+    return {
+        'Patient': pd.DataFrame({'identifier': np.arange(20)}),
+        'Encounter': pd.DataFrame({'identifier': np.arange(100, 140),
+                                   'subject': np.append(np.arange(20).repeat(2)[:-1], None),
+                                   'period': np.arange(40)}),
+        'Observation': pd.DataFrame({'identifier': np.arange(200, 240),
+                                     'encounter': np.arange(100, 140)}),
+        'Period': pd.DataFrame({'object_id': np.arange(40)})
+    }
+
+
+@pytest.fixture()
+def relationships():
+    return pd.DataFrame([
+        ('Patient', 'identifier', 'Encounter', 'subject'),
+        ('Encounter', 'identifier', 'Observation', 'encounter'),
+        ('Period', 'object_id', 'Encounter', 'period')
+    ], columns=['parent_entity', 'parent_variable', 'child_entity', 'child_variable'])
+
+
+@pytest.fixture()
+def identifiers():
+    return {'Patient': 'identifier', 'Encounter': 'identifier', 'Observation': 'identifier',
+            'Period': 'object_id'}
+
+
+def test_sample_dataframes(fhir, relationships, identifiers):
+    sampled = sample_dataframes(fhir, relationships, identifiers, 0.5)
+
+    patients = set(sampled['Patient']['identifier'])
+    subjects = sampled['Encounter']['subject']
+    assert patients == set(np.arange(20)[sample_keys(fhir['Patient']['identifier'], 0.5)])
+    assert set(subjects.dropna()) <= patients and subjects.isnull().sum() == 1
+    assert set(sampled['Observation']['encounter']) == set(sampled['Encounter']['identifier'])
+    assert set(sampled['Period']['object_id']) == set(sampled['Encounter']['period'])
+    assert len(fhir['Patient']) == 20
+
+
+def test_sample_dataframes_interned(fhir, relationships, identifiers):
+    interned, keys = intern_keys({'Patient': fhir['Patient'].iloc[::-1]})
+    fhir['Patient'] = interned['Patient']
+    fhir['Encounter']['subject'] = keys.intern(fhir['Encounter']['subject'])
+
+    sampled = sample_dataframes(fhir, relationships, identifiers, 0.5, keys=keys)
+
+    patients = keys.decode(sampled['Patient']['identifier']).astype(int)
+    assert set(patients) == set(np.arange(20)[sample_keys(pd.Series(np.arange(20)), 0.5)])
+
+
+def test_sample_dataframes_without_root(fhir, relationships, identifiers):
+    del fhir['Patient']
+    with pytest.raises(LookupError):
+        sample_dataframes(fhir, relationships, identifiers, 0.5)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+from inspect import isclass
+
+import pytest
+
+from cardea import fhir
+from cardea.fhir._index import ENUMERATIONS, RESOURCES
+
+
+def _loaded_resource_modules(statement):
+    code = 'import sys\n{}\nprint(sorted(m for m in sys.modules if m.startswith("cardea.fhir.")))'
+    output = subprocess.check_output([sys.executable, '-c', code.format(statement)])
+    modules = set(RESOURCES.values())
+    return [module for module in eval(output) if module.split('.')[-1] in modules]
+
+
+def test_import_does_not_load_resource_modules():
+    modules = _loaded_resource_modules('import cardea')
+    assert modules == []
+
+
+def test_attribute_access_loads_single_module():
+    modules = _loaded_resource_modules('from cardea.fhir import Patient_Contact')
+    assert modules == ['cardea.fhir.Patient', 'cardea.fhir.fhirbase']
+
+
+def test_index_resolves_every_resource():
+    for name in RESOURCES:
+        resource = getattr(fhir, name)
+        assert isclass(resource) and resource.__name__ == name
+
+
+def test_enumerations_belong_to_resources():
+    for name, enumerations in ENUMERATIONS.items():
+        resource = getattr(fhir, name)()
+        assert all(hasattr(resource, attr) for attr in enumerations)
+
+
+def test_submodule_import_does_not_shadow_class():
+    from cardea.fhir.Encounter import Encounter_Diagnosis  # noqa: F401
+    assert isclass(fhir.Encounter)
+
+
+def test_dir_lists_resources():
+    assert set(RESOURCES).issubset(dir(fhir))
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        fhir.Inpatient
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -61,3 +62,23 @@ def test_assert_type_enum():
     object_values = df.to_dict('list')
     with pytest.raises(ValueError):
         Patient(object_values)
+
+
+def test_assert_type_enum_case_insensitive():
+    df = pd.DataFrame({"identifier": [0, 1], "gender": ['Female', 'MALE']})
+    object = Patient(df.to_dict('list'))
+    assert object.validate() == []
+
+
+def test_validate_missing_values(patient_object):
+    patient_object.gender = pd.Series(['female', None, np.nan, 'male'])
+    assert patient_object.validate() == []
+
+
+def test_validate_reports_all_violations(patient_object):
+    patient_object.gender = pd.Series(['female', 'F', 'M', 'F', 'male'])
+    violations = patient_object.validate()
+    assert len(violations) == 1
+    assert violations[0]['attribute'] == 'gender'
+    assert violations[0]['count'] == 3
+    assert violations[0]['samples'] == ['F', 'M']
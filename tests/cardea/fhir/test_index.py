@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Checks that ``cardea.fhir._index`` matches the class definitions it indexes.
+
+The index is rebuilt from the comments that follow every attribute of the
+resource classes: ``# type:``, ``# possible values:`` and ``# reference to``.
+"""
+
+import glob
+import os
+import re
+
+import pytest
+
+import cardea.fhir
+from cardea.fhir import _index
+
+CLASS = re.compile(r'class (\w+)\(fhirbase\):')
+ATTRIBUTE = re.compile(r'\s+self\.(\w+) = ')
+TYPE = re.compile(r'\s+# type: (\w+)')
+VALUES = re.compile(r'\s+# possible values: (.*)')
+REFERENCE = re.compile(r'\s+# reference to (\w+)(?:: (\w+))?')
+COMMENT = re.compile(r'\s+# (.*)')
+
+
+def parse_module(path, index):
+    """Adds the classes of a resource module to the rebuilt index."""
+    module = os.path.splitext(os.path.basename(path))[0]
+    name = attribute = values = None
+    many = False
+
+    with open(path) as module_file:
+        for line in module_file:
+            match = CLASS.match(line)
+            if match:
+                name = match.group(1)
+                index['RESOURCES'][name] = module
+                continue
+
+            match = ATTRIBUTE.match(line)
+            if match:
+                attribute, values, many = match.group(1), None, False
+                continue
+
+            if attribute is None:
+                continue
+
+            # the resource type of a resource is fixed, so it is neither typed nor enumerated
+            resource_type = attribute == 'resourceType'
+
+            match = TYPE.match(line)
+            if match:
+                many = match.group(1) == 'list'
+                if not many and not resource_type:
+                    index['TYPES'].setdefault(name, {})[attribute] = match.group(1)
+
+                continue
+
+            match = REFERENCE.match(line)
+            if match:
+                parent, variable = match.group(1), match.group(2) or 'object_id'
+                cardinality = 'many' if many else 'one'
+                index['RELATIONSHIPS'].add((parent, variable, name, attribute, cardinality))
+                continue
+
+            if resource_type:
+                continue
+
+            match = VALUES.match(line)
+            if match:
+                values = match.group(1)
+            elif values is not None and COMMENT.match(line):
+                # possible values that do not fit on one line continue on the next ones
+                values += ' ' + COMMENT.match(line).group(1)
+            else:
+                values = None
+                continue
+
+            # enumerations are matched lowercased
+            possible_values = tuple(value.strip().lower() for value in values.split(','))
+            index['ENUMERATIONS'].setdefault(name, {})[attribute] = possible_values
+
+
+@pytest.fixture(scope='module')
+def index():
+    index = {
+        'RESOURCES': {'fhirbase': 'fhirbase'},
+        'ENUMERATIONS': {},
+        'TYPES': {},
+        'RELATIONSHIPS': set()
+    }
+    for path in sorted(glob.glob(os.path.join(os.path.dirname(cardea.fhir.__file__), '*.py'))):
+        if os.path.basename(path)[0].isupper():
+            parse_module(path, index)
+
+    return index
+
+
+def test_resources(index):
+    assert index['RESOURCES'] == _index.RESOURCES
+
+
+def test_enumerations(index):
+    assert index['ENUMERATIONS'] == _index.ENUMERATIONS
+
+
+def test_types(index):
+    assert index['TYPES'] == _index.TYPES
+
+
+def test_relationships(index):
+    assert len(_index.RELATIONSHIPS) == len(set(_index.RELATIONSHIPS))
+    assert index['RELATIONSHIPS'] == set(_index.RELATIONSHIPS)
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from cardea.fhir import Patient
+from cardea.fhir._index import RESOURCES
+from cardea.fhir.registry import get_resource_type
+
+
+def test_get_resource_type():
+    resource_type = get_resource_type('Patient')
+    assert resource_type.cls is Patient
+    assert resource_type.id_columns == ('identifier',)
+    assert resource_type.types['gender'] == 'str'
+
+
+def test_get_resource_type_cached():
+    assert get_resource_type('Encounter') is get_resource_type('Encounter')
+
+
+def test_get_resource_type_lookup_error():
+    with pytest.raises(LookupError):
+        get_resource_type('Inpatient')
+
+
+def test_resource_type_immutable():
+    resource_type = get_resource_type('Period')
+    with pytest.raises(TypeError):
+        resource_type.types['start'] = 'int'
+
+
+def test_every_resource_has_id_columns():
+    names = [name for name in RESOURCES if name != 'fhirbase']
+    assert all(get_resource_type(name).id_columns for name in names)
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from cardea.fhir.relationships import RELATIONSHIP_INDEX, RelationshipIndex
+
+
+@pytest.fixture()
+def index():
+    return RelationshipIndex([
+        ('Period', 'object_id', 'Encounter', 'period', 'one'),
+        ('Reference', 'identifier', 'Encounter', 'subject', 'one'),
+        ('Period', 'object_id', 'Patient_Contact', 'period', 'one'),
+        ('Reference', 'identifier', 'Patient', 'generalPractitioner', 'many'),
+    ])
+
+
+def test_by_child(index):
+    relations = index.by_child('Encounter')
+    assert [relation['child_variable'] for relation in relations] == ['period', 'subject']
+
+
+def test_by_child_unknown(index):
+    assert index.by_child('Inpatient') == []
+
+
+def test_by_parent(index):
+    children = [relation['child_entity'] for relation in index.by_parent('Period')]
+    assert children == ['Encounter', 'Patient_Contact']
+
+
+def test_among(index):
+    relations = index.among(['Encounter', 'Period', 'Patient'])
+    assert len(relations) == 1 and relations[0]['child_variable'] == 'period'
+
+
+def test_cardinality(index):
+    relation = index.by_child('Patient')[0]
+    assert relation['cardinality'] == 'many'
+
+
+def test_global_index():
+    relations = RELATIONSHIP_INDEX.by_child('Patient')
+    assert len(relations) == 12
+    assert {relation['cardinality'] for relation in relations} == {'one', 'many'}
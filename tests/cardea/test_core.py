@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+from functools import partial
+from unittest.mock import patch
+from zipfile import ZipFile
+
+import pandas as pd
+import pytest
+
+from cardea import Cardea
+from cardea.data_loader.load_mimic import convert_mimic_data
+
+
+@pytest.fixture()
+def cardea():
+    return Cardea()
+
+
+@pytest.fixture()
+def mimic_path(tmp_path):
+    path = tmp_path / 'mimic'
+    path.mkdir()
+    pd.DataFrame({'ROW_ID': [1, 2],
+                  'SUBJECT_ID': [10, 12],
+                  'HADM_ID': [100, 101],
+                  'ADMITTIME': ['2150-01-01 10:00:00', '2150-02-01 10:00:00']}).to_csv(
+                      path / 'ADMISSIONS.csv', index=False)
+    pd.DataFrame({'ROW_ID': [1, 2, 3],
+                  'SUBJECT_ID': [10, 11, 12],
+                  'GENDER': ['F', 'M', 'F'],
+                  'DOB': ['2100-01-01 00:00:00', '2090-05-01 00:00:00',
+                          '2080-03-01 00:00:00']}).to_csv(path / 'PATIENTS.csv', index=False)
+
+    return str(path)
+
+
+def test_load_entityset_mimic_parquet(cardea, mimic_path, tmp_path):
+    parquet_path = str(tmp_path / 'parquet')
+    convert_mimic_data(mimic_path, parquet_path, n_partitions=2)
+
+    cardea.load_entityset(parquet_path, fhir=False, format='parquet',
+                          columns={'patients': ['gender']})
+
+    assert len(cardea.es['patients'].df) == 3 and len(cardea.es['admissions'].df) == 2
+    assert 'dob' not in cardea.es['patients'].df.columns
+
+
+def test_load_entityset_mimic_unsupported_format(cardea, mimic_path):
+    with pytest.raises(ValueError):
+        cardea.load_entityset(mimic_path, fhir=False, format='ndjson')
+
+
+@pytest.mark.parametrize('option', [{'cache_dir': 'cache'}, {'append': True},
+                                    {'problem': 'Readmission'}, {'resources': ['Patient']}])
+def test_load_entityset_mimic_fhir_options(cardea, mimic_path, option):
+    with pytest.raises(ValueError):
+        cardea.load_entityset(mimic_path, fhir=False, **option)
+
+
+def test_load_entityset_demo_parquet(cardea, mimic_path, tmp_path):
+    (tmp_path / 'cardea').mkdir()
+    with ZipFile(tmp_path / 'cardea' / 'mimic.zip', 'w') as archive:
+        for name in os.listdir(mimic_path):
+            archive.write(os.path.join(mimic_path, name), name)
+
+    url = 'file://{}/{{}}/{{}}'.format(tmp_path)
+    download_demo = partial(Cardea.download_demo, data_path=str(tmp_path / 'data'))
+    with patch('cardea.core.S3_URL', url), patch.object(Cardea, 'download_demo', download_demo):
+        cardea.load_entityset('mimic', fhir=False, format='parquet')
+
+    assert os.path.exists(tmp_path / 'data' / 'mimic' / 'parquet' / 'manifest.json')
+    assert len(cardea.es['patients'].df) == 3 and len(cardea.es['admissions'].df) == 2
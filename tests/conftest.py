@@ -0,0 +1,12 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope='session')
+def spec_cache_dir(tmp_path_factory):
+    """Keeps the compiled MIMIC schema out of the cache of the user."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv('CARDEA_CACHE_DIR', str(tmp_path_factory.mktemp('cache')))
+        yield